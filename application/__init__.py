@@ -10,6 +10,8 @@
 - tool_executor.py: LLM工具调用执行
 - project_service.py: 项目管理服务
 - snapshot_service.py: 全量快照服务
+- startup_profile.py: 启动阶段计时与 -X importtime 报告
+- startup_warmup.py: 主窗口显示后的后台预热
 - workers/: 后台线程（LLM、仿真、RAG、文件监听）
 - graph/: LangGraph编排（状态、节点、边、构建器）
 
@@ -19,36 +21,32 @@
 - Layer 3: GraphState (Domain) - LangGraph 工作流的唯一真理来源
 """
 
-from application.bootstrap import run
-from application.session_state import (
-    SessionState,
-    SessionStateChangeHandler,
-    SESSION_PROJECT_ROOT,
-    SESSION_ID,
-    SESSION_WORKFLOW_LOCKED,
-    SESSION_CURRENT_NODE,
-    SESSION_ITERATION_COUNT,
-    SESSION_CHECKPOINT_COUNT,
-    SESSION_ACTIVE_CIRCUIT_FILE,
-)
-from application.graph_state_projector import (
-    GraphStateProjector,
-    is_workflow_locked,
-    UNLOCKED_NODES,
-)
-from application.project_service import (
-    ProjectService,
-    ProjectStatus,
-    ProjectInfo,
-)
-from application.snapshot_service import (
-    SnapshotService,
-    SnapshotInfo,
-)
-from application.graph import (
-    GraphState,
-    create_initial_state,
-)
+from shared.lazy_import import lazy_exports
+
+# 子模块按首次访问导入，见 shared/lazy_import.py
+# `import application.bootstrap` 会先执行本文件，不能在此拉起 application.graph（langgraph）
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "application.bootstrap": ("run",),
+    "application.session_state": (
+        "SessionState",
+        "SessionStateChangeHandler",
+        "SESSION_PROJECT_ROOT",
+        "SESSION_ID",
+        "SESSION_WORKFLOW_LOCKED",
+        "SESSION_CURRENT_NODE",
+        "SESSION_ITERATION_COUNT",
+        "SESSION_CHECKPOINT_COUNT",
+        "SESSION_ACTIVE_CIRCUIT_FILE",
+    ),
+    "application.graph_state_projector": (
+        "GraphStateProjector",
+        "is_workflow_locked",
+        "UNLOCKED_NODES",
+    ),
+    "application.project_service": ("ProjectService", "ProjectStatus", "ProjectInfo"),
+    "application.snapshot_service": ("SnapshotService", "SnapshotInfo"),
+    "application.graph": ("GraphState", "create_initial_state"),
+})
 
 __all__ = [
     "run",
@@ -43,8 +43,8 @@
 - Phase 3: 延迟初始化（异步，在融合事件循环中执行）
   - 3.1 WorkerManager 初始化
   - 3.2 FileManager 初始化
-  - 3.2.1 FileSearchService 初始化（精确搜索引擎）
-  - 3.2.2 UnifiedSearchService 初始化（统一搜索门面）
+  - 3.2.1 FileSearchService 注册（延迟构造，精确搜索引擎）
+  - 3.2.2 UnifiedSearchService 注册（延迟构造，统一搜索门面）
   - 3.3 ProjectService 初始化
   - 3.4 ContextManager 初始化
   - 3.5 SessionStateManager 初始化
@@ -55,12 +55,21 @@
   - 3.6.1 订阅 EVENT_LLM_CONFIG_CHANGED（应用层响应配置变更，刷新 LLM 运行时）
   - 3.8 RAG 服务初始化（RAGManager + DocumentWatcher）
   - 3.7 发布 EVENT_INIT_COMPLETE 事件
+  - 3.9 后台预热（模块导入、内置库索引、项目文件索引）
 - 应用关闭时：
+  - 后台预热线程池关闭
   - 异步运行时关闭（取消待处理任务）
   - TracingLogger 关闭（最后一次刷新）
   - TracingStore 关闭
 
 注意：ngspice 路径配置必须在应用启动时最先执行
+
+启动耗时预算：
+- 模块级导入只保留窗口骨架需要的依赖；langgraph / chromadb / tiktoken /
+  PyMuPDF 等在首次使用或后台预热时导入（各包 __init__ 使用 shared.lazy_import）
+- 构造函数无副作用的服务通过 ServiceLocator.register_factory 延迟到首次获取
+- 各阶段时间戳记录在 application.startup_profile，Phase 3 结束时写入日志；
+  导入耗时排行与首窗耗时回归见 tests/benchmarks/bench_startup.py
 """
 
 import sys
@@ -73,6 +82,11 @@ from typing import TYPE_CHECKING, Optional
 if TYPE_CHECKING:
     from PyQt6.QtWidgets import QMainWindow
 
+# ============================================================
+# Phase -1.0: 启动计时起点（无依赖，最先导入）
+# ============================================================
+from application.startup_profile import startup_profile
+
 # ============================================================
 # Phase -1.1: ngspice 路径配置（必须在所有其他导入之前）
 # ============================================================
@@ -88,6 +102,7 @@ if not _ngspice_init_success:
     print("[WARNING] 仿真功能可能不可用")
 else:
     print("[Phase -1.1] ngspice 配置成功")
+startup_profile.mark("Phase -1.1 ngspice 配置")
 
 
 # ============================================================
@@ -111,6 +126,7 @@ else:
     print("[Phase -1.2] AI 模型配置完成")
     print(f"  - 嵌入模型: {embedding_status}")
     print(f"  - 重排序模型: {reranker_status}")
+startup_profile.mark("Phase -1.2 AI 模型配置")
 
 
 # ============================================================
@@ -405,7 +421,9 @@ def _init_phase_2(app) -> Optional['QMainWindow']:
         # --------------------------------------------------------
         # 2.3 显示主窗口
         # --------------------------------------------------------
+        startup_profile.mark("Phase 2.2 MainWindow 创建")
         main_window.show()
+        startup_profile.mark("Phase 2.3 MainWindow 显示")
         if _logger:
             _logger.info("Phase 2.3 MainWindow 显示")
         else:
@@ -485,40 +503,51 @@ def _delayed_init():
             _logger.info("Phase 3.2 FileManager 初始化完成")
 
         # --------------------------------------------------------
-        # 3.2.0.1 AsyncFileOps 初始化
+        # 3.2.0.1 AsyncFileOps 注册（延迟构造）
         # 依赖：FileManager
         # 职责：异步文件操作门面（应用层接口，供 UI 和 LangGraph 节点使用）
         # --------------------------------------------------------
-        from infrastructure.persistence.async_file_ops import AsyncFileOps
         from shared.service_names import SVC_ASYNC_FILE_OPS
-        async_file_ops = AsyncFileOps(file_manager)
-        ServiceLocator.register(SVC_ASYNC_FILE_OPS, async_file_ops)
+
+        def _create_async_file_ops():
+            from infrastructure.persistence.async_file_ops import AsyncFileOps
+            return AsyncFileOps(file_manager)
+
+        ServiceLocator.register_factory(SVC_ASYNC_FILE_OPS, _create_async_file_ops)
         if _logger:
-            _logger.info("Phase 3.2.0.1 AsyncFileOps 初始化完成")
+            _logger.info("Phase 3.2.0.1 AsyncFileOps 已注册（延迟构造）")
 
         # --------------------------------------------------------
-        # 3.2.1 FileSearchService 初始化
+        # 3.2.1 FileSearchService 注册（延迟构造）
         # 依赖：FileManager、EventBus
         # 职责：精确搜索引擎（文件名、内容、符号搜索）
+        # 构造函数只建空索引；项目打开后由后台预热（3.9）构建文件名索引
         # --------------------------------------------------------
-        from infrastructure.file_intelligence.search.file_search_service import FileSearchService
         from shared.service_names import SVC_FILE_SEARCH_SERVICE
-        file_search_service = FileSearchService()
-        ServiceLocator.register(SVC_FILE_SEARCH_SERVICE, file_search_service)
+
+        def _create_file_search_service():
+            from infrastructure.file_intelligence.search.file_search_service import FileSearchService
+            return FileSearchService()
+
+        ServiceLocator.register_factory(SVC_FILE_SEARCH_SERVICE, _create_file_search_service)
         if _logger:
-            _logger.info("Phase 3.2.1 FileSearchService 初始化完成")
+            _logger.info("Phase 3.2.1 FileSearchService 已注册（延迟构造）")
 
         # --------------------------------------------------------
-        # 3.2.2 UnifiedSearchService 初始化
+        # 3.2.2 UnifiedSearchService 注册（延迟构造）
         # 依赖：FileSearchService（延迟获取）
         # 职责：统一搜索门面，协调精确搜索和语义搜索
+        # 文件变更事件在首次搜索启用缓存时才订阅，延迟构造不丢失失效通知
         # --------------------------------------------------------
-        from domain.search import UnifiedSearchService
         from shared.service_names import SVC_UNIFIED_SEARCH_SERVICE
-        unified_search_service = UnifiedSearchService()
-        ServiceLocator.register(SVC_UNIFIED_SEARCH_SERVICE, unified_search_service)
+
+        def _create_unified_search_service():
+            from domain.search import UnifiedSearchService
+            return UnifiedSearchService()
+
+        ServiceLocator.register_factory(SVC_UNIFIED_SEARCH_SERVICE, _create_unified_search_service)
         if _logger:
-            _logger.info("Phase 3.2.2 UnifiedSearchService 初始化完成")
+            _logger.info("Phase 3.2.2 UnifiedSearchService 已注册（延迟构造）")
 
         # --------------------------------------------------------
         # 3.5.1 SessionState 初始化（先于 ProjectService）
@@ -592,19 +621,26 @@ def _delayed_init():
         if _logger:
             _logger.info("Phase 3.5 SessionStateManager 初始化完成")
 
-        from domain.llm.conversation_rollback_service import ConversationRollbackService
+        # 回滚 / 压缩服务的依赖均为延迟获取，构造推迟到首次使用
         from shared.service_names import SVC_CONVERSATION_ROLLBACK_SERVICE
-        conversation_rollback_service = ConversationRollbackService()
-        ServiceLocator.register(SVC_CONVERSATION_ROLLBACK_SERVICE, conversation_rollback_service)
+
+        def _create_conversation_rollback_service():
+            from domain.llm.conversation_rollback_service import ConversationRollbackService
+            return ConversationRollbackService()
+
+        ServiceLocator.register_factory(SVC_CONVERSATION_ROLLBACK_SERVICE, _create_conversation_rollback_service)
         if _logger:
-            _logger.info("Phase 3.5.0.1 ConversationRollbackService 初始化完成")
+            _logger.info("Phase 3.5.0.1 ConversationRollbackService 已注册（延迟构造）")
 
-        from domain.llm.context_compression_service import ContextCompressionService
         from shared.service_names import SVC_CONTEXT_COMPRESSION_SERVICE
-        context_compression_service = ContextCompressionService()
-        ServiceLocator.register(SVC_CONTEXT_COMPRESSION_SERVICE, context_compression_service)
+
+        def _create_context_compression_service():
+            from domain.llm.context_compression_service import ContextCompressionService
+            return ContextCompressionService()
+
+        ServiceLocator.register_factory(SVC_CONTEXT_COMPRESSION_SERVICE, _create_context_compression_service)
         if _logger:
-            _logger.info("Phase 3.5.1 ContextCompressionService 初始化完成")
+            _logger.info("Phase 3.5.1 ContextCompressionService 已注册（延迟构造）")
 
         from application.pending_workspace_edit_service import PendingWorkspaceEditService
         from shared.service_names import SVC_PENDING_WORKSPACE_EDIT_SERVICE
@@ -753,16 +789,28 @@ def _delayed_init():
         from shared.service_names import SVC_EVENT_BUS
         from shared.event_types import EVENT_INIT_COMPLETE
         event_bus = ServiceLocator.get(SVC_EVENT_BUS)
+
+        # 3.9 后台预热：先订阅项目打开事件（EVENT_INIT_COMPLETE 的订阅者可能立即恢复项目）
+        from application.startup_warmup import get_startup_warmup
+        startup_warmup = get_startup_warmup()
+        startup_warmup.subscribe_events(event_bus)
+
         event_bus.publish(EVENT_INIT_COMPLETE, {"timestamp": time.time()})
         if _logger:
             _logger.info("Phase 3.8 EVENT_INIT_COMPLETE 已发布")
 
+        startup_warmup.start_default_tasks()
+        if _logger:
+            _logger.info("Phase 3.9 后台预热已提交")
+        startup_profile.mark("Phase 3 延迟初始化")
+
         print("=" * 50)
         print("初始化完成！应用已就绪。")
         print("=" * 50)
 
         if _logger:
             _logger.info("所有初始化阶段完成，应用已就绪")
+            _logger.info(startup_profile.format_report())
 
     except Exception as e:
         if _logger:
@@ -1205,6 +1253,7 @@ def run() -> int:
     # ============================================================
     print("\n[Phase 0] 基础设施初始化...")
     phase_0_success = _init_phase_0()
+    startup_profile.mark("Phase 0 基础设施")
     if not phase_0_success:
         print("[Phase 0] 失败，尝试继续启动（功能可能受限）...")
 
@@ -1213,6 +1262,7 @@ def run() -> int:
     # ============================================================
     print("\n[Phase 1] 核心管理器初始化...")
     phase_1_success = _init_phase_1()
+    startup_profile.mark("Phase 1 核心管理器")
     if not phase_1_success:
         print("[Phase 1] 失败，尝试继续启动（功能可能受限）...")
 
@@ -1255,6 +1305,7 @@ def run() -> int:
     from PyQt6.QtGui import QFont
 
     app = QApplication(sys.argv)
+    startup_profile.mark("Phase 2.1 QApplication 创建")
 
     try:
         from presentation.core.web_resource_host import install_app_web_resource_handler
@@ -1398,6 +1449,16 @@ def _shutdown_services():
     """
     from shared.service_locator import ServiceLocator
     from shared.service_names import SVC_FILE_WATCHER, SVC_PROJECT_SERVICE
+
+    # 停止后台预热（取消未开始的任务，不等待正在执行的任务）
+    try:
+        from application.startup_warmup import shutdown_startup_warmup
+        warmup_stats = shutdown_startup_warmup()
+        if _logger and warmup_stats:
+            _logger.info(f"后台预热线程池已关闭: {warmup_stats}")
+    except Exception as e:
+        if _logger:
+            _logger.warning(f"后台预热线程池关闭时出错: {e}")
     
     # 停止文件监听
     file_watcher = ServiceLocator.get_optional(SVC_FILE_WATCHER)
@@ -1421,6 +1482,36 @@ def _shutdown_services():
             if _logger:
                 _logger.warning(f"ProjectService 关闭项目时出错: {e}")
 
+    # 关闭进程级 HTTP 连接池，并记录连接复用 / 延迟统计
+    try:
+        from infrastructure.utils.http_client_pool import close_http_clients
+        http_stats = close_http_clients()
+        if _logger and http_stats:
+            _logger.info(f"HTTP 连接池已关闭: {http_stats}")
+    except Exception as e:
+        if _logger:
+            _logger.warning(f"HTTP 连接池关闭时出错: {e}")
+
+    # 关闭本地嵌入推理子进程
+    try:
+        from infrastructure.utils.local_embedding_backend import close_local_embedding_backends
+        local_embedding_stats = close_local_embedding_backends()
+        if _logger and local_embedding_stats:
+            _logger.info(f"本地嵌入推理进程已关闭: {local_embedding_stats}")
+    except Exception as e:
+        if _logger:
+            _logger.warning(f"本地嵌入推理进程关闭时出错: {e}")
+
+    # 关闭 Python 脚本执行进程池
+    try:
+        from domain.simulation.executor.python_worker_pool import shutdown_python_worker_pool
+        python_worker_stats = shutdown_python_worker_pool()
+        if _logger and python_worker_stats:
+            _logger.info(f"Python 脚本执行进程池已关闭: {python_worker_stats}")
+    except Exception as e:
+        if _logger:
+            _logger.warning(f"Python 脚本执行进程池关闭时出错: {e}")
+
 
 def _shutdown_tracing():
     """
@@ -0,0 +1,247 @@
+# Startup Profile - 启动耗时剖析
+"""
+启动耗时剖析
+
+职责：
+- 记录 bootstrap 各阶段相对进程内计时起点的时间戳（Phase -1 ~ Phase 3）
+- 解析 `python -X importtime` 的 stderr 输出，汇总导入耗时排行
+- 生成文本报告，供启动日志与 tests/benchmarks/bench_startup.py 使用
+
+计时起点：
+- 本模块首次导入的时刻（bootstrap 在 Phase -1 之前导入本模块）
+- 解释器自身启动与 main.py 之前的导入不计入
+
+使用示例：
+    from application.startup_profile import startup_profile
+    startup_profile.mark("Phase 2.3 MainWindow 显示")
+    print(startup_profile.format_report())
+
+    # 导入耗时报告
+    entries = parse_importtime(stderr_text)
+    print(format_importtime_report(entries, top=20))
+"""
+
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+# 计时起点（模块首次导入时刻）
+_ORIGIN = time.perf_counter()
+
+# `import time:      1945 |     192765 |     langchain_core`
+_IMPORTTIME_LINE = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S.*)$")
+
+
+# ============================================================
+# 阶段计时
+# ============================================================
+
+@dataclass(frozen=True)
+class StartupMark:
+    """一个阶段时间戳"""
+    label: str
+    elapsed_ms: float          # 相对计时起点
+    thread_name: str
+
+
+class StartupProfile:
+    """
+    启动阶段计时器
+
+    mark() 可在任意线程调用（后台预热任务也会打点），内部加锁。
+    """
+
+    def __init__(self, origin: Optional[float] = None):
+        self._origin = _ORIGIN if origin is None else origin
+        self._marks: List[StartupMark] = []
+        self._lock = threading.Lock()
+
+    def mark(self, label: str) -> float:
+        """
+        记录阶段时间戳
+
+        Args:
+            label: 阶段名
+
+        Returns:
+            float: 相对计时起点的毫秒数
+        """
+        elapsed_ms = (time.perf_counter() - self._origin) * 1000
+        with self._lock:
+            self._marks.append(StartupMark(label, elapsed_ms, threading.current_thread().name))
+        return elapsed_ms
+
+    def elapsed_ms(self, label: str) -> Optional[float]:
+        """获取某阶段首次打点的时间戳，未打点返回 None"""
+        with self._lock:
+            for mark in self._marks:
+                if mark.label == label:
+                    return mark.elapsed_ms
+        return None
+
+    def get_marks(self) -> List[StartupMark]:
+        """按打点顺序返回全部时间戳"""
+        with self._lock:
+            return list(self._marks)
+
+    def format_report(self) -> str:
+        """
+        生成阶段耗时报告
+
+        每行：累计时间、距上一打点的增量、阶段名（非主线程打点附线程名）
+        """
+        lines = ["启动阶段耗时（相对进程内计时起点）:"]
+        previous = 0.0
+        for mark in self.get_marks():
+            suffix = "" if mark.thread_name == "MainThread" else f"  [{mark.thread_name}]"
+            lines.append(
+                f"  {mark.elapsed_ms:9.1f}ms  +{mark.elapsed_ms - previous:8.1f}ms  {mark.label}{suffix}"
+            )
+            if mark.thread_name == "MainThread":
+                previous = mark.elapsed_ms
+        return "\n".join(lines)
+
+
+# ============================================================
+# -X importtime 解析
+# ============================================================
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """`-X importtime` 的一行：单位微秒"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        """顶层包名"""
+        return self.module.split(".", 1)[0]
+
+
+def parse_importtime(text: str) -> List[ImportTiming]:
+    """
+    解析 `python -X importtime` 输出
+
+    非 importtime 行（日志、表头）忽略。输出顺序与解释器一致：
+    子模块先于父模块出现。
+
+    Args:
+        text: stderr 文本
+
+    Returns:
+        List[ImportTiming]: 每个模块一条
+    """
+    entries = []
+    for line in text.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        entries.append(ImportTiming(
+            module=module.strip(),
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            depth=len(indent) // 2,
+        ))
+    return entries
+
+
+def import_chain(entries: List[ImportTiming], module: str) -> List[ImportTiming]:
+    """
+    定位某模块被谁首次导入
+
+    Args:
+        entries: parse_importtime() 的结果
+        module: 目标模块名
+
+    Returns:
+        List[ImportTiming]: 从目标模块到顶层导入者的链；未导入时为空
+    """
+    for index, entry in enumerate(entries):
+        if entry.module != module:
+            continue
+        chain = [entry]
+        depth = entry.depth
+        for parent in entries[index + 1:]:
+            if parent.depth < depth:
+                chain.append(parent)
+                depth = parent.depth
+        return chain
+    return []
+
+
+def summarize_by_package(entries: Iterable[ImportTiming]) -> List[Tuple[str, int]]:
+    """按顶层包汇总自身耗时（微秒），降序"""
+    totals: Dict[str, int] = {}
+    for entry in entries:
+        totals[entry.package] = totals.get(entry.package, 0) + entry.self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def format_importtime_report(
+    entries: List[ImportTiming],
+    top: int = 20,
+    watch: Iterable[str] = (),
+) -> str:
+    """
+    生成导入耗时报告
+
+    Args:
+        entries: parse_importtime() 的结果
+        top: 各排行保留条数
+        watch: 额外追踪的模块，输出其导入链（用于确认重型库是否被提前拉起）
+
+    Returns:
+        str: 报告文本
+    """
+    total_us = sum(entry.self_us for entry in entries)
+    lines = [f"导入总耗时 {total_us / 1000:.1f}ms，共 {len(entries)} 个模块"]
+
+    lines.append(f"累计耗时 Top {top}:")
+    for entry in sorted(entries, key=lambda item: item.cumulative_us, reverse=True)[:top]:
+        lines.append(f"  {entry.cumulative_us / 1000:9.1f}ms  {entry.module}")
+
+    lines.append(f"自身耗时（按顶层包）Top {top}:")
+    for package, self_us in summarize_by_package(entries)[:top]:
+        lines.append(f"  {self_us / 1000:9.1f}ms  {package}")
+
+    for module in watch:
+        chain = import_chain(entries, module)
+        if not chain:
+            lines.append(f"{module}: 未导入")
+            continue
+        path = " <- ".join(f"{entry.module}({entry.cumulative_us / 1000:.0f}ms)" for entry in chain)
+        lines.append(f"{module}: {path}")
+    return "\n".join(lines)
+
+
+# ============================================================
+# 模块级单例
+# ============================================================
+
+startup_profile = StartupProfile()
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "ImportTiming",
+    "StartupMark",
+    "StartupProfile",
+    "format_importtime_report",
+    "import_chain",
+    "parse_importtime",
+    "startup_profile",
+    "summarize_by_package",
+]
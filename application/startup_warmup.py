@@ -0,0 +1,314 @@
+# Startup Warmup - 主窗口显示后的后台预热
+"""
+启动后台预热
+
+职责：
+- 主窗口显示、Phase 3 完成后，在后台线程池中并行预热首次使用才需要的资源：
+  - 重型模块导入（LangGraph 状态、Agent 循环、工具注册、tiktoken）
+  - 内置 SPICE 库索引（ASC 转换、库注入首次使用时加载）
+  - 项目打开后的文件名索引（FileSearchService.build_index）
+  - 项目含 Python 仿真脚本时的脚本执行子进程（PythonExecutor.warm_up）
+- 预热只是提前执行首次使用时本来就会发生的工作：任务失败只记录日志，
+  真正使用时按原路径重新加载并报告错误
+- 应用退出时统一关闭（application.bootstrap._shutdown_services）
+
+线程模型：
+- 任务在 ThreadPoolExecutor 中执行，不触碰 Qt 对象
+- 项目打开事件在主线程回调，只负责提交任务
+- 延迟注册的服务由 ServiceLocator 在锁内构造，与主线程并发获取时只构造一次
+- 文件名索引构建由 FileSearchService 的构建锁串行化，主线程首次搜索会
+  等待进行中的预热构建，而不是再遍历一次
+
+使用示例：
+    warmup = get_startup_warmup()
+    warmup.subscribe_events(event_bus)
+    warmup.start_default_tasks()
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+DEFAULT_MAX_WORKERS = 2
+
+# 首次对话 / 首次仿真时才会导入的模块
+WARMUP_MODULES: Tuple[str, ...] = (
+    "application.graph.state",
+    "domain.llm.llm_executor",
+    "domain.llm.agent.agent_loop",
+    "domain.llm.agent.tool_factory",
+    "tiktoken",
+)
+
+TASK_OK = "ok"
+TASK_FAILED = "failed"
+TASK_CANCELLED = "cancelled"
+
+_logger = logging.getLogger(__name__)
+
+
+def _import_modules(module_names: Tuple[str, ...]) -> int:
+    """依次导入模块，缺失的可选依赖跳过，返回成功导入数"""
+    imported = 0
+    for module_name in module_names:
+        try:
+            import_module(module_name)
+            imported += 1
+        except ImportError as e:
+            _logger.debug("Warmup import skipped: %s (%s)", module_name, e)
+    return imported
+
+
+def _load_bundled_library_index() -> int:
+    # 内置库索引及其派生的运放描述、子电路路径索引（均为进程级缓存），
+    # 供首次仿真的网表规范化与 ASC 转换使用
+    from domain.simulation.spice.bundled_opamp_registry import load_bundled_opamp_descriptors
+    from domain.simulation.spice.runtime_compatibility import (
+        load_runtime_compatible_bundled_subcircuit_path_index,
+    )
+    load_bundled_opamp_descriptors()
+    return len(load_runtime_compatible_bundled_subcircuit_path_index())
+
+
+def _build_file_index(project_path: str) -> int:
+    from shared.service_locator import ServiceLocator
+    from shared.service_names import SVC_FILE_SEARCH_SERVICE
+    file_search_service = ServiceLocator.get_optional(SVC_FILE_SEARCH_SERVICE)
+    if file_search_service is None:
+        return 0
+    return file_search_service.build_index(project_path)
+
+
+def _find_python_simulation_script(project_path: str) -> Optional[Path]:
+    """查找项目中第一个定义了仿真入口函数的 Python 脚本（跳过排除目录）"""
+    from domain.simulation.executor.python_script_worker import ENTRY_FUNCTION_NAME
+    from shared.workspace_exclusions import get_workspace_exclusions
+
+    exclusions = get_workspace_exclusions()
+    entry_marker = f"def {ENTRY_FUNCTION_NAME}"
+    for root, dirs, files in os.walk(project_path):
+        relative_root = os.path.relpath(root, project_path)
+        dirs[:] = [
+            name for name in dirs
+            if not exclusions.is_excluded_dir(
+                name,
+                name if relative_root == "." else f"{relative_root}/{name}".replace("\\", "/"),
+            )
+        ]
+        for name in files:
+            if not name.endswith(".py") or exclusions.is_excluded_file(name):
+                continue
+            path = Path(root) / name
+            try:
+                if entry_marker in path.read_text(encoding="utf-8", errors="ignore"):
+                    return path
+            except OSError:
+                continue
+    return None
+
+
+def _warm_python_workers(project_path: str) -> int:
+    # 与 RAG 打开项目时预热嵌入后端相同：只在项目确实有 Python 仿真脚本时
+    # 预热一个脚本执行子进程，首次运行脚本不再等待解释器与 numpy 启动
+    script = _find_python_simulation_script(project_path)
+    if script is None:
+        return 0
+    from domain.simulation.executor.executor_registry import executor_registry
+    from domain.simulation.executor.python_executor import PythonExecutor
+
+    executor = executor_registry.get_executor_for_file(str(script))
+    if not isinstance(executor, PythonExecutor):
+        return 0
+    executor.warm_up()
+    return 1
+
+
+class StartupWarmup:
+    """
+    后台预热线程池
+
+    同名任务在上一次完成前不会重复提交（例如连续打开同一项目）。
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="startup-warmup",
+        )
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Future] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._subscribed = False
+        self._closed = False
+
+    # ============================================================
+    # 任务提交
+    # ============================================================
+
+    def submit(self, name: str, func: Callable[..., Any], *args: Any) -> Optional[Future]:
+        """
+        提交预热任务
+
+        Args:
+            name: 任务名（用于去重与统计）
+            func: 任务函数，在后台线程执行
+            *args: 任务参数
+
+        Returns:
+            Future；线程池已关闭或同名任务仍在执行时返回 None
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            pending = self._pending.get(name)
+            if pending is not None and not pending.done():
+                return None
+            future = self._executor.submit(self._run, name, func, *args)
+            self._pending[name] = future
+            return future
+
+    def start_default_tasks(self) -> None:
+        """提交默认预热任务：模块导入与内置库索引"""
+        self.submit("imports", _import_modules, WARMUP_MODULES)
+        self.submit("bundled_library_index", _load_bundled_library_index)
+
+    def warm_file_index(self, project_path: Union[str, Path]) -> Optional[Future]:
+        """为指定项目预建文件名索引"""
+        return self.submit("file_index", _build_file_index, str(project_path))
+
+    def warm_python_workers(self, project_path: Union[str, Path]) -> Optional[Future]:
+        """项目含 Python 仿真脚本时预热脚本执行子进程"""
+        return self.submit("python_workers", _warm_python_workers, str(project_path))
+
+    def _run(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        from application.startup_profile import startup_profile
+
+        started = time.perf_counter()
+        try:
+            value = func(*args)
+        except Exception as e:
+            self._record(name, TASK_FAILED, started, error=str(e))
+            _logger.warning("Warmup task %s failed: %s", name, e)
+            return None
+        self._record(name, TASK_OK, started, value=value)
+        startup_profile.mark(f"预热完成: {name}")
+        return value
+
+    def _record(self, name: str, status: str, started: float, **extra: Any) -> None:
+        duration_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._results[name] = {"status": status, "duration_ms": round(duration_ms, 1), **extra}
+        if status == TASK_OK:
+            _logger.info("Warmup task %s finished in %.1fms", name, duration_ms)
+
+    # ============================================================
+    # 事件订阅
+    # ============================================================
+
+    def subscribe_events(self, event_bus: Any) -> None:
+        """订阅项目打开事件，项目打开后预建文件名索引并预热脚本执行子进程"""
+        if self._subscribed or event_bus is None:
+            return
+        from shared.event_types import EVENT_STATE_PROJECT_OPENED
+        event_bus.subscribe(EVENT_STATE_PROJECT_OPENED, self._on_project_opened)
+        self._subscribed = True
+
+    def _on_project_opened(self, event_data: Dict[str, Any]) -> None:
+        data = event_data.get("data") or {}
+        path = data.get("path")
+        if path:
+            self.warm_file_index(path)
+            self.warm_python_workers(path)
+
+    # ============================================================
+    # 统计与关闭
+    # ============================================================
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """等待当前已提交任务完成（测试与基准使用），超时返回 False"""
+        with self._lock:
+            futures = list(self._pending.values())
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for future in futures:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                future.result(timeout=remaining)
+            except Exception:
+                return False
+        return True
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """各任务最近一次执行的状态与耗时"""
+        with self._lock:
+            return {name: dict(result) for name, result in self._results.items()}
+
+    def shutdown(self) -> Dict[str, Dict[str, Any]]:
+        """
+        关闭线程池：取消未开始的任务，不等待正在执行的任务
+
+        Returns:
+            各任务统计
+        """
+        with self._lock:
+            self._closed = True
+            for name, future in self._pending.items():
+                if future.cancel():
+                    self._results[name] = {"status": TASK_CANCELLED}
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        return self.get_stats()
+
+
+# ============================================================
+# 模块级单例
+# ============================================================
+
+_warmup: Optional[StartupWarmup] = None
+_warmup_lock = threading.Lock()
+
+
+def get_startup_warmup() -> StartupWarmup:
+    """获取进程级预热线程池（首次调用时创建）"""
+    global _warmup
+    with _warmup_lock:
+        if _warmup is None:
+            _warmup = StartupWarmup()
+        return _warmup
+
+
+def shutdown_startup_warmup() -> Dict[str, Dict[str, Any]]:
+    """
+    关闭预热线程池（应用退出时调用）
+
+    Returns:
+        任务统计；未创建过线程池时为空字典
+    """
+    global _warmup
+    with _warmup_lock:
+        warmup, _warmup = _warmup, None
+    return warmup.shutdown() if warmup is not None else {}
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "DEFAULT_MAX_WORKERS",
+    "StartupWarmup",
+    "TASK_CANCELLED",
+    "TASK_FAILED",
+    "TASK_OK",
+    "WARMUP_MODULES",
+    "get_startup_warmup",
+    "shutdown_startup_warmup",
+]
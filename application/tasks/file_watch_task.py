@@ -52,6 +52,13 @@ from watchdog.events import (
     DirMovedEvent,
 )
 
+from shared.workspace_exclusions import (
+    DEFAULT_EXCLUDED_DIRS,
+    DEFAULT_EXCLUDED_EXTENSIONS,
+    DEFAULT_EXCLUDED_NAME_PATTERNS,
+    get_workspace_exclusions,
+)
+
 
 # ============================================================
 # 常量定义
@@ -60,36 +67,11 @@ from watchdog.events import (
 # 防抖间隔（毫秒）
 DEBOUNCE_INTERVAL_MS = 200
 
-# 忽略的目录名
-IGNORED_DIRS = {
-    ".circuit_ai",
-    "simulation_results",
-    ".git",
-    "__pycache__",
-    ".vscode",
-    ".idea",
-    "node_modules",
-    ".venv",
-    "venv",
-}
-
-# 忽略的文件后缀
-IGNORED_EXTENSIONS = {
-    ".tmp",
-    ".swp",
-    ".bak",
-    ".pyc",
-    ".pyo",
-    ".log",
-}
-
-# 忽略的文件名模式
-IGNORED_PATTERNS = {
-    "~",  # 备份文件后缀
-    ".DS_Store",
-    "Thumbs.db",
-    "desktop.ini",
-}
+# 忽略规则与文件名索引共用（见 shared/workspace_exclusions.py），
+# 以下名称保留为默认规则的别名
+IGNORED_DIRS = DEFAULT_EXCLUDED_DIRS
+IGNORED_EXTENSIONS = DEFAULT_EXCLUDED_EXTENSIONS
+IGNORED_PATTERNS = DEFAULT_EXCLUDED_NAME_PATTERNS
 
 
 # ============================================================
@@ -257,6 +239,7 @@ class CircuitFileEventHandler(FileSystemEventHandler):
         super().__init__()
         self._receiver = receiver
         self._watch_root = watch_root
+        self._exclusions = get_workspace_exclusions()
         self._logger = None
     
     @property
@@ -270,12 +253,13 @@ class CircuitFileEventHandler(FileSystemEventHandler):
                 pass
         return self._logger
     
-    def _should_ignore(self, path: str) -> bool:
+    def _should_ignore(self, path: str, is_directory: bool = False) -> bool:
         """
         检查是否应该忽略该路径
         
         Args:
             path: 文件或目录路径
+            is_directory: 是否为目录
             
         Returns:
             bool: 是否应该忽略
@@ -283,23 +267,16 @@ class CircuitFileEventHandler(FileSystemEventHandler):
         try:
             path_obj = Path(path)
             
-            # 检查是否在忽略的目录中
-            for part in path_obj.parts:
-                if part in IGNORED_DIRS:
-                    return True
-            
-            # 检查文件名模式
-            name = path_obj.name
-            for pattern in IGNORED_PATTERNS:
-                if name.endswith(pattern) or name == pattern:
-                    return True
-            
-            # 检查扩展名
-            suffix = path_obj.suffix.lower()
-            if suffix in IGNORED_EXTENSIONS:
-                return True
+            # 按相对监听根目录的路径匹配，避免根目录所在的上级目录名误触发规则
+            try:
+                relative = path_obj.relative_to(self._watch_root)
+            except ValueError:
+                relative = path_obj
             
-            return False
+            return self._exclusions.is_excluded_path(
+                str(relative),
+                is_directory=is_directory
+            )
             
         except Exception:
             return True
@@ -321,10 +298,10 @@ class CircuitFileEventHandler(FileSystemEventHandler):
             dest_path: 移动目标路径
         """
         # 过滤事件
-        if self._should_ignore(path):
+        if self._should_ignore(path, is_directory):
             return
         
-        if dest_path and self._should_ignore(dest_path):
+        if dest_path and self._should_ignore(dest_path, is_directory):
             return
         
         # 通过 Qt 信号机制转发到主线程
@@ -3,7 +3,7 @@
 依赖扫描器
 
 职责：
-- 扫描项目中所有电路文件
+- 基于共享依赖图收集项目中所有电路文件
 - 解析 .include 和 .lib 引用
 - 检查引用文件是否存在
 - 生成依赖健康报告
@@ -12,7 +12,7 @@
 import hashlib
 import time
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import List, Optional, Set, TYPE_CHECKING
 
 from domain.dependency.models.dependency_item import (
     DependencyItem,
@@ -20,26 +20,46 @@ from domain.dependency.models.dependency_item import (
     DependencyType,
 )
 from domain.dependency.models.health_report import HealthReport
-from domain.dependency.scanner.include_parser import IncludeParser
 from domain.dependency.scanner.scan_config import ScanConfig
 
+if TYPE_CHECKING:
+    from domain.dependency.service.dependency_graph_service import DependencyGraphService
+
 
 class DependencyScanner:
     """
     依赖扫描器
     
-    扫描项目电路文件，检查依赖完整性
+    基于 DependencyGraphService 的缓存依赖图生成健康报告，
+    未变更的文件不会被重新读取
     """
     
-    def __init__(self, config: Optional[ScanConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ScanConfig] = None,
+        graph_service: Optional["DependencyGraphService"] = None,
+    ):
         """
         初始化扫描器
         
         Args:
             config: 扫描配置，若为 None 则使用默认配置
+            graph_service: 依赖图服务；若为 None，默认配置下使用共享实例，
+                自定义配置下创建独立实例
         """
-        self.config = config or ScanConfig()
-        self.parser = IncludeParser()
+        from domain.dependency.service.dependency_graph_service import (
+            DependencyGraphService,
+            get_dependency_graph_service,
+        )
+        
+        if graph_service is None:
+            graph_service = (
+                get_dependency_graph_service()
+                if config is None
+                else DependencyGraphService(config)
+            )
+        self.config = config or graph_service.config
+        self.graph = graph_service
         self._visited_files: Set[str] = set()
         self._current_depth: int = 0
     
@@ -60,7 +80,8 @@ class DependencyScanner:
         project_root = Path(project_path).resolve()
         report = HealthReport(project_path=str(project_root))
         
-        # 收集所有电路文件
+        # 与磁盘对齐依赖图，收集所有电路文件
+        self.graph.refresh(str(project_root))
         circuit_files = self._collect_circuit_files(project_root)
         report.scanned_files = len(circuit_files)
         
@@ -75,39 +96,13 @@ class DependencyScanner:
         return report
     
     def _collect_circuit_files(self, project_root: Path) -> List[Path]:
-        """收集项目中所有电路文件"""
-        circuit_files = []
-        # 缓存已检测的虚拟环境目录，避免重复检测
-        venv_dirs: Set[Path] = set()
-        
-        for item in project_root.rglob("*"):
-            # 跳过黑名单目录
-            if any(part in self.config.blacklist_dirs for part in item.parts):
-                continue
-            
-            # 跳过虚拟环境目录（通过特征文件检测）
-            skip = False
-            for parent in item.parents:
-                if parent in venv_dirs:
-                    skip = True
-                    break
-                if parent not in venv_dirs and self.config.is_venv_directory(parent):
-                    venv_dirs.add(parent)
-                    skip = True
-                    break
-            if skip:
-                continue
-            
-            # 检查是否为电路文件
-            if item.is_file() and self.config.is_circuit_file(item.name):
-                # 检查文件大小
-                try:
-                    if item.stat().st_size <= self.config.max_file_size_bytes:
-                        circuit_files.append(item)
-                except OSError:
-                    pass
-        
-        return circuit_files
+        """从依赖图中收集项目电路文件（黑名单与虚拟环境已在遍历时剔除）"""
+        return [
+            Path(record.path)
+            for record in self.graph.get_project_records()
+            if self.config.is_circuit_file(Path(record.path).name)
+            and record.size <= self.config.max_file_size_bytes
+        ]
     
     def _scan_file(
         self,
@@ -123,10 +118,8 @@ class DependencyScanner:
             return dependencies
         self._visited_files.add(file_key)
         
-        # 解析引用语句
-        includes = self.parser.parse_file(str(file_path))
-        
-        for include in includes:
+        # 引用语句与解析结果均来自依赖图缓存
+        for include, resolved_path in self.graph.get_resolved_includes(str(file_path)):
             # 生成唯一 ID
             dep_id = self._generate_dep_id(file_path, include.line_number, include.raw_path)
             
@@ -137,13 +130,6 @@ class DependencyScanner:
                 else DependencyType.LIB
             )
             
-            # 解析引用路径
-            resolved_path = self._resolve_path(
-                include.raw_path,
-                file_path,
-                project_root,
-            )
-            
             # 检查文件是否存在
             if resolved_path and Path(resolved_path).exists():
                 status = DependencyStatus.RESOLVED
@@ -155,7 +141,7 @@ class DependencyScanner:
                 id=dep_id,
                 dep_type=dep_type,
                 raw_path=include.raw_path,
-                source_file=str(file_path.relative_to(project_root)),
+                source_file=self._relative_source(file_path, project_root),
                 source_line=include.line_number,
                 status=status,
                 resolved_path=resolved_path if status == DependencyStatus.RESOLVED else None,
@@ -182,41 +168,17 @@ class DependencyScanner:
         source_file: Path,
         project_root: Path,
     ) -> Optional[str]:
-        """
-        解析引用路径
-        
-        尝试多种路径解析策略：
-        1. 相对于源文件目录
-        2. 相对于项目根目录
-        3. 绝对路径
-        """
-        # 清理路径
-        clean_path = raw_path.strip().strip('"').strip("'")
-        
-        # 策略1：相对于源文件目录
-        relative_to_source = source_file.parent / clean_path
-        if relative_to_source.exists():
-            return str(relative_to_source.resolve())
-        
-        # 策略2：相对于项目根目录
-        relative_to_root = project_root / clean_path
-        if relative_to_root.exists():
-            return str(relative_to_root.resolve())
-        
-        # 策略3：绝对路径
-        absolute_path = Path(clean_path)
-        if absolute_path.is_absolute() and absolute_path.exists():
-            return str(absolute_path.resolve())
-        
-        # 策略4：在常见子目录中搜索
-        common_dirs = ["subcircuits", "models", "lib", "libraries", "parameters"]
-        filename = Path(clean_path).name
-        for subdir in common_dirs:
-            search_path = project_root / subdir / filename
-            if search_path.exists():
-                return str(search_path.resolve())
-        
-        return None
+        """解析引用路径（策略见 resolve_include_path）"""
+        from domain.dependency.service.dependency_graph_service import resolve_include_path
+        return resolve_include_path(raw_path, source_file, project_root)
+    
+    @staticmethod
+    def _relative_source(file_path: Path, project_root: Path) -> str:
+        """源文件相对项目根目录的路径（项目外文件保留绝对路径）"""
+        try:
+            return str(file_path.relative_to(project_root))
+        except ValueError:
+            return str(file_path)
     
     def _generate_dep_id(
         self,
@@ -4,6 +4,7 @@
 
 包含：
 - DependencyHealthService: 依赖健康服务门面类
+- DependencyGraphService: 电路依赖图服务（缓存的 .include/.lib 依赖图）
 """
 
-__all__ = ["DependencyHealthService"]
+__all__ = ["DependencyHealthService", "DependencyGraphService"]
@@ -0,0 +1,786 @@
+# Dependency Graph Service
+"""
+电路依赖图服务
+
+职责：
+- 维护项目电路文件之间的 .include/.lib 依赖图（正向边与反向边）
+- 按内容哈希缓存单文件解析结果（引用语句、子电路定义、分析指令），
+  持久化到 .circuit_ai/dependency_graph.json，重新打开项目时只解析变更过的文件
+- 订阅 EVENT_FILE_CHANGED，增量更新单个文件的记录及受影响的边
+- 一次查询回答"某个 .lib 变更后哪些电路需要重新仿真"
+
+被调用方：
+- CircuitAnalyzer：电路文件扫描、依赖关系图
+- DependencyScanner：依赖健康报告
+
+设计说明：
+- 文件记录以绝对路径为键；项目外被引用的文件（如共享模型库）同样缓存记录，
+  但不计入项目文件集合
+- 引用路径解析采用与健康检查一致的多策略解析（源文件目录、项目根目录、
+  绝对路径、常见库目录），边中保留未解析的引用（None）以便报告缺失依赖
+- 记录有效性先比较 mtime/size，落在可疑时间窗口内的文件再比较内容哈希
+
+使用示例：
+    from domain.dependency.service.dependency_graph_service import (
+        get_dependency_graph_service,
+    )
+
+    graph = get_dependency_graph_service()
+    graph.refresh(project_path)
+    targets = graph.get_affected_simulations("models/opamp.lib")
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from domain.dependency.scanner.include_parser import IncludeParser, ParsedInclude
+from domain.dependency.scanner.scan_config import ScanConfig
+from shared.constants.paths import DEPENDENCY_GRAPH_FILE
+from shared.workspace_exclusions import get_workspace_exclusions
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+# 缓存格式版本（记录结构变化时递增）
+DEPENDENCY_GRAPH_VERSION = 1
+
+# mtime 距当前时间小于该窗口时，即使 mtime/size 未变也校验内容哈希
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# 仿真控制语句（与 CircuitAnalyzer 的主电路判定一致）
+SIMULATION_COMMANDS = (
+    ".ac", ".dc", ".tran", ".noise", ".op", ".tf", ".disto", ".pz", ".sens"
+)
+
+# 引用路径的常见库目录（按优先级）
+COMMON_LIBRARY_DIRS = ("subcircuits", "models", "lib", "libraries", "parameters")
+
+_SUBCKT_DEF_PATTERN = re.compile(r'^\s*\.subckt\s+(\S*)', re.IGNORECASE)
+_PARAM_PATTERN = re.compile(r'^\s*\.param\s+', re.IGNORECASE)
+
+# 文件监听事件类型到图操作的映射
+_WATCHER_OPERATIONS = {
+    "created": "create",
+    "modified": "update",
+    "deleted": "delete",
+}
+
+
+# ============================================================
+# 数据结构定义
+# ============================================================
+
+@dataclass
+class CircuitFileRecord:
+    """单个电路文件的解析记录（与内容哈希绑定）"""
+    path: str  # 绝对路径
+    size: int
+    mtime_ns: int
+    content_hash: str
+    # (行号, 语句类型, 原始路径, 是否带引号)
+    includes: List[Tuple[int, str, str, bool]] = field(default_factory=list)
+    subckt_defs: List[str] = field(default_factory=list)
+    analysis_directives: List[str] = field(default_factory=list)
+    has_only_params: bool = False
+
+    @property
+    def has_simulation_commands(self) -> bool:
+        return bool(self.analysis_directives)
+
+    @property
+    def has_subcircuit_defs(self) -> bool:
+        return bool(self.subckt_defs)
+
+    def to_parsed_includes(self) -> List[ParsedInclude]:
+        """生成新的 ParsedInclude 列表（调用方可自由修改）"""
+        return [
+            ParsedInclude(
+                line_number=line_number,
+                statement_type=statement_type,
+                raw_path=raw_path,
+                is_quoted=is_quoted,
+            )
+            for line_number, statement_type, raw_path, is_quoted in self.includes
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "hash": self.content_hash,
+            "includes": [list(item) for item in self.includes],
+            "subckt_defs": self.subckt_defs,
+            "analysis_directives": self.analysis_directives,
+            "has_only_params": self.has_only_params,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CircuitFileRecord":
+        return cls(
+            path=str(data["path"]),
+            size=int(data["size"]),
+            mtime_ns=int(data["mtime_ns"]),
+            content_hash=str(data["hash"]),
+            includes=[
+                (int(line), str(kind), str(raw), bool(quoted))
+                for line, kind, raw, quoted in data.get("includes", [])
+            ],
+            subckt_defs=[str(name) for name in data.get("subckt_defs", [])],
+            analysis_directives=[str(item) for item in data.get("analysis_directives", [])],
+            has_only_params=bool(data.get("has_only_params", False)),
+        )
+
+
+def build_circuit_file_record(
+    path: str,
+    content: str,
+    size: int,
+    mtime_ns: int,
+    content_hash: str,
+    parser: Optional[IncludeParser] = None,
+) -> CircuitFileRecord:
+    """
+    单遍解析文件内容，提取引用、子电路定义与分析指令
+
+    Args:
+        path: 文件绝对路径
+        content: 文件内容
+        size: 文件大小（字节）
+        mtime_ns: 修改时间（纳秒）
+        content_hash: 内容哈希
+        parser: 引用语句解析器
+
+    Returns:
+        CircuitFileRecord: 文件记录
+    """
+    parser = parser or IncludeParser()
+    includes: List[Tuple[int, str, str, bool]] = []
+    subckt_defs: List[str] = []
+    directives: List[str] = []
+    has_params = False
+    has_other = False
+
+    for line_number, line in enumerate(content.splitlines(), start=1):
+        stripped = line.strip()
+        if not stripped or stripped[0] in "*;":
+            continue
+
+        lowered = stripped.lower()
+        if lowered.startswith(SIMULATION_COMMANDS):
+            directive = lowered.split()[0]
+            if directive not in directives:
+                directives.append(directive)
+
+        match = _SUBCKT_DEF_PATTERN.match(line)
+        if match:
+            subckt_defs.append(match.group(1))
+
+        if _PARAM_PATTERN.match(line):
+            has_params = True
+        elif stripped.startswith('.'):
+            has_other = True
+
+        parsed = parser.parse_line(line, line_number)
+        if parsed:
+            includes.append(
+                (parsed.line_number, parsed.statement_type, parsed.raw_path, parsed.is_quoted)
+            )
+
+    return CircuitFileRecord(
+        path=path,
+        size=size,
+        mtime_ns=mtime_ns,
+        content_hash=content_hash,
+        includes=includes,
+        subckt_defs=subckt_defs,
+        analysis_directives=directives,
+        has_only_params=has_params and not has_other,
+    )
+
+
+def resolve_include_path(
+    raw_path: str,
+    source_file: Path,
+    project_root: Path,
+) -> Optional[str]:
+    """
+    解析引用路径
+
+    尝试多种路径解析策略：
+    1. 相对于源文件目录
+    2. 相对于项目根目录
+    3. 绝对路径
+    4. 在常见库目录中按文件名查找
+
+    Returns:
+        Optional[str]: 解析后的绝对路径，无法解析返回 None
+    """
+    clean_path = raw_path.strip().strip('"').strip("'")
+
+    relative_to_source = source_file.parent / clean_path
+    if relative_to_source.exists():
+        return str(relative_to_source.resolve())
+
+    relative_to_root = project_root / clean_path
+    if relative_to_root.exists():
+        return str(relative_to_root.resolve())
+
+    absolute_path = Path(clean_path)
+    if absolute_path.is_absolute() and absolute_path.exists():
+        return str(absolute_path.resolve())
+
+    filename = Path(clean_path).name
+    for subdir in COMMON_LIBRARY_DIRS:
+        search_path = project_root / subdir / filename
+        if search_path.exists():
+            return str(search_path.resolve())
+
+    return None
+
+
+# ============================================================
+# DependencyGraphService - 依赖图服务
+# ============================================================
+
+class DependencyGraphService:
+    """
+    电路依赖图服务
+
+    线程安全；文件记录与边在同一把锁下维护。
+    """
+
+    def __init__(self, config: Optional[ScanConfig] = None):
+        """
+        初始化服务
+
+        Args:
+            config: 扫描配置（黑名单目录、虚拟环境检测、电路扩展名）
+        """
+        self.config = config or ScanConfig()
+        self.parser = IncludeParser()
+        self._lock = threading.RLock()
+
+        self._project_root: Optional[Path] = None
+        self._extensions: Set[str] = {ext.lower() for ext in self.config.circuit_extensions}
+        self._records: Dict[str, CircuitFileRecord] = {}
+        self._project_files: Set[str] = set()
+        # 正向边：文件 -> 与 record.includes 对齐的解析结果（None 表示缺失）
+        self._edges: Dict[str, List[Optional[str]]] = {}
+        # 反向边：被引用文件 -> 引用它的文件
+        self._reverse: Dict[str, Set[str]] = {}
+        self._dirty = False
+
+        # 最近一次 refresh 的统计
+        self.parsed_count = 0
+        self.reused_count = 0
+
+        # 延迟获取的服务
+        self._event_bus = None
+        self._subscribed = False
+
+    @property
+    def event_bus(self):
+        """延迟获取事件总线"""
+        if self._event_bus is None:
+            try:
+                from shared.service_locator import ServiceLocator
+                from shared.service_names import SVC_EVENT_BUS
+                self._event_bus = ServiceLocator.get_optional(SVC_EVENT_BUS)
+            except Exception:
+                pass
+        return self._event_bus
+
+    @property
+    def project_root(self) -> Optional[Path]:
+        return self._project_root
+
+    # ============================================================
+    # 构建与持久化
+    # ============================================================
+
+    def refresh(
+        self,
+        project_path: str,
+        extensions: Optional[Iterable[str]] = None,
+    ) -> List[CircuitFileRecord]:
+        """
+        与磁盘对齐：遍历项目目录，仅重新解析内容变化的文件
+
+        Args:
+            project_path: 项目根目录路径
+            extensions: 调用方额外关心的文件扩展名
+
+        Returns:
+            List[CircuitFileRecord]: 项目内文件记录（按路径排序）
+        """
+        project_root = Path(project_path).resolve()
+
+        with self._lock:
+            if extensions:
+                new_extensions = {ext.lower() for ext in extensions} - self._extensions
+                self._extensions.update(new_extensions)
+            if project_root != self._project_root:
+                self._reset(project_root)
+                self._load_cache()
+
+            self.parsed_count = 0
+            self.reused_count = 0
+
+            found = self._walk(project_root)
+            for stale in self._project_files - found:
+                self._drop_record(stale)
+            self._project_files = found
+            for path in sorted(found):
+                if self._ensure_record(path) is None:
+                    self._project_files.discard(path)
+
+            self._rebuild_edges()
+            if self._dirty:
+                self.save_cache()
+
+        self._subscribe_file_events()
+        return self.get_project_records()
+
+    def save_cache(self) -> bool:
+        """
+        将文件记录写入缓存文件（先写临时文件再原子替换）
+
+        Returns:
+            bool: 是否写入成功
+        """
+        with self._lock:
+            if self._project_root is None:
+                return False
+            data = {
+                "version": DEPENDENCY_GRAPH_VERSION,
+                "project_root": str(self._project_root),
+                "records": [record.to_dict() for record in self._records.values()],
+            }
+            cache_path = self._project_root / DEPENDENCY_GRAPH_FILE
+            self._dirty = False
+
+        temp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp_path, cache_path)
+            return True
+        except OSError:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            return False
+
+    def _load_cache(self) -> None:
+        """读取缓存；版本或项目根目录不一致时忽略"""
+        cache_path = self._project_root / DEPENDENCY_GRAPH_FILE
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != DEPENDENCY_GRAPH_VERSION
+            or data.get("project_root") != str(self._project_root)
+        ):
+            return
+        try:
+            records = [CircuitFileRecord.from_dict(item) for item in data.get("records", [])]
+        except (KeyError, TypeError, ValueError):
+            return
+        self._records = {record.path: record for record in records}
+
+    def _reset(self, project_root: Path) -> None:
+        self._project_root = project_root
+        self._records.clear()
+        self._project_files.clear()
+        self._edges.clear()
+        self._reverse.clear()
+        self._dirty = False
+
+    def _walk(self, top: Path) -> Set[str]:
+        """收集 top 下的电路文件（跳过生成目录、黑名单目录与虚拟环境）"""
+        exclusions = get_workspace_exclusions(self.config.blacklist_dirs)
+        found: Set[str] = set()
+
+        for dirpath, dirnames, filenames in os.walk(top):
+            rel_dir = os.path.relpath(dirpath, self._project_root)
+            rel_dir = "" if rel_dir == "." else rel_dir
+            dirnames[:] = [
+                name for name in dirnames
+                if not exclusions.is_excluded_dir(name, os.path.join(rel_dir, name))
+                and not self.config.is_venv_directory(Path(dirpath) / name)
+            ]
+            for name in filenames:
+                if exclusions.is_excluded_file(name):
+                    continue
+                if os.path.splitext(name)[1].lower() in self._extensions:
+                    found.add(str((Path(dirpath) / name).resolve()))
+
+        return found
+
+    # ============================================================
+    # 文件记录
+    # ============================================================
+
+    def _ensure_record(self, path: str) -> Optional[CircuitFileRecord]:
+        """返回与磁盘一致的文件记录，必要时重新读取解析"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._drop_record(path)
+            return None
+
+        record = self._records.get(path)
+        racy = time.time_ns() - stat.st_mtime_ns < RACY_MTIME_WINDOW_NS
+        if (
+            record is not None
+            and not racy
+            and record.mtime_ns == stat.st_mtime_ns
+            and record.size == stat.st_size
+        ):
+            self.reused_count += 1
+            return record
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self._drop_record(path)
+            return None
+
+        content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if record is not None and record.content_hash == content_hash:
+            if record.mtime_ns != stat.st_mtime_ns or record.size != stat.st_size:
+                record.mtime_ns = stat.st_mtime_ns
+                record.size = stat.st_size
+                self._dirty = True
+            self.reused_count += 1
+            return record
+
+        record = build_circuit_file_record(
+            path,
+            data.decode("utf-8", errors="ignore"),
+            stat.st_size,
+            stat.st_mtime_ns,
+            content_hash,
+            self.parser,
+        )
+        self._records[path] = record
+        self._dirty = True
+        self.parsed_count += 1
+        return record
+
+    def _drop_record(self, path: str) -> None:
+        if self._records.pop(path, None) is not None:
+            self._dirty = True
+        self._set_edges(path, None)
+
+    # ============================================================
+    # 边维护
+    # ============================================================
+
+    def _set_edges(self, path: str, targets: Optional[List[Optional[str]]]) -> None:
+        """替换 path 的正向边并同步反向边"""
+        for old_target in self._edges.pop(path, None) or []:
+            if old_target is None:
+                continue
+            referrers = self._reverse.get(old_target)
+            if referrers is not None:
+                referrers.discard(path)
+                if not referrers:
+                    del self._reverse[old_target]
+        if targets is None:
+            return
+        self._edges[path] = targets
+        for target in targets:
+            if target is not None:
+                self._reverse.setdefault(target, set()).add(path)
+
+    def _update_edges(self, paths: Iterable[str]) -> None:
+        """重新解析 paths 的引用路径，并沿新出现的边补齐项目外文件记录"""
+        pending = list(paths)
+        visited: Set[str] = set()
+        while pending:
+            path = pending.pop()
+            if path in visited:
+                continue
+            visited.add(path)
+            record = self._records.get(path)
+            if record is None:
+                self._set_edges(path, None)
+                continue
+            targets = [
+                resolve_include_path(raw_path, Path(path), self._project_root)
+                for _, _, raw_path, _ in record.includes
+            ]
+            self._set_edges(path, targets)
+            if not self.config.parse_nested_includes:
+                continue
+            for target in targets:
+                if target is None or target in visited:
+                    continue
+                if target not in self._edges and target not in self._project_files:
+                    if self._ensure_record(target) is not None:
+                        pending.append(target)
+
+    def _rebuild_edges(self) -> None:
+        self._edges.clear()
+        self._reverse.clear()
+        self._update_edges(sorted(self._project_files))
+        # 不再被引用的项目外文件记录随之淘汰
+        for path in [p for p in self._records if p not in self._edges]:
+            self._records.pop(path)
+            self._dirty = True
+
+    # ============================================================
+    # 增量更新
+    # ============================================================
+
+    def apply_file_change(self, path: str, operation: str, is_directory: bool = False) -> None:
+        """
+        将单个文件变更应用到依赖图
+
+        Args:
+            path: 变更文件路径（绝对路径或相对项目根目录）
+            operation: create/update/delete
+            is_directory: 是否为目录
+        """
+        with self._lock:
+            if self._project_root is None or not path:
+                return
+            # 与图中的键一致：均为 Path.resolve() 后的绝对路径
+            changed_path = self._absolute(path)
+
+            if is_directory:
+                self._apply_directory_change(changed_path, operation)
+                return
+
+            affected: Set[str] = set()
+            if changed_path in self._records or self._is_project_circuit_file(changed_path):
+                affected.add(changed_path)
+                if operation == "delete":
+                    self._project_files.discard(changed_path)
+                    self._drop_record(changed_path)
+                elif self._ensure_record(changed_path) is not None:
+                    if self._is_project_circuit_file(changed_path):
+                        self._project_files.add(changed_path)
+                else:
+                    self._project_files.discard(changed_path)
+
+            if operation in ("create", "delete"):
+                # 文件出现或消失可能改变其他文件引用的解析结果
+                name = os.path.basename(changed_path)
+                affected.update(
+                    source for source, record in self._records.items()
+                    if any(Path(raw).name == name for _, _, raw, _ in record.includes)
+                )
+            if affected:
+                self._update_edges(affected)
+
+    def _apply_directory_change(self, directory: str, operation: str) -> None:
+        if operation == "delete":
+            prefix = directory + os.sep
+            removed = [p for p in self._project_files if p.startswith(prefix)]
+            for path in removed:
+                self._project_files.discard(path)
+                self._drop_record(path)
+        elif operation == "create" and os.path.isdir(directory):
+            if not self._is_project_path(directory, is_directory=True):
+                return
+            for path in self._walk(Path(directory)):
+                if self._ensure_record(path) is not None:
+                    self._project_files.add(path)
+        else:
+            return
+        self._rebuild_edges()
+
+    def _is_project_path(self, path: str, is_directory: bool = False) -> bool:
+        try:
+            relative = os.path.relpath(path, self._project_root)
+        except ValueError:
+            return False
+        if relative.startswith(os.pardir):
+            return False
+        exclusions = get_workspace_exclusions(self.config.blacklist_dirs)
+        return not exclusions.is_excluded_path(relative, is_directory)
+
+    def _is_project_circuit_file(self, path: str) -> bool:
+        return (
+            os.path.splitext(path)[1].lower() in self._extensions
+            and self._is_project_path(path)
+        )
+
+    def _subscribe_file_events(self) -> None:
+        """订阅文件变更事件，用于增量更新依赖图"""
+        if self._subscribed or self.event_bus is None:
+            return
+        try:
+            from shared.event_types import EVENT_FILE_CHANGED
+            self.event_bus.subscribe(EVENT_FILE_CHANGED, self._on_file_changed)
+            self._subscribed = True
+        except Exception:
+            pass
+
+    def _on_file_changed(self, event_data: Dict[str, Any]) -> None:
+        """
+        处理文件变更事件
+
+        同时兼容 FileManager 事件（operation: create/update/delete）
+        与文件监听事件（event_type: created/modified/deleted/moved）。
+        """
+        data = event_data.get("data", {})
+        path = data.get("path", "")
+        operation = data.get("operation") or _WATCHER_OPERATIONS.get(
+            data.get("event_type", ""), ""
+        )
+        is_directory = bool(data.get("is_directory", False))
+
+        if data.get("event_type") == "moved":
+            self.apply_file_change(path, "delete", is_directory)
+            self.apply_file_change(data.get("dest_path", ""), "create", is_directory)
+            return
+
+        if operation:
+            self.apply_file_change(path, operation, is_directory)
+
+    # ============================================================
+    # 查询接口
+    # ============================================================
+
+    def get_project_records(self) -> List[CircuitFileRecord]:
+        """获取项目内文件记录（按路径排序）"""
+        with self._lock:
+            return [self._records[path] for path in sorted(self._project_files)]
+
+    def get_record(self, file_path: str) -> Optional[CircuitFileRecord]:
+        """
+        获取单个文件的记录（不在图中的文件按需读取并缓存）
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            Optional[CircuitFileRecord]: 文件记录，文件不可读时返回 None
+        """
+        with self._lock:
+            return self._ensure_record(self._absolute(file_path))
+
+    def get_resolved_includes(
+        self,
+        file_path: str,
+    ) -> List[Tuple[ParsedInclude, Optional[str]]]:
+        """
+        获取文件的引用语句及其解析结果
+
+        Returns:
+            List[Tuple[ParsedInclude, Optional[str]]]: (引用, 解析后的绝对路径或 None)
+        """
+        with self._lock:
+            path = self._absolute(file_path)
+            record = self._ensure_record(path)
+            if record is None:
+                return []
+            targets = self._edges.get(path)
+            if targets is None or len(targets) != len(record.includes):
+                root = self._project_root or Path(path).parent
+                targets = [
+                    resolve_include_path(raw_path, Path(path), root)
+                    for _, _, raw_path, _ in record.includes
+                ]
+            return list(zip(record.to_parsed_includes(), targets))
+
+    def get_dependencies(self, file_path: str) -> List[str]:
+        """获取文件直接引用且存在的文件（绝对路径）"""
+        return [
+            target
+            for _, target in self.get_resolved_includes(file_path)
+            if target is not None
+        ]
+
+    def get_dependents(self, file_path: str, transitive: bool = True) -> List[str]:
+        """
+        获取引用该文件的文件（绝对路径，按路径排序）
+
+        Args:
+            file_path: 被引用文件路径
+            transitive: 是否包含间接引用者
+        """
+        with self._lock:
+            start = self._absolute(file_path)
+            found: Set[str] = set()
+            pending = [start]
+            while pending:
+                current = pending.pop()
+                for referrer in self._reverse.get(current, ()):
+                    if referrer not in found and referrer != start:
+                        found.add(referrer)
+                        if transitive:
+                            pending.append(referrer)
+            return sorted(found)
+
+    def get_affected_simulations(self, file_path: str) -> List[str]:
+        """
+        获取该文件变更后需要重新仿真的电路（绝对路径，按路径排序）
+
+        包含文件自身（若为可仿真电路）以及直接或间接引用它的、
+        含仿真控制语句的项目文件。
+        """
+        with self._lock:
+            start = self._absolute(file_path)
+            candidates = [start] + self.get_dependents(start)
+            return sorted(
+                path for path in set(candidates)
+                if path in self._project_files
+                and self._records[path].has_simulation_commands
+            )
+
+    def _absolute(self, file_path: str) -> str:
+        path = Path(file_path)
+        if not path.is_absolute() and self._project_root is not None:
+            path = self._project_root / path
+        return str(path.resolve())
+
+
+# ============================================================
+# 共享实例
+# ============================================================
+
+_shared_graph_service: Optional[DependencyGraphService] = None
+_shared_graph_lock = threading.Lock()
+
+
+def get_dependency_graph_service() -> DependencyGraphService:
+    """获取进程内共享的依赖图服务"""
+    global _shared_graph_service
+    with _shared_graph_lock:
+        if _shared_graph_service is None:
+            _shared_graph_service = DependencyGraphService()
+        return _shared_graph_service
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "CircuitFileRecord",
+    "DependencyGraphService",
+    "SIMULATION_COMMANDS",
+    "build_circuit_file_record",
+    "get_dependency_graph_service",
+    "resolve_include_path",
+]
@@ -9,6 +9,7 @@
 - 发布依赖相关事件
 """
 
+import json
 from pathlib import Path
 from typing import List, Optional
 
@@ -17,6 +18,7 @@ from domain.dependency.models.health_report import HealthReport
 from domain.dependency.models.resolution_result import ResolutionResult
 from domain.dependency.scanner.dependency_scanner import DependencyScanner
 from domain.dependency.scanner.scan_config import ScanConfig
+from domain.dependency.service.dependency_graph_service import DependencyGraphService
 from domain.dependency.resolver.local_resolver import LocalResolver
 from domain.dependency.resolver.external_resolver import ExternalResolver
 from domain.dependency.resolver.resolution_strategy import ResolutionStrategy
@@ -39,8 +41,10 @@ class DependencyHealthService:
         Args:
             config: 扫描配置
         """
-        self.config = config or ScanConfig()
-        self.scanner = DependencyScanner(self.config)
+        # 默认配置下与 CircuitAnalyzer 共用同一依赖图
+        self.scanner = DependencyScanner(config)
+        self.config = self.scanner.config
+        self.graph: DependencyGraphService = self.scanner.graph
         
         # 解析策略链（按优先级排序）
         self._resolvers: List[ResolutionStrategy] = [
@@ -154,12 +158,7 @@ class DependencyHealthService:
             return None
         
         try:
-            if self.json_repo:
-                data = self.json_repo.load_json(cache_file)
-            else:
-                import json
-                data = json.loads(cache_file.read_text())
-            
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
             report = HealthReport.from_dict(data)
             self._cached_report = report
             return report
@@ -169,6 +168,18 @@ class DependencyHealthService:
                 self.logger.warning(f"加载依赖健康报告失败: {e}")
             return None
     
+    def get_affected_simulations(self, file_path: str) -> List[str]:
+        """
+        获取文件变更后需要重新仿真的电路
+        
+        Args:
+            file_path: 变更文件路径（绝对路径或相对项目根目录）
+            
+        Returns:
+            List[str]: 需要重新仿真的电路文件绝对路径
+        """
+        return self.graph.get_affected_simulations(file_path)
+    
     def try_resolve(
         self,
         dependency: DependencyItem,
@@ -244,11 +255,7 @@ class DependencyHealthService:
         cache_file = cache_dir / self.REPORT_CACHE_FILE
         
         try:
-            if self.json_repo:
-                self.json_repo.save_json(cache_file, report.to_dict())
-            else:
-                import json
-                cache_file.write_text(json.dumps(report.to_dict(), indent=2))
+            cache_file.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
         except Exception as e:
             if self.logger:
                 self.logger.warning(f"保存依赖健康报告失败: {e}")
@@ -30,120 +30,102 @@ Agent 工具调用模块：
 - external_service_manager.py: 外部服务统一管理（重试/熔断）
 """
 
-# 消息辅助函数
-from domain.llm.message_helpers import (
-    # 角色常量
-    ROLE_USER,
-    ROLE_ASSISTANT,
-    ROLE_SYSTEM,
-    ROLE_TOOL,
-    VALID_ROLES,
-    # 消息创建
-    create_human_message,
-    create_ai_message,
-    create_system_message,
-    create_tool_message,
-    # 扩展字段读取
-    get_reasoning_content,
-    get_operations,
-    get_usage,
-    get_attachments,
-    get_timestamp,
-    is_partial_response,
-    get_stop_reason,
-    get_tool_calls_pending,
-    get_web_search_results,
-    # 扩展字段写入
-    set_reasoning_content,
-    set_operations,
-    mark_as_partial,
-    mark_as_complete,
-    # 消息类型判断
-    is_human_message,
-    is_ai_message,
-    is_system_message,
-    is_tool_message,
-    get_role,
-    # 序列化
-    message_to_dict,
-    dict_to_message,
-    messages_to_dicts,
-    dicts_to_messages,
-)
-
-# 辅助数据结构
-from domain.llm.message_types import (
-    TokenUsage,
-    Attachment,
-)
-
-# 对话格式化
-from domain.llm.conversation import (
-    format_message_for_display,
-    format_reasoning_content,
-    split_content_and_reasoning,
-    format_partial_indicator,
-    render_operations_summary,
-    render_web_search_results,
-    format_messages_for_export,
-    StreamingContentBuffer,
-)
-
-# Token 计数
-from domain.llm.token_counter import (
-    count_tokens,
-    count_message_tokens,
-    get_model_context_limit,
-    get_model_output_limit,
-    get_available_context,
-)
-
-# 缓存统计
-from domain.llm.cache_stats_tracker import (
-    CacheStats,
-    SessionCacheStats,
-    CacheEfficiencyReport,
-    CacheStatsTracker,
-)
-
-# Token 监控
-from domain.llm.token_monitor import (
-    TokenMonitor,
-)
-
-# 消息存储
-from domain.llm.message_store import (
-    MessageStore,
-    IMPORTANCE_HIGH,
-    IMPORTANCE_MEDIUM,
-    IMPORTANCE_LOW,
-)
-
-# 会话状态管理器
-from domain.llm.session_state_manager import (
-    SessionStateManager,
-    SessionInfo,
-)
-
-# 上下文管理器（门面类）
-from domain.llm.context_manager import ContextManager
-
-# 外部服务管理器
-from domain.llm.external_service_manager import (
-    ExternalServiceManager,
-    ServiceCallResult,
-    CallStatistics,
-    CircuitBreaker,
-    CircuitState,
-    ServiceStatus,
-    SERVICE_LLM_ZHIPU,
-    SERVICE_LLM_QWEN,
-    SERVICE_LLM_DEEPSEEK,
-    ALL_SERVICE_TYPES,
-)
-
-# LLM 执行器
-from domain.llm.llm_executor import LLMExecutor
+from shared.lazy_import import lazy_exports
+
+# 子模块按首次访问导入，见 shared/lazy_import.py
+__getattr__, __dir__ = lazy_exports(__name__, {
+    # 消息辅助函数
+    "domain.llm.message_helpers": (
+        "ROLE_USER",
+        "ROLE_ASSISTANT",
+        "ROLE_SYSTEM",
+        "ROLE_TOOL",
+        "VALID_ROLES",
+        "create_human_message",
+        "create_ai_message",
+        "create_system_message",
+        "create_tool_message",
+        "get_reasoning_content",
+        "get_operations",
+        "get_usage",
+        "get_attachments",
+        "get_timestamp",
+        "is_partial_response",
+        "get_stop_reason",
+        "get_tool_calls_pending",
+        "get_web_search_results",
+        "set_reasoning_content",
+        "set_operations",
+        "mark_as_partial",
+        "mark_as_complete",
+        "is_human_message",
+        "is_ai_message",
+        "is_system_message",
+        "is_tool_message",
+        "get_role",
+        "message_to_dict",
+        "dict_to_message",
+        "messages_to_dicts",
+        "dicts_to_messages",
+    ),
+    # 辅助数据结构
+    "domain.llm.message_types": ("TokenUsage", "Attachment"),
+    # 对话格式化
+    "domain.llm.conversation": (
+        "format_message_for_display",
+        "format_reasoning_content",
+        "split_content_and_reasoning",
+        "format_partial_indicator",
+        "render_operations_summary",
+        "render_web_search_results",
+        "format_messages_for_export",
+        "StreamingContentBuffer",
+    ),
+    # Token 计数
+    "domain.llm.token_counter": (
+        "count_tokens",
+        "count_tokens_many",
+        "count_message_tokens",
+        "get_model_context_limit",
+        "get_model_output_limit",
+        "get_available_context",
+    ),
+    # 缓存统计
+    "domain.llm.cache_stats_tracker": (
+        "CacheStats",
+        "SessionCacheStats",
+        "CacheEfficiencyReport",
+        "CacheStatsTracker",
+    ),
+    # Token 监控
+    "domain.llm.token_monitor": ("TokenMonitor",),
+    # 消息存储
+    "domain.llm.message_store": (
+        "MessageStore",
+        "IMPORTANCE_HIGH",
+        "IMPORTANCE_MEDIUM",
+        "IMPORTANCE_LOW",
+    ),
+    # 会话状态管理器
+    "domain.llm.session_state_manager": ("SessionStateManager", "SessionInfo"),
+    # 上下文管理器（门面类）
+    "domain.llm.context_manager": ("ContextManager",),
+    # 外部服务管理器
+    "domain.llm.external_service_manager": (
+        "ExternalServiceManager",
+        "ServiceCallResult",
+        "CallStatistics",
+        "CircuitBreaker",
+        "CircuitState",
+        "ServiceStatus",
+        "SERVICE_LLM_ZHIPU",
+        "SERVICE_LLM_QWEN",
+        "SERVICE_LLM_DEEPSEEK",
+        "ALL_SERVICE_TYPES",
+    ),
+    # LLM 执行器
+    "domain.llm.llm_executor": ("LLMExecutor",),
+})
 
 __all__ = [
     # 角色常量
@@ -197,6 +179,7 @@ __all__ = [
     "StreamingContentBuffer",
     # Token 计数
     "count_tokens",
+    "count_tokens_many",
     "count_message_tokens",
     "get_model_context_limit",
     "get_model_output_limit",
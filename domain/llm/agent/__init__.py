@@ -19,6 +19,8 @@ Agent 工具调用模块
 - tool_registry.py     : 工具注册表
 - tool_factory.py      : 工具工厂（集中注册所有默认工具）
 - agent_loop.py        : ReAct 循环控制器
+- stream_coalescer.py  : 流式增量合并（时间 / 大小窗口）
+- tool_scheduler.py    : 单轮工具调用调度（只读并发、阻塞 I/O 进线程池、变更按资源串行）
 - agent_prompt_builder.py : Agent 系统提示词构建器
 - tools/               : 具体工具实现
     read_file, patch_file, rewrite_file  — 文件操作
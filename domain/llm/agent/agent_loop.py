@@ -4,8 +4,8 @@ ReAct 循环控制器
 
 职责：
 - 管理 LLM → 工具调用 → 结果回传 → 再次 LLM 的多轮交互循环
-- 流式转发 LLM 响应给 UI
-- 三阶段工具执行：prepare → execute → finalize
+- 流式转发 LLM 响应给 UI（按时间 / 大小窗口合并增量事件）
+- 三阶段工具执行：prepare → execute → finalize（由 ToolScheduler 编排并发）
 - 自动判断何时结束循环（LLM 不再调用工具时）
 
 参考来源：
@@ -38,9 +38,10 @@ from domain.llm.agent.types import (
     ToolCallInfo,
     ToolContext,
     ToolResult,
-    create_error_result,
 )
 from domain.llm.agent.tool_registry import ToolRegistry
+from domain.llm.agent.stream_coalescer import StreamChunkCoalescer
+from domain.llm.agent.tool_scheduler import ToolScheduler
 
 
 # ============================================================
@@ -123,6 +124,7 @@ class AgentLoop:
         self._model = model
         self._thinking = thinking
         self._max_turns = max_turns
+        self._scheduler = ToolScheduler(registry, context)
         self._logger = logging.getLogger(__name__)
 
     async def run(
@@ -237,6 +239,8 @@ class AgentLoop:
         lock 失败所导致的 ``RuntimeError: no running event loop``。
         """
         turn = TurnResult()
+        content_parts: List[str] = []
+        reasoning_parts: List[str] = []
 
         tool_names = []
         for schema in schemas:
@@ -247,36 +251,49 @@ class AgentLoop:
             f"Agent turn request tools: count={len(tool_names)}, tools={tool_names}"
         )
 
-        async for chunk in self._client.chat_stream(
-            messages=messages,
-            model=self._model,
-            tools=schemas if schemas else None,
-            thinking=self._thinking,
-        ):
-            if chunk.reasoning_content:
-                turn.reasoning_content += chunk.reasoning_content
-                await self._emit(on_event, EVENT_STREAM_CHUNK, {
-                    "step_index": step_index,
-                    "chunk_type": "reasoning",
-                    "text": chunk.reasoning_content,
-                })
-
-            if chunk.content:
-                turn.content += chunk.content
-                await self._emit(on_event, EVENT_STREAM_CHUNK, {
-                    "step_index": step_index,
-                    "chunk_type": "content",
-                    "text": chunk.content,
-                })
-
-            if chunk.usage:
-                turn.usage = chunk.usage
+        async def emit_chunk(chunk_type: str, text: str) -> None:
+            await self._emit(on_event, EVENT_STREAM_CHUNK, {
+                "step_index": step_index,
+                "chunk_type": chunk_type,
+                "text": text,
+            })
 
-            if chunk.tool_calls:
-                turn.tool_calls = chunk.tool_calls
-            if chunk.finish_reason:
-                turn.finish_reason = chunk.finish_reason
+        # 列表累积 + 窗口合并：避免 += 的二次方拼接与逐 delta 的 UI 往返
+        coalescer = StreamChunkCoalescer(emit_chunk)
+        try:
+            async for chunk in self._client.chat_stream(
+                messages=messages,
+                model=self._model,
+                tools=schemas if schemas else None,
+                thinking=self._thinking,
+            ):
+                if chunk.reasoning_content:
+                    reasoning_parts.append(chunk.reasoning_content)
+                    await coalescer.push("reasoning", chunk.reasoning_content)
+
+                if chunk.content:
+                    content_parts.append(chunk.content)
+                    await coalescer.push("content", chunk.content)
+
+                if chunk.usage:
+                    turn.usage = chunk.usage
+
+                if chunk.tool_calls:
+                    turn.tool_calls = chunk.tool_calls
+                if chunk.finish_reason:
+                    turn.finish_reason = chunk.finish_reason
+
+            await coalescer.aclose()
+        finally:
+            # 异常 / 取消路径：先发出已缓冲的文本，UI 与 turn 内容保持一致
+            try:
+                await coalescer.flush()
+            except Exception as e:
+                self._logger.warning(f"Failed to flush buffered stream text: {e}")
+            coalescer.cancel()
 
+        turn.content = "".join(content_parts)
+        turn.reasoning_content = "".join(reasoning_parts)
         return turn
 
     # ============================================================
@@ -293,7 +310,9 @@ class AgentLoop:
         执行工具调用列表
 
         对照 pi-mono agent-loop.ts 第 336-438 行。
-        当前采用顺序执行策略。
+        由 ToolScheduler 编排：只读调用并发执行，阻塞型工具在工作线程
+        池中运行，变更调用按资源串行。tool_start / tool_end 事件在每个
+        调用真正开始 / 结束时发射。
 
         Args:
             tool_calls: LLM 返回的工具调用列表
@@ -302,18 +321,7 @@ class AgentLoop:
         Returns:
             ToolResult 列表，与 tool_calls 一一对应
         """
-        results = []
-
-        for tc_raw in tool_calls:
-            # 解析工具调用信息
-            try:
-                tc_info = ToolCallInfo.from_api_format(tc_raw)
-            except ValueError as e:
-                self._logger.error(f"Invalid tool call format: {e}")
-                results.append(create_error_result(str(e)))
-                continue
-
-            # 发射 tool_start 事件
+        async def on_start(tc_info: ToolCallInfo) -> None:
             await self._emit(on_event, EVENT_TOOL_START, {
                 "step_index": step_index,
                 "tool_call_id": tc_info.id,
@@ -321,10 +329,7 @@ class AgentLoop:
                 "arguments": tc_info.arguments,
             })
 
-            # 三阶段执行
-            result = await self._execute_single_tool(tc_info)
-
-            # 发射 tool_end 事件
+        async def on_end(tc_info: ToolCallInfo, result: ToolResult) -> None:
             await self._emit(on_event, EVENT_TOOL_END, {
                 "step_index": step_index,
                 "tool_call_id": tc_info.id,
@@ -334,57 +339,7 @@ class AgentLoop:
                 "details": result.details,
             })
 
-            results.append(result)
-
-        return results
-
-    async def _execute_single_tool(self, tc_info: ToolCallInfo) -> ToolResult:
-        """
-        执行单个工具调用（三阶段：prepare → execute → finalize）
-
-        对照 pi-mono agent-loop.ts 第 458-580 行。
-
-        Args:
-            tc_info: 工具调用信息
-
-        Returns:
-            ToolResult: 工具执行结果
-        """
-        # ---- prepare ----
-        tool = self._registry.get(tc_info.name)
-        if not tool:
-            self._logger.warning(f"Tool not found: {tc_info.name}")
-            return create_error_result(
-                f"Tool '{tc_info.name}' not found. "
-                f"Available tools: {', '.join(self._registry.get_names())}"
-            )
-
-        # 参数校验
-        validation_error = tool.validate_params(tc_info.arguments)
-        if validation_error:
-            self._logger.warning(
-                f"Tool '{tc_info.name}' param validation failed: {validation_error}"
-            )
-            return create_error_result(validation_error)
-
-        # ---- execute ----
-        try:
-            result = await tool.execute(
-                tc_info.id, tc_info.arguments, self._context
-            )
-            self._logger.info(
-                f"Tool '{tc_info.name}' executed: "
-                f"is_error={result.is_error}, "
-                f"content_len={len(result.content)}"
-            )
-            return result
-        except Exception as e:
-            self._logger.error(
-                f"Tool '{tc_info.name}' execution error: {e}"
-            )
-            return create_error_result(
-                f"Tool execution error: {e}"
-            )
+        return await self._scheduler.run(tool_calls, on_start, on_end)
 
     # ============================================================
     # 辅助方法
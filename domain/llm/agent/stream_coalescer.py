@@ -0,0 +1,152 @@
+# Stream Coalescer - 流式增量合并器
+"""
+流式增量合并器
+
+职责：
+- 把 provider 逐个 delta 的流式文本合并成少量 stream_chunk 事件
+- 按时间窗口（默认 25ms，落在 16–33ms 的一到两帧之间）或累计字符数
+  （默认 2048）触发 flush，两者先到先发
+- 保持 reasoning / content 的先后顺序：块类型切换时先 flush 旧类型
+
+设计说明：
+- 每个事件都要穿过 LLMExecutor → Qt 信号 → React 会话面板，
+  逐 delta 转发时长推理输出会产生数千次 UI 往返
+- 窗口到期但 provider 暂时没有新 delta 时，由 loop.call_later 的
+  定时器补发，避免尾部文本卡在缓冲区里
+- flush 在 asyncio.Lock 内交换缓冲区并发射，定时器与 push 触发的
+  flush 不会乱序
+
+架构位置：
+- 被 AgentLoop._stream_llm_response 使用
+- 只依赖传入的 emit 协程，不感知事件回调的具体形态
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional
+
+
+# ============================================================
+# 常量
+# ============================================================
+
+# 时间窗口（秒）
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.025
+
+# 单个事件的最大累计字符数
+DEFAULT_FLUSH_MAX_CHARS = 2048
+
+# emit(chunk_type, text)
+CoalescedEmit = Callable[[str, str], Awaitable[None]]
+
+
+# ============================================================
+# StreamChunkCoalescer
+# ============================================================
+
+class StreamChunkCoalescer:
+    """
+    按时间 / 大小窗口合并流式文本块
+
+    使用示例：
+        coalescer = StreamChunkCoalescer(emit)
+        try:
+            async for chunk in stream:
+                await coalescer.push("content", chunk.content)
+            await coalescer.aclose()
+        finally:
+            await coalescer.flush()    # 异常 / 取消路径上不丢缓冲文本
+            coalescer.cancel()
+    """
+
+    def __init__(
+        self,
+        emit: CoalescedEmit,
+        *,
+        interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_chars: int = DEFAULT_FLUSH_MAX_CHARS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._emit = emit
+        self._interval = max(0.0, float(interval))
+        self._max_chars = max(1, int(max_chars))
+        self._clock = clock
+        self._parts: List[str] = []
+        self._size = 0
+        self._chunk_type: Optional[str] = None
+        self._window_start = 0.0
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_flush: Optional["asyncio.Task[None]"] = None
+        self.emitted_count = 0
+
+    async def push(self, chunk_type: str, text: str) -> None:
+        """追加一段文本，满足窗口条件时立即 flush"""
+        if not text:
+            return
+        if self._parts and chunk_type != self._chunk_type:
+            await self.flush()
+        if not self._parts:
+            self._window_start = self._clock()
+            self._arm_timer()
+        self._parts.append(text)
+        self._size += len(text)
+        self._chunk_type = chunk_type
+        if self._size >= self._max_chars or self._clock() - self._window_start >= self._interval:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """发射缓冲区中的全部文本（合并为一个事件）"""
+        async with self._lock:
+            if not self._parts:
+                return
+            text = "".join(self._parts)
+            chunk_type = self._chunk_type or "content"
+            self._parts = []
+            self._size = 0
+            self._disarm_timer()
+            self.emitted_count += 1
+            await self._emit(chunk_type, text)
+
+    async def aclose(self) -> None:
+        """流结束：发射剩余文本"""
+        self._disarm_timer()
+        await self.flush()
+
+    def cancel(self) -> None:
+        """流被取消：丢弃定时器与尚未执行的定时 flush"""
+        self._disarm_timer()
+        if self._timer_flush is not None and not self._timer_flush.done():
+            self._timer_flush.cancel()
+        self._timer_flush = None
+
+    # --------------------------------------------------------
+    # 定时器
+    # --------------------------------------------------------
+
+    def _arm_timer(self) -> None:
+        if self._timer is not None or self._interval <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(self._interval, self._on_timer)
+
+    def _disarm_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        if self._parts:
+            self._timer_flush = asyncio.ensure_future(self.flush())
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "DEFAULT_FLUSH_INTERVAL_SECONDS",
+    "DEFAULT_FLUSH_MAX_CHARS",
+    "StreamChunkCoalescer",
+]
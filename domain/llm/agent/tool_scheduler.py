@@ -0,0 +1,309 @@
+# Tool Scheduler - Agent 工具调用调度器
+"""
+Agent 工具调用调度器
+
+职责：
+- 把同一轮 LLM 响应中的多个工具调用按依赖关系并发执行，
+  返回结果与调用顺序一一对应
+- 声明 ``runs_blocking_io`` 的工具放到工作线程池执行，不占用
+  qasync 所在的 Qt UI 线程
+- 变更类工具之间按调用顺序串行（``get_resource_key`` 只用于 tracing）
+- 每个工具调用记录一个 tracing span（耗时、执行位置、是否出错）
+
+调度规则：调用 i 等待更早的调用 j 完成，当且仅当 i 与 j 至少有一个
+是变更调用；即只有只读调用之间可以并发。
+
+变更调用不按资源分组并发：先修改网表再仿真同一电路时，两个工具
+操作的“资源”无法用同一个 key 表达，而仿真会读取刚被修改的网表及其
+.include 文件。``resource_key`` 因此只是 tracing span 上的标签，默认为
+``tool:<工具名>``。
+
+线程池说明：
+- 工作线程里用独立事件循环运行 ``tool.execute()``，因此阻塞型
+  工具不得 await 绑定在主事件循环上的对象
+- 上层取消（``asyncio.Task.cancel()``）只会取消等待，已经在
+  工作线程中运行的只读工具会自然跑完，其结果被丢弃
+
+架构位置：
+- 被 AgentLoop._execute_tool_calls 调用
+- 依赖 ToolRegistry 查找工具，依赖 BaseTool 的调度声明
+- 不感知 UI 事件语义，只在调用开始 / 结束时回调 AgentLoop 传入的钩子
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+from domain.llm.agent.tool_registry import ToolRegistry
+from domain.llm.agent.types import (
+    BaseTool,
+    ToolCallInfo,
+    ToolContext,
+    ToolResult,
+    create_error_result,
+)
+from shared.tracing import SpanType, TraceStatus, TracingContext
+
+
+# ============================================================
+# 常量与类型
+# ============================================================
+
+# 阻塞型工具的工作线程数
+DEFAULT_TOOL_WORKERS = 4
+
+# 调用开始 / 结束钩子
+ToolStartHook = Callable[[ToolCallInfo], Coroutine[Any, Any, None]]
+ToolEndHook = Callable[[ToolCallInfo, ToolResult], Coroutine[Any, Any, None]]
+
+_logger = logging.getLogger(__name__)
+
+_worker_pool: Optional[ThreadPoolExecutor] = None
+_worker_pool_lock = threading.Lock()
+
+
+def _get_worker_pool() -> ThreadPoolExecutor:
+    """惰性创建模块级工作线程池（所有 AgentLoop 共享）"""
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = ThreadPoolExecutor(
+                max_workers=DEFAULT_TOOL_WORKERS,
+                thread_name_prefix="agent-tool",
+            )
+        return _worker_pool
+
+
+def _run_tool_in_worker(
+    tool: BaseTool,
+    tc_info: ToolCallInfo,
+    context: ToolContext,
+) -> ToolResult:
+    """在工作线程的独立事件循环中执行工具"""
+    return asyncio.run(tool.execute(tc_info.id, tc_info.arguments, context))
+
+
+# ============================================================
+# 调度计划
+# ============================================================
+
+@dataclass
+class ScheduledToolCall:
+    """
+    一次工具调用的调度条目
+
+    Attributes:
+        index: 在本轮 tool_calls 中的位置
+        info: 解析后的调用信息；格式非法时为 None
+        tool: 注册表中的工具；未找到时为 None
+        resource_key: 变更调用的资源标签（仅用于 tracing）；只读调用为 None
+        prepared_error: prepare 阶段就确定的错误结果（格式非法、
+            工具不存在、参数校验失败），不会进入 execute
+        depends_on: 需要先完成的更早调用的 index
+    """
+    index: int
+    info: Optional[ToolCallInfo]
+    tool: Optional[BaseTool] = None
+    resource_key: Optional[str] = None
+    prepared_error: Optional[ToolResult] = None
+    depends_on: List[int] = field(default_factory=list)
+
+    @property
+    def is_read_only(self) -> bool:
+        # prepare 失败的调用不会执行任何动作，按只读处理
+        return self.tool is None or self.prepared_error is not None or self.tool.is_read_only
+
+
+# ============================================================
+# ToolScheduler
+# ============================================================
+
+class ToolScheduler:
+    """
+    单轮工具调用调度器
+
+    对照 pi-mono agent-loop.ts 第 336-580 行的 prepare → execute →
+    finalize 三阶段；prepare 在编排前同步完成，execute 按依赖并发。
+    """
+
+    def __init__(self, registry: ToolRegistry, context: ToolContext):
+        self._registry = registry
+        self._context = context
+
+    # --------------------------------------------------------
+    # prepare：解析 + 查找 + 校验 + 依赖编排
+    # --------------------------------------------------------
+
+    def plan(self, tool_calls: List[Dict[str, Any]]) -> List[ScheduledToolCall]:
+        """把原始 tool_calls 解析成带依赖关系的调度条目"""
+        planned: List[ScheduledToolCall] = []
+        for index, tc_raw in enumerate(tool_calls):
+            entry = self._prepare(index, tc_raw)
+            for earlier in planned:
+                if self._must_wait(entry, earlier):
+                    entry.depends_on.append(earlier.index)
+            planned.append(entry)
+        return planned
+
+    def _prepare(self, index: int, tc_raw: Dict[str, Any]) -> ScheduledToolCall:
+        try:
+            tc_info = ToolCallInfo.from_api_format(tc_raw)
+        except ValueError as e:
+            _logger.error(f"Invalid tool call format: {e}")
+            return ScheduledToolCall(index=index, info=None, prepared_error=create_error_result(str(e)))
+
+        tool = self._registry.get(tc_info.name)
+        if not tool:
+            _logger.warning(f"Tool not found: {tc_info.name}")
+            return ScheduledToolCall(
+                index=index,
+                info=tc_info,
+                prepared_error=create_error_result(
+                    f"Tool '{tc_info.name}' not found. "
+                    f"Available tools: {', '.join(self._registry.get_names())}"
+                ),
+            )
+
+        validation_error = tool.validate_params(tc_info.arguments)
+        if validation_error:
+            _logger.warning(
+                f"Tool '{tc_info.name}' param validation failed: {validation_error}"
+            )
+            return ScheduledToolCall(
+                index=index,
+                info=tc_info,
+                tool=tool,
+                prepared_error=create_error_result(validation_error),
+            )
+
+        resource_key = None
+        if not tool.is_read_only:
+            try:
+                resource_key = tool.get_resource_key(tc_info.arguments, self._context)
+            except Exception as e:
+                _logger.warning(f"Tool '{tc_info.name}' resource key failed: {e}")
+            if not resource_key:
+                resource_key = f"tool:{tool.name}"
+        return ScheduledToolCall(index=index, info=tc_info, tool=tool, resource_key=resource_key)
+
+    @staticmethod
+    def _must_wait(entry: ScheduledToolCall, earlier: ScheduledToolCall) -> bool:
+        if entry.prepared_error is not None or earlier.prepared_error is not None:
+            return False
+        return not (entry.is_read_only and earlier.is_read_only)
+
+    # --------------------------------------------------------
+    # execute：按依赖并发执行
+    # --------------------------------------------------------
+
+    async def run(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        on_start: ToolStartHook,
+        on_end: ToolEndHook,
+    ) -> List[ToolResult]:
+        """
+        执行一轮工具调用
+
+        Args:
+            tool_calls: LLM 返回的工具调用列表
+            on_start: 调用真正开始执行前的钩子
+            on_end: 调用完成后的钩子
+
+        Returns:
+            ToolResult 列表，与 tool_calls 一一对应
+        """
+        planned = self.plan(tool_calls)
+        tasks: List["asyncio.Task[ToolResult]"] = []
+
+        async def run_entry(entry: ScheduledToolCall) -> ToolResult:
+            if entry.depends_on:
+                # 依赖调用的异常已在其内部包装为 ToolResult，这里只等完成
+                await asyncio.wait([tasks[i] for i in entry.depends_on])
+            if entry.info is None:
+                return entry.prepared_error
+            await on_start(entry.info)
+            result = await self._execute_entry(entry)
+            await on_end(entry.info, result)
+            return result
+
+        try:
+            for entry in planned:
+                tasks.append(asyncio.ensure_future(run_entry(entry)))
+            return list(await asyncio.gather(*tasks))
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _execute_entry(self, entry: ScheduledToolCall) -> ToolResult:
+        if entry.prepared_error is not None:
+            return entry.prepared_error
+
+        tool = entry.tool
+        tc_info = entry.info
+        in_worker = tool.runs_blocking_io
+        started = time.perf_counter()
+
+        async with TracingContext.span(
+            SpanType.AGENTIC_TOOL,
+            "agent_loop",
+            inputs={"tool_call_id": tc_info.id, "arguments": tc_info.arguments},
+            metadata={
+                "tool_name": tc_info.name,
+                "read_only": tool.is_read_only,
+                "execution": "worker" if in_worker else "event_loop",
+                "resource_key": entry.resource_key,
+            },
+        ) as span:
+            try:
+                if in_worker:
+                    loop = asyncio.get_running_loop()
+                    result = await loop.run_in_executor(
+                        _get_worker_pool(),
+                        contextvars.copy_context().run,
+                        _run_tool_in_worker,
+                        tool,
+                        tc_info,
+                        self._context,
+                    )
+                else:
+                    result = await tool.execute(tc_info.id, tc_info.arguments, self._context)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _logger.error(f"Tool '{tc_info.name}' execution error: {e}")
+                result = create_error_result(f"Tool execution error: {e}")
+
+            latency_ms = (time.perf_counter() - started) * 1000
+            span.set_output({
+                "is_error": result.is_error,
+                "content_len": len(result.content),
+                "latency_ms": round(latency_ms, 3),
+            })
+            if result.is_error:
+                span.finish(TraceStatus.ERROR, error_message=result.content[:200])
+
+        _logger.info(
+            f"Tool '{tc_info.name}' executed: "
+            f"is_error={result.is_error}, "
+            f"content_len={len(result.content)}, "
+            f"latency_ms={latency_ms:.1f}"
+        )
+        return result
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "DEFAULT_TOOL_WORKERS",
+    "ScheduledToolCall",
+    "ToolScheduler",
+]
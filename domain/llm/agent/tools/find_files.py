@@ -113,6 +113,14 @@ class FindFilesTool(BaseTool):
             "Use the path parameter to narrow the search to a specific subdirectory.",
         ]
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
+    @property
+    def runs_blocking_io(self) -> bool:
+        return True
+
     async def execute(
         self,
         tool_call_id: str,
@@ -145,6 +145,14 @@ class GrepSearchTool(BaseTool):
             "Use context_lines=2 to see surrounding lines for better understanding.",
         ]
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
+    @property
+    def runs_blocking_io(self) -> bool:
+        return True
+
     async def execute(
         self,
         tool_call_id: str,
@@ -97,6 +97,14 @@ class ListDirectoryTool(BaseTool):
             "Directories are marked with a trailing '/'; the listing is sorted alphabetically.",
         ]
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
+    @property
+    def runs_blocking_io(self) -> bool:
+        return True
+
     async def execute(
         self,
         tool_call_id: str,
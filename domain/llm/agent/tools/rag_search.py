@@ -8,7 +8,7 @@ Agent RAG 检索工具
 
 架构位置：
 - 被 ToolRegistry 注册
-- 依赖 RAGManager（向量相似度检索）
+- 依赖 RAGManager（BM25 + 向量混合检索）
 - RAGManager 由调用方通过 ToolContext.rag_query_service 注入，
   tool 不从全局服务定位器自取
 """
@@ -37,7 +37,9 @@ class RAGSearchTool(BaseTool):
     def description(self) -> str:
         return (
             "Search the project index library for document chunks related to a query. "
-            "Uses local embedding-based vector retrieval (ChromaDB + sentence-transformers). "
+            "Combines a local BM25 keyword index with embedding-based vector retrieval, "
+            "so exact part numbers, SPICE directives and node names (e.g. LT1001, .model 2N3904) "
+            "match directly. "
             "Returns relevant text from indexed project files including circuit files, "
             "code, documentation, and PDFs."
         )
@@ -60,7 +62,7 @@ class RAGSearchTool(BaseTool):
 
     @property
     def prompt_snippet(self) -> Optional[str]:
-        return "Search the project index library for document chunks using vector similarity"
+        return "Search the project index library for document chunks using keyword and vector retrieval"
 
     @property
     def prompt_guidelines(self) -> Optional[List[str]]:
@@ -71,6 +73,10 @@ class RAGSearchTool(BaseTool):
             "the project's indexed circuit designs and documentation.",
         ]
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
     async def execute(
         self,
         tool_call_id: str,
@@ -101,6 +101,14 @@ class ReadFileTool(BaseTool):
             "For large files, use offset and limit to read specific sections.",
         ]
     
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
+    @property
+    def runs_blocking_io(self) -> bool:
+        return True
+
     async def execute(
         self,
         tool_call_id: str,
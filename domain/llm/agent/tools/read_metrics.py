@@ -18,6 +18,9 @@
 - 输出严格不带 ``raw_value`` 浮点原值给 LLM：``value`` 字段本来就是
   经过 ``DisplayMetricBuilder._format_with_unit`` 格式化好的字符串，
   LLM 视角这已是人类可读形态，再带原值只是 token 膨胀。
+- ``data.cross_checks``（exporter 用波形数据复算 .MEASURE 的结果）只
+  呈现 mismatch 条目：列出 ngspice 值与复算值，提示 LLM 这条指标和
+  导出波形对不上；一致或无法复算的条目不占篇幅。
 - 500 行 markdown 上限：触达就尾部截断，content 末尾明确附
   ``metrics.csv`` 的**绝对路径**，方便 LLM 追加 ``read_file`` 跟进。
 """
@@ -37,8 +40,10 @@ from domain.llm.agent.tools.simulation_artifact_reader_base import (
 )
 from domain.llm.agent.types import BaseTool, ToolContext, ToolResult
 from domain.simulation.data.simulation_artifact_exporter import (
+    CATEGORY_METRICS,
     simulation_artifact_exporter,
 )
+from domain.simulation.measure.measure_cross_check import CROSS_CHECK_MISMATCH
 
 
 # Content 行数上限；触达即尾部截断 + 追加 metrics.csv 绝对路径指引。
@@ -112,6 +117,14 @@ class ReadMetricsTool(BaseTool):
     # Execute —— 解析 → 读 metrics.json → 格式化
     # ------------------------------------------------------------------
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
+    @property
+    def runs_blocking_io(self) -> bool:
+        return True
+
     async def execute(
         self,
         tool_call_id: str,
@@ -133,6 +146,7 @@ class ReadMetricsTool(BaseTool):
         bundle: ResolvedSimulationBundle,
         params: Dict[str, Any],
     ) -> ToolResult:
+        bundle.ensure_artifacts(CATEGORY_METRICS)
         paths = simulation_artifact_exporter.metrics_paths(bundle.bundle_dir)
         json_path = paths.json_path
 
@@ -193,9 +207,13 @@ class ReadMetricsTool(BaseTool):
         # 未达标置顶 → 已达标 / 无目标 / 无法解析按 display_name 稳定排序
         annotated.sort(key=self._row_sort_key)
 
+        cross_checks = data.get("cross_checks") if isinstance(data, dict) else None
+        mismatches = self._select_mismatches(cross_checks, rows)
+
         lines = self._build_markdown(
             bundle=bundle,
             annotated=annotated,
+            mismatches=mismatches,
             metrics_csv_path=paths.csv_path,
             filter_text=filter_text,
         )
@@ -229,6 +247,24 @@ class ReadMetricsTool(BaseTool):
                 selected.append(row)
         return selected
 
+    @staticmethod
+    def _select_mismatches(
+        cross_checks: Any,
+        rows: List[Any],
+    ) -> List[Dict[str, Any]]:
+        # 只呈现与波形复算不一致的测量；match / unsupported 不占篇幅。
+        if not isinstance(cross_checks, list):
+            return []
+        names = {
+            str(row.get("name") or "") for row in rows if isinstance(row, dict)
+        }
+        return [
+            check for check in cross_checks
+            if isinstance(check, dict)
+            and check.get("status") == CROSS_CHECK_MISMATCH
+            and str(check.get("name") or "") in names
+        ]
+
     @staticmethod
     def _annotate_row(row: Any) -> Dict[str, Any]:
         if not isinstance(row, dict):
@@ -262,6 +298,7 @@ class ReadMetricsTool(BaseTool):
         *,
         bundle: ResolvedSimulationBundle,
         annotated: List[Dict[str, Any]],
+        mismatches: List[Dict[str, Any]],
         metrics_csv_path: Path,
         filter_text: str,
     ) -> List[str]:
@@ -342,6 +379,22 @@ class ReadMetricsTool(BaseTool):
                     f"| {row['display_name']} | {row['value']} | {row['unit']} |"
                 )
 
+        if mismatches:
+            body.extend(
+                [
+                    "",
+                    "## Waveform Cross-check Mismatches",
+                    "",
+                    "| name | reported | recomputed |",
+                    "| --- | --- | --- |",
+                ]
+            )
+            for check in mismatches:
+                body.append(
+                    f"| {check.get('name')} | {_format_check_value(check.get('reported'))} "
+                    f"| {_format_check_value(check.get('recomputed'))} |"
+                )
+
         if not annotated:
             body.extend(
                 [
@@ -384,4 +437,10 @@ class ReadMetricsTool(BaseTool):
         return kept
 
 
+def _format_check_value(value: Any) -> str:
+    if isinstance(value, (int, float)):
+        return f"{value:.6g}"
+    return "—"
+
+
 __all__ = ["ReadMetricsTool"]
@@ -68,6 +68,14 @@ class ReadOpResultTool(BaseTool):
             ),
         ]
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
+    @property
+    def runs_blocking_io(self) -> bool:
+        return True
+
     async def execute(
         self,
         tool_call_id: str,
@@ -95,6 +103,7 @@ class ReadOpResultTool(BaseTool):
                 },
             )
 
+        resolved.ensure_artifacts(CATEGORY_OP_RESULT)
         paths = simulation_artifact_exporter.op_result_paths(resolved.bundle_dir)
         text_content = self._try_read_text(paths.text_path)
         if text_content is not None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -16,7 +16,9 @@ from domain.llm.agent.utils.truncate import (
     DEFAULT_MAX_LINES,
     truncate_head,
 )
+from domain.simulation.data.output_log_index import OutputLogIndex, open_output_log_index
 from domain.simulation.data.simulation_artifact_exporter import (
+    CATEGORY_OUTPUT_LOG,
     simulation_artifact_exporter,
 )
 from domain.simulation.data.simulation_output_reader import (
@@ -35,12 +37,32 @@ class _LoadedOutputLog:
     summary: SimulationSummary
     lines: List[LogLine]
     raw_output: str
-    full_text_for_all: str
+    full_text_for_all: Optional[str]
     structured_source: str
     structured_source_path: Path
     full_text_source_path: Path
     text_path: Path
     json_path: Path
+    # output_log.txt 的行索引；存在时 lines / raw_output / full_text_for_all
+    # 为空，各分区按需从索引读取
+    index: Optional[OutputLogIndex] = None
+
+    def error_lines(self) -> List[LogLine]:
+        if self.index is not None:
+            return self.index.read_level("error")
+        return [line for line in self.lines if line.is_error()]
+
+    def warning_lines(self, limit: Optional[int] = None) -> tuple[List[LogLine], int]:
+        """返回 (前 limit 条警告, 警告总数)"""
+        if self.index is not None:
+            return self.index.read_level("warning", limit=limit), self.index.warning_count
+        warnings = [line for line in self.lines if line.is_warning()]
+        return (warnings if limit is None else warnings[:limit]), len(warnings)
+
+    def tail_lines(self, count: int) -> List[LogLine]:
+        if self.index is not None:
+            return self.index.tail(count)
+        return self.lines[-count:]
 
 
 class ReadOutputLogTool(BaseTool):
@@ -113,6 +135,14 @@ class ReadOutputLogTool(BaseTool):
             ),
         ]
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
+    @property
+    def runs_blocking_io(self) -> bool:
+        return True
+
     async def execute(
         self,
         tool_call_id: str,
@@ -145,14 +175,14 @@ class ReadOutputLogTool(BaseTool):
             content = self._join_sections(
                 self._build_header(resolved, loaded),
                 self._build_summary_section(loaded.summary),
-                self._build_errors_section(loaded.lines),
+                self._build_errors_section(loaded.error_lines()),
             )
         elif section == "warnings":
             content = self._join_sections(
                 self._build_header(resolved, loaded),
                 self._build_summary_section(loaded.summary),
                 self._build_warnings_section(
-                    loaded.lines,
+                    *loaded.warning_lines(),
                     limit=None,
                     text_path=loaded.text_path,
                 ),
@@ -161,19 +191,19 @@ class ReadOutputLogTool(BaseTool):
             content = self._join_sections(
                 self._build_header(resolved, loaded),
                 self._build_summary_section(loaded.summary),
-                self._build_tail_section(loaded.lines),
+                self._build_tail_section(loaded.tail_lines(_TAIL_LINE_COUNT)),
             )
         else:
             content = self._join_sections(
                 self._build_header(resolved, loaded),
                 self._build_summary_section(loaded.summary),
-                self._build_errors_section(loaded.lines),
+                self._build_errors_section(loaded.error_lines()),
                 self._build_warnings_section(
-                    loaded.lines,
+                    *loaded.warning_lines(_WARNING_PREVIEW_LIMIT),
                     limit=_WARNING_PREVIEW_LIMIT,
                     text_path=loaded.text_path,
                 ),
-                self._build_tail_section(loaded.lines),
+                self._build_tail_section(loaded.tail_lines(_TAIL_LINE_COUNT)),
             )
 
         return ToolResult(
@@ -197,7 +227,16 @@ class ReadOutputLogTool(BaseTool):
         self,
         bundle: ResolvedSimulationBundle,
     ) -> _LoadedOutputLog | ToolResult:
+        bundle.ensure_artifacts(CATEGORY_OUTPUT_LOG)
         paths = simulation_artifact_exporter.output_log_paths(bundle.bundle_dir)
+        if paths.text_path.is_file():
+            index = open_output_log_index(paths.text_path, paths.index_path)
+            if index is not None:
+                return self._load_from_index(
+                    index=index,
+                    text_path=paths.text_path,
+                    json_path=paths.json_path,
+                )
         text_content, text_error = self._try_read_text(paths.text_path)
 
         if paths.json_path.is_file():
@@ -306,6 +345,26 @@ class ReadOutputLogTool(BaseTool):
             json_path=json_path,
         )
 
+    @staticmethod
+    def _load_from_index(
+        *,
+        index: OutputLogIndex,
+        text_path: Path,
+        json_path: Path,
+    ) -> _LoadedOutputLog:
+        return _LoadedOutputLog(
+            summary=index.summary(),
+            lines=[],
+            raw_output="",
+            full_text_for_all=None,
+            structured_source="index",
+            structured_source_path=text_path,
+            full_text_source_path=text_path,
+            text_path=text_path,
+            json_path=json_path,
+            index=index,
+        )
+
     def _load_from_text(
         self,
         *,
@@ -415,8 +474,7 @@ class ReadOutputLogTool(BaseTool):
         ]
 
     @staticmethod
-    def _build_errors_section(lines: List[LogLine]) -> List[str]:
-        error_lines = [line for line in lines if line.is_error()]
+    def _build_errors_section(error_lines: List[LogLine]) -> List[str]:
         section = ["## errors"]
         if not error_lines:
             section.append("- <none>")
@@ -426,21 +484,20 @@ class ReadOutputLogTool(BaseTool):
 
     @staticmethod
     def _build_warnings_section(
-        lines: List[LogLine],
+        visible: List[LogLine],
+        total: int,
         *,
         limit: Optional[int],
         text_path: Path,
     ) -> List[str]:
-        warning_lines = [line for line in lines if line.is_warning()]
         section = ["## warnings"]
-        if not warning_lines:
+        if not visible:
             section.append("- <none>")
             return section
 
-        visible = warning_lines if limit is None else warning_lines[:limit]
         section.extend(ReadOutputLogTool._format_log_line(line) for line in visible)
-        if limit is not None and len(warning_lines) > limit:
-            omitted = len(warning_lines) - limit
+        if limit is not None and total > limit:
+            omitted = total - limit
             section.append(
                 (
                     f"- {omitted} warning(s) omitted; for the complete list, "
@@ -450,12 +507,11 @@ class ReadOutputLogTool(BaseTool):
         return section
 
     @staticmethod
-    def _build_tail_section(lines: List[LogLine]) -> List[str]:
+    def _build_tail_section(tail: List[LogLine]) -> List[str]:
         section = ["## tail"]
-        if not lines:
+        if not tail:
             section.append("- <none>")
             return section
-        tail = lines[-_TAIL_LINE_COUNT:]
         section.extend(ReadOutputLogTool._format_log_line(line) for line in tail)
         return section
 
@@ -464,11 +520,14 @@ class ReadOutputLogTool(BaseTool):
         bundle: ResolvedSimulationBundle,
         loaded: _LoadedOutputLog,
     ) -> ToolResult:
-        truncation = truncate_head(
-            loaded.full_text_for_all,
-            max_lines=DEFAULT_MAX_LINES,
-            max_bytes=DEFAULT_MAX_BYTES,
-        )
+        if loaded.index is not None:
+            truncation = self._truncate_indexed_log(loaded.index)
+        else:
+            truncation = truncate_head(
+                loaded.full_text_for_all,
+                max_lines=DEFAULT_MAX_LINES,
+                max_bytes=DEFAULT_MAX_BYTES,
+            )
         content = truncation.content
         if truncation.truncated:
             content += (
@@ -502,6 +561,26 @@ class ReadOutputLogTool(BaseTool):
             },
         )
 
+    @staticmethod
+    def _truncate_indexed_log(index: OutputLogIndex):
+        """
+        只读取文件开头足以判定截断位置的部分；总行数 / 总字节数取自
+        索引，与对全文调用 truncate_head 的结果一致
+        """
+        head = index.read_text_head(DEFAULT_MAX_BYTES)
+        truncation = truncate_head(
+            head,
+            max_lines=DEFAULT_MAX_LINES,
+            max_bytes=DEFAULT_MAX_BYTES,
+        )
+        if len(head.encode("utf-8")) == index.text_size:
+            return truncation
+        return replace(
+            truncation,
+            total_lines=index.text_newline_count + 1,
+            total_bytes=index.text_size,
+        )
+
     @staticmethod
     def _build_full_text_fallback(
         *,
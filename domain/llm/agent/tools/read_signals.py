@@ -92,6 +92,8 @@ from domain.llm.agent.tools.simulation_series_stats import (
 )
 from domain.llm.agent.types import BaseTool, ToolContext, ToolResult
 from domain.simulation.data.simulation_artifact_exporter import (
+    CATEGORY_METRICS,
+    CATEGORY_RAW_DATA,
     simulation_artifact_exporter,
 )
 from domain.simulation.data.waveform_data_service import waveform_data_service
@@ -330,6 +332,14 @@ class ReadSignalsTool(BaseTool):
     # Execute
     # ------------------------------------------------------------------
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
+    @property
+    def runs_blocking_io(self) -> bool:
+        return True
+
     async def execute(
         self,
         tool_call_id: str,
@@ -374,6 +384,7 @@ class ReadSignalsTool(BaseTool):
         # AC FOM 引用：两种条件成立才触发，任意源都不重算。
         ac_rows: List[Dict[str, Any]] = []
         if self._should_link_ac_fom(target, bundle):
+            bundle.ensure_artifacts(CATEGORY_METRICS)
             ac_rows = self._load_ac_fom_rows(bundle.bundle_dir)
 
         lines = self._build_markdown(
@@ -434,6 +445,7 @@ class ReadSignalsTool(BaseTool):
         bundle_dir = bundle.bundle_dir
         raw_paths = simulation_artifact_exporter.raw_data_paths(bundle_dir)
         if bundle.result.data is not None:
+            bundle.ensure_artifacts(CATEGORY_RAW_DATA)
             out.append(
                 _SourceDescriptor(
                     kind=SourceKind.RAW,
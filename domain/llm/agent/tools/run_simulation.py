@@ -19,6 +19,9 @@
   ``await`` 点抛出，沿栈抵达本 tool 的 ``except`` 分支；此时 tool 登记
   cancel 意图给 manager 再 ``raise``，让上层 ``AgentLoop`` / ``LLMExecutor``
   按既有 ``OUTCOME_STOPPED`` 路径处理。tool 自己**不**吞 ``CancelledError``。
+- 排队期间 job 被同一电路的新提交取代（``superseded_by``）时不算取消：
+  tool 改为等待取代者并回报它的结果，``content`` / ``details`` 点名
+  被取代的 job
 
 与其它 tool 的解耦姿态（Step 17 补强）：
 - 本 tool **只**负责"发起一次仿真并回报结果状态"。它既不内嵌
@@ -42,6 +45,7 @@ from typing import Any, Dict, List, Optional
 
 from domain.llm.agent.types import BaseTool, ToolContext, ToolResult
 from domain.llm.agent.utils.path_utils import validate_file_path
+from domain.services.simulation_job_queue import SimulationQueueFullError
 from domain.simulation.models.simulation_job import JobOrigin, JobStatus
 from shared.workspace_file_types import (
     SIMULATABLE_CIRCUIT_EXTENSIONS,
@@ -235,11 +239,24 @@ class RunSimulationTool(BaseTool):
                 )
 
         # ---- 阶段 4: 提交 + 等待 + 取消协议对齐 ----
-        job = manager.submit(
-            circuit_file=abs_path,
-            origin=JobOrigin.AGENT_TOOL,
-            project_root=project_root,
-        )
+        # manager 对 AGENT_TOOL 排队深度设了上限：超限时 submit 直接抛出
+        # 且不登记 job，这里把背压原样告诉 LLM，由它决定稍后重试还是换任务。
+        try:
+            job = manager.submit(
+                circuit_file=abs_path,
+                origin=JobOrigin.AGENT_TOOL,
+                project_root=project_root,
+            )
+        except SimulationQueueFullError as exc:
+            return ToolResult(
+                content=(
+                    f"Error: the simulation queue is full ({exc.depth} agent "
+                    f"simulations already waiting, limit {exc.limit}). Wait "
+                    "for queued runs to finish before submitting more."
+                ),
+                is_error=True,
+                details={"queue_depth": exc.depth, "queue_limit": exc.limit},
+            )
 
         try:
             final_job = await manager.await_completion_async(job.job_id)
@@ -252,8 +269,31 @@ class RunSimulationTool(BaseTool):
             manager.request_cancel(job.job_id)
             raise
 
+        # 排队期间被同一电路的新提交取代：取代者会跑同一份电路，改为
+        # 等它的结果。取代者不属于本次调用，被取消时不向它转发取消。
+        superseded_ids: List[str] = []
+        while (
+            final_job.status is JobStatus.CANCELLED
+            and final_job.superseded_by
+            and final_job.superseded_by not in superseded_ids
+        ):
+            superseded_ids.append(final_job.job_id)
+            try:
+                final_job = await manager.await_completion_async(final_job.superseded_by)
+            except ValueError:
+                # 取代者已被 manager 清出索引，按取消分派并点名取代者
+                break
+
         # ---- 阶段 5: 结果分派 ----
-        return self._format_result(final_job, project_root, repository)
+        result = self._format_result(final_job, project_root, repository)
+        if superseded_ids and final_job.job_id not in superseded_ids:
+            result.details = {**(result.details or {}), "superseded_job_ids": superseded_ids}
+            result.content = (
+                f"Note: job {superseded_ids[0]} was superseded by newer "
+                f"submission {final_job.job_id} for the same circuit; "
+                "reporting that run.\n" + result.content
+            )
+        return result
 
     # ------------------------------------------------------------------
     # 结果分派
@@ -277,6 +317,18 @@ class RunSimulationTool(BaseTool):
             # 里只覆盖"其它来源把 job 标成 CANCELLED"的边角——比如
             # 另一个 UI 发来的 request_cancel。仍然按 is_error 处理，
             # content 明确区分"取消"而不是"失败"。
+            if job.superseded_by:
+                details["superseded_by"] = job.superseded_by
+                return ToolResult(
+                    content=(
+                        f"Simulation job {job.job_id} was superseded by newer "
+                        f"submission {job.superseded_by} for the same circuit "
+                        "before it started; that job's result is no longer "
+                        "tracked."
+                    ),
+                    is_error=True,
+                    details=details,
+                )
             return ToolResult(
                 content=(
                     f"Simulation was cancelled before completion "
@@ -79,6 +79,7 @@ from domain.simulation.data.op_result_payload import (
     sort_op_result_device_rows,
     sort_op_result_node_rows,
 )
+from domain.simulation.data.simulation_artifact_persistence import ensure_bundle_categories
 from domain.simulation.models.simulation_result import SimulationResult
 
 
@@ -118,6 +119,15 @@ class ResolvedSimulationBundle:
     circuit_file: str
     used_fallback: bool
 
+    def ensure_artifacts(self, *categories: str) -> Dict[str, str]:
+        """读取工件子文件前确保对应类别已落盘。
+
+        仿真完成时只同步写入 ``result.json`` 与 manifest，其余类别由
+        后台 I/O 队列导出；这里对仍在写的类别等待，对尚未开始的类别
+        直接在当前线程导出，不会排在无关类别之后。
+        """
+        return ensure_bundle_categories(self.bundle_dir, categories, result=self.result)
+
 
 # ============================================================
 # 共享 prompt 片段
@@ -16,9 +16,11 @@ peak_to_peak``，再加一张等距锚点小表 ``(x, y1, y2, ...)``。把这套
         anchor_scale=AnchorScale.LINEAR,
     )
 
-- 对 CSV 做**两遍扫描**，每次只在内存里持有 O(S) 的信号级标量累加器
-  + O(K) 的锚点缓冲（S=信号数、K=锚点数）；绝不把完整 CSV 一次性
-  读入——测 10 万+ 采样点也不会爆。
+- 对 CSV 做**两遍扫描**，按固定行数分块解析，每次只在内存里持有
+  一块 O(B×S) 的数值矩阵 + O(S) 的信号级统计 + O(K) 的锚点缓冲
+  （B=块行数、S=信号数、K=锚点数）；绝不把完整 CSV 一次性读入——
+  测 10 万+ 采样点也不会爆。统计由共享的波形测量内核
+  （``waveform_measurements.summarize_series``）按块计算再合并。
 - 文件顶部的"自证 header"（``# artifact_type: ...`` 等 6 行 + 一行
   空行）被解析成 ``(key, value)`` 列表透传回来，调用方需要的话可以
   在自己的 markdown 里原样 echo 出来。
@@ -50,10 +52,16 @@ from __future__ import annotations
 
 import csv
 import enum
+import itertools
 import math
-from dataclasses import dataclass, field
+import warnings
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+from typing import Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.simulation.data.waveform_measurements import SeriesSummary, summarize_series
 
 
 # ============================================================
@@ -177,7 +185,7 @@ def read_series_csv(
     """
     anchor_count = max(4, min(32, int(anchor_count)))
 
-    # -------- 第一遍：解析 header、列名、累加统计 --------
+    # -------- 第一遍：解析 header、列名、分块累加统计 --------
     pass1 = _scan_pass1(csv_path)
 
     if pass1.total_rows == 0:
@@ -187,22 +195,14 @@ def read_series_csv(
             signal_column_names=pass1.signal_column_names,
             total_rows=0,
             x_range=(float("nan"), float("nan")),
-            stats=tuple(
-                _stats_from_aggregator(agg) for agg in pass1.aggregators
-            ),
+            stats=_stats_from_summary(pass1.signal_column_names, pass1.summary),
             anchors=(),
             anchor_scale_requested=anchor_scale,
             anchor_scale_effective=anchor_scale,
         )
 
     # -------- 选锚点索引 / 目标 x --------
-    effective_scale = anchor_scale
-    if anchor_scale == AnchorScale.LOG:
-        if not (pass1.x_min > 0 and math.isfinite(pass1.x_min)
-                and math.isfinite(pass1.x_max) and pass1.x_max > pass1.x_min):
-            # 数据里有 <=0 或 x 轴退化 —— 对数采样不可行，退到线性。
-            effective_scale = AnchorScale.LINEAR
-
+    effective_scale = _effective_anchor_scale(anchor_scale, pass1.x_min, pass1.x_max)
     if effective_scale == AnchorScale.LINEAR:
         target_indices = _linear_anchor_indices(pass1.total_rows, anchor_count)
         target_xs: Optional[List[float]] = None
@@ -226,9 +226,7 @@ def read_series_csv(
         signal_column_names=pass1.signal_column_names,
         total_rows=pass1.total_rows,
         x_range=(pass1.x_min, pass1.x_max),
-        stats=tuple(
-            _stats_from_aggregator(agg) for agg in pass1.aggregators
-        ),
+        stats=_stats_from_summary(pass1.signal_column_names, pass1.summary),
         anchors=anchors,
         anchor_scale_requested=anchor_scale,
         anchor_scale_effective=effective_scale,
@@ -250,30 +248,26 @@ def read_series_table(
     This is the source-authoritative path used when the caller already owns
     structured signal data (for example ``SimulationResult.data`` routed
     through ``WaveformDataService`` or an exported chart JSON sidecar).
-    The statistical semantics intentionally match :func:`read_series_csv`.
+    The statistical semantics intentionally match :func:`read_series_csv`;
+    columns are converted to float arrays once and summarized by the shared
+    waveform measurement kernels.
     """
     anchor_count = max(4, min(32, int(anchor_count)))
     signal_names = tuple(str(name) for name in signal_column_names)
-    aggregators = tuple(_SignalAggregator(name=name) for name in signal_names)
     header_tuple = tuple((str(key), str(value)) for key, value in header_entries)
 
-    x_min = float("inf")
-    x_max = float("-inf")
-    valid_rows: List[Tuple[int, float]] = []
-
-    for row_index, raw_x in enumerate(x_values):
-        x_value = _try_parse_scalar(raw_x)
-        if x_value is None:
+    x_all = _column_to_array(x_values)
+    valid_rows = np.flatnonzero(np.isfinite(x_all))
+    x = x_all[valid_rows]
+    y = np.full((len(signal_names), len(valid_rows)), np.nan)
+    for row, signal_name in enumerate(signal_names):
+        column = signal_columns.get(signal_name)
+        if column is None:
             continue
-        valid_rows.append((row_index, x_value))
-        if x_value < x_min:
-            x_min = x_value
-        if x_value > x_max:
-            x_max = x_value
-        _apply_signal_values(
-            aggregators,
-            _table_row_values(signal_names, signal_columns, row_index),
-        )
+        values = _column_to_array(column)
+        in_range = valid_rows < len(values)
+        y[row, in_range] = values[valid_rows[in_range]]
+    stats = _stats_from_summary(signal_names, summarize_series(y))
 
     total_rows = len(valid_rows)
     if total_rows == 0:
@@ -283,62 +277,24 @@ def read_series_table(
             signal_column_names=signal_names,
             total_rows=0,
             x_range=(float("nan"), float("nan")),
-            stats=tuple(_stats_from_aggregator(agg) for agg in aggregators),
+            stats=stats,
             anchors=(),
             anchor_scale_requested=anchor_scale,
             anchor_scale_effective=anchor_scale,
         )
 
-    effective_scale = anchor_scale
-    if anchor_scale == AnchorScale.LOG:
-        if not (
-            x_min > 0
-            and math.isfinite(x_min)
-            and math.isfinite(x_max)
-            and x_max > x_min
-        ):
-            effective_scale = AnchorScale.LINEAR
-
+    x_min = float(x.min())
+    x_max = float(x.max())
+    effective_scale = _effective_anchor_scale(anchor_scale, x_min, x_max)
     if effective_scale == AnchorScale.LINEAR:
-        target_positions = _linear_anchor_indices(total_rows, anchor_count)
-        anchors = tuple(
-            AnchorRow(
-                x=valid_rows[position][1],
-                values=tuple(
-                    _table_row_values(
-                        signal_names,
-                        signal_columns,
-                        valid_rows[position][0],
-                    )
-                ),
-            )
-            for position in target_positions
-        )
+        positions = _linear_anchor_indices(total_rows, anchor_count)
     else:
+        positive = np.flatnonzero(x > 0)
         target_xs = _log_anchor_targets(x_min, x_max, anchor_count)
-        best_delta: List[float] = [float("inf")] * len(target_xs)
-        picked_xs: List[Optional[AnchorRow]] = [None] * len(target_xs)
-        for row_index, x_value in valid_rows:
-            if x_value <= 0:
-                continue
-            values = tuple(_table_row_values(signal_names, signal_columns, row_index))
-            for target_index, target_x in enumerate(target_xs):
-                delta = abs(math.log10(x_value) - math.log10(target_x))
-                if delta < best_delta[target_index]:
-                    best_delta[target_index] = delta
-                    picked_xs[target_index] = AnchorRow(x=x_value, values=values)
-
-        seen_xs: set = set()
-        anchor_rows: List[AnchorRow] = []
-        for entry in picked_xs:
-            if entry is None:
-                continue
-            if entry.x in seen_xs:
-                continue
-            seen_xs.add(entry.x)
-            anchor_rows.append(entry)
-        anchor_rows.sort(key=lambda row: row.x)
-        anchors = tuple(anchor_rows)
+        positions = positive[_nearest_log_positions(x[positive], target_xs)[1]].tolist()
+    anchors = _anchor_rows(x, y, positions)
+    if effective_scale == AnchorScale.LOG:
+        anchors = _dedupe_sorted_anchors(anchors)
 
     return SeriesReadResult(
         header_entries=header_tuple,
@@ -346,7 +302,7 @@ def read_series_table(
         signal_column_names=signal_names,
         total_rows=total_rows,
         x_range=(x_min, x_max),
-        stats=tuple(_stats_from_aggregator(agg) for agg in aggregators),
+        stats=stats,
         anchors=anchors,
         anchor_scale_requested=anchor_scale,
         anchor_scale_effective=effective_scale,
@@ -354,23 +310,12 @@ def read_series_table(
 
 
 # ============================================================
-# 第一遍：header + 列名 + 累加统计
+# 第一遍：header + 列名 + 分块统计
 # ============================================================
 
 
-@dataclass
-class _SignalAggregator:
-    """流式累加器。"""
-
-    name: str
-    samples: int = 0
-    min_value: float = float("inf")
-    max_value: float = float("-inf")
-    sum_value: float = 0.0
-    initial_value: Optional[float] = None
-    final_value: Optional[float] = None
-    last_value: Optional[float] = None
-    zero_crossings: int = 0
+_CSV_CHUNK_ROWS = 8192
+"""流式扫描时每块解析的数据行数；内存占用为 O(块行数 × 列数)。"""
 
 
 @dataclass
@@ -381,7 +326,7 @@ class _Pass1Result:
     total_rows: int
     x_min: float
     x_max: float
-    aggregators: Tuple[_SignalAggregator, ...]
+    summary: SeriesSummary
 
 
 def _scan_pass1(csv_path: Path) -> _Pass1Result:
@@ -430,53 +375,27 @@ def _bootstrap_pass1(
         raise ValueError("series csv column header is empty")
     x_column = columns[0]
     signal_columns = columns[1:]
-    aggregators = tuple(
-        _SignalAggregator(name=name) for name in signal_columns
-    )
 
+    summary = summarize_series(np.empty((len(signal_columns), 0)))
     x_min = float("inf")
     x_max = float("-inf")
     total_rows = 0
 
-    reader = csv.reader(handle)
-    for row in reader:
-        if not row:
-            continue
-        # csv.reader 永远保证 row 是 List[str]；row 长度可能短于列数
-        # （exporter 的 ``writer.writerow([row.get(col, "") for col ...])``
-        # 实际上会对齐，但测试 fixture 可能手写成缺列；我们能容错）。
-        x_value = _try_parse_float(row[0] if row else "")
-        if x_value is None:
-            # x 轴解析失败的数据行丢弃；exporter 产出不会触发，但
-            # 手写 fixture 或外部 CSV 可能会遇到。不抛——仿真结果
-            # 的质量问题不应让 read 工具完全放弃整个文件。
+    for x, y in _iter_csv_chunks(handle, 1 + len(signal_columns)):
+        # x 轴解析失败的数据行已在分块时丢弃；exporter 产出不会触发，
+        # 但手写 fixture 或外部 CSV 可能会遇到。不抛——仿真结果的
+        # 质量问题不应让 read 工具完全放弃整个文件。
+        if len(x) == 0:
             continue
-        total_rows += 1
-        if x_value < x_min:
-            x_min = x_value
-        if x_value > x_max:
-            x_max = x_value
-
-        _apply_signal_values(
-            aggregators,
-            [
-                _try_parse_float(row[i + 1]) if i + 1 < len(row) else None
-                for i in range(len(aggregators))
-            ],
-        )
+        total_rows += len(x)
+        x_min = min(x_min, float(x.min()))
+        x_max = max(x_max, float(x.max()))
+        summary = summary.merge(summarize_series(y))
 
     if total_rows == 0:
         # x_min / x_max 仍是 inf/-inf——用 nan 对外呈现，让调用方
         # 清楚"有文件但没有有效数据"。
-        return _Pass1Result(
-            header_entries=tuple(header_entries),
-            x_column_name=x_column,
-            signal_column_names=tuple(signal_columns),
-            total_rows=0,
-            x_min=float("nan"),
-            x_max=float("nan"),
-            aggregators=aggregators,
-        )
+        x_min = x_max = float("nan")
 
     return _Pass1Result(
         header_entries=tuple(header_entries),
@@ -485,10 +404,49 @@ def _bootstrap_pass1(
         total_rows=total_rows,
         x_min=x_min,
         x_max=x_max,
-        aggregators=aggregators,
+        summary=summary,
     )
 
 
+def _iter_csv_chunks(handle, column_count: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """把数据行按块解析为 ``(x, y)``：x 为有效 x 值，y 为 (信号数, 行数)。
+
+    空行跳过；短行补 NaN、长行截断（exporter 产出总是对齐的，但测试
+    fixture 可能手写成缺列）；空单元 / 非数字 / 非有限值都视为缺失，
+    x 缺失的行整行丢弃。整块都是规整数字时交给 ``np.loadtxt`` 一次
+    解析，否则这一块回退到 csv.reader + :func:`_try_parse_float`。
+    """
+    while True:
+        lines = list(itertools.islice(handle, _CSV_CHUNK_ROWS))
+        if not lines:
+            return
+        block = _parse_csv_block(lines, column_count)
+        keep = np.isfinite(block[:, 0])
+        yield block[keep, 0], block[keep, 1:].T
+
+
+def _parse_csv_block(lines: List[str], column_count: int) -> np.ndarray:
+    try:
+        with warnings.catch_warnings():
+            # 全是空行的块会触发 "input contained no data"，走下面的回退即可。
+            warnings.simplefilter("ignore", UserWarning)
+            block = np.loadtxt(lines, delimiter=",", comments=None, dtype=float, ndmin=2)
+    except ValueError:
+        block = None
+    if block is not None and block.shape[1] >= column_count:
+        block = block[:, :column_count]
+        block[~np.isfinite(block)] = np.nan
+        return block
+    rows = [row for row in csv.reader(lines) if row]
+    block = np.full((len(rows), column_count), np.nan)
+    for row_index, row in enumerate(rows):
+        for column_index, cell in enumerate(row[:column_count]):
+            value = _try_parse_float(cell)
+            if value is not None:
+                block[row_index, column_index] = value
+    return block
+
+
 # ============================================================
 # 第二遍：锚点挑行
 # ============================================================
@@ -503,14 +461,15 @@ def _scan_pass2(
 ) -> Tuple[AnchorRow, ...]:
     """按目标索引（线性）或目标 x（对数最近邻）挑采样行。
 
-    只会一遍扫描；对数路径维护 ``best_delta[k]`` 就地替换最近邻行。
+    只会一遍扫描；对数路径按块求每个目标的最近行，跨块保留更近者
+    （距离相同时先出现的行优先）。
     """
     if target_indices is not None:
-        needed = set(target_indices)
-        picked: Dict[int, AnchorRow] = {}
+        needed = sorted(set(target_indices))
+        picked: List[AnchorRow] = []
     else:
         assert target_xs is not None
-        best_delta: List[float] = [float("inf")] * len(target_xs)
+        best_delta = np.full(len(target_xs), np.inf)
         picked_xs: List[Optional[AnchorRow]] = [None] * len(target_xs)
 
     with csv_path.open("r", encoding="utf-8", newline="") as handle:
@@ -535,59 +494,27 @@ def _scan_pass2(
         if not saw_columns:
             return ()
 
-        reader = csv.reader(handle)
         data_index = 0
-        for row in reader:
-            if not row:
-                continue
-            x_value = _try_parse_float(row[0] if row else "")
-            if x_value is None:
-                continue
-
-            values: List[Optional[float]] = []
-            for i in range(1, column_count):
-                if i >= len(row):
-                    values.append(None)
-                else:
-                    values.append(_try_parse_float(row[i]))
-
+        for x, y in _iter_csv_chunks(handle, column_count):
             if target_indices is not None:
-                if data_index in needed:
-                    picked[data_index] = AnchorRow(
-                        x=x_value, values=tuple(values)
-                    )
-                    needed.discard(data_index)
-                    if not needed:
-                        data_index += 1
-                        break
-            else:
-                # 对数最近邻：对每个目标 x 看看当前行是否更近。
-                for k, target in enumerate(target_xs):  # type: ignore[arg-type]
-                    delta = abs(math.log10(x_value) - math.log10(target))
-                    if delta < best_delta[k]:
-                        best_delta[k] = delta
-                        picked_xs[k] = AnchorRow(
-                            x=x_value, values=tuple(values)
-                        )
-
-            data_index += 1
+                chunk_end = data_index + len(x)
+                in_chunk = [index for index in needed if index < chunk_end]
+                picked.extend(_anchor_rows(x, y, [index - data_index for index in in_chunk]))
+                needed = needed[len(in_chunk):]
+                data_index = chunk_end
+                if not needed:
+                    break
+            elif len(x):
+                deltas, positions = _nearest_log_positions(x, target_xs)  # type: ignore[arg-type]
+                for k in np.flatnonzero(deltas < best_delta):
+                    best_delta[k] = deltas[k]
+                    picked_xs[k] = _anchor_rows(x, y, [positions[k]])[0]
 
     if target_indices is not None:
-        rows = [picked[idx] for idx in target_indices if idx in picked]
-    else:
-        # 对数路径：去重相邻被吸到同一行的目标。
-        seen_xs: set = set()
-        rows = []
-        for entry in picked_xs:
-            if entry is None:
-                continue
-            if entry.x in seen_xs:
-                continue
-            seen_xs.add(entry.x)
-            rows.append(entry)
-
-    rows.sort(key=lambda r: r.x)
-    return tuple(rows)
+        rows = sorted(picked, key=lambda r: r.x)
+        return tuple(rows)
+    # 对数路径：去重相邻被吸到同一行的目标。
+    return _dedupe_sorted_anchors(tuple(entry for entry in picked_xs if entry is not None))
 
 
 # ============================================================
@@ -595,6 +522,21 @@ def _scan_pass2(
 # ============================================================
 
 
+def _effective_anchor_scale(
+    anchor_scale: AnchorScale, x_min: float, x_max: float
+) -> AnchorScale:
+    if anchor_scale == AnchorScale.LOG:
+        if not (
+            x_min > 0
+            and math.isfinite(x_min)
+            and math.isfinite(x_max)
+            and x_max > x_min
+        ):
+            # 数据里有 <=0 或 x 轴退化 —— 对数采样不可行，退到线性。
+            return AnchorScale.LINEAR
+    return anchor_scale
+
+
 def _linear_anchor_indices(total_rows: int, anchor_count: int) -> List[int]:
     if total_rows <= 0:
         return []
@@ -618,73 +560,106 @@ def _log_anchor_targets(
     return [10 ** (log_min + i * step) for i in range(anchor_count)]
 
 
-# ============================================================
-# 工具
-# ============================================================
-
-
-def _stats_from_aggregator(agg: _SignalAggregator) -> SeriesStats:
-    if agg.samples == 0:
-        nan = float("nan")
-        return SeriesStats(
-            name=agg.name,
-            samples=0,
-            min_value=nan,
-            max_value=nan,
-            mean_value=nan,
-            initial_value=nan,
-            final_value=nan,
-            zero_crossings=0,
-            peak_to_peak=nan,
+def _nearest_log_positions(
+    x: np.ndarray, target_xs: Sequence[float]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """每个目标在对数 x 上最近的行：返回 ``(距离, 行位置)``，同距取先出现者。"""
+    if len(x) == 0:
+        return np.full(len(target_xs), np.inf), np.zeros(len(target_xs), dtype=np.intp)
+    deltas = np.abs(np.log10(x)[None, :] - np.log10(np.asarray(target_xs, dtype=float))[:, None])
+    positions = np.argmin(deltas, axis=1)
+    return deltas[np.arange(len(target_xs)), positions], positions
+
+
+def _anchor_rows(x: np.ndarray, y: np.ndarray, positions: Sequence[int]) -> Tuple[AnchorRow, ...]:
+    return tuple(
+        AnchorRow(
+            x=float(x[position]),
+            values=tuple(
+                None if math.isnan(value) else value
+                for value in y[:, position].tolist()
+            ),
         )
-    mean = agg.sum_value / agg.samples
-    return SeriesStats(
-        name=agg.name,
-        samples=agg.samples,
-        min_value=agg.min_value,
-        max_value=agg.max_value,
-        mean_value=mean,
-        initial_value=agg.initial_value if agg.initial_value is not None else float("nan"),
-        final_value=agg.final_value if agg.final_value is not None else float("nan"),
-        zero_crossings=agg.zero_crossings,
-        peak_to_peak=agg.max_value - agg.min_value,
+        for position in positions
     )
 
 
-def _apply_signal_values(
-    aggregators: Sequence[_SignalAggregator],
-    values: Sequence[Optional[float]],
-) -> None:
-    for agg, y_value in zip(aggregators, values):
-        if y_value is None:
+def _dedupe_sorted_anchors(anchors: Sequence[AnchorRow]) -> Tuple[AnchorRow, ...]:
+    seen_xs: set = set()
+    rows: List[AnchorRow] = []
+    for entry in anchors:
+        if entry.x in seen_xs:
             continue
-        agg.samples += 1
-        agg.sum_value += y_value
-        if y_value < agg.min_value:
-            agg.min_value = y_value
-        if y_value > agg.max_value:
-            agg.max_value = y_value
-        if agg.initial_value is None:
-            agg.initial_value = y_value
-        agg.final_value = y_value
-        if agg.last_value is not None and agg.last_value * y_value < 0.0:
-            agg.zero_crossings += 1
-        agg.last_value = y_value
-
-
-def _table_row_values(
-    signal_names: Sequence[str],
-    signal_columns: Mapping[str, Sequence[object]],
-    row_index: int,
-) -> List[Optional[float]]:
-    values: List[Optional[float]] = []
-    for signal_name in signal_names:
-        column = signal_columns.get(signal_name)
-        if column is None or row_index >= len(column):
-            values.append(None)
+        seen_xs.add(entry.x)
+        rows.append(entry)
+    rows.sort(key=lambda row: row.x)
+    return tuple(rows)
+
+
+# ============================================================
+# 工具
+# ============================================================
+
+
+def _stats_from_summary(
+    signal_names: Sequence[str], summary: SeriesSummary
+) -> Tuple[SeriesStats, ...]:
+    mean = summary.mean
+    stats: List[SeriesStats] = []
+    for index, name in enumerate(signal_names):
+        samples = int(summary.samples[index])
+        if samples == 0:
+            nan = float("nan")
+            stats.append(SeriesStats(
+                name=name,
+                samples=0,
+                min_value=nan,
+                max_value=nan,
+                mean_value=nan,
+                initial_value=nan,
+                final_value=nan,
+                zero_crossings=0,
+                peak_to_peak=nan,
+            ))
             continue
-        values.append(_try_parse_scalar(column[row_index]))
-    return values
+        min_value = float(summary.minimum[index])
+        max_value = float(summary.maximum[index])
+        stats.append(SeriesStats(
+            name=name,
+            samples=samples,
+            min_value=min_value,
+            max_value=max_value,
+            mean_value=float(mean[index]),
+            initial_value=float(summary.initial[index]),
+            final_value=float(summary.final[index]),
+            zero_crossings=int(summary.zero_crossings[index]),
+            peak_to_peak=max_value - min_value,
+        ))
+    return tuple(stats)
+
+
+def _column_to_array(values: Sequence[object]) -> np.ndarray:
+    """把一列转换为 float 数组；无法解析或非有限的单元记为 NaN。
+
+    实数 ndarray / 纯数值列表走一次性转换；复数、对象或混杂内容逐元素
+    回退到 :func:`_try_parse_scalar`，语义与逐行解析一致。
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind in "biuf":
+        array = values.astype(float).ravel()
+    else:
+        try:
+            array = np.asarray(values, dtype=float).ravel()
+        except (TypeError, ValueError):
+            array = np.array(
+                [
+                    np.nan if (parsed := _try_parse_scalar(value)) is None else parsed
+                    for value in values
+                ],
+                dtype=float,
+            )
+    if not np.isfinite(array).all():
+        array = np.where(np.isfinite(array), array, np.nan)
+    return array
 
 
 def _try_parse_scalar(value: object) -> Optional[float]:
@@ -721,7 +696,6 @@ def _parse_csv_line(line: str) -> List[str]:
         return [cell.strip() for cell in row]
     return []
 
-
 # ============================================================
 # 模块导出
 # ============================================================
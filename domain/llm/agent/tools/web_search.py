@@ -49,6 +49,10 @@ class WebSearchTool(BaseTool):
             "Prefer concise, targeted queries and cite returned sources in the final answer when relevant.",
         ]
 
+    @property
+    def is_read_only(self) -> bool:
+        return True
+
     async def execute(
         self,
         tool_call_id: str,
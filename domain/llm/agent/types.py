@@ -302,6 +302,9 @@ class BaseTool(ABC):
     - execute() 接收已解析的参数字典（不是 JSON 字符串）
     - execute() 通过抛异常表示失败，循环层自动包装为 ToolResult(is_error=True)
     - prompt_snippet 和 prompt_guidelines 供系统提示词构建器使用
+    - is_read_only / runs_blocking_io 是给 ToolScheduler 的调度声明，
+      默认值对应"串行、在事件循环上执行"；get_resource_key 只是
+      tracing 标签
     """
     
     @property
@@ -384,6 +387,44 @@ class BaseTool(ABC):
         """
         return None
     
+    @property
+    def is_read_only(self) -> bool:
+        """
+        是否为只读工具（调度声明）
+        
+        只读工具不修改工作区、不提交仿真；同一轮 LLM 响应里的多个
+        只读调用由 ToolScheduler 并发执行。默认 False。
+        """
+        return False
+    
+    @property
+    def runs_blocking_io(self) -> bool:
+        """
+        execute() 内是否包含同步阻塞的文件 I/O 或解析（调度声明）
+        
+        为 True 时 ToolScheduler 把整个 execute() 放到工作线程池中、
+        在独立事件循环里运行，避免阻塞 qasync 所在的 Qt UI 线程。
+        声明为阻塞的工具不得 await 绑定在主事件循环上的对象。
+        默认 False。
+        """
+        return False
+    
+    def get_resource_key(
+        self,
+        params: Dict[str, Any],
+        context: "ToolContext",
+    ) -> Optional[str]:
+        """
+        变更类工具调用在 tracing span 上的资源标签
+        
+        不参与调度：同一轮内的变更调用一律按 LLM 给出的顺序串行执行，
+        该标签只记录在 tracing span 中。只读工具返回 None；变更类工具
+        默认以工具名作为标签。
+        """
+        if self.is_read_only:
+            return None
+        return f"tool:{self.name}"
+    
     def get_schema(self) -> ToolSchema:
         """
         获取工具的 Schema 定义
@@ -19,11 +19,10 @@ from domain.llm.message_helpers import (
     ROLE_ASSISTANT,
     is_system_message,
     is_ai_message,
-    get_reasoning_content,
     get_operations,
     get_role,
 )
-from domain.llm.token_counter import count_tokens
+from domain.llm.message_token_cache import count_messages_tokens
 from domain.llm.working_context_builder import (
     build_working_context_state,
     get_history_messages,
@@ -121,11 +120,7 @@ class ContextCompressor:
             keep_recent,
         )
 
-        tokens_saved = sum(
-            count_tokens(msg.content if isinstance(msg.content, str) else "", model)
-            + count_tokens(get_reasoning_content(msg) or "", model)
-            for msg in messages_to_summarize
-        )
+        tokens_saved = sum(count_messages_tokens(messages_to_summarize, model))
 
         summary_preview = self._build_preview_summary(state, messages_to_summarize)
 
@@ -289,18 +284,9 @@ class ContextCompressor:
         state: Dict[str, Any],
         model: str
     ) -> int:
-        """计算状态的总 token 数"""
+        """计算状态的总 token 数（复用消息上的 Token 计数缓存）"""
         messages = get_working_context_messages(state)
-        total = 0
-
-        for msg in messages:
-            content = msg.content if isinstance(msg.content, str) else ""
-            total += count_tokens(content, model)
-            reasoning = get_reasoning_content(msg)
-            if reasoning:
-                total += count_tokens(reasoning, model)
-
-        return total
+        return sum(count_messages_tokens(messages, model))
     
     def _get_messages(self, state: Dict[str, Any]) -> List[BaseMessage]:
         """获取消息列表"""
@@ -448,6 +448,8 @@ def message_to_dict(msg: BaseMessage) -> Dict[str, Any]:
         result["additional_kwargs"]["timestamp"] = kwargs["timestamp"]
     if kwargs.get("metadata"):
         result["additional_kwargs"]["metadata"] = kwargs["metadata"]
+    if kwargs.get("token_count"):
+        result["additional_kwargs"]["token_count"] = kwargs["token_count"]
     
     # 用户消息特有字段
     if role == ROLE_USER:
@@ -0,0 +1,229 @@
+# Message Token Cache - Per-Message Token Count Memo
+"""
+消息 Token 计数缓存 - 为 LangChain 消息记忆 Token 数量
+
+职责：
+- 计算单条消息（按 LLM 请求载荷口径）的 Token 数量
+- 将计数结果写入消息 additional_kwargs，随会话一起持久化
+- 批量计算未命中缓存的消息，已命中的消息不再重新编码
+
+缓存键：
+- 消息 ID（metadata.id）
+- 内容哈希（content、reasoning_content、附件、工具名称）
+- tokenizer 标识（切换 tokenizer 后自动失效）
+
+设计说明：
+- 缓存条目存储在 additional_kwargs["token_count"]，由 message_to_dict 持久化
+- 计数口径与 count_message_tokens 一致：每条消息包含角色开销，
+  不包含消息列表的 3 tokens 格式开销
+- 写入缓存是对 additional_kwargs 字典的原地更新，不改变消息语义
+
+使用示例：
+    from domain.llm.message_token_cache import count_messages_tokens
+
+    per_message = count_messages_tokens(messages, model="glm-4")
+    total = sum(per_message)
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.messages import BaseMessage
+
+from domain.llm.message_helpers import (
+    get_attachments,
+    get_message_id,
+    get_reasoning_content,
+    get_role,
+)
+from domain.llm.token_counter import (
+    count_payload_tokens_many,
+    get_tokenizer_name,
+)
+
+
+# ============================================================
+# 常量
+# ============================================================
+
+# additional_kwargs 中的缓存字段名
+TOKEN_COUNT_KEY = "token_count"
+
+PayloadBuilder = Callable[[BaseMessage], Dict[str, Any]]
+
+
+# ============================================================
+# 缓存键
+# ============================================================
+
+def compute_message_content_hash(msg: BaseMessage) -> str:
+    """
+    计算影响 Token 数量的消息内容哈希
+
+    附件按路径、大小与修改时间参与哈希：附件文件变化时载荷文本随之变化。
+
+    Args:
+        msg: LangChain 消息
+
+    Returns:
+        十六进制哈希字符串
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(get_role(msg).encode("utf-8"))
+    digest.update(b"\0")
+
+    content = msg.content
+    if isinstance(content, str):
+        digest.update(content.encode("utf-8", "surrogatepass"))
+    else:
+        digest.update(
+            json.dumps(content, ensure_ascii=False, sort_keys=True, default=str)
+            .encode("utf-8", "surrogatepass")
+        )
+    digest.update(b"\0")
+    digest.update((get_reasoning_content(msg) or "").encode("utf-8", "surrogatepass"))
+    digest.update(b"\0")
+    digest.update(str(getattr(msg, "name", "") or "").encode("utf-8"))
+
+    for attachment in get_attachments(msg):
+        try:
+            mtime_ns = os.stat(attachment.path).st_mtime_ns if attachment.path else 0
+        except OSError:
+            mtime_ns = 0
+        digest.update(b"\0")
+        digest.update(
+            f"{attachment.type}|{attachment.path}|{attachment.size}|"
+            f"{attachment.reference_id}|{mtime_ns}".encode("utf-8", "surrogatepass")
+        )
+
+    return digest.hexdigest()
+
+
+def get_cached_message_tokens(msg: BaseMessage, tokenizer_name: str) -> Optional[int]:
+    """
+    读取消息上的 Token 计数缓存
+
+    Args:
+        msg: LangChain 消息
+        tokenizer_name: 当前 tokenizer 标识
+
+    Returns:
+        命中时返回 Token 数量，未命中或已失效返回 None
+    """
+    additional_kwargs = getattr(msg, "additional_kwargs", None)
+    if not isinstance(additional_kwargs, dict):
+        return None
+
+    entry = additional_kwargs.get(TOKEN_COUNT_KEY)
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("tokenizer") != tokenizer_name:
+        return None
+    if entry.get("message_id", "") != get_message_id(msg):
+        return None
+    if entry.get("content_hash") != compute_message_content_hash(msg):
+        return None
+
+    tokens = entry.get("tokens")
+    if isinstance(tokens, int) and tokens >= 0:
+        return tokens
+    return None
+
+
+def store_message_tokens(msg: BaseMessage, tokenizer_name: str, tokens: int) -> None:
+    """
+    将 Token 计数写入消息 additional_kwargs
+
+    Args:
+        msg: LangChain 消息
+        tokenizer_name: 当前 tokenizer 标识
+        tokens: Token 数量
+    """
+    additional_kwargs = getattr(msg, "additional_kwargs", None)
+    if not isinstance(additional_kwargs, dict):
+        return
+
+    additional_kwargs[TOKEN_COUNT_KEY] = {
+        "message_id": get_message_id(msg),
+        "content_hash": compute_message_content_hash(msg),
+        "tokenizer": tokenizer_name,
+        "tokens": int(tokens),
+    }
+
+
+# ============================================================
+# 批量计数
+# ============================================================
+
+_default_payload_builder: Optional[PayloadBuilder] = None
+
+
+def _get_default_payload_builder() -> PayloadBuilder:
+    """延迟创建默认载荷构建器（避免导入期加载附件提取依赖）"""
+    global _default_payload_builder
+    if _default_payload_builder is None:
+        from domain.llm.llm_message_builder import LLMMessageBuilder
+
+        _default_payload_builder = LLMMessageBuilder().build_message
+    return _default_payload_builder
+
+
+def count_messages_tokens(
+    messages: List[BaseMessage],
+    model: str = "default",
+    payload_builder: Optional[PayloadBuilder] = None,
+) -> List[int]:
+    """
+    逐条计算消息 Token 数量（带缓存）
+
+    命中缓存的消息直接返回记忆值；未命中的消息统一构建请求载荷后
+    批量编码，并把结果写回缓存。
+
+    Args:
+        messages: LangChain 消息列表
+        model: 模型名称
+        payload_builder: 消息 → 请求载荷字典的构建函数，默认使用 LLMMessageBuilder
+
+    Returns:
+        与输入顺序一致的每条消息 Token 数量
+    """
+    if not messages:
+        return []
+
+    tokenizer_name = get_tokenizer_name(model)
+    counts: List[int] = [0] * len(messages)
+    pending_indexes: List[int] = []
+
+    for index, msg in enumerate(messages):
+        cached = get_cached_message_tokens(msg, tokenizer_name)
+        if cached is None:
+            pending_indexes.append(index)
+        else:
+            counts[index] = cached
+
+    if not pending_indexes:
+        return counts
+
+    build_payload = payload_builder or _get_default_payload_builder()
+    payloads = [build_payload(messages[index]) for index in pending_indexes]
+
+    for index, tokens in zip(pending_indexes, count_payload_tokens_many(payloads, model)):
+        counts[index] = tokens
+        store_message_tokens(messages[index], tokenizer_name, tokens)
+
+    return counts
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "TOKEN_COUNT_KEY",
+    "compute_message_content_hash",
+    "get_cached_message_tokens",
+    "store_message_tokens",
+    "count_messages_tokens",
+]
@@ -15,6 +15,7 @@ Token 计数工具 - 提供 Token 计数功能
 """
 
 import logging
+import re
 from typing import Any, Dict, List, Optional, Union
 
 _logger = logging.getLogger(__name__)
@@ -27,6 +28,12 @@ _logger = logging.getLogger(__name__)
 DEFAULT_CONTEXT_LIMIT = 128_000
 DEFAULT_OUTPUT_LIMIT = 32_768  # 现代大模型普遍支持 32K+ 输出
 
+# tokenizer 不可用时使用的估算器标识
+ESTIMATE_TOKENIZER_NAME = "estimate"
+
+# 消息列表的格式开销
+MESSAGE_LIST_OVERHEAD_TOKENS = 3
+
 
 # ============================================================
 # Token 计数器
@@ -128,6 +135,24 @@ def _get_tokenizer(model: str = "default") -> Any:
         return None
 
 
+def get_tokenizer_name(model: str = "default") -> str:
+    """
+    获取当前模型使用的 tokenizer 标识
+
+    用于 Token 计数缓存的键：tokenizer 变化时缓存自动失效。
+
+    Args:
+        model: 模型名称
+
+    Returns:
+        tokenizer 编码名称，不可用时返回 "estimate"
+    """
+    tokenizer = _get_tokenizer(model)
+    if tokenizer is None:
+        return ESTIMATE_TOKENIZER_NAME
+    return str(getattr(tokenizer, "name", "") or ESTIMATE_TOKENIZER_NAME)
+
+
 def count_tokens(
     text: Union[str, List[str]],
     model: str = "default"
@@ -143,7 +168,7 @@ def count_tokens(
         Token 数量
     """
     if isinstance(text, list):
-        return sum(count_tokens(t, model) for t in text)
+        return sum(count_tokens_many(text, model))
     
     if not text:
         return 0
@@ -161,6 +186,67 @@ def count_tokens(
     return _estimate_tokens(text)
 
 
+def count_tokens_many(
+    texts: List[str],
+    model: str = "default"
+) -> List[int]:
+    """
+    批量计算多段文本的 Token 数量
+
+    模型与 tokenizer 只解析一次，非空文本通过 tiktoken 的批量编码
+    一次性处理；批量编码失败（如包含特殊 token）时逐条回退到
+    count_tokens 的行为。
+
+    Args:
+        texts: 文本列表
+        model: 模型名称
+
+    Returns:
+        与输入顺序一致的 Token 数量列表
+    """
+    counts = [0] * len(texts)
+    pending_indexes = [index for index, text in enumerate(texts) if text]
+    if not pending_indexes:
+        return counts
+
+    resolved_model, _ = _resolve_active_model_and_provider(model)
+    tokenizer = _get_tokenizer(resolved_model)
+    pending_texts = [texts[index] for index in pending_indexes]
+
+    if tokenizer is not None:
+        try:
+            encoded = tokenizer.encode_batch(pending_texts)
+            for index, tokens in zip(pending_indexes, encoded):
+                counts[index] = len(tokens)
+            return counts
+        except Exception:
+            pass
+
+        for index, text in zip(pending_indexes, pending_texts):
+            try:
+                counts[index] = len(tokenizer.encode(text))
+            except Exception:
+                counts[index] = _estimate_tokens(text)
+        return counts
+
+    for index, text in zip(pending_indexes, pending_texts):
+        counts[index] = _estimate_tokens(text)
+    return counts
+
+
+# 估算器字符分类（与逐字符判断的优先级一致：中文 > 标点 > 换行 > 空白 > 其他）
+_CHINESE_CHAR_PATTERN = re.compile(r"[\u4e00-\u9fff]")
+_PUNCTUATION_CHAR_PATTERN = re.compile(
+    r"[\u3000-\u303f\uff00-\uffef.,;:!?()\[\]{}\"'\-]"
+)
+_SPACE_CHAR_PATTERN = re.compile(r"[ \t]")
+
+
+def _count_pattern_chars(pattern: "re.Pattern[str]", text: str) -> int:
+    """统计匹配字符数（在 C 层完成扫描，避免 Python 逐字符循环）"""
+    return len(text) - len(pattern.sub("", text))
+
+
 def _estimate_tokens(text: str) -> int:
     """
     近似估算 Token 数量
@@ -174,32 +260,18 @@ def _estimate_tokens(text: str) -> int:
     - 空格：通常 4 个合并为 1 token
     
     近似公式：tokens ≈ chinese_chars / 1.5 + other_chars / 4
+
+    各类字符数通过正则替换前后的长度差计算，整段文本只做常数次
+    C 层扫描。
     """
     if not text:
         return 0
     
-    chinese_chars = 0
-    punctuation_chars = 0
-    newline_chars = 0
-    space_chars = 0
-    other_chars = 0
-    
-    for c in text:
-        if '\u4e00' <= c <= '\u9fff':
-            # 中文字符
-            chinese_chars += 1
-        elif '\u3000' <= c <= '\u303f' or '\uff00' <= c <= '\uffef':
-            # 中文标点
-            punctuation_chars += 1
-        elif c in '.,;:!?()[]{}"\'-':
-            # 英文标点
-            punctuation_chars += 1
-        elif c == '\n':
-            newline_chars += 1
-        elif c in ' \t':
-            space_chars += 1
-        else:
-            other_chars += 1
+    chinese_chars = _count_pattern_chars(_CHINESE_CHAR_PATTERN, text)
+    punctuation_chars = _count_pattern_chars(_PUNCTUATION_CHAR_PATTERN, text)
+    newline_chars = text.count("\n")
+    space_chars = _count_pattern_chars(_SPACE_CHAR_PATTERN, text)
+    other_chars = len(text) - chinese_chars - punctuation_chars - newline_chars - space_chars
     
     # 计算 Token 数
     tokens = 0
@@ -212,6 +284,78 @@ def _estimate_tokens(text: str) -> int:
     return int(tokens)
 
 
+def _collect_payload_texts(msg: Dict[str, Any]) -> tuple[int, List[str]]:
+    """
+    拆分单条消息字典的固定开销与需要计数的文本
+
+    Returns:
+        (固定开销 tokens, 文本片段列表)
+    """
+    role = msg.get("role", "")
+
+    # 角色标记开销（约 4 tokens）
+    overhead = 4
+
+    # 系统消息额外开销
+    if role == "system":
+        overhead += 4
+
+    texts: List[str] = []
+
+    # 内容
+    content = msg.get("content", "")
+    if isinstance(content, str):
+        texts.append(content)
+    elif isinstance(content, list):
+        # 多模态内容
+        for item in content:
+            if isinstance(item, dict):
+                if "text" in item:
+                    texts.append(item["text"])
+                elif "image_url" in item:
+                    # 图片内容，使用默认估算
+                    overhead += 85  # 基础图片开销
+
+    # 思考内容（reasoning_content）
+    reasoning = msg.get("reasoning_content", "")
+    if reasoning:
+        texts.append(reasoning)
+
+    return overhead, texts
+
+
+def count_payload_tokens_many(
+    messages: List[Dict[str, Any]],
+    model: str = "default"
+) -> List[int]:
+    """
+    逐条计算消息字典的 Token 数量（不含消息列表的格式开销）
+
+    所有消息的文本片段合并为一次批量编码。
+
+    Args:
+        messages: 消息列表（字典格式）
+        model: 模型名称
+
+    Returns:
+        与输入顺序一致的每条消息 Token 数量
+    """
+    overheads: List[int] = []
+    owners: List[int] = []
+    texts: List[str] = []
+
+    for index, msg in enumerate(messages):
+        overhead, msg_texts = _collect_payload_texts(msg)
+        overheads.append(overhead)
+        texts.extend(msg_texts)
+        owners.extend([index] * len(msg_texts))
+
+    totals = list(overheads)
+    for owner, tokens in zip(owners, count_tokens_many(texts, model)):
+        totals[owner] += tokens
+    return totals
+
+
 def count_message_tokens(
     messages: List[Dict[str, Any]],
     model: str = "default"
@@ -231,39 +375,10 @@ def count_message_tokens(
     Returns:
         Token 数量
     """
-    total = 0
-    
-    for msg in messages:
-        role = msg.get("role", "")
-        
-        # 角色标记开销（约 4 tokens）
-        total += 4
-        
-        # 系统消息额外开销
-        if role == "system":
-            total += 4
-        
-        # 内容
-        content = msg.get("content", "")
-        if isinstance(content, str):
-            total += count_tokens(content, model)
-        elif isinstance(content, list):
-            # 多模态内容
-            for item in content:
-                if isinstance(item, dict):
-                    if "text" in item:
-                        total += count_tokens(item["text"], model)
-                    elif "image_url" in item:
-                        # 图片内容，使用默认估算
-                        total += 85  # 基础图片开销
-        
-        # 思考内容（reasoning_content）
-        reasoning = msg.get("reasoning_content", "")
-        if reasoning:
-            total += count_tokens(reasoning, model)
+    total = sum(count_payload_tokens_many(messages, model))
     
     # 消息格式开销（约 3 tokens）
-    total += 3
+    total += MESSAGE_LIST_OVERHEAD_TOKENS
     
     return total
 
@@ -456,7 +571,10 @@ def get_available_context(
 __all__ = [
     # 计数函数
     "count_tokens",
+    "count_tokens_many",
     "count_message_tokens",
+    "count_payload_tokens_many",
+    "get_tokenizer_name",
     "count_image_tokens",
     # 限制查询
     "get_model_context_limit",
@@ -466,4 +584,6 @@ __all__ = [
     # 默认值
     "DEFAULT_CONTEXT_LIMIT",
     "DEFAULT_OUTPUT_LIMIT",
+    "ESTIMATE_TOKENIZER_NAME",
+    "MESSAGE_LIST_OVERHEAD_TOKENS",
 ]
@@ -10,7 +10,9 @@ Token 监控。
 from typing import Any, Dict
 
 from domain.llm.llm_message_builder import LLMMessageBuilder
+from domain.llm.message_token_cache import count_messages_tokens
 from domain.llm.token_counter import (
+    MESSAGE_LIST_OVERHEAD_TOKENS,
     count_tokens,
     count_message_tokens,
     get_model_context_limit,
@@ -76,7 +78,8 @@ class TokenMonitor:
         summary_tokens = 0
         summary = get_working_context_summary(state)
         if summary:
-            summary_messages = [msg for msg in working_messages if msg not in direct_messages]
+            direct_message_ids = {id(msg) for msg in direct_messages}
+            summary_messages = [msg for msg in working_messages if id(msg) not in direct_message_ids]
             if summary_messages:
                 summary_tokens = self._count_messages(summary_messages, model)
             else:
@@ -137,6 +140,9 @@ class TokenMonitor:
     def _count_langchain_messages(self, messages: list, model: str) -> int:
         """
         计算 LangChain 消息的 token 数
+
+        每条消息的计数缓存在消息 additional_kwargs 中，只有新增或
+        内容变化的消息需要重新构建载荷并编码。
         
         Args:
             messages: LangChain 消息列表
@@ -145,8 +151,12 @@ class TokenMonitor:
         Returns:
             Token 数量
         """
-        payload_messages = self._message_builder.build_messages(messages)
-        return count_message_tokens(payload_messages, model)
+        per_message_tokens = count_messages_tokens(
+            messages,
+            model,
+            payload_builder=self._message_builder.build_message,
+        )
+        return sum(per_message_tokens) + MESSAGE_LIST_OVERHEAD_TOKENS
     
     def get_usage_ratio(
         self,
@@ -7,16 +7,27 @@ RAG 知识检索域 - Embedding-only 向量检索架构
 - chunker         : 文件分块（按文件类型选策略）
 - embedder        : 本地 Embedding 模型（sentence-transformers）
 - vector_store    : ChromaDB 向量存储（upsert/delete/query）
+- keyword_index   : BM25 关键词倒排索引（随 vector_store 同步更新）
 - rag_manager     : 业务逻辑管理器（索引、查询、生命周期）
 - document_watcher: 文件变更检测（防抖、增量索引触发）
 """
 
-from domain.rag.chunker import Chunk, chunk_file
-from domain.rag.embedder import Embedder
-from domain.rag.file_extractor import FileIndexRule, extract_indexable_content, get_file_index_rule
-from domain.rag.rag_manager import RAGManager
-from domain.rag.vector_store import RAGQueryResult, VectorStore
-from domain.rag.document_watcher import DocumentWatcher
+from shared.lazy_import import lazy_exports
+
+# 子模块按首次访问导入，见 shared/lazy_import.py
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "domain.rag.chunker": ("Chunk", "chunk_file"),
+    "domain.rag.embedder": ("Embedder",),
+    "domain.rag.keyword_index": ("KeywordIndex",),
+    "domain.rag.file_extractor": (
+        "FileIndexRule",
+        "extract_indexable_content",
+        "get_file_index_rule",
+    ),
+    "domain.rag.rag_manager": ("RAGManager",),
+    "domain.rag.vector_store": ("RAGQueryResult", "VectorStore"),
+    "domain.rag.document_watcher": ("DocumentWatcher",),
+})
 
 
 __all__ = [
@@ -26,6 +37,7 @@ __all__ = [
     "extract_indexable_content",
     "FileIndexRule",
     "get_file_index_rule",
+    "KeywordIndex",
     "RAGManager",
     "RAGQueryResult",
     "VectorStore",
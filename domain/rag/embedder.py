@@ -1,41 +1,184 @@
-# Embedder - Zhipu AI Embedding via REST API
+# Embedder - Zhipu AI Embedding via REST API / Local Model
 """
 文本向量化模块
 
-使用智谱 embedding-3 API 生成文本向量，与对话模型共用同一 API Key。
+使用智谱 embedding-3 API 生成文本向量，与对话模型共用同一 API Key；
+或使用本地厂商（local）在独立进程中以 CPU 推理随包分发的模型
+（infrastructure.utils.local_embedding_backend），无网络往返与限速。
+厂商可按项目覆盖（.circuit_ai/embedding_config.json）。
 
 接口：POST https://open.bigmodel.cn/api/paas/v4/embeddings
 模型：embedding-3（2048 维）
 认证：Bearer {zhipu_api_key}（从 CredentialManager 获取）
+
+吞吐控制：
+- 自适应分批：按 token 估算把连续文本装入批次，单批不超过条数上限
+  与 token 预算，长块少装、短块多装，批次保持输入顺序
+- embed_texts_async 在并发上限内同时发出多个批次，共享
+  token/分钟限速器（同步与异步路径共用同一预算）
+- 429 / 5xx / 网络错误按指数退避重试，优先遵循 Retry-After
 """
 
+import asyncio
 import logging
-from typing import List
+import random
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import httpx
 
+from domain.llm.token_counter import count_tokens_many
 from infrastructure.config.settings import (
     CONFIG_EMBEDDING_BASE_URL,
     CONFIG_EMBEDDING_BATCH_SIZE,
+    CONFIG_EMBEDDING_CONCURRENCY,
+    CONFIG_EMBEDDING_LOCAL_BACKEND,
     CONFIG_EMBEDDING_MODEL,
     CONFIG_EMBEDDING_TIMEOUT,
+    CONFIG_EMBEDDING_TOKENS_PER_MINUTE,
     CONFIG_EMBEDDING_PROVIDER,
+    DEFAULT_EMBEDDING_CONCURRENCY,
+    DEFAULT_EMBEDDING_MAX_BATCH_TOKENS,
+    DEFAULT_EMBEDDING_TOKENS_PER_MINUTE,
+    DEFAULT_LOCAL_EMBEDDING_BACKEND,
+    EMBEDDING_PROVIDER_LOCAL,
+    EMBEDDING_PROVIDER_ZHIPU,
+    LOCAL_EMBEDDING_BACKENDS,
+    SUPPORTED_EMBEDDING_PROVIDERS,
+)
+from infrastructure.utils.http_client_pool import get_http_client_registry
+from infrastructure.utils.local_embedding_backend import (
+    LocalEmbeddingBackend,
+    get_local_embedding_backend,
 )
+from infrastructure.utils.model_config import get_embedding_model_path
 
 logger = logging.getLogger(__name__)
 
 _BATCH_SIZE = 32      # 每批最多 32 条（API 限制）
 _TIMEOUT = 30.0       # 单次请求超时秒数
 
+# 重试
+_MAX_RETRIES = 4
+_RETRY_BASE_DELAY = 0.5      # 首次退避秒数，之后按 2 的幂增长
+_RETRY_MAX_DELAY = 20.0
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+# ============================================================
+# 分批与限速
+# ============================================================
+
+def plan_embedding_batches(
+    token_counts: Sequence[int],
+    max_items: int,
+    max_tokens: int = DEFAULT_EMBEDDING_MAX_BATCH_TOKENS,
+) -> List[Tuple[int, int]]:
+    """
+    按 token 长度自适应切分批次
+
+    Args:
+        token_counts: 每条文本的 token 估算
+        max_items: 单批条数上限
+        max_tokens: 单批 token 预算；单条超过预算时独占一批
+
+    Returns:
+        连续区间 [(start, end), ...]，按输入顺序排列
+    """
+    batches: List[Tuple[int, int]] = []
+    start = 0
+    batch_tokens = 0
+    for index, tokens in enumerate(token_counts):
+        size = index - start
+        if size and (size >= max_items or batch_tokens + tokens > max_tokens):
+            batches.append((start, index))
+            start = index
+            batch_tokens = 0
+        batch_tokens += tokens
+    if start < len(token_counts):
+        batches.append((start, len(token_counts)))
+    return batches
+
+
+class TokenRateLimiter:
+    """
+    token/分钟限速器（预约式令牌桶）
+
+    reserve() 立即扣减预算并返回需要等待的秒数，预算可以透支，
+    后到的请求排在透支之后，因此多线程 / 多协程按预约顺序放行。
+    """
+
+    def __init__(self, tokens_per_minute: int, clock=time.monotonic):
+        self.tokens_per_minute = max(0, int(tokens_per_minute))
+        self._rate = self.tokens_per_minute / 60.0
+        self._clock = clock
+        self._available = float(self.tokens_per_minute)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int) -> float:
+        """预约 tokens，返回需要等待的秒数（不限速时为 0）"""
+        if self._rate <= 0:
+            return 0.0
+        tokens = min(max(0, int(tokens)), self.tokens_per_minute)
+        with self._lock:
+            now = self._clock()
+            self._available = min(
+                float(self.tokens_per_minute),
+                self._available + (now - self._updated) * self._rate,
+            )
+            self._updated = now
+            self._available -= tokens
+            return max(0.0, -self._available / self._rate)
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        try:
+            return min(_RETRY_MAX_DELAY, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * (2 ** attempt))
+    return delay * (0.5 + random.random() / 2)
+
+
+def _parse_embeddings(response: httpx.Response) -> List[List[float]]:
+    response.raise_for_status()
+    data = response.json()
+    items = sorted(data["data"], key=lambda x: x["index"])
+    return [item["embedding"] for item in items]
+
 
 class Embedder:
     """
-    智谱 embedding-3 向量化器
+    智谱 embedding-3 / 本地模型向量化器
 
     使用独立的 embedding 配置与 embedding 凭证。
-    使用 httpx 同步调用（在 RAGWorkerThread 内执行，不阻塞 Qt 主线程）。
+    使用 httpx 同步调用（在 RAGWorkerThread 内执行，不阻塞 Qt 主线程），
+    连接取自进程级连接池，批次之间复用 keep-alive 连接。
+    embed_texts_async 供事件循环内并发使用。
     """
 
+    def __init__(self):
+        self._project_config: Dict[str, Any] = {}
+        self._limiter: Optional[TokenRateLimiter] = None
+        self._limiter_lock = threading.Lock()
+        # 并发信号量绑定事件循环，按循环分别创建
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[int, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def set_project_config(self, config: Optional[Dict[str, Any]]) -> None:
+        """
+        设置项目级嵌入配置覆盖（{project}/.circuit_ai/embedding_config.json）
+
+        支持字段：provider、model、local_backend；None 表示沿用全局配置。
+        """
+        self._project_config = dict(config) if config else {}
+
     def _get_embedding_config(self) -> tuple[str, str, str, int, int]:
         try:
             from shared.service_locator import ServiceLocator
@@ -45,37 +188,37 @@ class Embedder:
             config_manager = ServiceLocator.get_optional(SVC_CONFIG_MANAGER)
             EmbeddingModelRegistry.initialize()
 
-            provider_id = ""
-            if config_manager:
+            provider_id = str(self._project_config.get("provider", "") or "").strip()
+            if not provider_id and config_manager:
                 provider_id = str(config_manager.get(CONFIG_EMBEDDING_PROVIDER, "") or "").strip()
 
             if not provider_id:
                 default_provider = EmbeddingModelRegistry.get_default_provider()
                 provider_id = default_provider.id if default_provider else "zhipu"
 
-            if provider_id != "zhipu":
-                raise RuntimeError("Only Zhipu embedding is currently supported.")
+            if provider_id not in SUPPORTED_EMBEDDING_PROVIDERS:
+                raise RuntimeError(f"Unsupported embedding provider: {provider_id}")
 
             provider = EmbeddingModelRegistry.get_provider(provider_id)
             default_model = EmbeddingModelRegistry.get_default_model(provider_id)
             model_name = default_model.name if default_model else "embedding-3"
             default_base_url = provider.base_url if provider else "https://open.bigmodel.cn/api/paas/v4/embeddings"
 
-            if config_manager:
-                configured_provider = config_manager.get(CONFIG_EMBEDDING_PROVIDER, provider_id)
-                if configured_provider != "zhipu":
-                    raise RuntimeError("Only Zhipu embedding is currently supported.")
-
+            configured_model = str(self._project_config.get("model", "") or "").strip()
+            if not configured_model and config_manager and not self._project_config.get("provider"):
                 configured_model = str(config_manager.get(CONFIG_EMBEDDING_MODEL, "") or "").strip()
-                if configured_model:
-                    configured_model_config = EmbeddingModelRegistry.get_model_by_name(configured_provider, configured_model)
-                    if configured_model_config:
-                        model_name = configured_model_config.name
+            if configured_model:
+                configured_model_config = EmbeddingModelRegistry.get_model_by_name(provider_id, configured_model)
+                if configured_model_config:
+                    model_name = configured_model_config.name
 
-                base_url = config_manager.get(CONFIG_EMBEDDING_BASE_URL, "") or default_base_url
+            if config_manager:
+                base_url = default_base_url
+                if provider_id == str(config_manager.get(CONFIG_EMBEDDING_PROVIDER, "") or ""):
+                    base_url = config_manager.get(CONFIG_EMBEDDING_BASE_URL, "") or default_base_url
                 timeout = int(config_manager.get(CONFIG_EMBEDDING_TIMEOUT, _TIMEOUT))
                 batch_size = int(config_manager.get(CONFIG_EMBEDDING_BATCH_SIZE, _BATCH_SIZE))
-                return configured_provider, model_name, base_url, max(batch_size, 1), max(timeout, 1)
+                return provider_id, model_name, base_url, max(batch_size, 1), max(timeout, 1)
 
             return provider_id, model_name, default_base_url, _BATCH_SIZE, int(_TIMEOUT)
         except RuntimeError:
@@ -98,6 +241,54 @@ class Embedder:
             logger.debug(f"Embedding config unavailable, fallback to default: {exc}")
             return "zhipu", "embedding-3", "https://open.bigmodel.cn/api/paas/v4/embeddings", _BATCH_SIZE, int(_TIMEOUT)
 
+    def _get_local_backend(self, batch_size: int) -> LocalEmbeddingBackend:
+        """本地厂商：按项目 / 全局配置的推理后端取进程级实例"""
+        backend = str(self._project_config.get("local_backend", "") or "").strip()
+        if not backend:
+            backend = DEFAULT_LOCAL_EMBEDDING_BACKEND
+            try:
+                from shared.service_locator import ServiceLocator
+                from shared.service_names import SVC_CONFIG_MANAGER
+
+                config_manager = ServiceLocator.get_optional(SVC_CONFIG_MANAGER)
+                if config_manager:
+                    backend = str(config_manager.get(CONFIG_EMBEDDING_LOCAL_BACKEND, backend) or backend)
+            except Exception as exc:
+                logger.debug(f"Local embedding backend config unavailable, fallback to default: {exc}")
+        if backend not in LOCAL_EMBEDDING_BACKENDS:
+            raise RuntimeError(f"Unsupported local embedding backend: {backend}")
+        return get_local_embedding_backend(get_embedding_model_path(), backend, batch_size)
+
+    def _get_throughput_config(self) -> Tuple[int, int]:
+        """返回 (并发批次数, token/分钟上限)"""
+        concurrency = DEFAULT_EMBEDDING_CONCURRENCY
+        tokens_per_minute = DEFAULT_EMBEDDING_TOKENS_PER_MINUTE
+        try:
+            from shared.service_locator import ServiceLocator
+            from shared.service_names import SVC_CONFIG_MANAGER
+
+            config_manager = ServiceLocator.get_optional(SVC_CONFIG_MANAGER)
+            if config_manager:
+                concurrency = int(config_manager.get(CONFIG_EMBEDDING_CONCURRENCY, concurrency))
+                tokens_per_minute = int(config_manager.get(CONFIG_EMBEDDING_TOKENS_PER_MINUTE, tokens_per_minute))
+        except Exception as exc:
+            logger.debug(f"Embedding throughput config unavailable, fallback to default: {exc}")
+        return max(concurrency, 1), max(tokens_per_minute, 0)
+
+    def _get_rate_limiter(self, tokens_per_minute: int) -> TokenRateLimiter:
+        with self._limiter_lock:
+            if self._limiter is None or self._limiter.tokens_per_minute != tokens_per_minute:
+                self._limiter = TokenRateLimiter(tokens_per_minute)
+            return self._limiter
+
+    def _get_semaphore(self, concurrency: int) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        entry = self._semaphores.get(loop)
+        if entry is None or entry[0] != concurrency:
+            entry = (concurrency, asyncio.Semaphore(concurrency))
+            self._semaphores[loop] = entry
+        return entry[1]
+
     # ============================================================
     # 内部
     # ============================================================
@@ -121,22 +312,46 @@ class Embedder:
             "Please set it in Settings → Model Configuration."
         )
 
-    def _call_api(self, batch: List[str]) -> List[List[float]]:
-        provider_id, model_name, base_url, _, timeout = self._get_embedding_config()
-        if provider_id != "zhipu":
-            raise RuntimeError("Only Zhipu embedding is currently supported.")
-
-        api_key = self._get_api_key()
-        resp = httpx.post(
-            base_url,
-            headers={"Authorization": f"Bearer {api_key}"},
-            json={"input": batch, "model": model_name},
-            timeout=timeout,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        items = sorted(data["data"], key=lambda x: x["index"])
-        return [item["embedding"] for item in items]
+    def _prepare_request(self, config: Optional[tuple] = None) -> Tuple[str, str, str, int, int]:
+        """返回 (model_name, base_url, api_key, batch_size, timeout)"""
+        provider_id, model_name, base_url, batch_size, timeout = config or self._get_embedding_config()
+        if provider_id != EMBEDDING_PROVIDER_ZHIPU:
+            raise RuntimeError(f"Embedding provider '{provider_id}' does not use the REST API.")
+        return model_name, base_url, self._get_api_key(), batch_size, timeout
+
+    def _call_api(self, client, batch: List[str], model_name: str) -> List[List[float]]:
+        """同步发送一批，429 / 5xx / 网络错误退避重试"""
+        for attempt in range(_MAX_RETRIES + 1):
+            response = None
+            try:
+                response = client.post(json={"input": batch, "model": model_name})
+            except httpx.TransportError as exc:
+                if attempt >= _MAX_RETRIES:
+                    raise
+                logger.warning(f"Embedding request failed ({exc}), retrying")
+            else:
+                if response.status_code not in _RETRYABLE_STATUS or attempt >= _MAX_RETRIES:
+                    return _parse_embeddings(response)
+                logger.warning(f"Embedding request got HTTP {response.status_code}, retrying")
+            time.sleep(_retry_delay(attempt, response))
+        raise AssertionError("unreachable")
+
+    async def _call_api_async(self, client, batch: List[str], model_name: str) -> List[List[float]]:
+        """异步发送一批，重试策略与 _call_api 相同"""
+        for attempt in range(_MAX_RETRIES + 1):
+            response = None
+            try:
+                response = await client.post(json={"input": batch, "model": model_name})
+            except httpx.TransportError as exc:
+                if attempt >= _MAX_RETRIES:
+                    raise
+                logger.warning(f"Embedding request failed ({exc}), retrying")
+            else:
+                if response.status_code not in _RETRYABLE_STATUS or attempt >= _MAX_RETRIES:
+                    return _parse_embeddings(response)
+                logger.warning(f"Embedding request got HTTP {response.status_code}, retrying")
+            await asyncio.sleep(_retry_delay(attempt, response))
+        raise AssertionError("unreachable")
 
     # ============================================================
     # 公共接口
@@ -155,23 +370,104 @@ class Embedder:
         if not texts:
             return []
 
-        _, _, _, batch_size, _ = self._get_embedding_config()
+        config = self._get_embedding_config()
+        if config[0] == EMBEDDING_PROVIDER_LOCAL:
+            return self._get_local_backend(config[3]).embed(texts)
+
+        model_name, base_url, api_key, batch_size, timeout = self._prepare_request(config)
+        _, tokens_per_minute = self._get_throughput_config()
+        limiter = self._get_rate_limiter(tokens_per_minute)
+        client = get_http_client_registry().bind(
+            base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=timeout,
+        )
+
+        token_counts = count_tokens_many(texts)
         results: List[List[float]] = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            results.extend(self._call_api(batch))
+        for start, end in plan_embedding_batches(token_counts, batch_size):
+            time.sleep(limiter.reserve(sum(token_counts[start:end])))
+            results.extend(self._call_api(client, texts[start:end], model_name))
 
         return results
 
+    async def embed_texts_async(self, texts: List[str]) -> List[List[float]]:
+        """
+        批量生成文本向量（异步并发）
+
+        批次在并发上限内同时发出，共享 token/分钟限速；
+        任一批次最终失败时取消其余批次并抛出异常。
+
+        Args:
+            texts: 文本列表
+
+        Returns:
+            与输入等长、同序的向量列表
+        """
+        if not texts:
+            return []
+
+        config = self._get_embedding_config()
+        if config[0] == EMBEDDING_PROVIDER_LOCAL:
+            return await self._get_local_backend(config[3]).embed_async(texts)
+
+        model_name, base_url, api_key, batch_size, timeout = self._prepare_request(config)
+        concurrency, tokens_per_minute = self._get_throughput_config()
+        limiter = self._get_rate_limiter(tokens_per_minute)
+        semaphore = self._get_semaphore(concurrency)
+        client = get_http_client_registry().bind_async(
+            base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=timeout,
+        )
+
+        token_counts = count_tokens_many(texts)
+        batches = plan_embedding_batches(token_counts, batch_size)
+        batch_results: List[List[List[float]]] = [[] for _ in batches]
+
+        async def run_batch(index: int, start: int, end: int) -> None:
+            async with semaphore:
+                await asyncio.sleep(limiter.reserve(sum(token_counts[start:end])))
+                batch_results[index] = await self._call_api_async(client, texts[start:end], model_name)
+
+        tasks = [
+            asyncio.ensure_future(run_batch(index, start, end))
+            for index, (start, end) in enumerate(batches)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return [vector for batch in batch_results for vector in batch]
+
     def embed_single(self, text: str) -> List[float]:
         """生成单条文本向量"""
         result = self.embed_texts([text])
         return result[0] if result else []
 
+    def warm_up(self) -> None:
+        """本地厂商时在后台启动推理进程并预热（项目打开时调用）；远程厂商无操作"""
+        config = self._get_embedding_config()
+        if config[0] == EMBEDDING_PROVIDER_LOCAL:
+            self._get_local_backend(config[3]).warm_up()
+
     @property
     def model_name(self) -> str:
         _, model_name, _, _, _ = self._get_embedding_config()
         return model_name
 
+    @property
+    def model_id(self) -> str:
+        """"provider:model"，用于判断项目索引是否由当前模型生成"""
+        provider_id, model_name, _, _, _ = self._get_embedding_config()
+        return f"{provider_id}:{model_name}"
+
 
-__all__ = ["Embedder"]
+__all__ = [
+    "Embedder",
+    "TokenRateLimiter",
+    "plan_embedding_batches",
+]
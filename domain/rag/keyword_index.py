@@ -0,0 +1,295 @@
+# Keyword Index - Local BM25 Inverted Index
+"""
+本地 BM25 关键词索引
+
+职责：
+- 对与 VectorStore 相同的 chunk 建立倒排索引，按 BM25 打分检索
+- 覆盖向量检索的弱项：器件型号（LT1001、2N3904）、SPICE 指令
+  （.model、.subckt）、节点名（V(out)）等精确符号
+- 以 JSON 持久化 chunk 原文与元数据，加载时重建倒排表
+
+同步方式：
+- 由 VectorStore.upsert_file / delete_file / clear 驱动，与向量库
+  在同一调用点更新，chunk_id 一一对应
+- 持久化时机与 index_meta.json 一致（RAGManager._save_index_meta），
+  加载后若 chunk_id 集合与 ChromaDB 不一致则从 ChromaDB 重建
+
+分词：
+- 小写化；ASCII 取 ``\\.?[0-9a-z_]+``（保留 SPICE 指令的前导点）
+- 连续中文按单字 + 相邻二字切分
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from domain.rag.vector_store import QueryHit
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 常量
+# ============================================================
+
+KEYWORD_INDEX_FILE = "keyword_index.json"
+KEYWORD_INDEX_VERSION = 1
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+RRF_K = 60                    # 倒数排名融合常数
+
+_ASCII_TOKEN_PATTERN = re.compile(r"\.?[0-9a-z_]+")
+_CJK_RUN_PATTERN = re.compile(r"[\u4e00-\u9fff]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """把文本切分为检索词（查询与文档使用同一规则）"""
+    lowered = text.lower()
+    tokens = _ASCII_TOKEN_PATTERN.findall(lowered)
+    for run in _CJK_RUN_PATTERN.findall(lowered):
+        tokens.extend(run)
+        tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+# ============================================================
+# KeywordIndex
+# ============================================================
+
+class KeywordIndex:
+    """
+    chunk 级 BM25 倒排索引（线程安全）
+
+    文档以 chunk_id 为键，元数据字段与 VectorStore 写入 ChromaDB 的
+    metadatas 相同。
+    """
+
+    def __init__(self, storage_path: Optional[str] = None):
+        self._storage_path = storage_path
+        self._lock = threading.RLock()
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._term_freqs: Dict[str, Counter] = {}
+        self._lengths: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._file_chunks: Dict[str, List[str]] = defaultdict(list)
+        self._total_length = 0
+        self._dirty = False
+
+    # --------------------------------------------------------
+    # 写操作
+    # --------------------------------------------------------
+
+    def upsert_file(self, rel_path: str, chunks: Iterable[Any]) -> None:
+        """替换文件的全部 chunk（与 VectorStore.upsert_file 对应）"""
+        with self._lock:
+            self._remove_file(rel_path)
+            for chunk in chunks:
+                self._add(chunk.chunk_id, {
+                    "content": chunk.content,
+                    "file_path": chunk.file_path,
+                    "chunk_index": chunk.chunk_index,
+                    "file_type": chunk.file_type,
+                    "symbol_name": chunk.symbol_name,
+                })
+            self._dirty = True
+
+    def delete_file(self, rel_path: str) -> None:
+        with self._lock:
+            if self._remove_file(rel_path):
+                self._dirty = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._docs.clear()
+            self._term_freqs.clear()
+            self._lengths.clear()
+            self._postings.clear()
+            self._file_chunks.clear()
+            self._total_length = 0
+            self._dirty = True
+
+    def rebuild(self, documents: Iterable[Dict[str, Any]]) -> None:
+        """用 {"chunk_id", "content", 元数据...} 序列整体重建"""
+        with self._lock:
+            self.clear()
+            for document in documents:
+                document = dict(document)
+                self._add(document.pop("chunk_id"), document)
+
+    def _add(self, chunk_id: str, document: Dict[str, Any]) -> None:
+        term_freqs = Counter(tokenize(document.get("content", "")))
+        symbol_name = document.get("symbol_name") or ""
+        if symbol_name and not symbol_name.startswith("<"):
+            term_freqs.update(tokenize(symbol_name))
+        length = sum(term_freqs.values())
+
+        self._docs[chunk_id] = document
+        self._term_freqs[chunk_id] = term_freqs
+        self._lengths[chunk_id] = length
+        self._total_length += length
+        for term, freq in term_freqs.items():
+            self._postings[term][chunk_id] = freq
+        self._file_chunks[document.get("file_path", "")].append(chunk_id)
+
+    def _remove_file(self, rel_path: str) -> bool:
+        chunk_ids = self._file_chunks.pop(rel_path, None)
+        if not chunk_ids:
+            return False
+        for chunk_id in chunk_ids:
+            self._docs.pop(chunk_id, None)
+            self._total_length -= self._lengths.pop(chunk_id, 0)
+            for term in self._term_freqs.pop(chunk_id, ()):
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(chunk_id, None)
+                    if not postings:
+                        del self._postings[term]
+        return True
+
+    # --------------------------------------------------------
+    # 查询
+    # --------------------------------------------------------
+
+    def search(self, query_text: str, top_k: int = 10) -> List[QueryHit]:
+        """
+        BM25 检索
+
+        Returns:
+            按 BM25 分数降序的 QueryHit 列表（无命中词时为空）
+        """
+        terms = set(tokenize(query_text))
+        with self._lock:
+            doc_count = len(self._docs)
+            if not terms or doc_count == 0:
+                return []
+            avg_length = self._total_length / doc_count or 1.0
+
+            scores: Dict[str, float] = defaultdict(float)
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1.0 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for chunk_id, freq in postings.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[chunk_id] / avg_length)
+                    scores[chunk_id] += idf * freq * (BM25_K1 + 1) / (freq + norm)
+
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+            return [self._to_hit(chunk_id, score) for chunk_id, score in ranked]
+
+    def _to_hit(self, chunk_id: str, score: float) -> QueryHit:
+        document = self._docs[chunk_id]
+        return QueryHit(
+            content=document.get("content", ""),
+            file_path=document.get("file_path", ""),
+            score=score,
+            symbol_name=document.get("symbol_name", ""),
+            chunk_index=int(document.get("chunk_index", 0)),
+            file_type=document.get("file_type", ""),
+        )
+
+    # --------------------------------------------------------
+    # 状态与持久化
+    # --------------------------------------------------------
+
+    def chunk_ids(self) -> set:
+        with self._lock:
+            return set(self._docs)
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._docs)
+
+    def load(self) -> bool:
+        """从磁盘加载；文件缺失或版本不符时返回 False"""
+        if not self._storage_path or not os.path.isfile(self._storage_path):
+            return False
+        try:
+            with open(self._storage_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != KEYWORD_INDEX_VERSION:
+                return False
+            documents = data.get("documents", {})
+            self.rebuild({"chunk_id": chunk_id, **doc} for chunk_id, doc in documents.items())
+            with self._lock:
+                self._dirty = False
+            return True
+        except Exception as exc:
+            logger.warning(f"Failed to load keyword index: {exc}")
+            return False
+
+    def save(self) -> None:
+        """有未保存的变更时写盘（临时文件 + 原子替换）"""
+        if not self._storage_path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = {"version": KEYWORD_INDEX_VERSION, "documents": dict(self._docs)}
+            self._dirty = False
+        tmp_path = f"{self._storage_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._storage_path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, self._storage_path)
+        except Exception as exc:
+            with self._lock:
+                self._dirty = True
+            logger.error(f"Failed to save keyword index: {exc}")
+
+
+# ============================================================
+# 融合
+# ============================================================
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[List[QueryHit]],
+    top_k: int,
+    k: int = RRF_K,
+) -> List[QueryHit]:
+    """
+    倒数排名融合（RRF）
+
+    同一 chunk（file_path + chunk_index）在各路排序中的得分为
+    Σ 1 / (k + rank)，只依赖名次，不需要对齐 BM25 与余弦分数的量纲。
+
+    Returns:
+        按融合分数降序的 QueryHit 列表，score 为融合分数
+    """
+    fused: Dict[tuple, float] = defaultdict(float)
+    first_seen: Dict[tuple, QueryHit] = {}
+    for ranking in rankings:
+        for rank, hit in enumerate(ranking, start=1):
+            key = (hit.file_path, hit.chunk_index)
+            fused[key] += 1.0 / (k + rank)
+            first_seen.setdefault(key, hit)
+
+    ordered = sorted(fused.items(), key=lambda item: item[1], reverse=True)[:top_k]
+    results: List[QueryHit] = []
+    for key, score in ordered:
+        hit = first_seen[key]
+        results.append(QueryHit(
+            content=hit.content,
+            file_path=hit.file_path,
+            score=score,
+            symbol_name=hit.symbol_name,
+            chunk_index=hit.chunk_index,
+            file_type=hit.file_type,
+        ))
+    return results
+
+
+__all__ = [
+    "KEYWORD_INDEX_FILE",
+    "RRF_K",
+    "KeywordIndex",
+    "reciprocal_rank_fusion",
+    "tokenize",
+]
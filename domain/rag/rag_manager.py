@@ -11,7 +11,9 @@ RAG 业务逻辑管理器
 - 项目生命周期联动（订阅 PROJECT_OPENED / PROJECT_CLOSED）
 - 项目打开时初始化 VectorStore + Embedder 并增量索引
 - 项目文件扫描与索引（全量/增量/单文件）
-- 查询接口（供 rag_search 工具调用）
+- 查询接口（供 rag_search 工具调用）：BM25 关键词 + 向量检索，
+  倒数排名融合；符号类查询（器件型号、SPICE 指令）命中关键词索引时
+  跳过 embedding 调用；查询向量按 LRU 缓存
 - 索引状态管理（index_meta.json）
 - 增量更新：mtime 对比 + 已删除文件清理
 - 通过 EventBus 发布 RAG 事件
@@ -27,8 +29,10 @@ import asyncio
 import json
 import logging
 import os
+import re
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -36,6 +40,7 @@ from typing import Any, Dict, List, Optional, Set
 
 from domain.rag.chunker import chunk_file
 from domain.rag.embedder import Embedder
+from domain.rag.keyword_index import reciprocal_rank_fusion
 from domain.rag.file_extractor import (
     FileIndexRule,
     INDEX_EXCLUDED_DIR_NAMES,
@@ -50,6 +55,8 @@ from infrastructure.config.settings import (
     DEFAULT_RAG_CONTEXT_TOKEN_BUDGET,
     DEFAULT_VECTOR_STORE_DIR,
 )
+from infrastructure.utils.http_client_pool import get_http_client_registry
+from shared.constants.paths import EMBEDDING_CONFIG_FILE
 from shared.event_types import (
     EVENT_RAG_INIT_COMPLETE,
     EVENT_RAG_INDEX_STARTED,
@@ -64,6 +71,27 @@ from shared.event_types import (
 
 logger = logging.getLogger(__name__)
 
+# 全量索引时同时处理的文件数（嵌入请求并发由 Embedder 控制）
+_INDEX_FILES_IN_FLIGHT = 8
+
+# 混合检索：每一路取 top_k 的倍数作为融合候选
+_HYBRID_CANDIDATE_FACTOR = 3
+# 查询向量 LRU 缓存条数
+_QUERY_VECTOR_CACHE_SIZE = 256
+# 符号类检索词：SPICE 指令（.model）、含数字的型号 / 位号（LT1001、2N3904、R12）、节点（V(out)）
+_SYMBOL_TERM_PATTERN = re.compile(
+    r"^(?:\.[A-Za-z]\w*|[A-Za-z_]*\d[\w.+\-/]*|[A-Za-z_]\w*\([\w.+\-]*\))$"
+)
+_SYMBOL_QUERY_MAX_TERMS = 4
+
+
+def _is_symbol_query(query_text: str) -> bool:
+    """查询是否只由少量符号类检索词组成（此类查询不需要语义向量）"""
+    terms = query_text.split()
+    return 0 < len(terms) <= _SYMBOL_QUERY_MAX_TERMS and all(
+        _SYMBOL_TERM_PATTERN.match(term) for term in terms
+    )
+
 
 # ============================================================
 # 文件扫描规则
@@ -76,6 +104,7 @@ EXCLUDED_DIRS: Set[str] = {
 }
 
 INDEX_META_FILE = "index_meta.json"
+_LEGACY_EMBEDDING_MODEL = "zhipu:embedding-3"   # 未记录 embedding_model 的旧索引
 
 
 # ============================================================
@@ -180,6 +209,9 @@ class RAGManager:
         self._subscribed = False
         # 后台工作线程：索引和查询在此线程运行，避免阻塞 Qt UI
         self._worker = RAGWorkerThread()
+        # 查询向量缓存：(embedding 模型, 查询文本) → 向量
+        self._query_vectors: "OrderedDict[tuple, List[float]]" = OrderedDict()
+        self._query_vectors_lock = threading.Lock()
 
     @property
     def is_available(self) -> bool:
@@ -278,6 +310,7 @@ class RAGManager:
 
             if self._embedder is None:
                 self._embedder = Embedder()
+            self._embedder.set_project_config(self._load_project_embedding_config())
 
             # 初始化 VectorStore（ChromaDB，同步，~100ms）
             self._vector_store = VectorStore(
@@ -295,6 +328,8 @@ class RAGManager:
             })
 
             self._load_index_meta()
+            self._check_index_embedding_model()
+            self._embedder.warm_up()
             self._safe_index_project()
 
         except Exception as e:
@@ -306,6 +341,36 @@ class RAGManager:
                 "error": f"RAG 自动初始化失败: {e}",
             })
 
+    def _load_project_embedding_config(self) -> Optional[Dict[str, Any]]:
+        """读取项目级嵌入配置覆盖（文件缺失或无效时返回 None）"""
+        path = os.path.join(self._project_root, EMBEDDING_CONFIG_FILE)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else None
+        except Exception as e:
+            logger.warning(f"Failed to load project embedding config: {e}")
+            return None
+
+    def _check_index_embedding_model(self) -> None:
+        """
+        索引由其他嵌入模型生成时清空重建（向量维度与语义空间不可混用）
+
+        早期的 index_meta 未记录模型，按当时唯一支持的智谱默认模型处理。
+        """
+        model_id = self._embedder.model_id
+        with self._meta_lock:
+            indexed_model = self._index_meta.get("embedding_model")
+            if not indexed_model and self._index_meta.get("files"):
+                indexed_model = _LEGACY_EMBEDDING_MODEL
+        if indexed_model and indexed_model != model_id:
+            logger.info(f"Embedding model changed ({indexed_model} -> {model_id}), rebuilding RAG index")
+            self.clear_index()
+        with self._meta_lock:
+            self._index_meta["embedding_model"] = model_id
+
     def _on_project_closed(self, event_data) -> None:
         """
         项目关闭事件处理（同步入口）
@@ -370,34 +435,8 @@ class RAGManager:
                 "track_id": self._current_track_id,
             })
 
-            processed = 0
-            failed = 0
-
-            for i, (rel_path, abs_path) in enumerate(files_to_index):
-                try:
-                    self._publish_event(EVENT_RAG_INDEX_PROGRESS, {
-                        "processed": i,
-                        "total": total,
-                        "current_file": rel_path,
-                        "track_id": self._current_track_id,
-                    })
-
-                    self._index_single_file_internal(rel_path, abs_path)
-                    processed += 1
-
-                except Exception as e:
-                    failed += 1
-                    logger.error(f"Failed to index {rel_path}: {e}")
-                    self._publish_event(EVENT_RAG_INDEX_ERROR, {
-                        "file_path": rel_path,
-                        "error": str(e),
-                        "track_id": self._current_track_id,
-                    })
-                    # 记录失败状态
-                    self._update_file_meta(rel_path, {
-                        "status": "failed",
-                        "error": str(e),
-                    })
+            # 工作线程内开临时事件循环，多个文件的嵌入批次并发在途
+            processed, failed = asyncio.run(self._index_files_async(files_to_index))
 
             duration = time.time() - start_time
             self._save_index_meta()
@@ -455,6 +494,56 @@ class RAGManager:
         except Exception as e:
             logger.error(f"Failed to index single file {rel_path}: {e}")
 
+    async def _index_files_async(self, files_to_index: List[tuple]) -> tuple:
+        """
+        并发索引一组文件（在工作线程的临时事件循环中运行）
+
+        同时处理的文件数为 _INDEX_FILES_IN_FLIGHT，嵌入请求的并发与
+        限速由 Embedder 统一控制；单个文件失败不影响其他文件。
+
+        Returns:
+            (成功数, 失败数)
+        """
+        total = len(files_to_index)
+        gate = asyncio.Semaphore(_INDEX_FILES_IN_FLIGHT)
+        counters = {"processed": 0, "failed": 0}
+
+        async def index_one(rel_path: str, abs_path: str) -> None:
+            async with gate:
+                self._publish_event(EVENT_RAG_INDEX_PROGRESS, {
+                    "processed": counters["processed"] + counters["failed"],
+                    "total": total,
+                    "current_file": rel_path,
+                    "track_id": self._current_track_id,
+                })
+                try:
+                    prepared = self._prepare_file_chunks(rel_path, abs_path)
+                    if prepared is not None:
+                        chunks, stat = prepared
+                        vectors = await self._embedder.embed_texts_async([c.content for c in chunks])
+                        self._store_file_chunks(rel_path, chunks, vectors, stat)
+                    counters["processed"] += 1
+                except Exception as e:
+                    counters["failed"] += 1
+                    logger.error(f"Failed to index {rel_path}: {e}")
+                    self._publish_event(EVENT_RAG_INDEX_ERROR, {
+                        "file_path": rel_path,
+                        "error": str(e),
+                        "track_id": self._current_track_id,
+                    })
+                    # 记录失败状态
+                    self._update_file_meta(rel_path, {
+                        "status": "failed",
+                        "error": str(e),
+                    })
+
+        try:
+            await asyncio.gather(*(index_one(rel_path, abs_path) for rel_path, abs_path in files_to_index))
+        finally:
+            # 临时事件循环即将关闭，释放绑定在它上面的连接
+            await get_http_client_registry().aclose_loop_clients()
+        return counters["processed"], counters["failed"]
+
     def _index_single_file_internal(
         self, rel_path: str, abs_path: str
     ) -> None:
@@ -462,17 +551,28 @@ class RAGManager:
 
         流程：读取内容 → 分块 → Embedding → upsert 到 VectorStore
         """
+        prepared = self._prepare_file_chunks(rel_path, abs_path)
+        if prepared is None:
+            return
+        chunks, stat = prepared
+        vectors = self._embedder.embed_texts([c.content for c in chunks])
+        self._store_file_chunks(rel_path, chunks, vectors, stat)
+
+    def _prepare_file_chunks(self, rel_path: str, abs_path: str) -> Optional[tuple]:
+        """读取并分块；无可索引内容时返回 None，否则返回 (chunks, stat)"""
         content = extract_indexable_content(abs_path)
         if not content.strip():
-            return
+            return None
 
         stat = os.stat(abs_path)
 
         chunks = chunk_file(content, rel_path)
         if not chunks:
-            return
+            return None
+        return chunks, stat
 
-        vectors = self._embedder.embed_texts([c.content for c in chunks])
+    def _store_file_chunks(self, rel_path: str, chunks: list, vectors: list, stat: os.stat_result) -> None:
+        """upsert 到 VectorStore 并更新索引元数据"""
         self._vector_store.upsert_file(rel_path, chunks, vectors)
 
         self._update_file_meta(rel_path, {
@@ -505,17 +605,69 @@ class RAGManager:
         if not self.is_available:
             return RAGQueryResult(error="Index library is unavailable")
 
-        vector = self._embedder.embed_single(query_text)
-        hits = self._vector_store.query(vector, top_k=top_k)
-        result = RAGQueryResult(hits=hits)
+        keyword_hits = self._keyword_query(query_text, top_k)
+        if keyword_hits and _is_symbol_query(query_text):
+            return self._complete_query(query_text, keyword_hits[:top_k], "keyword")
+
+        cache_key = self._query_vector_key(query_text)
+        vector = self._get_cached_query_vector(cache_key)
+        if vector is None:
+            vector = self._embedder.embed_single(query_text)
+            self._cache_query_vector(cache_key, vector)
+        return self._query_by_vector(query_text, vector, top_k, keyword_hits)
 
+    def _keyword_query(self, query_text: str, top_k: int) -> list:
+        """BM25 候选（本地倒排索引，不调用 embedding）"""
+        if self._vector_store is None:
+            return []
+        return self._vector_store.keyword_query(query_text, top_k=top_k * _HYBRID_CANDIDATE_FACTOR)
+
+    def _query_by_vector(
+        self,
+        query_text: str,
+        vector: List[float],
+        top_k: int,
+        keyword_hits: Optional[list] = None,
+    ) -> RAGQueryResult:
+        """向量检索并与 BM25 候选做倒数排名融合"""
+        vector_hits = self._vector_store.query(vector, top_k=top_k * _HYBRID_CANDIDATE_FACTOR)
+        hits = reciprocal_rank_fusion([vector_hits, keyword_hits or []], top_k)
+        return self._complete_query(query_text, hits, "hybrid")
+
+    def _complete_query(self, query_text: str, hits: list, mode: str) -> RAGQueryResult:
+        """发布查询完成事件并包装结果"""
         self._publish_event(EVENT_RAG_QUERY_COMPLETE, {
             "query": query_text[:100],
             "results_count": len(hits),
             "chunks_found": len(hits),
+            "mode": mode,
         })
+        return RAGQueryResult(hits=hits)
 
-        return result
+    # ------------------------------------------------------------
+    # 查询向量缓存
+    # ------------------------------------------------------------
+
+    def _query_vector_key(self, query_text: str) -> tuple:
+        try:
+            model_name = self._embedder.model_name
+        except Exception:
+            model_name = ""
+        return model_name, query_text.strip()
+
+    def _get_cached_query_vector(self, key: tuple) -> Optional[List[float]]:
+        with self._query_vectors_lock:
+            vector = self._query_vectors.get(key)
+            if vector is not None:
+                self._query_vectors.move_to_end(key)
+            return vector
+
+    def _cache_query_vector(self, key: tuple, vector: List[float]) -> None:
+        with self._query_vectors_lock:
+            self._query_vectors[key] = vector
+            self._query_vectors.move_to_end(key)
+            while len(self._query_vectors) > _QUERY_VECTOR_CACHE_SIZE:
+                self._query_vectors.popitem(last=False)
 
     # ============================================================
     # Qt 主线程入口方法（同步触发，工作在后台线程）
@@ -551,8 +703,10 @@ class RAGManager:
         """
         从 Qt 主线程异步查询知识库
 
-        将 query() 提交到工作线程执行，通过 asyncio.wrap_future()
-        让 Qt 主线程的协程可以 await 结果，同时不阻塞 UI。
+        BM25 候选与向量检索（ChromaDB 同步调用）在工作线程执行，通过
+        asyncio.wrap_future() 等待；符号类查询命中关键词索引时直接返回。
+        查询向量先查 LRU 缓存，未命中时通过 Embedder.embed_texts_async()
+        在当前事件循环上非阻塞生成。
 
         Args:
             query_text: 查询文本
@@ -564,8 +718,22 @@ class RAGManager:
         if not self.is_available:
             return RAGQueryResult(error="Index library is unavailable")
 
+        keyword_future = self._worker.submit(self._keyword_query, query_text, top_k)
+        if keyword_future is None:
+            return RAGQueryResult(error="Index library worker is not running")
+        keyword_hits = await asyncio.wrap_future(keyword_future)
+        if keyword_hits and _is_symbol_query(query_text):
+            return self._complete_query(query_text, keyword_hits[:top_k], "keyword")
+
+        cache_key = self._query_vector_key(query_text)
+        vector = self._get_cached_query_vector(cache_key)
+        if vector is None:
+            vectors = await self._embedder.embed_texts_async([query_text])
+            vector = vectors[0]
+            self._cache_query_vector(cache_key, vector)
+
         future = self._worker.submit(
-            self.query, query_text, top_k
+            self._query_by_vector, query_text, vector, top_k, keyword_hits
         )
         if future is None:
             return RAGQueryResult(error="Index library worker is not running")
@@ -634,12 +802,15 @@ class RAGManager:
             self._vector_store.clear()
 
         with self._meta_lock:
+            embedding_model = self._index_meta.get("embedding_model")
             self._index_meta = {
                 "version": 1,
                 "project_root": self._project_root,
                 "files": {},
                 "stats": {},
             }
+            if embedding_model:
+                self._index_meta["embedding_model"] = embedding_model
         self._save_index_meta()
         logger.info("RAG index cleared")
 
@@ -860,6 +1031,10 @@ class RAGManager:
         except Exception as e:
             logger.error(f"Failed to save index meta: {e}")
 
+        # 关键词索引与 index_meta 同一时机落盘，保证增量索引判断一致
+        if self._vector_store is not None:
+            self._vector_store.save_keyword_index()
+
     def _update_file_meta(self, rel_path: str, data: Dict[str, Any]) -> None:
         """更新单文件的 meta 信息（线程安全）"""
         with self._meta_lock:
@@ -7,6 +7,8 @@ ChromaDB 向量存储封装
 - 每个项目使用独立 Collection（基于项目路径 MD5 命名）
 - 提供 chunk 级别的 upsert / delete / query 接口
 - 定义 RAGQueryResult（向量检索结果）
+- 维护同一批 chunk 的 BM25 关键词索引（keyword_index.py），
+  写操作与 ChromaDB 同步执行
 
 存储路径：{project_root}/.circuit_ai/vector_store/
 """
@@ -106,6 +108,9 @@ class VectorStore:
         path_hash = hashlib.md5(self._project_root.encode("utf-8")).hexdigest()[:12]
         self._collection_name = f"project_{path_hash}"
 
+        from domain.rag.keyword_index import KEYWORD_INDEX_FILE, KeywordIndex
+        self._keyword_index = KeywordIndex(os.path.join(self._storage_path, KEYWORD_INDEX_FILE))
+
     # ============================================================
     # 初始化
     # ============================================================
@@ -130,6 +135,7 @@ class VectorStore:
                 f"VectorStore initialized: collection={self._collection_name}, "
                 f"docs={self._collection.count()}"
             )
+            self._load_keyword_index()
         except ImportError as exc:
             raise ImportError(
                 "chromadb is not installed. Run: pip install chromadb"
@@ -137,6 +143,28 @@ class VectorStore:
         except Exception as exc:
             raise RuntimeError(f"VectorStore initialization failed: {exc}") from exc
 
+    def _load_keyword_index(self) -> None:
+        """加载关键词索引；与 ChromaDB 的 chunk 集合不一致时从 ChromaDB 重建"""
+        loaded = self._keyword_index.load()
+        try:
+            stored = self._collection.get(include=[])
+            stored_ids = set(stored.get("ids", []))
+            if loaded and stored_ids == self._keyword_index.chunk_ids():
+                return
+            records = self._collection.get(include=["documents", "metadatas"])
+            self._keyword_index.rebuild(
+                {"chunk_id": chunk_id, "content": doc or "", **(meta or {})}
+                for chunk_id, doc, meta in zip(
+                    records.get("ids", []),
+                    records.get("documents", []),
+                    records.get("metadatas", []),
+                )
+            )
+            self._keyword_index.save()
+            logger.info(f"Keyword index rebuilt from collection: {self._keyword_index.count()} chunks")
+        except Exception as exc:
+            logger.warning(f"Keyword index rebuild failed: {exc}")
+
     @property
     def is_initialized(self) -> bool:
         return self._collection is not None
@@ -166,6 +194,7 @@ class VectorStore:
         self._delete_by_file(rel_path)
 
         if not chunks:
+            self._keyword_index.delete_file(rel_path)
             return
 
         ids       = [c.chunk_id for c in chunks]
@@ -187,8 +216,10 @@ class VectorStore:
                 embeddings=vectors,
                 metadatas=metadatas,
             )
+            self._keyword_index.upsert_file(rel_path, chunks)
             logger.debug(f"Upserted {len(chunks)} chunks for {rel_path}")
         except Exception as exc:
+            self._keyword_index.delete_file(rel_path)
             logger.error(f"Failed to upsert chunks for {rel_path}: {exc}")
 
     def delete_file(self, rel_path: str) -> None:
@@ -196,6 +227,7 @@ class VectorStore:
         if not self._collection:
             return
         self._delete_by_file(rel_path)
+        self._keyword_index.delete_file(rel_path)
 
     def _delete_by_file(self, rel_path: str) -> None:
         try:
@@ -220,6 +252,8 @@ class VectorStore:
                 name=self._collection_name,
                 metadata={"hnsw:space": "cosine"},
             )
+            self._keyword_index.clear()
+            self._keyword_index.save()
             logger.info(f"VectorStore collection cleared: {self._collection_name}")
         except Exception as exc:
             logger.error(f"Failed to clear VectorStore: {exc}")
@@ -278,6 +312,21 @@ class VectorStore:
 
         return sorted(hits, key=lambda h: h.score, reverse=True)
 
+    def keyword_query(self, query_text: str, top_k: int = 10) -> List[QueryHit]:
+        """
+        BM25 关键词检索（本地倒排索引，不调用 embedding）
+
+        Returns:
+            按 BM25 分数降序排列的 QueryHit 列表
+        """
+        if not self._collection:
+            return []
+        return self._keyword_index.search(query_text, top_k=top_k)
+
+    def save_keyword_index(self) -> None:
+        """持久化关键词索引（与 index_meta.json 同时保存）"""
+        self._keyword_index.save()
+
     # ============================================================
     # 状态查询
     # ============================================================
@@ -45,28 +45,29 @@ def _estimate_tokens_fast(text: str) -> int:
     return max(1, len(text) // CHARS_PER_TOKEN_ESTIMATE)
 
 
-def _estimate_tokens_precise(text: str) -> int:
+def _count_tokens_precise(texts: List[str]) -> List[int]:
     """
-    精确估算文本的 Token 数量
+    批量精确计算多段文本的 Token 数量
     
-    委托给 token_counter 模块，若不可用则回退到快速估算。
+    委托给 token_counter 的批量计数（一次解析 tokenizer，一次批量编码），
+    若不可用则回退到快速估算。
     仅用于截断后的结果，此时文本已经很短。
     
     Args:
-        text: 输入文本
+        texts: 输入文本列表
         
     Returns:
-        int: 估算的 Token 数
+        List[int]: 与输入顺序一致的 Token 数
     """
-    if not text:
-        return 0
+    if not texts:
+        return []
     
     try:
-        from domain.llm.token_counter import estimate_tokens
-        return estimate_tokens(text)
+        from domain.llm.token_counter import count_tokens_many
+        return count_tokens_many(texts)
     except ImportError:
         # 回退到快速估算
-        return _estimate_tokens_fast(text)
+        return [_estimate_tokens_fast(text) for text in texts]
 
 
 class TokenBudgetAllocator:
@@ -77,8 +78,8 @@ class TokenBudgetAllocator:
     确保返回给 LLM 的上下文不会超出限制。
     
     性能优化：
-    - 截断判断阶段使用字符数快速估算（O(1)）
-    - 仅对截断后的结果调用精确 tokenizer
+    - 单条截断判断使用字符数快速估算（O(1)）
+    - 截断后的候选结果一次批量精确编码，总预算按精确 Token 数扣减
     - 无论输入文本多大，截断操作始终是 O(1) 的
     """
     
@@ -152,36 +153,21 @@ class TokenBudgetAllocator:
         if not results:
             return [], 0
         
-        budget = self.config.exact_budget
-        allocated = []
-        tokens_used = 0
-        
+        # 超长的单条结果按字符估算截断（O(1)）
         for result in results:
-            # 使用快速估算判断是否需要截断
             result_text = self._format_exact_result(result)
-            result_tokens = _estimate_tokens_fast(result_text)
-            
-            # 检查是否超出单条结果限制
-            if result_tokens > self.config.max_result_tokens:
-                # 截断内容
-                if result.line_content:
-                    truncated, _ = self.truncate_text(
-                        result.line_content,
-                        self.config.max_result_tokens // 2
-                    )
-                    result.line_content = truncated
-                result_tokens = self.config.max_result_tokens
-            
-            # 检查是否超出总预算
-            if tokens_used + result_tokens > budget:
-                break
-            
-            # 对截断后的结果使用精确计数
-            result.token_count = _estimate_tokens_precise(self._format_exact_result(result))
-            allocated.append(result)
-            tokens_used += result.token_count
+            if _estimate_tokens_fast(result_text) > self.config.max_result_tokens and result.line_content:
+                truncated, _ = self.truncate_text(
+                    result.line_content,
+                    self.config.max_result_tokens // 2
+                )
+                result.line_content = truncated
         
-        return allocated, tokens_used
+        # 整批精确计数后再套用总预算（字符估算会低估中文 3-4 倍）
+        precise_counts = _count_tokens_precise(
+            [self._format_exact_result(result) for result in results]
+        )
+        return self._apply_budget(results, precise_counts, self.config.exact_budget)
     
     def allocate_semantic_results(
         self,
@@ -199,33 +185,35 @@ class TokenBudgetAllocator:
         if not results:
             return [], 0
         
-        budget = self.config.semantic_budget
-        allocated = []
-        tokens_used = 0
-        
+        # 超长的单条结果按字符估算截断（O(1)）
         for result in results:
-            # 使用快速估算判断是否需要截断
-            result_tokens = _estimate_tokens_fast(result.content)
-            
-            # 检查是否超出单条结果限制
-            if result_tokens > self.config.max_result_tokens:
-                # 截断内容
+            if _estimate_tokens_fast(result.content) > self.config.max_result_tokens:
                 truncated, _ = self.truncate_text(
                     result.content,
                     self.config.max_result_tokens
                 )
                 result.content = truncated
-                result_tokens = self.config.max_result_tokens
-            
-            # 检查是否超出总预算
-            if tokens_used + result_tokens > budget:
+        
+        # 整批精确计数后再套用总预算（字符估算会低估中文 3-4 倍）
+        precise_counts = _count_tokens_precise([result.content for result in results])
+        return self._apply_budget(results, precise_counts, self.config.semantic_budget)
+    
+    @staticmethod
+    def _apply_budget(results: list, token_counts: List[int], budget: int) -> Tuple[list, int]:
+        """
+        按精确 Token 数依次接纳结果，直到超出预算
+        
+        Returns:
+            Tuple[list, int]: (接纳的结果, 使用的 Token 数)
+        """
+        allocated = []
+        tokens_used = 0
+        for result, token_count in zip(results, token_counts):
+            if tokens_used + token_count > budget:
                 break
-            
-            # 对截断后的结果使用精确计数
-            result.token_count = _estimate_tokens_precise(result.content)
+            result.token_count = token_count
             allocated.append(result)
-            tokens_used += result.token_count
-        
+            tokens_used += token_count
         return allocated, tokens_used
     
     def _format_exact_result(self, result: ExactMatchResult) -> str:
@@ -33,11 +33,22 @@
     
     # 仅文档搜索
     result = search_service.search("low-pass filter", scope=SearchScope.DOCS)
+
+结果缓存：
+- 键为 (小写查询, scope, max_results, 文件类型, Token 预算, 索引代数)；
+  查询只做小写化——内容搜索与符号搜索均不区分大小写，而空白参与字面匹配
+- 索引代数由 FileSearchService 在整体重建、目录级增删时递增，旧代数的条目自然失效
+- 文件级变更（EVENT_FILE_CHANGED）在主线程只登记，下次 search() 时精确失效：
+  结果中包含该文件的条目，以及新内容命中其查询的条目
+- 未接入事件总线时不缓存（无法感知失效）
 """
 
+import threading
 import time
+from collections import OrderedDict
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from domain.search.models.unified_search_result import (
     UnifiedSearchResult,
@@ -60,23 +71,52 @@ class UnifiedSearchService:
     注意：单文件搜索由 InFileSearchService 负责。
     """
     
+    # 结果缓存条目上限
+    RESULT_CACHE_SIZE = 128
+    
+    # 文件监听事件类型到变更操作的映射（与 FileSearchService 一致）
+    _WATCHER_OPERATIONS = {
+        "created": "create",
+        "modified": "update",
+        "deleted": "delete",
+    }
+    
     def __init__(
         self,
-        token_budget_config: TokenBudgetConfig = None
+        token_budget_config: TokenBudgetConfig = None,
+        cache_size: int = RESULT_CACHE_SIZE
     ):
         """
         初始化统一搜索服务
         
         Args:
             token_budget_config: Token 预算配置
+            cache_size: 结果缓存条目上限（0 表示不缓存）
         """
         self._token_config = token_budget_config or TokenBudgetConfig()
         self._merger = SearchResultMerger()
         self._allocator = TokenBudgetAllocator(self._token_config)
         
+        # 结果缓存：key -> _CacheEntry（LRU 顺序）
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[tuple, _CacheEntry]" = OrderedDict()
+        self._cache_lock = threading.RLock()
+        # 待处理的文件变更 (absolute_path, operation)，由事件处理器登记
+        self._pending_changes: List[Tuple[str, str]] = []
+        # 每登记一次变更递增；搜索期间发生变更则不写入缓存
+        self._change_epoch = 0
+        self._cache_stats = {
+            "hits": 0,
+            "misses": 0,
+            "invalidated": 0,
+            "saved_ms": 0.0,
+        }
+        
         # 延迟获取的服务
         self._file_search_service = None
         # 语义搜索由 RAGManager.query_async() 提供（通过 rag_search 工具按需调用）
+        self._event_bus = None
+        self._subscribed = False
         self._logger = None
     
     # ============================================================
@@ -102,6 +142,18 @@ class UnifiedSearchService:
         """语义搜索由 rag_search 工具按需触发，本属性保留为兼容占位符"""
         return None
     
+    @property
+    def event_bus(self):
+        """延迟获取事件总线"""
+        if self._event_bus is None:
+            try:
+                from shared.service_locator import ServiceLocator
+                from shared.service_names import SVC_EVENT_BUS
+                self._event_bus = ServiceLocator.get_optional(SVC_EVENT_BUS)
+            except Exception:
+                pass
+        return self._event_bus
+    
     @property
     def logger(self):
         """延迟获取日志器"""
@@ -152,6 +204,15 @@ class UnifiedSearchService:
         if token_budget:
             self._allocator.config.total_budget = token_budget
         
+        # 查询结果缓存
+        cache_key = None
+        if self._cache_enabled():
+            cache_key = self._make_cache_key(query, scope, max_results, file_types)
+            cached = self._cache_lookup(cache_key, query, start_time)
+            if cached is not None:
+                return cached
+            epoch = self._change_epoch
+        
         # 根据 scope 执行搜索
         exact_results: List[ExactMatchResult] = []
         semantic_results: List[SemanticMatchResult] = []
@@ -208,6 +269,9 @@ class UnifiedSearchService:
                 f"time={search_time:.0f}ms"
             )
         
+        if cache_key is not None:
+            self._cache_store(cache_key, result, file_types, epoch)
+        
         return result
     
     # ============================================================
@@ -244,7 +308,7 @@ class UnifiedSearchService:
             for r in content_results:
                 for match in r.matches[:3]:  # 每个文件最多取3个匹配
                     results.append(ExactMatchResult(
-                        file_path=r.relative_path,
+                        file_path=r.path,
                         file_name=r.file_name,
                         match_type="content",
                         score=r.score,
@@ -266,7 +330,7 @@ class UnifiedSearchService:
                     symbols = r.metadata.get("symbols", [])
                     for symbol in symbols[:2]:  # 每个文件最多取2个符号
                         results.append(ExactMatchResult(
-                            file_path=r.relative_path,
+                            file_path=r.path,
                             file_name=r.file_name,
                             match_type="symbol",
                             score=r.score,
@@ -304,6 +368,184 @@ class UnifiedSearchService:
         
         return results[:max_results], total
     
+    # ============================================================
+    # 结果缓存
+    # ============================================================
+    
+    def _cache_enabled(self) -> bool:
+        """缓存依赖文件变更事件失效，未接入事件总线时不缓存"""
+        if self._cache_size <= 0:
+            return False
+        self._subscribe_file_events()
+        return self._subscribed
+    
+    def _subscribe_file_events(self) -> None:
+        """订阅文件变更事件，用于结果缓存失效"""
+        if self._subscribed or self.event_bus is None:
+            return
+        
+        try:
+            from shared.event_types import EVENT_FILE_CHANGED
+            self.event_bus.subscribe(EVENT_FILE_CHANGED, self._on_file_changed)
+            self._subscribed = True
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"订阅文件变更事件失败: {e}")
+    
+    def _on_file_changed(self, event_data: Dict[str, Any]) -> None:
+        """
+        登记文件变更（主线程执行，只记录不计算）
+        
+        目录级变更由 FileSearchService 递增索引代数处理，此处跳过。
+        """
+        data = event_data.get("data") or {}
+        path = data.get("path", "")
+        if not path or data.get("is_directory"):
+            return
+        
+        if data.get("event_type") == "moved":
+            changes = [(path, "delete")]
+            if data.get("dest_path"):
+                changes.append((data["dest_path"], "create"))
+        else:
+            operation = data.get("operation") or self._WATCHER_OPERATIONS.get(
+                data.get("event_type", ""), "update"
+            )
+            changes = [(path, operation)]
+        
+        with self._cache_lock:
+            self._pending_changes.extend(changes)
+            self._change_epoch += 1
+    
+    def _make_cache_key(
+        self,
+        query: str,
+        scope: SearchScope,
+        max_results: int,
+        file_types: Optional[List[str]]
+    ) -> tuple:
+        """构建缓存键（Token 预算取生效值，因为 token_budget 参数会持久修改配置）"""
+        generation = getattr(self.file_search_service, "index_generation", 0)
+        return (
+            query.lower(),
+            scope.value,
+            max_results,
+            tuple(sorted({t.lower() for t in file_types})) if file_types else (),
+            self._allocator.config.total_budget,
+            generation,
+        )
+    
+    def _cache_lookup(
+        self,
+        key: tuple,
+        query: str,
+        start_time: float
+    ) -> Optional[UnifiedSearchResult]:
+        """先应用待处理变更再查缓存；命中时返回副本并累计节省的耗时"""
+        self._apply_pending_changes()
+        
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._cache_stats["misses"] += 1
+                return None
+            self._cache.move_to_end(key)
+            
+            lookup_ms = (time.time() - start_time) * 1000
+            self._cache_stats["hits"] += 1
+            self._cache_stats["saved_ms"] += max(0.0, entry.result.search_time_ms - lookup_ms)
+            return replace(
+                entry.result,
+                query=query,
+                exact_matches=list(entry.result.exact_matches),
+                semantic_matches=list(entry.result.semantic_matches),
+                search_time_ms=lookup_ms,
+            )
+    
+    def _cache_store(
+        self,
+        key: tuple,
+        result: UnifiedSearchResult,
+        file_types: Optional[List[str]],
+        epoch: int
+    ) -> None:
+        """写入缓存；搜索期间有文件变更登记时放弃写入（结果可能已过期）"""
+        files = {m.file_path for m in result.exact_matches}
+        files.update(m.source for m in result.semantic_matches)
+        
+        with self._cache_lock:
+            if epoch != self._change_epoch:
+                return
+            self._cache[key] = _CacheEntry(
+                result=result,
+                files=files,
+                file_types=key[3],
+            )
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+    
+    def _apply_pending_changes(self) -> None:
+        """
+        按登记的文件变更精确失效缓存条目
+        
+        失效条件（任一满足）：
+        - 条目结果中包含该文件
+        - 文件被新建/修改，且其新内容命中条目的查询（可能新增匹配）
+        """
+        with self._cache_lock:
+            if not self._pending_changes:
+                return
+            changes, self._pending_changes = self._pending_changes, []
+            if not self._cache:
+                return
+            entries = list(self._cache.items())
+        
+        service = self.file_search_service
+        stale: Set[tuple] = set()
+        for path, operation in changes:
+            relative_path = service.to_index_path(path) if service else path
+            if relative_path is None:
+                continue
+            
+            remaining = []
+            for key, entry in entries:
+                if relative_path in entry.files:
+                    stale.add(key)
+                else:
+                    remaining.append((key, entry))
+            
+            if operation == "delete" or service is None:
+                entries = remaining
+                continue
+            
+            # 同一查询只读一次文件
+            extension = Path(relative_path).suffix.lower()
+            matched: Dict[str, bool] = {}
+            for key, entry in remaining:
+                if key[1] not in (SearchScope.ALL.value, SearchScope.CODE.value, SearchScope.EXACT.value):
+                    continue
+                if entry.file_types and extension not in entry.file_types:
+                    continue
+                if key[0] not in matched:
+                    matched[key[0]] = service.content_matches(path, key[0])
+                if matched[key[0]]:
+                    stale.add(key)
+            entries = [(k, e) for k, e in remaining if k not in stale]
+        
+        if not stale:
+            return
+        with self._cache_lock:
+            for key in stale:
+                if self._cache.pop(key, None) is not None:
+                    self._cache_stats["invalidated"] += 1
+    
+    def clear_cache(self) -> None:
+        """清空结果缓存"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._pending_changes.clear()
+    
     def _looks_like_symbol(self, query: str) -> bool:
         """
         判断查询是否看起来像符号名
@@ -390,9 +632,33 @@ class UnifiedSearchService:
         if self.file_search_service:
             stats["file_index"] = self.file_search_service.get_index_stats()
         
+        with self._cache_lock:
+            lookups = self._cache_stats["hits"] + self._cache_stats["misses"]
+            stats["cache"] = {
+                "enabled": self._subscribed and self._cache_size > 0,
+                "entries": len(self._cache),
+                "max_entries": self._cache_size,
+                "hits": self._cache_stats["hits"],
+                "misses": self._cache_stats["misses"],
+                "hit_rate": self._cache_stats["hits"] / lookups if lookups else 0.0,
+                "invalidated": self._cache_stats["invalidated"],
+                "saved_ms": round(self._cache_stats["saved_ms"], 2),
+            }
+        
         return stats
 
 
+class _CacheEntry:
+    """结果缓存条目"""
+    
+    __slots__ = ("result", "files", "file_types")
+    
+    def __init__(self, result: UnifiedSearchResult, files: Set[str], file_types: tuple):
+        self.result = result
+        self.files = files
+        self.file_types = file_types
+
+
 # ============================================================
 # 模块导出
 # ============================================================
@@ -18,22 +18,50 @@ primary key for every later interaction:
 - **Request cancellation**: :meth:`request_cancel` (advisory — see
   "Cancellation semantics" below).
 
-Internally the manager owns three pieces of infrastructure:
-
-1. A ``ThreadPoolExecutor`` for concurrent execution. Two jobs
-   targeting *different* circuits run in parallel; the per-job worker
-   still runs its executor + persistence steps sequentially inside one
-   pool thread.
-2. An index of :class:`SimulationJob` instances keyed by ``job_id``.
-   Jobs are kept in the index forever for MVP — Step 5/10 of the
-   roadmap will add a retention policy if the backlog becomes an
-   issue.
+Internally the manager owns four pieces of infrastructure:
+
+0. A :class:`~domain.services.simulation_job_queue.SimulationJobQueue`
+   holding submitted jobs until a worker slot is free. It schedules
+   by origin priority with fair share, coalesces repeated submits for
+   the same circuit and applies per-origin queue-depth limits — see
+   "Scheduling" below.
+1. A ``ThreadPoolExecutor`` for concurrent execution. The manager only
+   hands it as many jobs as it has workers, so the pool's own FIFO
+   never decides ordering. Two jobs targeting *different* circuits run
+   in parallel; the per-job worker still runs its executor +
+   persistence steps sequentially inside one pool thread.
+2. An index of :class:`SimulationJob` instances keyed by ``job_id``,
+   with secondary indexes by ``origin`` and ``circuit_file`` plus the
+   set of live (non-terminal) jobs, so :meth:`list` only touches the
+   jobs that can match. Retention is bounded — see below.
 3. Per-job synchronisation primitives: one ``threading.Event`` for
    sync waiters, and an ``asyncio.Future`` list for async waiters.
    The async completion path **must** cross threads through
    ``loop.call_soon_threadsafe`` — setting an ``asyncio.Future`` from
    a background thread directly raises ``RuntimeError: non-thread-safe``.
 
+Retention policy
+----------------
+
+A long agent session submits hundreds of sweeps, so the index cannot
+grow with the session:
+
+- **Compaction.** When a job turns terminal its done event and
+  async-waiter list are dropped right after the waiters are woken; only the frozen :class:`SimulationJob` stays. Live jobs are
+  never compacted or evicted.
+- **Bounded LRU.** Terminal jobs are kept in least-recently-used
+  order (``query`` / ``await_completion*`` count as use). Once more
+  than ``max_retained_jobs`` terminal jobs are held, or a terminal job
+  has not been used for ``retention_seconds`` (``None`` disables the
+  age limit), the oldest are evicted. Eviction is swept on submit,
+  query, list and on every terminal transition.
+- **Spill.** An evicted job's slim record is appended to
+  ``<project_root>/simulation_results/job_index.jsonl`` (only when that
+  directory already exists — the manager never creates project
+  directories on its own). :meth:`query` and the waiters fall back to
+  that index on a miss and re-admit the job; :meth:`list` covers the
+  in-memory window only.
+
 Authoritative event broadcasting
 --------------------------------
 
@@ -50,15 +78,30 @@ itself ferries handlers onto the Qt main thread via
 ``QMetaObject.invokeMethod`` (see ``shared/event_bus.py``). Worker
 threads simply call ``publish`` and move on.
 
+Scheduling
+----------
+
+- ``UI_EDITOR`` jobs outweigh ``AGENT_TOOL`` jobs (4:1 by default), so
+  an interactive run waits for at most one agent dispatch even behind a
+  long agent batch, while agents keep a guaranteed share.
+- A submit for the same ``(origin, project_root, circuit_file)`` as a
+  still-queued job supersedes it. The older job is cancelled with
+  ``superseded_by`` set and an ``EVENT_SIM_ERROR(cancelled=True)``.
+- Queued ``AGENT_TOOL`` jobs are capped (8 by default); a submit past
+  the cap raises :class:`SimulationQueueFullError` without registering
+  a job, which the ``run_simulation`` tool reports back to the LLM.
+- Every job records ``queue_depth_at_submit`` and exposes
+  ``queue_wait_seconds``; ``EVENT_SIM_STARTED`` carries the wait.
+
 Cancellation semantics (MVP)
 ----------------------------
 
 ``request_cancel`` is advisory, not surgical:
 
-- ``PENDING`` jobs that have not yet been picked up by a worker are
-  cancelled outright: the pool's ``Future.cancel()`` returns ``True``,
-  the job transitions ``PENDING -> CANCELLED``, and an ``EVENT_SIM_ERROR``
-  is emitted with ``cancelled=True``.
+- ``PENDING`` jobs still in the manager's queue are cancelled
+  outright: they are removed from the queue, the job transitions
+  ``PENDING -> CANCELLED``, and an ``EVENT_SIM_ERROR`` is emitted with
+  ``cancelled=True``.
 - ``RUNNING`` jobs only get their ``cancel_requested`` flag set. The
   worker's executor (ngspice / python sub-process) keeps running
   until natural completion; the manager checks the intent flag once
@@ -84,13 +127,25 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+import datetime as _dt
+import json
 import logging
 import threading
 import time
-from pathlib import PurePosixPath
-from typing import Any, Dict, List, Mapping, Optional, Tuple
+from collections import OrderedDict
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
 from domain.services.simulation_service import SimulationService
+from domain.services.simulation_job_queue import (
+    QueuedJob,
+    SimulationJobQueue,
+    SimulationQueueFullError,
+)
+from domain.simulation.data.simulation_artifact_exporter import (
+    CANONICAL_RESULTS_DIR,
+    JOB_INDEX_FILENAME,
+)
 from domain.simulation.data.simulation_artifact_persistence import (
     SimulationArtifactPersistence,
 )
@@ -113,6 +168,8 @@ from shared.event_types import (
 _LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_MAX_WORKERS = 4
+_DEFAULT_MAX_RETAINED_JOBS = 256
+_DEFAULT_RETENTION_SECONDS: Optional[float] = None
 _CANCELLED_ERROR_MESSAGE = "Simulation cancelled"
 
 
@@ -133,6 +190,10 @@ class SimulationJobManager:
         artifact_persistence: Optional[SimulationArtifactPersistence] = None,
         event_bus: Optional[EventBus] = None,
         max_workers: int = _DEFAULT_MAX_WORKERS,
+        max_retained_jobs: int = _DEFAULT_MAX_RETAINED_JOBS,
+        retention_seconds: Optional[float] = _DEFAULT_RETENTION_SECONDS,
+        origin_weights: Optional[Mapping[JobOrigin, int]] = None,
+        queue_limits: Optional[Mapping[JobOrigin, int]] = None,
     ) -> None:
         if simulation_service is not None and (
             executor_registry is not None or artifact_persistence is not None
@@ -147,19 +208,42 @@ class SimulationJobManager:
             artifact_persistence=artifact_persistence,
         )
         self._explicit_event_bus = event_bus
+        self._max_workers = max(1, int(max_workers))
         self._pool = concurrent.futures.ThreadPoolExecutor(
-            max_workers=max(1, int(max_workers)),
+            max_workers=self._max_workers,
             thread_name_prefix="sim-job",
         )
+        self._queue = SimulationJobQueue(
+            origin_weights=origin_weights,
+            queue_limits=queue_limits,
+        )
+        self._in_flight = 0
+        self._closed = False
 
         self._lock = threading.Lock()
         self._jobs: Dict[str, SimulationJob] = {}
-        self._futures: Dict[str, concurrent.futures.Future] = {}
         self._done_events: Dict[str, threading.Event] = {}
         self._async_waiters: Dict[
             str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]
         ] = {}
 
+        # Secondary indexes: insertion-ordered ``job_id`` sets (dicts
+        # with ``None`` values) so ``list`` never scans the whole index.
+        self._by_origin: Dict[JobOrigin, Dict[str, None]] = {}
+        self._by_circuit: Dict[str, Dict[str, None]] = {}
+        self._live: Dict[str, None] = {}
+
+        # Terminal jobs in LRU order: ``job_id -> (last_used, spilled)``.
+        # ``spilled`` marks jobs re-admitted from the on-disk index so a
+        # second eviction does not append a duplicate record.
+        self._max_retained = max(0, int(max_retained_jobs))
+        self._retention_seconds = retention_seconds
+        self._retained: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+        self._spill_lock = threading.Lock()
+        self._spill_roots: Set[str] = set()
+        # Evicted jobs stay resolvable here until their record is on disk.
+        self._spill_pending: Dict[str, SimulationJob] = {}
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -175,11 +259,17 @@ class SimulationJobManager:
         version: int = 1,
         session_id: str = "",
     ) -> SimulationJob:
-        """Register a new job and hand it to the worker pool.
+        """Register a new job and queue it for the worker pool.
 
         Returns the :class:`SimulationJob` with ``status == PENDING``.
         The caller keeps the ``job_id`` as the primary key for later
-        queries / cancellations.
+        queries / cancellations. A still-queued job for the same
+        origin and circuit is superseded (cancelled) by this one.
+
+        Raises:
+            SimulationQueueFullError: the origin's queue-depth limit is
+                reached; no job is registered.
+            RuntimeError: the manager has been closed.
         """
         if not circuit_file:
             raise ValueError("circuit_file is required")
@@ -198,31 +288,53 @@ class SimulationJobManager:
             origin=origin,
             project_root=project_root,
         )
-        done_event = threading.Event()
-        with self._lock:
-            self._jobs[job.job_id] = job
-            self._done_events[job.job_id] = done_event
-            self._async_waiters[job.job_id] = []
-
         config_snapshot: Dict[str, Any] = dict(analysis_config or {})
         targets_snapshot: Dict[str, str] = dict(metric_targets or {})
-
-        future = self._pool.submit(
-            self._run_job,
-            job,
-            config_snapshot,
-            targets_snapshot,
-            version,
-            session_id,
+        entry = QueuedJob(
+            job=job,
+            args=(config_snapshot, targets_snapshot, version, session_id),
         )
+
+        done_event = threading.Event()
+        superseded_job: Optional[SimulationJob] = None
         with self._lock:
-            self._futures[job.job_id] = future
+            if self._closed:
+                raise RuntimeError("SimulationJobManager is closed")
+            job.queue_depth_at_submit = len(self._queue)
+            # Raises SimulationQueueFullError before anything is indexed.
+            superseded = self._queue.push(entry)
+            self._index_locked(job)
+            self._live[job.job_id] = None
+            self._done_events[job.job_id] = done_event
+            self._async_waiters[job.job_id] = []
+            if superseded is not None:
+                superseded_job = superseded.job
+                superseded_job.request_cancel()
+                superseded_job.superseded_by = job.job_id
+                superseded_job.mark_cancelled()
+            evicted = self._sweep_locked()
+        self._spill(evicted)
+
+        if superseded_job is not None:
+            self._publish_error(
+                superseded_job,
+                error_message=f"Superseded by newer submission {job.job_id}",
+                cancelled=True,
+                result_path="",
+                export_root="",
+                duration_seconds=0.0,
+            )
+            self._notify_terminal(superseded_job)
+        self._dispatch()
         return job
 
     def query(self, job_id: str) -> Optional[SimulationJob]:
-        """Return the job with ``job_id`` or ``None`` if unknown."""
-        with self._lock:
-            return self._jobs.get(job_id)
+        """Return the job with ``job_id`` or ``None`` if unknown.
+
+        Jobs evicted from memory are looked up in the on-disk job
+        index and re-admitted.
+        """
+        return self._lookup(job_id)
 
     def list(
         self,
@@ -239,16 +351,26 @@ class SimulationJobManager:
         just the live queue.
         """
         with self._lock:
-            jobs = list(self._jobs.values())
-        matches: List[SimulationJob] = []
-        for job in jobs:
-            if origin is not None and job.origin is not origin:
-                continue
-            if circuit_file is not None and job.circuit_file != circuit_file:
-                continue
-            if not include_terminal and job.is_terminal:
-                continue
-            matches.append(job)
+            evicted = self._sweep_locked()
+            candidates: List[Dict[str, None]] = []
+            if origin is not None:
+                candidates.append(self._by_origin.get(origin, {}))
+            if circuit_file is not None:
+                candidates.append(self._by_circuit.get(circuit_file, {}))
+            if not include_terminal:
+                candidates.append(self._live)
+            if candidates:
+                # Walk the smallest index and probe the others.
+                candidates.sort(key=len)
+                smallest, others = candidates[0], candidates[1:]
+                job_ids: Iterable[str] = [
+                    job_id for job_id in smallest
+                    if all(job_id in other for other in others)
+                ]
+            else:
+                job_ids = self._jobs
+            matches = [self._jobs[job_id] for job_id in job_ids]
+        self._spill(evicted)
         matches.sort(key=lambda j: j.submitted_at)
         return matches
 
@@ -263,11 +385,11 @@ class SimulationJobManager:
         :class:`TimeoutError`. Intended for sync contexts (tests, CLI
         helpers). Async callers use :meth:`await_completion_async`.
         """
-        with self._lock:
-            job = self._jobs.get(job_id)
-            event = self._done_events.get(job_id)
+        job = self._lookup(job_id)
         if job is None:
             raise ValueError(f"Unknown job_id: {job_id}")
+        with self._lock:
+            event = self._done_events.get(job_id)
         if job.is_terminal:
             return job
         if event is None:
@@ -278,8 +400,9 @@ class SimulationJobManager:
             raise TimeoutError(
                 f"Job {job_id} did not complete within {timeout}s"
             )
-        with self._lock:
-            return self._jobs[job_id]
+        # The event is set only after the job turned terminal; the
+        # instance is the same even if it has been evicted since.
+        return job
 
     async def await_completion_async(self, job_id: str) -> SimulationJob:
         """Await completion on the caller's running event loop.
@@ -289,8 +412,7 @@ class SimulationJobManager:
         ``loop.call_soon_threadsafe`` — the only thread-safe way to
         resolve a ``Future`` from outside its owner loop.
         """
-        with self._lock:
-            job = self._jobs.get(job_id)
+        job = self._lookup(job_id)
         if job is None:
             raise ValueError(f"Unknown job_id: {job_id}")
         if job.is_terminal:
@@ -300,22 +422,21 @@ class SimulationJobManager:
         future: asyncio.Future = loop.create_future()
         with self._lock:
             # Re-check under lock: the worker may have just flipped the
-            # job to terminal between the optimistic check above and
-            # us registering as a waiter.
-            current = self._jobs[job_id]
-            if current.is_terminal:
-                return current
-            self._async_waiters[job_id].append((loop, future))
+            # job to terminal (and compacted its waiter list) between
+            # the optimistic check above and us registering as a waiter.
+            waiters = self._async_waiters.get(job_id)
+            if job.is_terminal or waiters is None:
+                return job
+            waiters.append((loop, future))
         return await future
 
     def request_cancel(self, job_id: str) -> bool:
         """Register the caller's intent to cancel ``job_id``.
 
         Returns ``True`` if the intent was registered (job exists and
-        is non-terminal), ``False`` otherwise. ``PENDING`` jobs whose
-        ``Future`` can still be pulled off the pool queue are finalised
-        here and emit ``EVENT_SIM_ERROR(cancelled=True)`` before the
-        method returns.
+        is non-terminal), ``False`` otherwise. ``PENDING`` jobs still
+        in the manager's queue are finalised here and emit
+        ``EVENT_SIM_ERROR(cancelled=True)`` before the method returns.
         """
         terminal_job: Optional[SimulationJob] = None
         with self._lock:
@@ -323,15 +444,10 @@ class SimulationJobManager:
             if job is None or job.is_terminal:
                 return False
             job.request_cancel()
-            future = self._futures.get(job_id)
-            if (
-                job.status is JobStatus.PENDING
-                and future is not None
-                and future.cancel()
-            ):
-                # Future was queued but not yet started; safely
-                # transition the job straight to CANCELLED so waiters
-                # can stop blocking immediately.
+            if self._queue.remove(job_id) is not None:
+                # Still queued, never dispatched; safely transition the
+                # job straight to CANCELLED so waiters can stop
+                # blocking immediately.
                 job.mark_cancelled()
                 terminal_job = job
         if terminal_job is not None:
@@ -349,14 +465,54 @@ class SimulationJobManager:
     def close(self) -> None:
         """Shut down the worker pool.
 
-        Intended for application exit / test teardown. Pending jobs
-        get their futures cancelled; running jobs are allowed to finish
-        naturally so in-flight ngspice subprocesses are not left in a
-        half-dead state. This is not one of the business lifecycle
-        methods — it exists purely for resource hygiene.
+        Intended for application exit / test teardown. Queued jobs are
+        cancelled (so their waiters wake up); running jobs are allowed
+        to finish naturally so in-flight ngspice subprocesses are not
+        left in a half-dead state. Later submits raise. This is not one
+        of the business lifecycle methods — it exists purely for
+        resource hygiene.
         """
+        with self._lock:
+            self._closed = True
+            queued = self._queue.drain()
+        for entry in queued:
+            entry.job.request_cancel()
+            self._finalize_cancelled(entry.job, duration_seconds=0.0)
         self._pool.shutdown(wait=False, cancel_futures=True)
 
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _dispatch(self) -> None:
+        """Move queued jobs into the pool while worker slots are free."""
+        while True:
+            with self._lock:
+                if self._closed or self._in_flight >= self._max_workers:
+                    return
+                entry = self._queue.pop()
+                if entry is None:
+                    return
+                self._in_flight += 1
+            try:
+                self._pool.submit(self._run_dispatched, entry)
+            except RuntimeError:
+                # ``close`` shut the pool down between the check above
+                # and this submit; the job never ran.
+                with self._lock:
+                    self._in_flight -= 1
+                entry.job.request_cancel()
+                self._finalize_cancelled(entry.job, duration_seconds=0.0)
+                return
+
+    def _run_dispatched(self, entry: QueuedJob) -> None:
+        try:
+            self._run_job(entry.job, *entry.args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._dispatch()
+
     # ------------------------------------------------------------------
     # Worker path
     # ------------------------------------------------------------------
@@ -503,6 +659,7 @@ class SimulationJobManager:
             "project_root": job.project_root,
             "analysis_type": str(analysis_config.get("analysis_type", "")),
             "config": dict(analysis_config),
+            "queue_wait_seconds": job.queue_wait_seconds,
         }
         self._publish(EVENT_SIM_STARTED, payload)
 
@@ -542,6 +699,7 @@ class SimulationJobManager:
             "project_root": job.project_root,
             "error_message": error_message,
             "cancelled": bool(cancelled),
+            "superseded_by": job.superseded_by or "",
             "result_path": result_path,
             "export_root": export_root,
             "duration_seconds": float(duration_seconds),
@@ -587,7 +745,12 @@ class SimulationJobManager:
         """
         with self._lock:
             waiters = self._async_waiters.pop(job.job_id, [])
-            done_event = self._done_events.get(job.job_id)
+            done_event = self._done_events.pop(job.job_id, None)
+            self._compact_locked(job)
+            evicted = self._sweep_locked()
+        # Spill before waking anyone so a returning waiter finds the
+        # evicted records on disk.
+        self._spill(evicted)
         for loop, future in waiters:
             if future.done():
                 continue
@@ -635,6 +798,163 @@ class SimulationJobManager:
         )
         self._notify_terminal(job)
 
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def _index_locked(self, job: SimulationJob) -> None:
+        self._jobs[job.job_id] = job
+        self._by_origin.setdefault(job.origin, {})[job.job_id] = None
+        self._by_circuit.setdefault(job.circuit_file, {})[job.job_id] = None
+
+    def _unindex_locked(self, job: SimulationJob) -> None:
+        self._jobs.pop(job.job_id, None)
+        for index, key in (
+            (self._by_origin, job.origin),
+            (self._by_circuit, job.circuit_file),
+        ):
+            members = index.get(key)
+            if members is None:
+                continue
+            members.pop(job.job_id, None)
+            if not members:
+                del index[key]
+
+    def _compact_locked(self, job: SimulationJob) -> None:
+        """Drop the per-job primitives of a terminal job and move it
+        into the retained LRU. Waiters must already have been popped."""
+        self._live.pop(job.job_id, None)
+        if job.job_id in self._jobs:
+            self._retained[job.job_id] = (time.monotonic(), False)
+
+    def _touch_locked(self, job_id: str) -> None:
+        entry = self._retained.get(job_id)
+        if entry is not None:
+            self._retained[job_id] = (time.monotonic(), entry[1])
+            self._retained.move_to_end(job_id)
+
+    def _sweep_locked(self) -> List[SimulationJob]:
+        """Evict terminal jobs over the count or age limit, oldest
+        use first. Returns the evicted jobs that still need spilling."""
+        evicted: List[SimulationJob] = []
+        deadline = (
+            None
+            if self._retention_seconds is None
+            else time.monotonic() - self._retention_seconds
+        )
+        while self._retained:
+            job_id, (last_used, spilled) = next(iter(self._retained.items()))
+            over_count = len(self._retained) > self._max_retained
+            expired = deadline is not None and last_used <= deadline
+            if not (over_count or expired):
+                break
+            del self._retained[job_id]
+            job = self._jobs.get(job_id)
+            if job is None:
+                continue
+            self._unindex_locked(job)
+            if not spilled:
+                self._spill_pending[job_id] = job
+                evicted.append(job)
+        return evicted
+
+    def _lookup(self, job_id: str) -> Optional[SimulationJob]:
+        """Resolve ``job_id`` from memory, falling back to the on-disk
+        job index for evicted jobs (which are re-admitted)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._touch_locked(job_id)
+                evicted = self._sweep_locked()
+            else:
+                evicted = []
+                job = self._spill_pending.get(job_id)
+                roots = list(self._spill_roots)
+        self._spill(evicted)
+        if job is not None or not roots:
+            return job
+
+        restored = self._read_spilled(job_id, roots)
+        if restored is None:
+            return None
+        with self._lock:
+            current = self._jobs.get(job_id)
+            if current is not None:
+                return current
+            self._index_locked(restored)
+            self._retained[job_id] = (time.monotonic(), True)
+            evicted = self._sweep_locked()
+        self._spill(evicted)
+        return restored
+
+    def _spill(self, jobs: List[SimulationJob]) -> None:
+        """Append slim records of evicted jobs to their project's job
+        index. Projects without a results directory are skipped."""
+        if not jobs:
+            return
+        grouped: Dict[str, List[SimulationJob]] = {}
+        for job in jobs:
+            grouped.setdefault(job.project_root, []).append(job)
+        with self._spill_lock:
+            for project_root, members in grouped.items():
+                results_dir = Path(project_root) / CANONICAL_RESULTS_DIR
+                if not results_dir.is_dir():
+                    self._forget_pending(members)
+                    continue
+                lines = "".join(
+                    json.dumps(_job_to_record(job), ensure_ascii=False) + "\n"
+                    for job in members
+                )
+                try:
+                    with open(
+                        results_dir / JOB_INDEX_FILENAME, "a", encoding="utf-8"
+                    ) as handle:
+                        handle.write(lines)
+                except OSError as exc:
+                    _LOGGER.warning(
+                        "SimulationJobManager failed to spill %d job(s) to %s: %s",
+                        len(members),
+                        results_dir,
+                        exc,
+                    )
+                    self._forget_pending(members)
+                    continue
+                with self._lock:
+                    self._spill_roots.add(project_root)
+                self._forget_pending(members)
+
+    def _forget_pending(self, jobs: List[SimulationJob]) -> None:
+        with self._lock:
+            for job in jobs:
+                self._spill_pending.pop(job.job_id, None)
+
+    def _read_spilled(
+        self,
+        job_id: str,
+        project_roots: List[str],
+    ) -> Optional[SimulationJob]:
+        needle = f'"{job_id}"'
+        with self._spill_lock:
+            for project_root in project_roots:
+                index_path = (
+                    Path(project_root) / CANONICAL_RESULTS_DIR / JOB_INDEX_FILENAME
+                )
+                try:
+                    with open(index_path, "r", encoding="utf-8") as handle:
+                        for line in handle:
+                            if needle not in line:
+                                continue
+                            record = json.loads(line)
+                            if record.get("job_id") == job_id:
+                                return _job_from_record(record)
+                except (OSError, ValueError, KeyError) as exc:
+                    _LOGGER.debug(
+                        "SimulationJobManager could not read job index %s: %s",
+                        index_path,
+                        exc,
+                    )
+        return None
+
     # ------------------------------------------------------------------
     # Misc helpers
     # ------------------------------------------------------------------
@@ -649,6 +969,71 @@ class SimulationJobManager:
         return "Unknown simulation error"
 
 
+def _job_to_record(job: SimulationJob) -> Dict[str, Any]:
+    """Slim JSON record of a terminal job (one job-index line)."""
+
+    def _iso(value: Optional[_dt.datetime]) -> Optional[str]:
+        return value.isoformat() if value is not None else None
+
+    return {
+        "job_id": job.job_id,
+        "origin": job.origin.value,
+        "circuit_file": job.circuit_file,
+        "project_root": job.project_root,
+        "status": job.status.value,
+        "submitted_at": _iso(job.submitted_at),
+        "started_at": _iso(job.started_at),
+        "finished_at": _iso(job.finished_at),
+        "result_path": job.result_path,
+        "export_root": job.export_root,
+        "error_message": job.error_message,
+        "queue_depth_at_submit": job.queue_depth_at_submit,
+        "superseded_by": job.superseded_by,
+    }
+
+
+def _job_from_record(record: Mapping[str, Any]) -> SimulationJob:
+    """Rebuild a frozen terminal job from :func:`_job_to_record` output.
+
+    The terminal transition goes through the public ``mark_*`` methods
+    so the restored job carries the same invariants as the original.
+    """
+
+    def _parse(value: Optional[str]) -> Optional[_dt.datetime]:
+        return _dt.datetime.fromisoformat(value) if value else None
+
+    status = JobStatus(record["status"])
+    job = SimulationJob(
+        circuit_file=record["circuit_file"],
+        origin=JobOrigin(record["origin"]),
+        project_root=record.get("project_root") or "",
+        job_id=record["job_id"],
+        submitted_at=_parse(record.get("submitted_at"))
+        or _dt.datetime.now(_dt.timezone.utc),
+        started_at=_parse(record.get("started_at")),
+        cancel_requested=status is JobStatus.CANCELLED,
+        queue_depth_at_submit=int(record.get("queue_depth_at_submit") or 0),
+        superseded_by=record.get("superseded_by"),
+    )
+    finished_at = _parse(record.get("finished_at"))
+    if status is JobStatus.COMPLETED:
+        job.mark_completed(
+            result_path=record["result_path"],
+            export_root=record["export_root"],
+            finished_at=finished_at,
+        )
+    elif status is JobStatus.FAILED:
+        job.mark_failed(
+            error_message=record.get("error_message") or "Unknown simulation error",
+            finished_at=finished_at,
+        )
+    elif status is JobStatus.CANCELLED:
+        job.mark_cancelled(finished_at=finished_at)
+    else:
+        raise ValueError(f"job index record is not terminal: {status.value}")
+    return job
+
+
 def _derive_export_root(result_path: str) -> str:
     """Return the bundle directory that contains ``result_path``.
 
@@ -667,4 +1052,5 @@ def _derive_export_root(result_path: str) -> str:
 
 __all__ = [
     "SimulationJobManager",
+    "SimulationQueueFullError",
 ]
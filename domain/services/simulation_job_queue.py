@@ -0,0 +1,209 @@
+"""``SimulationJobQueue`` — pending-job scheduling for
+:class:`~domain.services.simulation_job_manager.SimulationJobManager`.
+
+The manager no longer hands every submission straight to its
+``ThreadPoolExecutor`` (which is strictly FIFO). Jobs wait here until a
+worker slot frees up, and the queue decides which one goes next:
+
+- **Priority classes by origin.** Every :class:`JobOrigin` has a weight
+  and a rank. ``UI_EDITOR`` outweighs ``AGENT_TOOL`` so an interactive
+  Run click is picked ahead of a queued agent batch; ties go to the
+  lower rank.
+- **Fair share.** Selection is stride scheduling over origins: each
+  dispatch advances the origin's pass by ``1 / weight`` and the origin
+  with the smallest pass goes next. An origin whose queue was empty
+  re-enters at the current virtual time, so idling never banks credit
+  — agents still progress while the UI is busy, at ``1/weight`` of the
+  dispatch rate, and neither side can starve the other.
+- **Per-circuit coalescing.** A new submission for the same
+  ``(origin, project_root, circuit_file)`` as a job that is still
+  queued supersedes it: the older entry is removed and handed back to
+  the caller, which cancels it. Running jobs are never superseded.
+- **Queue-depth limits.** Origins may carry a cap on queued (not
+  running) jobs. Pushing beyond it raises
+  :class:`SimulationQueueFullError` so the submitter gets backpressure
+  instead of an unbounded backlog. A superseding push never counts
+  against the cap since it replaces an entry.
+
+The queue is a plain data structure: it is **not** thread-safe and the
+manager only touches it under its own lock.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
+
+from domain.simulation.models.simulation_job import JobOrigin, SimulationJob
+
+
+# Dispatch weight per origin (fair-share ratio) — higher runs more often.
+DEFAULT_ORIGIN_WEIGHTS: Mapping[JobOrigin, int] = {
+    JobOrigin.UI_EDITOR: 4,
+    JobOrigin.AGENT_TOOL: 1,
+}
+
+# Tie-break order when two origins have the same pass value.
+_ORIGIN_RANK: Mapping[JobOrigin, int] = {
+    JobOrigin.UI_EDITOR: 0,
+    JobOrigin.AGENT_TOOL: 1,
+}
+
+# Cap on *queued* jobs per origin; origins not listed are unbounded.
+# The UI already gates itself to one in-flight run; the agent can fan
+# out tool calls, so it is the one that needs backpressure.
+DEFAULT_QUEUE_LIMITS: Mapping[JobOrigin, int] = {
+    JobOrigin.AGENT_TOOL: 8,
+}
+
+
+class SimulationQueueFullError(RuntimeError):
+    """Raised by ``submit`` when the origin's queue-depth limit is hit.
+
+    Carries the origin, the configured limit and the current depth so
+    callers (the agent ``run_simulation`` tool) can report a concrete
+    "try again later" instead of a generic failure.
+    """
+
+    def __init__(self, origin: JobOrigin, limit: int, depth: int) -> None:
+        self.origin = origin
+        self.limit = limit
+        self.depth = depth
+        super().__init__(
+            f"Simulation queue for origin {origin.value!r} is full "
+            f"({depth} queued, limit {limit})"
+        )
+
+
+@dataclass
+class QueuedJob:
+    """A pending job plus the worker arguments captured at submit time."""
+
+    job: SimulationJob
+    args: Tuple[Any, ...] = ()
+    coalesce_key: Tuple[str, str, str] = field(default=("", "", ""))
+
+
+def coalesce_key(job: SimulationJob) -> Tuple[str, str, str]:
+    """``(origin, project_root, circuit_file)`` with OS-normalised paths.
+
+    UI submissions carry absolute editor paths, agent submissions carry
+    resolved paths; ``normcase`` / ``normpath`` make two spellings of
+    the same file coalesce on case-insensitive platforms.
+    """
+
+    def _norm(path: str) -> str:
+        return os.path.normcase(os.path.normpath(path)) if path else ""
+
+    return (job.origin.value, _norm(job.project_root), _norm(job.circuit_file))
+
+
+class SimulationJobQueue:
+    """Per-origin FIFO queues with stride-scheduled fair share."""
+
+    def __init__(
+        self,
+        *,
+        origin_weights: Optional[Mapping[JobOrigin, int]] = None,
+        queue_limits: Optional[Mapping[JobOrigin, int]] = None,
+    ) -> None:
+        weights = dict(DEFAULT_ORIGIN_WEIGHTS)
+        weights.update(origin_weights or {})
+        self._strides: Dict[JobOrigin, float] = {
+            origin: 1.0 / max(1, int(weights.get(origin, 1))) for origin in JobOrigin
+        }
+        self._limits: Dict[JobOrigin, int] = dict(
+            DEFAULT_QUEUE_LIMITS if queue_limits is None else queue_limits
+        )
+        self._queues: Dict[JobOrigin, Deque[QueuedJob]] = {
+            origin: deque() for origin in JobOrigin
+        }
+        self._by_key: Dict[Tuple[str, str, str], QueuedJob] = {}
+        self._by_id: Dict[str, QueuedJob] = {}
+        self._pass: Dict[JobOrigin, float] = {origin: 0.0 for origin in JobOrigin}
+        self._virtual_time = 0.0
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self._by_id
+
+    def depth(self, origin: Optional[JobOrigin] = None) -> int:
+        """Queued jobs for ``origin`` (all origins when ``None``)."""
+        if origin is None:
+            return len(self._by_id)
+        return len(self._queues[origin])
+
+    def push(self, entry: QueuedJob) -> Optional[QueuedJob]:
+        """Queue ``entry``; return the queued entry it supersedes, if any.
+
+        Raises:
+            SimulationQueueFullError: the origin is at its depth limit
+                and ``entry`` does not replace a queued job.
+        """
+        origin = entry.job.origin
+        entry.coalesce_key = coalesce_key(entry.job)
+        superseded = self._by_key.get(entry.coalesce_key)
+        limit = self._limits.get(origin)
+        depth = len(self._queues[origin])
+        if superseded is None and limit is not None and depth >= limit:
+            raise SimulationQueueFullError(origin, limit, depth)
+
+        if superseded is not None:
+            self._discard(superseded)
+        if not self._queues[origin]:
+            # Re-entering origins start at the current virtual time.
+            self._pass[origin] = max(self._pass[origin], self._virtual_time)
+        self._queues[origin].append(entry)
+        self._by_key[entry.coalesce_key] = entry
+        self._by_id[entry.job.job_id] = entry
+        return superseded
+
+    def pop(self) -> Optional[QueuedJob]:
+        """Remove and return the next job to dispatch, or ``None``."""
+        ready = [origin for origin, queue in self._queues.items() if queue]
+        if not ready:
+            return None
+        origin = min(
+            ready,
+            key=lambda o: (self._pass[o], _ORIGIN_RANK.get(o, len(_ORIGIN_RANK))),
+        )
+        self._virtual_time = self._pass[origin]
+        self._pass[origin] += self._strides[origin]
+        entry = self._queues[origin].popleft()
+        self._by_key.pop(entry.coalesce_key, None)
+        self._by_id.pop(entry.job.job_id, None)
+        return entry
+
+    def remove(self, job_id: str) -> Optional[QueuedJob]:
+        """Take a queued job out (cancellation); ``None`` if not queued."""
+        entry = self._by_id.get(job_id)
+        if entry is not None:
+            self._discard(entry)
+        return entry
+
+    def drain(self) -> List[QueuedJob]:
+        """Remove and return every queued job, in submission order."""
+        entries = sorted(self._by_id.values(), key=lambda e: e.job.submitted_at)
+        for entry in entries:
+            self._discard(entry)
+        return entries
+
+    def _discard(self, entry: QueuedJob) -> None:
+        self._queues[entry.job.origin].remove(entry)
+        self._by_id.pop(entry.job.job_id, None)
+        if self._by_key.get(entry.coalesce_key) is entry:
+            del self._by_key[entry.coalesce_key]
+
+
+__all__ = [
+    "DEFAULT_ORIGIN_WEIGHTS",
+    "DEFAULT_QUEUE_LIMITS",
+    "QueuedJob",
+    "SimulationJobQueue",
+    "SimulationQueueFullError",
+    "coalesce_key",
+]
@@ -124,7 +124,12 @@ class SimulationService:
             Every executor failure is captured into an error-shaped
             ``SimulationResult`` and returned, never raised. Persistence
             errors, by contrast, propagate out: a "successful" return
-            from this method means the bundle is on disk.
+            from this method means ``result.json`` and the export
+            manifest are on disk. Derived categories (metrics, raw
+            data, output log, ...) are exported on the persistence
+            I/O queue afterwards, so the manager can publish
+            completion without waiting for them; readers go through
+            ``ensure_bundle_categories``.
         """
         start_time = time.time()
         analysis_type = self._resolve_analysis_type(analysis_config, file_path)
@@ -190,12 +195,14 @@ class SimulationService:
                 project_root=project_root,
                 result=result,
                 metric_targets=metric_targets,
+                defer_derived_exports=True,
             )
             result_path = outcome.result_path
             _logger.info(
-                "Simulation bundle persisted: %s (files=%d, errors=%d)",
+                "Simulation bundle committed: %s (files=%d, pending=%d, errors=%d)",
                 result_path,
                 len(outcome.written_files),
+                len(outcome.pending_categories),
                 len(outcome.errors),
             )
         return result, result_path
@@ -0,0 +1,622 @@
+# OutputLogIndex - Indexed Output Log Access
+"""
+仿真输出日志索引
+
+职责：
+- 为仿真结果包中的 output_log.txt 建立一次性索引并持久化到其旁边
+  （output_log.index.npz），后续读取无需重新解析整份日志
+- 索引内容：每行的字节偏移、级别位图（info/warning/error）、
+  错误行 / 警告行列表，以及可选的词项倒排索引
+- 分页、按级别过滤与关键词搜索只读取需要的行区间
+
+设计说明：
+- 行号与 SimulationOutputReader 一致：跳过导出器写入的 ``# key: value``
+  头部及其后的空行，正文按 str.splitlines() 切分，从 1 开始编号
+- 级别由 SimulationOutputReader.detect_log_level 判定，与未建索引时的
+  解析结果完全一致
+- 索引以源文件大小与 mtime_ns 校验，源文件变化后自动重建
+- 词项索引（小写字母连续段 → 行号列表，数字不入索引，词表因此很小）
+  只在首次关键词搜索时构建并
+  回写索引文件；它只用于筛选候选行，候选行仍逐行校验子串匹配，
+  因此搜索结果与全量扫描一致。正则搜索无法借助词项索引，按块顺序扫描
+- 进程内缓存最近打开的若干索引，重复的工具调用只需一次 stat
+
+使用示例：
+    index = open_output_log_index(paths.text_path, paths.index_path)
+    if index is not None:
+        errors = index.read_level("error")
+        page = index.read_lines(1000, 1200)
+        hits = index.search("timestep too small")
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.simulation.data.simulation_output_reader import (
+    ERROR_KEYWORDS,
+    WARNING_KEYWORDS,
+    LogLevel,
+    LogLine,
+    SimulationSummary,
+    simulation_output_reader,
+)
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+INDEX_FORMAT_VERSION = 1
+
+# 级别位图中的编码，下标即编码值
+_LEVEL_NAMES: Tuple[str, ...] = (
+    LogLevel.INFO.value,
+    LogLevel.WARNING.value,
+    LogLevel.ERROR.value,
+)
+_LEVEL_CODES = {name: code for code, name in enumerate(_LEVEL_NAMES)}
+
+# 词项：连续字母（不含数字与下划线）
+_TERM_PATTERN = re.compile(r"[^\W\d_]+")
+
+# 顺序扫描（正则搜索、无法使用词项索引的搜索）时每次读取的行数
+_SCAN_BLOCK_LINES = 65536
+
+# 按行号读取时，间隔不超过该行数的相邻行合并为一次读取
+_MAX_READ_GAP_LINES = 16
+
+# 进程内缓存的索引数量
+_CACHE_SIZE = 8
+
+_logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# OutputLogIndex
+# ============================================================
+
+class OutputLogIndex:
+    """
+    单个 output_log.txt 的行索引
+
+    通过 OutputLogIndex.build() 构建，或由 open_output_log_index()
+    从磁盘加载 / 构建并缓存。
+    """
+
+    def __init__(
+        self,
+        text_path: Path,
+        index_path: Path,
+        *,
+        source_size: int,
+        source_mtime_ns: int,
+        text_size: int,
+        text_newline_count: int,
+        line_offsets: np.ndarray,
+        levels: np.ndarray,
+        error_lines: Optional[np.ndarray] = None,
+        warning_lines: Optional[np.ndarray] = None,
+        term_vocabulary: Optional[List[str]] = None,
+        term_bounds: Optional[np.ndarray] = None,
+        term_postings: Optional[np.ndarray] = None,
+    ):
+        self.text_path = Path(text_path)
+        self.index_path = Path(index_path)
+        self.source_size = source_size
+        self.source_mtime_ns = source_mtime_ns
+        # 以文本模式（通用换行）读取全文时的 UTF-8 字节数与换行数
+        self.text_size = text_size
+        self.text_newline_count = text_newline_count
+        self._line_offsets = line_offsets
+        self._levels = levels
+        if error_lines is None:
+            error_lines = np.flatnonzero(levels == _LEVEL_CODES[LogLevel.ERROR.value]).astype(np.uint32)
+        if warning_lines is None:
+            warning_lines = np.flatnonzero(levels == _LEVEL_CODES[LogLevel.WARNING.value]).astype(np.uint32)
+        self._error_lines = error_lines
+        self._warning_lines = warning_lines
+        self._term_vocabulary = term_vocabulary
+        self._term_bounds = term_bounds
+        self._term_postings = term_postings
+        self._term_lock = threading.Lock()
+
+    # --------------------------------------------------------
+    # 构建与持久化
+    # --------------------------------------------------------
+
+    @classmethod
+    def build(cls, text_path: Path, index_path: Path) -> "OutputLogIndex":
+        """
+        读取整份日志构建索引（不写盘）
+
+        Raises:
+            OSError: 日志文件无法读取
+        """
+        text_path = Path(text_path)
+        stat = text_path.stat()
+        data = text_path.read_bytes()
+        # surrogateescape 保证每个片段重新编码后的长度等于原始字节数
+        text = data.decode("utf-8", errors="surrogateescape")
+        pieces = text.splitlines(keepends=True)
+        contents = text.splitlines()
+        header_count = _count_export_header_lines(contents)
+
+        if data.isascii():
+            lengths = [len(piece) for piece in pieces]
+        else:
+            lengths = [len(piece.encode("utf-8", errors="surrogateescape")) for piece in pieces]
+        offsets = np.zeros(len(pieces) - header_count + 1, dtype=np.uint64)
+        offsets[1:] = np.cumsum(np.asarray(lengths[header_count:], dtype=np.uint64))
+        offsets += sum(lengths[:header_count])
+
+        normalized = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        if data.isascii():
+            header_chars = int(offsets[0])
+            levels = _detect_levels_ascii(text[header_chars:].lower(), offsets - header_chars)
+        else:
+            detect = simulation_output_reader.detect_log_level
+            levels = np.fromiter(
+                (_LEVEL_CODES[detect(content)] for content in contents[header_count:]),
+                dtype=np.uint8,
+                count=len(contents) - header_count,
+            )
+        return cls(
+            text_path,
+            index_path,
+            source_size=stat.st_size,
+            source_mtime_ns=stat.st_mtime_ns,
+            text_size=len(normalized),
+            text_newline_count=normalized.count(b"\n"),
+            line_offsets=offsets,
+            levels=levels,
+        )
+
+    @classmethod
+    def load(cls, text_path: Path, index_path: Path) -> Optional["OutputLogIndex"]:
+        """
+        加载持久化的索引；索引缺失、损坏或与源文件不一致时返回 None
+        """
+        text_path = Path(text_path)
+        index_path = Path(index_path)
+        try:
+            stat = text_path.stat()
+            with np.load(index_path, allow_pickle=False) as archive:
+                meta = json.loads(archive["meta"].tobytes().decode("utf-8"))
+                if (
+                    meta.get("version") != INDEX_FORMAT_VERSION
+                    or meta.get("source_size") != stat.st_size
+                    or meta.get("source_mtime_ns") != stat.st_mtime_ns
+                ):
+                    return None
+                vocabulary = None
+                bounds = postings = None
+                if meta.get("has_terms"):
+                    joined = archive["term_vocabulary"].tobytes().decode("utf-8")
+                    vocabulary = joined.split("\n") if joined else []
+                    bounds = archive["term_bounds"]
+                    postings = archive["term_postings"]
+                return cls(
+                    text_path,
+                    index_path,
+                    source_size=stat.st_size,
+                    source_mtime_ns=stat.st_mtime_ns,
+                    text_size=int(meta["text_size"]),
+                    text_newline_count=int(meta["text_newline_count"]),
+                    line_offsets=archive["line_offsets"],
+                    levels=archive["levels"],
+                    error_lines=archive["error_lines"],
+                    warning_lines=archive["warning_lines"],
+                    term_vocabulary=vocabulary,
+                    term_bounds=bounds,
+                    term_postings=postings,
+                )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, UnicodeDecodeError) as exc:
+            _logger.warning(f"输出日志索引无法加载，将重建: {index_path}, 错误: {exc}")
+            return None
+
+    def save(self) -> bool:
+        """
+        写入索引文件（先写临时文件再替换）
+
+        Returns:
+            bool: 是否写入成功；失败只记录日志，不影响读取
+        """
+        meta = {
+            "version": INDEX_FORMAT_VERSION,
+            "source_size": self.source_size,
+            "source_mtime_ns": self.source_mtime_ns,
+            "text_size": self.text_size,
+            "text_newline_count": self.text_newline_count,
+            "has_terms": self.has_term_index,
+        }
+        arrays = {
+            "meta": np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+            "line_offsets": self._line_offsets,
+            "levels": self._levels,
+            "error_lines": self._error_lines,
+            "warning_lines": self._warning_lines,
+        }
+        if self.has_term_index:
+            arrays["term_vocabulary"] = np.frombuffer(
+                "\n".join(self._term_vocabulary).encode("utf-8"), dtype=np.uint8
+            )
+            arrays["term_bounds"] = self._term_bounds
+            arrays["term_postings"] = self._term_postings
+
+        temp_path = self.index_path.with_name(f".{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, "wb") as handle:
+                np.savez(handle, **arrays)
+            os.replace(temp_path, self.index_path)
+            return True
+        except OSError as exc:
+            _logger.warning(f"输出日志索引写入失败: {self.index_path}, 错误: {exc}")
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            return False
+
+    # --------------------------------------------------------
+    # 统计
+    # --------------------------------------------------------
+
+    @property
+    def total_lines(self) -> int:
+        return len(self._levels)
+
+    @property
+    def error_count(self) -> int:
+        return len(self._error_lines)
+
+    @property
+    def warning_count(self) -> int:
+        return len(self._warning_lines)
+
+    @property
+    def info_count(self) -> int:
+        return self.total_lines - self.error_count - self.warning_count
+
+    @property
+    def has_term_index(self) -> bool:
+        return self._term_vocabulary is not None
+
+    def count_level(self, level: str) -> int:
+        """指定级别（info/warning/error/all）的行数"""
+        if level == "all":
+            return self.total_lines
+        return int(np.count_nonzero(self._levels == _LEVEL_CODES[level]))
+
+    def first_error(self) -> Optional[str]:
+        """第一条错误行内容"""
+        if not self.error_count:
+            return None
+        return self.read_line_numbers([int(self._error_lines[0])])[0].content
+
+    def summary(self) -> SimulationSummary:
+        """仅包含日志统计字段的摘要（分析类型等元数据由调用方补充）"""
+        return SimulationSummary(
+            total_lines=self.total_lines,
+            error_count=self.error_count,
+            warning_count=self.warning_count,
+            info_count=self.info_count,
+            first_error=self.first_error(),
+        )
+
+    # --------------------------------------------------------
+    # 读取
+    # --------------------------------------------------------
+
+    def read_lines(self, start: int = 0, stop: Optional[int] = None) -> List[LogLine]:
+        """
+        读取连续行区间 [start, stop)（0 起始下标，负数按 Python 切片语义）
+        """
+        start, stop, _ = slice(start, stop).indices(self.total_lines)
+        if start >= stop:
+            return []
+        with open(self.text_path, "rb") as handle:
+            return self._read_range(handle, start, stop)
+
+    def tail(self, count: int) -> List[LogLine]:
+        """最后 count 行"""
+        if count <= 0:
+            return []
+        return self.read_lines(max(0, self.total_lines - count))
+
+    def read_line_numbers(self, indices: Sequence[int]) -> List[LogLine]:
+        """
+        读取指定下标的行（0 起始，需升序）；相近的行合并为一次读取
+        """
+        if not len(indices):
+            return []
+        result: List[LogLine] = []
+        with open(self.text_path, "rb") as handle:
+            for run_start, run_stop, members in _group_runs(indices, _MAX_READ_GAP_LINES):
+                block = self._read_range(handle, run_start, run_stop)
+                result.extend(block[index - run_start] for index in members)
+        return result
+
+    def read_level(self, level: str, offset: int = 0, limit: Optional[int] = None) -> List[LogLine]:
+        """
+        按级别分页读取
+
+        Args:
+            level: 日志级别（info/warning/error/all）
+            offset: 跳过该级别的前 offset 行
+            limit: 最多返回行数，None 表示全部
+        """
+        stop = None if limit is None else offset + max(0, limit)
+        if level == "all":
+            return self.read_lines(offset, stop)
+        if level == LogLevel.ERROR.value:
+            indices = self._error_lines
+        elif level == LogLevel.WARNING.value:
+            indices = self._warning_lines
+        else:
+            indices = np.flatnonzero(self._levels == _LEVEL_CODES[level])
+        return self.read_line_numbers(indices[offset:stop].tolist())
+
+    def read_text_head(self, max_bytes: int) -> str:
+        """
+        以文本模式读取文件开头 max_bytes + 1 个字符（含导出头部），
+        编码后必然超过 max_bytes 字节；文件更短时返回全文
+        """
+        with open(self.text_path, "r", encoding="utf-8") as handle:
+            return handle.read(max_bytes + 1)
+
+    # --------------------------------------------------------
+    # 搜索
+    # --------------------------------------------------------
+
+    def search(self, keyword: str, case_sensitive: bool = False, limit: Optional[int] = None) -> List[LogLine]:
+        """
+        子串搜索，语义与 SimulationOutputReader.search_log 一致
+
+        关键词包含字母时先用词项索引筛选候选行，只读取候选行校验；
+        否则（或区分大小写且关键词含非 ASCII 字符时）按块扫描全文。
+        """
+        if not keyword:
+            return []
+        if case_sensitive:
+            matches = lambda content: keyword in content
+        else:
+            keyword_lower = keyword.lower()
+            matches = lambda content: keyword_lower in content.lower()
+
+        candidates = None
+        if not case_sensitive or keyword.isascii():
+            candidates = self._term_candidates(keyword.lower())
+        if candidates is None:
+            return self._scan(matches, limit)
+
+        result: List[LogLine] = []
+        for line in self.read_line_numbers(candidates.tolist()):
+            if matches(line.content):
+                result.append(line)
+                if limit is not None and len(result) >= limit:
+                    break
+        return result
+
+    def search_regex(self, regex: "re.Pattern[str]", limit: Optional[int] = None) -> List[LogLine]:
+        """正则搜索（按块顺序扫描）"""
+        return self._scan(lambda content: regex.search(content) is not None, limit)
+
+    def ensure_term_index(self) -> None:
+        """构建词项索引并回写索引文件（已存在时直接返回）"""
+        with self._term_lock:
+            if self.has_term_index:
+                return
+            postings: dict = {}
+            with open(self.text_path, "rb") as handle:
+                for start in range(0, self.total_lines, _SCAN_BLOCK_LINES):
+                    stop = min(start + _SCAN_BLOCK_LINES, self.total_lines)
+                    contents = self._read_contents(handle, start, stop, lower=True)
+                    for index, content in enumerate(contents, start=start):
+                        for term in set(_TERM_PATTERN.findall(content)):
+                            postings.setdefault(term, []).append(index)
+            vocabulary = sorted(postings)
+            bounds = np.zeros(len(vocabulary) + 1, dtype=np.uint64)
+            bounds[1:] = np.cumsum(np.asarray([len(postings[term]) for term in vocabulary], dtype=np.uint64))
+            flat = np.fromiter(
+                (index for term in vocabulary for index in postings[term]),
+                dtype=np.uint32,
+                count=int(bounds[-1]),
+            )
+            self._term_bounds = bounds
+            self._term_postings = flat
+            self._term_vocabulary = vocabulary
+        self.save()
+
+    def _term_candidates(self, keyword_lower: str) -> Optional[np.ndarray]:
+        """
+        候选行下标（升序）；关键词不含字母时返回 None
+
+        关键词中的每个字母连续段必然落在匹配行某个词项之内，
+        因此取“包含该片段的词项”的行并集，再对各片段求交集。
+        """
+        parts = set(_TERM_PATTERN.findall(keyword_lower))
+        if not parts:
+            return None
+        self.ensure_term_index()
+        candidates: Optional[np.ndarray] = None
+        for part in sorted(parts, key=len, reverse=True):
+            rows = [
+                self._term_postings[int(self._term_bounds[i]):int(self._term_bounds[i + 1])]
+                for i, term in enumerate(self._term_vocabulary)
+                if part in term
+            ]
+            lines = np.unique(np.concatenate(rows)) if rows else np.empty(0, dtype=np.uint32)
+            candidates = lines if candidates is None else np.intersect1d(candidates, lines, assume_unique=True)
+            if not len(candidates):
+                break
+        return candidates
+
+    def _scan(self, matches, limit: Optional[int]) -> List[LogLine]:
+        result: List[LogLine] = []
+        for start in range(0, self.total_lines, _SCAN_BLOCK_LINES):
+            for line in self.read_lines(start, start + _SCAN_BLOCK_LINES):
+                if matches(line.content):
+                    result.append(line)
+                    if limit is not None and len(result) >= limit:
+                        return result
+        return result
+
+    def _read_contents(self, handle, start: int, stop: int, lower: bool = False) -> List[str]:
+        begin = int(self._line_offsets[start])
+        handle.seek(begin)
+        text = handle.read(int(self._line_offsets[stop]) - begin).decode("utf-8", errors="replace")
+        # 整块转小写与逐行转小写结果一致（行分隔符不是字母）
+        return (text.lower() if lower else text).splitlines()
+
+    def _read_range(self, handle, start: int, stop: int) -> List[LogLine]:
+        contents = self._read_contents(handle, start, stop)
+        levels = self._levels[start:stop].tolist()
+        return [
+            LogLine(line_number=start + i + 1, content=content, level=_LEVEL_NAMES[code])
+            for i, (content, code) in enumerate(zip(contents, levels))
+        ]
+
+
+# ============================================================
+# 内部工具函数
+# ============================================================
+
+def _count_export_header_lines(lines: List[str]) -> int:
+    """导出器写入的 ``# key: value`` 头部及其后空行的行数；无头部时为 0"""
+    index = 0
+    while index < len(lines) and lines[index].startswith("# "):
+        index += 1
+    if index > 0 and index < len(lines) and lines[index] == "":
+        return index + 1
+    return 0
+
+
+def _detect_levels_ascii(body_lower: str, line_offsets: np.ndarray) -> np.ndarray:
+    """
+    ASCII 日志的级别检测：对整段小写正文逐个关键词 str.find，
+    手工校验单词边界后按行起始偏移映射到行
+
+    与逐行 detect_log_level 等价：关键词不含换行符，行分隔符均为非单词
+    字符，因此整段文本中的 \\b 边界与单行中的一致；错误级别最后写入，
+    覆盖同一行的警告。
+    """
+    line_count = len(line_offsets) - 1
+    levels = np.zeros(line_count, dtype=np.uint8)
+    for level, keywords in (
+        (LogLevel.WARNING.value, WARNING_KEYWORDS),
+        (LogLevel.ERROR.value, ERROR_KEYWORDS),
+    ):
+        positions: List[int] = []
+        for keyword in keywords:
+            start = body_lower.find(keyword)
+            while start != -1:
+                end = start + len(keyword)
+                if (start == 0 or not _is_ascii_word_char(body_lower[start - 1])) and (
+                    end == len(body_lower) or not _is_ascii_word_char(body_lower[end])
+                ):
+                    positions.append(start)
+                start = body_lower.find(keyword, start + 1)
+        if positions:
+            lines = np.searchsorted(line_offsets, positions, side="right") - 1
+            levels[lines[lines < line_count]] = _LEVEL_CODES[level]
+    return levels
+
+
+def _is_ascii_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _group_runs(indices: Sequence[int], max_gap: int) -> Iterator[Tuple[int, int, List[int]]]:
+    """将升序下标分组为 (起始, 结束, 组内下标)，组内相邻下标间隔不超过 max_gap"""
+    members = [indices[0]]
+    for index in indices[1:]:
+        if index - members[-1] > max_gap:
+            yield members[0], members[-1] + 1, members
+            members = []
+        members.append(index)
+    yield members[0], members[-1] + 1, members
+
+
+# ============================================================
+# 进程内缓存
+# ============================================================
+
+_cache: "OrderedDict[str, OutputLogIndex]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def open_output_log_index(text_path: Path, index_path: Path) -> Optional[OutputLogIndex]:
+    """
+    获取 output_log.txt 的索引
+
+    依次尝试进程内缓存、磁盘上的索引文件，最后重新构建并写盘。
+
+    Returns:
+        Optional[OutputLogIndex]: 日志文件不存在或无法读取时为 None
+    """
+    text_path = Path(text_path)
+    try:
+        stat = text_path.stat()
+    except OSError:
+        return None
+    key = str(text_path.resolve())
+    with _cache_lock:
+        index = _cache.get(key)
+        if index is not None:
+            if index.source_size == stat.st_size and index.source_mtime_ns == stat.st_mtime_ns:
+                _cache.move_to_end(key)
+                return index
+            del _cache[key]
+
+    index = OutputLogIndex.load(text_path, index_path)
+    if index is None:
+        try:
+            index = OutputLogIndex.build(text_path, index_path)
+        except OSError as exc:
+            _logger.warning(f"输出日志无法读取: {text_path}, 错误: {exc}")
+            return None
+        index.save()
+
+    with _cache_lock:
+        _cache[key] = index
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return index
+
+
+def build_output_log_index(text_path: Path, index_path: Path) -> Optional[OutputLogIndex]:
+    """
+    重新构建并写入索引（导出 output_log 时调用），同时刷新进程内缓存
+    """
+    with _cache_lock:
+        _cache.pop(str(Path(text_path).resolve()), None)
+    try:
+        index = OutputLogIndex.build(text_path, index_path)
+    except OSError as exc:
+        _logger.warning(f"输出日志索引构建失败: {text_path}, 错误: {exc}")
+        return None
+    index.save()
+    return index
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "INDEX_FORMAT_VERSION",
+    "OutputLogIndex",
+    "build_output_log_index",
+    "open_output_log_index",
+]
@@ -0,0 +1,455 @@
+# ResultColumnStore - Columnar Archive of result.json
+"""
+仿真结果列式归档存储
+
+职责：
+- 将 result.json 中的数值数组（time / frequency / sweep / 各信号）与
+  raw_output 移入旁路列文件（result.columns），result.json 只保留头部
+  字段与列引用（存根），供归档层（simulation_bundle_archiver）使用
+- 读取 result.json 时透明还原：存根中的列引用替换为 numpy 数组，
+  raw_output 还原为文本，调用方得到与未归档时等价的字典
+- 按信号读取（load_result_columns）：只还原 x 轴与选中的信号，
+  按头部偏移定位，未引用的列不读取、不解压
+
+列文件格式：
+- 魔数 ``SIMCOLS1`` + 4 字节小端头部长度 + JSON 头部 + 各列压缩块
+- 头部记录压缩算法与每列的 dtype、长度、编码、偏移、字节数、是否有损
+- 压缩：安装了 zstandard 时使用 zstd，否则回退到标准库 zlib；
+  读取按头部记录的算法解压
+- 编码：
+  - ``shuffle``：按字节平面重排（同一字节位置的数据相邻），提升浮点数压缩率
+  - ``delta``：单调坐标轴（time / frequency / sweep）先对整数位视图做差分
+    （模 2^64 回绕），再做字节重排；累加还原逐位精确
+  - ``float32``：可选，仅用于信号列，坐标轴始终保持原精度；头部标记为有损
+  - ``text``：raw_output 的 UTF-8 字节
+
+设计说明：
+- 存根顶层带 ``archive`` 标记（格式、版本、列文件名、压缩算法、是否有损），
+  不含标记的 result.json 按原样解析，与归档前完全兼容
+- 写入顺序：先原子写列文件，再原子替换 result.json；中途中断时
+  result.json 仍是完整版本，孤立的列文件在下次归档时被覆盖
+- 本模块只依赖 numpy 与标准库：simulation_output_reader 在导出器之前
+  被导入，路径由调用方传入，不经过导出器
+
+使用示例：
+    payload = load_result_payload(result_path)
+    result = SimulationResult.from_dict(payload)
+"""
+
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    import zstandard
+except ImportError:  # 可选依赖：缺失时以 zlib 压缩
+    zstandard = None
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+ARCHIVE_FORMAT = "columns"
+ARCHIVE_FORMAT_VERSION = 1
+
+# result.json 存根中的归档标记键与列引用键
+ARCHIVE_MARKER_KEY = "archive"
+COLUMN_REF_KEY = "_column"
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+
+ENCODING_SHUFFLE = "shuffle"
+ENCODING_DELTA = "delta"
+ENCODING_TEXT = "text"
+
+_MAGIC = b"SIMCOLS1"
+_HEADER_LENGTH = struct.Struct("<I")
+
+_ZSTD_LEVEL = 10
+_ZLIB_LEVEL = 6
+
+# 做差分编码的单调坐标轴
+_AXIS_KEYS: Tuple[str, ...] = ("time", "frequency", "sweep")
+
+
+class ResultArchiveError(ValueError):
+    """列文件缺失、损坏或使用了当前环境不支持的压缩算法"""
+
+
+# ============================================================
+# 写入
+# ============================================================
+
+def default_codec() -> str:
+    """当前环境可用的最佳压缩算法"""
+    return CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+
+
+def is_archived_payload(payload: Any) -> bool:
+    """result.json 内容是否为归档存根"""
+    return isinstance(payload, dict) and isinstance(payload.get(ARCHIVE_MARKER_KEY), dict)
+
+
+def pack_result_archive(
+    payload: Dict[str, Any],
+    archive_name: str,
+    *,
+    float32: bool = False,
+    codec: Optional[str] = None,
+) -> Tuple[bytes, bytes]:
+    """
+    将完整的 result.json 内容拆分为存根与列文件（不写盘）
+
+    Args:
+        payload: 完整的 result.json 字典（SimulationResult.to_dict()）
+        archive_name: 列文件名，记录在存根标记中，相对 result.json 所在目录
+        float32: 信号列是否降为 float32 存储（有损）
+        codec: 压缩算法，默认 default_codec()
+
+    Returns:
+        (存根 JSON 字节, 列文件字节)
+    """
+    codec = codec or default_codec()
+    writer = _ColumnWriter(codec)
+    stub = dict(payload)
+
+    data = payload.get("data")
+    if isinstance(data, dict):
+        stub_data = dict(data)
+        for key in _AXIS_KEYS:
+            stub_data[key] = writer.add_array(key, data.get(key), axis=True)
+        signals = data.get("signals")
+        if isinstance(signals, dict):
+            stub_signals = {}
+            for index, (name, values) in enumerate(signals.items()):
+                column = f"signal:{index}"
+                if isinstance(values, dict) and values.get("_complex"):
+                    stub_signals[name] = {
+                        **values,
+                        "real": writer.add_array(f"{column}:real", values.get("real"), float32=float32),
+                        "imag": writer.add_array(f"{column}:imag", values.get("imag"), float32=float32),
+                    }
+                else:
+                    stub_signals[name] = writer.add_array(column, values, float32=float32)
+            stub_data["signals"] = stub_signals
+        stub["data"] = stub_data
+
+    raw_output = payload.get("raw_output")
+    if isinstance(raw_output, str):
+        stub["raw_output"] = writer.add_text("raw_output", raw_output)
+
+    stub[ARCHIVE_MARKER_KEY] = {
+        "format": ARCHIVE_FORMAT,
+        "version": ARCHIVE_FORMAT_VERSION,
+        "file": archive_name,
+        "codec": codec,
+        "lossy": writer.lossy,
+    }
+    stub_bytes = json.dumps(stub, indent=2, ensure_ascii=False).encode("utf-8")
+    return stub_bytes, writer.to_bytes()
+
+
+def write_result_archive(
+    result_path: Path,
+    archive_path: Path,
+    payload: Dict[str, Any],
+    *,
+    float32: bool = False,
+    codec: Optional[str] = None,
+) -> Tuple[int, int]:
+    """
+    归档 result.json：写列文件，再以存根原子替换 result.json（保留原 mtime）
+
+    Args:
+        result_path: result.json 路径
+        archive_path: 列文件路径，需与 result.json 同目录
+        payload: 完整的 result.json 字典
+        float32: 信号列是否降为 float32 存储（有损）
+        codec: 压缩算法，默认 default_codec()
+
+    Returns:
+        (存根字节数, 列文件字节数)
+    """
+    stub_bytes, archive_bytes = pack_result_archive(
+        payload, archive_path.name, float32=float32, codec=codec
+    )
+    stat = result_path.stat() if result_path.exists() else None
+    _atomic_write_bytes(archive_path, archive_bytes)
+    _atomic_write_bytes(result_path, stub_bytes)
+    if stat is not None:
+        # 历史列表以 mtime 作为同一时间戳的排序依据，归档不应改变它
+        os.utime(result_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    return len(stub_bytes), len(archive_bytes)
+
+
+class _ColumnWriter:
+    """累积列块，最后拼接为列文件"""
+
+    def __init__(self, codec: str):
+        self.codec = codec
+        self.lossy = False
+        self._columns: Dict[str, Dict[str, Any]] = {}
+        self._blobs: List[bytes] = []
+        self._offset = 0
+
+    def add_array(self, name: str, values: Any, *, axis: bool = False, float32: bool = False) -> Any:
+        """归档一个数值列并返回列引用；无法按数值列存储时原样返回"""
+        if not isinstance(values, list):
+            return values
+        try:
+            array = np.asarray(values)
+        except (TypeError, ValueError):
+            return values
+        if array.ndim != 1 or array.dtype.kind not in "fiu":
+            return values
+
+        stored = array
+        lossy = False
+        if float32 and not axis and array.dtype == np.float64:
+            stored = array.astype(np.float32)
+            lossy = True
+        encoding = ENCODING_DELTA if axis and _is_monotonic(array) else ENCODING_SHUFFLE
+        raw = _encode(stored, encoding)
+        self._append(name, raw, {
+            "dtype": array.dtype.str,
+            "stored_dtype": stored.dtype.str,
+            "length": int(array.size),
+            "encoding": encoding,
+            "lossy": lossy,
+        })
+        self.lossy = self.lossy or lossy
+        return {COLUMN_REF_KEY: name}
+
+    def add_text(self, name: str, text: str) -> Dict[str, str]:
+        raw = text.encode("utf-8")
+        self._append(name, raw, {"encoding": ENCODING_TEXT, "length": len(raw), "lossy": False})
+        return {COLUMN_REF_KEY: name}
+
+    def _append(self, name: str, raw: bytes, info: Dict[str, Any]) -> None:
+        blob = _compress(raw, self.codec)
+        self._columns[name] = {**info, "offset": self._offset, "size": len(blob), "raw_size": len(raw)}
+        self._blobs.append(blob)
+        self._offset += len(blob)
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps(
+            {"version": ARCHIVE_FORMAT_VERSION, "codec": self.codec, "columns": self._columns},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        return b"".join([_MAGIC, _HEADER_LENGTH.pack(len(header)), header, *self._blobs])
+
+
+# ============================================================
+# 读取
+# ============================================================
+
+def load_result_payload(result_path: Path) -> Dict[str, Any]:
+    """
+    读取 result.json；归档存根透明还原为完整内容
+
+    还原后的数值列为 numpy 数组（float32 列还原为原 dtype），
+    SimulationResult.from_dict 可直接使用。
+
+    Raises:
+        json.JSONDecodeError: result.json 不是合法 JSON
+        ResultArchiveError: 存根引用的列文件缺失或损坏
+    """
+    result_path = Path(result_path)
+    payload = json.loads(result_path.read_text(encoding="utf-8"))
+    return restore_result_payload(result_path, payload)
+
+
+def restore_result_payload(result_path: Path, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    还原已解析的 result.json 内容；非归档存根原样返回
+
+    Raises:
+        ResultArchiveError: 存根引用的列文件缺失或损坏
+    """
+    if not is_archived_payload(payload):
+        return payload
+
+    marker = payload[ARCHIVE_MARKER_KEY]
+    archive_path = result_path.with_name(str(marker.get("file", "")))
+    restored = {key: value for key, value in payload.items() if key != ARCHIVE_MARKER_KEY}
+    columns = _read_columns(archive_path, _referenced_columns(restored))
+    return _resolve(restored, columns)
+
+
+def load_result_columns(
+    result_path: Path,
+    signal_filter: Callable[[str], bool],
+) -> Dict[str, Any]:
+    """
+    只读取 result.json 的头部字段、x 轴与筛选出的信号列
+
+    跨结果比较等只需要少数信号的场景使用：未选中的信号被丢弃，
+    raw_output 置为 None。归档结果包只解压被引用的列；未归档的
+    result.json 仍需完整解析 JSON，但只保留选中的信号。
+
+    Args:
+        result_path: result.json 路径
+        signal_filter: 信号名 -> 是否读取
+
+    Raises:
+        json.JSONDecodeError: result.json 不是合法 JSON
+        ResultArchiveError: 存根引用的列文件缺失或损坏
+    """
+    result_path = Path(result_path)
+    payload = json.loads(result_path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        return payload
+    payload["raw_output"] = None
+    data = payload.get("data")
+    if isinstance(data, dict) and isinstance(data.get("signals"), dict):
+        data["signals"] = {
+            name: values for name, values in data["signals"].items() if signal_filter(name)
+        }
+    return restore_result_payload(result_path, payload)
+
+
+def _referenced_columns(value: Any) -> Set[str]:
+    if isinstance(value, dict):
+        if set(value) == {COLUMN_REF_KEY}:
+            return {value[COLUMN_REF_KEY]}
+        names: Set[str] = set()
+        for item in value.values():
+            names |= _referenced_columns(item)
+        return names
+    return set()
+
+
+def _read_columns(archive_path: Path, names: Set[str]) -> Dict[str, Any]:
+    """按头部偏移只读取并解压 names 中的列"""
+    try:
+        with open(archive_path, "rb") as f:
+            prefix = f.read(len(_MAGIC) + _HEADER_LENGTH.size)
+            if len(prefix) != len(_MAGIC) + _HEADER_LENGTH.size or not prefix.startswith(_MAGIC):
+                raise ResultArchiveError(f"列文件格式无效: {archive_path}")
+            (header_length,) = _HEADER_LENGTH.unpack_from(prefix, len(_MAGIC))
+            try:
+                header = json.loads(f.read(header_length).decode("utf-8"))
+            except (UnicodeDecodeError, ValueError) as e:
+                raise ResultArchiveError(f"列文件头部损坏: {archive_path}") from e
+
+            codec = header.get("codec")
+            body_start = len(prefix) + header_length
+            infos = header.get("columns", {})
+            columns: Dict[str, Any] = {}
+            # 按偏移顺序读取，顺序访问磁盘
+            for name in sorted(names & set(infos), key=lambda n: infos[n]["offset"]):
+                info = infos[name]
+                f.seek(body_start + info["offset"])
+                blob = f.read(info["size"])
+                raw = _decompress(blob, codec, info["raw_size"])
+                if info["encoding"] == ENCODING_TEXT:
+                    columns[name] = raw.decode("utf-8")
+                else:
+                    stored = _decode(raw, np.dtype(info["stored_dtype"]), info["length"], info["encoding"])
+                    columns[name] = stored.astype(np.dtype(info["dtype"]), copy=False)
+    except OSError as e:
+        raise ResultArchiveError(f"无法读取列文件: {archive_path}: {e}") from e
+    return columns
+
+
+def _resolve(value: Any, columns: Dict[str, Any]) -> Any:
+    if isinstance(value, dict):
+        if set(value) == {COLUMN_REF_KEY}:
+            name = value[COLUMN_REF_KEY]
+            if name not in columns:
+                raise ResultArchiveError(f"列文件缺少列: {name}")
+            return columns[name]
+        return {key: _resolve(item, columns) for key, item in value.items()}
+    return value
+
+
+# ============================================================
+# 编码与压缩
+# ============================================================
+
+def _is_monotonic(array: np.ndarray) -> bool:
+    if array.size < 2 or array.dtype.kind != "f" or not np.isfinite(array).all():
+        return False
+    steps = np.diff(array)
+    return bool((steps >= 0).all() or (steps <= 0).all())
+
+
+def _encode(array: np.ndarray, encoding: str) -> bytes:
+    itemsize = array.dtype.itemsize
+    if encoding == ENCODING_DELTA:
+        bits = np.ascontiguousarray(array).view(np.dtype(f"<u{itemsize}"))
+        # 无符号差分按模回绕，cumsum 还原逐位精确
+        array = np.diff(bits, prepend=bits.dtype.type(0))
+    planes = np.frombuffer(np.ascontiguousarray(array).tobytes(), dtype=np.uint8)
+    return planes.reshape(-1, itemsize).T.tobytes()
+
+
+def _decode(raw: bytes, dtype: np.dtype, length: int, encoding: str) -> np.ndarray:
+    itemsize = dtype.itemsize
+    planes = np.frombuffer(raw, dtype=np.uint8).reshape(itemsize, length)
+    interleaved = np.ascontiguousarray(planes.T)
+    if encoding == ENCODING_DELTA:
+        deltas = interleaved.view(np.dtype(f"<u{itemsize}")).reshape(length)
+        bits = np.cumsum(deltas, dtype=deltas.dtype)
+        return bits.view(dtype)
+    return interleaved.view(dtype).reshape(length)
+
+
+def _compress(raw: bytes, codec: str) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ResultArchiveError("zstandard 未安装，无法使用 zstd 压缩")
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(raw)
+    if codec == CODEC_ZLIB:
+        return zlib.compress(raw, _ZLIB_LEVEL)
+    raise ResultArchiveError(f"不支持的压缩算法: {codec}")
+
+
+def _decompress(blob: bytes, codec: Optional[str], raw_size: int) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ResultArchiveError("该归档使用 zstd 压缩，需要安装 zstandard")
+        decompressor = zstandard.ZstdDecompressor()
+        decompress = lambda: decompressor.decompress(blob, max_output_size=raw_size)
+    elif codec == CODEC_ZLIB:
+        decompress = lambda: zlib.decompress(blob)
+    else:
+        raise ResultArchiveError(f"不支持的压缩算法: {codec}")
+    try:
+        return decompress()
+    except Exception as e:
+        raise ResultArchiveError(f"列数据解压失败: {e}") from e
+
+
+def _atomic_write_bytes(path: Path, content: bytes) -> None:
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_bytes(content)
+    os.replace(temp_path, path)
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "ARCHIVE_FORMAT",
+    "ARCHIVE_FORMAT_VERSION",
+    "ARCHIVE_MARKER_KEY",
+    "CODEC_ZLIB",
+    "CODEC_ZSTD",
+    "ResultArchiveError",
+    "default_codec",
+    "is_archived_payload",
+    "load_result_columns",
+    "load_result_payload",
+    "pack_result_archive",
+    "restore_result_payload",
+    "write_result_archive",
+]
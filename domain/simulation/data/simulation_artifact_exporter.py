@@ -3,9 +3,12 @@ import json
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Final, List, Optional, Tuple
+from typing import Any, Dict, Final, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from domain.simulation.data.op_result_data_builder import op_result_data_builder
+from domain.simulation.data.output_log_index import build_output_log_index
 from domain.simulation.data.png_metadata import inject_png_text_chunks
 from domain.simulation.data.simulation_output_reader import simulation_output_reader
 from domain.simulation.data.waveform_data_service import waveform_data_service
@@ -45,11 +48,31 @@ RESULT_JSON_FILENAME: Final[str] = "result.json"
 # coordinator. Two writers, same filename, one schema.
 EXPORT_MANIFEST_FILENAME: Final[str] = "export_manifest.json"
 
+# Columnar sidecar of an archived bundle (see ``bundle_archive``): the
+# numeric arrays and raw output moved out of ``result.json``, which is
+# left as a header stub that references the sidecar columns.
+RESULT_ARCHIVE_FILENAME: Final[str] = "result.columns"
+
+# Per-project job index (JSON lines) under ``CANONICAL_RESULTS_DIR``:
+# ``SimulationJobManager`` appends the slim record of every terminal job
+# it evicts from memory so ``query(job_id)`` keeps resolving. Not a
+# bundle file — readers that scan for ``result.json`` never see it.
+JOB_INDEX_FILENAME: Final[str] = "job_index.jsonl"
+
 # Artifact-type tag for the manifest payload itself (keeps all
 # ``artifact_type`` values authored in this file, not strewn across
 # persistence / coordinator code).
 ARTIFACT_TYPE_EXPORT_MANIFEST: Final[str] = "export_manifest"
 
+# Rows formatted and written per block by the raw-data CSV writer. Peak
+# formatting memory is ``chunk rows x columns`` strings, independent of
+# the total sample count.
+RAW_DATA_CSV_CHUNK_ROWS: Final[int] = 16384
+
+# ``csv.writer``'s default terminator; the block writer emits the same
+# bytes so the CSV is identical to the previous row-by-row output.
+_CSV_LINE_TERMINATOR: Final[str] = "\r\n"
+
 # ---- Canonical category names ----
 #
 # These names are simultaneously:
@@ -143,10 +166,16 @@ class RawDataArtifactPaths:
 
 @dataclass(frozen=True)
 class OutputLogArtifactPaths:
-    """Canonical paths for the ``output_log`` artifact category."""
+    """Canonical paths for the ``output_log`` artifact category.
+
+    ``index_path`` is the line index derived from ``output_log.txt``
+    (see ``output_log_index``). It is a rebuildable cache, so it is not
+    reported among the exported files.
+    """
     directory: Path
     text_path: Path
     json_path: Path
+    index_path: Path
 
 
 @dataclass(frozen=True)
@@ -201,6 +230,10 @@ class SimulationArtifactExporter:
         """Canonical ``result.json`` path at the bundle root."""
         return Path(export_root) / RESULT_JSON_FILENAME
 
+    def result_archive_path(self, export_root: str | Path) -> Path:
+        """Canonical columnar sidecar path of an archived bundle."""
+        return Path(export_root) / RESULT_ARCHIVE_FILENAME
+
     def export_manifest_path(self, export_root: str | Path) -> Path:
         """Canonical ``export_manifest.json`` path at the bundle root."""
         return Path(export_root) / EXPORT_MANIFEST_FILENAME
@@ -235,6 +268,7 @@ class SimulationArtifactExporter:
             directory=directory,
             text_path=directory / "output_log.txt",
             json_path=directory / "output_log.json",
+            index_path=directory / "output_log.index.npz",
         )
 
     def op_result_paths(self, export_root: str | Path) -> OpResultArtifactPaths:
@@ -451,6 +485,43 @@ class SimulationArtifactExporter:
             for row in rows:
                 writer.writerow([row.get(column, "") for column in columns])
 
+    def write_csv_columns_with_header(
+        self,
+        path: str | Path,
+        result: SimulationResult,
+        artifact_type: str,
+        columns: List[str],
+        arrays: Sequence[np.ndarray],
+        *,
+        blank_non_finite: Sequence[bool] = (),
+        chunk_rows: int = RAW_DATA_CSV_CHUNK_ROWS,
+    ) -> int:
+        """Column-oriented sibling of ``write_csv_with_header``.
+
+        Streams ``arrays`` (one float column per entry in ``columns``)
+        to disk in blocks of ``chunk_rows``: each block is formatted a
+        column at a time and joined into lines, so no per-row Python
+        objects are ever materialised for the whole table. Values are
+        written with ``repr(float)`` exactly as ``csv.writer`` would;
+        columns flagged in ``blank_non_finite`` write NaN/inf as empty
+        cells. Returns the number of data rows written.
+        """
+        blank_flags = list(blank_non_finite) + [False] * (len(arrays) - len(blank_non_finite))
+        row_count = min((len(array) for array in arrays), default=0)
+        chunk_rows = max(1, int(chunk_rows))
+        with Path(path).open("w", newline="", encoding="utf-8") as handle:
+            handle.write(self.build_text_header_block(result, artifact_type))
+            csv.writer(handle).writerow(columns)
+            for start in range(0, row_count, chunk_rows):
+                stop = min(start + chunk_rows, row_count)
+                cells = [
+                    self._format_csv_block(array[start:stop], blank)
+                    for array, blank in zip(arrays, blank_flags)
+                ]
+                handle.write(_CSV_LINE_TERMINATOR.join(map(",".join, zip(*cells))))
+                handle.write(_CSV_LINE_TERMINATOR)
+        return row_count
+
     def inject_png_linkage(self, path: str | Path, result: SimulationResult, artifact_type: str) -> bool:
         """Rewrite a PNG file in place with canonical circuit-linkage
         tEXt chunks. Returns ``True`` if the file was touched.
@@ -478,6 +549,14 @@ class SimulationArtifactExporter:
         ]
         rows = [self._metric_to_row(metric) for metric in metrics]
         self.write_csv_with_header(paths.csv_path, result, CATEGORY_METRICS, columns, rows)
+        # 用导出的波形重新计算 .MEASURE 值，便于发现 ngspice 结果与数据不一致。
+        # 延迟导入：交叉校验从本包导入测量内核，而本包的 __init__ 又导入本模块
+        from domain.simulation.measure.measure_cross_check import (
+            CROSS_CHECK_MISMATCH,
+            measure_cross_checker,
+        )
+
+        cross_checks = measure_cross_checker.check(result.data, result.measurements)
 
         self._write_json(paths.json_path, self.build_artifact_payload(
             result=result,
@@ -485,6 +564,7 @@ class SimulationArtifactExporter:
             summary={
                 "metric_count": len(rows),
                 "metrics_with_target": sum(1 for row in rows if row.get("target")),
+                "cross_check_mismatches": sum(1 for check in cross_checks if check.status == CROSS_CHECK_MISMATCH),
             },
             files={
                 "csv": paths.csv_path.name,
@@ -492,6 +572,7 @@ class SimulationArtifactExporter:
             data={
                 "columns": columns,
                 "rows": rows,
+                "cross_checks": [check.to_dict() for check in cross_checks],
             },
         ))
         return [str(paths.csv_path), str(paths.json_path)]
@@ -521,6 +602,14 @@ class SimulationArtifactExporter:
         return [str(paths.json_path), str(paths.text_path)]
 
     def export_raw_data(self, export_root: Path, result: SimulationResult) -> List[str]:
+        """Export the full raw-data table.
+
+        ``raw_data.csv`` is the single on-disk column store for the
+        table: it is streamed straight from the snapshot's NumPy columns.
+        ``raw_data.json`` only describes that store (column order, row
+        count, per-signal column index) instead of repeating the values,
+        so a waveform is persisted once here and once in ``result.json``.
+        """
         paths = self.raw_data_paths(export_root)
         paths.directory.mkdir(parents=True, exist_ok=True)
 
@@ -528,16 +617,24 @@ class SimulationArtifactExporter:
         x_label = snapshot.x_label if snapshot is not None else result.get_x_axis_label()
         signal_names = list(snapshot.signal_names) if snapshot is not None else []
         columns = [x_label, *signal_names]
-        rows = self._build_snapshot_rows(snapshot)
-        series = self._build_snapshot_series(snapshot)
+        arrays: List[np.ndarray] = []
+        if snapshot is not None:
+            arrays = [snapshot.x_values, *(snapshot.signal_columns[name] for name in signal_names)]
 
-        self.write_csv_with_header(paths.csv_path, result, CATEGORY_RAW_DATA, columns, rows)
+        row_count = self.write_csv_columns_with_header(
+            paths.csv_path,
+            result,
+            CATEGORY_RAW_DATA,
+            columns,
+            arrays,
+            blank_non_finite=[False] + [True] * len(signal_names),
+        )
 
         self._write_json(paths.json_path, self.build_artifact_payload(
             result,
             CATEGORY_RAW_DATA,
             summary={
-                "row_count": len(rows),
+                "row_count": row_count,
                 "signal_count": len(signal_names),
                 "x_axis_label": x_label,
             },
@@ -546,8 +643,15 @@ class SimulationArtifactExporter:
             },
             data={
                 "columns": columns,
-                "rows": rows,
-                "series": series,
+                "row_count": row_count,
+                "storage": {
+                    "format": "csv",
+                    "file": paths.csv_path.name,
+                    "comment_prefix": "#",
+                    "header_row": True,
+                    "missing_value": "",
+                },
+                "series": self._build_snapshot_series(snapshot, row_count),
             },
         ))
         return [str(paths.csv_path), str(paths.json_path)]
@@ -582,6 +686,7 @@ class SimulationArtifactExporter:
                 "lines": [line.to_dict() for line in log_lines],
             },
         ))
+        build_output_log_index(paths.text_path, paths.index_path)
         return [str(paths.text_path), str(paths.json_path)]
 
     def export_op_result(self, export_root: Path, result: SimulationResult) -> List[str]:
@@ -621,40 +726,27 @@ class SimulationArtifactExporter:
             "target": str(getattr(metric, "target", "") or ""),
         }
 
-    def _build_snapshot_rows(self, snapshot) -> List[Dict[str, Any]]:
-        if snapshot is None:
-            return []
+    def _format_csv_block(self, values: np.ndarray, blank_non_finite: bool) -> List[str]:
+        cells = list(map(repr, np.asarray(values, dtype=float).tolist()))
+        if blank_non_finite:
+            for index in np.flatnonzero(~np.isfinite(values)).tolist():
+                cells[index] = ""
+        return cells
 
-        rows: List[Dict[str, Any]] = []
-        for row_index in range(snapshot.total_rows):
-            row: Dict[str, Any] = {snapshot.x_label: float(snapshot.x_values[row_index])}
-            for signal_name in snapshot.signal_names:
-                column = snapshot.signal_columns.get(signal_name)
-                if column is None or row_index >= len(column):
-                    row[signal_name] = ""
-                    continue
-                raw_value = column[row_index]
-                row[signal_name] = float(raw_value) if self._is_finite_number(raw_value) else ""
-            rows.append(row)
-        return rows
-
-    def _build_snapshot_series(self, snapshot) -> List[Dict[str, Any]]:
+    def _build_snapshot_series(self, snapshot, row_count: int) -> List[Dict[str, Any]]:
+        """Per-signal index into the CSV column store (no sample values)."""
         if snapshot is None:
             return []
 
-        x_values = [float(value) for value in snapshot.x_values]
         series: List[Dict[str, Any]] = []
-        for signal_name in snapshot.signal_names:
+        for column_index, signal_name in enumerate(snapshot.signal_names, start=1):
             column = snapshot.signal_columns.get(signal_name)
-            values = []
-            if column is not None:
-                for raw_value in column:
-                    values.append(float(raw_value) if self._is_finite_number(raw_value) else None)
+            finite_count = int(np.count_nonzero(np.isfinite(column))) if column is not None else 0
             series.append({
                 "name": signal_name,
-                "x": x_values,
-                "y": values,
-                "point_count": len(values),
+                "column": column_index,
+                "point_count": row_count,
+                "finite_count": finite_count,
             })
         return series
 
@@ -732,13 +824,6 @@ class SimulationArtifactExporter:
     def _write_json(self, path: Path, payload: Dict[str, Any]) -> None:
         path.write_text(self.dumps_json(payload), encoding="utf-8")
 
-    def _is_finite_number(self, value: Any) -> bool:
-        try:
-            number = float(value)
-        except (TypeError, ValueError):
-            return False
-        return number == number and number not in (float("inf"), float("-inf"))
-
 
 simulation_artifact_exporter = SimulationArtifactExporter()
 
@@ -750,8 +835,11 @@ __all__ = [
     "CANONICAL_RESULTS_DIR",
     "EXPORT_SCHEMA_VERSION",
     "RESULT_JSON_FILENAME",
+    "RESULT_ARCHIVE_FILENAME",
     "EXPORT_MANIFEST_FILENAME",
+    "JOB_INDEX_FILENAME",
     "ARTIFACT_TYPE_EXPORT_MANIFEST",
+    "RAW_DATA_CSV_CHUNK_ROWS",
     # Canonical category names
     "CATEGORY_METRICS",
     "CATEGORY_ANALYSIS_INFO",
@@ -14,6 +14,24 @@ by ``simulation_artifact_exporter`` (Step 15 canonical layout schema);
 this service only decides **which** categories to emit and **in what
 order**. It never constructs artifact paths itself.
 
+Persistence is two-phase. Phase one commits ``result.json`` and an
+``export_manifest.json`` that lists every derived category as
+``pending``; phase two exports the categories and rewrites the
+manifest as each one becomes ``ready`` (or ``failed``). Callers that
+must not block on derived I/O (``SimulationService`` before the job
+manager publishes ``EVENT_SIM_COMPLETE``) pass
+``defer_derived_exports=True`` and phase two runs on a single
+background I/O worker. Readers that need a category call
+``ensure_bundle_categories``: it waits for a category that is already
+being written, or claims and writes a still-pending one on the
+caller's thread, so an agent read never has to queue behind unrelated
+categories.
+
+Archived bundles (see ``bundle_archive``) reuse the same machinery:
+their bulky derived categories are deleted and recorded as
+``archived``. Such a category is never exported in the background; the
+first reader that ensures it regenerates it from ``result.json``.
+
 UI chart/waveform PNG rendering is intentionally **not** performed
 here — that still runs in the display layer because it needs the
 user's current viewport / signal-visibility state. Agents that want
@@ -29,10 +47,15 @@ agent's job manager, and standalone unit tests.
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Mapping, Optional, Sequence
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
 
 from domain.simulation.data.op_result_data_builder import op_result_data_builder
 from domain.simulation.data.simulation_artifact_exporter import (
@@ -69,6 +92,19 @@ _LOGGER = logging.getLogger(__name__)
 
 ARTIFACT_CATEGORY_ORDER = HEADLESS_ARTIFACT_CATEGORIES
 
+# Per-category readiness recorded under ``data.category_status`` of the
+# manifest. ``running`` is only ever observed from another process
+# (or after a crash); in-process readers wait on the export job instead.
+EXPORT_STATUS_PENDING = "pending"
+EXPORT_STATUS_RUNNING = "running"
+EXPORT_STATUS_READY = "ready"
+EXPORT_STATUS_FAILED = "failed"
+# Files dropped by the archival tier; rebuilt only when a reader asks.
+EXPORT_STATUS_ARCHIVED = "archived"
+
+# Upper bound a reader waits for a category another thread is writing.
+DEFAULT_ARTIFACT_WAIT_SECONDS = 30.0
+
 
 @dataclass
 class BundlePersistenceResult:
@@ -89,10 +125,23 @@ class BundlePersistenceResult:
     errors: List[Dict[str, str]] = field(default_factory=list)
     """Per-category failures; empty when everything succeeded."""
 
+    pending_categories: List[str] = field(default_factory=list)
+    """Categories queued for background export when the call returned."""
+
+    _export_job: Optional["_BundleExportJob"] = field(
+        default=None, repr=False, compare=False
+    )
+
     @property
     def success(self) -> bool:
         return not self.errors
 
+    def wait_for_exports(self, timeout: Optional[float] = None) -> bool:
+        """Block until every deferred category finished (or ``timeout``)."""
+        if self._export_job is None:
+            return True
+        return self._export_job.wait_all(timeout)
+
 
 class SimulationArtifactPersistence:
     """Write the full bundle for a simulation result in one call."""
@@ -102,6 +151,8 @@ class SimulationArtifactPersistence:
         project_root: str,
         result: SimulationResult,
         metric_targets: Optional[Mapping[str, str]] = None,
+        *,
+        defer_derived_exports: bool = False,
     ) -> BundlePersistenceResult:
         """Create the bundle directory and flush every pure-data artifact.
 
@@ -111,6 +162,10 @@ class SimulationArtifactPersistence:
             metric_targets: ``{metric_name: target_text}`` map. The UI
                 caller passes ``MetricTargetService.get_targets_for_file``;
                 headless callers (agent job manager) pass ``{}``.
+            defer_derived_exports: When ``True`` only ``result.json`` and
+                the manifest are written before returning; the derived
+                categories are exported on the background I/O worker
+                and listed in ``pending_categories``.
         """
         if not project_root:
             raise ValueError("project_root is required for bundle persistence")
@@ -134,28 +189,144 @@ class SimulationArtifactPersistence:
             category_files={RESULT_JSON_FILENAME: [RESULT_JSON_FILENAME]},
         )
 
-        metrics = self._build_display_metrics(result, metric_targets)
-
-        for category in ARTIFACT_CATEGORY_ORDER:
-            if category == CATEGORY_OP_RESULT and not op_result_data_builder.is_available(result):
-                continue
-            try:
-                files = self._export_category(export_root, result, category, metrics)
-            except Exception as exc:  # pragma: no cover - defensive
-                _LOGGER.warning(
-                    "Bundle category '%s' failed to persist: %s", category, exc
-                )
-                outcome.errors.append({"artifact_type": category, "message": str(exc)})
-                continue
-            outcome.written_files.extend(files)
-            outcome.category_files[category] = self._as_relative(export_root, files)
+        categories = [
+            category
+            for category in ARTIFACT_CATEGORY_ORDER
+            if category != CATEGORY_OP_RESULT or op_result_data_builder.is_available(result)
+        ]
+        job = _BundleExportJob(
+            self, export_root, result, dict(metric_targets or {}), outcome, categories
+        )
+        job.write_manifest()
 
-        manifest_path = self._write_manifest(export_root, result, outcome)
-        outcome.written_files.append(str(manifest_path))
-        outcome.category_files[ARTIFACT_TYPE_EXPORT_MANIFEST] = [manifest_path.name]
+        if defer_derived_exports and categories:
+            outcome.pending_categories = list(categories)
+            outcome._export_job = job
+            _register_export_job(job)
+            _export_queue().submit(job.run_all)
+        else:
+            job.run_all()
 
         return outcome
 
+    def ensure_categories(
+        self,
+        export_root: str | Path,
+        categories: Sequence[str],
+        result: Optional[SimulationResult] = None,
+        timeout: float = DEFAULT_ARTIFACT_WAIT_SECONDS,
+        result_loader: Optional[Callable[[], Optional[SimulationResult]]] = None,
+    ) -> Dict[str, str]:
+        """Make sure ``categories`` of a bundle are on disk before reading.
+
+        A category that is being exported is waited for; one that is
+        still pending is exported on the calling thread. Bundles whose
+        manifest carries no readiness record (older bundles, manual
+        exports) are reported as ready and left untouched. When the
+        in-process job is gone (the app restarted mid-export), pending
+        categories are resumed from ``result``; archived categories are
+        regenerated from ``result`` only when requested here. Callers that
+        do not hold the result can pass ``result_loader`` instead; it is
+        called only when such a resume is needed.
+
+        Returns:
+            ``{category: status}`` for the requested categories.
+        """
+        export_root = Path(export_root)
+        job = _ACTIVE_EXPORT_JOBS.get(_export_key(export_root))
+        if job is None:
+            statuses = self._read_category_status(export_root)
+            unfinished = [
+                category for category in categories
+                if statuses.get(category) in (
+                    EXPORT_STATUS_PENDING, EXPORT_STATUS_RUNNING, EXPORT_STATUS_ARCHIVED
+                )
+            ]
+            if unfinished and result is None and result_loader is not None:
+                result = result_loader()
+            if not unfinished or result is None:
+                return {
+                    category: statuses.get(category, EXPORT_STATUS_READY)
+                    for category in categories
+                }
+            job = self._resume_job(export_root, result)
+            if job is None:
+                return {category: statuses.get(category, EXPORT_STATUS_READY) for category in categories}
+
+        return {category: job.ensure(category, timeout) for category in categories}
+
+    def archive_categories(
+        self,
+        export_root: str | Path,
+        categories: Sequence[str],
+        *,
+        dry_run: bool = False,
+    ) -> Dict[str, int]:
+        """Delete ``ready`` derived categories and mark them ``archived``.
+
+        Only categories with an explicit ``ready`` record are dropped:
+        without one ``ensure_categories`` could never rebuild them.
+        Bundles with an in-process export job are left alone. With
+        ``dry_run`` nothing is deleted or rewritten.
+
+        Returns:
+            ``{category: bytes_removed}`` for every archived category.
+        """
+        export_root = Path(export_root)
+        if _export_key(export_root) in _ACTIVE_EXPORT_JOBS:
+            return {}
+        manifest_path = simulation_artifact_exporter.export_manifest_path(export_root)
+        try:
+            payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        data = payload.get("data") if isinstance(payload, dict) else None
+        status = data.get("category_status") if isinstance(data, dict) else None
+        if not isinstance(status, dict):
+            return {}
+
+        removed: Dict[str, int] = {}
+        for category in categories:
+            if (
+                category not in self._CATEGORY_DIRECTORIES
+                or status.get(category) != EXPORT_STATUS_READY
+            ):
+                continue
+            directory = self._CATEGORY_DIRECTORIES[category](export_root)
+            removed[category] = sum(
+                path.stat().st_size for path in directory.rglob("*") if path.is_file()
+            ) if directory.is_dir() else 0
+            if not dry_run:
+                shutil.rmtree(directory, ignore_errors=True)
+            status[category] = EXPORT_STATUS_ARCHIVED
+        if not removed or dry_run:
+            return removed
+
+        prefixes = tuple(f"{category}/" for category in removed)
+        data["exported_files"] = [
+            path for path in data.get("exported_files", [])
+            if not (isinstance(path, str) and path.startswith(prefixes))
+        ]
+        data["persisted_categories"] = [
+            category for category in data.get("persisted_categories", [])
+            if category not in removed
+        ]
+        files = payload.get("files")
+        if isinstance(files, dict) and isinstance(files.get("categories"), dict):
+            for category in removed:
+                files["categories"].pop(category, None)
+        summary = payload.get("summary")
+        if isinstance(summary, dict):
+            summary["category_count"] = len(data["persisted_categories"])
+            summary["exported_file_count"] = len(data["exported_files"])
+        temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        temp_path.write_text(
+            simulation_artifact_exporter.dumps_json(payload),
+            encoding="utf-8",
+        )
+        os.replace(temp_path, manifest_path)
+        return removed
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -204,11 +375,23 @@ class SimulationArtifactPersistence:
             simulation_artifact_exporter.export_op_result(root, result),
     }
 
+    # Category -> bundle subdirectory, resolved through the exporter's
+    # canonical path helpers (used when archiving drops a category).
+    _CATEGORY_DIRECTORIES = {
+        CATEGORY_METRICS:       lambda root: simulation_artifact_exporter.metrics_paths(root).directory,
+        CATEGORY_ANALYSIS_INFO: lambda root: simulation_artifact_exporter.analysis_info_paths(root).directory,
+        CATEGORY_RAW_DATA:      lambda root: simulation_artifact_exporter.raw_data_paths(root).directory,
+        CATEGORY_OUTPUT_LOG:    lambda root: simulation_artifact_exporter.output_log_paths(root).directory,
+        CATEGORY_OP_RESULT:     lambda root: simulation_artifact_exporter.op_result_paths(root).directory,
+    }
+
     def _write_manifest(
         self,
         export_root: Path,
         result: SimulationResult,
         outcome: BundlePersistenceResult,
+        category_status: Mapping[str, str],
+        metric_targets: Mapping[str, str],
     ) -> Path:
         manifest_path = simulation_artifact_exporter.export_manifest_path(export_root)
         persisted_categories = [
@@ -216,13 +399,21 @@ class SimulationArtifactPersistence:
             for category in (RESULT_JSON_FILENAME, *ARTIFACT_CATEGORY_ORDER)
             if category in outcome.category_files
         ]
+        exported_files = [
+            path for path in outcome.written_files if Path(path) != manifest_path
+        ]
+        pending_count = sum(
+            1 for status in category_status.values()
+            if status in (EXPORT_STATUS_PENDING, EXPORT_STATUS_RUNNING)
+        )
         payload = simulation_artifact_exporter.build_artifact_payload(
             result,
             ARTIFACT_TYPE_EXPORT_MANIFEST,
             summary={
                 "category_count": len(persisted_categories),
-                "exported_file_count": len(outcome.written_files) + 1,
+                "exported_file_count": len(exported_files) + 1,
                 "error_count": len(outcome.errors),
+                "pending_count": pending_count,
             },
             files={
                 "categories": {
@@ -233,18 +424,85 @@ class SimulationArtifactPersistence:
             },
             data={
                 "persisted_categories": persisted_categories,
+                "category_status": dict(category_status),
+                "metric_targets": dict(metric_targets),
                 "exported_files": self._as_relative(
-                    export_root, [*outcome.written_files, str(manifest_path)]
+                    export_root, [*exported_files, str(manifest_path)]
                 ),
                 "errors": outcome.errors,
             },
         )
-        manifest_path.write_text(
+        # Readers may poll the manifest while phase two rewrites it:
+        # write a sibling temp file and swap it in atomically.
+        temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        temp_path.write_text(
             simulation_artifact_exporter.dumps_json(payload),
             encoding="utf-8",
         )
+        os.replace(temp_path, manifest_path)
         return manifest_path
 
+    def _read_manifest_section(self, export_root: Path, section: str) -> Dict:
+        manifest_path = simulation_artifact_exporter.export_manifest_path(export_root)
+        try:
+            payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        value = payload.get(section) if isinstance(payload, dict) else None
+        return value if isinstance(value, dict) else {}
+
+    def read_category_status(self, export_root: str | Path) -> Dict[str, str]:
+        """Per-category status from the manifest; empty when none is recorded."""
+        return self._read_category_status(Path(export_root))
+
+    def _read_category_status(self, export_root: Path) -> Dict[str, str]:
+        status = self._read_manifest_section(export_root, "data").get("category_status")
+        return dict(status) if isinstance(status, dict) else {}
+
+    def _resume_job(
+        self,
+        export_root: Path,
+        result: SimulationResult,
+    ) -> Optional["_BundleExportJob"]:
+        """Rebuild an export job from a manifest left behind by another run."""
+        data = self._read_manifest_section(export_root, "data")
+        status = data.get("category_status")
+        if not isinstance(status, dict):
+            return None
+
+        outcome = BundlePersistenceResult(
+            export_root=export_root,
+            result_path="",
+            written_files=[
+                str(export_root / path)
+                for path in data.get("exported_files", [])
+                if isinstance(path, str)
+            ],
+            errors=[error for error in data.get("errors", []) if isinstance(error, dict)],
+        )
+        category_files = self._read_manifest_section(export_root, "files").get("categories")
+        if isinstance(category_files, dict):
+            outcome.category_files.update(category_files)
+        targets = data.get("metric_targets")
+        job = _BundleExportJob(
+            self,
+            export_root,
+            result,
+            dict(targets) if isinstance(targets, dict) else {},
+            outcome,
+            [category for category in ARTIFACT_CATEGORY_ORDER if category in status],
+        )
+        for category, category_status in status.items():
+            if category_status in (EXPORT_STATUS_READY, EXPORT_STATUS_FAILED):
+                job.mark_finished(category, category_status)
+            elif category_status == EXPORT_STATUS_ARCHIVED:
+                job.mark_archived(category)
+        registered = _register_export_job(job)
+        if registered is job and job.has_pending():
+            # Finish the remaining pending categories in the background.
+            _export_queue().submit(job.run_all)
+        return registered
+
     def _as_relative(self, export_root: Path, file_paths: Sequence[str]) -> List[str]:
         root = export_root.resolve()
         relative: List[str] = []
@@ -259,12 +517,210 @@ class SimulationArtifactPersistence:
         return relative
 
 
+class _BundleExportJob:
+    """Phase-two state of one bundle.
+
+    Each category is claimed exactly once — by the background worker or
+    by a reader that needs it first — and every state change rewrites
+    the manifest under the job lock.
+    """
+
+    def __init__(
+        self,
+        persistence: SimulationArtifactPersistence,
+        export_root: Path,
+        result: SimulationResult,
+        metric_targets: Dict[str, str],
+        outcome: BundlePersistenceResult,
+        categories: Sequence[str],
+    ) -> None:
+        self.persistence = persistence
+        self.export_root = export_root
+        self.result = result
+        self.metric_targets = metric_targets
+        self.outcome = outcome
+        self.categories = list(categories)
+        self.status: Dict[str, str] = {
+            category: EXPORT_STATUS_PENDING for category in self.categories
+        }
+        self._done = {category: threading.Event() for category in self.categories}
+        self._lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._metrics: Optional[List[DisplayMetric]] = None
+
+    def write_manifest(self) -> None:
+        with self._lock:
+            self._write_manifest_locked()
+
+    def run_all(self) -> None:
+        try:
+            for category in self.categories:
+                self.run(category)
+        finally:
+            _unregister_export_job(self)
+
+    def run(self, category: str, include_archived: bool = False) -> None:
+        claimable = (
+            (EXPORT_STATUS_PENDING, EXPORT_STATUS_ARCHIVED)
+            if include_archived
+            else (EXPORT_STATUS_PENDING,)
+        )
+        with self._lock:
+            if self.status.get(category) not in claimable:
+                return
+            self.status[category] = EXPORT_STATUS_RUNNING
+
+        try:
+            files = self.persistence._export_category(
+                self.export_root, self.result, category, self._display_metrics()
+            )
+        except Exception as exc:
+            _LOGGER.warning(
+                "Bundle category '%s' failed to persist: %s", category, exc
+            )
+            with self._lock:
+                self.outcome.errors.append({"artifact_type": category, "message": str(exc)})
+                self._finish_locked(category, EXPORT_STATUS_FAILED)
+            return
+
+        with self._lock:
+            self.outcome.written_files.extend(files)
+            self.outcome.category_files[category] = self.persistence._as_relative(
+                self.export_root, files
+            )
+            self._finish_locked(category, EXPORT_STATUS_READY)
+
+    def ensure(self, category: str, timeout: Optional[float]) -> str:
+        if category not in self.status:
+            return EXPORT_STATUS_READY
+        self.run(category, include_archived=True)
+        self._done[category].wait(timeout)
+        with self._lock:
+            status = self.status[category]
+        if not self.has_pending(include_running=True):
+            # A job resumed only for archived categories has no
+            # ``run_all`` to unregister it once the reader is served.
+            _unregister_export_job(self)
+        return status
+
+    def has_pending(self, include_running: bool = False) -> bool:
+        unfinished = (
+            (EXPORT_STATUS_PENDING, EXPORT_STATUS_RUNNING)
+            if include_running
+            else (EXPORT_STATUS_PENDING,)
+        )
+        with self._lock:
+            return any(status in unfinished for status in self.status.values())
+
+    def mark_finished(self, category: str, status: str) -> None:
+        with self._lock:
+            self.status[category] = status
+            self._done[category].set()
+
+    def mark_archived(self, category: str) -> None:
+        with self._lock:
+            self.status[category] = EXPORT_STATUS_ARCHIVED
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        for category in self.categories:
+            if not self._done[category].wait(timeout):
+                return False
+        return True
+
+    def _display_metrics(self) -> List[DisplayMetric]:
+        with self._metrics_lock:
+            if self._metrics is None:
+                self._metrics = self.persistence._build_display_metrics(
+                    self.result, self.metric_targets
+                )
+            return self._metrics
+
+    def _finish_locked(self, category: str, status: str) -> None:
+        self.status[category] = status
+        try:
+            self._write_manifest_locked()
+        finally:
+            self._done[category].set()
+
+    def _write_manifest_locked(self) -> None:
+        manifest_path = self.persistence._write_manifest(
+            self.export_root,
+            self.result,
+            self.outcome,
+            self.status,
+            self.metric_targets,
+        )
+        self.outcome.category_files[ARTIFACT_TYPE_EXPORT_MANIFEST] = [manifest_path.name]
+        if str(manifest_path) not in self.outcome.written_files:
+            self.outcome.written_files.append(str(manifest_path))
+
+
+# ---------------------------------------------------------------------------
+# Background I/O queue
+# ---------------------------------------------------------------------------
+#
+# One worker thread: derived exports are disk-bound, and running them
+# in submission order keeps the newest bundle from starving older ones.
+# Active jobs are tracked per export root so readers in any thread find
+# the job that owns a bundle.
+
+_ACTIVE_EXPORT_JOBS: Dict[str, _BundleExportJob] = {}
+_ACTIVE_EXPORT_JOBS_LOCK = threading.Lock()
+_EXPORT_QUEUE: Optional[ThreadPoolExecutor] = None
+
+
+def _export_key(export_root: Path) -> str:
+    return str(Path(export_root).resolve())
+
+
+def _export_queue() -> ThreadPoolExecutor:
+    global _EXPORT_QUEUE
+    with _ACTIVE_EXPORT_JOBS_LOCK:
+        if _EXPORT_QUEUE is None:
+            _EXPORT_QUEUE = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="bundle-export"
+            )
+        return _EXPORT_QUEUE
+
+
+def _register_export_job(job: _BundleExportJob) -> _BundleExportJob:
+    with _ACTIVE_EXPORT_JOBS_LOCK:
+        return _ACTIVE_EXPORT_JOBS.setdefault(_export_key(job.export_root), job)
+
+
+def _unregister_export_job(job: _BundleExportJob) -> None:
+    with _ACTIVE_EXPORT_JOBS_LOCK:
+        key = _export_key(job.export_root)
+        if _ACTIVE_EXPORT_JOBS.get(key) is job:
+            del _ACTIVE_EXPORT_JOBS[key]
+
+
 simulation_artifact_persistence = SimulationArtifactPersistence()
 
 
+def ensure_bundle_categories(
+    export_root: str | Path,
+    categories: Sequence[str],
+    result: Optional[SimulationResult] = None,
+    timeout: float = DEFAULT_ARTIFACT_WAIT_SECONDS,
+    result_loader: Optional[Callable[[], Optional[SimulationResult]]] = None,
+) -> Dict[str, str]:
+    """Module-level shortcut for ``SimulationArtifactPersistence.ensure_categories``."""
+    return simulation_artifact_persistence.ensure_categories(
+        export_root, categories, result=result, timeout=timeout, result_loader=result_loader
+    )
+
+
 __all__ = [
     "SimulationArtifactPersistence",
     "simulation_artifact_persistence",
     "BundlePersistenceResult",
     "ARTIFACT_CATEGORY_ORDER",
+    "DEFAULT_ARTIFACT_WAIT_SECONDS",
+    "EXPORT_STATUS_ARCHIVED",
+    "EXPORT_STATUS_FAILED",
+    "EXPORT_STATUS_PENDING",
+    "EXPORT_STATUS_READY",
+    "EXPORT_STATUS_RUNNING",
+    "ensure_bundle_categories",
 ]
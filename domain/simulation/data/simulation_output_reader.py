@@ -10,6 +10,8 @@
 
 设计原则：
 - 从 SimulationResult.raw_output 字段读取日志
+- 结果包中存在 output_log.txt 时，查询经由该日志的行索引
+  （output_log_index）只读取需要的行；否则回退为全量解析 raw_output
 - 支持从文件路径或内存数据读取
 - 日志级别基于关键词匹配识别
 - 提供结构化的日志行数据
@@ -34,7 +36,13 @@ import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from domain.simulation.data.result_column_store import ResultArchiveError, load_result_payload
+
+if TYPE_CHECKING:
+    from domain.simulation.data.output_log_index import OutputLogIndex
+    from domain.simulation.models.simulation_result import SimulationResult
 
 
 # ============================================================
@@ -269,6 +277,10 @@ class SimulationOutputReader:
         Returns:
             List[LogLine]: 日志行列表
         """
+        index = self.get_output_log_index(sim_result_path, project_root)
+        if index is not None:
+            return index.read_lines(0, max_lines)
+
         raw_output = self._load_raw_output(sim_result_path, project_root)
         if not raw_output:
             return []
@@ -310,6 +322,10 @@ class SimulationOutputReader:
         Returns:
             List[LogLine]: 错误行列表
         """
+        index = self.get_output_log_index(sim_result_path, project_root)
+        if index is not None:
+            return index.read_level(LogLevel.ERROR.value)
+
         all_lines = self.get_output_log(sim_result_path, project_root)
         return [line for line in all_lines if line.is_error()]
     
@@ -328,6 +344,10 @@ class SimulationOutputReader:
         Returns:
             List[LogLine]: 警告行列表
         """
+        index = self.get_output_log_index(sim_result_path, project_root)
+        if index is not None:
+            return index.read_level(LogLevel.WARNING.value)
+
         all_lines = self.get_output_log(sim_result_path, project_root)
         return [line for line in all_lines if line.is_warning()]
     
@@ -353,6 +373,10 @@ class SimulationOutputReader:
         if not keyword:
             return []
         
+        index = self.get_output_log_index(sim_result_path, project_root)
+        if index is not None:
+            return index.search(keyword, case_sensitive=case_sensitive)
+
         all_lines = self.get_output_log(sim_result_path, project_root)
         
         if case_sensitive:
@@ -387,6 +411,10 @@ class SimulationOutputReader:
             self._logger.warning(f"无效的正则表达式: {pattern}, 错误: {e}")
             return []
         
+        index = self.get_output_log_index(sim_result_path, project_root)
+        if index is not None:
+            return index.search_regex(regex)
+
         all_lines = self.get_output_log(sim_result_path, project_root)
         return [line for line in all_lines if regex.search(line.content)]
     
@@ -408,31 +436,36 @@ class SimulationOutputReader:
         # 加载仿真结果元数据
         result_data = self._load_result_data(sim_result_path, project_root)
         
-        # 解析日志行
-        raw_output = result_data.get("raw_output", "") if result_data else ""
-        log_lines = self._parse_log_lines(raw_output, max_lines=10000)
-        
-        # 统计各级别数量
-        error_count = sum(1 for line in log_lines if line.is_error())
-        warning_count = sum(1 for line in log_lines if line.is_warning())
-        info_count = len(log_lines) - error_count - warning_count
-        
-        # 获取第一个错误
-        first_error = None
-        for line in log_lines:
-            if line.is_error():
-                first_error = line.content
-                break
+        index = self.get_output_log_index(sim_result_path, project_root)
+        if index is not None:
+            # 统计来自索引，覆盖整份日志
+            summary = index.summary()
+        else:
+            # 解析日志行
+            raw_output = result_data.get("raw_output", "") if result_data else ""
+            log_lines = self._parse_log_lines(raw_output, max_lines=10000)
+            
+            # 统计各级别数量
+            error_count = sum(1 for line in log_lines if line.is_error())
+            warning_count = sum(1 for line in log_lines if line.is_warning())
+            summary = SimulationSummary(
+                total_lines=len(log_lines),
+                error_count=error_count,
+                warning_count=warning_count,
+                info_count=len(log_lines) - error_count - warning_count,
+                # 获取第一个错误
+                first_error=next((line.content for line in log_lines if line.is_error()), None),
+            )
         
         return SimulationSummary(
-            total_lines=len(log_lines),
-            error_count=error_count,
-            warning_count=warning_count,
-            info_count=info_count,
+            total_lines=summary.total_lines,
+            error_count=summary.error_count,
+            warning_count=summary.warning_count,
+            info_count=summary.info_count,
             analysis_type=result_data.get("analysis_type", "") if result_data else "",
             duration_seconds=result_data.get("duration_seconds", 0.0) if result_data else 0.0,
             success=result_data.get("success", True) if result_data else True,
-            first_error=first_error,
+            first_error=summary.first_error,
             timestamp=result_data.get("timestamp", "") if result_data else "",
         )
     
@@ -456,6 +489,113 @@ class SimulationOutputReader:
         
         return [line for line in log_lines if line.level == level]
     
+    def detect_log_level(self, content: str) -> str:
+        """
+        检测日志级别
+        
+        基于关键词匹配识别日志级别。
+        优先级：error > warning > info
+        
+        Args:
+            content: 日志内容
+            
+        Returns:
+            str: 日志级别
+        """
+        if not content:
+            return LogLevel.INFO.value
+        
+        # 检查错误关键词
+        if self._error_pattern.search(content):
+            return LogLevel.ERROR.value
+        
+        # 检查警告关键词
+        if self._warning_pattern.search(content):
+            return LogLevel.WARNING.value
+        
+        return LogLevel.INFO.value
+    
+    def get_output_log_page(
+        self,
+        sim_result_path: str,
+        project_root: str,
+        offset: int = 0,
+        limit: int = 1000,
+        level: str = "all"
+    ) -> List[LogLine]:
+        """
+        分页读取日志（可按级别过滤）
+        
+        有索引时只读取该页涉及的行；否则解析整份日志后切片。
+        
+        Args:
+            sim_result_path: 仿真结果相对路径
+            project_root: 项目根目录
+            offset: 跳过的行数（按过滤后的行计）
+            limit: 本页最大行数
+            level: 日志级别（info/warning/error/all）
+            
+        Returns:
+            List[LogLine]: 本页日志行
+        """
+        index = self.get_output_log_index(sim_result_path, project_root)
+        if index is not None:
+            return index.read_level(level, offset=offset, limit=limit)
+        
+        raw_output = self._load_raw_output(sim_result_path, project_root)
+        if not raw_output:
+            return []
+        all_lines = self._parse_log_lines(raw_output, max_lines=raw_output.count("\n") + 1)
+        return self.filter_by_level(all_lines, level)[offset:offset + limit]
+    
+    def get_output_log_index(
+        self,
+        sim_result_path: str,
+        project_root: str
+    ) -> Optional["OutputLogIndex"]:
+        """
+        获取结果包 output_log.txt 的行索引
+        
+        索引在导出 output_log 时构建并写入结果包；缺失或过期时在此
+        重建。output_log 仍在后台导出时先等待其完成；结果包中没有
+        就绪的 output_log.txt 时返回 None（调用方回退到 raw_output）。
+        
+        Args:
+            sim_result_path: 仿真结果相对路径（结果包中的 result.json）
+            project_root: 项目根目录
+            
+        Returns:
+            Optional[OutputLogIndex]: 日志索引
+        """
+        if not sim_result_path or not project_root:
+            return None
+        
+        # 延迟导入：导出器与索引模块都依赖本模块
+        from domain.simulation.data.output_log_index import open_output_log_index
+        from domain.simulation.data.simulation_artifact_exporter import (
+            CATEGORY_OUTPUT_LOG,
+            simulation_artifact_exporter,
+        )
+        from domain.simulation.data.simulation_artifact_persistence import (
+            EXPORT_STATUS_READY,
+            ensure_bundle_categories,
+        )
+        
+        bundle_dir = (Path(project_root) / sim_result_path).parent
+        # 后台导出写文件不是原子的：未就绪时不读半写的 output_log.txt。
+        # 进程内已无导出任务（应用重启、类别已归档）时才加载结果续导
+        status = ensure_bundle_categories(
+            bundle_dir,
+            [CATEGORY_OUTPUT_LOG],
+            result_loader=lambda: self._load_result(sim_result_path, project_root),
+        )[CATEGORY_OUTPUT_LOG]
+        if status != EXPORT_STATUS_READY:
+            return None
+        paths = simulation_artifact_exporter.output_log_paths(bundle_dir)
+        if not paths.text_path.is_file():
+            return None
+        return open_output_log_index(paths.text_path, paths.index_path)
+    
     # ============================================================
     # 内部方法
     # ============================================================
@@ -481,6 +621,32 @@ class SimulationOutputReader:
         
         return result_data.get("raw_output")
     
+    def _load_result(
+        self,
+        sim_result_path: str,
+        project_root: str
+    ) -> Optional["SimulationResult"]:
+        """
+        加载仿真结果对象（续导工件时使用）
+        
+        Args:
+            sim_result_path: 仿真结果相对路径
+            project_root: 项目根目录
+            
+        Returns:
+            Optional[SimulationResult]: 仿真结果；加载或解析失败时为 None
+        """
+        from domain.simulation.models.simulation_result import SimulationResult
+        
+        result_data = self._load_result_data(sim_result_path, project_root)
+        if not result_data:
+            return None
+        try:
+            return SimulationResult.from_dict(result_data)
+        except (KeyError, TypeError, ValueError) as e:
+            self._logger.error(f"解析仿真结果失败: {sim_result_path}, 错误: {e}")
+            return None
+    
     def _load_result_data(
         self,
         sim_result_path: str,
@@ -505,9 +671,9 @@ class SimulationOutputReader:
             return None
 
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            # 归档的结果包由列文件还原 raw_output
+            return load_result_payload(full_path)
+        except (json.JSONDecodeError, ResultArchiveError, IOError) as e:
             self._logger.error(f"加载仿真结果失败: {full_path}, 错误: {e}")
             return None
     
@@ -533,7 +699,7 @@ class SimulationOutputReader:
         result = []
         
         for i, content in enumerate(lines[:max_lines], start=1):
-            level = self._detect_log_level(content)
+            level = self.detect_log_level(content)
             result.append(LogLine(
                 line_number=i,
                 content=content,
@@ -541,32 +707,6 @@ class SimulationOutputReader:
             ))
         
         return result
-    
-    def _detect_log_level(self, content: str) -> str:
-        """
-        检测日志级别
-        
-        基于关键词匹配识别日志级别。
-        优先级：error > warning > info
-        
-        Args:
-            content: 日志内容
-            
-        Returns:
-            str: 日志级别
-        """
-        if not content:
-            return LogLevel.INFO.value
-        
-        # 检查错误关键词
-        if self._error_pattern.search(content):
-            return LogLevel.ERROR.value
-        
-        # 检查警告关键词
-        if self._warning_pattern.search(content):
-            return LogLevel.WARNING.value
-        
-        return LogLevel.INFO.value
 
 
 # ============================================================
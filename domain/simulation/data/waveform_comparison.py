@@ -0,0 +1,616 @@
+# Waveform Comparison - Cross-Run Signal Comparison
+"""
+跨结果波形比较
+
+职责：
+- 按结果包 id 与信号名只读取需要的信号列（result_column_store.load_result_columns），
+  不构建单次结果的金字塔
+- 将各次运行的信号重采样到共享 x 网格（向量化插值，同一 x 轴的运行一次插值）
+- 计算相对参考运行的差值、包络（min/max）、均值/标准差与逐运行统计
+- 按视口返回降采样叠加数据，供波形图一次绘制全部运行
+
+使用示例：
+    from domain.simulation.data.waveform_comparison import waveform_comparison_service
+
+    comparisons = waveform_comparison_service.compare(
+        project_root,
+        ["simulation_results/amp/20260101_000000", ...],
+        ["V(out)"],
+    )
+    comparison = comparisons["V(out)"]
+    overlay = comparison.overlay(x_min=0.0, x_max=1e-3, target_points=1000)
+
+设计说明：
+- 归档结果包只解压被请求的列；未归档的 result.json 仍需完整解析 JSON，
+  解析后只保留请求的信号，并按 (路径, mtime, 大小) 缓存
+- 共享网格取各运行 x 范围的交集；与已选范围不重叠的运行记为跳过
+- 叠加降采样使用按桶 min/max 抽取：全部运行在同一组桶上一次计算，
+  保留每条曲线的峰值，50 条运行缩放时仍只需一次数组运算
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from domain.simulation.data.result_column_store import ResultArchiveError, load_result_columns
+from domain.simulation.data.signal_semantics import normalize_simulation_signal_name
+from domain.simulation.data.simulation_artifact_exporter import (
+    RESULT_JSON_FILENAME,
+    simulation_artifact_exporter,
+)
+from domain.simulation.data.waveform_data_service import (
+    TABLE_COMPLEX_SUFFIXES,
+    waveform_data_service,
+)
+from domain.simulation.data.waveform_measurements import interpolate_at
+from domain.simulation.models.simulation_result import SimulationResult
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+# 共享网格点数上限（50 次运行 × 65536 点 float64 约 26 MB）
+MAX_GRID_POINTS = 65536
+
+# 叠加数据默认点数（与波形图视口点数一致）
+DEFAULT_OVERLAY_POINTS = 1000
+
+# 信号列缓存条目数（每条为一个结果文件中的一个信号）
+DEFAULT_CACHE_SIZE = 256
+
+
+# ============================================================
+# 数据类定义
+# ============================================================
+
+@dataclass
+class ComparisonRun:
+    """
+    参与比较的一次运行
+
+    Attributes:
+        bundle_id: 调用方传入的结果包 id
+        result_path: result.json 绝对路径
+        signal_name: 该运行中解析得到的信号名（复数信号为 _mag 等分量）
+        timestamp: 仿真时间戳
+        point_count: 原始采样点数
+    """
+    bundle_id: str
+    result_path: Path
+    signal_name: str
+    timestamp: str = ""
+    point_count: int = 0
+
+    @property
+    def label(self) -> str:
+        return self.timestamp or self.bundle_id
+
+
+@dataclass
+class RunStatistics:
+    """单次运行相对参考运行的统计量"""
+    bundle_id: str
+    max_abs_diff: float
+    rms_diff: float
+    mean: float
+    minimum: float
+    maximum: float
+
+
+@dataclass
+class ComparisonOverlay:
+    """
+    视口范围内的降采样叠加数据
+
+    run_x / run_y 形状为 (运行数, 点数)，各运行的 x 不同（min/max 抽取
+    位置不同）；均值与包络共用 envelope_x。
+    """
+    run_x: np.ndarray
+    run_y: np.ndarray
+    envelope_x: np.ndarray
+    mean: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    source_points: int
+
+    def flattened_runs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """全部运行拼成一条曲线，运行之间以 NaN 断开（connect="finite"）"""
+        runs = self.run_x.shape[0]
+        gap = np.full((runs, 1), np.nan)
+        x = np.hstack((self.run_x, gap)).ravel()
+        y = np.hstack((self.run_y, gap)).ravel()
+        return x[:-1], y[:-1]
+
+
+@dataclass
+class WaveformComparison:
+    """
+    单个信号在多次运行上的比较结果
+
+    Attributes:
+        signal_name: 请求的信号名
+        x_label: x 轴标签（取参考运行）
+        log_x: x 轴是否对数刻度
+        x: 共享 x 网格（递增）
+        values: 形状为 (运行数, 网格点数) 的重采样信号
+        runs: 参与比较的运行，顺序与 values 行一致
+        skipped: 被跳过的结果包 id -> 原因
+        reference_index: 参考运行在 runs 中的下标
+    """
+    signal_name: str
+    x_label: str
+    log_x: bool
+    x: np.ndarray
+    values: np.ndarray
+    runs: List[ComparisonRun]
+    skipped: Dict[str, str] = field(default_factory=dict)
+    reference_index: int = 0
+
+    @property
+    def run_count(self) -> int:
+        return len(self.runs)
+
+    @property
+    def reference(self) -> np.ndarray:
+        return self.values[self.reference_index]
+
+    @functools.cached_property
+    def diff(self) -> np.ndarray:
+        """各运行减参考运行"""
+        return self.values - self.reference
+
+    @functools.cached_property
+    def mean(self) -> np.ndarray:
+        return self.values.mean(axis=0)
+
+    @functools.cached_property
+    def std(self) -> np.ndarray:
+        return self.values.std(axis=0)
+
+    @functools.cached_property
+    def lower(self) -> np.ndarray:
+        return self.values.min(axis=0)
+
+    @functools.cached_property
+    def upper(self) -> np.ndarray:
+        return self.values.max(axis=0)
+
+    def run_statistics(self) -> List[RunStatistics]:
+        """逐运行统计（差值相对参考运行）"""
+        abs_diff = np.abs(self.diff)
+        max_abs = abs_diff.max(axis=1)
+        rms = np.sqrt(np.mean(self.diff ** 2, axis=1))
+        means = self.values.mean(axis=1)
+        minimums = self.values.min(axis=1)
+        maximums = self.values.max(axis=1)
+        return [
+            RunStatistics(
+                bundle_id=run.bundle_id,
+                max_abs_diff=float(max_abs[index]),
+                rms_diff=float(rms[index]),
+                mean=float(means[index]),
+                minimum=float(minimums[index]),
+                maximum=float(maximums[index]),
+            )
+            for index, run in enumerate(self.runs)
+        ]
+
+    def overlay(
+        self,
+        x_min: Optional[float] = None,
+        x_max: Optional[float] = None,
+        target_points: int = DEFAULT_OVERLAY_POINTS,
+    ) -> ComparisonOverlay:
+        """
+        获取 [x_min, x_max] 范围内的降采样叠加数据
+
+        范围两侧各多取一个网格点，保证曲线延伸到视口边缘。
+
+        Args:
+            x_min: 范围下限，None 表示网格起点
+            x_max: 范围上限，None 表示网格终点
+            target_points: 每条曲线的目标点数上限
+        """
+        start = 0 if x_min is None else max(int(np.searchsorted(self.x, x_min, side="left")) - 1, 0)
+        stop = len(self.x) if x_max is None else min(int(np.searchsorted(self.x, x_max, side="right")) + 1, len(self.x))
+        stop = max(stop, min(start + 1, len(self.x)))
+        x = self.x[start:stop]
+        values = self.values[:, start:stop]
+        lower = self.lower[start:stop]
+        upper = self.upper[start:stop]
+        mean = self.mean[start:stop]
+
+        buckets = max(int(target_points) // 2, 1)
+        if len(x) <= max(int(target_points), 2):
+            return ComparisonOverlay(
+                run_x=np.broadcast_to(x, values.shape).copy(),
+                run_y=values.copy(),
+                envelope_x=x.copy(),
+                mean=mean.copy(),
+                lower=lower.copy(),
+                upper=upper.copy(),
+                source_points=len(x),
+            )
+
+        run_index, run_y = _min_max_decimate(values, buckets)
+        size = -(-len(x) // buckets)
+        return ComparisonOverlay(
+            run_x=x[run_index],
+            run_y=run_y,
+            envelope_x=_bucket_centers(x, size),
+            mean=_bucket_reduce(mean, size, np.nanmean, np.nan),
+            lower=_bucket_reduce(lower, size, np.nanmin, np.inf),
+            upper=_bucket_reduce(upper, size, np.nanmax, -np.inf),
+            source_points=len(x),
+        )
+
+
+# ============================================================
+# 降采样辅助函数
+# ============================================================
+
+def _padded_buckets(values: np.ndarray, size: int, fill: float) -> np.ndarray:
+    """(行, n) -> (行, 桶数, size)，末桶以 fill 补齐"""
+    rows, count = values.shape
+    buckets = -(-count // size)
+    padded = np.full((rows, buckets * size), fill, dtype=float)
+    padded[:, :count] = values
+    return padded.reshape(rows, buckets, size)
+
+
+def _min_max_decimate(values: np.ndarray, buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    逐行按桶取最小/最大值，每桶输出 2 点（按原顺序）
+
+    Returns:
+        (网格下标, 值)，形状均为 (行, 2 × 实际桶数)
+    """
+    count = values.shape[1]
+    size = -(-count // buckets)
+    finite = np.where(np.isnan(values), np.inf, values)
+    low_index = _padded_buckets(finite, size, np.inf).argmin(axis=2)
+    finite = np.where(np.isnan(values), -np.inf, values)
+    high_index = _padded_buckets(finite, size, -np.inf).argmax(axis=2)
+
+    offsets = np.arange(low_index.shape[1]) * size
+    first = np.minimum(low_index, high_index) + offsets
+    second = np.maximum(low_index, high_index) + offsets
+    index = np.minimum(np.stack((first, second), axis=2).reshape(values.shape[0], -1), count - 1)
+    return index, np.take_along_axis(values, index, axis=1)
+
+
+def _bucket_centers(x: np.ndarray, size: int) -> np.ndarray:
+    count = len(x)
+    starts = np.arange(0, count, size)
+    stops = np.minimum(starts + size, count) - 1
+    return (x[starts] + x[stops]) / 2
+
+
+def _bucket_reduce(values: np.ndarray, size: int, reducer, fill: float) -> np.ndarray:
+    reduced = reducer(_padded_buckets(values[None, :], size, fill)[0], axis=1)
+    return np.where(np.isinf(reduced), np.nan, reduced)
+
+
+# ============================================================
+# WaveformComparisonService
+# ============================================================
+
+@dataclass
+class _RunColumns:
+    """单个结果文件中一个信号的原始列"""
+    x: np.ndarray
+    y: np.ndarray
+    signal_name: str
+    x_label: str
+    log_x: bool
+    timestamp: str
+
+
+class WaveformComparisonService:
+    """
+    跨结果波形比较服务
+
+    只读取请求的信号列，结果按 (路径, mtime, 大小, 信号) 缓存；
+    结果文件改写后缓存键变化，自动失效。读写都在锁内完成。
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self._cache_size = cache_size
+        self._cache: OrderedDict[Tuple[str, int, int, str], Optional[_RunColumns]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compare(
+        self,
+        project_root: str,
+        bundle_ids: Sequence[str],
+        signal_names: Sequence[str],
+        *,
+        reference: int = 0,
+        grid_points: Optional[int] = None,
+        x_range: Optional[Tuple[float, float]] = None,
+    ) -> Dict[str, WaveformComparison]:
+        """
+        比较多次运行中的信号
+
+        Args:
+            project_root: 项目根目录
+            bundle_ids: 结果包 id（相对项目根目录的结果包目录或 result.json 路径）
+            signal_names: 要比较的信号名
+            reference: 参考运行在 bundle_ids 中的下标；该运行被跳过时取第一个有效运行
+            grid_points: 共享网格点数，默认取各运行原始点数的最大值（不超过 MAX_GRID_POINTS）
+            x_range: 只比较该 x 范围（与各运行范围再取交集）
+
+        Returns:
+            信号名 -> WaveformComparison；没有任何有效运行的信号不出现在结果中
+        """
+        root = Path(project_root)
+        resolved_paths = [self._resolve_result_path(root, bundle_id) for bundle_id in bundle_ids]
+        columns_by_run = [
+            self._load_columns(path, signal_names) if path is not None else None
+            for path in resolved_paths
+        ]
+
+        comparisons: Dict[str, WaveformComparison] = {}
+        for signal_name in signal_names:
+            runs: List[ComparisonRun] = []
+            series: List[_RunColumns] = []
+            skipped: Dict[str, str] = {}
+            reference_index = 0
+            for index, (bundle_id, path) in enumerate(zip(bundle_ids, resolved_paths)):
+                columns = columns_by_run[index]
+                if path is None or columns is None:
+                    skipped[bundle_id] = "结果文件不存在或无法读取"
+                    continue
+                run_columns = columns.get(signal_name)
+                if run_columns is None:
+                    skipped[bundle_id] = f"信号不存在: {signal_name}"
+                    continue
+                if index == reference:
+                    reference_index = len(runs)
+                runs.append(ComparisonRun(
+                    bundle_id=bundle_id,
+                    result_path=path,
+                    signal_name=run_columns.signal_name,
+                    timestamp=run_columns.timestamp,
+                    point_count=len(run_columns.x),
+                ))
+                series.append(run_columns)
+
+            comparison = self._build_comparison(
+                signal_name, runs, series, skipped, reference_index, grid_points, x_range
+            )
+            if comparison is not None:
+                comparisons[signal_name] = comparison
+        return comparisons
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    # ============================================================
+    # 内部方法 - 读取
+    # ============================================================
+
+    def _resolve_result_path(self, project_root: Path, bundle_id: str) -> Optional[Path]:
+        path = Path(bundle_id)
+        if not path.is_absolute():
+            path = project_root / path
+        if path.name != RESULT_JSON_FILENAME:
+            path = simulation_artifact_exporter.result_json_path(path)
+        return path if path.is_file() else None
+
+    def _load_columns(
+        self,
+        result_path: Path,
+        signal_names: Sequence[str],
+    ) -> Optional[Dict[str, Optional[_RunColumns]]]:
+        """读取一个结果文件中的请求信号；缓存未命中的信号一次读取"""
+        try:
+            stat = result_path.stat()
+        except OSError:
+            return None
+        file_key = (str(result_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        loaded: Dict[str, Optional[_RunColumns]] = {}
+        missing: List[str] = []
+        with self._lock:
+            for signal_name in signal_names:
+                key = file_key + (signal_name,)
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    loaded[signal_name] = self._cache[key]
+                else:
+                    missing.append(signal_name)
+        if not missing:
+            return loaded
+
+        accepted = _signal_filter_names(missing)
+        try:
+            payload = load_result_columns(
+                result_path,
+                lambda name: name in accepted or normalize_simulation_signal_name(name) in accepted,
+            )
+            result = SimulationResult.from_dict(payload)
+        except (OSError, ValueError, ResultArchiveError, TypeError, KeyError):
+            return None
+
+        x = result.get_x_axis_data()
+        for signal_name in missing:
+            loaded[signal_name] = _extract_run_columns(result, x, signal_name)
+
+        with self._lock:
+            for signal_name in missing:
+                self._cache[file_key + (signal_name,)] = loaded[signal_name]
+                self._cache.move_to_end(file_key + (signal_name,))
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return loaded
+
+    # ============================================================
+    # 内部方法 - 重采样
+    # ============================================================
+
+    def _build_comparison(
+        self,
+        signal_name: str,
+        runs: List[ComparisonRun],
+        series: List[_RunColumns],
+        skipped: Dict[str, str],
+        reference_index: int,
+        grid_points: Optional[int],
+        x_range: Optional[Tuple[float, float]],
+    ) -> Optional[WaveformComparison]:
+        if not runs:
+            return None
+        reference_columns = series[reference_index]
+        log_x = reference_columns.log_x
+
+        # 以参考运行为起点逐个求交集；不重叠的运行跳过
+        low, high = _axis_range(reference_columns.x, log_x)
+        if x_range is not None:
+            low, high = max(low, min(x_range)), min(high, max(x_range))
+        kept = []
+        for index, columns in enumerate(series):
+            run_low, run_high = _axis_range(columns.x, log_x)
+            if index != reference_index and (max(low, run_low) >= min(high, run_high)):
+                skipped[runs[index].bundle_id] = "x 范围与其它运行不重叠"
+                continue
+            low, high = max(low, run_low), min(high, run_high)
+            kept.append(index)
+        if not (np.isfinite(low) and np.isfinite(high)) or low > high:
+            for index in kept:
+                skipped[runs[index].bundle_id] = "x 范围无效"
+            return None
+
+        reference_index = kept.index(reference_index)
+        runs = [runs[index] for index in kept]
+        series = [series[index] for index in kept]
+
+        grid = self._build_grid(series, low, high, log_x, grid_points)
+        values = np.empty((len(series), len(grid)), dtype=float)
+        # 相同 x 轴的运行一次插值（蒙特卡洛运行通常共享步长）
+        groups: Dict[Tuple[int, bytes], List[int]] = {}
+        for index, columns in enumerate(series):
+            groups.setdefault((len(columns.x), columns.x.tobytes()), []).append(index)
+        for indexes in groups.values():
+            x = series[indexes[0]].x
+            if len(x) == len(grid) and np.array_equal(x, grid):
+                values[indexes] = np.stack([series[index].y for index in indexes])
+            else:
+                stacked = np.stack([series[index].y for index in indexes])
+                values[indexes] = interpolate_at(x, stacked, grid)
+
+        return WaveformComparison(
+            signal_name=signal_name,
+            x_label=reference_columns.x_label,
+            log_x=log_x,
+            x=grid,
+            values=values,
+            runs=runs,
+            skipped=skipped,
+            reference_index=reference_index,
+        )
+
+    def _build_grid(
+        self,
+        series: List[_RunColumns],
+        low: float,
+        high: float,
+        log_x: bool,
+        grid_points: Optional[int],
+    ) -> np.ndarray:
+        if grid_points is None:
+            # 所有运行共享同一 x 轴且完整落在范围内时直接使用，免插值
+            first = series[0].x
+            if (
+                len(first) <= MAX_GRID_POINTS
+                and all(np.array_equal(columns.x, first) for columns in series[1:])
+                and np.all(np.diff(first) > 0)
+                and first[0] >= low and first[-1] <= high
+            ):
+                return np.asarray(first, dtype=float)
+            grid_points = max(len(columns.x) for columns in series)
+        count = int(min(max(grid_points, 2), MAX_GRID_POINTS))
+        if low == high:
+            return np.array([low], dtype=float)
+        if log_x:
+            return np.geomspace(low, high, count)
+        return np.linspace(low, high, count)
+
+
+# ============================================================
+# 辅助函数
+# ============================================================
+
+def _signal_filter_names(signal_names: Sequence[str]) -> set:
+    """请求信号对应的存储信号名候选（去掉复数分量后缀，含规范化名）"""
+    names = set()
+    for signal_name in signal_names:
+        base_name = signal_name
+        for suffix in TABLE_COMPLEX_SUFFIXES:
+            if signal_name.endswith(suffix):
+                base_name = signal_name[:-len(suffix)]
+                break
+        names.update((signal_name, base_name, normalize_simulation_signal_name(base_name)))
+    return names
+
+
+def _extract_run_columns(
+    result: SimulationResult,
+    x: Optional[np.ndarray],
+    signal_name: str,
+) -> Optional[_RunColumns]:
+    if x is None:
+        return None
+    resolved_name = waveform_data_service.resolve_signal_name(result, signal_name)
+    if resolved_name is None:
+        return None
+    y = waveform_data_service.get_signal_data(result, resolved_name)
+    if y is None or np.iscomplexobj(y) or len(y) != len(x) or len(x) == 0:
+        return None
+    return _RunColumns(
+        x=np.asarray(x, dtype=float),
+        y=np.asarray(y, dtype=float),
+        signal_name=resolved_name,
+        x_label=result.get_x_axis_label(),
+        log_x=result.is_x_axis_log(),
+        timestamp=result.timestamp or "",
+    )
+
+
+def _axis_range(x: np.ndarray, log_x: bool) -> Tuple[float, float]:
+    finite = x[np.isfinite(x)]
+    if log_x:
+        finite = finite[finite > 0]
+    if finite.size == 0:
+        return np.inf, -np.inf
+    return float(finite.min()), float(finite.max())
+
+
+# ============================================================
+# 模块级单例
+# ============================================================
+
+waveform_comparison_service = WaveformComparisonService()
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "DEFAULT_OVERLAY_POINTS",
+    "MAX_GRID_POINTS",
+    "ComparisonOverlay",
+    "ComparisonRun",
+    "RunStatistics",
+    "WaveformComparison",
+    "WaveformComparisonService",
+    "waveform_comparison_service",
+]
@@ -28,6 +28,7 @@
     table_snapshot = service.build_table_snapshot(result)
 """
 
+import threading
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from collections import OrderedDict
@@ -119,7 +120,8 @@ class LRUCache:
     """
     简单的 LRU 缓存实现
     
-    用于缓存信号的金字塔数据，避免重复构建。
+    用于缓存信号的金字塔数据，避免重复构建。agent 只读工具会在
+    工作线程中并发访问，读写都在锁内完成。
     """
     
     def __init__(self, max_size: int = 32):
@@ -131,30 +133,35 @@ class LRUCache:
         """
         self._max_size = max_size
         self._cache: OrderedDict[str, PyramidData] = OrderedDict()
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Optional[PyramidData]:
         """获取缓存项，命中时移动到末尾"""
-        if key in self._cache:
-            self._cache.move_to_end(key)
-            return self._cache[key]
-        return None
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            return None
     
     def put(self, key: str, value: PyramidData) -> None:
         """添加缓存项，超出容量时淘汰最旧的"""
-        if key in self._cache:
-            self._cache.move_to_end(key)
-        else:
-            if len(self._cache) >= self._max_size:
-                self._cache.popitem(last=False)
-        self._cache[key] = value
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            else:
+                if len(self._cache) >= self._max_size:
+                    self._cache.popitem(last=False)
+            self._cache[key] = value
     
     def clear(self) -> None:
         """清空缓存"""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
     
     def size(self) -> int:
         """获取当前缓存大小"""
-        return len(self._cache)
+        with self._lock:
+            return len(self._cache)
 
 
 # ============================================================
@@ -472,10 +479,7 @@ class WaveformDataService:
             column = np.full(total_rows, np.nan, dtype=float)
             if signal_data is not None:
                 limit = min(len(signal_data), total_rows)
-                for row in range(limit):
-                    scalar_value = self._to_table_scalar_value(signal_data[row])
-                    if scalar_value is not None:
-                        column[row] = scalar_value
+                column[:limit] = self._to_table_column(signal_data[:limit])
             signal_columns[signal_name] = column
 
         return TableSnapshot(
@@ -599,6 +603,23 @@ class WaveformDataService:
             return np.imag(complex_signal)
         return None
 
+    def _to_table_column(self, values: np.ndarray) -> np.ndarray:
+        """逐列转换为表格浮点列，规则与 _to_table_scalar_value 一致（不可转换的值为 NaN）"""
+        values = np.asarray(values)
+        if values.dtype.kind == "c":
+            column = values.real.astype(float)
+            column[np.abs(values.imag) > 1e-15] = np.nan
+            return column
+        if values.dtype.kind in "biuf":
+            return values.astype(float)
+
+        column = np.full(len(values), np.nan, dtype=float)
+        for row, value in enumerate(values):
+            scalar_value = self._to_table_scalar_value(value)
+            if scalar_value is not None:
+                column[row] = scalar_value
+        return column
+
     def _to_table_scalar_value(self, value: object) -> Optional[float]:
         if value is None:
             return None
@@ -0,0 +1,332 @@
+# Waveform Measurements - Vectorized Measurement Kernels
+"""
+波形测量内核
+
+职责：
+- 基于 NumPy 的波形测量函数，供光标读数、图表取样、信号统计
+  （simulation_series_stats）与 .MEASURE 交叉校验共用，不再各自
+  逐采样点循环
+- 覆盖：x 处插值、电平穿越、dB 幅度、RMS 与描述性统计
+  （SeriesSummary，含过零次数，可分块合并）
+
+批量约定：
+- x 轴为一维数组（长度 N），所有信号共享
+- y 的最后一维为采样维（长度 N），前面的任意维度（信号、扫描点……）
+  一次性批量计算；标量结果的形状为 y.shape[:-1]
+- 无法测得的结果（没有穿越、信号无摆幅等）返回 NaN，不抛异常
+- 除 summarize_series 外，输入应为有限值；
+  缺失采样用 NaN 表示，由 summarize_series 统一处理
+
+使用示例：
+    values = interpolate_at(x, y, [1e-6, 2e-6])     # y 形状 (2, N) → (2, 2)
+    t_cross = crossing_x(x, y, 0.5, edge=EDGE_RISE)  # shape (2,)
+    summary = summarize_series(y)                    # 各字段 shape (2,)
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+# 幅度转 dB 时的下限，避免 log10(0)
+_MIN_MAGNITUDE = 1e-300
+
+# 梯形积分：NumPy 2.0 起为 np.trapezoid，1.x 仅有 np.trapz
+trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+EDGE_RISE = "rise"
+EDGE_FALL = "fall"
+EDGE_CROSS = "cross"
+
+
+# ============================================================
+# 插值
+# ============================================================
+
+def interpolate_at(x: np.ndarray, y: np.ndarray, x_query) -> np.ndarray:
+    """
+    线性插值，语义与 np.interp 相同（范围外取端点值），但一次处理
+    y 的全部前置维度
+
+    x 可以单调递增或递减。
+
+    Returns:
+        形状为 y.shape[:-1] + np.shape(x_query) 的数组
+    """
+    return _InterpolationPlan(x, x_query).apply(np.asarray(y))
+
+
+def interpolate_columns(x: np.ndarray, columns: Sequence[np.ndarray], x_query) -> np.ndarray:
+    """
+    多条共享 x 轴的一维信号在同一组查询点上插值
+
+    与 interpolate_at 结果相同，但不需要先把信号堆叠成矩阵：区间查找
+    只做一次，每条信号只取查询点两侧的采样。
+
+    Returns:
+        形状为 (len(columns),) + np.shape(x_query) 的数组
+    """
+    plan = _InterpolationPlan(x, x_query)
+    if not columns:
+        return np.empty((0,) + plan.query.shape)
+    if plan.single:
+        return plan.apply(np.stack([np.asarray(column)[:1] for column in columns]))
+    # 每条信号只取查询点两侧与两端的采样，拼成小矩阵后一次计算
+    positions = np.concatenate((np.ravel(plan.lower), np.ravel(plan.upper), [plan.first, plan.last]))
+    gathered = np.stack([np.asarray(column)[positions] for column in columns])
+    size = np.size(plan.lower)
+    shape = (len(columns),) + np.shape(plan.lower)
+    return plan.combine(
+        gathered[:, :size].reshape(shape),
+        gathered[:, size:2 * size].reshape(shape),
+        gathered[:, -2],
+        gathered[:, -1],
+    )
+
+
+class _InterpolationPlan:
+    """查询点所在区间与端点钳位信息；同一 x 轴上的多条信号共用"""
+
+    def __init__(self, x: np.ndarray, x_query) -> None:
+        x = np.asarray(x, dtype=float)
+        self.query = np.asarray(x_query, dtype=float)
+        count = x.shape[0]
+        if count == 0:
+            raise ValueError("interpolate_at requires at least one sample")
+        self.single = count == 1
+        if self.single:
+            return
+        reverse = x[0] > x[-1]
+        ordered = x[::-1] if reverse else x
+        index = np.clip(np.searchsorted(ordered, self.query, side="right") - 1, 0, count - 2)
+        x0 = ordered[index]
+        self.dx = ordered[index + 1] - x0
+        self.offset = self.query - x0
+        self.below = self.query <= ordered[0]
+        self.above = self.query >= ordered[-1]
+        if reverse:
+            self.lower, self.upper = count - 1 - index, count - 2 - index
+            self.first, self.last = count - 1, 0
+        else:
+            self.lower, self.upper = index, index + 1
+            self.first, self.last = 0, count - 1
+
+    def apply(self, y: np.ndarray) -> np.ndarray:
+        if self.single:
+            return np.broadcast_to(y[..., :1], y.shape[:-1] + self.query.shape).copy()
+        return self.combine(y[..., self.lower], y[..., self.upper], y[..., self.first], y[..., self.last])
+
+    def combine(self, y0: np.ndarray, y1: np.ndarray, first: np.ndarray, last: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = np.where(self.dx != 0, (y1 - y0) / np.where(self.dx != 0, self.dx, 1.0), 0.0)
+        values = slope * self.offset + y0
+        expand = (1,) * self.query.ndim
+        first = np.reshape(first, np.shape(first) + expand)
+        last = np.reshape(last, np.shape(last) + expand)
+        values = np.where(self.below, first, values)
+        values = np.where(self.above, last, values)
+        return np.where(np.isnan(self.query), np.nan, values)
+
+
+# ============================================================
+# 电平穿越
+# ============================================================
+
+def crossing_x(
+    x: np.ndarray,
+    y: np.ndarray,
+    level=0.0,
+    *,
+    edge: str = EDGE_CROSS,
+    occurrence: int = 1,
+    after_x=None,
+) -> np.ndarray:
+    """
+    第 occurrence 次穿越 level 的 x 位置（相邻采样间线性插值）
+
+    Args:
+        x: x 轴（一维）
+        y: 信号（最后一维为采样）
+        level: 电平；标量或形状为 y.shape[:-1] 的数组
+        edge: "rise" / "fall" / "cross"
+        occurrence: 第几次穿越（从 1 开始）；负数表示倒数第几次
+        after_x: 只统计终点 x 大于该值的区间；标量或按行数组
+
+    Returns:
+        形状为 y.shape[:-1] 的数组，无对应穿越时为 NaN
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape[0] < 2 or occurrence == 0:
+        return np.full(y.shape[:-1], np.nan)
+    level = np.asarray(level, dtype=float)[..., None]
+    delta = y - level
+    before, after = delta[..., :-1], delta[..., 1:]
+    rising = (before < 0) & (after >= 0)
+    falling = (before > 0) & (after <= 0)
+    if edge == EDGE_RISE:
+        mask = rising
+    elif edge == EDGE_FALL:
+        mask = falling
+    else:
+        mask = rising | falling
+    if after_x is not None:
+        mask = mask & (x[1:] > np.asarray(after_x, dtype=float)[..., None])
+
+    if occurrence == 1:
+        segment = np.argmax(mask, axis=-1)
+    elif occurrence == -1:
+        segment = mask.shape[-1] - 1 - np.argmax(mask[..., ::-1], axis=-1)
+    else:
+        counts = np.cumsum(mask, axis=-1)
+        if occurrence > 0:
+            hit = mask & (counts == occurrence)
+        else:
+            hit = mask & (counts == counts[..., -1:] + occurrence + 1)
+        segment = np.argmax(hit, axis=-1)
+    found = np.take_along_axis(mask, segment[..., None], axis=-1)[..., 0]
+
+    d0 = np.take_along_axis(before, segment[..., None], axis=-1)[..., 0]
+    d1 = np.take_along_axis(after, segment[..., None], axis=-1)[..., 0]
+    x0 = x[segment]
+    x1 = x[segment + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = np.where(d0 != d1, d0 / (d0 - d1), 0.0)
+    return np.where(found, x0 + (x1 - x0) * fraction, np.nan)
+
+
+def _zero_crossing_count(y: np.ndarray) -> np.ndarray:
+    """
+    严格过零次数：相邻两个有效（有限）采样符号相反且都非零才计数；
+    中间夹 0 的过渡不计数。NaN 视为缺失，跳过后与前一个有效采样比较。
+    """
+    y = np.asarray(y, dtype=float)
+    if y.shape[-1] < 2:
+        return np.zeros(y.shape[:-1], dtype=np.int64)
+    valid = np.isfinite(y)
+    if valid.all():
+        return np.count_nonzero(y[..., 1:] * y[..., :-1] < 0, axis=-1)
+    previous_index = np.where(valid, np.arange(y.shape[-1]), -1)
+    previous_index = np.maximum.accumulate(previous_index, axis=-1)[..., :-1]
+    previous = np.take_along_axis(y, np.maximum(previous_index, 0), axis=-1)
+    flips = valid[..., 1:] & (previous_index >= 0) & (y[..., 1:] * previous < 0)
+    return np.count_nonzero(flips, axis=-1)
+
+
+# ============================================================
+# 幅值统计
+# ============================================================
+
+def magnitude_db(response: np.ndarray) -> np.ndarray:
+    """20·log10|H|"""
+    return 20.0 * np.log10(np.maximum(np.abs(np.asarray(response)), _MIN_MAGNITUDE))
+
+
+def rms(y: np.ndarray, x: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    均方根值；给定 x 时按梯形积分对 x 加权（与 .MEASURE RMS 一致，
+    适用于非等间距的瞬态时间步），否则为采样均方根
+    """
+    power = np.abs(np.asarray(y)) ** 2
+    if x is None:
+        return np.sqrt(power.mean(axis=-1))
+    x = np.asarray(x, dtype=float)
+    span = x[-1] - x[0]
+    if span == 0:
+        return np.sqrt(power.mean(axis=-1))
+    return np.sqrt(trapezoid(power, x, axis=-1) / span)
+
+
+# ============================================================
+# 描述性统计（可分块合并）
+# ============================================================
+
+@dataclass(frozen=True)
+class SeriesSummary:
+    """
+    每行信号的描述性统计；各字段形状均为 y.shape[:-1]
+
+    无有效采样的行：samples 为 0，其余浮点字段为 NaN。
+    """
+    samples: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    total: np.ndarray
+    initial: np.ndarray
+    final: np.ndarray
+    zero_crossings: np.ndarray
+
+    @property
+    def mean(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.samples > 0, self.total / np.maximum(self.samples, 1), np.nan)
+
+    def merge(self, later: "SeriesSummary") -> "SeriesSummary":
+        """合并紧随其后的一段采样的统计（用于分块流式读取）"""
+        both = (self.samples > 0) & (later.samples > 0)
+        boundary_flip = both & (self.final * later.initial < 0)
+        return SeriesSummary(
+            samples=self.samples + later.samples,
+            minimum=np.fmin(self.minimum, later.minimum),
+            maximum=np.fmax(self.maximum, later.maximum),
+            total=self.total + later.total,
+            initial=np.where(self.samples > 0, self.initial, later.initial),
+            final=np.where(later.samples > 0, later.final, self.final),
+            zero_crossings=self.zero_crossings + later.zero_crossings + boundary_flip,
+        )
+
+
+def summarize_series(y: np.ndarray) -> SeriesSummary:
+    """
+    计算 samples / min / max / sum / initial / final / zero_crossings
+
+    非有限值（NaN / inf）视为缺失采样。
+    """
+    y = np.asarray(y, dtype=float)
+    valid = np.isfinite(y)
+    samples = valid.sum(axis=-1)
+    has_samples = samples > 0
+    length = y.shape[-1]
+    if length == 0:
+        empty = np.full(y.shape[:-1], np.nan)
+        return SeriesSummary(
+            samples=samples, minimum=empty, maximum=empty, total=np.zeros(y.shape[:-1]),
+            initial=empty, final=empty, zero_crossings=np.zeros(y.shape[:-1], dtype=np.int64),
+        )
+    first = np.argmax(valid, axis=-1)
+    last = length - 1 - np.argmax(valid[..., ::-1], axis=-1)
+    initial = np.take_along_axis(y, first[..., None], axis=-1)[..., 0]
+    final = np.take_along_axis(y, last[..., None], axis=-1)[..., 0]
+    return SeriesSummary(
+        samples=samples,
+        minimum=np.where(has_samples, np.where(valid, y, np.inf).min(axis=-1), np.nan),
+        maximum=np.where(has_samples, np.where(valid, y, -np.inf).max(axis=-1), np.nan),
+        total=np.where(valid, y, 0.0).sum(axis=-1),
+        initial=np.where(has_samples, initial, np.nan),
+        final=np.where(has_samples, final, np.nan),
+        zero_crossings=_zero_crossing_count(y),
+    )
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "EDGE_CROSS",
+    "EDGE_FALL",
+    "EDGE_RISE",
+    "SeriesSummary",
+    "crossing_x",
+    "interpolate_at",
+    "interpolate_columns",
+    "magnitude_db",
+    "rms",
+    "summarize_series",
+    "trapezoid",
+]
@@ -14,7 +14,7 @@
 
 执行器列表：
 - SpiceExecutor: SPICE 仿真执行器（使用 ctypes 直接调用 ngspice 共享库）
-- PythonExecutor: Python 脚本执行器（在独立子进程中执行）
+- PythonExecutor: Python 脚本执行器（在预热的常驻子进程中执行）
 """
 
 from domain.simulation.executor.simulation_executor import SimulationExecutor
@@ -10,7 +10,8 @@
 - 扫描项目目录中的可仿真文件
 
 设计原则：
-- 复用现有的 IncludeParser 进行语句解析
+- 文件解析结果来自共享的 DependencyGraphService（按内容哈希缓存），
+  扫描与构建依赖图不再重复读取未变更的文件
 - 使用被引用分析法识别主电路
 - 提供清晰的文件类型判断规则
 - 返回结构化的分析结果
@@ -28,21 +29,22 @@
 """
 
 import logging
-import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 
-from domain.dependency.scanner.include_parser import IncludeParser, ParsedInclude
+from domain.dependency.scanner.include_parser import ParsedInclude
+from domain.dependency.service.dependency_graph_service import (
+    SIMULATION_COMMANDS,
+    CircuitFileRecord,
+    DependencyGraphService,
+    get_dependency_graph_service,
+)
 
 if TYPE_CHECKING:
     from domain.simulation.executor.executor_registry import ExecutorRegistry
 
 
-# ============================================================
-# 数据结构定义
-# ============================================================
-
 # ============================================================
 # 日志记录器
 # ============================================================
@@ -83,29 +85,22 @@ class CircuitAnalyzer:
     # 支持的电路文件扩展名（默认值，可通过 executor_registry 动态获取）
     CIRCUIT_EXTENSIONS = {".cir", ".sp", ".spice", ".net", ".ckt"}
     
-    # 仿真控制语句模式
-    SIMULATION_COMMANDS = {
-        ".ac", ".dc", ".tran", ".noise", ".op", ".tf", ".disto", ".pz", ".sens"
-    }
+    # 仿真控制语句
+    SIMULATION_COMMANDS = set(SIMULATION_COMMANDS)
     
-    # 子电路定义模式
-    SUBCKT_START_PATTERN = re.compile(r'^\s*\.subckt\s+', re.IGNORECASE)
-    SUBCKT_END_PATTERN = re.compile(r'^\s*\.ends\s*', re.IGNORECASE)
-    
-    # 参数定义模式
-    PARAM_PATTERN = re.compile(r'^\s*\.param\s+', re.IGNORECASE)
-    
-    # 模型定义模式
-    MODEL_PATTERN = re.compile(r'^\s*\.model\s+', re.IGNORECASE)
-    
-    def __init__(self, executor_registry: Optional["ExecutorRegistry"] = None):
+    def __init__(
+        self,
+        executor_registry: Optional["ExecutorRegistry"] = None,
+        graph_service: Optional[DependencyGraphService] = None,
+    ):
         """
         初始化电路分析器
         
         Args:
             executor_registry: 执行器注册表（可选），用于动态获取支持的扩展名
+            graph_service: 依赖图服务（可选），默认使用共享实例
         """
-        self.parser = IncludeParser()
+        self.graph = graph_service or get_dependency_graph_service()
         self._executor_registry = executor_registry
         self._logger = _logger
     
@@ -158,18 +153,19 @@ class CircuitAnalyzer:
         
         # 获取支持的扩展名
         extensions = self.get_supported_extensions()
+        suffixes = {ext.lower() for ext in extensions}
         
-        # 递归扫描所有电路文件
-        for ext in extensions:
-            for file_path in project_root.rglob(f"*{ext}"):
-                # 跳过隐藏目录和备份文件
-                if self._should_skip_file(file_path):
-                    continue
-                
-                # 提取文件信息
-                file_info = self._analyze_file(file_path, project_root)
-                if file_info:
-                    circuit_files.append(file_info)
+        # 依赖图遍历项目并只重新解析变更过的文件
+        for record in self.graph.refresh(str(project_root), extensions):
+            file_path = Path(record.path)
+            if file_path.suffix.lower() not in suffixes:
+                continue
+            
+            # 跳过隐藏目录和备份文件
+            if self._should_skip_file(file_path.relative_to(project_root)):
+                continue
+            
+            circuit_files.append(self._build_file_info(record, project_root))
         
         return circuit_files
     
@@ -183,8 +179,9 @@ class CircuitAnalyzer:
         Returns:
             List[ParsedInclude]: 解析出的引用列表
         """
-        # 使用 IncludeParser 解析
-        includes = self.parser.parse_file(file_path)
+        # 引用语句来自依赖图缓存
+        record = self.graph.get_record(file_path)
+        includes = record.to_parsed_includes() if record else []
         
         # 解析路径并检查文件是否存在
         file_path_obj = Path(file_path)
@@ -206,28 +203,38 @@ class CircuitAnalyzer:
         Returns:
             Dict[str, List[str]]: 依赖关系图，键为文件路径，值为该文件引用的文件列表
         """
-        project_root = Path(project_path).resolve()
         dep_graph = {}
         
-        # 扫描所有电路文件
-        circuit_files = self.scan_circuit_files(project_path)
-        
-        # 构建依赖关系
-        for file_info in circuit_files:
-            # 解析引用
-            includes = self.parse_includes(str(file_info.abs_path))
-            
-            # 提取存在的引用文件路径
-            referenced_files = [
+        # 扫描所有电路文件（引用已在扫描时解析）
+        for file_info in self.scan_circuit_files(project_path):
+            dep_graph[file_info.path] = [
                 inc.resolved_path
-                for inc in includes
+                for inc in file_info.references
                 if inc.exists and inc.resolved_path
             ]
-            
-            dep_graph[file_info.path] = referenced_files
         
         return dep_graph
     
+    def get_resimulation_targets(self, project_path: str, changed_file: str) -> List[str]:
+        """
+        获取文件变更后需要重新仿真的电路
+        
+        Args:
+            project_path: 项目根目录路径
+            changed_file: 变更文件路径（绝对路径或相对项目根目录）
+            
+        Returns:
+            List[str]: 需要重新仿真的电路文件（相对项目根目录）
+        """
+        project_root = Path(project_path).resolve()
+        if self.graph.project_root != project_root:
+            self.graph.refresh(str(project_root), self.get_supported_extensions())
+        
+        return [
+            str(Path(path).relative_to(project_root))
+            for path in self.graph.get_affected_simulations(changed_file)
+        ]
+    
     def get_circuit_type(self, file_path: str) -> str:
         """
         判断文件类型
@@ -259,7 +266,7 @@ class CircuitAnalyzer:
         判断是否应该跳过文件
         
         Args:
-            file_path: 文件路径
+            file_path: 相对项目根目录的文件路径
             
         Returns:
             bool: 是否跳过
@@ -305,114 +312,56 @@ class CircuitAnalyzer:
             project_root: 项目根目录
             
         Returns:
-            Optional[CircuitFileInfo]: 文件信息，解析失败返回 None
+            Optional[CircuitFileInfo]: 文件信息，读取失败返回 None
         """
-        try:
-            # 读取文件内容
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            lines = content.splitlines()
-            
-            # 分析文件特征
-            has_simulation_commands = self._has_simulation_commands(lines)
-            has_subcircuit_defs = self._has_subcircuit_defs(lines)
-            has_only_params = self._has_only_params(lines)
-            
-            # 解析引用
-            includes = self.parser.parse_content(content)
-            for include in includes:
-                include.resolve_path(file_path.parent, project_root)
-            
-            # 判断文件类型
-            file_type = self._determine_file_type(
-                has_simulation_commands,
-                has_subcircuit_defs,
-                has_only_params,
-                len(includes)
-            )
-            
-            # 计算相对路径
-            try:
-                rel_path = str(file_path.relative_to(project_root))
-            except ValueError:
-                rel_path = str(file_path)
-            
-            return CircuitFileInfo(
-                path=rel_path,
-                abs_path=file_path,
-                file_type=file_type,
-                size_bytes=file_path.stat().st_size,
-                modified_time=file_path.stat().st_mtime,
-                has_simulation_commands=has_simulation_commands,
-                has_subcircuit_defs=has_subcircuit_defs,
-                has_only_params=has_only_params,
-                references=includes,
-            )
-            
-        except Exception:
+        record = self.graph.get_record(str(file_path))
+        if record is None:
             return None
+        return self._build_file_info(record, project_root)
     
-    def _has_simulation_commands(self, lines: List[str]) -> bool:
-        """
-        检查是否包含仿真控制语句
-        
-        Args:
-            lines: 文件行列表
-            
-        Returns:
-            bool: 是否包含仿真控制语句
-        """
-        for line in lines:
-            stripped = line.strip().lower()
-            if stripped.startswith('*') or stripped.startswith(';'):
-                continue
-            
-            for cmd in self.SIMULATION_COMMANDS:
-                if stripped.startswith(cmd):
-                    return True
-        
-        return False
-    
-    def _has_subcircuit_defs(self, lines: List[str]) -> bool:
+    def _build_file_info(self, record: CircuitFileRecord, project_root: Path) -> CircuitFileInfo:
         """
-        检查是否包含子电路定义
+        由依赖图中的文件记录构建文件信息
         
         Args:
-            lines: 文件行列表
+            record: 文件记录
+            project_root: 项目根目录
             
         Returns:
-            bool: 是否包含子电路定义
+            CircuitFileInfo: 文件信息
         """
-        for line in lines:
-            if self.SUBCKT_START_PATTERN.match(line):
-                return True
+        file_path = Path(record.path)
         
-        return False
-    
-    def _has_only_params(self, lines: List[str]) -> bool:
-        """
-        检查是否仅包含参数定义
-        
-        Args:
-            lines: 文件行列表
-            
-        Returns:
-            bool: 是否仅包含参数定义
-        """
-        has_params = False
-        has_other = False
+        # 解析引用
+        includes = record.to_parsed_includes()
+        for include in includes:
+            include.resolve_path(file_path.parent, project_root)
         
-        for line in lines:
-            stripped = line.strip()
-            if not stripped or stripped.startswith('*') or stripped.startswith(';'):
-                continue
-            
-            if self.PARAM_PATTERN.match(line):
-                has_params = True
-            elif stripped.startswith('.'):
-                # 其他 SPICE 指令
-                has_other = True
+        # 判断文件类型
+        file_type = self._determine_file_type(
+            record.has_simulation_commands,
+            record.has_subcircuit_defs,
+            record.has_only_params,
+            len(includes)
+        )
         
-        return has_params and not has_other
+        # 计算相对路径
+        try:
+            rel_path = str(file_path.relative_to(project_root))
+        except ValueError:
+            rel_path = str(file_path)
+        
+        return CircuitFileInfo(
+            path=rel_path,
+            abs_path=file_path,
+            file_type=file_type,
+            size_bytes=record.size,
+            modified_time=record.mtime_ns / 1e9,
+            has_simulation_commands=record.has_simulation_commands,
+            has_subcircuit_defs=record.has_subcircuit_defs,
+            has_only_params=record.has_only_params,
+            references=includes,
+        )
     
     def _determine_file_type(
         self,
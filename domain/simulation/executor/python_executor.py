@@ -9,10 +9,11 @@ Python 脚本仿真执行器
 - 解析脚本输出为标准化仿真结果
 
 执行模式说明：
-- 使用 subprocess.run() 在独立子进程中执行脚本
-- 子进程崩溃不影响主程序稳定性
-- 通过 stdout 获取 JSON 格式的执行结果
-- 通过 stderr 获取错误信息和调试日志
+- 脚本在预热的常驻子进程中执行（PythonWorkerPool），免去每次运行的
+  解释器启动与 numpy 导入；脚本文件变化时子进程自动重新加载
+- 子进程崩溃不影响主程序稳定性，超时的子进程被杀死并替换
+- 波形数组以二进制缓冲区回传，其余字段按 JSON 约定规整
+- 脚本的 print / stderr 输出按次捕获，用于调试日志与 raw_output
 
 脚本约定：
 - 脚本必须定义 run_simulation(config: dict) -> dict 入口函数
@@ -21,7 +22,7 @@ Python 脚本仿真执行器
   - success: bool - 执行状态
   - data: dict - 仿真数据（frequency, time, signals）
   - measurements: list - 规范化测量结果（可选）
-- 脚本通过 stdout 以 JSON 格式输出结果
+- 同一子进程会多次运行脚本，模块级全局状态可能在运行间保留
 
 安全声明：
 - 本模块不提供完整的安全沙箱
@@ -50,10 +51,8 @@ Python 脚本仿真执行器
         output = result.get_signal("output")
 """
 
-import json
 import logging
 import subprocess
-import sys
 import time
 from datetime import datetime
 from pathlib import Path
@@ -61,6 +60,12 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from domain.simulation.executor.python_script_worker import ENTRY_FUNCTION_NAME
+from domain.simulation.executor.python_worker_pool import (
+    PythonWorkerOutcome,
+    PythonWorkerPool,
+    get_python_worker_pool,
+)
 from domain.simulation.executor.simulation_executor import SimulationExecutor
 from domain.simulation.models.simulation_result import (
     SimulationResult,
@@ -91,9 +96,6 @@ SUPPORTED_ANALYSES = ["custom", "ac", "dc", "tran", "noise", "op"]
 # 默认超时时间（秒）
 DEFAULT_TIMEOUT = 600
 
-# 脚本入口函数名称
-ENTRY_FUNCTION_NAME = "run_simulation"
-
 
 # ============================================================
 # PythonExecutor - Python 脚本仿真执行器
@@ -103,11 +105,12 @@ class PythonExecutor(SimulationExecutor):
     """
     Python 脚本仿真执行器
     
-    在独立子进程中执行用户自定义的 Python 仿真脚本。
+    在预热的常驻子进程中执行用户自定义的 Python 仿真脚本。
     支持超时控制、错误处理和标准化结果输出。
     
     特性：
     - 进程隔离：脚本在独立子进程中执行，崩溃不影响主程序
+    - 进程复用：子进程由 PythonWorkerPool 预热并复用
     - 超时控制：支持设置执行时限，超时自动终止
     - 标准化结果：返回统一的 SimulationResult 数据结构
     - 错误处理：捕获并解析脚本错误，提供恢复建议
@@ -118,15 +121,21 @@ class PythonExecutor(SimulationExecutor):
     - 用户应仅执行可信脚本
     """
     
-    def __init__(self, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        timeout: int = DEFAULT_TIMEOUT,
+        worker_pool: Optional[PythonWorkerPool] = None,
+    ):
         """
         初始化 Python 执行器
         
         Args:
             timeout: 执行超时时间（秒），默认 600 秒
+            worker_pool: 脚本执行进程池，默认使用进程级单例
         """
         self._logger = logging.getLogger(__name__)
         self._timeout = timeout
+        self._worker_pool = worker_pool
         self._logger.debug(f"PythonExecutor 初始化完成，超时时间: {timeout}s")
     
     # ============================================================
@@ -200,7 +209,7 @@ class PythonExecutor(SimulationExecutor):
         
         # 3. 执行脚本
         try:
-            result = self._run_in_subprocess(file_path, analysis_config or {})
+            result = self._run_in_worker(file_path, analysis_config or {})
             result.duration_seconds = time.time() - start_time
             return result
             
@@ -251,6 +260,10 @@ class PythonExecutor(SimulationExecutor):
         """
         return self._timeout
     
+    def warm_up(self) -> None:
+        """在后台预热一个脚本执行子进程（打开含 Python 仿真脚本的项目时由 StartupWarmup 调用）"""
+        self._get_worker_pool().warm_up(1)
+    
     # ============================================================
     # 内部方法
     # ============================================================
@@ -285,13 +298,18 @@ class PythonExecutor(SimulationExecutor):
         except Exception as e:
             return False, f"读取脚本文件失败: {e}"
     
-    def _run_in_subprocess(
+    def _get_worker_pool(self) -> PythonWorkerPool:
+        if self._worker_pool is None:
+            self._worker_pool = get_python_worker_pool()
+        return self._worker_pool
+    
+    def _run_in_worker(
         self,
         file_path: str,
         config: Dict[str, Any]
     ) -> SimulationResult:
         """
-        在子进程中执行脚本
+        在进程池的子进程中执行脚本
         
         Args:
             file_path: 脚本文件路径
@@ -308,98 +326,45 @@ class PythonExecutor(SimulationExecutor):
         
         # 获取超时时间（优先使用配置中的值）
         timeout = config.get("timeout", self._timeout)
-        
-        # 构建执行命令
-        # 使用 -c 参数执行内联代码，避免创建临时文件
         script_path = Path(file_path).resolve()
         
-        # 构建 Python 代码：导入脚本模块并调用入口函数
-        python_code = f"""
-import sys
-import json
-from pathlib import Path
-
-# 添加脚本所在目录到 sys.path
-script_dir = Path(r'{script_path.parent}').resolve()
-if str(script_dir) not in sys.path:
-    sys.path.insert(0, str(script_dir))
-
-# 导入脚本模块
-script_name = '{script_path.stem}'
-try:
-    module = __import__(script_name)
-except ImportError as e:
-    print(json.dumps({{"success": False, "error": f"导入脚本失败: {{e}}"}}))
-    sys.exit(1)
-
-# 检查入口函数是否存在
-if not hasattr(module, '{ENTRY_FUNCTION_NAME}'):
-    print(json.dumps({{"success": False, "error": "脚本未定义 {ENTRY_FUNCTION_NAME} 函数"}}))
-    sys.exit(1)
-
-# 调用入口函数
-config = {json.dumps(config)}
-try:
-    result = module.{ENTRY_FUNCTION_NAME}(config)
-    # 输出结果（JSON 格式）
-    print(json.dumps(result, default=str))
-except Exception as e:
-    print(json.dumps({{"success": False, "error": f"执行失败: {{e}}"}}))
-    sys.exit(1)
-"""
-        
-        # 执行子进程
         try:
-            process = subprocess.run(
-                [sys.executable, "-c", python_code],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=script_path.parent,  # 设置工作目录为脚本所在目录
-            )
-            
-            # 解析输出
-            return self._parse_output(
-                stdout=process.stdout,
-                stderr=process.stderr,
-                returncode=process.returncode,
-                file_path=file_path,
-                analysis_type=analysis_type,
-            )
-            
-        except subprocess.TimeoutExpired as e:
+            outcome = self._get_worker_pool().run(script_path, config, timeout)
+        except subprocess.TimeoutExpired:
             # 超时异常，向上传播
             self._logger.warning(f"脚本执行超时: {file_path}, 超时时间: {timeout}s")
             raise
+        
+        return self._parse_outcome(outcome, file_path, analysis_type)
     
-    def _parse_output(
+    def _parse_outcome(
         self,
-        stdout: str,
-        stderr: str,
-        returncode: int,
+        outcome: PythonWorkerOutcome,
         file_path: str,
         analysis_type: str
     ) -> SimulationResult:
         """
-        解析脚本输出为标准化仿真结果
+        解析子进程返回的结果为标准化仿真结果
         
         Args:
-            stdout: 标准输出
-            stderr: 标准错误输出
-            returncode: 返回码
+            outcome: 子进程的返回码、入口函数返回值与捕获的输出
             file_path: 脚本文件路径
             analysis_type: 分析类型
             
         Returns:
             SimulationResult: 仿真结果
         """
+        stdout = outcome.stdout
+        
         # 记录 stderr（用于调试）
-        if stderr:
-            self._logger.debug(f"脚本 stderr 输出:\n{stderr}")
+        if outcome.stderr:
+            self._logger.debug(f"脚本 stderr 输出:\n{outcome.stderr}")
         
         # 检查返回码
-        if returncode != 0:
-            error_msg = stderr or "脚本执行失败"
+        if outcome.returncode != 0:
+            error_msg = outcome.stderr or "脚本执行失败"
+            if isinstance(outcome.result, dict) and outcome.result.get("error"):
+                error_msg = f"{outcome.result['error']}\n{outcome.stderr}".rstrip()
             return create_error_result(
                 executor=self.get_name(),
                 file_path=file_path,
@@ -408,37 +373,15 @@ except Exception as e:
                     code="E011",
                     type=SimulationErrorType.SCRIPT_ERROR,
                     severity=ErrorSeverity.HIGH,
-                    message=f"脚本执行失败（返回码 {returncode}）: {error_msg}",
+                    message=f"脚本执行失败（返回码 {outcome.returncode}）: {error_msg}",
                     file_path=file_path,
                     recovery_suggestion="请检查脚本逻辑和错误输出",
                 ),
                 raw_output=stdout,
             )
         
-        # 解析 JSON 输出
         try:
-            # 提取最后一个有效的 JSON 对象
-            # 脚本可能在 stdout 中输出调试信息，我们只关心最后的 JSON 结果
-            json_lines = [line.strip() for line in stdout.strip().split('\n') if line.strip()]
-            
-            if not json_lines:
-                return create_error_result(
-                    executor=self.get_name(),
-                    file_path=file_path,
-                    analysis_type=analysis_type,
-                    error=SimulationError(
-                        code="E012",
-                        type=SimulationErrorType.OUTPUT_PARSE_ERROR,
-                        severity=ErrorSeverity.HIGH,
-                        message="脚本未输出任何结果",
-                        file_path=file_path,
-                        recovery_suggestion="请确保脚本通过 print(json.dumps(result)) 输出结果",
-                    ),
-                    raw_output=stdout,
-                )
-            
-            # 尝试解析最后一行为 JSON
-            result_dict = json.loads(json_lines[-1])
+            result_dict = outcome.result
             
             # 校验结果格式
             if not isinstance(result_dict, dict):
@@ -521,23 +464,6 @@ except Exception as e:
                 raw_output=stdout,
             )
             
-        except json.JSONDecodeError as e:
-            # JSON 解析失败
-            return create_error_result(
-                executor=self.get_name(),
-                file_path=file_path,
-                analysis_type=analysis_type,
-                error=SimulationError(
-                    code="E012",
-                    type=SimulationErrorType.OUTPUT_PARSE_ERROR,
-                    severity=ErrorSeverity.HIGH,
-                    message=f"JSON 解析失败: {e}",
-                    file_path=file_path,
-                    recovery_suggestion="请确保脚本输出有效的 JSON 格式",
-                ),
-                raw_output=stdout,
-            )
-        
         except Exception as e:
             # 其他解析错误
             self._logger.exception(f"解析脚本输出时出错: {e}")
@@ -570,19 +496,19 @@ except Exception as e:
         # 提取频率数据
         frequency = None
         if "frequency" in data_dict and data_dict["frequency"] is not None:
-            frequency = np.array(data_dict["frequency"])
+            frequency = np.asarray(data_dict["frequency"])
         
         # 提取时间数据
         time_data = None
         if "time" in data_dict and data_dict["time"] is not None:
-            time_data = np.array(data_dict["time"])
+            time_data = np.asarray(data_dict["time"])
         
         # 提取信号数据
         signals = {}
         if "signals" in data_dict and isinstance(data_dict["signals"], dict):
             for name, signal_data in data_dict["signals"].items():
                 if signal_data is not None:
-                    signals[name] = np.array(signal_data)
+                    signals[name] = np.asarray(signal_data)
         
         return SimulationData(
             frequency=frequency,
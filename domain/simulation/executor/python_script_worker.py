@@ -0,0 +1,343 @@
+# Python Script Worker - 常驻脚本执行进程
+"""
+Python 脚本常驻执行进程
+
+职责：
+- 作为 PythonWorkerPool 的子进程常驻运行，逐个执行仿真脚本的
+  run_simulation(config) 入口
+- 按脚本完整路径缓存已加载的模块，脚本或它导入的项目模块
+  mtime / 大小变化时重新加载
+- 数值型波形（data.frequency / data.time / data.signals）以 numpy
+  数组的原始缓冲区回传，不再经过 JSON 文本序列化
+
+进程协议（stdin / stdout 二进制帧）：
+- 帧格式：<payload 长度 u64, 缓冲区个数 u32> + pickle(protocol 5) payload
+  + 每个带外缓冲区 <长度 u64> + 原始字节
+- 启动后先发 {"status": "ready"}
+- 请求 {"script": 路径, "config": 配置} →
+  {"returncode", "result", "stdout", "stderr"}
+- 父进程关闭 stdin 即退出
+
+隔离约定：
+- 本模块只依赖标准库与 numpy，以脚本方式启动（不导入应用包）
+- 协议使用启动时复制出的 fd；fd 0 / 1 随后重定向，脚本中的
+  print / input / C 扩展输出不会混入协议流
+- 脚本的 print 输出按任务捕获，随结果回传
+- 每个任务结束后恢复工作目录与 sys.path，并从 sys.modules 移除本任务
+  导入的项目模块（脚本目录下、或不在解释器安装目录下的模块）；
+  标准库与 site-packages 中的模块保留，保持进程常驻的收益
+- 脚本模块自身的全局状态在同一进程的多次运行间保留（进程由进程池
+  定期回收）
+"""
+
+import io
+import json
+import os
+import pickle
+import struct
+import sys
+import traceback
+import types
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 是应用依赖，缺失时退回 JSON 传输
+    np = None
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+ENTRY_FUNCTION_NAME = "run_simulation"
+
+_FRAME_HEADER = struct.Struct("<QI")
+_BUFFER_HEADER = struct.Struct("<Q")
+_WAVEFORM_AXES = ("frequency", "time")
+
+
+# ============================================================
+# 帧读写（父进程与子进程共用）
+# ============================================================
+
+def write_message(stream: BinaryIO, message: Any) -> None:
+    """写入一帧；numpy 数组作为带外缓冲区原样写出"""
+    buffers: List[pickle.PickleBuffer] = []
+    payload = pickle.dumps(message, protocol=5, buffer_callback=buffers.append)
+    stream.write(_FRAME_HEADER.pack(len(payload), len(buffers)))
+    stream.write(payload)
+    for buffer in buffers:
+        raw = buffer.raw()
+        stream.write(_BUFFER_HEADER.pack(raw.nbytes))
+        stream.write(raw)
+    stream.flush()
+
+
+def read_message(stream: BinaryIO) -> Any:
+    """读取一帧；流结束时抛出 EOFError"""
+    payload_size, buffer_count = _FRAME_HEADER.unpack(_read_exact(stream, _FRAME_HEADER.size))
+    payload = _read_exact(stream, payload_size)
+    buffers = []
+    for _ in range(buffer_count):
+        (size,) = _BUFFER_HEADER.unpack(_read_exact(stream, _BUFFER_HEADER.size))
+        buffers.append(_read_exact(stream, size))
+    return pickle.loads(payload, buffers=buffers)
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytearray:
+    data = bytearray(size)
+    view = memoryview(data)
+    received = 0
+    while received < size:
+        count = stream.readinto(view[received:])
+        if not count:
+            raise EOFError("worker stream closed")
+        received += count
+    return data
+
+
+# ============================================================
+# 脚本加载与执行（子进程内）
+# ============================================================
+
+# 脚本路径 -> (脚本签名, 脚本导入的项目模块文件签名, 模块)
+_loaded_modules: Dict[str, Tuple[Tuple[int, int], Dict[str, Tuple[int, int]], types.ModuleType]] = {}
+
+# 解释器安装目录下的模块（标准库、site-packages）跨任务保留，避免每次重新导入 numpy 等
+_INSTALL_PREFIXES = tuple(
+    Path(prefix).resolve()
+    for prefix in {sys.prefix, sys.base_prefix, sys.exec_prefix}
+)
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _module_file(module: Any) -> Optional[Path]:
+    file = getattr(module, "__file__", None)
+    if not isinstance(file, str) or not file:
+        return None
+    try:
+        return Path(file).resolve()
+    except (OSError, ValueError):
+        return None
+
+
+def _is_project_module(module: Any, script_dir: Path) -> bool:
+    """脚本目录下、或不属于解释器安装目录的模块视为项目模块"""
+    path = _module_file(module)
+    if path is None:
+        return False
+    if path.is_relative_to(script_dir):
+        return True
+    return not any(path.is_relative_to(prefix) for prefix in _INSTALL_PREFIXES)
+
+
+def _load_script_module(script_path: Path) -> types.ModuleType:
+    """
+    加载脚本模块
+
+    脚本与它导入的项目模块（同目录的 helper.py 等）都未变化时复用已加载
+    的模块；任一文件变化或被删除时整体重新执行脚本。模块以完整路径为
+    键，不同目录下的同名脚本互不覆盖。
+    """
+    key = str(script_path)
+    signature = _file_signature(key)
+    if signature is None:
+        raise FileNotFoundError(key)
+    cached = _loaded_modules.get(key)
+    if (
+        cached is not None
+        and cached[0] == signature
+        and all(_file_signature(file) == sig for file, sig in cached[1].items())
+    ):
+        return cached[2]
+
+    script_dir = script_path.parent.resolve()
+    before = set(sys.modules)
+    source = script_path.read_bytes()
+    code = compile(source, key, "exec")
+    module = types.ModuleType(key)
+    module.__file__ = key
+    sys.modules[key] = module
+    try:
+        exec(code, module.__dict__)
+    except BaseException:
+        sys.modules.pop(key, None)
+        _loaded_modules.pop(key, None)
+        raise
+
+    dependencies: Dict[str, Tuple[int, int]] = {}
+    for name in set(sys.modules) - before:
+        imported = sys.modules.get(name)
+        if imported is module or not _is_project_module(imported, script_dir):
+            continue
+        file = str(_module_file(imported))
+        file_signature = _file_signature(file)
+        if file_signature is not None:
+            dependencies[file] = file_signature
+    _loaded_modules[key] = (signature, dependencies, module)
+    return module
+
+
+def _evict_project_modules(before: set, script_dir: Path) -> None:
+    """
+    移除本任务导入的项目模块，以及脚本目录下的全部模块
+
+    同一进程先后运行不同项目（或同一项目修改后的 helper.py）时，
+    import 总是从磁盘重新加载，而不是命中上一个任务留在 sys.modules
+    中的同名模块。
+    """
+    for name, module in list(sys.modules.items()):
+        path = _module_file(module)
+        if path is None:
+            continue
+        if path.is_relative_to(script_dir) or (name not in before and _is_project_module(module, script_dir)):
+            sys.modules.pop(name, None)
+
+
+def _run_job(request: Dict[str, Any]) -> Dict[str, Any]:
+    script_path = Path(request["script"])
+    script_dir = str(script_path.parent)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_cwd, saved_path = os.getcwd(), list(sys.path)
+    saved_modules = set(sys.modules)
+    returncode, result = 0, None
+    try:
+        os.chdir(script_dir)
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                module = _load_script_module(script_path)
+            except Exception as e:
+                traceback.print_exc()
+                return _failure(f"导入脚本失败: {e}", stdout, stderr)
+
+            entry = getattr(module, ENTRY_FUNCTION_NAME, None)
+            if entry is None:
+                return _failure(f"脚本未定义 {ENTRY_FUNCTION_NAME} 函数", stdout, stderr)
+
+            try:
+                result = entry(request["config"])
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                traceback.print_exc()
+                return _failure(f"执行失败: {e}", stdout, stderr)
+    finally:
+        os.chdir(saved_cwd)
+        sys.path[:] = saved_path
+        _evict_project_modules(saved_modules, Path(script_dir).resolve())
+
+    return {
+        "returncode": returncode,
+        "result": _encode_result(result) if returncode == 0 else None,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def _failure(message: str, stdout: io.StringIO, stderr: io.StringIO) -> Dict[str, Any]:
+    return {
+        "returncode": 1,
+        "result": {"success": False, "error": message},
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def _encode_result(result: Any) -> Any:
+    """
+    把脚本返回值转为可跨进程传输的结构
+
+    数值型波形转为连续 numpy 数组（带外缓冲区传输）；其余字段按原
+    JSON 约定规整（json.dumps(..., default=str)），与脚本自定义类型解耦。
+    """
+    arrays: Dict[Tuple[str, ...], Any] = {}
+    data = result.get("data") if isinstance(result, dict) else None
+    if np is not None and isinstance(data, dict):
+        for axis in _WAVEFORM_AXES:
+            array = _to_numeric_array(data.get(axis))
+            if array is not None:
+                arrays[(axis,)] = array
+        signals = data.get("signals")
+        if isinstance(signals, dict):
+            for name, value in signals.items():
+                array = _to_numeric_array(value)
+                if array is not None:
+                    arrays[("signals", name)] = array
+
+    if arrays:
+        data = dict(data)
+        if isinstance(data.get("signals"), dict):
+            data["signals"] = dict(data["signals"])
+        for path in arrays:
+            _container(data, path)[path[-1]] = None
+        result = dict(result, data=data)
+
+    encoded = json.loads(json.dumps(result, default=str))
+    for path, array in arrays.items():
+        _container(encoded["data"], path)[path[-1]] = array
+    return encoded
+
+
+def _container(data: Dict[str, Any], path: Tuple[str, ...]) -> Dict[str, Any]:
+    return data["signals"] if len(path) == 2 else data
+
+
+def _to_numeric_array(value: Any) -> Optional[Any]:
+    if value is None or isinstance(value, (str, bytes, dict)):
+        return None
+    try:
+        array = np.asarray(value)
+    except Exception:
+        return None
+    if array.dtype.kind not in "biufc":
+        return None
+    return np.ascontiguousarray(array)
+
+
+def main() -> int:
+    # 协议使用复制出的 fd，原 fd 0 / 1 交给脚本（输入为空，输出并入 stderr）
+    protocol_in = os.fdopen(os.dup(0), "rb", buffering=0)
+    protocol_out = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    os.dup2(2, 1)
+
+    # 以文件方式启动时 sys.path[0] 是本模块目录，避免遮蔽脚本的同名模块
+    if sys.path and Path(sys.path[0] or ".").resolve() == Path(__file__).resolve().parent:
+        sys.path.pop(0)
+
+    write_message(protocol_out, {"status": "ready"})
+    while True:
+        try:
+            request = read_message(protocol_in)
+        except EOFError:
+            return 0
+        write_message(protocol_out, _run_job(request))
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "ENTRY_FUNCTION_NAME",
+    "read_message",
+    "write_message",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
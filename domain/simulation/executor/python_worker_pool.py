@@ -0,0 +1,372 @@
+# Python Worker Pool - 预热的脚本执行进程池
+"""
+Python 脚本执行进程池
+
+职责：
+- 维护若干常驻的 python_script_worker 子进程（已导入 numpy），
+  PythonExecutor 的每次运行借用一个空闲进程，省去解释器启动与
+  numpy / 脚本重复导入的开销
+- 每个任务独立计时，超时即杀死该进程（与原 subprocess.run 的
+  timeout 行为一致），进程池随后补充新的预热进程
+- 应用退出时统一关闭（application.bootstrap._shutdown_services）
+
+进程回收：
+- 任务失败、超时或进程异常退出后丢弃该进程
+- 单个进程累计执行 max_jobs_per_worker 次后回收，限制脚本模块
+  全局状态在多次运行间的累积
+- 空闲进程最多保留 max_idle_workers 个；并发任务超出时临时启动新进程
+
+使用示例：
+    pool = get_python_worker_pool()
+    outcome = pool.run(Path("sweep.py"), {"analysis_type": "custom"}, timeout=600)
+"""
+
+import logging
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from domain.simulation.executor import python_script_worker
+from domain.simulation.executor.python_script_worker import read_message, write_message
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+DEFAULT_MAX_IDLE_WORKERS = 2
+DEFAULT_MAX_JOBS_PER_WORKER = 200
+WORKER_STARTUP_TIMEOUT = 60.0             # 子进程启动（导入 numpy）超时秒数
+STDERR_TAIL_BYTES = 4096                  # 进程异常退出时回传的 stderr 尾部长度
+
+_WORKER_SCRIPT = Path(python_script_worker.__file__).resolve()
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PythonWorkerOutcome:
+    """一次脚本运行的结果（字段语义与原子进程的返回码 / 输出对应）"""
+    returncode: int
+    result: Any
+    stdout: str
+    stderr: str
+
+
+# ============================================================
+# 单个工作进程
+# ============================================================
+
+class _ScriptWorker:
+    """一个 python_script_worker 子进程；调用方保证同一时刻只执行一个任务"""
+
+    def __init__(self):
+        self.jobs = 0
+        # stderr 写入临时文件：无需读线程，也不会因管道写满而阻塞
+        self._stderr_file = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            [sys.executable, str(_WORKER_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr_file,
+        )
+        self._timed_out = False
+        try:
+            message = self._receive(WORKER_STARTUP_TIMEOUT)
+        except (OSError, EOFError, subprocess.TimeoutExpired) as exc:
+            self.kill()
+            detail = self._read_stderr_tail() or exc
+            self.close()
+            raise RuntimeError(f"Python 脚本进程启动失败: {detail}") from exc
+        if message.get("status") != "ready":
+            self.kill()
+            self.close()
+            raise RuntimeError(f"Python 脚本进程启动失败: {message}")
+
+    @property
+    def pid(self) -> int:
+        return self._process.pid
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process.poll() is None
+
+    def run(self, script_path: Path, config: Dict[str, Any], timeout: Optional[float]) -> PythonWorkerOutcome:
+        """
+        执行一个任务
+
+        Raises:
+            subprocess.TimeoutExpired: 超时（进程已被杀死）
+        """
+        self.jobs += 1
+        try:
+            write_message(self._process.stdin, {"script": str(script_path), "config": config})
+            message = self._receive(timeout)
+        except (OSError, EOFError):
+            self.kill()
+            return PythonWorkerOutcome(
+                returncode=self._process.returncode or 1,
+                result=None,
+                stdout="",
+                stderr=self._read_stderr_tail() or "Python 脚本进程异常退出",
+            )
+        return PythonWorkerOutcome(
+            returncode=message["returncode"],
+            result=message["result"],
+            stdout=message["stdout"],
+            stderr=message["stderr"],
+        )
+
+    def _receive(self, timeout: Optional[float]) -> Dict[str, Any]:
+        """读取一帧应答；超时由看门狗杀死进程，读取随之以 EOF 结束"""
+        watchdog = None
+        if timeout is not None:
+            watchdog = threading.Timer(timeout, self._on_timeout)
+            watchdog.daemon = True
+            watchdog.start()
+        try:
+            return read_message(self._process.stdout)
+        except (OSError, EOFError):
+            if self._timed_out:
+                raise subprocess.TimeoutExpired(self._process.args, timeout)
+            raise
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+
+    def _on_timeout(self) -> None:
+        self._timed_out = True
+        self.kill()
+
+    def _read_stderr_tail(self) -> str:
+        try:
+            self._stderr_file.seek(0, 2)
+            size = self._stderr_file.tell()
+            self._stderr_file.seek(max(0, size - STDERR_TAIL_BYTES))
+            return self._stderr_file.read().decode("utf-8", errors="replace").strip()
+        except (OSError, ValueError):
+            return ""
+
+    def kill(self) -> None:
+        if self.is_alive:
+            self._process.kill()
+        self._process.wait()
+
+    def close(self) -> None:
+        """关闭 stdin 让子进程自行退出，超时则强制结束"""
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.kill()
+        for stream in (self._process.stdout, self._stderr_file):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+# ============================================================
+# PythonWorkerPool
+# ============================================================
+
+class PythonWorkerPool:
+    """预热的脚本执行进程池（线程安全）"""
+
+    def __init__(
+        self,
+        max_idle_workers: int = DEFAULT_MAX_IDLE_WORKERS,
+        max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+    ):
+        self.max_idle_workers = max(0, int(max_idle_workers))
+        self.max_jobs_per_worker = max(1, int(max_jobs_per_worker))
+        self._idle: List[_ScriptWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._warming = 0
+        self._stats = {
+            "runs": 0,
+            "warm_runs": 0,
+            "workers_started": 0,
+            "workers_retired": 0,
+            "timeouts": 0,
+            "startup_ms": 0.0,
+        }
+
+    # --------------------------------------------------------
+    # 执行
+    # --------------------------------------------------------
+
+    def run(
+        self,
+        script_path: Path,
+        config: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> PythonWorkerOutcome:
+        """
+        在空闲进程中执行脚本入口函数
+
+        Raises:
+            subprocess.TimeoutExpired: 超时（对应进程已被杀死并丢弃）
+        """
+        worker, warm = self._acquire()
+        healthy = False
+        try:
+            outcome = worker.run(Path(script_path), config, timeout)
+            healthy = outcome.returncode == 0 and worker.is_alive
+            with self._lock:
+                self._stats["runs"] += 1
+                self._stats["warm_runs"] += int(warm)
+            return outcome
+        except subprocess.TimeoutExpired:
+            with self._lock:
+                self._stats["timeouts"] += 1
+            raise
+        finally:
+            self._release(worker, healthy)
+
+    def _acquire(self) -> Tuple[_ScriptWorker, bool]:
+        # 已退出的空闲进程在锁外关闭（close 最多等待 5 秒），不阻塞其它取用 / 归还
+        dead: List[_ScriptWorker] = []
+        try:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Python 脚本进程池已关闭")
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.is_alive:
+                        return worker, True
+                    dead.append(worker)
+        finally:
+            for worker in dead:
+                worker.close()
+        return self._start_worker(), False
+
+    def _release(self, worker: _ScriptWorker, healthy: bool) -> None:
+        with self._lock:
+            keep = (
+                healthy
+                and not self._closed
+                and worker.jobs < self.max_jobs_per_worker
+                and len(self._idle) < self.max_idle_workers
+            )
+            if keep:
+                self._idle.append(worker)
+                return
+            self._stats["workers_retired"] += 1
+        worker.close()
+        if not self._closed:
+            self.warm_up(1)
+
+    def _start_worker(self) -> _ScriptWorker:
+        started = time.perf_counter()
+        worker = _ScriptWorker()
+        with self._lock:
+            self._stats["workers_started"] += 1
+            self._stats["startup_ms"] += (time.perf_counter() - started) * 1000
+        return worker
+
+    # --------------------------------------------------------
+    # 预热与关闭
+    # --------------------------------------------------------
+
+    def warm_up(self, count: int = 1) -> Optional[threading.Thread]:
+        """
+        在后台线程中启动进程，补足至 count 个空闲进程
+
+        Returns:
+            执行预热的线程；已满足或进程池已关闭时为 None
+        """
+        with self._lock:
+            target = min(count, self.max_idle_workers)
+            missing = target - len(self._idle) - self._warming
+            if self._closed or missing <= 0:
+                return None
+            self._warming += missing
+
+        def run() -> None:
+            for _ in range(missing):
+                try:
+                    worker = self._start_worker()
+                except Exception as exc:
+                    _logger.warning(f"Python 脚本进程预热失败: {exc}")
+                    with self._lock:
+                        self._warming -= 1
+                    continue
+                with self._lock:
+                    self._warming -= 1
+                    if not self._closed and len(self._idle) < self.max_idle_workers:
+                        self._idle.append(worker)
+                        continue
+                worker.close()
+
+        thread = threading.Thread(target=run, name="python-worker-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self) -> Dict[str, Any]:
+        """关闭全部空闲进程；之后的 run() 抛出 RuntimeError"""
+        with self._lock:
+            self._closed = True
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.close()
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle_workers"] = len(self._idle)
+        return stats
+
+
+# ============================================================
+# 模块级单例
+# ============================================================
+
+_pool: Optional[PythonWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_python_worker_pool() -> PythonWorkerPool:
+    """获取进程级脚本执行进程池（首次调用时创建）"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PythonWorkerPool()
+        return _pool
+
+
+def shutdown_python_worker_pool() -> Dict[str, Any]:
+    """
+    关闭进程池（应用退出时调用）
+
+    Returns:
+        进程池统计；未创建过进程池时为空字典
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    return pool.shutdown() if pool is not None else {}
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "DEFAULT_MAX_IDLE_WORKERS",
+    "DEFAULT_MAX_JOBS_PER_WORKER",
+    "PythonWorkerOutcome",
+    "PythonWorkerPool",
+    "get_python_worker_pool",
+    "shutdown_python_worker_pool",
+]
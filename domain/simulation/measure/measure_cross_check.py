@@ -0,0 +1,437 @@
+# Measure Cross Check - Recompute .MEASURE Results From Waveform Data
+"""
+.MEASURE 交叉校验
+
+职责：
+- 用波形测量内核（waveform_measurements）在 SimulationData 上重新计算
+  ngspice 已给出的 .MEASURE 结果，标记与 ngspice 数值不一致的测量
+- 只覆盖可以从导出波形无歧义复算的语句形式；其余标记为 unsupported，
+  不猜测
+
+支持的语句形式：
+- MAX / MIN / PP / AVG / RMS / INTEG <expr> [FROM=x] [TO=x]
+- FIND <expr> AT=x
+- FIND <expr> WHEN <expr>=<value|expr> [RISE|FALL|CROSS=n|LAST] [TD=x]
+- WHEN <expr>=<value|expr> [RISE|FALL|CROSS=n|LAST] [TD=x]
+- TRIG <expr> VAL=v [RISE|FALL|CROSS=n] [TD=x] TARG <expr> VAL=v [...]
+  （TRIG 也可为 AT=x）
+
+表达式支持 V(a) / V(a,b) / I(x) 及 AC 修饰 VM / VDB / VP / VR / VI；
+AC 复数信号不带修饰时按幅度计算（与 ngspice 一致），VP 为弧度。
+
+使用示例：
+    checks = measure_cross_checker.check(result.data, result.measurements)
+    mismatches = [c for c in checks if c.status == CROSS_CHECK_MISMATCH]
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from domain.simulation.data.waveform_measurements import (
+    EDGE_CROSS,
+    EDGE_FALL,
+    EDGE_RISE,
+    crossing_x,
+    interpolate_at,
+    magnitude_db,
+    rms,
+    trapezoid,
+)
+from domain.simulation.measure.measure_result import MeasureResult, MeasureStatus
+
+if TYPE_CHECKING:
+    from domain.simulation.models.simulation_result import SimulationData
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+CROSS_CHECK_MATCH = "match"
+CROSS_CHECK_MISMATCH = "mismatch"
+CROSS_CHECK_UNSUPPORTED = "unsupported"
+CROSS_CHECK_UNAVAILABLE = "unavailable"
+
+DEFAULT_RELATIVE_TOLERANCE = 1e-3
+DEFAULT_ABSOLUTE_TOLERANCE = 1e-15
+
+_STATISTIC_KEYWORDS = ("MAX", "MIN", "PP", "AVG", "RMS", "INTEG")
+
+_SPICE_SUFFIX_SCALES = {
+    "t": 1e12, "g": 1e9, "meg": 1e6, "k": 1e3, "mil": 25.4e-6,
+    "m": 1e-3, "u": 1e-6, "n": 1e-9, "p": 1e-12, "f": 1e-15,
+}
+_NUMBER_PATTERN = re.compile(
+    r"^([+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)(meg|mil|[tgkmunpf])?[a-z]*$",
+    re.IGNORECASE,
+)
+_SIGNAL_PATTERN = re.compile(
+    r"^(v|vm|vdb|vp|vr|vi|i)\(\s*([^,()\s]+)\s*(?:,\s*([^,()\s]+)\s*)?\)$",
+    re.IGNORECASE,
+)
+_ASSIGNMENT_SPACING = re.compile(r"\s*=\s*")
+
+
+# ============================================================
+# 数据类
+# ============================================================
+
+@dataclass(frozen=True)
+class MeasureCrossCheck:
+    """单条 .MEASURE 的交叉校验结果"""
+
+    name: str
+    """测量名称"""
+
+    status: str
+    """match / mismatch / unsupported / unavailable"""
+
+    reported: Optional[float] = None
+    """ngspice 报告的值"""
+
+    recomputed: Optional[float] = None
+    """由波形数据重新计算的值"""
+
+    detail: str = ""
+    """不支持或无法计算时的原因"""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """序列化为字典"""
+        return {
+            "name": self.name,
+            "status": self.status,
+            "reported": self.reported,
+            "recomputed": self.recomputed,
+            "detail": self.detail,
+        }
+
+
+class _Unsupported(Exception):
+    """语句形式不在复算范围内"""
+
+
+# ============================================================
+# 交叉校验器
+# ============================================================
+
+class MeasureCrossChecker:
+    """
+    .MEASURE 交叉校验器
+
+    复算完全基于导出的波形数据，因此只有当 ngspice 的结果与数据相符时
+    才会 match；数据被抽稀或截断时 mismatch 是提示而不是结论。
+    """
+
+    def check(
+        self,
+        data: Optional["SimulationData"],
+        measurements: Optional[Iterable[Any]],
+        *,
+        relative_tolerance: float = DEFAULT_RELATIVE_TOLERANCE,
+    ) -> List[MeasureCrossCheck]:
+        """
+        对所有带语句的 OK 测量做交叉校验
+
+        Args:
+            data: 仿真数据
+            measurements: MeasureResult 列表（非 MeasureResult 元素忽略）
+            relative_tolerance: 判定 match 的相对误差
+
+        Returns:
+            List[MeasureCrossCheck]: 与输入顺序一致
+        """
+        checks: List[MeasureCrossCheck] = []
+        if data is None:
+            return checks
+        for measurement in measurements or ():
+            if not isinstance(measurement, MeasureResult) or not measurement.statement:
+                continue
+            checks.append(self._check_one(data, measurement, relative_tolerance))
+        return checks
+
+    def recompute(self, data: "SimulationData", statement: str) -> float:
+        """
+        由波形数据重新计算一条 .MEASURE 语句
+
+        Raises:
+            ValueError: 语句不受支持或数据中缺少所需信号
+        """
+        try:
+            return _evaluate_statement(data, statement)
+        except _Unsupported as exc:
+            raise ValueError(str(exc)) from exc
+
+    def _check_one(
+        self,
+        data: "SimulationData",
+        measurement: MeasureResult,
+        relative_tolerance: float,
+    ) -> MeasureCrossCheck:
+        reported = measurement.value if measurement.status == MeasureStatus.OK else None
+        try:
+            recomputed = _evaluate_statement(data, measurement.statement)
+        except _Unsupported as exc:
+            return MeasureCrossCheck(
+                name=measurement.name,
+                status=CROSS_CHECK_UNSUPPORTED,
+                reported=reported,
+                detail=str(exc),
+            )
+        except Exception as exc:
+            # 交叉校验只是诊断信息，任何意外错误都不能中断指标导出
+            return MeasureCrossCheck(
+                name=measurement.name,
+                status=CROSS_CHECK_UNAVAILABLE,
+                reported=reported,
+                detail=f"recompute failed: {exc}",
+            )
+        if not math.isfinite(recomputed):
+            return MeasureCrossCheck(
+                name=measurement.name,
+                status=CROSS_CHECK_UNAVAILABLE,
+                reported=reported,
+                detail="condition not met in waveform data",
+            )
+        if reported is None:
+            return MeasureCrossCheck(
+                name=measurement.name,
+                status=CROSS_CHECK_MISMATCH,
+                recomputed=recomputed,
+                detail=f"ngspice reported {measurement.status.value}",
+            )
+        tolerance = relative_tolerance * max(abs(reported), abs(recomputed)) + DEFAULT_ABSOLUTE_TOLERANCE
+        status = CROSS_CHECK_MATCH if abs(reported - recomputed) <= tolerance else CROSS_CHECK_MISMATCH
+        return MeasureCrossCheck(
+            name=measurement.name,
+            status=status,
+            reported=reported,
+            recomputed=recomputed,
+        )
+
+
+# ============================================================
+# 语句解析与计算
+# ============================================================
+
+def _evaluate_statement(data: "SimulationData", statement: str) -> float:
+    tokens = _tokenize(statement)
+    if len(tokens) < 4 or tokens[0].lower() not in (".measure", ".meas"):
+        raise _Unsupported("not a .MEASURE statement")
+    analysis = tokens[1].lower()
+    body = tokens[3:]
+    x = _x_axis(data, analysis)
+    keyword = body[0].upper()
+
+    if keyword in _STATISTIC_KEYWORDS:
+        if len(body) < 2:
+            raise _Unsupported(f"{keyword} without expression")
+        options = _parse_options(body[2:], ("FROM", "TO"))
+        return _statistic(keyword, x, _signal(data, body[1]), options.get("FROM"), options.get("TO"))
+
+    if keyword == "FIND":
+        if len(body) < 3:
+            raise _Unsupported("FIND without AT or WHEN")
+        y = _signal(data, body[1])
+        if body[2].upper().startswith("AT="):
+            return float(interpolate_at(x, y, _number(body[2][3:])))
+        if body[2].upper() == "WHEN":
+            at = _when(data, x, body[3:])
+            return float(interpolate_at(x, y, at)) if math.isfinite(at) else math.nan
+        raise _Unsupported(f"FIND {body[2]}")
+
+    if keyword == "WHEN":
+        return _when(data, x, body[1:])
+
+    if keyword == "TRIG":
+        upper = [token.upper() for token in body]
+        if "TARG" not in upper:
+            raise _Unsupported("TRIG without TARG")
+        split = upper.index("TARG")
+        trigger = _trigger_point(data, x, body[1:split])
+        target = _trigger_point(data, x, body[split + 1:])
+        return target - trigger
+
+    raise _Unsupported(f"measure form {keyword}")
+
+
+def _tokenize(statement: str) -> List[str]:
+    text = " ".join(line.strip().lstrip("+") for line in statement.splitlines())
+    text = _ASSIGNMENT_SPACING.sub("=", text.replace("'", ""))
+    return text.split()
+
+
+def _parse_options(tokens: List[str], allowed: Tuple[str, ...]) -> Dict[str, Any]:
+    options: Dict[str, Any] = {}
+    for token in tokens:
+        key, separator, value = token.partition("=")
+        key = key.upper()
+        if not separator or key not in allowed:
+            raise _Unsupported(f"option {token}")
+        options[key] = value if key in ("RISE", "FALL", "CROSS") else _number(value)
+    return options
+
+
+def _edge_options(options: Dict[str, Any]) -> Tuple[str, int]:
+    for key, edge in (("RISE", EDGE_RISE), ("FALL", EDGE_FALL), ("CROSS", EDGE_CROSS)):
+        if key in options:
+            value = str(options[key]).upper()
+            if value == "LAST":
+                return edge, -1
+            try:
+                return edge, int(value)
+            except ValueError as exc:
+                raise _Unsupported(f"{key}={options[key]}") from exc
+    return EDGE_CROSS, 1
+
+
+def _when(data: "SimulationData", x: np.ndarray, tokens: List[str]) -> float:
+    if not tokens or "=" not in tokens[0]:
+        raise _Unsupported("WHEN without condition")
+    left, _, right = tokens[0].partition("=")
+    y = _signal(data, left)
+    try:
+        level = _number(right)
+    except _Unsupported:
+        # WHEN V(a)=V(b)：两条曲线相交
+        y = y - _signal(data, right)
+        level = 0.0
+    options = _parse_options(tokens[1:], ("RISE", "FALL", "CROSS", "TD"))
+    edge, occurrence = _edge_options(options)
+    return float(crossing_x(x, y, level, edge=edge, occurrence=occurrence, after_x=options.get("TD")))
+
+
+def _trigger_point(data: "SimulationData", x: np.ndarray, tokens: List[str]) -> float:
+    if len(tokens) == 1 and tokens[0].upper().startswith("AT="):
+        return _number(tokens[0][3:])
+    if len(tokens) < 2:
+        raise _Unsupported("TRIG/TARG without VAL")
+    y = _signal(data, tokens[0])
+    options = _parse_options(tokens[1:], ("VAL", "RISE", "FALL", "CROSS", "TD"))
+    if "VAL" not in options:
+        raise _Unsupported("TRIG/TARG without VAL")
+    edge, occurrence = _edge_options(options)
+    return float(crossing_x(x, y, options["VAL"], edge=edge, occurrence=occurrence, after_x=options.get("TD")))
+
+
+def _statistic(
+    keyword: str,
+    x: np.ndarray,
+    y: np.ndarray,
+    start: Optional[float],
+    stop: Optional[float],
+) -> float:
+    x, y = _window(x, y, start, stop)
+    if len(x) == 0:
+        return math.nan
+    if keyword == "MAX":
+        return float(y.max())
+    if keyword == "MIN":
+        return float(y.min())
+    if keyword == "PP":
+        return float(y.max() - y.min())
+    if keyword == "INTEG":
+        return float(trapezoid(y, x))
+    if keyword == "RMS":
+        return float(rms(y, x))
+    span = x[-1] - x[0]
+    return float(trapezoid(y, x) / span) if span else float(y.mean())
+
+
+def _window(
+    x: np.ndarray,
+    y: np.ndarray,
+    start: Optional[float],
+    stop: Optional[float],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """截取 [start, stop] 区间，边界处插值补点（与 ngspice 的区间测量一致）"""
+    if start is None and stop is None:
+        return x, y
+    low = x[0] if start is None else max(start, x[0])
+    high = x[-1] if stop is None else min(stop, x[-1])
+    if high < low:
+        return x[:0], y[:0]
+    inside = (x > low) & (x < high)
+    edges = interpolate_at(x, y, np.array([low, high]))
+    window_x = np.concatenate(([low], x[inside], [high]))
+    window_y = np.concatenate((edges[:1], y[inside], edges[1:]))
+    return window_x, window_y
+
+
+def _x_axis(data: "SimulationData", analysis: str) -> np.ndarray:
+    preferred = {"tran": data.time, "ac": data.frequency, "dc": data.sweep}.get(analysis)
+    for candidate in (preferred, data.time, data.frequency, data.sweep):
+        if candidate is not None and len(candidate):
+            return np.asarray(candidate, dtype=float)
+    raise _Unsupported(f"no x axis for {analysis} analysis")
+
+
+def _signal(data: "SimulationData", expression: str) -> np.ndarray:
+    match = _SIGNAL_PATTERN.match(expression.strip())
+    if match is None:
+        raise _Unsupported(f"expression {expression}")
+    kind = match.group(1).lower()
+    prefix = "I" if kind == "i" else "V"
+    values = _lookup(data, f"{prefix}({match.group(2)})")
+    if match.group(3) is not None:
+        values = values - _lookup(data, f"{prefix}({match.group(3)})")
+    if kind == "vdb":
+        return magnitude_db(values)
+    if kind == "vp":
+        return np.angle(values)
+    if kind == "vr":
+        return np.real(values).astype(float)
+    if kind == "vi":
+        return np.imag(values).astype(float)
+    if np.iscomplexobj(values):
+        return np.abs(values)
+    return values.astype(float)
+
+
+def _lookup(data: "SimulationData", name: str) -> np.ndarray:
+    values = data.get_signal(name)
+    if values is None:
+        lowered = name.lower()
+        for candidate in data.get_signal_names():
+            if candidate.lower() == lowered:
+                values = data.get_signal(candidate)
+                break
+    if values is None:
+        if name.lower() in ("v(0)", "v(gnd)"):
+            return np.zeros(1)
+        raise _Unsupported(f"signal {name} not in waveform data")
+    return np.asarray(values)
+
+
+def _number(token: str) -> float:
+    match = _NUMBER_PATTERN.match(token.strip())
+    if match is None:
+        raise _Unsupported(f"value {token}")
+    suffix = (match.group(2) or "").lower()
+    return float(match.group(1)) * _SPICE_SUFFIX_SCALES.get(suffix, 1.0)
+
+
+# ============================================================
+# 模块级单例
+# ============================================================
+
+measure_cross_checker = MeasureCrossChecker()
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "CROSS_CHECK_MATCH",
+    "CROSS_CHECK_MISMATCH",
+    "CROSS_CHECK_UNAVAILABLE",
+    "CROSS_CHECK_UNSUPPORTED",
+    "DEFAULT_RELATIVE_TOLERANCE",
+    "MeasureCrossCheck",
+    "MeasureCrossChecker",
+    "measure_cross_checker",
+]
@@ -191,6 +191,33 @@ class SimulationJob:
     error_message: Optional[str] = None
     """Human-readable failure reason. Set only on ``FAILED``."""
 
+    queue_depth_at_submit: int = 0
+    """Jobs already waiting in the manager's queue when this one was
+    submitted (all origins). Together with :attr:`queue_wait_seconds`
+    it shows whether a slow run was slow to start or slow to execute.
+    """
+
+    superseded_by: Optional[str] = None
+    """``job_id`` of the newer submission that replaced this job while
+    it was still queued (per-circuit coalescing). Set only on jobs the
+    manager cancelled for that reason.
+    """
+
+    # ------------------------------------------------------------------
+    # Queue metrics
+    # ------------------------------------------------------------------
+
+    @property
+    def queue_wait_seconds(self) -> float:
+        """Seconds spent ``PENDING``.
+
+        Measured up to ``started_at``; for jobs that never started it
+        runs up to ``finished_at`` (cancelled or superseded in the
+        queue), and for jobs still queued up to now.
+        """
+        end = self.started_at or self.finished_at or _utcnow()
+        return max(0.0, (end - self.submitted_at).total_seconds())
+
     # ------------------------------------------------------------------
     # Lifecycle transitions
     # ------------------------------------------------------------------
@@ -6,8 +6,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Set
 
+from domain.simulation.spice.bundled_library_index import load_bundled_library_index
 from domain.simulation.spice.runtime_compatibility import load_runtime_compatible_bundled_subcircuit_path_index
-from resources.resource_loader import get_spice_cmp_dir
 
 
 @dataclass(frozen=True)
@@ -90,28 +90,14 @@ class BundledSpiceLibraryInjector:
             return self._cmp_index
 
         index: Dict[str, BundledModelBlock] = {}
-        cmp_dir = get_spice_cmp_dir()
-        if not cmp_dir.exists():
-            self._cmp_index = index
-            return index
-
-        for model_file in sorted(path for path in cmp_dir.iterdir() if path.is_file()):
-            content = self._read_text(model_file)
-            if not content:
+        for source in load_bundled_library_index().model_blocks:
+            if source.name in index:
                 continue
-            for block in self._iter_model_blocks(content):
-                match = re.match(r'^\s*\.model\s+([^\s]+)', block, re.IGNORECASE)
-                if not match:
-                    continue
-                model_name = match.group(1).strip().lower()
-                index.setdefault(
-                    model_name,
-                    BundledModelBlock(
-                        name=model_name,
-                        source_file=model_file,
-                        text=self._sanitize_model_block(block),
-                    ),
-                )
+            index[source.name] = BundledModelBlock(
+                name=source.name,
+                source_file=source.source_file,
+                text=self._sanitize_model_block(source.text),
+            )
 
         self._cmp_index = index
         return index
@@ -123,33 +109,6 @@ class BundledSpiceLibraryInjector:
         self._subckt_index = dict(load_runtime_compatible_bundled_subcircuit_path_index())
         return self._subckt_index
 
-    def _read_text(self, file_path: Path) -> str:
-        for encoding in ('utf-8', 'latin1'):
-            try:
-                return file_path.read_text(encoding=encoding, errors='ignore')
-            except Exception:
-                continue
-        self._logger.warning(f'读取内置模型文件失败，已跳过: {file_path}')
-        return ''
-
-    def _iter_model_blocks(self, content: str) -> Iterable[str]:
-        current: List[str] = []
-        for line in content.splitlines():
-            stripped = line.lstrip()
-            if re.match(r'^\.model\s+', stripped, re.IGNORECASE):
-                if current:
-                    yield '\n'.join(current)
-                current = [line]
-                continue
-            if current and stripped.startswith('+'):
-                current.append(line)
-                continue
-            if current:
-                yield '\n'.join(current)
-                current = []
-        if current:
-            yield '\n'.join(current)
-
     # LTspice-only metadata keys per device type that ngspice does not recognise.
     # VDMOS is excluded because ngspice's VDMOS handler accepts mfg/Vds/Ron/Qg.
     _SANITIZE_RULES: List[tuple] = [
@@ -0,0 +1,374 @@
+# Simulation Bundle Archiver - Archival Tier for Historic Bundles
+"""
+历史仿真结果包归档
+
+职责：
+- 将 simulation_results/ 下超过指定天数的结果包转为归档形态：
+  - result.json 中的数值数组与 raw_output 移入压缩列文件
+    （result_column_store），result.json 只保留存根
+  - 可由 result.json 重新生成的派生类别（raw_data、output_log）
+    从磁盘删除，导出清单中标记为 archived
+- 统计归档前后的字节数，输出回收空间报告
+- 命令行入口：
+    python -m domain.simulation.service.simulation_bundle_archiver <项目目录>
+        [--older-than-days 30] [--float32] [--dry-run]
+
+透明读取：
+- SimulationResultRepository.load 与 SimulationOutputReader 经
+  result_column_store 还原存根，WaveformDataService 与 Agent 读取工具
+  拿到的 SimulationResult 与归档前一致
+- 读取工具通过 ensure_bundle_categories 请求 raw_data / output_log 时，
+  archived 类别由 result.json 按需重新生成
+
+设计说明：
+- 结果包年龄取 result.json 的 mtime；归档保留原 mtime，历史列表排序不变
+- 已归档、仍有待导出类别、或 result.json 无法解析的结果包跳过
+- 默认无损：坐标轴与信号保持 float64；--float32 只降低信号精度，
+  坐标轴始终无损
+- 运行中的应用可能通过结果文件监控收到 result.json 变化事件，
+  建议在项目关闭时执行归档
+"""
+
+import argparse
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from domain.simulation.data.result_column_store import (
+    default_codec,
+    is_archived_payload,
+    pack_result_archive,
+    write_result_archive,
+)
+from domain.simulation.data.simulation_artifact_exporter import (
+    CANONICAL_RESULTS_DIR,
+    CATEGORY_OUTPUT_LOG,
+    CATEGORY_RAW_DATA,
+    RESULT_JSON_FILENAME,
+    simulation_artifact_exporter,
+)
+from domain.simulation.data.simulation_artifact_persistence import (
+    EXPORT_STATUS_PENDING,
+    EXPORT_STATUS_RUNNING,
+    simulation_artifact_persistence,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+DEFAULT_ARCHIVE_AGE_DAYS = 30
+
+# 归档时删除、读取时按需重新生成的派生类别（体积最大的两类）
+ARCHIVED_CATEGORIES = (CATEGORY_RAW_DATA, CATEGORY_OUTPUT_LOG)
+
+ARCHIVE_STATUS_ARCHIVED = "archived"
+ARCHIVE_STATUS_WOULD_ARCHIVE = "would_archive"
+ARCHIVE_STATUS_SKIPPED = "skipped"
+ARCHIVE_STATUS_FAILED = "failed"
+
+
+# ============================================================
+# 报告数据结构
+# ============================================================
+
+@dataclass
+class BundleArchiveEntry:
+    """
+    单个结果包的归档结果
+
+    Attributes:
+        bundle_dir: 结果包目录（相对项目根目录，POSIX）
+        status: archived / would_archive / skipped / failed
+        bytes_before: 归档前 result.json 与被删除类别的字节数
+        bytes_after: 归档后存根与列文件的字节数
+        reason: 跳过或失败原因
+        lossy: 信号是否以 float32 存储
+    """
+    bundle_dir: str
+    status: str
+    bytes_before: int = 0
+    bytes_after: int = 0
+    reason: str = ""
+    lossy: bool = False
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+@dataclass
+class ArchiveReport:
+    """一次归档运行的汇总"""
+    project_root: str
+    older_than_days: float
+    dry_run: bool
+    codec: str
+    entries: List[BundleArchiveEntry] = field(default_factory=list)
+
+    def _counted(self) -> List[BundleArchiveEntry]:
+        return [
+            entry for entry in self.entries
+            if entry.status in (ARCHIVE_STATUS_ARCHIVED, ARCHIVE_STATUS_WOULD_ARCHIVE)
+        ]
+
+    @property
+    def archived_count(self) -> int:
+        return len(self._counted())
+
+    @property
+    def bytes_before(self) -> int:
+        return sum(entry.bytes_before for entry in self._counted())
+
+    @property
+    def bytes_after(self) -> int:
+        return sum(entry.bytes_after for entry in self._counted())
+
+    @property
+    def bytes_reclaimed(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+# ============================================================
+# SimulationBundleArchiver
+# ============================================================
+
+class SimulationBundleArchiver:
+    """历史结果包归档器"""
+
+    def archive_project(
+        self,
+        project_root: str,
+        *,
+        older_than_days: float = DEFAULT_ARCHIVE_AGE_DAYS,
+        float32: bool = False,
+        dry_run: bool = False,
+        now: Optional[float] = None,
+    ) -> ArchiveReport:
+        """
+        归档项目中超过 older_than_days 天的结果包
+
+        Args:
+            project_root: 项目根目录
+            older_than_days: 年龄阈值（天），按 result.json 的 mtime 计算
+            float32: 信号列是否降为 float32 存储（有损）
+            dry_run: 只统计，不修改磁盘
+            now: 当前时间戳（测试使用），默认 time.time()
+
+        Returns:
+            ArchiveReport
+        """
+        root = Path(project_root)
+        report = ArchiveReport(
+            project_root=str(root),
+            older_than_days=older_than_days,
+            dry_run=dry_run,
+            codec=default_codec(),
+        )
+        results_dir = root / CANONICAL_RESULTS_DIR
+        if not results_dir.is_dir():
+            return report
+
+        cutoff = (time.time() if now is None else now) - older_than_days * 86400
+        for result_path in sorted(results_dir.rglob(RESULT_JSON_FILENAME)):
+            try:
+                if not result_path.is_file() or result_path.stat().st_mtime > cutoff:
+                    continue
+            except OSError:
+                continue
+            entry = self.archive_bundle(result_path.parent, float32=float32, dry_run=dry_run)
+            entry.bundle_dir = _relative_to(root, result_path.parent)
+            report.entries.append(entry)
+        return report
+
+    def archive_bundle(
+        self,
+        export_root: Path,
+        *,
+        float32: bool = False,
+        dry_run: bool = False,
+    ) -> BundleArchiveEntry:
+        """
+        归档单个结果包
+
+        先删除派生类别、再写列文件与存根：任一步中断时，
+        完整的 result.json 仍可重新生成被删除的类别。
+        已归档的结果包只再删除读取时按需重新生成的类别。
+        """
+        export_root = Path(export_root)
+        entry = BundleArchiveEntry(bundle_dir=export_root.as_posix(), status=ARCHIVE_STATUS_SKIPPED)
+        result_path = simulation_artifact_exporter.result_json_path(export_root)
+        try:
+            payload = json.loads(result_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            entry.reason = f"result.json 无法解析: {e}"
+            return entry
+        if not isinstance(payload, dict):
+            entry.reason = "result.json 格式无效"
+            return entry
+        if is_archived_payload(payload):
+            return self._rearchive_categories(export_root, entry, dry_run=dry_run)
+
+        statuses = simulation_artifact_persistence.read_category_status(export_root)
+        if any(status in (EXPORT_STATUS_PENDING, EXPORT_STATUS_RUNNING) for status in statuses.values()):
+            entry.reason = "仍有类别等待导出"
+            return entry
+
+        archive_path = simulation_artifact_exporter.result_archive_path(export_root)
+        try:
+            result_size = result_path.stat().st_size
+            if dry_run:
+                dropped = simulation_artifact_persistence.archive_categories(
+                    export_root, ARCHIVED_CATEGORIES, dry_run=True
+                )
+                stub_bytes, archive_bytes = pack_result_archive(
+                    payload, archive_path.name, float32=float32
+                )
+                stub_size, archive_size = len(stub_bytes), len(archive_bytes)
+            else:
+                dropped = simulation_artifact_persistence.archive_categories(
+                    export_root, ARCHIVED_CATEGORIES
+                )
+                stub_size, archive_size = write_result_archive(
+                    result_path, archive_path, payload, float32=float32
+                )
+        except Exception as e:
+            _logger.warning(f"归档结果包失败: {export_root}: {e}")
+            entry.status = ARCHIVE_STATUS_FAILED
+            entry.reason = str(e)
+            return entry
+
+        entry.status = ARCHIVE_STATUS_WOULD_ARCHIVE if dry_run else ARCHIVE_STATUS_ARCHIVED
+        entry.bytes_before = result_size + sum(dropped.values())
+        entry.bytes_after = stub_size + archive_size
+        entry.lossy = float32
+        return entry
+
+    def _rearchive_categories(
+        self,
+        export_root: Path,
+        entry: BundleArchiveEntry,
+        *,
+        dry_run: bool,
+    ) -> BundleArchiveEntry:
+        """存根已写好时，再次删除被 ensure 重新生成的派生类别"""
+        try:
+            dropped = simulation_artifact_persistence.archive_categories(
+                export_root, ARCHIVED_CATEGORIES, dry_run=dry_run
+            )
+        except Exception as e:
+            _logger.warning(f"归档结果包失败: {export_root}: {e}")
+            entry.status = ARCHIVE_STATUS_FAILED
+            entry.reason = str(e)
+            return entry
+        if not dropped:
+            entry.reason = "已归档"
+            return entry
+        entry.status = ARCHIVE_STATUS_WOULD_ARCHIVE if dry_run else ARCHIVE_STATUS_ARCHIVED
+        entry.bytes_before = sum(dropped.values())
+        entry.reason = "重新归档: " + ", ".join(sorted(dropped))
+        return entry
+
+
+# ============================================================
+# 报告与命令行
+# ============================================================
+
+def format_archive_report(report: ArchiveReport) -> str:
+    """格式化归档报告（命令行输出）"""
+    action = "可归档" if report.dry_run else "已归档"
+    lines = [
+        f"项目: {report.project_root}",
+        f"阈值: {report.older_than_days:g} 天，压缩: {report.codec}"
+        + ("（预演，未修改磁盘）" if report.dry_run else ""),
+    ]
+    for entry in report.entries:
+        if entry.status in (ARCHIVE_STATUS_ARCHIVED, ARCHIVE_STATUS_WOULD_ARCHIVE):
+            lines.append(
+                f"  {entry.bundle_dir}: {_format_bytes(entry.bytes_before)} -> "
+                f"{_format_bytes(entry.bytes_after)}" + ("（float32）" if entry.lossy else "")
+            )
+        else:
+            lines.append(f"  {entry.bundle_dir}: {entry.status}（{entry.reason}）")
+    ratio = report.bytes_after / report.bytes_before if report.bytes_before else 1.0
+    lines.append(
+        f"{action} {report.archived_count} 个结果包: "
+        f"{_format_bytes(report.bytes_before)} -> {_format_bytes(report.bytes_after)}，"
+        f"回收 {_format_bytes(report.bytes_reclaimed)}（{ratio:.1%}）"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """命令行入口：归档项目中的历史结果包并输出报告"""
+    parser = argparse.ArgumentParser(description="归档历史仿真结果包并报告回收空间")
+    parser.add_argument("project_root", help="项目根目录")
+    parser.add_argument(
+        "--older-than-days", type=float, default=DEFAULT_ARCHIVE_AGE_DAYS,
+        help=f"只归档早于该天数的结果包（默认 {DEFAULT_ARCHIVE_AGE_DAYS}）",
+    )
+    parser.add_argument("--float32", action="store_true", help="信号以 float32 存储（有损，坐标轴不受影响）")
+    parser.add_argument("--dry-run", action="store_true", help="只统计，不修改磁盘")
+    args = parser.parse_args(argv)
+
+    report = simulation_bundle_archiver.archive_project(
+        args.project_root,
+        older_than_days=args.older_than_days,
+        float32=args.float32,
+        dry_run=args.dry_run,
+    )
+    print(format_archive_report(report))
+    return 1 if any(entry.status == ARCHIVE_STATUS_FAILED for entry in report.entries) else 0
+
+
+def _format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KB", "MB"):
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def _relative_to(root: Path, path: Path) -> str:
+    try:
+        return path.resolve().relative_to(root.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+# ============================================================
+# 模块级单例
+# ============================================================
+
+simulation_bundle_archiver = SimulationBundleArchiver()
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "ARCHIVED_CATEGORIES",
+    "ARCHIVE_STATUS_ARCHIVED",
+    "ARCHIVE_STATUS_FAILED",
+    "ARCHIVE_STATUS_SKIPPED",
+    "ARCHIVE_STATUS_WOULD_ARCHIVE",
+    "ArchiveReport",
+    "BundleArchiveEntry",
+    "DEFAULT_ARCHIVE_AGE_DAYS",
+    "SimulationBundleArchiver",
+    "format_archive_report",
+    "main",
+    "simulation_bundle_archiver",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
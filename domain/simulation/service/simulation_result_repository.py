@@ -49,6 +49,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
+from domain.simulation.data.result_column_store import (
+    ResultArchiveError,
+    restore_result_payload,
+)
 from domain.simulation.data.simulation_artifact_exporter import (
     CANONICAL_RESULTS_DIR,
     RESULT_JSON_FILENAME,
@@ -173,7 +177,9 @@ class SimulationResultRepository:
         into a ``SimulationResult``. Agents, the UI history-click
         branch, the project-open restore path, and the STARTED/COMPLETE
         display branch all funnel through here — no parallel JSON
-        parser exists anywhere in the codebase.
+        parser exists anywhere in the codebase. Archived bundles (a
+        header stub plus a columnar sidecar, see ``result_column_store``)
+        are restored transparently.
         """
         if not result_path:
             return LoadResult.path_empty()
@@ -188,11 +194,13 @@ class SimulationResultRepository:
             if not content.strip():
                 return LoadResult.parse_error(result_path, "文件内容为空")
 
-            data = json.loads(content)
+            data = restore_result_payload(file_path, json.loads(content))
             result = SimulationResult.from_dict(data)
             return LoadResult.ok(result, result_path)
         except json.JSONDecodeError as e:
             return LoadResult.parse_error(result_path, f"JSON 解析失败: {e}")
+        except ResultArchiveError as e:
+            return LoadResult.parse_error(result_path, f"归档数据读取失败: {e}")
         except KeyError as e:
             return LoadResult.parse_error(result_path, f"缺少必需字段: {e}")
         except Exception as e:
@@ -10,6 +10,7 @@ from domain.simulation.spice.models import (
     SpiceToken,
     TokenSpan,
 )
+from domain.simulation.spice.parse_cache import SpiceParseCache, get_shared_parse_cache
 from domain.simulation.spice.parser import SpiceParser
 
 __all__ = [
@@ -23,5 +24,7 @@ __all__ = [
     "SpiceSubcircuit",
     "SpiceToken",
     "TokenSpan",
+    "SpiceParseCache",
     "SpiceParser",
+    "get_shared_parse_cache",
 ]
@@ -0,0 +1,373 @@
+"""Prebuilt, versioned index of the bundled SPICE libraries.
+
+Scanning ``resources/models/sub`` (~1,700 library files) and ``resources/models/cmp``
+on the first simulation of every process costs hundreds of milliseconds. This module
+captures everything the simulation path needs from those files in one compact
+gzip-compressed JSON document:
+
+- ``.subckt`` headers: name, file, line index, ports and leading comment lines
+- per-file runtime compatibility scan (unsupported LTspice tokens, model/subckt names)
+- raw ``.model`` blocks from the standard component files
+
+The index is keyed by a fingerprint of the resource directories (relative path and size
+of every file; mtimes are not stable across packaged-app extraction). Lookup order:
+
+1. ``resources/models/bundled_library_index.json.gz`` — generated at build time with
+   ``python -m domain.simulation.spice.bundled_library_index``
+2. the per-user cache under ``~/.circuit_design_ai/cache``
+3. a full scan, which then rewrites the per-user cache
+"""
+
+from __future__ import annotations
+
+import functools
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from infrastructure.config.settings import GLOBAL_CONFIG_DIR
+from resources.resource_loader import get_spice_models_dir
+
+
+BUNDLED_LIBRARY_INDEX_VERSION = 1
+BUNDLED_LIBRARY_INDEX_FILE = "bundled_library_index.json.gz"
+
+_CATALOG_FILE_PATTERNS: Tuple[str, ...] = ("*.lib", "*.sub", "*.cir", "*.sp", "*.ckt", "*.mod")
+_SUBCKT_HEADER_PATTERN = re.compile(r"^\s*\.subckt\s+([^\s(]+)(.*)$", re.IGNORECASE)
+_LEADING_CONTEXT_LINES = 16
+_TRAILING_CONTEXT_LINES = 31
+
+_UNSUPPORTED_LIBRARY_PATTERNS: Tuple[Tuple[str, re.Pattern[str]], ...] = (
+    ("OTA", re.compile(r"\bOTA\b", re.IGNORECASE)),
+    ("noiseless", re.compile(r"\bnoiseless\b", re.IGNORECASE)),
+    ("uplim", re.compile(r"\buplim\s*\(", re.IGNORECASE)),
+    ("dnlim", re.compile(r"\bdnlim\s*\(", re.IGNORECASE)),
+)
+_MODEL_PATTERN = re.compile(r"^\s*\.model\s+([^\s]+)", re.IGNORECASE)
+_SUBCKT_PATTERN = re.compile(r"^\s*\.subckt\s+([^\s(]+)", re.IGNORECASE)
+_MODEL_START_PATTERN = re.compile(r"^\.model\s+", re.IGNORECASE)
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BundledSubcircuitHeader:
+    name: str
+    source_file: Path
+    ports: Tuple[str, ...]
+    leading_comment_lines: Tuple[str, ...]
+    line_index: int = 0
+
+    @functools.cached_property
+    def trailing_lines(self) -> Tuple[str, ...]:
+        """Lines following the header; read from the source file on first access."""
+        lines = read_library_lines(self.source_file)
+        return lines[self.line_index + 1:self.line_index + 1 + _TRAILING_CONTEXT_LINES]
+
+
+@dataclass(frozen=True)
+class SpiceLibraryScan:
+    incompatible_reasons: Tuple[str, ...]
+    model_names: Tuple[str, ...]
+    subckt_names: Tuple[str, ...]
+
+    @property
+    def is_compatible(self) -> bool:
+        return not self.incompatible_reasons
+
+
+@dataclass(frozen=True)
+class BundledModelSource:
+    name: str
+    source_file: Path
+    text: str
+
+
+@dataclass(frozen=True)
+class BundledLibraryIndex:
+    fingerprint: str
+    subcircuit_headers: Tuple[BundledSubcircuitHeader, ...]
+    library_scans: Dict[Path, SpiceLibraryScan]
+    model_blocks: Tuple[BundledModelSource, ...]
+    origin: str
+
+    @functools.cached_property
+    def _scans_by_key(self) -> Dict[str, SpiceLibraryScan]:
+        return {_path_key(path): scan for path, scan in self.library_scans.items()}
+
+    def scan_for(self, file_path: Path) -> Optional[SpiceLibraryScan]:
+        """Stored scan for a bundled library file (``None`` for files outside the index)."""
+        return self._scans_by_key.get(_path_key(file_path))
+
+
+# ============================================================
+# Text scanning (shared with runtime_compatibility / the injector)
+# ============================================================
+
+def scan_spice_library_text(content: str) -> SpiceLibraryScan:
+    reasons = tuple(label for label, pattern in _UNSUPPORTED_LIBRARY_PATTERNS if pattern.search(content))
+    models = sorted({match.group(1).strip().lower() for match in _MODEL_PATTERN.finditer(content)})
+    subckts = sorted({match.group(1).strip().lower() for match in _SUBCKT_PATTERN.finditer(content)})
+    return SpiceLibraryScan(
+        incompatible_reasons=reasons,
+        model_names=tuple(models),
+        subckt_names=tuple(subckts),
+    )
+
+
+def iter_spice_model_blocks(content: str) -> Iterable[str]:
+    """Yield each ``.model`` statement together with its ``+`` continuation lines."""
+    current: List[str] = []
+    for line in content.splitlines():
+        stripped = line.lstrip()
+        if _MODEL_START_PATTERN.match(stripped):
+            if current:
+                yield '\n'.join(current)
+            current = [line]
+            continue
+        if current and stripped.startswith('+'):
+            current.append(line)
+            continue
+        if current:
+            yield '\n'.join(current)
+            current = []
+    if current:
+        yield '\n'.join(current)
+
+
+def read_library_text(file_path: Path) -> str:
+    for encoding in ("utf-8", "latin1"):
+        try:
+            return file_path.read_text(encoding=encoding, errors="ignore")
+        except Exception:
+            continue
+    return ""
+
+
+def read_library_lines(file_path: Path) -> Tuple[str, ...]:
+    return tuple(read_library_text(file_path).splitlines())
+
+
+# ============================================================
+# Loading
+# ============================================================
+
+@functools.lru_cache(maxsize=1)
+def load_bundled_library_index() -> BundledLibraryIndex:
+    models_dir = get_spice_models_dir()
+    fingerprint = compute_resource_fingerprint(models_dir)
+    for origin, path in (("prebuilt", models_dir / BUNDLED_LIBRARY_INDEX_FILE), ("cache", _user_cache_path())):
+        index = read_bundled_library_index(path, models_dir, fingerprint, origin)
+        if index is not None:
+            return index
+
+    _logger.info("Bundled library index missing or stale, scanning %s", models_dir)
+    index = build_bundled_library_index(models_dir, fingerprint)
+    write_bundled_library_index(index, models_dir, _user_cache_path())
+    return index
+
+
+def compute_resource_fingerprint(models_dir: Path) -> str:
+    """Hash of (relative path, size) for every file under ``sub/`` and ``cmp/``."""
+    entries: List[Tuple[str, int]] = []
+    for subdir in ("sub", "cmp"):
+        root = models_dir / subdir
+        for dir_path, _dir_names, file_names in os.walk(root):
+            for file_name in file_names:
+                full_path = os.path.join(dir_path, file_name)
+                try:
+                    size = os.stat(full_path).st_size
+                except OSError:
+                    continue
+                entries.append((Path(os.path.relpath(full_path, models_dir)).as_posix(), size))
+    digest = hashlib.sha1(f"v{BUNDLED_LIBRARY_INDEX_VERSION}".encode())
+    for relative_path, size in sorted(entries):
+        digest.update(f"\0{relative_path}\0{size}".encode("utf-8", errors="surrogateescape"))
+    return digest.hexdigest()
+
+
+def build_bundled_library_index(models_dir: Path, fingerprint: str) -> BundledLibraryIndex:
+    headers: List[BundledSubcircuitHeader] = []
+    scans: Dict[Path, SpiceLibraryScan] = {}
+    sub_dir = models_dir / "sub"
+    if sub_dir.exists():
+        seen_files = set()
+        for pattern in _CATALOG_FILE_PATTERNS:
+            for file_path in sorted(sub_dir.rglob(pattern)):
+                normalized_file_path = str(file_path.resolve()).lower()
+                if normalized_file_path in seen_files:
+                    continue
+                seen_files.add(normalized_file_path)
+                content = read_library_text(file_path)
+                if not content:
+                    continue
+                scans[file_path] = scan_spice_library_text(content)
+                lines = content.splitlines()
+                for index, line in enumerate(lines):
+                    match = _SUBCKT_HEADER_PATTERN.match(line)
+                    if match is None:
+                        continue
+                    headers.append(
+                        BundledSubcircuitHeader(
+                            name=match.group(1).strip().lower(),
+                            source_file=file_path,
+                            ports=tuple(token for token in match.group(2).split() if token),
+                            leading_comment_lines=tuple(lines[max(0, index - _LEADING_CONTEXT_LINES):index]),
+                            line_index=index,
+                        )
+                    )
+
+    model_blocks: List[BundledModelSource] = []
+    cmp_dir = models_dir / "cmp"
+    if cmp_dir.exists():
+        for model_file in sorted(path for path in cmp_dir.iterdir() if path.is_file()):
+            for block in iter_spice_model_blocks(read_library_text(model_file)):
+                match = _MODEL_PATTERN.match(block)
+                if match:
+                    model_blocks.append(BundledModelSource(match.group(1).strip().lower(), model_file, block))
+
+    return BundledLibraryIndex(
+        fingerprint=fingerprint,
+        subcircuit_headers=tuple(headers),
+        library_scans=scans,
+        model_blocks=tuple(model_blocks),
+        origin="scan",
+    )
+
+
+def read_bundled_library_index(
+    path: Path,
+    models_dir: Path,
+    fingerprint: str,
+    origin: str,
+) -> Optional[BundledLibraryIndex]:
+    """Load a serialized index; ``None`` when missing, unreadable or stale."""
+    if not path.is_file():
+        return None
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            data = json.load(handle)
+        if data.get("version") != BUNDLED_LIBRARY_INDEX_VERSION or data.get("fingerprint") != fingerprint:
+            return None
+        return _index_from_dict(data, models_dir, origin)
+    except Exception as exc:
+        _logger.warning("Failed to read bundled library index %s: %s", path, exc)
+        return None
+
+
+def write_bundled_library_index(index: BundledLibraryIndex, models_dir: Path, path: Path) -> bool:
+    """Atomically write ``index`` to ``path``; returns ``False`` on failure."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as handle:
+            json.dump(_index_to_dict(index, models_dir), handle, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        return True
+    except Exception as exc:
+        _logger.warning("Failed to write bundled library index %s: %s", path, exc)
+        return False
+
+
+def _user_cache_path() -> Path:
+    return GLOBAL_CONFIG_DIR / "cache" / BUNDLED_LIBRARY_INDEX_FILE
+
+
+def _path_key(path: Path) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _index_to_dict(index: BundledLibraryIndex, models_dir: Path) -> Dict[str, Any]:
+    def relative(path: Path) -> str:
+        return Path(os.path.relpath(path, models_dir)).as_posix()
+
+    return {
+        "version": BUNDLED_LIBRARY_INDEX_VERSION,
+        "fingerprint": index.fingerprint,
+        "libraries": {
+            relative(path): [list(scan.incompatible_reasons), list(scan.model_names), list(scan.subckt_names)]
+            for path, scan in index.library_scans.items()
+        },
+        "subcircuits": [
+            [header.name, relative(header.source_file), header.line_index, list(header.ports),
+             list(header.leading_comment_lines)]
+            for header in index.subcircuit_headers
+        ],
+        "models": [[block.name, relative(block.source_file), block.text] for block in index.model_blocks],
+    }
+
+
+def _index_from_dict(data: Dict[str, Any], models_dir: Path, origin: str) -> BundledLibraryIndex:
+    paths: Dict[str, Path] = {}
+
+    def absolute(relative_path: str) -> Path:
+        path = paths.get(relative_path)
+        if path is None:
+            path = paths[relative_path] = models_dir / relative_path
+        return path
+
+    return BundledLibraryIndex(
+        fingerprint=data["fingerprint"],
+        subcircuit_headers=tuple(
+            BundledSubcircuitHeader(
+                name=name,
+                source_file=absolute(relative_path),
+                ports=tuple(ports),
+                leading_comment_lines=tuple(leading),
+                line_index=line_index,
+            )
+            for name, relative_path, line_index, ports, leading in data["subcircuits"]
+        ),
+        library_scans={
+            absolute(relative_path): SpiceLibraryScan(tuple(reasons), tuple(models), tuple(subckts))
+            for relative_path, (reasons, models, subckts) in data["libraries"].items()
+        },
+        model_blocks=tuple(
+            BundledModelSource(name, absolute(relative_path), text)
+            for name, relative_path, text in data["models"]
+        ),
+        origin=origin,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Build-time entry point: regenerate the prebuilt index next to the resources."""
+    models_dir = get_spice_models_dir()
+    index = build_bundled_library_index(models_dir, compute_resource_fingerprint(models_dir))
+    target = models_dir / BUNDLED_LIBRARY_INDEX_FILE
+    if not write_bundled_library_index(index, models_dir, target):
+        return 1
+    print(
+        f"{target}: {len(index.subcircuit_headers)} subckts, {len(index.library_scans)} libraries, "
+        f"{len(index.model_blocks)} models, {target.stat().st_size} bytes"
+    )
+    return 0
+
+
+__all__ = [
+    "BUNDLED_LIBRARY_INDEX_FILE",
+    "BUNDLED_LIBRARY_INDEX_VERSION",
+    "BundledLibraryIndex",
+    "BundledModelSource",
+    "BundledSubcircuitHeader",
+    "SpiceLibraryScan",
+    "build_bundled_library_index",
+    "compute_resource_fingerprint",
+    "iter_spice_model_blocks",
+    "load_bundled_library_index",
+    "read_bundled_library_index",
+    "read_library_lines",
+    "read_library_text",
+    "scan_spice_library_text",
+    "write_bundled_library_index",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import os
 import re
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from domain.simulation.spice.analysis_directive_authority import normalize_analysis_directive
+from domain.simulation.spice.bundled_library_index import load_bundled_library_index
 from domain.simulation.spice.ltspice_symbol_catalog import (
     LtspicePinDefinition,
     LtspiceSymbolCatalog,
@@ -22,7 +27,6 @@ from domain.simulation.spice.runtime_compatibility import (
     analyze_spice_library_file,
     load_runtime_compatible_bundled_subcircuit_path_index,
 )
-from resources.resource_loader import get_spice_cmp_dir
 
 
 @dataclass(frozen=True)
@@ -50,6 +54,15 @@ class AscBatchConversionExecution:
     failed_files: Tuple[Tuple[str, str], ...]
 
 
+_BatchOutcome = Tuple[Optional[TranscribedAscNetlist], str]
+
+# 批量转换默认在当前进程内逐个转换；spawn 进程池需由调用方显式开启
+# （max_workers），入口需调用 multiprocessing.freeze_support() 以支持打包构建。
+# 少于该文件数时不建议开启（进程启动开销不划算）
+ASC_BATCH_PARALLEL_MIN_FILES = 4
+ASC_BATCH_MAX_WORKERS = 4
+
+
 @dataclass(frozen=True)
 class _Point:
     x: int
@@ -134,6 +147,33 @@ class _DisjointSet:
         self._rank[left_root] += 1
 
 
+class _AxisPointIndex:
+    def __init__(self, points: Sequence[_Point]) -> None:
+        self._points = points
+        ys_by_x: Dict[int, List[int]] = {}
+        xs_by_y: Dict[int, List[int]] = {}
+        for point in points:
+            ys_by_x.setdefault(point.x, []).append(point.y)
+            xs_by_y.setdefault(point.y, []).append(point.x)
+        for coordinates in (*ys_by_x.values(), *xs_by_y.values()):
+            coordinates.sort()
+        self._ys_by_x = ys_by_x
+        self._xs_by_y = xs_by_y
+
+    def points_on(self, wire: _WireSegment) -> List[_Point]:
+        start, end = wire.start, wire.end
+        if start.x == end.x:
+            ys = self._ys_by_x.get(start.x, ())
+            low, high = sorted((start.y, end.y))
+            return [_Point(x=start.x, y=y) for y in ys[bisect_left(ys, low):bisect_right(ys, high)]]
+        if start.y == end.y:
+            xs = self._xs_by_y.get(start.y, ())
+            low, high = sorted((start.x, end.x))
+            return [_Point(x=x, y=start.y) for x in xs[bisect_left(xs, low):bisect_right(xs, high)]]
+        on_segment = [point for point in self._points if _point_on_segment(point, wire)]
+        return sorted(on_segment, key=lambda point: (point.x, point.y))
+
+
 class LtspiceAscToCirTranscriber:
     _EARLY_DIRECTIVE_PREFIXES = (
         ".include",
@@ -163,16 +203,27 @@ class LtspiceAscToCirTranscriber:
         self._bundled_models = _load_bundled_model_names()
         self._runtime_normalizer = NetlistRuntimeCompatibilityNormalizer()
 
-    def convert_files(self, asc_paths: Sequence[str], output_dir: str) -> AscBatchConversionExecution:
+    def convert_files(
+        self,
+        asc_paths: Sequence[str],
+        output_dir: str,
+        *,
+        max_workers: Optional[int] = None,
+    ) -> AscBatchConversionExecution:
         output_root = Path(str(output_dir or "")).expanduser().resolve()
         output_root.mkdir(parents=True, exist_ok=True)
+        source_paths = [Path(str(raw_path or "")).expanduser().resolve() for raw_path in asc_paths]
         converted_files: List[AscConversionOutput] = []
         failed_files: List[Tuple[str, str]] = []
         used_output_names: Set[str] = set()
-        for raw_path in asc_paths:
-            source_path = Path(str(raw_path or "")).expanduser().resolve()
+        for source_path, (transcribed, error) in zip(
+            source_paths,
+            self._transcribe_batch(source_paths, output_root, max_workers),
+        ):
+            if transcribed is None:
+                failed_files.append((str(source_path), error))
+                continue
             try:
-                transcribed = self.transcribe_file(str(source_path), output_dir=str(output_root))
                 output_name = _build_unique_output_name(source_path.stem, used_output_names)
                 used_output_names.add(output_name.lower())
                 output_path = output_root / output_name
@@ -194,6 +245,38 @@ class LtspiceAscToCirTranscriber:
             failed_files=tuple(failed_files),
         )
 
+    def _transcribe_batch(
+        self,
+        source_paths: Sequence[Path],
+        output_root: Path,
+        max_workers: Optional[int],
+    ) -> List[_BatchOutcome]:
+        worker_count = _resolve_batch_worker_count(len(source_paths), max_workers)
+        if worker_count > 1:
+            # 子进程共享父进程预加载的符号库，不再各自扫描 .asy
+            self._symbol_catalog.preload()
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=worker_count,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_batch_worker,
+                    initargs=(self._symbol_catalog,),
+                ) as pool:
+                    return list(pool.map(
+                        _transcribe_in_batch_worker,
+                        [str(source_path) for source_path in source_paths],
+                        [str(output_root)] * len(source_paths),
+                    ))
+            except (BrokenProcessPool, OSError) as exc:
+                self._logger.warning(f"ASC 批量转换进程池不可用，改为逐个转换: {exc}")
+        return [self._transcribe_safely(source_path, output_root) for source_path in source_paths]
+
+    def _transcribe_safely(self, source_path: Path, output_root: Path) -> _BatchOutcome:
+        try:
+            return self.transcribe_file(str(source_path), output_dir=str(output_root)), ""
+        except Exception as exc:
+            return None, str(exc)
+
     def transcribe_file(self, asc_path: str, *, output_dir: str) -> TranscribedAscNetlist:
         source_path = Path(str(asc_path or "")).expanduser().resolve()
         if not source_path.is_file():
@@ -388,11 +471,9 @@ class LtspiceAscToCirTranscriber:
                 _add_point(pin.point)
         dsu = _DisjointSet(len(points))
         point_index = {point: index for index, point in enumerate(points)}
+        axis_index = _AxisPointIndex(points)
         for wire in document.wires:
-            on_segment = [point for point in points if _point_on_segment(point, wire)]
-            if len(on_segment) < 2:
-                continue
-            ordered_points = sorted(on_segment, key=lambda point: (point.x, point.y) if wire.start.x != wire.end.x else (point.y, point.x))
+            ordered_points = axis_index.points_on(wire)
             for left, right in zip(ordered_points, ordered_points[1:]):
                 dsu.union(point_index[left], point_index[right])
         labels_by_root: Dict[int, List[str]] = {}
@@ -910,30 +991,42 @@ def _read_optional_text(file_path: Path) -> str:
 
 
 def _load_bundled_model_names() -> Set[str]:
-    model_names: Set[str] = set()
-    cmp_dir = get_spice_cmp_dir()
-    if not cmp_dir.exists():
-        return model_names
-    pattern = re.compile(r"^\s*\.model\s+([^\s]+)", re.IGNORECASE)
-    for file_path in cmp_dir.iterdir():
-        if not file_path.is_file():
-            continue
-        for encoding in ("utf-8", "latin1"):
-            try:
-                content = file_path.read_text(encoding=encoding, errors="ignore")
-                break
-            except Exception:
-                content = ""
-        for line in content.splitlines():
-            match = pattern.match(line)
-            if match is not None:
-                model_names.add(match.group(1).strip().lower())
-    return model_names
+    return {block.name for block in load_bundled_library_index().model_blocks}
+
+
+def recommended_batch_workers(file_count: int) -> int:
+    """按文件数给出建议的批量转换进程数（供调用方显式开启进程池）"""
+    if file_count < ASC_BATCH_PARALLEL_MIN_FILES:
+        return 1
+    return min(ASC_BATCH_MAX_WORKERS, os.cpu_count() or 1)
+
+
+def _resolve_batch_worker_count(file_count: int, max_workers: Optional[int]) -> int:
+    if max_workers is None:
+        return 1
+    return max(1, min(int(max_workers), file_count))
+
+
+_batch_transcriber: Optional[LtspiceAscToCirTranscriber] = None
+
+
+def _init_batch_worker(symbol_catalog: LtspiceSymbolCatalog) -> None:
+    global _batch_transcriber
+    _batch_transcriber = LtspiceAscToCirTranscriber(symbol_catalog=symbol_catalog)
+
+
+def _transcribe_in_batch_worker(source_path: str, output_root: str) -> _BatchOutcome:
+    if _batch_transcriber is None:
+        return None, "ASC 批量转换子进程未初始化"
+    return _batch_transcriber._transcribe_safely(Path(source_path), Path(output_root))
 
 
 __all__ = [
+    "ASC_BATCH_MAX_WORKERS",
+    "ASC_BATCH_PARALLEL_MIN_FILES",
     "AscBatchConversionExecution",
     "AscConversionOutput",
     "LtspiceAscToCirTranscriber",
     "TranscribedAscNetlist",
+    "recommended_batch_workers",
 ]
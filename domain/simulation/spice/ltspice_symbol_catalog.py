@@ -44,6 +44,10 @@ class LtspiceSymbolCatalog:
             return definition
         return self._symbols_by_basename.get(normalized.rsplit("/", 1)[-1])
 
+    def preload(self) -> LtspiceSymbolCatalog:
+        self._ensure_loaded()
+        return self
+
     def all_symbols(self) -> Sequence[LtspiceSymbolDefinition]:
         self._ensure_loaded()
         assert self._symbols_by_key is not None
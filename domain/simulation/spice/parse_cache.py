@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from domain.simulation.spice.models import SpiceDocument
+
+
+DEFAULT_PARSE_CACHE_ENTRIES = 32
+
+
+@dataclass(frozen=True)
+class SpiceParseCacheEntry:
+    source_file: str
+    content: str
+    document: SpiceDocument
+    model_variants: Dict[str, str]
+
+
+def make_content_digest(content: str) -> str:
+    return hashlib.blake2b(str(content or "").encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SpiceParseCache:
+    """Process-wide LRU of parsed netlists keyed by ``(source_file,
+    content digest)``.
+
+    The schematic view, the runtime compatibility normalizer and the
+    ASC transcriber all parse the same netlist text repeatedly; a hit
+    returns the previously built ``SpiceDocument`` object. Documents
+    handed out by the cache are shared between callers and must be
+    treated as read-only.
+
+    The parse result depends only on the file path and its text: the
+    parser never opens include files, and the bundled model / opamp
+    registries it consults are process-constant. Dependency snapshots
+    therefore only enter the schematic *revision*, which the builder
+    uses as its payload key.
+
+    Besides the keyed entries, the cache remembers the most recent
+    entry per source file so the parser can reparse incrementally
+    when a single component line changed (the common
+    ``updateSchematicValue`` round-trip).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PARSE_CACHE_ENTRIES) -> None:
+        self._max_entries = max(0, int(max_entries))
+        self._entries: "OrderedDict[Tuple[str, str], SpiceParseCacheEntry]" = OrderedDict()
+        self._latest_by_file: Dict[str, SpiceParseCacheEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    def get(self, source_file: str, content: str, digest: str = "") -> Optional[SpiceParseCacheEntry]:
+        if not self.enabled:
+            return None
+        key = (str(source_file or ""), digest or make_content_digest(content))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.content != content:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._latest_by_file[key[0]] = entry
+            self.hits += 1
+            return entry
+
+    def latest(self, source_file: str) -> Optional[SpiceParseCacheEntry]:
+        with self._lock:
+            return self._latest_by_file.get(str(source_file or ""))
+
+    def put(self, entry: SpiceParseCacheEntry, digest: str = "") -> None:
+        if not self.enabled:
+            return
+        key = (entry.source_file, digest or make_content_digest(entry.content))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._latest_by_file[entry.source_file] = entry
+            while len(self._entries) > self._max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                if self._latest_by_file.get(evicted.source_file) is evicted:
+                    del self._latest_by_file[evicted.source_file]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._latest_by_file.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_shared_parse_cache = SpiceParseCache()
+
+
+def get_shared_parse_cache() -> SpiceParseCache:
+    return _shared_parse_cache
+
+
+__all__ = [
+    "DEFAULT_PARSE_CACHE_ENTRIES",
+    "SpiceParseCache",
+    "SpiceParseCacheEntry",
+    "get_shared_parse_cache",
+    "make_content_digest",
+]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 import functools
 import hashlib
 import re
@@ -19,6 +20,12 @@ from domain.simulation.spice.models import (
     SpiceToken,
     TokenSpan,
 )
+from domain.simulation.spice.parse_cache import (
+    SpiceParseCache,
+    SpiceParseCacheEntry,
+    get_shared_parse_cache,
+    make_content_digest,
+)
 from domain.simulation.spice.primitive_resolver import SpicePrimitiveResolver
 
 
@@ -91,10 +98,16 @@ _READONLY_COMPLEX_EXPRESSION = "字段由复杂表达式描述，首版保持只
 _READONLY_UNSUPPORTED_FIELD = "该字段当前未提供语义等价写回能力"
 
 
+# Instance kinds whose parse result is touched by the primitive
+# resolver; an edited line of these kinds always triggers a full parse.
+_RESOLVER_SENSITIVE_KINDS = frozenset({"X", "U"})
+
+
 class SpiceParser:
-    def __init__(self) -> None:
+    def __init__(self, parse_cache: Optional[SpiceParseCache] = None) -> None:
         self._include_parser = IncludeParser()
         self._primitive_resolver = SpicePrimitiveResolver()
+        self._parse_cache = parse_cache if parse_cache is not None else get_shared_parse_cache()
 
     def parse_file(self, file_path: str) -> SpiceDocument:
         path = Path(file_path)
@@ -102,6 +115,39 @@ class SpiceParser:
         return self.parse_content(content, str(path))
 
     def parse_content(self, content: str, source_file: str) -> SpiceDocument:
+        """Parse ``content`` through the shared parse cache.
+
+        The returned document may be shared with other callers that
+        parsed the same text and must not be mutated. On a miss, if the
+        previous version of the same file differs by exactly one
+        component line, only that line is reparsed and the spans of
+        everything after it are shifted.
+        """
+        source_key = str(source_file or "")
+        if not self._parse_cache.enabled:
+            return self._parse_uncached(content, source_key)[0]
+
+        digest = make_content_digest(content)
+        cached = self._parse_cache.get(source_key, content, digest)
+        if cached is not None:
+            return cached.document
+
+        entry = None
+        previous = self._parse_cache.latest(source_key)
+        if previous is not None:
+            entry = self._reparse_single_line(previous, content)
+        if entry is None:
+            document, model_variants = self._parse_uncached(content, source_key)
+            entry = SpiceParseCacheEntry(
+                source_file=source_key,
+                content=content,
+                document=document,
+                model_variants=model_variants,
+            )
+        self._parse_cache.put(entry, digest)
+        return entry.document
+
+    def _parse_uncached(self, content: str, source_file: str) -> Tuple[SpiceDocument, Dict[str, str]]:
         document = SpiceDocument(source_file=str(source_file or ""))
         subcircuit_stack: List[SpiceSubcircuit] = []
         lines = content.splitlines(keepends=True)
@@ -194,7 +240,128 @@ class SpiceParser:
             absolute_offset += len(raw_line)
 
         self._primitive_resolver.apply(document)
-        return document
+        return document, model_variants
+
+    def _reparse_single_line(
+        self,
+        previous: SpiceParseCacheEntry,
+        content: str,
+    ) -> Optional[SpiceParseCacheEntry]:
+        """Incrementally derive the document for ``content`` from the
+        previous parse of the same file.
+
+        Only applies when the line count is unchanged and exactly one
+        line differs, and that line is (before and after) an instance
+        line of the same component whose kind the primitive resolver
+        ignores — i.e. the ``updateSchematicValue`` case of rewriting a
+        single R / C / L / V / I value token. Everything else returns
+        ``None`` and falls back to a full parse.
+        """
+        old_lines = previous.content.splitlines(keepends=True)
+        new_lines = content.splitlines(keepends=True)
+        if len(old_lines) != len(new_lines):
+            return None
+
+        changed_index = -1
+        for line_index, (old_line, new_line) in enumerate(zip(old_lines, new_lines)):
+            if old_line != new_line:
+                if changed_index >= 0:
+                    return None
+                changed_index = line_index
+        if changed_index < 0:
+            return None
+
+        old_document = previous.document
+        old_component = None
+        for component in self._iter_document_components(old_document):
+            if component.source_span is not None and component.source_span.line_index == changed_index:
+                old_component = component
+                break
+        if old_component is None or old_component.kind in _RESOLVER_SENSITIVE_KINDS:
+            return None
+
+        new_line_text = new_lines[changed_index].rstrip("\r\n")
+        new_tokens = new_line_text.split()
+        if not new_tokens or new_tokens[0] != old_component.instance_name:
+            return None
+
+        line_start = old_component.source_span.absolute_start
+        new_component = self._parse_component_line(
+            line_text=new_line_text,
+            source_file=old_document.source_file,
+            scope_path=list(old_component.scope_path),
+            line_index=changed_index,
+            absolute_offset=line_start,
+            model_variants=previous.model_variants,
+        )
+        if new_component is None:
+            return None
+
+        delta = len(new_lines[changed_index]) - len(old_lines[changed_index])
+
+        def rebuild(component: SpiceComponent) -> SpiceComponent:
+            if component is old_component:
+                return new_component
+            if delta and component.source_span is not None and component.source_span.absolute_start > line_start:
+                return self._shift_component(component, delta)
+            return component
+
+        def reposition(item):
+            span = item.source_span
+            if delta and span is not None and span.absolute_start > line_start:
+                return dataclasses.replace(item, source_span=_shift_span(span, delta))
+            return item
+
+        document = SpiceDocument(source_file=old_document.source_file)
+        document.components = [rebuild(component) for component in old_document.components]
+        document.includes = [reposition(include) for include in old_document.includes]
+        document.subcircuits = [
+            dataclasses.replace(
+                reposition(subcircuit),
+                components=[rebuild(component) for component in subcircuit.components],
+            )
+            for subcircuit in old_document.subcircuits
+        ]
+        document.parse_errors = [reposition(parse_error) for parse_error in old_document.parse_errors]
+        return SpiceParseCacheEntry(
+            source_file=previous.source_file,
+            content=content,
+            document=document,
+            model_variants=previous.model_variants,
+        )
+
+    def _shift_component(self, component: SpiceComponent, delta: int) -> SpiceComponent:
+        source_span = _shift_span(component.source_span, delta)
+        editable_fields = [
+            dataclasses.replace(
+                field,
+                token_span=_shift_span(field.token_span, delta),
+                source_span=_shift_span(field.source_span, delta),
+            )
+            for field in component.editable_fields
+        ]
+        return dataclasses.replace(
+            component,
+            id=self._make_component_id(
+                component.source_file,
+                component.scope_path,
+                component.instance_name,
+                source_span.absolute_start,
+            ),
+            source_span=source_span,
+            editable_fields=editable_fields,
+            token_spans={
+                field.field_key: field.token_span
+                for field in editable_fields
+                if field.token_span is not None
+            },
+        )
+
+    @staticmethod
+    def _iter_document_components(document: SpiceDocument):
+        yield from document.components
+        for subcircuit in document.subcircuits:
+            yield from subcircuit.components
 
     def _parse_subcircuit_header(
         self,
@@ -647,4 +814,14 @@ class SpiceParser:
         return hashlib.sha1(seed.encode("utf-8")).hexdigest()[:16]
 
 
+def _shift_span(span, delta: int):
+    if span is None:
+        return None
+    return dataclasses.replace(
+        span,
+        absolute_start=span.absolute_start + delta,
+        absolute_end=span.absolute_end + delta,
+    )
+
+
 __all__ = ["SpiceParser"]
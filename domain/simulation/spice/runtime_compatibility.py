@@ -7,19 +7,11 @@ from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from domain.simulation.spice.bundled_opamp_registry import load_bundled_opamp_descriptors
-from domain.simulation.spice.bundled_subcircuit_catalog import load_bundled_subcircuit_catalog
+from domain.simulation.spice.bundled_library_index import load_bundled_library_index, scan_spice_library_text
 from domain.simulation.spice.parser import SpiceParser
 
 
-_UNSUPPORTED_LIBRARY_PATTERNS: Tuple[Tuple[str, re.Pattern[str]], ...] = (
-    ("OTA", re.compile(r"\bOTA\b", re.IGNORECASE)),
-    ("noiseless", re.compile(r"\bnoiseless\b", re.IGNORECASE)),
-    ("uplim", re.compile(r"\buplim\s*\(", re.IGNORECASE)),
-    ("dnlim", re.compile(r"\bdnlim\s*\(", re.IGNORECASE)),
-)
 _INCLUDE_PATTERN = re.compile(r"^(\.(?:include|lib))\s+((?:\"[^\"]+\")|(?:'[^']+')|\S+)(.*)$", re.IGNORECASE)
-_MODEL_PATTERN = re.compile(r"^\s*\.model\s+([^\s]+)", re.IGNORECASE)
-_SUBCKT_PATTERN = re.compile(r"^\s*\.subckt\s+([^\s(]+)", re.IGNORECASE)
 
 
 @dataclass(frozen=True)
@@ -143,8 +135,16 @@ class RuntimeFallbackLibraryBuilder:
 class NetlistRuntimeCompatibilityNormalizer:
     def __init__(self) -> None:
         self._parser = SpiceParser()
-        self._bundled_opamps = load_bundled_opamp_descriptors()
-        self._compatible_bundled_subckts = set(load_runtime_compatible_bundled_subcircuit_path_index().keys())
+
+    # The bundled library index is loaded on first normalize() (or by the startup
+    # warm-up) rather than when SpiceExecutor is constructed during startup.
+    @functools.cached_property
+    def _bundled_opamps(self):
+        return load_bundled_opamp_descriptors()
+
+    @functools.cached_property
+    def _compatible_bundled_subckts(self) -> Set[str]:
+        return set(load_runtime_compatible_bundled_subcircuit_path_index().keys())
 
     def normalize(self, netlist_text: str, *, source_file: str) -> RuntimeNormalizedNetlist:
         warnings: List[str] = []
@@ -290,51 +290,46 @@ def _normalize_mos_instance_line_for_runtime(raw_line: str) -> Tuple[str, str, b
 @functools.lru_cache(maxsize=None)
 def analyze_spice_library_file(file_path: Path) -> SpiceLibraryCompatibility:
     resolved_path = Path(file_path).expanduser().resolve()
-    if not resolved_path.is_file():
-        return SpiceLibraryCompatibility(
-            file_path=str(resolved_path),
-            is_compatible=False,
-            model_names=(),
-            subckt_names=(),
-            incompatible_reasons=("文件不存在",),
-        )
+    scan = load_bundled_library_index().scan_for(resolved_path)
+    if scan is None:
+        if not resolved_path.is_file():
+            return SpiceLibraryCompatibility(
+                file_path=str(resolved_path),
+                is_compatible=False,
+                model_names=(),
+                subckt_names=(),
+                incompatible_reasons=("文件不存在",),
+            )
 
-    content = _read_optional_text(resolved_path)
-    if not content:
-        return SpiceLibraryCompatibility(
-            file_path=str(resolved_path),
-            is_compatible=False,
-            model_names=(),
-            subckt_names=(),
-            incompatible_reasons=("文件不可读",),
-        )
+        content = _read_optional_text(resolved_path)
+        if not content:
+            return SpiceLibraryCompatibility(
+                file_path=str(resolved_path),
+                is_compatible=False,
+                model_names=(),
+                subckt_names=(),
+                incompatible_reasons=("文件不可读",),
+            )
+        scan = scan_spice_library_text(content)
 
-    reasons = [label for label, pattern in _UNSUPPORTED_LIBRARY_PATTERNS if pattern.search(content)]
-    models = sorted({match.group(1).strip().lower() for match in _MODEL_PATTERN.finditer(content)})
-    subckts = sorted({match.group(1).strip().lower() for match in _SUBCKT_PATTERN.finditer(content)})
     return SpiceLibraryCompatibility(
         file_path=str(resolved_path),
-        is_compatible=not reasons,
-        model_names=tuple(models),
-        subckt_names=tuple(subckts),
-        incompatible_reasons=tuple(reasons),
+        is_compatible=scan.is_compatible,
+        model_names=scan.model_names,
+        subckt_names=scan.subckt_names,
+        incompatible_reasons=scan.incompatible_reasons,
     )
 
 
 @functools.lru_cache(maxsize=1)
 def load_runtime_compatible_bundled_subcircuit_path_index() -> Dict[str, Path]:
+    bundled_index = load_bundled_library_index()
     index: Dict[str, Path] = {}
-    compatibility_by_file: Dict[str, SpiceLibraryCompatibility] = {}
-    for header in load_bundled_subcircuit_catalog():
-        source_file = Path(header.source_file).resolve()
-        file_key = str(source_file).lower()
-        compatibility = compatibility_by_file.get(file_key)
-        if compatibility is None:
-            compatibility = analyze_spice_library_file(source_file)
-            compatibility_by_file[file_key] = compatibility
-        if not compatibility.is_compatible:
+    for header in bundled_index.subcircuit_headers:
+        scan = bundled_index.scan_for(header.source_file)
+        if scan is None or not scan.is_compatible:
             continue
-        index.setdefault(header.name, source_file)
+        index.setdefault(header.name, Path(header.source_file).resolve())
     return index
 
 
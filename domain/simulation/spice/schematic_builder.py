@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
@@ -40,7 +41,19 @@ def make_schematic_revision(file_path: str, source_text: str, dependency_snapsho
     return hashlib.sha1(seed.encode("utf-8")).hexdigest()[:16]
 
 
+_PAYLOAD_CACHE_ENTRIES = 8
+
+
 class SpiceSchematicBuilder:
+    def __init__(self) -> None:
+        # revision + title -> (document the payload was built from, payload).
+        # The document identity check keeps callers that pass an empty
+        # source_text for different documents from sharing a payload.
+        self._payload_cache: "OrderedDict[Tuple[str, str], Tuple[SpiceDocument, Dict[str, Any]]]" = OrderedDict()
+        # id(component) -> (component, payload) for the last built document;
+        # components reused by an incremental reparse keep their payload.
+        self._component_payloads: Dict[int, Tuple[SpiceComponent, Dict[str, Any]]] = {}
+
     def build_document(
         self,
         spice_document: Optional[SpiceDocument],
@@ -52,16 +65,37 @@ class SpiceSchematicBuilder:
         if spice_document is None:
             return self.build_empty_document()
 
+        file_path = str(spice_document.source_file or "")
+        revision = make_schematic_revision(file_path, source_text, dependency_snapshots)
+        cache_key = (revision, str(title or ""))
+        cached = self._payload_cache.get(cache_key)
+        if cached is not None and cached[0] is spice_document:
+            self._payload_cache.move_to_end(cache_key)
+            return dict(cached[1])
+
+        payload = self._build_document_payload(spice_document, revision=revision, title=title)
+        self._payload_cache[cache_key] = (spice_document, payload)
+        while len(self._payload_cache) > _PAYLOAD_CACHE_ENTRIES:
+            self._payload_cache.popitem(last=False)
+        return dict(payload)
+
+    def _build_document_payload(
+        self,
+        spice_document: SpiceDocument,
+        *,
+        revision: str,
+        title: str,
+    ) -> Dict[str, Any]:
         file_path = str(spice_document.source_file or "")
         file_name = Path(file_path).name if file_path else ""
         visible_subcircuits = self._collect_visible_subcircuits(spice_document)
         all_components = self._collect_all_components(spice_document, visible_subcircuits)
-        components_payload = [self._build_component_payload(component) for component in all_components]
+        components_payload = self._build_components_payload(all_components)
         document_title = title or file_name or "电路"
         readonly_reasons = self._collect_readonly_reasons(all_components)
         return {
             "document_id": make_schematic_document_id(file_path),
-            "revision": make_schematic_revision(file_path, source_text, dependency_snapshots),
+            "revision": revision,
             "file_path": file_path,
             "file_name": file_name,
             "has_schematic": bool(components_payload or visible_subcircuits),
@@ -122,6 +156,19 @@ class SpiceSchematicBuilder:
             components.extend(subcircuit.components)
         return components
 
+    def _build_components_payload(self, components: List[SpiceComponent]) -> List[Dict[str, Any]]:
+        previous = self._component_payloads
+        current: Dict[int, Tuple[SpiceComponent, Dict[str, Any]]] = {}
+        payloads: List[Dict[str, Any]] = []
+        for component in components:
+            entry = previous.get(id(component))
+            if entry is None or entry[0] is not component:
+                entry = (component, self._build_component_payload(component))
+            current[id(component)] = entry
+            payloads.append(entry[1])
+        self._component_payloads = current
+        return payloads
+
     def _build_component_payload(self, component: SpiceComponent) -> Dict[str, Any]:
         value_field = self._find_value_field(component.editable_fields)
         return {
@@ -48,6 +48,7 @@ export interface SimulationBridge {
   markReady(): void
   activateTab(tabId: SimulationTabId): void
   loadResultByPath(resultPath: string): void
+  compareResultsByPath(resultPaths: string[]): void
   updateSchematicValue(payload: SchematicValueUpdateRequestInput): void
   requestRawDataViewport(payload: RawDataViewportRequestInput): void
   copyRawDataRange(payload: RawDataCopyRequestInput): void
@@ -40,11 +40,15 @@ function resolveCircuitSelectionColumnCount(width: number): number {
  *
  * Visual language is a full reuse of the shared panel primitives and
  * of the generic ``surface-state-card--empty`` for empty states. No
- * local CSS, no inline ``style``, no bridge method is
- * introduced by this tab: the card click calls the single generic
- * ``bridge.loadResultByPath(result_path)`` entry point, and the
- * backend's post-load snapshot is what flips ``is_current`` on the
- * right card — the tab itself keeps no selection state.
+ * inline ``style`` and no tab-specific bridge method: the card click
+ * calls the single generic ``bridge.loadResultByPath(result_path)``
+ * entry point, and the backend's post-load snapshot is what flips
+ * ``is_current`` on the right card — the tab itself keeps no
+ * selection state. Cards whose backend-computed
+ * ``comparison_result_paths`` list at least two runs also offer a
+ * compare action, which hands that list to the generic
+ * ``bridge.compareResultsByPath`` entry point; the backend overlays
+ * the runs and switches to the waveform tab.
  */
 export function CircuitSelectionTab({ state, bridge }: CircuitSelectionTabProps) {
   const runtime = state.simulation_runtime
@@ -87,6 +91,12 @@ export function CircuitSelectionTab({ state, bridge }: CircuitSelectionTabProps)
                   }
                   bridge.loadResultByPath(target.result_path)
                 }}
+                onCompare={() => {
+                  if (!bridge || item.comparison_result_paths.length < 2) {
+                    return
+                  }
+                  bridge.compareResultsByPath(item.comparison_result_paths)
+                }}
               />
             ))}
           </div>
@@ -100,6 +110,7 @@ interface CircuitSelectionCardProps {
   item: CircuitSelectionItemState
   uiText: Record<string, string>
   onSelect: () => void
+  onCompare: () => void
 }
 
 /**
@@ -111,9 +122,11 @@ interface CircuitSelectionCardProps {
  * ``disabled`` mirrors the backend's ``latest_result.can_load``
  * predicate: a card whose newest bundle cannot be loaded (empty /
  * malformed ``result_path``) should not be clickable, without the tab
- * re-deriving that rule itself.
+ * re-deriving that rule itself. The compare action sits beside the
+ * card button (buttons cannot nest) and only renders when the backend
+ * found at least two comparable runs.
  */
-function CircuitSelectionCard({ item, uiText, onSelect }: CircuitSelectionCardProps) {
+function CircuitSelectionCard({ item, uiText, onSelect, onCompare }: CircuitSelectionCardProps) {
   const latest = item.latest_result
   const metaParts = [
     latest.analysis_type,
@@ -131,38 +144,51 @@ function CircuitSelectionCard({ item, uiText, onSelect }: CircuitSelectionCardPr
   ].filter(Boolean).join(' ')
   const displayName = item.circuit_display_name || latest.file_name || getUiText(uiText, 'simulation.circuit_selection.unnamed_circuit', 'Unnamed Circuit')
 
+  const comparableRunCount = item.comparison_result_paths.length
+
   return (
-    <button
-      type="button"
-      className={className}
-      disabled={!latest.can_load}
-      onClick={onSelect}
-      title={item.circuit_absolute_path || item.circuit_file}
-      {...(item.is_current ? { 'aria-current': 'true' as const } : null)}
-    >
-      <div className="circuit-selection-card__header">
-        <div className="circuit-selection-card__title-block">
-          <div className="circuit-selection-card__title">{displayName}</div>
-          <div className="circuit-selection-card__meta">
-            {metaParts.length
-              ? getUiText(uiText, 'simulation.circuit_selection.latest_run', 'Latest: {meta}', { meta: metaParts.join(' · ') })
-              : getUiText(uiText, 'simulation.circuit_selection.latest_run_empty', 'Latest: No metadata')}
+    <div className="circuit-selection-card-cell">
+      <button
+        type="button"
+        className={className}
+        disabled={!latest.can_load}
+        onClick={onSelect}
+        title={item.circuit_absolute_path || item.circuit_file}
+        {...(item.is_current ? { 'aria-current': 'true' as const } : null)}
+      >
+        <div className="circuit-selection-card__header">
+          <div className="circuit-selection-card__title-block">
+            <div className="circuit-selection-card__title">{displayName}</div>
+            <div className="circuit-selection-card__meta">
+              {metaParts.length
+                ? getUiText(uiText, 'simulation.circuit_selection.latest_run', 'Latest: {meta}', { meta: metaParts.join(' · ') })
+                : getUiText(uiText, 'simulation.circuit_selection.latest_run_empty', 'Latest: No metadata')}
+            </div>
           </div>
+          <div className="circuit-selection-card__run-count">{getUiText(uiText, 'simulation.circuit_selection.run_count', '{count} runs', { count: item.run_count })}</div>
         </div>
-        <div className="circuit-selection-card__run-count">{getUiText(uiText, 'simulation.circuit_selection.run_count', '{count} runs', { count: item.run_count })}</div>
-      </div>
-      <div className="circuit-selection-card__footer">
-        <div className="circuit-selection-card__badge-row">
-          {badges.map((badge) => (
-            <span
-              key={badge.label}
-              className={`circuit-selection-card__badge${badge.modifier}`}
-            >
-              {badge.label}
-            </span>
-          ))}
+        <div className="circuit-selection-card__footer">
+          <div className="circuit-selection-card__badge-row">
+            {badges.map((badge) => (
+              <span
+                key={badge.label}
+                className={`circuit-selection-card__badge${badge.modifier}`}
+              >
+                {badge.label}
+              </span>
+            ))}
+          </div>
         </div>
-      </div>
-    </button>
+      </button>
+      {comparableRunCount >= 2 ? (
+        <button
+          type="button"
+          className="sim-compact-button circuit-selection-card__compare"
+          onClick={onCompare}
+        >
+          {getUiText(uiText, 'simulation.circuit_selection.compare_runs', 'Compare {count} runs', { count: comparableRunCount })}
+        </button>
+      ) : null}
+    </div>
   )
 }
@@ -1,11 +1,12 @@
 import { useEffect, useMemo, useState } from 'react'
 
 import type { SimulationBridge } from '../../bridge/bridge'
-import type { SimulationMainState } from '../../types/state'
+import type { SimulationMainState, WaveformComparisonState } from '../../types/state'
 import { ResponsivePane } from '../layout/ResponsivePane'
 import { MeasurementFloatingPanel } from '../shared/MeasurementFloatingPanel'
 import { SignalSelectionSidebar } from '../shared/SignalSelectionSidebar'
 import { SeriesSvgChart } from '../shared/SeriesSvgChart'
+import type { SeriesSvgChartDatum } from '../shared/seriesSvgChartModel'
 import { formatMeasurementNumber } from '../shared/chartValueFormatting'
 import { getUiText } from '../../uiText'
 
@@ -21,6 +22,69 @@ function formatMeasurementDelta(valueA: number | null, valueB: number | null): s
   return formatMeasurementNumber(valueB - valueA)
 }
 
+/**
+ * Expand a comparison snapshot into plain chart series.
+ *
+ * The backend ships every run as one flattened x/y pair with a
+ * ``null`` gap between runs; each gap-delimited segment becomes its
+ * own polyline in the run colour, followed by the mean and the dashed
+ * min/max envelope.
+ */
+function buildComparisonSeries(
+  comparison: WaveformComparisonState,
+  uiText: Record<string, string>,
+): SeriesSvgChartDatum[] {
+  const series: SeriesSvgChartDatum[] = []
+  let x: number[] = []
+  let y: number[] = []
+  const flushRun = () => {
+    if (x.length) {
+      const run = comparison.runs[series.length]
+      series.push({
+        name: `${comparison.signal_name} #${series.length + 1}${run?.label ? ` (${run.label})` : ''}`,
+        color: comparison.run_color,
+        axis_key: 'left',
+        x,
+        y,
+      })
+    }
+    x = []
+    y = []
+  }
+  comparison.runs_x.forEach((xValue, index) => {
+    const yValue = comparison.runs_y[index] ?? null
+    if (xValue === null || yValue === null) {
+      flushRun()
+      return
+    }
+    x.push(xValue)
+    y.push(yValue)
+  })
+  flushRun()
+  const envelope = [
+    { key: 'lower', label: getUiText(uiText, 'simulation.waveform.comparison_lower', 'Min'), values: comparison.lower },
+    { key: 'upper', label: getUiText(uiText, 'simulation.waveform.comparison_upper', 'Max'), values: comparison.upper },
+  ]
+  envelope.forEach(({ label, values }) => {
+    series.push({
+      name: `${comparison.signal_name} (${label})`,
+      color: comparison.mean_color,
+      axis_key: 'left',
+      line_style: 'dash',
+      x: comparison.x,
+      y: values,
+    })
+  })
+  series.push({
+    name: `${comparison.signal_name} (${getUiText(uiText, 'simulation.waveform.comparison_mean', 'Mean')})`,
+    color: comparison.mean_color,
+    axis_key: 'left',
+    x: comparison.x,
+    y: comparison.mean,
+  })
+  return series
+}
+
 export function WaveformTab({ state, bridge }: WaveformTabProps) {
   const waveform = state.waveform_view
   const uiText = state.ui_text
@@ -51,7 +115,22 @@ export function WaveformTab({ state, bridge }: WaveformTabProps) {
       valueB: waveform.measurement.values_b[name] ?? null,
     }))
   }, [waveform.measurement.values_a, waveform.measurement.values_b, waveform.visible_series])
+  const comparison = waveform.comparison
+  const comparisonSeries = useMemo(
+    () => (comparison ? buildComparisonSeries(comparison, uiText) : null),
+    [comparison, uiText],
+  )
   const waveformTitle = useMemo(() => {
+    if (comparison) {
+      const skippedCount = Object.keys(comparison.skipped).length
+      const title = getUiText(uiText, 'simulation.waveform.comparison_title', '{signal} · {count} runs', {
+        signal: comparison.signal_name,
+        count: comparison.run_count,
+      })
+      return skippedCount
+        ? `${title} · ${getUiText(uiText, 'simulation.waveform.comparison_skipped', '{count} skipped', { count: skippedCount })}`
+        : title
+    }
     if (!waveform.has_waveform) {
       return ''
     }
@@ -62,7 +141,7 @@ export function WaveformTab({ state, bridge }: WaveformTabProps) {
       return getUiText(uiText, 'simulation.waveform.dc_sweep_title', 'DC Sweep Waveform')
     }
     return getUiText(uiText, 'simulation.waveform.default_title', 'Waveform')
-  }, [normalizedAnalysisType, uiText, waveform.has_waveform])
+  }, [comparison, normalizedAnalysisType, uiText, waveform.has_waveform])
   const waveformHeaderActions = waveform.has_waveform ? (
     <>
       <button
@@ -117,11 +196,23 @@ export function WaveformTab({ state, bridge }: WaveformTabProps) {
     checked: signal.visible,
     onCheckedChange: (checked: boolean) => bridge?.setSignalVisible(signal.name, checked),
   })), [bridge, waveform.signal_catalog])
-  const visibleSignalItems = useMemo(() => waveform.visible_series.map((series) => ({
-    id: series.name,
-    label: series.name,
-    color: series.color,
-  })), [waveform.signal_catalog, waveform.visible_series])
+  const visibleSignalItems = useMemo(() => {
+    if (comparison) {
+      return [
+        { id: 'comparison-runs', label: `${comparison.signal_name} × ${comparison.run_count}`, color: comparison.run_color },
+        {
+          id: 'comparison-mean',
+          label: `${comparison.signal_name} (${getUiText(uiText, 'simulation.waveform.comparison_mean', 'Mean')})`,
+          color: comparison.mean_color,
+        },
+      ]
+    }
+    return waveform.visible_series.map((series) => ({
+      id: series.name,
+      label: series.name,
+      color: series.color,
+    }))
+  }, [comparison, uiText, waveform.signal_catalog, waveform.visible_series])
 
   const preferredMeasurementSignalId = measurementSignals[0]?.id ?? ''
 
@@ -208,7 +299,7 @@ export function WaveformTab({ state, bridge }: WaveformTabProps) {
               }}
               viewWindow={viewWindow}
               onViewportChange={(nextViewWindow) => bridge?.setWaveformViewport(nextViewWindow)}
-              series={waveform.visible_series}
+              series={comparisonSeries ?? waveform.visible_series}
               xLabel={waveform.x_axis_label}
               yLabel={waveform.y_label || 'Waveform'}
               secondaryYLabel={waveform.secondary_y_label}
@@ -197,6 +197,37 @@ export interface WaveformViewState {
   cursor_a_visible: boolean
   cursor_b_visible: boolean
   measurement: WaveformMeasurementState
+  comparison: WaveformComparisonState | null
+}
+
+export interface WaveformComparisonRunState {
+  bundle_id: string
+  label: string
+  signal_name: string
+}
+
+/**
+ * Cross-run comparison overlay of one signal.
+ *
+ * ``runs_x`` / ``runs_y`` hold every run concatenated in ``runs``
+ * order, with a ``null`` pair between consecutive runs (the backend's
+ * ``flattened_runs``). ``x`` is shared by the mean / envelope curves.
+ */
+export interface WaveformComparisonState {
+  signal_name: string
+  run_count: number
+  run_color: string
+  mean_color: string
+  runs_x: Array<number | null>
+  runs_y: Array<number | null>
+  runs: WaveformComparisonRunState[]
+  skipped: Record<string, string>
+  reference_index: number
+  x: number[]
+  mean: number[]
+  lower: number[]
+  upper: number[]
+  source_points: number
 }
 
 export interface WaveformSignalCatalogItemState {
@@ -445,6 +476,7 @@ export interface CircuitSelectionItemState {
   run_count: number
   is_current: boolean
   latest_result: LoadableResultState
+  comparison_result_paths: string[]
 }
 
 export interface CircuitSelectionViewState {
@@ -666,6 +698,7 @@ export const EMPTY_SIMULATION_STATE: SimulationMainState = {
     cursor_a_visible: false,
     cursor_b_visible: false,
     measurement: EMPTY_WAVEFORM_MEASUREMENT,
+    comparison: null,
   },
   analysis_info_view: {
     analysis_type: '',
@@ -1023,6 +1056,44 @@ function normalizeWaveformMeasurement(value: unknown): WaveformMeasurementState
   }
 }
 
+function asNullableNumberArray(value: unknown): Array<number | null> {
+  if (!Array.isArray(value)) {
+    return []
+  }
+  return value.map((item) => asNullableNumber(item))
+}
+
+function normalizeWaveformComparison(value: unknown): WaveformComparisonState | null {
+  if (!value || typeof value !== 'object') {
+    return null
+  }
+  const record = asRecord(value)
+  const runs = Array.isArray(record.runs) ? record.runs : []
+  return {
+    signal_name: asString(record.signal_name),
+    run_count: asNumber(record.run_count),
+    run_color: asString(record.run_color),
+    mean_color: asString(record.mean_color),
+    runs_x: asNullableNumberArray(record.runs_x),
+    runs_y: asNullableNumberArray(record.runs_y),
+    runs: runs.map((item) => {
+      const run = asRecord(item)
+      return {
+        bundle_id: asString(run.bundle_id),
+        label: asString(run.label),
+        signal_name: asString(run.signal_name),
+      }
+    }),
+    skipped: asStringRecord(record.skipped),
+    reference_index: asNumber(record.reference_index),
+    x: asNumberArray(record.x),
+    mean: asNumberArray(record.mean),
+    lower: asNumberArray(record.lower),
+    upper: asNumberArray(record.upper),
+    source_points: asNumber(record.source_points),
+  }
+}
+
 function normalizeRawDataColumns(value: unknown): RawDataColumnState[] {
   if (!Array.isArray(value)) {
     return []
@@ -1124,6 +1195,7 @@ function normalizeCircuitSelectionItems(value: unknown): CircuitSelectionItemSta
       run_count: asNumber(record.run_count),
       is_current: asBoolean(record.is_current),
       latest_result: normalizeLoadableResult(record.latest_result),
+      comparison_result_paths: asStringArray(record.comparison_result_paths),
     }
   })
 }
@@ -1250,6 +1322,7 @@ export function normalizeSimulationState(input: unknown): SimulationMainState {
       cursor_a_visible: asBoolean(waveformView.cursor_a_visible),
       cursor_b_visible: asBoolean(waveformView.cursor_b_visible),
       measurement: normalizeWaveformMeasurement(waveformView.measurement),
+      comparison: normalizeWaveformComparison(waveformView.comparison),
     },
     analysis_info_view: {
       analysis_type: asString(analysisInfoView.analysis_type),
@@ -37,6 +37,10 @@ from .settings import (
     CONFIG_EMBEDDING_BASE_URL,
     CONFIG_EMBEDDING_TIMEOUT,
     CONFIG_EMBEDDING_BATCH_SIZE,
+    CONFIG_EMBEDDING_CONCURRENCY,
+    CONFIG_EMBEDDING_TOKENS_PER_MINUTE,
+    CONFIG_EMBEDDING_LOCAL_BACKEND,
+    CONFIG_WORKSPACE_EXCLUDED_DIRS,
     # 凭证类型常量
     CREDENTIAL_TYPE_LLM,
     CREDENTIAL_TYPE_EMBEDDING,
@@ -46,6 +50,7 @@ from .settings import (
     LLM_PROVIDER_QWEN,
     SUPPORTED_LLM_PROVIDERS,
     EMBEDDING_PROVIDER_ZHIPU,
+    EMBEDDING_PROVIDER_LOCAL,
     SUPPORTED_EMBEDDING_PROVIDERS,
     # 默认配置模板
     DEFAULT_CONFIG,
@@ -83,6 +88,10 @@ __all__ = [
     "CONFIG_EMBEDDING_BASE_URL",
     "CONFIG_EMBEDDING_TIMEOUT",
     "CONFIG_EMBEDDING_BATCH_SIZE",
+    "CONFIG_EMBEDDING_CONCURRENCY",
+    "CONFIG_EMBEDDING_TOKENS_PER_MINUTE",
+    "CONFIG_EMBEDDING_LOCAL_BACKEND",
+    "CONFIG_WORKSPACE_EXCLUDED_DIRS",
     "CREDENTIAL_TYPE_LLM",
     "CREDENTIAL_TYPE_EMBEDDING",
     "LLM_PROVIDER_ZHIPU",
@@ -90,6 +99,7 @@ __all__ = [
     "LLM_PROVIDER_QWEN",
     "SUPPORTED_LLM_PROVIDERS",
     "EMBEDDING_PROVIDER_ZHIPU",
+    "EMBEDDING_PROVIDER_LOCAL",
     "SUPPORTED_EMBEDDING_PROVIDERS",
     "DEFAULT_CONFIG",
 ]
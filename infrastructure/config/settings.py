@@ -106,13 +106,21 @@ DEFAULT_CHUNK_OVERLAP_CHARS = 200
 # ============================================================
 
 EMBEDDING_PROVIDER_ZHIPU = "zhipu"     # 智谱嵌入模型（Embedding-3）
+EMBEDDING_PROVIDER_LOCAL = "local"     # 本地 CPU 推理（sentence-transformers）
 
-SUPPORTED_EMBEDDING_PROVIDERS = ["zhipu"]
+SUPPORTED_EMBEDDING_PROVIDERS = ["zhipu", "local"]
 DEFAULT_EMBEDDING_PROVIDER = "zhipu"   # 默认使用智谱嵌入模型
 
 # 嵌入模型相关默认值
 DEFAULT_EMBEDDING_BATCH_SIZE = 32      # 批量嵌入请求大小
 DEFAULT_EMBEDDING_TIMEOUT = 30         # 嵌入 API 请求超时秒数
+DEFAULT_EMBEDDING_CONCURRENCY = 4      # 异步嵌入同时在途的批次数
+DEFAULT_EMBEDDING_TOKENS_PER_MINUTE = 1_000_000  # 嵌入请求的 token/分钟上限（0 表示不限）
+DEFAULT_EMBEDDING_MAX_BATCH_TOKENS = 16_000      # 单批请求的 token 预算（自适应分批）
+
+# 本地嵌入推理后端：torch（原始权重）、onnx、onnx-qint8（动态量化 ONNX）
+LOCAL_EMBEDDING_BACKENDS = ["torch", "onnx", "onnx-qint8"]
+DEFAULT_LOCAL_EMBEDDING_BACKEND = "torch"
 
 # ============================================================
 # 路径相关常量
@@ -167,6 +175,12 @@ CONFIG_EMBEDDING_MODEL = "embedding_model"
 CONFIG_EMBEDDING_BASE_URL = "embedding_base_url"
 CONFIG_EMBEDDING_TIMEOUT = "embedding_timeout"
 CONFIG_EMBEDDING_BATCH_SIZE = "embedding_batch_size"
+CONFIG_EMBEDDING_CONCURRENCY = "embedding_concurrency"
+CONFIG_EMBEDDING_TOKENS_PER_MINUTE = "embedding_tokens_per_minute"
+CONFIG_EMBEDDING_LOCAL_BACKEND = "embedding_local_backend"
+
+# 工作区配置
+CONFIG_WORKSPACE_EXCLUDED_DIRS = "workspace_excluded_dirs"  # 额外排除的生成目录
 
 # ============================================================
 # 默认配置模板
@@ -193,6 +207,12 @@ DEFAULT_CONFIG = {
     CONFIG_EMBEDDING_BASE_URL: "",  # 空则使用厂商默认
     CONFIG_EMBEDDING_TIMEOUT: DEFAULT_EMBEDDING_TIMEOUT,
     CONFIG_EMBEDDING_BATCH_SIZE: DEFAULT_EMBEDDING_BATCH_SIZE,
+    CONFIG_EMBEDDING_CONCURRENCY: DEFAULT_EMBEDDING_CONCURRENCY,
+    CONFIG_EMBEDDING_TOKENS_PER_MINUTE: DEFAULT_EMBEDDING_TOKENS_PER_MINUTE,
+    CONFIG_EMBEDDING_LOCAL_BACKEND: DEFAULT_LOCAL_EMBEDDING_BACKEND,
+    
+    # 工作区配置
+    CONFIG_WORKSPACE_EXCLUDED_DIRS: [],  # 目录名或相对路径前缀，叠加在内置规则之上
 }
 
 # ============================================================
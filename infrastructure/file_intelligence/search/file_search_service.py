@@ -42,11 +42,15 @@
     results = search_service.search_symbols("LM741", file_types=[".cir"])
 """
 
+import json
+import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from infrastructure.file_intelligence.models.search_result import (
     SearchOptions,
@@ -58,18 +62,48 @@ from infrastructure.file_intelligence.search.content_searcher import (
     ContentSearcher,
     ContentSearchOptions,
 )
+from infrastructure.utils.json_utils import safe_json_load_file
+from shared.constants.paths import FILE_NAME_INDEX_FILE
+from shared.workspace_exclusions import WorkspaceExclusions, get_workspace_exclusions
 
 
 # ============================================================
 # 文件名索引缓存
 # ============================================================
 
+# 快照格式版本（格式变化时递增，旧快照自动失效）
+FILE_NAME_INDEX_VERSION = 1
+
+# 目录 mtime 落在快照扫描开始前该窗口内时视为不可信，需要重新列举
+# （文件系统时间戳精度有限，扫描期间的修改可能与记录的 mtime 相同）
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# 并行遍历目录的线程数
+SCAN_WORKERS = 8
+
+
+@dataclass
+class _DirRecord:
+    """单个目录的扫描记录"""
+    mtime_ns: int                                      # 扫描时的目录 mtime
+    files: List[str] = field(default_factory=list)     # 直接包含的文件名
+    subdirs: List[str] = field(default_factory=list)   # 直接包含的子目录名（已排除生成目录）
+
+
 class FileNameIndex:
     """
     文件名索引缓存
     
     在项目打开时构建，支持增量更新。
     用于加速文件名搜索。
+    
+    性能优化：
+    - 按目录记录扫描结果（mtime + 直接子项），可持久化为快照
+    - 打开项目时按目录 mtime 对账：未变化的目录直接复用记录，
+      只对变化的目录重新 os.scandir
+    - 同一层级的目录在线程池中并行扫描
+    - 生成目录（simulation_results/、.circuit_ai/ 等）在遍历时整体剪枝，
+      规则与文件监听共用（shared/workspace_exclusions.py）
     """
     
     def __init__(self):
@@ -77,6 +111,17 @@ class FileNameIndex:
         self._files: Dict[str, str] = {}
         # 文件名到路径的映射：{file_name: [relative_paths]}
         self._name_index: Dict[str, List[str]] = {}
+        # 目录扫描记录：{relative_dir: _DirRecord}，根目录为 ""
+        self._dirs: Dict[str, _DirRecord] = {}
+        # 当前索引的工作目录
+        self._work_dir: Optional[Path] = None
+        # 当前索引使用的排除规则
+        self._exclusions: Optional[WorkspaceExclusions] = None
+        # 最近一次遍历开始时间（纳秒，用于判断不可信 mtime）
+        self._scan_started_ns: int = 0
+        # 最近一次遍历统计：重新列举 / 复用的目录数
+        self._scanned_dirs: int = 0
+        self._reused_dirs: int = 0
         # 索引构建时间
         self._build_time: float = 0.0
         # 线程锁
@@ -87,50 +132,233 @@ class FileNameIndex:
     def build(
         self,
         work_dir: Path,
-        exclude_patterns: List[str] = None
+        exclude_patterns: List[str] = None,
+        exclusions: Optional[WorkspaceExclusions] = None,
+        snapshot_path: Optional[Path] = None,
     ) -> int:
         """
         构建文件名索引
         
+        提供 snapshot_path 且快照有效时，按目录 mtime 增量对账；
+        否则全量遍历。
+        
         Args:
             work_dir: 工作目录
-            exclude_patterns: 排除的路径模式
+            exclude_patterns: 额外排除的目录名或相对路径前缀
+            exclusions: 排除规则，默认使用 get_workspace_exclusions()
+            snapshot_path: 快照文件路径
             
         Returns:
             int: 索引的文件数量
         """
-        if exclude_patterns is None:
-            exclude_patterns = ["__pycache__", ".git", ".circuit_ai/temp"]
+        work_dir = Path(work_dir)
+        if exclusions is None:
+            exclusions = get_workspace_exclusions(exclude_patterns)
+        
+        previous = self._load_snapshot(snapshot_path, work_dir, exclusions)
         
         with self._lock:
-            self._files.clear()
-            self._name_index.clear()
-            
             start_time = time.time()
+            scan_started_ns = time.time_ns()
             
-            for path in work_dir.rglob("*"):
-                if not path.is_file():
-                    continue
-                
-                # 检查是否应该排除
-                relative = str(path.relative_to(work_dir))
-                if self._should_exclude(relative, exclude_patterns):
-                    continue
-                
-                # 添加到索引
-                self._add_file(relative, str(path))
+            if previous is None and self._work_dir == work_dir and self._exclusions is not None \
+                    and self._exclusions.signature == exclusions.signature:
+                # 同一项目重复构建：以内存中的记录作为对账基准
+                previous = (self._dirs, self._scan_started_ns)
+            
+            records, scanned, reused = self._walk(work_dir, exclusions, previous)
+            
+            self._work_dir = work_dir
+            self._exclusions = exclusions
+            self._scan_started_ns = scan_started_ns
+            self._scanned_dirs = scanned
+            self._reused_dirs = reused
+            self._rebuild_from_records(records)
             
             self._build_time = time.time() - start_time
             self._built = True
             
             return len(self._files)
     
-    def _should_exclude(self, path: str, patterns: List[str]) -> bool:
-        """检查路径是否应该排除"""
-        for pattern in patterns:
-            if pattern in path:
-                return True
-        return False
+    def _walk(
+        self,
+        work_dir: Path,
+        exclusions: WorkspaceExclusions,
+        previous: Optional[Tuple[Dict[str, "_DirRecord"], int]],
+        root_rel: str = "",
+    ) -> Tuple[Dict[str, "_DirRecord"], int, int]:
+        """
+        按层级并行遍历目录树
+        
+        Args:
+            work_dir: 工作目录
+            exclusions: 排除规则
+            previous: 上次扫描的 (目录记录, 扫描开始时间)，用于 mtime 对账
+            root_rel: 遍历起点（相对工作目录），默认整个工作目录
+        
+        Returns:
+            (目录记录, 重新列举的目录数, 复用的目录数)
+        """
+        previous_records, previous_started_ns = previous if previous else ({}, 0)
+        trusted_before_ns = previous_started_ns - RACY_MTIME_WINDOW_NS
+        
+        records: Dict[str, _DirRecord] = {}
+        scanned = 0
+        reused = 0
+        level = [root_rel]
+        
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            while level:
+                results = executor.map(
+                    lambda rel: self._visit_dir(
+                        work_dir, rel, exclusions, previous_records.get(rel), trusted_before_ns
+                    ),
+                    level,
+                )
+                next_level = []
+                for rel_dir, (record, was_scanned) in zip(level, results):
+                    if record is None:
+                        continue
+                    records[rel_dir] = record
+                    if was_scanned:
+                        scanned += 1
+                    else:
+                        reused += 1
+                    next_level.extend(
+                        os.path.join(rel_dir, name) if rel_dir else name
+                        for name in record.subdirs
+                    )
+                level = next_level
+        
+        return records, scanned, reused
+    
+    @staticmethod
+    def _visit_dir(
+        work_dir: Path,
+        rel_dir: str,
+        exclusions: WorkspaceExclusions,
+        previous: Optional["_DirRecord"],
+        trusted_before_ns: int,
+    ) -> Tuple[Optional["_DirRecord"], bool]:
+        """
+        访问单个目录：mtime 未变化则复用旧记录，否则重新 scandir
+        
+        Returns:
+            (目录记录, 是否重新列举)；目录不可访问时记录为 None
+        """
+        abs_dir = os.path.join(work_dir, rel_dir) if rel_dir else str(work_dir)
+        try:
+            mtime_ns = os.stat(abs_dir).st_mtime_ns
+        except OSError:
+            return None, False
+        
+        if previous is not None and previous.mtime_ns == mtime_ns and mtime_ns < trusted_before_ns:
+            return previous, False
+        
+        record = _DirRecord(mtime_ns=mtime_ns)
+        try:
+            with os.scandir(abs_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            child_rel = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                            if not exclusions.is_excluded_dir(entry.name, child_rel):
+                                record.subdirs.append(entry.name)
+                        elif entry.is_file():
+                            if not exclusions.is_excluded_file(entry.name):
+                                record.files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return None, False
+        
+        return record, True
+    
+    def _rebuild_from_records(self, records: Dict[str, "_DirRecord"]) -> None:
+        """根据目录记录重建文件映射（调用方持有锁）"""
+        self._dirs = records
+        self._files.clear()
+        self._name_index.clear()
+        work_dir = str(self._work_dir)
+        for rel_dir, record in records.items():
+            for name in record.files:
+                relative = os.path.join(rel_dir, name) if rel_dir else name
+                self._add_file(relative, os.path.join(work_dir, relative))
+    
+    # ============================================================
+    # 快照持久化
+    # ============================================================
+    
+    def save_snapshot(self, snapshot_path: Path) -> bool:
+        """
+        将目录记录写入快照文件（先写临时文件再原子替换）
+        
+        Args:
+            snapshot_path: 快照文件路径
+            
+        Returns:
+            bool: 是否写入成功
+        """
+        with self._lock:
+            if not self._built or self._work_dir is None or self._exclusions is None:
+                return False
+            data = {
+                "version": FILE_NAME_INDEX_VERSION,
+                "work_dir": str(self._work_dir),
+                "exclusions": self._exclusions.signature,
+                "scan_started_ns": self._scan_started_ns,
+                "dirs": {
+                    rel_dir: [record.mtime_ns, record.files, record.subdirs]
+                    for rel_dir, record in self._dirs.items()
+                },
+            }
+        
+        snapshot_path = Path(snapshot_path)
+        temp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+        try:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp_path, snapshot_path)
+            return True
+        except OSError:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            return False
+    
+    @staticmethod
+    def _load_snapshot(
+        snapshot_path: Optional[Path],
+        work_dir: Path,
+        exclusions: WorkspaceExclusions,
+    ) -> Optional[Tuple[Dict[str, "_DirRecord"], int]]:
+        """
+        读取快照；版本、工作目录或排除规则不一致时视为无效
+        
+        Returns:
+            (目录记录, 快照扫描开始时间) 或 None
+        """
+        if snapshot_path is None:
+            return None
+        data = safe_json_load_file(Path(snapshot_path))
+        if not isinstance(data, dict):
+            return None
+        if (
+            data.get("version") != FILE_NAME_INDEX_VERSION
+            or data.get("work_dir") != str(work_dir)
+            or data.get("exclusions") != exclusions.signature
+        ):
+            return None
+        try:
+            records = {
+                rel_dir: _DirRecord(mtime_ns=int(mtime_ns), files=list(files), subdirs=list(subdirs))
+                for rel_dir, (mtime_ns, files, subdirs) in data.get("dirs", {}).items()
+            }
+            return records, int(data.get("scan_started_ns", 0))
+        except (TypeError, ValueError):
+            return None
     
     def _add_file(self, relative_path: str, absolute_path: str) -> None:
         """添加文件到索引"""
@@ -141,25 +369,79 @@ class FileNameIndex:
             self._name_index[file_name] = []
         self._name_index[file_name].append(relative_path)
     
+    def _remove_file(self, relative_path: str) -> None:
+        """从索引删除文件（调用方持有锁）"""
+        if relative_path not in self._files:
+            return
+        del self._files[relative_path]
+        
+        file_name = Path(relative_path).name.lower()
+        if file_name in self._name_index:
+            try:
+                self._name_index[file_name].remove(relative_path)
+                if not self._name_index[file_name]:
+                    del self._name_index[file_name]
+            except ValueError:
+                pass
+    
     def add_file(self, relative_path: str, absolute_path: str) -> None:
         """增量添加文件"""
         with self._lock:
-            self._add_file(relative_path, absolute_path)
+            if relative_path not in self._files:
+                self._add_file(relative_path, absolute_path)
     
     def remove_file(self, relative_path: str) -> None:
         """增量删除文件"""
         with self._lock:
-            if relative_path in self._files:
-                del self._files[relative_path]
-                
-                file_name = Path(relative_path).name.lower()
-                if file_name in self._name_index:
-                    try:
-                        self._name_index[file_name].remove(relative_path)
-                        if not self._name_index[file_name]:
-                            del self._name_index[file_name]
-                    except ValueError:
-                        pass
+            self._remove_file(relative_path)
+    
+    def add_directory(self, relative_dir: str) -> int:
+        """
+        增量索引新出现的目录（如移动进工作区的目录树）
+        
+        Args:
+            relative_dir: 目录相对路径
+            
+        Returns:
+            int: 新增的文件数量
+        """
+        with self._lock:
+            if self._work_dir is None or self._exclusions is None:
+                return 0
+            if self._exclusions.is_excluded_path(relative_dir, is_directory=True):
+                return 0
+            records, _, _ = self._walk(self._work_dir, self._exclusions, None, relative_dir)
+            work_dir = str(self._work_dir)
+            added = 0
+            for rel_dir, record in records.items():
+                for name in record.files:
+                    relative = os.path.join(rel_dir, name)
+                    if relative not in self._files:
+                        self._add_file(relative, os.path.join(work_dir, relative))
+                        added += 1
+            return added
+    
+    def remove_directory(self, relative_dir: str) -> int:
+        """
+        增量删除目录下的所有文件
+        
+        Args:
+            relative_dir: 目录相对路径
+            
+        Returns:
+            int: 删除的文件数量
+        """
+        prefix = relative_dir.rstrip("/\\") + os.sep
+        with self._lock:
+            removed = [path for path in self._files if path.startswith(prefix)]
+            for path in removed:
+                self._remove_file(path)
+            return len(removed)
+    
+    def is_excluded(self, relative_path: str, is_directory: bool = False) -> bool:
+        """检查路径是否被当前排除规则排除"""
+        exclusions = self._exclusions or get_workspace_exclusions()
+        return exclusions.is_excluded_path(relative_path, is_directory)
     
     def update_file(self, relative_path: str, absolute_path: str) -> None:
         """更新文件（先删后加）"""
@@ -230,10 +512,25 @@ class FileNameIndex:
         """是否已构建索引"""
         return self._built
     
+    @property
+    def work_dir(self) -> Optional[Path]:
+        """当前索引的工作目录"""
+        return self._work_dir
+    
     @property
     def build_time_ms(self) -> float:
         """索引构建时间（毫秒）"""
         return self._build_time * 1000
+    
+    @property
+    def scanned_dir_count(self) -> int:
+        """最近一次构建中重新列举的目录数"""
+        return self._scanned_dirs
+    
+    @property
+    def reused_dir_count(self) -> int:
+        """最近一次构建中按 mtime 复用的目录数"""
+        return self._reused_dirs
 
 
 # ============================================================
@@ -250,7 +547,8 @@ class FileSearchService:
     - 按符号搜索（委托给 FileAnalyzer）
     
     性能优化：
-    - 文件名索引缓存（项目打开时构建）
+    - 文件名索引缓存（项目打开时构建，快照持久化于 .circuit_ai/file_name_index.json）
+    - 重新打开项目时按目录 mtime 对账，只列举变化的目录
     - 增量更新索引（文件变更时）
     - 大文件跳过内容搜索（>1MB）
     """
@@ -258,11 +556,8 @@ class FileSearchService:
     # 大文件阈值（字节）
     LARGE_FILE_THRESHOLD = 1024 * 1024  # 1MB
     
-    # 默认排除模式
-    DEFAULT_EXCLUDE_PATTERNS = [
-        "__pycache__", ".git", ".circuit_ai/temp", "node_modules",
-        ".pytest_cache", ".mypy_cache", "*.pyc", "*.pyo"
-    ]
+    # 额外排除的目录（叠加在 shared/workspace_exclusions.py 的共用规则之上）
+    DEFAULT_EXCLUDE_PATTERNS: List[str] = []
     
     def __init__(self):
         """初始化文件搜索服务"""
@@ -282,6 +577,16 @@ class FileSearchService:
         
         # 事件订阅状态
         self._subscribed = False
+        
+        # 索引代数：整体重建或目录级增删时递增，供上层结果缓存判断失效
+        self._index_generation = 0
+        
+        # 整体构建互斥：后台预热与主线程首次搜索可能同时触发构建
+        self._build_lock = threading.Lock()
+        # 构建期间到达的文件变更先排队，构建完成后按顺序应用，
+        # 事件回调（主线程）不必等待整次遍历
+        self._changes_lock = threading.Lock()
+        self._deferred_changes: Optional[List[Tuple[str, str, bool]]] = None
     
     @property
     def content_searcher(self) -> ContentSearcher:
@@ -351,6 +656,19 @@ class FileSearchService:
         Returns:
             int: 索引的文件数量
         """
+        with self._build_lock:
+            return self._build_index_locked(work_dir)
+    
+    def _ensure_index(self) -> None:
+        """索引尚未构建时构建；已有构建在进行时等待其完成，不重复遍历"""
+        if self._file_index.is_built:
+            return
+        with self._build_lock:
+            if not self._file_index.is_built:
+                self._build_index_locked(None)
+    
+    def _build_index_locked(self, work_dir: Union[str, Path, None]) -> int:
+        """在 _build_lock 内构建；构建期间到达的文件变更排队到构建完成后应用"""
         if work_dir is None:
             if self.file_manager is not None:
                 work_dir = self.file_manager.get_work_dir()
@@ -359,22 +677,42 @@ class FileSearchService:
                     self.logger.warning("无法构建索引：工作目录未设置")
                 return 0
         
-        work_dir = Path(work_dir)
-        
+        # 先订阅再遍历：遍历期间的变更排队，不会在两者之间丢失
+        self._subscribe_file_events()
+        with self._changes_lock:
+            self._deferred_changes = []
+        try:
+            return self._walk_index(Path(work_dir))
+        finally:
+            with self._changes_lock:
+                deferred, self._deferred_changes = self._deferred_changes, None
+                for path, operation, is_directory in deferred:
+                    self._apply_file_change(path, operation, is_directory)
+    
+    def _walk_index(self, work_dir: Path) -> int:
         if self.logger:
             self.logger.info(f"开始构建文件索引: {work_dir}")
         
-        count = self._file_index.build(work_dir, self.DEFAULT_EXCLUDE_PATTERNS)
+        snapshot_path = work_dir / FILE_NAME_INDEX_FILE
+        count = self._file_index.build(
+            work_dir,
+            self.DEFAULT_EXCLUDE_PATTERNS,
+            snapshot_path=snapshot_path,
+        )
+        
+        if self._file_index.scanned_dir_count:
+            if not self._file_index.save_snapshot(snapshot_path) and self.logger:
+                self.logger.warning(f"文件索引快照写入失败: {snapshot_path}")
         
         if self.logger:
             self.logger.info(
                 f"文件索引构建完成: {count} 个文件, "
+                f"列举 {self._file_index.scanned_dir_count} 个目录, "
+                f"复用 {self._file_index.reused_dir_count} 个目录, "
                 f"耗时 {self._file_index.build_time_ms:.0f}ms"
             )
         
-        # 订阅文件变更事件
-        self._subscribe_file_events()
-        
+        self._index_generation += 1
         return count
     
     def _subscribe_file_events(self) -> None:
@@ -393,21 +731,83 @@ class FileSearchService:
             if self.logger:
                 self.logger.warning(f"订阅文件变更事件失败: {e}")
     
+    # 文件监听事件类型到索引操作的映射
+    _WATCHER_OPERATIONS = {
+        "created": "create",
+        "modified": "update",
+        "deleted": "delete",
+    }
+    
     def _on_file_changed(self, event_data: Dict[str, Any]) -> None:
-        """处理文件变更事件"""
+        """
+        处理文件变更事件
+        
+        同时兼容 FileManager 事件（operation: create/update/delete）
+        与文件监听事件（event_type: created/modified/deleted/moved）。
+        """
         data = event_data.get("data", {})
         path = data.get("path", "")
-        operation = data.get("operation", "")
+        operation = data.get("operation") or self._WATCHER_OPERATIONS.get(
+            data.get("event_type", ""), ""
+        )
+        is_directory = bool(data.get("is_directory", False))
         
         if not path:
             return
         
-        # 获取相对路径
-        if self.file_manager is not None:
+        if data.get("event_type") == "moved":
+            self._queue_or_apply_change(path, "delete", is_directory)
+            dest_path = data.get("dest_path", "")
+            if dest_path:
+                self._queue_or_apply_change(dest_path, "create", is_directory)
+            return
+        
+        self._queue_or_apply_change(path, operation, is_directory)
+    
+    def _queue_or_apply_change(self, path: str, operation: str, is_directory: bool) -> None:
+        """构建进行中时排队，否则立即应用"""
+        with self._changes_lock:
+            if self._deferred_changes is not None:
+                self._deferred_changes.append((path, operation, is_directory))
+                return
+            self._apply_file_change(path, operation, is_directory)
+    
+    def to_index_path(self, path: str, is_directory: bool = False) -> Optional[str]:
+        """
+        将变更路径转换为索引内的相对路径
+        
+        Returns:
+            Optional[str]: 相对路径；位于排除目录（生成目录等）时返回 None
+        """
+        # 优先相对索引所在的工作目录
+        index_root = self._file_index.work_dir
+        if index_root is not None and Path(path).is_relative_to(index_root):
+            relative_path = str(Path(path).relative_to(index_root))
+        elif self.file_manager is not None:
             relative_path = self.file_manager.to_relative_path(path)
         else:
             relative_path = path
         
+        # 生成目录中的变更不进入索引（与文件监听共用规则）
+        if self._file_index.is_excluded(relative_path, is_directory):
+            return None
+        return relative_path
+    
+    def _apply_file_change(self, path: str, operation: str, is_directory: bool) -> None:
+        """将单个变更应用到文件名索引"""
+        relative_path = self.to_index_path(path, is_directory)
+        if relative_path is None:
+            return
+        
+        if is_directory:
+            if operation == "create":
+                self._file_index.add_directory(relative_path)
+                self._index_generation += 1
+            elif operation == "delete":
+                self._file_index.remove_directory(relative_path)
+                self._index_generation += 1
+            return
+        
         # 更新索引
         if operation == "create":
             self._file_index.add_file(relative_path, path)
@@ -490,8 +890,7 @@ class FileSearchService:
             List[SearchResult]: 搜索结果列表
         """
         # 确保索引已构建
-        if not self._file_index.is_built:
-            self.build_index()
+        self._ensure_index()
         
         # 从索引搜索
         matches = self._file_index.search_by_name(
@@ -548,6 +947,19 @@ class FileSearchService:
             absolute_path = str(file_path)
         
         return self.content_searcher.search_in_file(absolute_path, query, options)
+    
+    def content_matches(self, absolute_path: str, query: str) -> bool:
+        """
+        判断文件内容是否命中查询（与 search_by_content 相同的匹配规则）
+        
+        供上层结果缓存判断新建/修改的文件是否会改变已缓存的结果。
+        """
+        options = ContentSearchOptions(
+            context_lines=0,
+            max_matches_per_file=1,
+            max_file_size=self.LARGE_FILE_THRESHOLD,
+        )
+        return bool(self.content_searcher.search_in_file(absolute_path, query, options))
 
     
     # ============================================================
@@ -576,8 +988,7 @@ class FileSearchService:
             List[SearchResult]: 搜索结果列表
         """
         # 确保索引已构建
-        if not self._file_index.is_built:
-            self.build_index()
+        self._ensure_index()
         
         # 构建内容搜索选项
         search_options = ContentSearchOptions(
@@ -651,8 +1062,7 @@ class FileSearchService:
             List[SearchResult]: 搜索结果列表
         """
         # 确保索引已构建
-        if not self._file_index.is_built:
-            self.build_index()
+        self._ensure_index()
         
         results = []
         files = self._file_index.get_all_files()
@@ -781,6 +1191,11 @@ class FileSearchService:
         
         return self.search_by_name("", file_types=[extension], max_results=max_results)
     
+    @property
+    def index_generation(self) -> int:
+        """索引代数（整体重建或目录级增删后递增）"""
+        return self._index_generation
+    
     def get_index_stats(self) -> Dict[str, Any]:
         """
         获取索引统计信息
@@ -792,6 +1207,9 @@ class FileSearchService:
             "file_count": self._file_index.file_count,
             "is_built": self._file_index.is_built,
             "build_time_ms": self._file_index.build_time_ms,
+            "scanned_dirs": self._file_index.scanned_dir_count,
+            "reused_dirs": self._file_index.reused_dir_count,
+            "generation": self._index_generation,
         }
 
 
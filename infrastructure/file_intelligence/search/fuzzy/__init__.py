@@ -7,8 +7,13 @@
 - text_normalizer.py: 文本规范化器
 - match_scorer.py: 匹配评分器
 - fuzzy_matcher.py: 模糊匹配器门面类
+- block_matcher.py: 代码块模糊匹配器（锚点 + 行窗口）
 """
 
+from infrastructure.file_intelligence.search.fuzzy.block_matcher import (
+    BlockMatch,
+    BlockMatcher,
+)
 from infrastructure.file_intelligence.search.fuzzy.fuzzy_matcher import (
     FuzzyMatcher,
     MatchOptions,
@@ -27,6 +32,8 @@ from infrastructure.file_intelligence.search.fuzzy.text_normalizer import (
 )
 
 __all__ = [
+    "BlockMatch",
+    "BlockMatcher",
     "FuzzyMatcher",
     "MatchOptions",
     "MatchResult",
@@ -0,0 +1,227 @@
+# Block Matcher - Line-Window Fuzzy Block Matching
+"""
+代码块模糊匹配器
+
+职责：
+- 在长文本中定位与查询代码块最相似的行窗口
+- 每行只规范化一次，窗口文本由已规范化的行直接拼接
+- 以精确相同的规范化行作为锚点，优先评分锚点对应的候选窗口
+- 使用 rapidfuzz 的 C 实现评分，并以当前最佳分数作为 score_cutoff 提前退出
+
+性能说明：
+- 规范化成本 O(lines)，不再随窗口大小放大
+- 锚点命中满分时只需回扫其之前的窗口，且仅长度完全相同的窗口会被评分
+- 全量扫描时先用窗口长度上界（2 * min / sum）过滤，再调用带下限的评分函数
+
+被调用方：fuzzy_matcher.py, file_manager.py
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+from infrastructure.file_intelligence.search.fuzzy.similarity_algorithms import (
+    SimilarityAlgorithms,
+)
+
+
+# 评分函数签名：(query, window, score_cutoff) -> 0.0-1.0
+BlockScorer = Callable[[str, str, float], float]
+
+# 出现次数超过该值的行不作为锚点（如 ".ends"、"+" 续行等高频行）
+MAX_ANCHOR_OCCURRENCES = 32
+
+
+@dataclass
+class BlockMatch:
+    """代码块匹配结果"""
+    start_line: int      # 窗口起始行（0-based）
+    line_count: int      # 窗口行数
+    score: float         # 匹配分数（0.0-1.0）
+
+
+class BlockMatcher:
+    """
+    代码块模糊匹配器
+
+    对目标文本按行预处理一次，之后可对多个查询块执行匹配。
+    """
+
+    def __init__(
+        self,
+        content_lines: Sequence[str],
+        normalize_line: Callable[[str], str],
+        skip_empty_lines: bool = False,
+    ):
+        """
+        初始化匹配器
+
+        Args:
+            content_lines: 目标文本的原始行
+            normalize_line: 单行规范化函数（必须是逐行独立的变换）
+            skip_empty_lines: 拼接窗口文本时是否跳过规范化后为空的行
+        """
+        self._normalize_line = normalize_line
+        self._skip_empty_lines = skip_empty_lines
+        self._lines: List[str] = [normalize_line(line) for line in content_lines]
+
+        # 前缀和：窗口规范化文本长度可 O(1) 计算
+        self._char_prefix: List[int] = [0]
+        self._kept_prefix: List[int] = [0]
+        self._anchor_index: Dict[str, List[int]] = {}
+
+        for position, line in enumerate(self._lines):
+            kept = 1 if (line or not skip_empty_lines) else 0
+            self._char_prefix.append(self._char_prefix[-1] + len(line) * kept)
+            self._kept_prefix.append(self._kept_prefix[-1] + kept)
+            if line.strip():
+                self._anchor_index.setdefault(line, []).append(position)
+
+    @property
+    def line_count(self) -> int:
+        """目标文本行数"""
+        return len(self._lines)
+
+    def window_text(self, start_line: int, line_count: int) -> str:
+        """
+        获取窗口的规范化文本
+
+        Args:
+            start_line: 起始行（0-based）
+            line_count: 行数
+
+        Returns:
+            str: 规范化后的窗口文本
+        """
+        window = self._lines[start_line:start_line + line_count]
+        if self._skip_empty_lines:
+            return '\n'.join(line for line in window if line)
+        return '\n'.join(window)
+
+    def _window_length(self, start_line: int, line_count: int) -> int:
+        end_line = start_line + line_count
+        chars = self._char_prefix[end_line] - self._char_prefix[start_line]
+        kept = self._kept_prefix[end_line] - self._kept_prefix[start_line]
+        return chars + max(0, kept - 1)
+
+    def _seed_candidates(self, query_lines: Sequence[str], line_count: int) -> List[int]:
+        """根据锚点行生成候选窗口起点（按行号升序）"""
+        max_start = self.line_count - line_count
+        candidates = set()
+
+        for offset, raw_line in enumerate(query_lines):
+            normalized = self._normalize_line(raw_line)
+            if not normalized.strip():
+                continue
+            positions = self._anchor_index.get(normalized)
+            if not positions or len(positions) > MAX_ANCHOR_OCCURRENCES:
+                continue
+            for position in positions:
+                start = position - offset
+                if 0 <= start <= max_start:
+                    candidates.add(start)
+
+        return sorted(candidates)
+
+    def find_best(
+        self,
+        query_text: str,
+        query_lines: Sequence[str],
+        threshold: float,
+    ) -> Optional[BlockMatch]:
+        """
+        查找与查询块最相似的窗口（Indel 相似度）
+
+        结果与逐窗口暴力比较一致：分数最高者胜出，同分取行号最小者。
+        长度上界过滤依赖 Indel 相似度的性质，因此评分函数固定。
+
+        Args:
+            query_text: 已规范化的查询文本
+            query_lines: 查询块的原始行（用于确定窗口行数与锚点）
+            threshold: 最低接受分数
+
+        Returns:
+            Optional[BlockMatch]: 最佳匹配；没有窗口达到阈值时返回 None
+        """
+        line_count = len(query_lines)
+        if line_count == 0 or line_count > self.line_count:
+            return None
+
+        best: Optional[BlockMatch] = None
+
+        def consider(start: int, cutoff: float) -> None:
+            nonlocal best
+            score = SimilarityAlgorithms.indel_ratio(
+                query_text, self.window_text(start, line_count), cutoff
+            )
+            if score < cutoff or score <= 0.0:
+                return
+            if (
+                best is None
+                or score > best.score
+                or (score == best.score and start < best.start_line)
+            ):
+                best = BlockMatch(start_line=start, line_count=line_count, score=score)
+
+        # 1. 锚点候选：通常直接命中目标位置，满分时停止
+        for start in self._seed_candidates(query_lines, line_count):
+            consider(start, best.score if best else threshold)
+            if best and best.score >= 1.0:
+                break
+
+        # 2. 全量扫描：以当前最佳分数作为下限，长度上界不足的窗口直接跳过；
+        #    已有满分时只需确认其之前没有同为满分的窗口
+        query_length = len(query_text)
+        for start in range(self.line_count - line_count + 1):
+            if best and best.score >= 1.0 and start >= best.start_line:
+                break
+            if best and start == best.start_line:
+                continue
+            cutoff = best.score if best else threshold
+            window_length = self._window_length(start, line_count)
+            total_length = query_length + window_length
+            if total_length and 2.0 * min(query_length, window_length) / total_length < cutoff:
+                continue
+            consider(start, cutoff)
+
+        return best
+
+    def find_all(
+        self,
+        query_text: str,
+        line_count: int,
+        threshold: float,
+        scorer: BlockScorer = SimilarityAlgorithms.partial_ratio,
+    ) -> List[BlockMatch]:
+        """
+        查找所有达到阈值的窗口
+
+        Args:
+            query_text: 已规范化的查询文本
+            line_count: 窗口行数
+            threshold: 最低接受分数
+            scorer: 评分函数，需支持 score_cutoff
+
+        Returns:
+            List[BlockMatch]: 按行号升序排列的匹配窗口
+        """
+        if line_count <= 0 or line_count > self.line_count:
+            return []
+
+        matches = []
+        for start in range(self.line_count - line_count + 1):
+            score = scorer(query_text, self.window_text(start, line_count), threshold)
+            if score >= threshold:
+                matches.append(BlockMatch(start_line=start, line_count=line_count, score=score))
+        return matches
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    'BlockMatch',
+    'BlockMatcher',
+    'BlockScorer',
+    'MAX_ANCHOR_OCCURRENCES',
+]
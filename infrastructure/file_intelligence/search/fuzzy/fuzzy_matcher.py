@@ -13,6 +13,7 @@
 from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional, Tuple
 
+from infrastructure.file_intelligence.search.fuzzy.block_matcher import BlockMatcher
 from infrastructure.file_intelligence.search.fuzzy.match_scorer import (
     MatchScorer,
     ScoreResult,
@@ -208,36 +209,32 @@ class FuzzyMatcher:
             return []
         
         query_line_count = len(query_lines)
-        results = []
+        normalize_options = NormalizeOptions(ignore_whitespace=True, ignore_empty_lines=False)
         
-        # 滑动窗口搜索
-        for i in range(len(content_lines) - query_line_count + 1):
-            window = content_lines[i:i + query_line_count]
-            window_text = '\n'.join(window)
-            query_text = '\n'.join(query_lines)
-            
-            # 规范化后比较
-            normalized_query = TextNormalizer.normalize_for_matching(
-                query_text,
-                NormalizeOptions(ignore_whitespace=True, ignore_empty_lines=False)
-            )
-            normalized_window = TextNormalizer.normalize_for_matching(
-                window_text,
-                NormalizeOptions(ignore_whitespace=True, ignore_empty_lines=False)
-            )
-            
-            # 计算相似度
-            score = SimilarityAlgorithms.partial_ratio(
-                normalized_query, normalized_window
+        def normalize_line(line: str) -> str:
+            return TextNormalizer.normalize_for_matching(line, normalize_options)
+        
+        # 规范化是逐行变换：目标文本每行只规范化一次，查询只规范化一次
+        block_matcher = BlockMatcher(content_lines, normalize_line)
+        normalized_query = '\n'.join(normalize_line(line) for line in query_lines)
+        
+        # 滑动窗口搜索（C 实现评分，低于阈值提前退出）
+        results = [
+            {
+                'start_line': match.start_line + 1,  # 1-based
+                'end_line': match.start_line + query_line_count,
+                'matched_content': '\n'.join(
+                    content_lines[match.start_line:match.start_line + query_line_count]
+                ),
+                'score': match.score,
+            }
+            for match in block_matcher.find_all(
+                normalized_query,
+                query_line_count,
+                threshold,
+                scorer=SimilarityAlgorithms.partial_ratio,
             )
-            
-            if score >= threshold:
-                results.append({
-                    'start_line': i + 1,  # 1-based
-                    'end_line': i + query_line_count,
-                    'matched_content': window_text,
-                    'score': score,
-                })
+        ]
         
         # 按分数降序排序
         results.sort(key=lambda r: r['score'], reverse=True)
@@ -15,7 +15,7 @@
 from typing import Callable
 
 from rapidfuzz import fuzz
-from rapidfuzz.distance import JaroWinkler, Levenshtein
+from rapidfuzz.distance import Indel, JaroWinkler, Levenshtein
 
 
 class SimilarityAlgorithms:
@@ -47,6 +47,30 @@ class SimilarityAlgorithms:
         
         return Levenshtein.normalized_similarity(s1, s2)
     
+    @staticmethod
+    def indel_ratio(s1: str, s2: str, score_cutoff: float = 0.0) -> float:
+        """
+        Indel（最长公共子序列）相似度
+        
+        计算 2 * LCS / (len1 + len2)，与 difflib.SequenceMatcher.ratio
+        口径一致但不受其 autojunk 启发式影响。
+        适用于：代码块整体比对。
+        
+        Args:
+            s1: 第一个字符串
+            s2: 第二个字符串
+            score_cutoff: 分数下限（0-1），低于下限时提前退出并返回 0.0
+            
+        Returns:
+            float: 相似度（0.0-1.0）
+        """
+        if not s1 and not s2:
+            return 1.0
+        if not s1 or not s2:
+            return 0.0
+        
+        return Indel.normalized_similarity(s1, s2, score_cutoff=score_cutoff)
+    
     @staticmethod
     def jaro_winkler_ratio(s1: str, s2: str, prefix_weight: float = 0.1) -> float:
         """
@@ -70,7 +94,7 @@ class SimilarityAlgorithms:
         return JaroWinkler.similarity(s1, s2, prefix_weight=prefix_weight)
     
     @staticmethod
-    def partial_ratio(s1: str, s2: str) -> float:
+    def partial_ratio(s1: str, s2: str, score_cutoff: float = 0.0) -> float:
         """
         部分匹配相似度
         
@@ -80,6 +104,7 @@ class SimilarityAlgorithms:
         Args:
             s1: 查询字符串（通常较短）
             s2: 目标字符串（通常较长）
+            score_cutoff: 分数下限（0-1），低于下限时提前退出并返回 0.0
             
         Returns:
             float: 相似度（0.0-1.0）
@@ -89,7 +114,7 @@ class SimilarityAlgorithms:
         if not s1 or not s2:
             return 0.0
         
-        return fuzz.partial_ratio(s1, s2) / 100.0
+        return fuzz.partial_ratio(s1, s2, score_cutoff=score_cutoff * 100.0) / 100.0
     
     @staticmethod
     def token_sort_ratio(s1: str, s2: str) -> float:
@@ -141,13 +166,14 @@ class SimilarityAlgorithms:
         根据名称获取算法函数
         
         Args:
-            name: 算法名称（levenshtein/jaro_winkler/partial/token_sort/token_set）
+            name: 算法名称（levenshtein/indel/jaro_winkler/partial/token_sort/token_set）
             
         Returns:
             Callable: 算法函数
         """
         algorithms = {
             'levenshtein': SimilarityAlgorithms.levenshtein_ratio,
+            'indel': SimilarityAlgorithms.indel_ratio,
             'jaro_winkler': SimilarityAlgorithms.jaro_winkler_ratio,
             'partial': SimilarityAlgorithms.partial_ratio,
             'token_sort': SimilarityAlgorithms.token_sort_ratio,
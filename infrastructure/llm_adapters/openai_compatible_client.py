@@ -15,6 +15,11 @@ from infrastructure.llm_adapters.base_client import (
     ResponseParseError,
     StreamChunk,
 )
+from infrastructure.utils.http_client_pool import (
+    AsyncBoundHttpClient,
+    BoundHttpClient,
+    get_http_client_registry,
+)
 
 
 _DEFAULT_CONTEXT_LIMIT = 128_000
@@ -38,7 +43,6 @@ class OpenAICompatibleClient(BaseLLMClient):
         self.auth_header = auth_header
         self.auth_prefix = auth_prefix
         self._logger = logging.getLogger(__name__)
-        self._sync_client: Optional[httpx.Client] = None
 
     def _get_headers(self) -> Dict[str, str]:
         auth_value = self.api_key
@@ -49,33 +53,25 @@ class OpenAICompatibleClient(BaseLLMClient):
             self.auth_header: auth_value,
         }
 
-    def _get_sync_client(self) -> httpx.Client:
-        if self._sync_client is None:
-            self._sync_client = httpx.Client(
-                base_url=self.base_url,
-                headers=self._get_headers(),
-                timeout=httpx.Timeout(self.timeout, connect=10.0),
-            )
-        return self._sync_client
-
-    def _create_async_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
-            base_url=self.base_url,
+    def _get_sync_client(self) -> BoundHttpClient:
+        # Connections live in the process-wide pool keyed by origin;
+        # the bound view only carries base URL, auth headers and timeout.
+        return get_http_client_registry().bind(
+            self.base_url,
             headers=self._get_headers(),
-            timeout=httpx.Timeout(self.timeout, connect=10.0),
+            timeout=self.timeout,
         )
 
-    def __del__(self):
-        if self._sync_client:
-            try:
-                self._sync_client.close()
-            except Exception:
-                pass
+    def _create_async_client(self) -> AsyncBoundHttpClient:
+        return get_http_client_registry().bind_async(
+            self.base_url,
+            headers=self._get_headers(),
+            timeout=self.timeout,
+        )
 
     async def close(self) -> None:
-        if self._sync_client is not None:
-            self._sync_client.close()
-            self._sync_client = None
+        # Pooled connections are closed at application shutdown.
+        return None
 
     def _build_request_body(
         self,
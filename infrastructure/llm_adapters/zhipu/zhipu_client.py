@@ -5,7 +5,7 @@
 职责：
 - 协调请求构建、发送、响应解析
 - 提供统一的对外接口
-- 管理 httpx 异步客户端
+- 通过进程级连接池（http_client_pool）发送请求
 - 与 ExternalServiceManager 集成
 
 API 端点：https://open.bigmodel.cn/api/paas/v4/chat/completions
@@ -41,6 +41,11 @@ from infrastructure.llm_adapters.zhipu.zhipu_request_builder import ZhipuRequest
 from infrastructure.llm_adapters.zhipu.zhipu_response_parser import ZhipuResponseParser
 from infrastructure.llm_adapters.zhipu.zhipu_stream_handler import ZhipuStreamHandler
 from infrastructure.llm_adapters.model_configs import ZHIPU_PROVIDER
+from infrastructure.utils.http_client_pool import (
+    AsyncBoundHttpClient,
+    BoundHttpClient,
+    get_http_client_registry,
+)
 from infrastructure.config.settings import (
     DEFAULT_TIMEOUT,
     DEFAULT_THINKING_TIMEOUT,
@@ -66,7 +71,7 @@ class ZhipuClient(BaseLLMClient):
     - 支持流式输出
     - 支持工具调用
     - 支持多模态输入（图像）
-    - 使用 httpx 异步客户端
+    - 复用进程级 httpx 连接池
     
     使用示例：
         client = ZhipuClient(api_key="your_api_key")
@@ -111,9 +116,6 @@ class ZhipuClient(BaseLLMClient):
         self._request_builder = ZhipuRequestBuilder()
         self._response_parser = ZhipuResponseParser()
         self._stream_handler = ZhipuStreamHandler()
-        
-        # httpx 客户端（延迟初始化）
-        self._sync_client: Optional[httpx.Client] = None
     
     # ============================================================
     # httpx 客户端管理
@@ -126,37 +128,25 @@ class ZhipuClient(BaseLLMClient):
             "Authorization": f"Bearer {self.api_key}",
         }
     
-    def _create_async_client(self) -> httpx.AsyncClient:
-        """获取异步 httpx 客户端（按请求创建）"""
-        return httpx.AsyncClient(
-            base_url=self.base_url,
+    def _create_async_client(self) -> AsyncBoundHttpClient:
+        """获取绑定到共享连接池的异步客户端视图"""
+        return get_http_client_registry().bind_async(
+            self.base_url,
             headers=self._get_headers(),
-            timeout=httpx.Timeout(self.timeout, connect=10.0),
+            timeout=self.timeout,
         )
     
-    def _get_sync_client(self) -> httpx.Client:
-        """获取同步 httpx 客户端（延迟初始化）"""
-        if self._sync_client is None:
-            self._sync_client = httpx.Client(
-                base_url=self.base_url,
-                headers=self._get_headers(),
-                timeout=httpx.Timeout(self.timeout, connect=10.0),
-            )
-        return self._sync_client
+    def _get_sync_client(self) -> BoundHttpClient:
+        """获取绑定到共享连接池的同步客户端视图"""
+        return get_http_client_registry().bind(
+            self.base_url,
+            headers=self._get_headers(),
+            timeout=self.timeout,
+        )
     
     async def close(self) -> None:
-        """关闭客户端连接"""
-        if self._sync_client:
-            self._sync_client.close()
-            self._sync_client = None
-    
-    def __del__(self):
-        """析构时关闭同步客户端"""
-        if self._sync_client:
-            try:
-                self._sync_client.close()
-            except Exception:
-                pass
+        """连接由进程级连接池持有，应用退出时统一关闭"""
+        return None
     
     # ============================================================
     # 核心方法实现
@@ -25,10 +25,12 @@ from infrastructure.llm_adapters.zhipu.zhipu_response_parser import ZhipuRespons
 
 @dataclass
 class StreamState:
-    """流式输出累积状态。"""
+    """流式输出累积状态。
+
+    只记录长度统计；正文由下游（AgentLoop）按列表累积，这里不再
+    逐 delta 拼接字符串。
+    """
 
-    content_buffer: str = ""
-    reasoning_buffer: str = ""
     tool_calls: List[Dict[str, Any]] = field(default_factory=list)
     chunk_count: int = 0
     total_content_length: int = 0
@@ -56,9 +58,13 @@ class ZhipuStreamHandler:
         state = StreamState()
         buffer = ""
         async for chunk in response.aiter_text():
-            buffer += chunk
-            while "\n" in buffer:
-                line, buffer = buffer.split("\n", 1)
+            if "\n" not in chunk:
+                buffer += chunk
+                continue
+            # 一次切分整块文本，末尾未完成的半行留到下一块
+            lines = (buffer + chunk).split("\n")
+            buffer = lines.pop()
+            for line in lines:
                 stream_chunk = self._process_line(line, state)
                 if stream_chunk:
                     yield stream_chunk
@@ -89,11 +95,9 @@ class ZhipuStreamHandler:
         state.chunk_count += 1
 
         if chunk.content:
-            state.content_buffer += chunk.content
             state.total_content_length += len(chunk.content)
 
         if chunk.reasoning_content:
-            state.reasoning_buffer += chunk.reasoning_content
             state.total_reasoning_length += len(chunk.reasoning_content)
 
         delta_tool_calls = getattr(chunk, "_delta_tool_calls", None)
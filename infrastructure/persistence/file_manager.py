@@ -33,6 +33,7 @@
 
 import hashlib
 import os
+import re
 import shutil
 import threading
 import time
@@ -87,6 +88,9 @@ class FileManager:
     # 内部写入回声抑制窗口（秒）
     INTERNAL_CHANGE_ECHO_WINDOW_S = 0.5
     
+    # 连续空白（模糊匹配规范化）
+    _WHITESPACE_RUN_PATTERN = re.compile(r'[ \t]+')
+    
     def __init__(self):
         """初始化文件管理器"""
         # 工作目录（延迟设置）
@@ -763,14 +767,16 @@ class FileManager:
         normalized = re.sub(r'[ \t]+', ' ', normalized)
         return normalized
     
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
+    def _normalize_line_whitespace(self, line: str) -> str:
         """
-        计算两个文本的相似度（0.0 - 1.0）
+        规范化单行空白字符（与 _normalize_whitespace 逐行等价）
         
-        使用 SequenceMatcher 计算相似度
+        空白行规范化为空字符串，由调用方在拼接窗口时跳过。
         """
-        from difflib import SequenceMatcher
-        return SequenceMatcher(None, text1, text2).ratio()
+        line = line.rstrip()
+        if not line.strip():
+            return ""
+        return self._WHITESPACE_RUN_PATTERN.sub(' ', line)
     
     def _patch_file_fuzzy(
         self,
@@ -785,7 +791,7 @@ class FileManager:
         模糊匹配模式的文件修改
         
         - 忽略空白字符差异
-        - 使用相似度匹配（阈值 0.9）
+        - 使用相似度匹配（Indel 相似度，阈值 0.9）
         
         Returns:
             Tuple[int, str]: (替换次数, 实际匹配到的原始内容)
@@ -805,32 +811,35 @@ class FileManager:
                 self.logger.debug(f"文件已是目标状态（模糊匹配），跳过修改: {resolved}")
             return (0, "")
         
-        # 按行分割内容，寻找最相似的内容块
+        from infrastructure.file_intelligence.search.fuzzy.block_matcher import BlockMatcher
+        
+        # 按行分割内容，寻找最相似的内容块（每行只规范化一次，锚点行优先）
         content_lines = content.split('\n')
-        best_match = None
-        best_similarity = 0.0
-        best_start_line = -1
-        
-        # 滑动窗口搜索
-        for i in range(len(content_lines) - search_lines + 1):
-            window = '\n'.join(content_lines[i:i + search_lines])
-            normalized_window = self._normalize_whitespace(window)
-            
-            similarity = self._calculate_similarity(normalized_search, normalized_window)
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = window
-                best_start_line = i
+        block_matcher = BlockMatcher(
+            content_lines,
+            self._normalize_line_whitespace,
+            skip_empty_lines=True,
+        )
+        search_block_lines = search.strip().split('\n')
+        match = block_matcher.find_best(
+            normalized_search, search_block_lines, SIMILARITY_THRESHOLD
+        )
         
         # 检查是否达到相似度阈值
-        if best_similarity < SIMILARITY_THRESHOLD:
+        if match is None:
+            # 失败路径：不设下限重新查找，仅用于报告最高相似度
+            closest = block_matcher.find_best(normalized_search, search_block_lines, 0.0)
+            best_similarity = closest.score if closest else 0.0
             raise SearchNotFoundError(
                 str(resolved),
                 f"模糊匹配失败，最高相似度 {best_similarity:.2%} < 阈值 {SIMILARITY_THRESHOLD:.0%}\n"
                 f"搜索内容: {search[:100]}..."
             )
         
+        best_similarity = match.score
+        best_start_line = match.start_line
+        best_match = '\n'.join(content_lines[best_start_line:best_start_line + search_lines])
+        
         if self.logger:
             self.logger.debug(
                 f"模糊匹配成功: 相似度 {best_similarity:.2%}, "
@@ -8,58 +8,71 @@
 - logger.py: 统一日志管理器
 - json_utils.py: JSON序列化/反序列化
 - file_utils.py: 跨平台文件操作（阶段二）
+- http_client_pool.py: 进程级 HTTP 连接池
+- local_embedding_backend.py: 独立进程内的本地嵌入推理
 - token_counter.py: 多模型Token计数（阶段三）
 """
 
-from .ngspice_config import (
-    configure_ngspice,
-    get_ngspice_path,
-    is_ngspice_available,
-    get_configuration_error,
-    get_ngspice_info,
-)
+from shared.lazy_import import lazy_exports
 
-from .model_config import (
-    configure_models,
-    get_embedding_model_path,
-    get_reranker_model_path,
-    is_embedding_available,
-    is_reranker_available,
-    get_model_info,
-)
-
-from .logger import (
-    setup_logger,
-    get_logger,
-    sanitize_message,
-    truncate_content,
-    log_performance,
-    log_api_call,
-    log_file_operation,
-    log_simulation,
-    cleanup_old_logs,
-)
-
-from .json_utils import (
-    safe_json_loads,
-    safe_json_dumps,
-    safe_json_load_file,
-    safe_json_dump_file,
-    CustomJSONEncoder,
-    merge_json_objects,
-    extract_json_from_text,
-)
-
-from .web_search_tool import (
-    DEFAULT_MAX_RESULTS,
-    SearchResult,
-    SearchError,
-    SearchCapability,
-    SearchCapabilityError,
-    SearchExecutionError,
-    WebSearchTool,
-    get_web_search_tool,
-)
+# 子模块按首次访问导入，见 shared/lazy_import.py
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "infrastructure.utils.ngspice_config": (
+        "configure_ngspice",
+        "get_ngspice_path",
+        "is_ngspice_available",
+        "get_configuration_error",
+        "get_ngspice_info",
+    ),
+    "infrastructure.utils.model_config": (
+        "configure_models",
+        "get_embedding_model_path",
+        "get_reranker_model_path",
+        "is_embedding_available",
+        "is_reranker_available",
+        "get_model_info",
+    ),
+    "infrastructure.utils.logger": (
+        "setup_logger",
+        "get_logger",
+        "sanitize_message",
+        "truncate_content",
+        "log_performance",
+        "log_api_call",
+        "log_file_operation",
+        "log_simulation",
+        "cleanup_old_logs",
+    ),
+    "infrastructure.utils.json_utils": (
+        "safe_json_loads",
+        "safe_json_dumps",
+        "safe_json_load_file",
+        "safe_json_dump_file",
+        "CustomJSONEncoder",
+        "merge_json_objects",
+        "extract_json_from_text",
+    ),
+    "infrastructure.utils.http_client_pool": (
+        "HttpClientRegistry",
+        "close_http_clients",
+        "get_http_client_registry",
+    ),
+    "infrastructure.utils.local_embedding_backend": (
+        "LocalEmbeddingBackend",
+        "close_local_embedding_backends",
+        "get_local_embedding_backend",
+    ),
+    "infrastructure.utils.web_search_tool": (
+        "DEFAULT_MAX_RESULTS",
+        "SearchResult",
+        "SearchError",
+        "SearchCapability",
+        "SearchCapabilityError",
+        "SearchExecutionError",
+        "WebSearchTool",
+        "get_web_search_tool",
+    ),
+})
 
 __all__ = [
     # ngspice 配置
@@ -93,6 +106,14 @@ __all__ = [
     "CustomJSONEncoder",
     "merge_json_objects",
     "extract_json_from_text",
+    # HTTP 连接池
+    "HttpClientRegistry",
+    "close_http_clients",
+    "get_http_client_registry",
+    # 本地嵌入推理
+    "LocalEmbeddingBackend",
+    "close_local_embedding_backends",
+    "get_local_embedding_backend",
     # 联网搜索
     "DEFAULT_MAX_RESULTS",
     "SearchResult",
@@ -0,0 +1,468 @@
+# HTTP Client Pool - 进程级 httpx 连接池
+"""
+进程级 HTTP 客户端注册表
+
+职责：
+- 按源站（scheme://host:port）复用 httpx.Client / httpx.AsyncClient，
+  LLM 对话、嵌入、连接测试共用 keep-alive 连接池，不再每次请求
+  重新握手 TCP/TLS
+- 安装了 h2 时启用 HTTP/2（同一连接上多路复用并发请求）
+- 统计每个源站的请求数、新建连接数、连接复用率与首包延迟
+- 应用退出时统一关闭（application.bootstrap._shutdown_services）
+
+设计说明：
+- 共享客户端不携带 base_url / 鉴权头 / 超时，这些由调用方通过
+  bind() / bind_async() 得到的绑定视图逐请求传入，因此同一源站的
+  不同 API Key、不同端点路径共用同一个连接池
+- 异步客户端的连接绑定在创建它的事件循环上，因此按（源站, 事件循环）
+  分别缓存；工作线程里 asyncio.run() 的临时循环应在退出前调用
+  aclose_loop_clients()，遗漏时对应客户端在下次取用时被丢弃
+- 绑定视图的 async with 不关闭底层客户端，连接归注册表所有
+- 连接复用通过 httpcore 的 trace 扩展判断：请求期间发生了
+  connect_tcp 即为新建连接，否则为复用
+
+使用示例：
+    client = get_http_client_registry().bind(base_url, headers=headers, timeout=30)
+    response = client.post("/chat/completions", json=body)
+
+    async with get_http_client_registry().bind_async(base_url, headers=headers) as client:
+        async with client.stream("POST", "/chat/completions", json=body) as response:
+            ...
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import httpx
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+DEFAULT_MAX_CONNECTIONS = 20              # 每个源站的最大连接数
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10    # 每个源站保持的空闲连接数
+DEFAULT_KEEPALIVE_EXPIRY = 90.0           # 空闲连接保留秒数
+DEFAULT_CONNECT_TIMEOUT = 10.0            # 建连超时秒数
+DEFAULT_REQUEST_TIMEOUT = 60.0            # 未指定时的请求超时秒数
+LATENCY_SAMPLE_SIZE = 256                 # 每个源站保留的延迟样本数
+
+TimeoutSpec = Union[None, float, int, httpx.Timeout]
+
+_logger = logging.getLogger(__name__)
+
+
+def is_http2_available() -> bool:
+    """是否安装了 HTTP/2 依赖（h2）"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _origin_of(url: str) -> str:
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.hostname:
+        raise ValueError(f"Absolute URL required: {url!r}")
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return f"{parts.scheme}://{parts.hostname.lower()}:{port}"
+
+
+def _join_url(base_url: str, url: str) -> str:
+    if not url:
+        return base_url
+    if "://" in url:
+        return url
+    return f"{base_url.rstrip('/')}/{url.lstrip('/')}"
+
+
+def _as_timeout(timeout: TimeoutSpec) -> httpx.Timeout:
+    if isinstance(timeout, httpx.Timeout):
+        return timeout
+    return httpx.Timeout(
+        float(timeout) if timeout is not None else DEFAULT_REQUEST_TIMEOUT,
+        connect=DEFAULT_CONNECT_TIMEOUT,
+    )
+
+
+# ============================================================
+# 指标
+# ============================================================
+
+class _OriginStats:
+    """单个源站的请求统计（在注册表锁内更新）"""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.new_connections = 0
+        self.latency_ms_total = 0.0
+        self.latency_ms_max = 0.0
+        self.latency_samples: Deque[float] = deque(maxlen=LATENCY_SAMPLE_SIZE)
+
+    def record(self, latency_ms: float, new_connection: bool) -> None:
+        self.requests += 1
+        if new_connection:
+            self.new_connections += 1
+        self.latency_ms_total += latency_ms
+        self.latency_ms_max = max(self.latency_ms_max, latency_ms)
+        self.latency_samples.append(latency_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        reused = max(0, self.requests - self.new_connections)
+        ordered = sorted(self.latency_samples)
+
+        def percentile(fraction: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": reused,
+            "reuse_ratio": round(reused / self.requests, 4) if self.requests else 0.0,
+            "latency_ms_avg": round(self.latency_ms_total / self.requests, 3) if self.requests else 0.0,
+            "latency_ms_p50": percentile(0.5),
+            "latency_ms_p95": percentile(0.95),
+            "latency_ms_max": round(self.latency_ms_max, 3),
+        }
+
+
+class _RequestProbe:
+    """挂在 request.extensions["trace"] 上，记录单次请求的建连与耗时"""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.new_connection = False
+
+    def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.new_connection = True
+
+    async def atrace(self, event_name: str, info: Dict[str, Any]) -> None:
+        self.trace(event_name, info)
+
+
+# ============================================================
+# 绑定视图
+# ============================================================
+
+class BoundHttpClient:
+    """绑定 base_url / 请求头 / 超时的同步客户端视图"""
+
+    def __init__(self, client: httpx.Client, base_url: str, headers: Dict[str, str], timeout: httpx.Timeout):
+        self._client = client
+        self.base_url = base_url
+        self._headers = headers
+        self._timeout = timeout
+
+    def request(self, method: str, url: str = "", **kwargs: Any) -> httpx.Response:
+        headers = {**self._headers, **(kwargs.pop("headers", None) or {})}
+        kwargs.setdefault("timeout", self._timeout)
+        return self._client.request(method, _join_url(self.base_url, url), headers=headers, **kwargs)
+
+    def post(self, url: str = "", **kwargs: Any) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get(self, url: str = "", **kwargs: Any) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def close(self) -> None:
+        """连接归注册表所有，视图关闭不影响连接池"""
+
+    def __enter__(self) -> "BoundHttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+class AsyncBoundHttpClient:
+    """绑定 base_url / 请求头 / 超时的异步客户端视图"""
+
+    def __init__(self, client: httpx.AsyncClient, base_url: str, headers: Dict[str, str], timeout: httpx.Timeout):
+        self._client = client
+        self.base_url = base_url
+        self._headers = headers
+        self._timeout = timeout
+
+    def _prepare(self, url: str, kwargs: Dict[str, Any]) -> str:
+        kwargs["headers"] = {**self._headers, **(kwargs.pop("headers", None) or {})}
+        kwargs.setdefault("timeout", self._timeout)
+        return _join_url(self.base_url, url)
+
+    async def request(self, method: str, url: str = "", **kwargs: Any) -> httpx.Response:
+        full_url = self._prepare(url, kwargs)
+        return await self._client.request(method, full_url, **kwargs)
+
+    async def post(self, url: str = "", **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def stream(self, method: str, url: str = "", **kwargs: Any):
+        full_url = self._prepare(url, kwargs)
+        return self._client.stream(method, full_url, **kwargs)
+
+    async def aclose(self) -> None:
+        """连接归注册表所有，视图关闭不影响连接池"""
+
+    async def __aenter__(self) -> "AsyncBoundHttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+# ============================================================
+# HttpClientRegistry
+# ============================================================
+
+class HttpClientRegistry:
+    """
+    进程级 httpx 客户端注册表
+
+    同步客户端按源站缓存，异步客户端按（源站, 事件循环）缓存。
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+    ):
+        self._http2 = bool(http2) and is_http2_available()
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._lock = threading.Lock()
+        self._sync_clients: Dict[str, httpx.Client] = {}
+        self._async_clients: Dict[Tuple[str, asyncio.AbstractEventLoop], httpx.AsyncClient] = {}
+        self._stats: Dict[str, _OriginStats] = {}
+
+    @property
+    def http2_enabled(self) -> bool:
+        return self._http2
+
+    # --------------------------------------------------------
+    # 客户端获取
+    # --------------------------------------------------------
+
+    def get_sync_client(self, url: str) -> httpx.Client:
+        """获取某源站的共享同步客户端"""
+        origin = _origin_of(url)
+        with self._lock:
+            client = self._sync_clients.get(origin)
+            if client is None or client.is_closed:
+                client = httpx.Client(
+                    http2=self._http2,
+                    limits=self._limits,
+                    timeout=_as_timeout(None),
+                    event_hooks={
+                        "request": [self._on_request],
+                        "response": [self._make_response_hook(origin)],
+                    },
+                )
+                self._sync_clients[origin] = client
+            return client
+
+    def get_async_client(self, url: str) -> httpx.AsyncClient:
+        """获取某源站在当前事件循环上的共享异步客户端"""
+        origin = _origin_of(url)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._prune_closed_loops()
+            key = (origin, loop)
+            client = self._async_clients.get(key)
+            if client is None or client.is_closed:
+                record = self._make_response_hook(origin)
+
+                async def on_request(request: httpx.Request) -> None:
+                    self._on_request(request, asynchronous=True)
+
+                async def on_response(response: httpx.Response) -> None:
+                    record(response)
+
+                client = httpx.AsyncClient(
+                    http2=self._http2,
+                    limits=self._limits,
+                    timeout=_as_timeout(None),
+                    event_hooks={"request": [on_request], "response": [on_response]},
+                )
+                self._async_clients[key] = client
+            return client
+
+    def bind(
+        self,
+        base_url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: TimeoutSpec = None,
+    ) -> BoundHttpClient:
+        """获取绑定 base_url / 请求头 / 超时的同步视图"""
+        return BoundHttpClient(self.get_sync_client(base_url), base_url, dict(headers or {}), _as_timeout(timeout))
+
+    def bind_async(
+        self,
+        base_url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: TimeoutSpec = None,
+    ) -> AsyncBoundHttpClient:
+        """获取绑定 base_url / 请求头 / 超时的异步视图（需在事件循环内调用）"""
+        return AsyncBoundHttpClient(self.get_async_client(base_url), base_url, dict(headers or {}), _as_timeout(timeout))
+
+    def _prune_closed_loops(self) -> None:
+        for key in [key for key in self._async_clients if key[1].is_closed()]:
+            # 循环已关闭，连接无法再 await 关闭，交给 GC
+            del self._async_clients[key]
+
+    # --------------------------------------------------------
+    # 指标
+    # --------------------------------------------------------
+
+    def _on_request(self, request: httpx.Request, asynchronous: bool = False) -> None:
+        probe = _RequestProbe()
+        request.extensions["trace"] = probe.atrace if asynchronous else probe.trace
+
+    def _make_response_hook(self, origin: str):
+        def on_response(response: httpx.Response) -> None:
+            probe = getattr(response.request.extensions.get("trace"), "__self__", None)
+            if not isinstance(probe, _RequestProbe):
+                return
+            latency_ms = (time.perf_counter() - probe.started) * 1000
+            with self._lock:
+                self._stats.setdefault(origin, _OriginStats()).record(latency_ms, probe.new_connection)
+        return on_response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        获取连接池统计
+
+        Returns:
+            {"http2": bool, "clients": {...}, "origins": {origin: {...}}}
+            latency_ms_* 为发出请求到收到响应头的耗时
+        """
+        with self._lock:
+            return {
+                "http2": self._http2,
+                "clients": {
+                    "sync": len(self._sync_clients),
+                    "async": len(self._async_clients),
+                },
+                "origins": {origin: stats.to_dict() for origin, stats in self._stats.items()},
+            }
+
+    # --------------------------------------------------------
+    # 生命周期
+    # --------------------------------------------------------
+
+    def close(self) -> None:
+        """
+        关闭全部客户端（应用退出时调用）
+
+        同步客户端直接关闭；异步客户端在其事件循环未运行且未关闭时
+        同步等待关闭，循环仍在运行时调度关闭任务，已关闭则直接丢弃。
+        """
+        with self._lock:
+            sync_clients = list(self._sync_clients.values())
+            async_clients = list(self._async_clients.items())
+            self._sync_clients.clear()
+            self._async_clients.clear()
+
+        for client in sync_clients:
+            try:
+                client.close()
+            except Exception as e:
+                _logger.debug(f"Closing HTTP client failed: {e}")
+
+        for (_, loop), client in async_clients:
+            try:
+                if loop.is_closed():
+                    continue
+                if loop.is_running():
+                    loop.call_soon_threadsafe(lambda c=client, lp=loop: lp.create_task(c.aclose()))
+                else:
+                    loop.run_until_complete(client.aclose())
+            except Exception as e:
+                _logger.debug(f"Closing async HTTP client failed: {e}")
+
+    async def aclose_loop_clients(self) -> None:
+        """
+        关闭绑定在当前事件循环上的异步客户端
+
+        供 asyncio.run() 创建的临时循环在退出前调用，避免连接残留到
+        循环关闭之后。
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            own = [key for key in self._async_clients if key[1] is loop]
+            clients = [self._async_clients.pop(key) for key in own]
+        for client in clients:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """在事件循环内关闭全部客户端"""
+        await self.aclose_loop_clients()
+        self.close()
+
+
+# ============================================================
+# 模块级单例
+# ============================================================
+
+_registry: Optional[HttpClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    """
+    获取 HttpClientRegistry 单例实例
+
+    Returns:
+        HttpClientRegistry 实例
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = HttpClientRegistry()
+        return _registry
+
+
+def close_http_clients() -> Dict[str, Any]:
+    """
+    关闭进程级客户端并返回最终统计（应用退出时调用）
+
+    Returns:
+        关闭前的 get_stats() 结果；注册表未创建时为空字典
+    """
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is None:
+        return {}
+    stats = registry.get_stats()
+    registry.close()
+    return stats
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "DEFAULT_MAX_CONNECTIONS",
+    "DEFAULT_MAX_KEEPALIVE_CONNECTIONS",
+    "DEFAULT_KEEPALIVE_EXPIRY",
+    "AsyncBoundHttpClient",
+    "BoundHttpClient",
+    "HttpClientRegistry",
+    "close_http_clients",
+    "get_http_client_registry",
+    "is_http2_available",
+]
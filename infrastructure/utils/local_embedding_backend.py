@@ -0,0 +1,369 @@
+# Local Embedding Backend - 独立进程内的本地 CPU 嵌入推理
+"""
+本地嵌入推理后端
+
+职责：
+- 在独立子进程中加载 sentence-transformers 模型并批量推理，
+  推理期间不占用主进程 GIL，Qt 主线程与 RAG 工作线程不受影响
+- 支持原始权重（torch）、ONNX 与动态量化 ONNX（onnx-qint8）三种后端
+- warm_up() 在后台线程启动子进程并完成一次推理（项目打开时调用），
+  首次索引 / 查询不再承担模型加载耗时
+- 应用退出时统一关闭（application.bootstrap._shutdown_services）
+
+进程协议（multiprocessing.Pipe，一问一答，调用方持锁串行）：
+- 子进程启动后先回 ("ready", 加载耗时毫秒) 或 ("error", 信息)
+- 请求 ("embed", texts) → ("ok", vectors) / ("error", 信息)
+- 请求 ("close",) → 子进程退出
+
+设计说明：
+- 子进程使用 spawn 启动，不继承主进程的 Qt / 线程状态
+- 子进程意外退出时，下一次请求自动重启
+- 模型加载函数（loader）须为模块级可导入函数，在子进程内调用，
+  返回 texts -> vectors 的编码函数
+
+使用示例：
+    backend = get_local_embedding_backend(get_embedding_model_path(), "onnx")
+    backend.warm_up()
+    vectors = backend.embed(["R1 in out 10k"])
+"""
+
+import asyncio
+import glob
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# ============================================================
+# 常量定义
+# ============================================================
+
+DEFAULT_LOCAL_BATCH_SIZE = 32             # 子进程内 encode 的批大小
+STARTUP_TIMEOUT = 600.0                   # 模型加载超时秒数（首次可能需要下载）
+POLL_INTERVAL = 0.5                       # 等待应答时检查子进程存活的间隔
+QUANTIZED_ONNX_PATTERN = "onnx/model_qint8_*.onnx"
+
+EncodeFn = Callable[[List[str]], List[List[float]]]
+Loader = Callable[[str, str, int], EncodeFn]
+
+_logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# 子进程
+# ============================================================
+
+def load_sentence_transformer(model_path: str, backend: str, batch_size: int) -> EncodeFn:
+    """
+    加载 sentence-transformers 模型（在子进程内调用）
+
+    Args:
+        model_path: 本地模型目录或 HuggingFace 模型 ID
+        backend: "torch" / "onnx" / "onnx-qint8"
+        batch_size: encode 批大小
+
+    Returns:
+        编码函数，输出 L2 归一化的向量
+    """
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "torch":
+        model = SentenceTransformer(model_path, device="cpu")
+    elif backend == "onnx":
+        model = SentenceTransformer(model_path, device="cpu", backend="onnx")
+    elif backend == "onnx-qint8":
+        candidates = sorted(glob.glob(os.path.join(model_path, QUANTIZED_ONNX_PATTERN)))
+        if not candidates:
+            raise FileNotFoundError(
+                f"No quantized ONNX model ({QUANTIZED_ONNX_PATTERN}) under {model_path}"
+            )
+        file_name = os.path.relpath(candidates[0], model_path).replace(os.sep, "/")
+        model = SentenceTransformer(
+            model_path,
+            device="cpu",
+            backend="onnx",
+            model_kwargs={"file_name": file_name},
+        )
+    else:
+        raise ValueError(f"Unknown local embedding backend: {backend}")
+
+    def encode(texts: List[str]) -> List[List[float]]:
+        vectors = model.encode(
+            texts,
+            batch_size=batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return vectors.tolist()
+
+    return encode
+
+
+def _worker_main(conn, loader: Loader, model_path: str, backend: str, batch_size: int) -> None:
+    """子进程入口：加载模型后循环处理请求"""
+    started = time.perf_counter()
+    try:
+        encode = loader(model_path, backend, batch_size)
+    except Exception as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+        return
+    conn.send(("ready", (time.perf_counter() - started) * 1000))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message[0] == "close":
+            return
+        try:
+            conn.send(("ok", encode(list(message[1]))))
+        except Exception as exc:
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+
+
+# ============================================================
+# LocalEmbeddingBackend
+# ============================================================
+
+class LocalEmbeddingBackend:
+    """
+    本地嵌入推理后端（线程安全，请求串行进入子进程）
+
+    子进程内 sentence-transformers 自行按 batch_size 分批，
+    调用方一次传入整批文本即可。
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        backend: str = "torch",
+        batch_size: int = DEFAULT_LOCAL_BATCH_SIZE,
+        loader: Loader = load_sentence_transformer,
+    ):
+        self.model_path = model_path
+        self.backend = backend
+        self.batch_size = max(1, int(batch_size))
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._conn = None
+        self._stats = {
+            "starts": 0,
+            "load_ms": 0.0,
+            "requests": 0,
+            "texts": 0,
+            "encode_ms": 0.0,
+        }
+
+    # --------------------------------------------------------
+    # 进程管理
+    # --------------------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        process = self._process
+        return process is not None and process.is_alive()
+
+    def start(self) -> None:
+        """启动子进程并等待模型加载完成（已在运行时立即返回）"""
+        with self._lock:
+            self._ensure_process()
+
+    def _ensure_process(self) -> None:
+        if self.is_running:
+            return
+        self._stop_process()
+
+        # 打包构建中 spawn 子进程依赖入口 main.py 调用 multiprocessing.freeze_support()
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_worker_main,
+            args=(child_conn, self._loader, self.model_path, self.backend, self.batch_size),
+            name="local-embedding",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+
+        status, payload = self._receive(STARTUP_TIMEOUT)
+        if status != "ready":
+            self._stop_process()
+            raise RuntimeError(f"Local embedding model failed to load: {payload}")
+        self._stats["starts"] += 1
+        self._stats["load_ms"] = payload
+        _logger.info(
+            f"Local embedding model loaded: {self.model_path} "
+            f"(backend={self.backend}, {payload:.0f}ms)"
+        )
+
+    def _receive(self, timeout: Optional[float] = None) -> Tuple[str, Any]:
+        """等待子进程应答；子进程退出或超时时抛出 RuntimeError"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._conn.poll(POLL_INTERVAL):
+            if not self._process.is_alive():
+                raise RuntimeError(
+                    f"Local embedding process exited (code {self._process.exitcode})"
+                )
+            if deadline is not None and time.monotonic() > deadline:
+                raise RuntimeError("Timed out waiting for local embedding process")
+        try:
+            return self._conn.recv()
+        except EOFError:
+            raise RuntimeError("Local embedding process closed the connection")
+
+    def _stop_process(self) -> None:
+        process, conn = self._process, self._conn
+        self._process = None
+        self._conn = None
+        if conn is not None:
+            try:
+                if process is not None and process.is_alive():
+                    conn.send(("close",))
+            except (OSError, BrokenPipeError):
+                pass
+            conn.close()
+        if process is not None:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=5)
+
+    def warm_up(self) -> threading.Thread:
+        """
+        在后台线程启动子进程并完成一次推理
+
+        Returns:
+            执行预热的线程（调用方一般无需等待）
+        """
+        def run() -> None:
+            try:
+                self.embed(["warm up"])
+            except Exception as exc:
+                _logger.warning(f"Local embedding warm-up failed: {exc}")
+
+        thread = threading.Thread(target=run, name="local-embedding-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def close(self) -> None:
+        """关闭子进程"""
+        with self._lock:
+            self._stop_process()
+
+    # --------------------------------------------------------
+    # 推理
+    # --------------------------------------------------------
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        批量生成向量（阻塞至子进程返回）
+
+        子进程在请求处理中途退出时重启一次并重试。
+
+        Returns:
+            与输入等长、同序的向量列表
+        """
+        if not texts:
+            return []
+        with self._lock:
+            for attempt in range(2):
+                self._ensure_process()
+                started = time.perf_counter()
+                try:
+                    self._conn.send(("embed", list(texts)))
+                    status, payload = self._receive()
+                except (RuntimeError, OSError) as exc:
+                    if attempt:
+                        raise RuntimeError(f"Local embedding failed: {exc}") from exc
+                    _logger.warning(f"Local embedding process lost ({exc}), restarting")
+                    self._stop_process()
+                    continue
+                if status != "ok":
+                    raise RuntimeError(f"Local embedding failed: {payload}")
+                self._stats["requests"] += 1
+                self._stats["texts"] += len(texts)
+                self._stats["encode_ms"] += (time.perf_counter() - started) * 1000
+                return payload
+        raise AssertionError("unreachable")
+
+    async def embed_async(self, texts: List[str]) -> List[List[float]]:
+        """在线程池中等待子进程推理，不阻塞事件循环"""
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.embed, texts)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["running"] = self.is_running
+        stats["backend"] = self.backend
+        stats["texts_per_second"] = (
+            stats["texts"] * 1000 / stats["encode_ms"] if stats["encode_ms"] else 0.0
+        )
+        return stats
+
+
+# ============================================================
+# 模块级单例
+# ============================================================
+
+_backends: Dict[Tuple[str, str], LocalEmbeddingBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_local_embedding_backend(
+    model_path: str,
+    backend: str = "torch",
+    batch_size: int = DEFAULT_LOCAL_BATCH_SIZE,
+) -> LocalEmbeddingBackend:
+    """
+    获取（模型路径, 推理后端）对应的进程级后端实例
+
+    batch_size 只在首次创建时生效。
+    """
+    key = (model_path, backend)
+    with _backends_lock:
+        instance = _backends.get(key)
+        if instance is None:
+            instance = LocalEmbeddingBackend(model_path, backend, batch_size)
+            _backends[key] = instance
+        return instance
+
+
+def close_local_embedding_backends() -> Dict[str, Any]:
+    """
+    关闭全部本地推理子进程（应用退出时调用）
+
+    Returns:
+        {"模型路径 [后端]": get_stats()}；未创建过后端时为空字典
+    """
+    with _backends_lock:
+        backends = list(_backends.values())
+        _backends.clear()
+    stats = {}
+    for instance in backends:
+        stats[f"{instance.model_path} [{instance.backend}]"] = instance.get_stats()
+        instance.close()
+    return stats
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "DEFAULT_LOCAL_BATCH_SIZE",
+    "LocalEmbeddingBackend",
+    "close_local_embedding_backends",
+    "get_local_embedding_backend",
+    "load_sentence_transformer",
+]
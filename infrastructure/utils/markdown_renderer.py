@@ -7,6 +7,8 @@ Markdown 渲染器（含 LaTeX 支持）
 - 支持 LaTeX 数学公式渲染（通过 KaTeX）
 - 提供代码块语法高亮
 - 生成完整的 HTML 页面模板
+- 增量渲染：按稳定块（段落、代码围栏、表格、公式块）切分，已定稿块
+  的 HTML 按内容缓存，整条消息另有跨会话历史的 LRU 缓存
 
 使用示例：
     from infrastructure.utils.markdown_renderer import MarkdownRenderer
@@ -19,6 +21,7 @@ Markdown 渲染器（含 LaTeX 支持）
 import os
 import re
 import base64
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -45,6 +48,17 @@ _PIPE_TABLE_SEPARATOR_PATTERN = re.compile(
     r'^\s*\|?\s*:?-{3,}:?\s*(?:\|\s*:?-{3,}:?\s*)+\|?\s*$'
 )
 
+# 增量渲染
+DEFAULT_BLOCK_CACHE_SIZE = 4096       # 已定稿块 HTML 缓存条数
+DEFAULT_DOCUMENT_CACHE_SIZE = 512     # 整条消息 HTML 缓存条数（跨会话历史）
+_FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+_LIST_ITEM_PATTERN = re.compile(r'^ {0,3}(?:[*+-]|\d+[.)])\s')
+_BLOCKQUOTE_PATTERN = re.compile(r'^ {0,3}>')
+# 标题、围栏、分隔线等行结束其前面的列表 / 引用容器
+_CONTAINER_BREAK_PATTERN = re.compile(r'^ {0,3}(?:#{1,6}(?:\s|$)|`{3,}|~{3,}|\$\$|(?:[-*_] *){3,}$)')
+# 引用式链接定义作用于全文，出现时整体渲染，不做分块
+_REFERENCE_DEFINITION_PATTERN = re.compile(r'^ {0,3}\[[^\]]+\]:\s*\S', re.MULTILINE)
+
 
 def _get_katex_base_path() -> Optional[Path]:
     """
@@ -146,6 +160,133 @@ def _load_katex_resources() -> Tuple[str, str, str]:
         return ("", "", "")
 
 
+# ============================================================
+# 增量渲染：分块与缓存
+# ============================================================
+
+def split_markdown_blocks(text: str) -> List[str]:
+    """
+    把 Markdown 文本切分为可以独立渲染的稳定块
+
+    只在代码围栏、$$ 公式块之外的空行处切分；以下情况不切：
+    - 空行后的下一行有缩进（列表续行、缩进代码块）
+    - 空行后的下一行延续当前块末尾打开的容器：列表后接列表项
+      （松散列表需要整体渲染）、引用后接 > 行（同一个 blockquote）
+
+    流式输出时文本只在末尾增长，因此除最后一块外的所有块都已定稿。
+
+    Args:
+        text: Markdown 文本
+
+    Returns:
+        块列表，按 "\n" 拼接等于去掉块间多余空行后的原文
+    """
+    lines = text.split("\n")
+    blocks: List[str] = []
+    current: List[str] = []
+    fence: Optional[str] = None
+    in_math = False
+
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        if fence is not None:
+            current.append(line)
+            match = _FENCE_PATTERN.match(line)
+            if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence) \
+                    and not line.strip().strip(fence[0]):
+                fence = None
+            index += 1
+            continue
+        if in_math:
+            current.append(line)
+            if line.count("$$") % 2 == 1:
+                in_math = False
+            index += 1
+            continue
+
+        if not line.strip():
+            next_index = index
+            while next_index < len(lines) and not lines[next_index].strip():
+                next_index += 1
+            if current and next_index < len(lines) and _starts_new_block(current, lines[next_index]):
+                blocks.append("\n".join(current))
+                current = []
+                index = next_index
+                continue
+            current.extend(lines[index:next_index])
+            index = next_index
+            continue
+
+        current.append(line)
+        match = _FENCE_PATTERN.match(line)
+        if match:
+            fence = match.group(1)
+        elif line.count("$$") % 2 == 1:
+            in_math = True
+        index += 1
+
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+def _starts_new_block(current: List[str], next_line: str) -> bool:
+    if next_line[:1] in (" ", "\t"):
+        return False
+    container = _open_container(current)
+    if container == "list" and _LIST_ITEM_PATTERN.match(next_line):
+        return False
+    if container == "quote" and _BLOCKQUOTE_PATTERN.match(next_line):
+        return False
+    return True
+
+
+def _open_container(current: List[str]) -> Optional[str]:
+    """
+    当前块末尾仍打开的容器（"list" / "quote" / None）
+
+    自后向前跳过缩进行与惰性续行，遇到的第一个列表项或 > 行决定容器；
+    先遇到标题、围栏、公式块或分隔线则容器已结束。
+    """
+    for line in reversed(current):
+        if _BLOCKQUOTE_PATTERN.match(line):
+            return "quote"
+        if _LIST_ITEM_PATTERN.match(line):
+            return "list"
+        if _CONTAINER_BREAK_PATTERN.match(line):
+            return None
+    return None
+
+
+class _RenderCache:
+    """按文本内容索引的 LRU（dict 以字符串哈希定位条目）"""
+
+    def __init__(self, max_size: int):
+        self._max_size = max(0, int(max_size))
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        if self._max_size <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 # ============================================================
 # MarkdownRenderer 类
 # ============================================================
@@ -157,16 +298,26 @@ class MarkdownRenderer:
     支持 Markdown 转 HTML，包含 LaTeX 公式渲染。
     """
     
-    def __init__(self, use_local_katex: bool = True):
+    def __init__(
+        self,
+        use_local_katex: bool = True,
+        block_cache_size: int = DEFAULT_BLOCK_CACHE_SIZE,
+        document_cache_size: int = DEFAULT_DOCUMENT_CACHE_SIZE,
+    ):
         """
         初始化渲染器
         
         Args:
             use_local_katex: 是否使用本地 KaTeX 文件
+            block_cache_size: 已定稿块 HTML 缓存条数
+            document_cache_size: 整条消息 HTML 缓存条数
         """
         self._use_local_katex = use_local_katex
         self._katex_base_path = _get_katex_base_path() if use_local_katex else None
         self._md = None
+        self._block_cache = _RenderCache(block_cache_size)
+        self._document_cache = _RenderCache(document_cache_size)
+        self.rendered_block_count = 0
         
         if MARKDOWN_AVAILABLE:
             self._md = markdown.Markdown(
@@ -180,7 +331,10 @@ class MarkdownRenderer:
     
     def render_markdown(self, text: str) -> str:
         """
-        将 Markdown 转换为 HTML
+        将 Markdown 转换为 HTML（增量）
+        
+        整条文本命中历史缓存时直接返回；否则按 split_markdown_blocks
+        分块，已定稿块走块缓存，只重新渲染末尾仍可能增长的块。
         
         Args:
             text: Markdown 文本
@@ -190,7 +344,39 @@ class MarkdownRenderer:
         """
         if not text:
             return ""
-        
+
+        cached = self._document_cache.get(text)
+        if cached is not None:
+            return cached
+
+        if _REFERENCE_DEFINITION_PATTERN.search(text):
+            html = self._render_block(text)
+        else:
+            blocks = split_markdown_blocks(text)
+            parts: List[str] = []
+            for block in blocks[:-1]:
+                block_html = self._block_cache.get(block)
+                if block_html is None:
+                    block_html = self._render_block(block)
+                    self._block_cache.put(block, block_html)
+                parts.append(block_html)
+            if blocks:
+                # 末尾块在流式输出中仍会增长，不进块缓存
+                parts.append(self._render_block(blocks[-1]))
+            html = "\n".join(part for part in parts if part)
+
+        self._document_cache.put(text, html)
+        return html
+
+    def clear_cache(self) -> None:
+        """清空块缓存与整条消息缓存"""
+        self._block_cache.clear()
+        self._document_cache.clear()
+
+    def _render_block(self, text: str) -> str:
+        """完整渲染一段 Markdown（不查缓存）"""
+        self.rendered_block_count += 1
+
         # 保护 LaTeX 公式不被 Markdown 解析器处理
         text, latex_blocks = self._protect_latex(text)
         text = self._normalize_pipe_table_blocks(text)
@@ -709,7 +895,10 @@ def get_full_html(content: str, title: str = "") -> str:
 # ============================================================
 
 __all__ = [
+    "DEFAULT_BLOCK_CACHE_SIZE",
+    "DEFAULT_DOCUMENT_CACHE_SIZE",
     "MarkdownRenderer",
+    "split_markdown_blocks",
     "render_markdown",
     "get_full_html",
     "get_renderer",
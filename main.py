@@ -11,6 +11,7 @@
 - 所有初始化编排由 application/bootstrap.py 负责
 """
 
+import multiprocessing
 import sys
 
 
@@ -26,4 +27,7 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # 打包构建中 spawn 子进程（ASC 批量转换、本地嵌入推理）会重新执行入口，
+    # freeze_support 使其直接进入子进程逻辑而不是再次启动应用
+    multiprocessing.freeze_support()
     sys.exit(main())
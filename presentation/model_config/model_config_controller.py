@@ -1,25 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
-import httpx
 from PyQt6.QtCore import QTimer
 
 from infrastructure.config.settings import (
     CONFIG_EMBEDDING_BASE_URL,
     CONFIG_EMBEDDING_BATCH_SIZE,
+    CONFIG_EMBEDDING_LOCAL_BACKEND,
     CONFIG_EMBEDDING_MODEL,
     CONFIG_EMBEDDING_PROVIDER,
     CONFIG_EMBEDDING_TIMEOUT,
     CREDENTIAL_TYPE_EMBEDDING,
     DEFAULT_EMBEDDING_BATCH_SIZE,
     DEFAULT_EMBEDDING_TIMEOUT,
+    DEFAULT_LOCAL_EMBEDDING_BACKEND,
     DEFAULT_THINKING_TIMEOUT,
     DEFAULT_TIMEOUT,
+    EMBEDDING_PROVIDER_LOCAL,
 )
 from infrastructure.llm_adapters.client_factory import LLMClientFactory
+from infrastructure.utils.http_client_pool import get_http_client_registry
+from infrastructure.utils.local_embedding_backend import get_local_embedding_backend
+from infrastructure.utils.model_config import get_embedding_model_path
 from presentation.model_config.model_config_state_serializer import ModelConfigStateSerializer
 from shared.embedding_model_registry import EmbeddingModelRegistry
 from shared.event_types import EVENT_LANGUAGE_CHANGED, EVENT_LLM_CONFIG_CHANGED
@@ -77,6 +83,8 @@ class ModelConfigController:
         self._draft = ModelConfigDraft()
         self._language_subscribed = False
         self._serializer = ModelConfigStateSerializer(self._get_text)
+        # 本地嵌入连接测试任务；保留引用，避免事件循环只持有弱引用时被回收
+        self._connection_test_task: Optional[asyncio.Task] = None
 
     def activate(self) -> None:
         ModelRegistry.initialize()
@@ -438,6 +446,13 @@ class ModelConfigController:
         self._draft.embedding_validation_status = "testing"
         self._draft.embedding_validation_message = ""
         self.emit_state()
+        if self._draft.embedding_provider.strip() == EMBEDDING_PROVIDER_LOCAL:
+            # 本地模型首次加载可能耗时数分钟，推理放到线程池等待，不阻塞 Qt 主线程
+            self._connection_test_task = asyncio.create_task(
+                self._perform_local_embedding_connection_test()
+            )
+            self._connection_test_task.add_done_callback(self._on_connection_test_task_done)
+            return
         QTimer.singleShot(100, self._perform_embedding_connection_test)
 
     def _perform_chat_connection_test(self) -> None:
@@ -484,47 +499,83 @@ class ModelConfigController:
             return
 
         try:
-            if provider_id != "zhipu":
-                raise RuntimeError(
-                    self._get_text(
-                        "dialog.model_config.error.embedding_test_not_supported",
-                        "Embedding connection testing is not implemented for this provider yet.",
-                    )
+            embedding = self._embed_with_remote_provider(provider_id, "ping")
+            self._apply_embedding_test_result(provider_id, embedding)
+        except Exception as exc:
+            self._fail_embedding_connection_test(exc)
+        self.emit_state()
+
+    def _on_connection_test_task_done(self, task: asyncio.Task) -> None:
+        if self._connection_test_task is task:
+            self._connection_test_task = None
+
+    async def _perform_local_embedding_connection_test(self) -> None:
+        provider_id = EMBEDDING_PROVIDER_LOCAL
+        try:
+            embedding = await self._embed_with_local_backend("ping")
+            if self._draft.embedding_provider.strip() != provider_id:
+                # 等待期间已切换提供商，结果作废
+                return
+            self._apply_embedding_test_result(provider_id, embedding)
+        except Exception as exc:
+            if self._draft.embedding_provider.strip() != provider_id:
+                return
+            self._fail_embedding_connection_test(exc)
+        self.emit_state()
+
+    def _apply_embedding_test_result(self, provider_id: str, embedding: Any) -> None:
+        if not isinstance(embedding, list) or not embedding:
+            raise RuntimeError(
+                self._get_text(
+                    "dialog.model_config.error.invalid_embedding_response",
+                    "Embedding API returned an invalid response.",
                 )
-            headers = {}
-            api_key = self._draft.embedding_api_key.strip()
-            if api_key:
-                headers["Authorization"] = f"Bearer {api_key}"
-            response = httpx.post(
-                self._draft.embedding_base_url.strip() or None,
-                headers=headers,
-                json={
-                    "input": ["ping"],
-                    "model": self._draft.embedding_model.strip() or None,
-                },
-                timeout=max(1, int(self._draft.embedding_timeout or DEFAULT_EMBEDDING_TIMEOUT)),
             )
-            response.raise_for_status()
-            data = response.json()
-            items = data.get("data", []) if isinstance(data, dict) else []
-            first_item = items[0] if items else None
-            embedding = first_item.get("embedding") if isinstance(first_item, dict) else None
-            if not isinstance(embedding, list) or not embedding:
-                raise RuntimeError(
-                    self._get_text(
-                        "dialog.model_config.error.invalid_embedding_response",
-                        "Embedding API returned an invalid response.",
-                    )
+        self._draft.embedding_validation_status = "verified"
+        self._draft.embedding_validation_message = ""
+        self._save_embedding_verification_timestamp(provider_id)
+
+    def _fail_embedding_connection_test(self, exc: Exception) -> None:
+        if self.logger:
+            self.logger.error(f"Embedding connection test failed: {exc}")
+        self._draft.embedding_validation_status = "failed"
+        self._draft.embedding_validation_message = str(exc)
+
+    def _embed_with_remote_provider(self, provider_id: str, text: str) -> Any:
+        if provider_id != "zhipu":
+            raise RuntimeError(
+                self._get_text(
+                    "dialog.model_config.error.embedding_test_not_supported",
+                    "Embedding connection testing is not implemented for this provider yet.",
                 )
-            self._draft.embedding_validation_status = "verified"
-            self._draft.embedding_validation_message = ""
-            self._save_embedding_verification_timestamp(provider_id)
-        except Exception as exc:
-            if self.logger:
-                self.logger.error(f"Embedding connection test failed: {exc}")
-            self._draft.embedding_validation_status = "failed"
-            self._draft.embedding_validation_message = str(exc)
-        self.emit_state()
+            )
+        headers = {}
+        api_key = self._draft.embedding_api_key.strip()
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        client = get_http_client_registry().bind(
+            self._draft.embedding_base_url.strip(),
+            headers=headers,
+            timeout=max(1, int(self._draft.embedding_timeout or DEFAULT_EMBEDDING_TIMEOUT)),
+        )
+        response = client.post(
+            json={
+                "input": [text],
+                "model": self._draft.embedding_model.strip() or None,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        items = data.get("data", []) if isinstance(data, dict) else []
+        first_item = items[0] if items else None
+        return first_item.get("embedding") if isinstance(first_item, dict) else None
+
+    async def _embed_with_local_backend(self, text: str) -> Any:
+        backend = DEFAULT_LOCAL_EMBEDDING_BACKEND
+        if self.config_manager:
+            backend = self.config_manager.get(CONFIG_EMBEDDING_LOCAL_BACKEND, backend) or backend
+        vectors = await get_local_embedding_backend(get_embedding_model_path(), backend).embed_async([text])
+        return vectors[0] if vectors else None
 
     def request_save(self) -> None:
         validation_error = self._validate()
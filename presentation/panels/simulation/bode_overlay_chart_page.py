@@ -5,6 +5,7 @@ import pyqtgraph as pg
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QSplitter, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget
 
+from domain.simulation.data.waveform_measurements import interpolate_at
 from presentation.panels.simulation.chart_measurement_point import MeasurementPointSample, MeasurementPointValue, clamp_to_bounds, midpoint_of_bounds, serialize_measurement_point_sample
 from presentation.panels.simulation.chart_export_utils import build_chart_export_payload, serialize_chart_series_for_web
 from presentation.panels.simulation.chart_view_types import ChartSeries, ChartSpec
@@ -705,9 +706,9 @@ class BodeOverlayChartPage(QWidget):
     def _sample_raw_series(self, series: ChartSeries, x_position: float) -> Optional[float]:
         x_data = self._to_view_axis_data(series.x_data, log_enabled=self._is_log_x())
         y_data = np.asarray(series.y_data, dtype=float)
-        if len(x_data) == 0 or len(y_data) == 0:
+        if len(x_data) == 0 or len(x_data) != len(y_data):
             return None
-        return float(np.interp(x_position, x_data, y_data))
+        return float(interpolate_at(x_data, y_data, x_position))
 
     def _sample_measurement_values(self, x_position: float) -> Dict[str, float]:
         values: Dict[str, float] = {}
@@ -795,7 +796,7 @@ class BodeOverlayChartPage(QWidget):
         unwrapped_rad = np.unwrap(np.radians(unique_phase))
         omega = 2.0 * np.pi * unique_x
         derivative = np.gradient(unwrapped_rad, omega)
-        return float(-np.interp(frequency_hz, unique_x, derivative))
+        return float(-interpolate_at(unique_x, derivative, frequency_hz))
 
     def _on_signal_item_changed(self, item: QTreeWidgetItem, column: int):
         if self._updating_tree or column != 0 or item is None:
@@ -5,6 +5,7 @@ import pyqtgraph as pg
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QSplitter, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget
 
+from domain.simulation.data.waveform_measurements import interpolate_at
 from presentation.panels.simulation.chart_axis_planner import ChartAxisPlan, apply_axis_plan, build_chart_axis_plan, resolve_axis_key, resolve_axis_label
 from presentation.panels.simulation.chart_measurement_point import MeasurementPointSample, MeasurementPointValue, clamp_to_bounds, midpoint_of_bounds, serialize_measurement_point_sample
 from presentation.panels.simulation.chart_export_utils import build_chart_export_payload, serialize_chart_series_for_web
@@ -593,9 +594,9 @@ class ChartPage(QWidget):
             if self._spec.log_x:
                 x_data = np.log10(np.maximum(x_data, 1e-30))
             y_data = np.asarray(series.y_data, dtype=float)
-            if len(x_data) == 0 or len(y_data) == 0:
+            if len(x_data) == 0 or len(x_data) != len(y_data):
                 continue
-            sampled[series.name] = float(np.interp(x_position, x_data, y_data))
+            sampled[series.name] = float(interpolate_at(x_data, y_data, x_position))
         return sampled
 
     def _to_display_x(self, x_position: Optional[float]) -> Optional[float]:
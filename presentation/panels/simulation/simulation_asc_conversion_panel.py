@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import QFileDialog, QMessageBox, QWidget
 from domain.simulation.spice.ltspice_asc_to_cir_transcriber import (
     AscBatchConversionExecution,
     LtspiceAscToCirTranscriber,
+    recommended_batch_workers,
 )
 
 
@@ -17,7 +18,8 @@ class SimulationAscConversionPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._project_root: Optional[Path] = None
-        self._transcriber = LtspiceAscToCirTranscriber()
+        # 转换器构造需加载内置库索引，推迟到首次转换（启动后由后台预热加载索引）
+        self._transcriber: Optional[LtspiceAscToCirTranscriber] = None
         self._selected_files_summary = ""
         self.retranslate_ui()
 
@@ -49,7 +51,13 @@ class SimulationAscConversionPanel(QWidget):
             return None
         self._selected_files_summary = f"已选择并转换 {len(file_paths)} 个 .asc 文件"
         output_root = self._project_root / self.OUTPUT_DIRECTORY_NAME
-        execution = self._transcriber.convert_files(file_paths, str(output_root))
+        if self._transcriber is None:
+            self._transcriber = LtspiceAscToCirTranscriber()
+        execution = self._transcriber.convert_files(
+            file_paths,
+            str(output_root),
+            max_workers=recommended_batch_workers(len(file_paths)),
+        )
         self._show_execution_result(execution)
         return execution
 
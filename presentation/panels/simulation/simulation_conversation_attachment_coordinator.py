@@ -1,7 +1,18 @@
 from pathlib import Path
 from typing import Any, List, Optional
 
-from domain.simulation.data.simulation_artifact_exporter import simulation_artifact_exporter
+from domain.simulation.data.simulation_artifact_exporter import (
+    CATEGORY_METRICS,
+    CATEGORY_OP_RESULT,
+    CATEGORY_OUTPUT_LOG,
+    simulation_artifact_exporter,
+)
+from domain.simulation.data.simulation_artifact_persistence import (
+    EXPORT_STATUS_PENDING,
+    EXPORT_STATUS_READY,
+    EXPORT_STATUS_RUNNING,
+    ensure_bundle_categories,
+)
 from domain.simulation.models.simulation_result import SimulationResult
 from shared.event_types import (
     EVENT_UI_ACTIVATE_CONVERSATION_TAB,
@@ -11,6 +22,11 @@ from shared.service_locator import ServiceLocator
 from shared.service_names import SVC_EVENT_BUS
 
 
+# Attachments are requested from UI slots: wait only briefly for a
+# category the background job is still writing.
+ATTACHMENT_EXPORT_WAIT_SECONDS = 2.0
+
+
 class SimulationConversationAttachmentCoordinator:
     def __init__(self, chart_viewer, waveform_widget):
         self._chart_viewer = chart_viewer
@@ -39,8 +55,13 @@ class SimulationConversationAttachmentCoordinator:
         re-export on every call (even if a stale file already exists)
         so the agent never sees outdated target strings after the user
         tweaks them between simulation runs.
+
+        A deferred background export of the same category is waited for
+        first (briefly, see ``ATTACHMENT_EXPORT_WAIT_SECONDS``) so the two
+        writers never overlap.
         """
         root = self._resolve_export_root(project_root, export_root, result)
+        self._ensure_category(root, CATEGORY_METRICS, result)
         simulation_artifact_exporter.export_metrics(root, result, metrics)
         target_path = simulation_artifact_exporter.metrics_paths(root).json_path
         self._ensure_file(target_path)
@@ -54,8 +75,9 @@ class SimulationConversationAttachmentCoordinator:
         result: SimulationResult,
     ) -> str:
         root = self._resolve_export_root(project_root, export_root, result)
+        status = self._ensure_category(root, CATEGORY_OUTPUT_LOG, result)
         target_path = simulation_artifact_exporter.output_log_paths(root).text_path
-        if not target_path.is_file():
+        if status != EXPORT_STATUS_READY or not target_path.is_file():
             simulation_artifact_exporter.export_output_log(root, result)
         self._ensure_file(target_path)
         self._publish([str(target_path)])
@@ -68,10 +90,11 @@ class SimulationConversationAttachmentCoordinator:
         result: SimulationResult,
     ) -> str:
         root = self._resolve_export_root(project_root, export_root, result)
+        status = self._ensure_category(root, CATEGORY_OP_RESULT, result)
         op_paths = simulation_artifact_exporter.op_result_paths(root)
         text_path = op_paths.text_path
         json_path = op_paths.json_path
-        if not text_path.is_file() or not json_path.is_file():
+        if status != EXPORT_STATUS_READY or not text_path.is_file() or not json_path.is_file():
             simulation_artifact_exporter.export_op_result(root, result)
         self._ensure_file(text_path)
         self._ensure_file(json_path)
@@ -126,6 +149,22 @@ class SimulationConversationAttachmentCoordinator:
             raise ValueError("Project export root is unavailable")
         return simulation_artifact_exporter.create_project_export_root(project_root, result)
 
+    def _ensure_category(self, root: Path, category: str, result: SimulationResult) -> str:
+        """Wait for (or run) the bundle's deferred export of ``category``.
+
+        The exporter writes files in place, so a file can exist while
+        the background job is still writing it. A category still being
+        written after ``ATTACHMENT_EXPORT_WAIT_SECONDS`` raises instead
+        of blocking the UI; any other status (including ``failed``) is
+        returned so the caller can fall back to a synchronous export.
+        """
+        status = ensure_bundle_categories(
+            root, [category], result=result, timeout=ATTACHMENT_EXPORT_WAIT_SECONDS
+        )[category]
+        if status in (EXPORT_STATUS_PENDING, EXPORT_STATUS_RUNNING):
+            raise RuntimeError(f"Bundle category '{category}' is still exporting, try again shortly")
+        return status
+
     def _ensure_file(self, path: Path) -> None:
         if not path.is_file():
             raise FileNotFoundError(str(path))
@@ -138,4 +177,4 @@ class SimulationConversationAttachmentCoordinator:
         self.event_bus.publish(EVENT_UI_ACTIVATE_CONVERSATION_TAB, {})
 
 
-__all__ = ["SimulationConversationAttachmentCoordinator"]
+__all__ = ["ATTACHMENT_EXPORT_WAIT_SECONDS", "SimulationConversationAttachmentCoordinator"]
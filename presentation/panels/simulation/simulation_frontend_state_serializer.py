@@ -670,12 +670,35 @@ class SimulationFrontendStateSerializer:
                     latest,
                     current_result_path="",
                 ),
+                "comparison_result_paths": self._comparison_result_paths(group),
             })
         return {
             "items": items,
             "selected_circuit_file": normalized_displayed,
         }
 
+    @staticmethod
+    def _comparison_result_paths(group: CircuitResultGroup) -> List[str]:
+        """Runs of a circuit card that can be overlaid in the waveform tab.
+
+        Only successful runs sharing the newest run's analysis type are
+        comparable (a transient overlay cannot mix with an AC sweep), and
+        an operating point has no waveform at all. Fewer than two runs
+        leaves nothing to compare, so the card hides its compare action.
+        """
+        latest = group.results[0]
+        analysis_type = str(latest.analysis_type or "").strip().lower()
+        if analysis_type in ("", "op"):
+            return []
+        paths = [
+            summary.result_path
+            for summary in group.results
+            if summary.success
+            and summary.result_path
+            and str(summary.analysis_type or "").strip().lower() == analysis_type
+        ]
+        return paths if len(paths) >= 2 else []
+
     @staticmethod
     def _derive_circuit_display_name(circuit_file: str) -> str:
         """Human-readable label for a circuit card.
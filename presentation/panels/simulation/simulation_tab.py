@@ -21,6 +21,7 @@
 
 import copy
 import logging
+import threading
 from pathlib import Path
 from typing import List, Optional
 
@@ -38,6 +39,7 @@ from presentation.panels.simulation.simulation_view_model import (
     SimulationStatus,
     DisplayMetric,
 )
+from domain.simulation.data.waveform_comparison import waveform_comparison_service
 from domain.simulation.service.simulation_result_repository import (
     CircuitResultGroup,
     SimulationResultSummary,
@@ -84,6 +86,8 @@ class SimulationTab(QWidget):
     raw_data_document_changed = pyqtSignal(dict)
     raw_data_viewport_changed = pyqtSignal(dict)
     raw_data_copy_result_changed = pyqtSignal(dict)
+    # 后台比较线程完成后回到 UI 线程：(请求序号, 比较结果或 None, 信号名)
+    _comparison_finished = pyqtSignal(int, object, str)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -130,6 +134,9 @@ class SimulationTab(QWidget):
         self._authoritative_raw_data_document = self._state_serializer.serialize_raw_data_document()
         self._authoritative_raw_data_viewport = self._state_serializer.serialize_raw_data_viewport()
         self._raw_data_copy_sequence = 0
+        # 跨结果比较请求序号；只应用最新一次请求的结果
+        self._comparison_sequence = 0
+        self._pending_comparison_paths: List[str] = []
         self._authoritative_raw_data_copy_result = self._state_serializer.serialize_raw_data_copy_result()
         # Step 9 — single by-circuit aggregated result-index cache.
         # The shared data source feeding the Step 11 circuit-selection
@@ -203,6 +210,7 @@ class SimulationTab(QWidget):
         self._backend_runtime.spice_schematic_document.schematic_write_result_changed.connect(
             self._on_runtime_schematic_write_result_changed
         )
+        self._comparison_finished.connect(self._on_comparison_finished)
 
     def get_authoritative_frontend_state(self):
         return copy.deepcopy(self._authoritative_frontend_state)
@@ -380,6 +388,7 @@ class SimulationTab(QWidget):
             ("simulation.circuit_selection.latest_failed", "Latest Failed"),
             ("simulation.circuit_selection.not_loadable", "Not Loadable"),
             ("simulation.circuit_selection.unnamed_circuit", "Unnamed Circuit"),
+            ("simulation.circuit_selection.compare_runs", "Compare {count} runs"),
             ("simulation.metrics.confirm_changes", "Confirm Changes"),
             ("simulation.metrics.empty_title", "No Metrics"),
             ("simulation.metrics.empty_hint", "Add `.MEASURE` statements to the SPICE file and run a simulation to generate metrics."),
@@ -432,6 +441,11 @@ class SimulationTab(QWidget):
             ("simulation.waveform.measurement_empty", "No measurement values are available for the selected signal."),
             ("simulation.waveform.empty_hidden", "No waveform is currently displayed. Select signals from the left sidebar."),
             ("simulation.waveform.empty_no_waveform", "No waveform is available for the current result."),
+            ("simulation.waveform.comparison_title", "{signal} · {count} runs"),
+            ("simulation.waveform.comparison_mean", "Mean"),
+            ("simulation.waveform.comparison_lower", "Min"),
+            ("simulation.waveform.comparison_upper", "Max"),
+            ("simulation.waveform.comparison_skipped", "{count} skipped"),
             ("simulation.output_log.keyword", "Keyword"),
             ("simulation.output_log.search_placeholder", "Enter search keyword"),
             ("simulation.output_log.apply_filter", "Apply Filter"),
@@ -951,6 +965,7 @@ class SimulationTab(QWidget):
         self._bound_web_bridge = bridge
         bridge.activate_tab_requested.connect(self.activate_result_tab)
         bridge.load_result_by_path_requested.connect(self.load_result_by_path)
+        bridge.compare_results_by_path_requested.connect(self.compare_results_by_path)
         bridge.schematic_value_update_requested.connect(self._on_schematic_value_update_requested)
         bridge.raw_data_viewport_requested.connect(self._on_raw_data_viewport_requested)
         bridge.raw_data_copy_requested.connect(self._on_raw_data_copy_requested)
@@ -1504,6 +1519,86 @@ class SimulationTab(QWidget):
         self._displayed_circuit_file = str(getattr(load_result.data, "file_path", "") or "")
         self._render_result(load_result.data, activate_op_tab=False)
         return True
+
+    def compare_results_by_path(self, result_paths: List[str]) -> bool:
+        """Overlay several persisted runs of one signal in the waveform tab.
+
+        Unless the panel is already showing one of the compared
+        bundles, the first path is loaded through
+        :meth:`load_result_by_path` first, so the displayed triple, the
+        signal catalog and any export all refer to a run that is part
+        of the comparison; that displayed run is also the reference.
+        The compared signal is the first displayed waveform signal
+        (after that load, the default signal).
+
+        ``waveform_comparison_service.compare`` reads every bundle, so
+        it runs on a worker thread; the result is applied on the UI
+        thread by :meth:`_on_comparison_finished`, and only if no newer
+        comparison was requested and the displayed run is still one of
+        the compared bundles.
+
+        Returns ``True`` iff the comparison was started.
+        """
+        paths = [str(path) for path in result_paths or () if path]
+        if not self._project_root or len(paths) < 2:
+            return False
+        waveform_widget = self._backend_runtime.waveform_widget
+        if self._displayed_result_path not in paths or not waveform_widget.get_displayed_signal_names():
+            if not self.load_result_by_path(paths[0]):
+                return False
+        signal_names = waveform_widget.get_displayed_signal_names()
+        if not signal_names:
+            return False
+        reference = paths.index(self._displayed_result_path) if self._displayed_result_path in paths else 0
+        self._comparison_sequence += 1
+        self._pending_comparison_paths = paths
+        threading.Thread(
+            target=self._run_comparison,
+            args=(self._comparison_sequence, self._project_root, paths, signal_names[0], reference),
+            name="waveform-comparison",
+            daemon=True,
+        ).start()
+        return True
+
+    def _run_comparison(
+        self,
+        sequence: int,
+        project_root: str,
+        paths: List[str],
+        signal_name: str,
+        reference: int,
+    ) -> None:
+        """工作线程：读取各结果包并重采样，结果经信号送回 UI 线程"""
+        comparison = None
+        try:
+            comparison = waveform_comparison_service.compare(
+                project_root,
+                paths,
+                [signal_name],
+                reference=reference,
+            ).get(signal_name)
+        except Exception as exc:
+            self._logger.warning(f"Failed to compare simulation results: {exc}")
+        try:
+            self._comparison_finished.emit(sequence, comparison, signal_name)
+        except RuntimeError:
+            # 比较期间面板已销毁
+            pass
+
+    def _on_comparison_finished(self, sequence: int, comparison, signal_name: str) -> None:
+        """UI 线程：应用后台比较结果"""
+        if sequence != self._comparison_sequence:
+            return
+        paths, self._pending_comparison_paths = self._pending_comparison_paths, []
+        if self._displayed_result_path not in paths:
+            # 比较期间已切换到其它结果，丢弃
+            return
+        waveform_widget = self._backend_runtime.waveform_widget
+        if comparison is None or not waveform_widget.load_comparison(comparison):
+            self._logger.warning(f"No comparable runs for signal {signal_name}")
+            return
+        self._active_frontend_tab = "waveform"
+        self._update_frontend_payloads()
     
     def retranslate_ui(self):
         """重新翻译 UI 文本"""
@@ -11,6 +11,7 @@ class SimulationWebBridge(QObject):
     ready = pyqtSignal()
     activate_tab_requested = pyqtSignal(str)
     load_result_by_path_requested = pyqtSignal(str)
+    compare_results_by_path_requested = pyqtSignal(list)
     schematic_value_update_requested = pyqtSignal(dict)
     raw_data_viewport_requested = pyqtSignal(dict)
     raw_data_copy_requested = pyqtSignal(dict)
@@ -53,6 +54,13 @@ class SimulationWebBridge(QObject):
     def loadResultByPath(self, result_path: str) -> None:
         self.load_result_by_path_requested.emit(str(result_path or ""))
 
+    @pyqtSlot(QJsonValue)
+    @pyqtSlot(list)
+    def compareResultsByPath(self, result_paths: Any) -> None:
+        normalized = self._normalize_result_paths(result_paths)
+        if len(normalized) >= 2:
+            self.compare_results_by_path_requested.emit(normalized)
+
     @pyqtSlot(QJsonValue)
     @pyqtSlot(dict)
     def updateSchematicValue(self, payload: Any) -> None:
@@ -216,6 +224,18 @@ class SimulationWebBridge(QObject):
         allowed = {"metrics", "chart", "waveform", "output_log", "op_result"}
         return normalized if normalized in allowed else "metrics"
 
+    def _normalize_result_paths(self, payload: Any) -> List[str]:
+        if isinstance(payload, QJsonValue):
+            payload = payload.toVariant()
+        if not isinstance(payload, (list, tuple)):
+            return []
+        normalized: List[str] = []
+        for item in payload:
+            path = str(item or "").strip()
+            if path and path not in normalized:
+                normalized.append(path)
+        return normalized
+
     def _normalize_metric_targets_payload(self, payload: Any) -> Optional[Dict[str, Any]]:
         if isinstance(payload, QJsonValue):
             payload = payload.toVariant()
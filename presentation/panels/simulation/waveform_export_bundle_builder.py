@@ -1,8 +1,10 @@
 import json
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Mapping, Sequence
 
 from domain.simulation.data.simulation_artifact_exporter import simulation_artifact_exporter
+from domain.simulation.data.waveform_comparison import WaveformComparison
 from domain.simulation.models.simulation_result import SimulationResult
 
 
@@ -128,6 +130,84 @@ class WaveformExportBundleBuilder:
 
         return exported_files
 
+    def export_comparison_bundle(
+        self,
+        output_dir: str,
+        result: SimulationResult,
+        comparison: WaveformComparison,
+        export_image: Callable[[str], bool],
+    ) -> List[str]:
+        """Export a cross-run comparison into the canonical waveform files.
+
+        The CSV holds the shared grid with the mean / std / envelope
+        columns followed by one resampled column per run; the JSON
+        records which bundles took part and their per-run statistics.
+        ``result`` only supplies the linkage metadata.
+        """
+        target_dir = Path(output_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        canonical_waveform_paths = simulation_artifact_exporter.waveforms_paths(target_dir.parent)
+
+        exported_files: List[str] = []
+        image_path = target_dir / canonical_waveform_paths.image_path.name
+        csv_path = target_dir / canonical_waveform_paths.csv_path.name
+        json_path = target_dir / canonical_waveform_paths.json_path.name
+        file_map: Dict[str, str] = {}
+
+        if export_image(str(image_path)):
+            simulation_artifact_exporter.inject_png_linkage(image_path, result, "waveforms")
+            exported_files.append(str(image_path))
+            file_map["image"] = image_path.name
+
+        run_columns = [f"{comparison.signal_name} [{run.label}]" for run in comparison.runs]
+        headers = [comparison.x_label, "mean", "std", "lower", "upper", *run_columns]
+        row_count = simulation_artifact_exporter.write_csv_columns_with_header(
+            csv_path,
+            result,
+            "waveforms",
+            headers,
+            [comparison.x, comparison.mean, comparison.std, comparison.lower, comparison.upper, *comparison.values],
+            blank_non_finite=[True] * len(headers),
+        )
+        exported_files.append(str(csv_path))
+        file_map["csv"] = csv_path.name
+
+        file_map["json"] = json_path.name
+        payload = simulation_artifact_exporter.build_artifact_payload(
+            result,
+            "waveforms",
+            summary={
+                "signal_count": 1,
+                "row_count": row_count,
+                "run_count": comparison.run_count,
+                "measurement_enabled": False,
+            },
+            files=file_map,
+            data={
+                "columns": headers,
+                "comparison": {
+                    "signal_name": comparison.signal_name,
+                    "reference_index": comparison.reference_index,
+                    "runs": [
+                        {
+                            "bundle_id": run.bundle_id,
+                            "label": run.label,
+                            "signal_name": run.signal_name,
+                            "point_count": run.point_count,
+                            "column": column,
+                        }
+                        for run, column in zip(comparison.runs, run_columns)
+                    ],
+                    "skipped": dict(comparison.skipped),
+                    "run_statistics": [asdict(stats) for stats in comparison.run_statistics()],
+                },
+            },
+        )
+        json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        exported_files.append(str(json_path))
+
+        return exported_files
+
 
 waveform_export_bundle_builder = WaveformExportBundleBuilder()
 
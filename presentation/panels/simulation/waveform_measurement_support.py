@@ -1,8 +1,9 @@
-from typing import Callable, Dict, List, Mapping, Optional
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
 
 import numpy as np
 
 from domain.simulation.data.waveform_data_service import WaveformDataService
+from domain.simulation.data.waveform_measurements import interpolate_columns
 from domain.simulation.models.simulation_result import SimulationResult
 from presentation.panels.simulation.waveform_plot_types import PlotItem, WaveformMeasurement
 
@@ -15,13 +16,25 @@ class WaveformMeasurementSupport:
         plot_items: Mapping[str, PlotItem],
         x: float,
     ) -> Dict[str, float]:
-        result: Dict[str, float] = {}
-        if current_result is None:
-            return result
+        return self.get_all_y_at_xs(current_result, data_service, plot_items, [x])[0]
+
+    def get_all_y_at_xs(
+        self,
+        current_result: Optional[SimulationResult],
+        data_service: WaveformDataService,
+        plot_items: Mapping[str, PlotItem],
+        xs: Sequence[float],
+    ) -> List[Dict[str, float]]:
+        """所有信号在多个 x 处的插值：区间查找只做一次，各信号共用"""
+        results: List[Dict[str, float]] = [{} for _ in xs]
+        if current_result is None or not xs:
+            return results
         x_data = current_result.get_x_axis_data()
         if x_data is None or len(x_data) == 0:
-            return result
+            return results
         x_array = np.asarray(x_data, dtype=float)
+        names: List[str] = []
+        rows: List[np.ndarray] = []
         for signal_name in plot_items:
             y_data = data_service.get_signal_data(current_result, signal_name)
             if y_data is None:
@@ -29,11 +42,15 @@ class WaveformMeasurementSupport:
             y_array = np.asarray(y_data, dtype=float)
             if len(y_array) == 0 or len(y_array) != len(x_array):
                 continue
-            try:
-                result[signal_name] = float(np.interp(x, x_array, y_array))
-            except Exception:
-                continue
-        return result
+            names.append(signal_name)
+            rows.append(y_array)
+        if not rows:
+            return results
+        values = interpolate_columns(x_array, rows, np.asarray(xs, dtype=float))
+        for row_index, signal_name in enumerate(names):
+            for x_index, value in enumerate(values[row_index].tolist()):
+                results[x_index][signal_name] = value
+        return results
 
     def build_measurement(
         self,
@@ -48,14 +65,19 @@ class WaveformMeasurementSupport:
 
         if cursor_a_pos is not None:
             measurement.cursor_a_x = from_view_x_value(cursor_a_pos)
-            all_y_a = self.get_all_y_at_x(current_result, data_service, plot_items, measurement.cursor_a_x)
+        if cursor_b_pos is not None:
+            measurement.cursor_b_x = from_view_x_value(cursor_b_pos)
+        cursor_xs = [x for x in (measurement.cursor_a_x, measurement.cursor_b_x) if x is not None]
+        sampled = iter(self.get_all_y_at_xs(current_result, data_service, plot_items, cursor_xs))
+
+        if measurement.cursor_a_x is not None:
+            all_y_a = next(sampled)
             measurement.signal_values_a = all_y_a
             if all_y_a:
                 measurement.cursor_a_y = next(iter(all_y_a.values()))
 
-        if cursor_b_pos is not None:
-            measurement.cursor_b_x = from_view_x_value(cursor_b_pos)
-            all_y_b = self.get_all_y_at_x(current_result, data_service, plot_items, measurement.cursor_b_x)
+        if measurement.cursor_b_x is not None:
+            all_y_b = next(sampled)
             measurement.signal_values_b = all_y_b
             if all_y_b:
                 measurement.cursor_b_y = next(iter(all_y_b.values()))
@@ -7,6 +7,7 @@
 - 支持框选放大、Fit 全显示、双光标测量
 - 支持多信号叠加显示
 - 动态加载不同分辨率数据
+- 跨结果比较模式：多次运行叠加、均值与包络（load_comparison）
 
 技术选型：
 - pyqtgraph.PlotWidget：纯 Qt 实现，高性能
@@ -20,6 +21,9 @@
     widget.load_waveform(result, "V(out)")
     widget.add_waveform(result, "V(in)")
     
+    # 跨结果比较（数据由 WaveformComparisonService 提供）
+    widget.load_comparison(comparisons["V(out)"])
+    
     # 设置测量光标
     widget.set_cursor_a(0.001)
     widget.set_cursor_b(0.002)
@@ -41,6 +45,7 @@ from PyQt6.QtWidgets import (
 import numpy as np
 import pyqtgraph as pg
 
+from domain.simulation.data.waveform_comparison import WaveformComparison
 from domain.simulation.data.waveform_data_service import (
     WaveformDataService,
     waveform_data_service,
@@ -59,6 +64,7 @@ from presentation.panels.simulation.waveform_plot_types import (
 from presentation.panels.simulation.waveform_viewport_manager import WaveformViewportManager
 from presentation.panels.simulation.ltspice_plot_interaction import (
     clamp_range,
+    finite_range,
 )
 
 from resources.theme import COLOR_BG_PRIMARY
@@ -68,6 +74,12 @@ from resources.theme import COLOR_BG_PRIMARY
 # 常量定义
 # ============================================================
 
+# 比较模式：单条运行曲线的透明度（0-255），多次运行叠加时保持可辨
+COMPARISON_RUN_ALPHA = 70
+
+# 比较模式 Web 快照：每条运行曲线至少保留的点数
+COMPARISON_SNAPSHOT_MIN_RUN_POINTS = 64
+
 
 # ============================================================
 # 数据类定义
@@ -130,6 +142,10 @@ class WaveformWidget(QWidget):
         self._signal_types: Dict[str, str] = {}
         self._measurement_cache: Optional[WaveformMeasurement] = None
         
+        # 比较模式：全部运行合并为一个绘图项，另有均值线与包络
+        self._comparison: Optional[WaveformComparison] = None
+        self._comparison_items: Dict[str, Any] = {}
+        
         # 初始化 UI
         self._setup_ui()
         self._setup_plot()
@@ -247,6 +263,9 @@ class WaveformWidget(QWidget):
         if result_signature != self._current_result_signature:
             self._clear_displayed_waveforms(preserve_result_context=True)
             self._set_result_context(result)
+        elif self._comparison is not None:
+            # 单信号与比较叠加不混合显示，添加信号即退出比较模式
+            self._clear_displayed_waveforms(preserve_result_context=True)
         
         waveform_data = self._data_service.get_initial_data(
             result,
@@ -308,6 +327,61 @@ class WaveformWidget(QWidget):
         )
         return True
     
+    def load_comparison(self, comparison: WaveformComparison) -> bool:
+        """
+        加载跨结果比较（替换当前显示）
+        
+        全部运行绘制为一个以 NaN 断开的 PlotDataItem，另绘制均值线
+        与 min/max 包络；缩放时按视口重新抽取，绘图项数量不随运行数增长。
+        保留当前结果上下文：信号目录照常可选（选中信号即退出比较模式），
+        导出时以其作为元数据来源。
+        
+        Args:
+            comparison: WaveformComparisonService 返回的比较结果
+            
+        Returns:
+            bool: 是否加载成功
+        """
+        self._clear_displayed_waveforms(preserve_result_context=True)
+        if comparison is None or comparison.run_count == 0 or len(comparison.x) == 0:
+            return False
+
+        self._comparison = comparison
+        plot_item = self._plot_widget.getPlotItem()
+        plot_item.setLabel('bottom', comparison.x_label)
+        plot_item.setLogMode(x=comparison.log_x, y=False)
+
+        runs_color = pg.mkColor(SIGNAL_COLORS[0])
+        runs_color.setAlpha(COMPARISON_RUN_ALPHA)
+        envelope_color = pg.mkColor(SIGNAL_COLORS[1])
+        envelope_color.setAlpha(60)
+
+        lower_item = pg.PlotDataItem(pen=pg.mkPen(color=envelope_color, width=1))
+        upper_item = pg.PlotDataItem(pen=pg.mkPen(color=envelope_color, width=1))
+        self._comparison_items = {
+            "runs": pg.PlotDataItem(
+                pen=pg.mkPen(color=runs_color, width=1),
+                connect="finite",
+                name=f"{comparison.signal_name} × {comparison.run_count}",
+            ),
+            "lower": lower_item,
+            "upper": upper_item,
+            "envelope": pg.FillBetweenItem(lower_item, upper_item, brush=pg.mkBrush(envelope_color)),
+            "mean": pg.PlotDataItem(
+                pen=pg.mkPen(color=SIGNAL_COLORS[1], width=1.6),
+                name=f"{comparison.signal_name} (mean)",
+            ),
+        }
+        for item in self._comparison_items.values():
+            plot_item.addItem(item)
+
+        self._refresh_legend()
+        self.fit_to_view()
+        return True
+
+    def get_comparison(self) -> Optional[WaveformComparison]:
+        return self._comparison
+
     def remove_waveform(self, signal_name: str) -> bool:
         """
         移除波形
@@ -444,13 +518,20 @@ class WaveformWidget(QWidget):
         return self._measurement_cache
 
     def export_image(self, path: str) -> bool:
-        if self._current_result is None or not self._plot_items:
+        if self._comparison is None and (self._current_result is None or not self._plot_items):
             return False
         return export_widget_image(self, self._plot_widget, path)
 
     def export_bundle(self, output_dir: str) -> List[str]:
         if self._current_result is None:
             return []
+        if self._comparison is not None:
+            return waveform_export_bundle_builder.export_comparison_bundle(
+                output_dir,
+                self._current_result,
+                self._comparison,
+                self.export_image,
+            )
 
         measurement = self.get_measurement()
         signal_names = self.get_displayed_signal_names()
@@ -546,11 +627,56 @@ class WaveformWidget(QWidget):
                 "values_a": {name: float(value) for name, value in (measurement.signal_values_a or {}).items()},
                 "values_b": {name: float(value) for name, value in (measurement.signal_values_b or {}).items()},
             },
-            "can_export": bool(self._current_result is not None and self._plot_items),
+            "can_export": bool(
+                self._current_result is not None and (self._plot_items or self._comparison is not None)
+            ),
             "can_add_to_conversation": bool(self._plot_items),
+            "comparison": self._build_comparison_snapshot(max_points),
+        }
+
+    def _build_comparison_snapshot(self, max_points: int) -> Optional[Dict[str, Any]]:
+        comparison = self._comparison
+        if comparison is None:
+            return None
+        x_range = None
+        if self._viewport_active and self._view_x_range is not None:
+            x_range = (
+                self._from_view_x_value(self._view_x_range[0]),
+                self._from_view_x_value(self._view_x_range[1]),
+            )
+        target_points = max_points if max_points > 0 else VIEWPORT_POINTS
+        overlay = comparison.overlay(*(x_range or (None, None)), target_points=target_points)
+        # 各运行分摊点数预算（每条不少于 COMPARISON_SNAPSHOT_MIN_RUN_POINTS 点）
+        run_points = max(target_points // comparison.run_count, COMPARISON_SNAPSHOT_MIN_RUN_POINTS)
+        run_overlay = overlay if run_points >= target_points else comparison.overlay(
+            *(x_range or (None, None)),
+            target_points=run_points,
+        )
+        runs_x, runs_y = run_overlay.flattened_runs()
+        return {
+            "signal_name": comparison.signal_name,
+            "run_count": comparison.run_count,
+            "run_color": _css_rgba(SIGNAL_COLORS[0], COMPARISON_RUN_ALPHA),
+            "mean_color": SIGNAL_COLORS[1],
+            # 运行之间以 null 断开（JSON 不支持 NaN）
+            "runs_x": _json_floats(runs_x),
+            "runs_y": _json_floats(runs_y),
+            "runs": [
+                {"bundle_id": run.bundle_id, "label": run.label, "signal_name": run.signal_name}
+                for run in comparison.runs
+            ],
+            "skipped": dict(comparison.skipped),
+            "reference_index": comparison.reference_index,
+            "x": [float(value) for value in overlay.envelope_x],
+            "mean": [float(value) for value in overlay.mean],
+            "lower": [float(value) for value in overlay.lower],
+            "upper": [float(value) for value in overlay.upper],
+            "source_points": overlay.source_points,
         }
 
     def _get_x_axis_label(self) -> str:
+        if self._comparison is not None:
+            return self._comparison.x_label
         if self._current_result is None:
             return "X"
         return self._current_result.get_x_axis_label()
@@ -583,6 +709,16 @@ class WaveformWidget(QWidget):
         }
 
     def fit_to_view(self):
+        if self._comparison is not None:
+            self._render_comparison(None)
+            self._x_domain = finite_range(self._to_view_x_data(self._comparison.x))
+            self._left_y_domain = finite_range(
+                np.concatenate((self._comparison.lower, self._comparison.upper))
+            )
+            self._right_y_domain = None
+            self._apply_full_viewport()
+            self._measurement_cache = None
+            return
         if self._current_result is None or not self._plot_items:
             return
 
@@ -600,7 +736,8 @@ class WaveformWidget(QWidget):
         self.fit_to_view()
 
     def set_viewport(self, viewport: Dict[str, Any]) -> bool:
-        if self._current_result is None or not self._plot_items or self._x_domain is None:
+        has_content = self._comparison is not None or (self._current_result is not None and self._plot_items)
+        if not has_content or self._x_domain is None:
             return False
         view_x_min = self._to_view_x_value(float(viewport.get("x_min")))
         view_x_max = self._to_view_x_value(float(viewport.get("x_max")))
@@ -626,19 +763,40 @@ class WaveformWidget(QWidget):
                 (float(viewport.get("right_y_min")), float(viewport.get("right_y_max"))),
                 self._right_y_domain,
             )
-        self._viewport_manager.reload_viewport_data(
-            self._current_result,
-            self._plot_items,
-            clamped_x_range,
-            self._from_view_x_value,
-            VIEWPORT_POINTS,
-        )
+        if self._comparison is not None:
+            self._render_comparison(clamped_x_range)
+        else:
+            self._viewport_manager.reload_viewport_data(
+                self._current_result,
+                self._plot_items,
+                clamped_x_range,
+                self._from_view_x_value,
+                VIEWPORT_POINTS,
+            )
         self._viewport_active = True
         self._apply_domain_limits()
         self._apply_viewport(clamped_x_range, left_y_range, right_y_range)
         self._measurement_cache = None
         return True
 
+    def _render_comparison(self, view_x_range: Optional[Tuple[float, float]]):
+        """按视口（视图坐标）重新抽取比较叠加数据"""
+        if self._comparison is None or not self._comparison_items:
+            return
+        if view_x_range is None:
+            overlay = self._comparison.overlay(target_points=INITIAL_POINTS)
+        else:
+            overlay = self._comparison.overlay(
+                self._from_view_x_value(view_x_range[0]),
+                self._from_view_x_value(view_x_range[1]),
+                target_points=VIEWPORT_POINTS,
+            )
+        runs_x, runs_y = overlay.flattened_runs()
+        self._comparison_items["runs"].setData(runs_x, runs_y, connect="finite")
+        self._comparison_items["lower"].setData(overlay.envelope_x, overlay.lower)
+        self._comparison_items["upper"].setData(overlay.envelope_x, overlay.upper)
+        self._comparison_items["mean"].setData(overlay.envelope_x, overlay.mean)
+
     def _get_result_signature(self, result: Optional[SimulationResult]) -> Optional[Tuple[str, str, str]]:
         if result is None:
             return None
@@ -673,6 +831,10 @@ class WaveformWidget(QWidget):
                 self._plot_widget.getPlotItem().removeItem(plot_item.plot_data_item)
 
         self._plot_items.clear()
+        for item in self._comparison_items.values():
+            self._plot_widget.getPlotItem().removeItem(item)
+        self._comparison_items = {}
+        self._comparison = None
         self._color_index = 0
         self._measurement_cache = None
         self._x_domain = None
@@ -695,6 +857,8 @@ class WaveformWidget(QWidget):
             self._plot_widget.getPlotItem().setLogMode(x=False, y=False)
 
     def _is_log_x_enabled(self) -> bool:
+        if self._comparison is not None:
+            return self._comparison.log_x
         return self._current_result is not None and self._current_result.is_x_axis_log()
 
     def _to_view_x_data(self, values: np.ndarray) -> np.ndarray:
@@ -731,6 +895,10 @@ class WaveformWidget(QWidget):
 
         for signal_name, plot_item in self._plot_items.items():
             self._legend.addItem(plot_item.plot_data_item, signal_name)
+        for key in ("runs", "mean"):
+            item = self._comparison_items.get(key)
+            if item is not None:
+                self._legend.addItem(item, item.name())
 
     def _rebuild_domains(self):
         self._x_domain, self._left_y_domain, self._right_y_domain = self._viewport_manager.rebuild_domains(
@@ -853,6 +1021,19 @@ class WaveformWidget(QWidget):
             return text
 
 
+# ============================================================
+# 快照辅助函数
+# ============================================================
+
+def _css_rgba(color: str, alpha: int) -> str:
+    qcolor = pg.mkColor(color)
+    return f"rgba({qcolor.red()}, {qcolor.green()}, {qcolor.blue()}, {alpha / 255:.3f})"
+
+
+def _json_floats(values: np.ndarray) -> List[Optional[float]]:
+    return [float(value) if np.isfinite(value) else None for value in values]
+
+
 # ============================================================
 # 模块导出
 # ============================================================
@@ -1,41 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const o of document.querySelectorAll('link[rel="modulepreload"]'))r(o);new MutationObserver(o=>{for(const s of o)if(s.type==="childList")for(const i of s.addedNodes)i.tagName==="LINK"&&i.rel==="modulepreload"&&r(i)}).observe(document,{childList:!0,subtree:!0});function n(o){const s={};return o.integrity&&(s.integrity=o.integrity),o.referrerPolicy&&(s.referrerPolicy=o.referrerPolicy),o.crossOrigin==="use-credentials"?s.credentials="include":o.crossOrigin==="anonymous"?s.credentials="omit":s.credentials="same-origin",s}function r(o){if(o.ep)return;o.ep=!0;const s=n(o);fetch(o.href,s)}})();var ed={exports:{}},Xs={},td={exports:{}},ee={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var uo=Symbol.for("react.element"),Yp=Symbol.for("react.portal"),Wp=Symbol.for("react.fragment"),Up=Symbol.for("react.strict_mode"),Hp=Symbol.for("react.profiler"),Vp=Symbol.for("react.provider"),Gp=Symbol.for("react.context"),Kp=Symbol.for("react.forward_ref"),Qp=Symbol.for("react.suspense"),Zp=Symbol.for("react.memo"),qp=Symbol.for("react.lazy"),Ja=Symbol.iterator;function Jp(e){return e===null||typeof e!="object"?null:(e=Ja&&e[Ja]||e["@@iterator"],typeof e=="function"?e:null)}var nd={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},rd=Object.assign,od={};function ur(e,t,n){this.props=e,this.context=t,this.refs=od,this.updater=n||nd}ur.prototype.isReactComponent={};ur.prototype.setState=function(e,t){if(typeof e!="object"&&typeof e!="function"&&e!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")};ur.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")};function sd(){}sd.prototype=ur.prototype;function ea(e,t,n){this.props=e,this.context=t,this.refs=od,this.updater=n||nd}var ta=ea.prototype=new sd;ta.constructor=ea;rd(ta,ur.prototype);ta.isPureReactComponent=!0;var eu=Array.isArray,id=Object.prototype.hasOwnProperty,na={current:null},ld={key:!0,ref:!0,__self:!0,__source:!0};function ad(e,t,n){var r,o={},s=null,i=null;if(t!=null)for(r in t.ref!==void 0&&(i=t.ref),t.key!==void 0&&(s=""+t.key),t)id.call(t,r)&&!ld.hasOwnProperty(r)&&(o[r]=t[r]);var l=arguments.length-2;if(l===1)o.children=n;else if(1<l){for(var u=Array(l),c=0;c<l;c++)u[c]=arguments[c+2];o.children=u}if(e&&e.defaultProps)for(r in l=e.defaultProps,l)o[r]===void 0&&(o[r]=l[r]);return{$$typeof:uo,type:e,key:s,ref:i,props:o,_owner:na.current}}function em(e,t){return{$$typeof:uo,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}function ra(e){return typeof e=="object"&&e!==null&&e.$$typeof===uo}function tm(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(n){return t[n]})}var tu=/\/+/g;function fi(e,t){return typeof e=="object"&&e!==null&&e.key!=null?tm(""+e.key):t.toString(36)}function Ho(e,t,n,r,o){var s=typeof e;(s==="undefined"||s==="boolean")&&(e=null);var i=!1;if(e===null)i=!0;else switch(s){case"string":case"number":i=!0;break;case"object":switch(e.$$typeof){case uo:case Yp:i=!0}}if(i)return i=e,o=o(i),e=r===""?"."+fi(i,0):r,eu(o)?(n="",e!=null&&(n=e.replace(tu,"$&/")+"/"),Ho(o,t,n,"",function(c){return c})):o!=null&&(ra(o)&&(o=em(o,n+(!o.key||i&&i.key===o.key?"":(""+o.key).replace(tu,"$&/")+"/")+e)),t.push(o)),1;if(i=0,r=r===""?".":r+":",eu(e))for(var l=0;l<e.length;l++){s=e[l];var u=r+fi(s,l);i+=Ho(s,t,n,u,o)}else if(u=Jp(e),typeof u=="function")for(e=u.call(e),l=0;!(s=e.next()).done;)s=s.value,u=r+fi(s,l++),i+=Ho(s,t,n,u,o);else if(s==="object")throw t=String(e),Error("Objects are not valid as a React child (found: "+(t==="[object Object]"?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return i}function ko(e,t,n){if(e==null)return e;var r=[],o=0;return Ho(e,r,"","",function(s){return t.call(n,s,o++)}),r}function nm(e){if(e._status===-1){var t=e._result;t=t(),t.then(function(n){(e._status===0||e._status===-1)&&(e._status=1,e._result=n)},function(n){(e._status===0||e._status===-1)&&(e._status=2,e._result=n)}),e._status===-1&&(e._status=0,e._result=t)}if(e._status===1)return e._result.default;throw e._result}var Fe={current:null},Vo={transition:null},rm={ReactCurrentDispatcher:Fe,ReactCurrentBatchConfig:Vo,ReactCurrentOwner:na};function ud(){throw Error("act(...) is not supported in production builds of React.")}ee.Children={map:ko,forEach:function(e,t,n){ko(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return ko(e,function(){t++}),t},toArray:function(e){return ko(e,function(t){return t})||[]},only:function(e){if(!ra(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};ee.Component=ur;ee.Fragment=Wp;ee.Profiler=Hp;ee.PureComponent=ea;ee.StrictMode=Up;ee.Suspense=Qp;ee.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=rm;ee.act=ud;ee.cloneElement=function(e,t,n){if(e==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var r=rd({},e.props),o=e.key,s=e.ref,i=e._owner;if(t!=null){if(t.ref!==void 0&&(s=t.ref,i=na.current),t.key!==void 0&&(o=""+t.key),e.type&&e.type.defaultProps)var l=e.type.defaultProps;for(u in t)id.call(t,u)&&!ld.hasOwnProperty(u)&&(r[u]=t[u]===void 0&&l!==void 0?l[u]:t[u])}var u=arguments.length-2;if(u===1)r.children=n;else if(1<u){l=Array(u);for(var c=0;c<u;c++)l[c]=arguments[c+2];r.children=l}return{$$typeof:uo,type:e.type,key:o,ref:s,props:r,_owner:i}};ee.createContext=function(e){return e={$$typeof:Gp,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},e.Provider={$$typeof:Vp,_context:e},e.Consumer=e};ee.createElement=ad;ee.createFactory=function(e){var t=ad.bind(null,e);return t.type=e,t};ee.createRef=function(){return{current:null}};ee.forwardRef=function(e){return{$$typeof:Kp,render:e}};ee.isValidElement=ra;ee.lazy=function(e){return{$$typeof:qp,_payload:{_status:-1,_result:e},_init:nm}};ee.memo=function(e,t){return{$$typeof:Zp,type:e,compare:t===void 0?null:t}};ee.startTransition=function(e){var t=Vo.transition;Vo.transition={};try{e()}finally{Vo.transition=t}};ee.unstable_act=ud;ee.useCallback=function(e,t){return Fe.current.useCallback(e,t)};ee.useContext=function(e){return Fe.current.useContext(e)};ee.useDebugValue=function(){};ee.useDeferredValue=function(e){return Fe.current.useDeferredValue(e)};ee.useEffect=function(e,t){return Fe.current.useEffect(e,t)};ee.useId=function(){return Fe.current.useId()};ee.useImperativeHandle=function(e,t,n){return Fe.current.useImperativeHandle(e,t,n)};ee.useInsertionEffect=function(e,t){return Fe.current.useInsertionEffect(e,t)};ee.useLayoutEffect=function(e,t){return Fe.current.useLayoutEffect(e,t)};ee.useMemo=function(e,t){return Fe.current.useMemo(e,t)};ee.useReducer=function(e,t,n){return Fe.current.useReducer(e,t,n)};ee.useRef=function(e){return Fe.current.useRef(e)};ee.useState=function(e){return Fe.current.useState(e)};ee.useSyncExternalStore=function(e,t,n){return Fe.current.useSyncExternalStore(e,t,n)};ee.useTransition=function(){return Fe.current.useTransition()};ee.version="18.3.1";td.exports=ee;var N=td.exports;/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var om=N,sm=Symbol.for("react.element"),im=Symbol.for("react.fragment"),lm=Object.prototype.hasOwnProperty,am=om.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,um={key:!0,ref:!0,__self:!0,__source:!0};function cd(e,t,n){var r,o={},s=null,i=null;n!==void 0&&(s=""+n),t.key!==void 0&&(s=""+t.key),t.ref!==void 0&&(i=t.ref);for(r in t)lm.call(t,r)&&!um.hasOwnProperty(r)&&(o[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps,t)o[r]===void 0&&(o[r]=t[r]);return{$$typeof:sm,type:e,key:s,ref:i,props:o,_owner:am.current}}Xs.Fragment=im;Xs.jsx=cd;Xs.jsxs=cd;ed.exports=Xs;var a=ed.exports,dd={exports:{}},rt={},fd={exports:{}},pd={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */(function(e){function t(T,O){var B=T.length;T.push(O);e:for(;0<B;){var E=B-1>>>1,$=T[E];if(0<o($,O))T[E]=O,T[B]=$,B=E;else break e}}function n(T){return T.length===0?null:T[0]}function r(T){if(T.length===0)return null;var O=T[0],B=T.pop();if(B!==O){T[0]=B;e:for(var E=0,$=T.length,Y=$>>>1;E<Y;){var le=2*(E+1)-1,U=T[le],q=le+1,oe=T[q];if(0>o(U,B))q<$&&0>o(oe,U)?(T[E]=oe,T[q]=B,E=q):(T[E]=U,T[le]=B,E=le);else if(q<$&&0>o(oe,B))T[E]=oe,T[q]=B,E=q;else break e}}return O}function o(T,O){var B=T.sortIndex-O.sortIndex;return B!==0?B:T.id-O.id}if(typeof performance=="object"&&typeof performance.now=="function"){var s=performance;e.unstable_now=function(){return s.now()}}else{var i=Date,l=i.now();e.unstable_now=function(){return i.now()-l}}var u=[],c=[],p=1,m=null,h=3,g=!1,v=!1,x=!1,L=typeof setTimeout=="function"?setTimeout:null,_=typeof clearTimeout=="function"?clearTimeout:null,d=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function f(T){for(var O=n(c);O!==null;){if(O.callback===null)r(c);else if(O.startTime<=T)r(c),O.sortIndex=O.expirationTime,t(u,O);else break;O=n(c)}}function y(T){if(x=!1,f(T),!v)if(n(u)!==null)v=!0,Q(w);else{var O=n(c);O!==null&&X(y,O.startTime-T)}}function w(T,O){v=!1,x&&(x=!1,_(C),C=-1),g=!0;var B=h;try{for(f(O),m=n(u);m!==null&&(!(m.expirationTime>O)||T&&!te());){var E=m.callback;if(typeof E=="function"){m.callback=null,h=m.priorityLevel;var $=E(m.expirationTime<=O);O=e.unstable_now(),typeof $=="function"?m.callback=$:m===n(u)&&r(u),f(O)}else r(u);m=n(u)}if(m!==null)var Y=!0;else{var le=n(c);le!==null&&X(y,le.startTime-O),Y=!1}return Y}finally{m=null,h=B,g=!1}}var S=!1,M=null,C=-1,z=5,P=-1;function te(){return!(e.unstable_now()-P<z)}function W(){if(M!==null){var T=e.unstable_now();P=T;var O=!0;try{O=M(!0,T)}finally{O?_e():(S=!1,M=null)}}else S=!1}var _e;if(typeof d=="function")_e=function(){d(W)};else if(typeof MessageChannel<"u"){var ze=new MessageChannel,b=ze.port2;ze.port1.onmessage=W,_e=function(){b.postMessage(null)}}else _e=function(){L(W,0)};function Q(T){M=T,S||(S=!0,_e())}function X(T,O){C=L(function(){T(e.unstable_now())},O)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(T){T.callback=null},e.unstable_continueExecution=function(){v||g||(v=!0,Q(w))},e.unstable_forceFrameRate=function(T){0>T||125<T?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):z=0<T?Math.floor(1e3/T):5},e.unstable_getCurrentPriorityLevel=function(){return h},e.unstable_getFirstCallbackNode=function(){return n(u)},e.unstable_next=function(T){switch(h){case 1:case 2:case 3:var O=3;break;default:O=h}var B=h;h=O;try{return T()}finally{h=B}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(T,O){switch(T){case 1:case 2:case 3:case 4:case 5:break;default:T=3}var B=h;h=T;try{return O()}finally{h=B}},e.unstable_scheduleCallback=function(T,O,B){var E=e.unstable_now();switch(typeof B=="object"&&B!==null?(B=B.delay,B=typeof B=="number"&&0<B?E+B:E):B=E,T){case 1:var $=-1;break;case 2:$=250;break;case 5:$=1073741823;break;case 4:$=1e4;break;default:$=5e3}return $=B+$,T={id:p++,callback:O,priorityLevel:T,startTime:B,expirationTime:$,sortIndex:-1},B>E?(T.sortIndex=B,t(c,T),n(u)===null&&T===n(c)&&(x?(_(C),C=-1):x=!0,X(y,B-E))):(T.sortIndex=$,t(u,T),v||g||(v=!0,Q(w))),T},e.unstable_shouldYield=te,e.unstable_wrapCallback=function(T){var O=h;return function(){var B=h;h=O;try{return T.apply(this,arguments)}finally{h=B}}}})(pd);fd.exports=pd;var cm=fd.exports;/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var dm=N,tt=cm;function A(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var md=new Set,Wr={};function Tn(e,t){er(e,t),er(e+"Capture",t)}function er(e,t){for(Wr[e]=t,e=0;e<t.length;e++)md.add(t[e])}var It=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),el=Object.prototype.hasOwnProperty,fm=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,nu={},ru={};function pm(e){return el.call(ru,e)?!0:el.call(nu,e)?!1:fm.test(e)?ru[e]=!0:(nu[e]=!0,!1)}function mm(e,t,n,r){if(n!==null&&n.type===0)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return r?!1:n!==null?!n.acceptsBooleans:(e=e.toLowerCase().slice(0,5),e!=="data-"&&e!=="aria-");default:return!1}}function hm(e,t,n,r){if(t===null||typeof t>"u"||mm(e,t,n,r))return!0;if(r)return!1;if(n!==null)switch(n.type){case 3:return!t;case 4:return t===!1;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}function Xe(e,t,n,r,o,s,i){this.acceptsBooleans=t===2||t===3||t===4,this.attributeName=r,this.attributeNamespace=o,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=s,this.removeEmptyString=i}var Te={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){Te[e]=new Xe(e,0,!1,e,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];Te[t]=new Xe(t,1,!1,e[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(e){Te[e]=new Xe(e,2,!1,e.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){Te[e]=new Xe(e,2,!1,e,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){Te[e]=new Xe(e,3,!1,e.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(e){Te[e]=new Xe(e,3,!0,e,null,!1,!1)});["capture","download"].forEach(function(e){Te[e]=new Xe(e,4,!1,e,null,!1,!1)});["cols","rows","size","span"].forEach(function(e){Te[e]=new Xe(e,6,!1,e,null,!1,!1)});["rowSpan","start"].forEach(function(e){Te[e]=new Xe(e,5,!1,e.toLowerCase(),null,!1,!1)});var oa=/[\-:]([a-z])/g;function sa(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(oa,sa);Te[t]=new Xe(t,1,!1,e,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(oa,sa);Te[t]=new Xe(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(oa,sa);Te[t]=new Xe(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(e){Te[e]=new Xe(e,1,!1,e.toLowerCase(),null,!1,!1)});Te.xlinkHref=new Xe("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(e){Te[e]=new Xe(e,1,!1,e.toLowerCase(),null,!0,!0)});function ia(e,t,n,r){var o=Te.hasOwnProperty(t)?Te[t]:null;(o!==null?o.type!==0:r||!(2<t.length)||t[0]!=="o"&&t[0]!=="O"||t[1]!=="n"&&t[1]!=="N")&&(hm(t,n,o,r)&&(n=null),r||o===null?pm(t)&&(n===null?e.removeAttribute(t):e.setAttribute(t,""+n)):o.mustUseProperty?e[o.propertyName]=n===null?o.type===3?!1:"":n:(t=o.attributeName,r=o.attributeNamespace,n===null?e.removeAttribute(t):(o=o.type,n=o===3||o===4&&n===!0?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}var Ot=dm.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,No=Symbol.for("react.element"),On=Symbol.for("react.portal"),zn=Symbol.for("react.fragment"),la=Symbol.for("react.strict_mode"),tl=Symbol.for("react.profiler"),hd=Symbol.for("react.provider"),_d=Symbol.for("react.context"),aa=Symbol.for("react.forward_ref"),nl=Symbol.for("react.suspense"),rl=Symbol.for("react.suspense_list"),ua=Symbol.for("react.memo"),$t=Symbol.for("react.lazy"),yd=Symbol.for("react.offscreen"),ou=Symbol.iterator;function hr(e){return e===null||typeof e!="object"?null:(e=ou&&e[ou]||e["@@iterator"],typeof e=="function"?e:null)}var he=Object.assign,pi;function Cr(e){if(pi===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);pi=t&&t[1]||""}return`
-`+pi+e}var mi=!1;function hi(e,t){if(!e||mi)return"";mi=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(t,[])}catch(c){var r=c}Reflect.construct(e,[],t)}else{try{t.call()}catch(c){r=c}e.call(t.prototype)}else{try{throw Error()}catch(c){r=c}e()}}catch(c){if(c&&r&&typeof c.stack=="string"){for(var o=c.stack.split(`
-`),s=r.stack.split(`
-`),i=o.length-1,l=s.length-1;1<=i&&0<=l&&o[i]!==s[l];)l--;for(;1<=i&&0<=l;i--,l--)if(o[i]!==s[l]){if(i!==1||l!==1)do if(i--,l--,0>l||o[i]!==s[l]){var u=`
-`+o[i].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}while(1<=i&&0<=l);break}}}finally{mi=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?Cr(e):""}function _m(e){switch(e.tag){case 5:return Cr(e.type);case 16:return Cr("Lazy");case 13:return Cr("Suspense");case 19:return Cr("SuspenseList");case 0:case 2:case 15:return e=hi(e.type,!1),e;case 11:return e=hi(e.type.render,!1),e;case 1:return e=hi(e.type,!0),e;default:return""}}function ol(e){if(e==null)return null;if(typeof e=="function")return e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case zn:return"Fragment";case On:return"Portal";case tl:return"Profiler";case la:return"StrictMode";case nl:return"Suspense";case rl:return"SuspenseList"}if(typeof e=="object")switch(e.$$typeof){case _d:return(e.displayName||"Context")+".Consumer";case hd:return(e._context.displayName||"Context")+".Provider";case aa:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case ua:return t=e.displayName||null,t!==null?t:ol(e.type)||"Memo";case $t:t=e._payload,e=e._init;try{return ol(e(t))}catch{}}return null}function ym(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=t.render,e=e.displayName||e.name||"",t.displayName||(e!==""?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return ol(t);case 8:return t===la?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function nn(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function vd(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function vm(e){var t=vd(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var o=n.get,s=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return o.call(this)},set:function(i){r=""+i,s.call(this,i)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(i){r=""+i},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function Eo(e){e._valueTracker||(e._valueTracker=vm(e))}function gd(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=vd(e)?e.checked?"true":"false":e.value),e=r,e!==n?(t.setValue(e),!0):!1}function as(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}function sl(e,t){var n=t.checked;return he({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:n??e._wrapperState.initialChecked})}function su(e,t){var n=t.defaultValue==null?"":t.defaultValue,r=t.checked!=null?t.checked:t.defaultChecked;n=nn(t.value!=null?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function xd(e,t){t=t.checked,t!=null&&ia(e,"checked",t,!1)}function il(e,t){xd(e,t);var n=nn(t.value),r=t.type;if(n!=null)r==="number"?(n===0&&e.value===""||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if(r==="submit"||r==="reset"){e.removeAttribute("value");return}t.hasOwnProperty("value")?ll(e,t.type,n):t.hasOwnProperty("defaultValue")&&ll(e,t.type,nn(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(e.defaultChecked=!!t.defaultChecked)}function iu(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!(r!=="submit"&&r!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}n=e.name,n!==""&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,n!==""&&(e.name=n)}function ll(e,t,n){(t!=="number"||as(e.ownerDocument)!==e)&&(n==null?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var jr=Array.isArray;function Gn(e,t,n,r){if(e=e.options,t){t={};for(var o=0;o<n.length;o++)t["$"+n[o]]=!0;for(n=0;n<e.length;n++)o=t.hasOwnProperty("$"+e[n].value),e[n].selected!==o&&(e[n].selected=o),o&&r&&(e[n].defaultSelected=!0)}else{for(n=""+nn(n),t=null,o=0;o<e.length;o++){if(e[o].value===n){e[o].selected=!0,r&&(e[o].defaultSelected=!0);return}t!==null||e[o].disabled||(t=e[o])}t!==null&&(t.selected=!0)}}function al(e,t){if(t.dangerouslySetInnerHTML!=null)throw Error(A(91));return he({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function lu(e,t){var n=t.value;if(n==null){if(n=t.children,t=t.defaultValue,n!=null){if(t!=null)throw Error(A(92));if(jr(n)){if(1<n.length)throw Error(A(93));n=n[0]}t=n}t==null&&(t=""),n=t}e._wrapperState={initialValue:nn(n)}}function wd(e,t){var n=nn(t.value),r=nn(t.defaultValue);n!=null&&(n=""+n,n!==e.value&&(e.value=n),t.defaultValue==null&&e.defaultValue!==n&&(e.defaultValue=n)),r!=null&&(e.defaultValue=""+r)}function au(e){var t=e.textContent;t===e._wrapperState.initialValue&&t!==""&&t!==null&&(e.value=t)}function Sd(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ul(e,t){return e==null||e==="http://www.w3.org/1999/xhtml"?Sd(t):e==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":e}var Co,kd=function(e){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,n,r,o){MSApp.execUnsafeLocalFunction(function(){return e(t,n,r,o)})}:e}(function(e,t){if(e.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in e)e.innerHTML=t;else{for(Co=Co||document.createElement("div"),Co.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=Co.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}});function Ur(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Ar={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},gm=["Webkit","ms","Moz","O"];Object.keys(Ar).forEach(function(e){gm.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Ar[t]=Ar[e]})});function Nd(e,t,n){return t==null||typeof t=="boolean"||t===""?"":n||typeof t!="number"||t===0||Ar.hasOwnProperty(e)&&Ar[e]?(""+t).trim():t+"px"}function Ed(e,t){e=e.style;for(var n in t)if(t.hasOwnProperty(n)){var r=n.indexOf("--")===0,o=Nd(n,t[n],r);n==="float"&&(n="cssFloat"),r?e.setProperty(n,o):e[n]=o}}var xm=he({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function cl(e,t){if(t){if(xm[e]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(A(137,e));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(A(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(A(61))}if(t.style!=null&&typeof t.style!="object")throw Error(A(62))}}function dl(e,t){if(e.indexOf("-")===-1)return typeof t.is=="string";switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var fl=null;function ca(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var pl=null,Kn=null,Qn=null;function uu(e){if(e=po(e)){if(typeof pl!="function")throw Error(A(280));var t=e.stateNode;t&&(t=Vs(t),pl(e.stateNode,e.type,t))}}function Cd(e){Kn?Qn?Qn.push(e):Qn=[e]:Kn=e}function jd(){if(Kn){var e=Kn,t=Qn;if(Qn=Kn=null,uu(e),t)for(e=0;e<t.length;e++)uu(t[e])}}function Md(e,t){return e(t)}function Ld(){}var _i=!1;function Td(e,t,n){if(_i)return e(t,n);_i=!0;try{return Md(e,t,n)}finally{_i=!1,(Kn!==null||Qn!==null)&&(Ld(),jd())}}function Hr(e,t){var n=e.stateNode;if(n===null)return null;var r=Vs(n);if(r===null)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(e=e.type,r=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!r;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(A(231,t,typeof n));return n}var ml=!1;if(It)try{var _r={};Object.defineProperty(_r,"passive",{get:function(){ml=!0}}),window.addEventListener("test",_r,_r),window.removeEventListener("test",_r,_r)}catch{ml=!1}function wm(e,t,n,r,o,s,i,l,u){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(p){this.onError(p)}}var Pr=!1,us=null,cs=!1,hl=null,Sm={onError:function(e){Pr=!0,us=e}};function km(e,t,n,r,o,s,i,l,u){Pr=!1,us=null,wm.apply(Sm,arguments)}function Nm(e,t,n,r,o,s,i,l,u){if(km.apply(this,arguments),Pr){if(Pr){var c=us;Pr=!1,us=null}else throw Error(A(198));cs||(cs=!0,hl=c)}}function bn(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,t.flags&4098&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function bd(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function cu(e){if(bn(e)!==e)throw Error(A(188))}function Em(e){var t=e.alternate;if(!t){if(t=bn(e),t===null)throw Error(A(188));return t!==e?null:e}for(var n=e,r=t;;){var o=n.return;if(o===null)break;var s=o.alternate;if(s===null){if(r=o.return,r!==null){n=r;continue}break}if(o.child===s.child){for(s=o.child;s;){if(s===n)return cu(o),e;if(s===r)return cu(o),t;s=s.sibling}throw Error(A(188))}if(n.return!==r.return)n=o,r=s;else{for(var i=!1,l=o.child;l;){if(l===n){i=!0,n=o,r=s;break}if(l===r){i=!0,r=o,n=s;break}l=l.sibling}if(!i){for(l=s.child;l;){if(l===n){i=!0,n=s,r=o;break}if(l===r){i=!0,r=s,n=o;break}l=l.sibling}if(!i)throw Error(A(189))}}if(n.alternate!==r)throw Error(A(190))}if(n.tag!==3)throw Error(A(188));return n.stateNode.current===n?e:t}function Id(e){return e=Em(e),e!==null?Ad(e):null}function Ad(e){if(e.tag===5||e.tag===6)return e;for(e=e.child;e!==null;){var t=Ad(e);if(t!==null)return t;e=e.sibling}return null}var Pd=tt.unstable_scheduleCallback,du=tt.unstable_cancelCallback,Cm=tt.unstable_shouldYield,jm=tt.unstable_requestPaint,xe=tt.unstable_now,Mm=tt.unstable_getCurrentPriorityLevel,da=tt.unstable_ImmediatePriority,Rd=tt.unstable_UserBlockingPriority,ds=tt.unstable_NormalPriority,Lm=tt.unstable_LowPriority,Od=tt.unstable_IdlePriority,Ys=null,kt=null;function Tm(e){if(kt&&typeof kt.onCommitFiberRoot=="function")try{kt.onCommitFiberRoot(Ys,e,void 0,(e.current.flags&128)===128)}catch{}}var _t=Math.clz32?Math.clz32:Am,bm=Math.log,Im=Math.LN2;function Am(e){return e>>>=0,e===0?32:31-(bm(e)/Im|0)|0}var jo=64,Mo=4194304;function Mr(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return e&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function fs(e,t){var n=e.pendingLanes;if(n===0)return 0;var r=0,o=e.suspendedLanes,s=e.pingedLanes,i=n&268435455;if(i!==0){var l=i&~o;l!==0?r=Mr(l):(s&=i,s!==0&&(r=Mr(s)))}else i=n&~o,i!==0?r=Mr(i):s!==0&&(r=Mr(s));if(r===0)return 0;if(t!==0&&t!==r&&!(t&o)&&(o=r&-r,s=t&-t,o>=s||o===16&&(s&4194240)!==0))return t;if(r&4&&(r|=n&16),t=e.entangledLanes,t!==0)for(e=e.entanglements,t&=r;0<t;)n=31-_t(t),o=1<<n,r|=e[n],t&=~o;return r}function Pm(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Rm(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,o=e.expirationTimes,s=e.pendingLanes;0<s;){var i=31-_t(s),l=1<<i,u=o[i];u===-1?(!(l&n)||l&r)&&(o[i]=Pm(l,t)):u<=t&&(e.expiredLanes|=l),s&=~l}}function _l(e){return e=e.pendingLanes&-1073741825,e!==0?e:e&1073741824?1073741824:0}function zd(){var e=jo;return jo<<=1,!(jo&4194240)&&(jo=64),e}function yi(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function co(e,t,n){e.pendingLanes|=t,t!==536870912&&(e.suspendedLanes=0,e.pingedLanes=0),e=e.eventTimes,t=31-_t(t),e[t]=n}function Om(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var o=31-_t(n),s=1<<o;t[o]=0,r[o]=-1,e[o]=-1,n&=~s}}function fa(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-_t(n),o=1<<r;o&t|e[r]&t&&(e[r]|=t),n&=~o}}var ie=0;function Dd(e){return e&=-e,1<e?4<e?e&268435455?16:536870912:4:1}var Bd,pa,$d,Fd,Xd,yl=!1,Lo=[],Vt=null,Gt=null,Kt=null,Vr=new Map,Gr=new Map,Yt=[],zm="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function fu(e,t){switch(e){case"focusin":case"focusout":Vt=null;break;case"dragenter":case"dragleave":Gt=null;break;case"mouseover":case"mouseout":Kt=null;break;case"pointerover":case"pointerout":Vr.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Gr.delete(t.pointerId)}}function yr(e,t,n,r,o,s){return e===null||e.nativeEvent!==s?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:s,targetContainers:[o]},t!==null&&(t=po(t),t!==null&&pa(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,o!==null&&t.indexOf(o)===-1&&t.push(o),e)}function Dm(e,t,n,r,o){switch(t){case"focusin":return Vt=yr(Vt,e,t,n,r,o),!0;case"dragenter":return Gt=yr(Gt,e,t,n,r,o),!0;case"mouseover":return Kt=yr(Kt,e,t,n,r,o),!0;case"pointerover":var s=o.pointerId;return Vr.set(s,yr(Vr.get(s)||null,e,t,n,r,o)),!0;case"gotpointercapture":return s=o.pointerId,Gr.set(s,yr(Gr.get(s)||null,e,t,n,r,o)),!0}return!1}function Yd(e){var t=hn(e.target);if(t!==null){var n=bn(t);if(n!==null){if(t=n.tag,t===13){if(t=bd(n),t!==null){e.blockedOn=t,Xd(e.priority,function(){$d(n)});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Go(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=vl(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(n===null){n=e.nativeEvent;var r=new n.constructor(n.type,n);fl=r,n.target.dispatchEvent(r),fl=null}else return t=po(n),t!==null&&pa(t),e.blockedOn=n,!1;t.shift()}return!0}function pu(e,t,n){Go(e)&&n.delete(t)}function Bm(){yl=!1,Vt!==null&&Go(Vt)&&(Vt=null),Gt!==null&&Go(Gt)&&(Gt=null),Kt!==null&&Go(Kt)&&(Kt=null),Vr.forEach(pu),Gr.forEach(pu)}function vr(e,t){e.blockedOn===t&&(e.blockedOn=null,yl||(yl=!0,tt.unstable_scheduleCallback(tt.unstable_NormalPriority,Bm)))}function Kr(e){function t(o){return vr(o,e)}if(0<Lo.length){vr(Lo[0],e);for(var n=1;n<Lo.length;n++){var r=Lo[n];r.blockedOn===e&&(r.blockedOn=null)}}for(Vt!==null&&vr(Vt,e),Gt!==null&&vr(Gt,e),Kt!==null&&vr(Kt,e),Vr.forEach(t),Gr.forEach(t),n=0;n<Yt.length;n++)r=Yt[n],r.blockedOn===e&&(r.blockedOn=null);for(;0<Yt.length&&(n=Yt[0],n.blockedOn===null);)Yd(n),n.blockedOn===null&&Yt.shift()}var Zn=Ot.ReactCurrentBatchConfig,ps=!0;function $m(e,t,n,r){var o=ie,s=Zn.transition;Zn.transition=null;try{ie=1,ma(e,t,n,r)}finally{ie=o,Zn.transition=s}}function Fm(e,t,n,r){var o=ie,s=Zn.transition;Zn.transition=null;try{ie=4,ma(e,t,n,r)}finally{ie=o,Zn.transition=s}}function ma(e,t,n,r){if(ps){var o=vl(e,t,n,r);if(o===null)ji(e,t,r,ms,n),fu(e,r);else if(Dm(o,e,t,n,r))r.stopPropagation();else if(fu(e,r),t&4&&-1<zm.indexOf(e)){for(;o!==null;){var s=po(o);if(s!==null&&Bd(s),s=vl(e,t,n,r),s===null&&ji(e,t,r,ms,n),s===o)break;o=s}o!==null&&r.stopPropagation()}else ji(e,t,r,null,n)}}var ms=null;function vl(e,t,n,r){if(ms=null,e=ca(r),e=hn(e),e!==null)if(t=bn(e),t===null)e=null;else if(n=t.tag,n===13){if(e=bd(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return ms=e,null}function Wd(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Mm()){case da:return 1;case Rd:return 4;case ds:case Lm:return 16;case Od:return 536870912;default:return 16}default:return 16}}var Ut=null,ha=null,Ko=null;function Ud(){if(Ko)return Ko;var e,t=ha,n=t.length,r,o="value"in Ut?Ut.value:Ut.textContent,s=o.length;for(e=0;e<n&&t[e]===o[e];e++);var i=n-e;for(r=1;r<=i&&t[n-r]===o[s-r];r++);return Ko=o.slice(e,1<r?1-r:void 0)}function Qo(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function To(){return!0}function mu(){return!1}function ot(e){function t(n,r,o,s,i){this._reactName=n,this._targetInst=o,this.type=r,this.nativeEvent=s,this.target=i,this.currentTarget=null;for(var l in e)e.hasOwnProperty(l)&&(n=e[l],this[l]=n?n(s):s[l]);return this.isDefaultPrevented=(s.defaultPrevented!=null?s.defaultPrevented:s.returnValue===!1)?To:mu,this.isPropagationStopped=mu,this}return he(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=To)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=To)},persist:function(){},isPersistent:To}),t}var cr={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},_a=ot(cr),fo=he({},cr,{view:0,detail:0}),Xm=ot(fo),vi,gi,gr,Ws=he({},fo,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:ya,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==gr&&(gr&&e.type==="mousemove"?(vi=e.screenX-gr.screenX,gi=e.screenY-gr.screenY):gi=vi=0,gr=e),vi)},movementY:function(e){return"movementY"in e?e.movementY:gi}}),hu=ot(Ws),Ym=he({},Ws,{dataTransfer:0}),Wm=ot(Ym),Um=he({},fo,{relatedTarget:0}),xi=ot(Um),Hm=he({},cr,{animationName:0,elapsedTime:0,pseudoElement:0}),Vm=ot(Hm),Gm=he({},cr,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Km=ot(Gm),Qm=he({},cr,{data:0}),_u=ot(Qm),Zm={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},qm={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Jm={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function eh(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=Jm[e])?!!t[e]:!1}function ya(){return eh}var th=he({},fo,{key:function(e){if(e.key){var t=Zm[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Qo(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?qm[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:ya,charCode:function(e){return e.type==="keypress"?Qo(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Qo(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),nh=ot(th),rh=he({},Ws,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),yu=ot(rh),oh=he({},fo,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:ya}),sh=ot(oh),ih=he({},cr,{propertyName:0,elapsedTime:0,pseudoElement:0}),lh=ot(ih),ah=he({},Ws,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),uh=ot(ah),ch=[9,13,27,32],va=It&&"CompositionEvent"in window,Rr=null;It&&"documentMode"in document&&(Rr=document.documentMode);var dh=It&&"TextEvent"in window&&!Rr,Hd=It&&(!va||Rr&&8<Rr&&11>=Rr),vu=" ",gu=!1;function Vd(e,t){switch(e){case"keyup":return ch.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Gd(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Dn=!1;function fh(e,t){switch(e){case"compositionend":return Gd(t);case"keypress":return t.which!==32?null:(gu=!0,vu);case"textInput":return e=t.data,e===vu&&gu?null:e;default:return null}}function ph(e,t){if(Dn)return e==="compositionend"||!va&&Vd(e,t)?(e=Ud(),Ko=ha=Ut=null,Dn=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Hd&&t.locale!=="ko"?null:t.data;default:return null}}var mh={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function xu(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!mh[e.type]:t==="textarea"}function Kd(e,t,n,r){Cd(r),t=hs(t,"onChange"),0<t.length&&(n=new _a("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Or=null,Qr=null;function hh(e){lf(e,0)}function Us(e){var t=Fn(e);if(gd(t))return e}function _h(e,t){if(e==="change")return t}var Qd=!1;if(It){var wi;if(It){var Si="oninput"in document;if(!Si){var wu=document.createElement("div");wu.setAttribute("oninput","return;"),Si=typeof wu.oninput=="function"}wi=Si}else wi=!1;Qd=wi&&(!document.documentMode||9<document.documentMode)}function Su(){Or&&(Or.detachEvent("onpropertychange",Zd),Qr=Or=null)}function Zd(e){if(e.propertyName==="value"&&Us(Qr)){var t=[];Kd(t,Qr,e,ca(e)),Td(hh,t)}}function yh(e,t,n){e==="focusin"?(Su(),Or=t,Qr=n,Or.attachEvent("onpropertychange",Zd)):e==="focusout"&&Su()}function vh(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return Us(Qr)}function gh(e,t){if(e==="click")return Us(t)}function xh(e,t){if(e==="input"||e==="change")return Us(t)}function wh(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var vt=typeof Object.is=="function"?Object.is:wh;function Zr(e,t){if(vt(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var o=n[r];if(!el.call(t,o)||!vt(e[o],t[o]))return!1}return!0}function ku(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Nu(e,t){var n=ku(e);e=0;for(var r;n;){if(n.nodeType===3){if(r=e+n.textContent.length,e<=t&&r>=t)return{node:n,offset:t-e};e=r}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=ku(n)}}function qd(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?qd(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Jd(){for(var e=window,t=as();t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=as(e.document)}return t}function ga(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}function Sh(e){var t=Jd(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&qd(n.ownerDocument.documentElement,n)){if(r!==null&&ga(n)){if(t=r.start,e=r.end,e===void 0&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if(e=(t=n.ownerDocument||document)&&t.defaultView||window,e.getSelection){e=e.getSelection();var o=n.textContent.length,s=Math.min(r.start,o);r=r.end===void 0?s:Math.min(r.end,o),!e.extend&&s>r&&(o=r,r=s,s=o),o=Nu(n,s);var i=Nu(n,r);o&&i&&(e.rangeCount!==1||e.anchorNode!==o.node||e.anchorOffset!==o.offset||e.focusNode!==i.node||e.focusOffset!==i.offset)&&(t=t.createRange(),t.setStart(o.node,o.offset),e.removeAllRanges(),s>r?(e.addRange(t),e.extend(i.node,i.offset)):(t.setEnd(i.node,i.offset),e.addRange(t)))}}for(t=[],e=n;e=e.parentNode;)e.nodeType===1&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for(typeof n.focus=="function"&&n.focus(),n=0;n<t.length;n++)e=t[n],e.element.scrollLeft=e.left,e.element.scrollTop=e.top}}var kh=It&&"documentMode"in document&&11>=document.documentMode,Bn=null,gl=null,zr=null,xl=!1;function Eu(e,t,n){var r=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;xl||Bn==null||Bn!==as(r)||(r=Bn,"selectionStart"in r&&ga(r)?r={start:r.selectionStart,end:r.selectionEnd}:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection(),r={anchorNode:r.anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset}),zr&&Zr(zr,r)||(zr=r,r=hs(gl,"onSelect"),0<r.length&&(t=new _a("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=Bn)))}function bo(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var $n={animationend:bo("Animation","AnimationEnd"),animationiteration:bo("Animation","AnimationIteration"),animationstart:bo("Animation","AnimationStart"),transitionend:bo("Transition","TransitionEnd")},ki={},ef={};It&&(ef=document.createElement("div").style,"AnimationEvent"in window||(delete $n.animationend.animation,delete $n.animationiteration.animation,delete $n.animationstart.animation),"TransitionEvent"in window||delete $n.transitionend.transition);function Hs(e){if(ki[e])return ki[e];if(!$n[e])return e;var t=$n[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in ef)return ki[e]=t[n];return e}var tf=Hs("animationend"),nf=Hs("animationiteration"),rf=Hs("animationstart"),of=Hs("transitionend"),sf=new Map,Cu="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function on(e,t){sf.set(e,t),Tn(t,[e])}for(var Ni=0;Ni<Cu.length;Ni++){var Ei=Cu[Ni],Nh=Ei.toLowerCase(),Eh=Ei[0].toUpperCase()+Ei.slice(1);on(Nh,"on"+Eh)}on(tf,"onAnimationEnd");on(nf,"onAnimationIteration");on(rf,"onAnimationStart");on("dblclick","onDoubleClick");on("focusin","onFocus");on("focusout","onBlur");on(of,"onTransitionEnd");er("onMouseEnter",["mouseout","mouseover"]);er("onMouseLeave",["mouseout","mouseover"]);er("onPointerEnter",["pointerout","pointerover"]);er("onPointerLeave",["pointerout","pointerover"]);Tn("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Tn("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Tn("onBeforeInput",["compositionend","keypress","textInput","paste"]);Tn("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Tn("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Tn("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Lr="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Ch=new Set("cancel close invalid load scroll toggle".split(" ").concat(Lr));function ju(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,Nm(r,t,void 0,e),e.currentTarget=null}function lf(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var r=e[n],o=r.event;r=r.listeners;e:{var s=void 0;if(t)for(var i=r.length-1;0<=i;i--){var l=r[i],u=l.instance,c=l.currentTarget;if(l=l.listener,u!==s&&o.isPropagationStopped())break e;ju(o,l,c),s=u}else for(i=0;i<r.length;i++){if(l=r[i],u=l.instance,c=l.currentTarget,l=l.listener,u!==s&&o.isPropagationStopped())break e;ju(o,l,c),s=u}}}if(cs)throw e=hl,cs=!1,hl=null,e}function ce(e,t){var n=t[El];n===void 0&&(n=t[El]=new Set);var r=e+"__bubble";n.has(r)||(af(t,e,2,!1),n.add(r))}function Ci(e,t,n){var r=0;t&&(r|=4),af(n,e,r,t)}var Io="_reactListening"+Math.random().toString(36).slice(2);function qr(e){if(!e[Io]){e[Io]=!0,md.forEach(function(n){n!=="selectionchange"&&(Ch.has(n)||Ci(n,!1,e),Ci(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Io]||(t[Io]=!0,Ci("selectionchange",!1,t))}}function af(e,t,n,r){switch(Wd(t)){case 1:var o=$m;break;case 4:o=Fm;break;default:o=ma}n=o.bind(null,t,n,e),o=void 0,!ml||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(o=!0),r?o!==void 0?e.addEventListener(t,n,{capture:!0,passive:o}):e.addEventListener(t,n,!0):o!==void 0?e.addEventListener(t,n,{passive:o}):e.addEventListener(t,n,!1)}function ji(e,t,n,r,o){var s=r;if(!(t&1)&&!(t&2)&&r!==null)e:for(;;){if(r===null)return;var i=r.tag;if(i===3||i===4){var l=r.stateNode.containerInfo;if(l===o||l.nodeType===8&&l.parentNode===o)break;if(i===4)for(i=r.return;i!==null;){var u=i.tag;if((u===3||u===4)&&(u=i.stateNode.containerInfo,u===o||u.nodeType===8&&u.parentNode===o))return;i=i.return}for(;l!==null;){if(i=hn(l),i===null)return;if(u=i.tag,u===5||u===6){r=s=i;continue e}l=l.parentNode}}r=r.return}Td(function(){var c=s,p=ca(n),m=[];e:{var h=sf.get(e);if(h!==void 0){var g=_a,v=e;switch(e){case"keypress":if(Qo(n)===0)break e;case"keydown":case"keyup":g=nh;break;case"focusin":v="focus",g=xi;break;case"focusout":v="blur",g=xi;break;case"beforeblur":case"afterblur":g=xi;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":g=hu;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":g=Wm;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":g=sh;break;case tf:case nf:case rf:g=Vm;break;case of:g=lh;break;case"scroll":g=Xm;break;case"wheel":g=uh;break;case"copy":case"cut":case"paste":g=Km;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":g=yu}var x=(t&4)!==0,L=!x&&e==="scroll",_=x?h!==null?h+"Capture":null:h;x=[];for(var d=c,f;d!==null;){f=d;var y=f.stateNode;if(f.tag===5&&y!==null&&(f=y,_!==null&&(y=Hr(d,_),y!=null&&x.push(Jr(d,y,f)))),L)break;d=d.return}0<x.length&&(h=new g(h,v,null,n,p),m.push({event:h,listeners:x}))}}if(!(t&7)){e:{if(h=e==="mouseover"||e==="pointerover",g=e==="mouseout"||e==="pointerout",h&&n!==fl&&(v=n.relatedTarget||n.fromElement)&&(hn(v)||v[At]))break e;if((g||h)&&(h=p.window===p?p:(h=p.ownerDocument)?h.defaultView||h.parentWindow:window,g?(v=n.relatedTarget||n.toElement,g=c,v=v?hn(v):null,v!==null&&(L=bn(v),v!==L||v.tag!==5&&v.tag!==6)&&(v=null)):(g=null,v=c),g!==v)){if(x=hu,y="onMouseLeave",_="onMouseEnter",d="mouse",(e==="pointerout"||e==="pointerover")&&(x=yu,y="onPointerLeave",_="onPointerEnter",d="pointer"),L=g==null?h:Fn(g),f=v==null?h:Fn(v),h=new x(y,d+"leave",g,n,p),h.target=L,h.relatedTarget=f,y=null,hn(p)===c&&(x=new x(_,d+"enter",v,n,p),x.target=f,x.relatedTarget=L,y=x),L=y,g&&v)t:{for(x=g,_=v,d=0,f=x;f;f=An(f))d++;for(f=0,y=_;y;y=An(y))f++;for(;0<d-f;)x=An(x),d--;for(;0<f-d;)_=An(_),f--;for(;d--;){if(x===_||_!==null&&x===_.alternate)break t;x=An(x),_=An(_)}x=null}else x=null;g!==null&&Mu(m,h,g,x,!1),v!==null&&L!==null&&Mu(m,L,v,x,!0)}}e:{if(h=c?Fn(c):window,g=h.nodeName&&h.nodeName.toLowerCase(),g==="select"||g==="input"&&h.type==="file")var w=_h;else if(xu(h))if(Qd)w=xh;else{w=vh;var S=yh}else(g=h.nodeName)&&g.toLowerCase()==="input"&&(h.type==="checkbox"||h.type==="radio")&&(w=gh);if(w&&(w=w(e,c))){Kd(m,w,n,p);break e}S&&S(e,h,c),e==="focusout"&&(S=h._wrapperState)&&S.controlled&&h.type==="number"&&ll(h,"number",h.value)}switch(S=c?Fn(c):window,e){case"focusin":(xu(S)||S.contentEditable==="true")&&(Bn=S,gl=c,zr=null);break;case"focusout":zr=gl=Bn=null;break;case"mousedown":xl=!0;break;case"contextmenu":case"mouseup":case"dragend":xl=!1,Eu(m,n,p);break;case"selectionchange":if(kh)break;case"keydown":case"keyup":Eu(m,n,p)}var M;if(va)e:{switch(e){case"compositionstart":var C="onCompositionStart";break e;case"compositionend":C="onCompositionEnd";break e;case"compositionupdate":C="onCompositionUpdate";break e}C=void 0}else Dn?Vd(e,n)&&(C="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(C="onCompositionStart");C&&(Hd&&n.locale!=="ko"&&(Dn||C!=="onCompositionStart"?C==="onCompositionEnd"&&Dn&&(M=Ud()):(Ut=p,ha="value"in Ut?Ut.value:Ut.textContent,Dn=!0)),S=hs(c,C),0<S.length&&(C=new _u(C,e,null,n,p),m.push({event:C,listeners:S}),M?C.data=M:(M=Gd(n),M!==null&&(C.data=M)))),(M=dh?fh(e,n):ph(e,n))&&(c=hs(c,"onBeforeInput"),0<c.length&&(p=new _u("onBeforeInput","beforeinput",null,n,p),m.push({event:p,listeners:c}),p.data=M))}lf(m,t)})}function Jr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function hs(e,t){for(var n=t+"Capture",r=[];e!==null;){var o=e,s=o.stateNode;o.tag===5&&s!==null&&(o=s,s=Hr(e,n),s!=null&&r.unshift(Jr(e,s,o)),s=Hr(e,t),s!=null&&r.push(Jr(e,s,o))),e=e.return}return r}function An(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5);return e||null}function Mu(e,t,n,r,o){for(var s=t._reactName,i=[];n!==null&&n!==r;){var l=n,u=l.alternate,c=l.stateNode;if(u!==null&&u===r)break;l.tag===5&&c!==null&&(l=c,o?(u=Hr(n,s),u!=null&&i.unshift(Jr(n,u,l))):o||(u=Hr(n,s),u!=null&&i.push(Jr(n,u,l)))),n=n.return}i.length!==0&&e.push({event:t,listeners:i})}var jh=/\r\n?/g,Mh=/\u0000|\uFFFD/g;function Lu(e){return(typeof e=="string"?e:""+e).replace(jh,`
-`).replace(Mh,"")}function Ao(e,t,n){if(t=Lu(t),Lu(e)!==t&&n)throw Error(A(425))}function _s(){}var wl=null,Sl=null;function kl(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Nl=typeof setTimeout=="function"?setTimeout:void 0,Lh=typeof clearTimeout=="function"?clearTimeout:void 0,Tu=typeof Promise=="function"?Promise:void 0,Th=typeof queueMicrotask=="function"?queueMicrotask:typeof Tu<"u"?function(e){return Tu.resolve(null).then(e).catch(bh)}:Nl;function bh(e){setTimeout(function(){throw e})}function Mi(e,t){var n=t,r=0;do{var o=n.nextSibling;if(e.removeChild(n),o&&o.nodeType===8)if(n=o.data,n==="/$"){if(r===0){e.removeChild(o),Kr(t);return}r--}else n!=="$"&&n!=="$?"&&n!=="$!"||r++;n=o}while(n);Kr(t)}function Qt(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return e}function bu(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}var dr=Math.random().toString(36).slice(2),St="__reactFiber$"+dr,eo="__reactProps$"+dr,At="__reactContainer$"+dr,El="__reactEvents$"+dr,Ih="__reactListeners$"+dr,Ah="__reactHandles$"+dr;function hn(e){var t=e[St];if(t)return t;for(var n=e.parentNode;n;){if(t=n[At]||n[St]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=bu(e);e!==null;){if(n=e[St])return n;e=bu(e)}return t}e=n,n=e.parentNode}return null}function po(e){return e=e[St]||e[At],!e||e.tag!==5&&e.tag!==6&&e.tag!==13&&e.tag!==3?null:e}function Fn(e){if(e.tag===5||e.tag===6)return e.stateNode;throw Error(A(33))}function Vs(e){return e[eo]||null}var Cl=[],Xn=-1;function sn(e){return{current:e}}function de(e){0>Xn||(e.current=Cl[Xn],Cl[Xn]=null,Xn--)}function ue(e,t){Xn++,Cl[Xn]=e.current,e.current=t}var rn={},Re=sn(rn),Ve=sn(!1),kn=rn;function tr(e,t){var n=e.type.contextTypes;if(!n)return rn;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var o={},s;for(s in n)o[s]=t[s];return r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=o),o}function Ge(e){return e=e.childContextTypes,e!=null}function ys(){de(Ve),de(Re)}function Iu(e,t,n){if(Re.current!==rn)throw Error(A(168));ue(Re,t),ue(Ve,n)}function uf(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,typeof r.getChildContext!="function")return n;r=r.getChildContext();for(var o in r)if(!(o in t))throw Error(A(108,ym(e)||"Unknown",o));return he({},n,r)}function vs(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||rn,kn=Re.current,ue(Re,e),ue(Ve,Ve.current),!0}function Au(e,t,n){var r=e.stateNode;if(!r)throw Error(A(169));n?(e=uf(e,t,kn),r.__reactInternalMemoizedMergedChildContext=e,de(Ve),de(Re),ue(Re,e)):de(Ve),ue(Ve,n)}var jt=null,Gs=!1,Li=!1;function cf(e){jt===null?jt=[e]:jt.push(e)}function Ph(e){Gs=!0,cf(e)}function ln(){if(!Li&&jt!==null){Li=!0;var e=0,t=ie;try{var n=jt;for(ie=1;e<n.length;e++){var r=n[e];do r=r(!0);while(r!==null)}jt=null,Gs=!1}catch(o){throw jt!==null&&(jt=jt.slice(e+1)),Pd(da,ln),o}finally{ie=t,Li=!1}}return null}var Yn=[],Wn=0,gs=null,xs=0,st=[],it=0,Nn=null,Lt=1,Tt="";function cn(e,t){Yn[Wn++]=xs,Yn[Wn++]=gs,gs=e,xs=t}function df(e,t,n){st[it++]=Lt,st[it++]=Tt,st[it++]=Nn,Nn=e;var r=Lt;e=Tt;var o=32-_t(r)-1;r&=~(1<<o),n+=1;var s=32-_t(t)+o;if(30<s){var i=o-o%5;s=(r&(1<<i)-1).toString(32),r>>=i,o-=i,Lt=1<<32-_t(t)+o|n<<o|r,Tt=s+e}else Lt=1<<s|n<<o|r,Tt=e}function xa(e){e.return!==null&&(cn(e,1),df(e,1,0))}function wa(e){for(;e===gs;)gs=Yn[--Wn],Yn[Wn]=null,xs=Yn[--Wn],Yn[Wn]=null;for(;e===Nn;)Nn=st[--it],st[it]=null,Tt=st[--it],st[it]=null,Lt=st[--it],st[it]=null}var et=null,qe=null,fe=!1,ht=null;function ff(e,t){var n=lt(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,t=e.deletions,t===null?(e.deletions=[n],e.flags|=16):t.push(n)}function Pu(e,t){switch(e.tag){case 5:var n=e.type;return t=t.nodeType!==1||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(e.stateNode=t,et=e,qe=Qt(t.firstChild),!0):!1;case 6:return t=e.pendingProps===""||t.nodeType!==3?null:t,t!==null?(e.stateNode=t,et=e,qe=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(n=Nn!==null?{id:Lt,overflow:Tt}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},n=lt(18,null,null,0),n.stateNode=t,n.return=e,e.child=n,et=e,qe=null,!0):!1;default:return!1}}function jl(e){return(e.mode&1)!==0&&(e.flags&128)===0}function Ml(e){if(fe){var t=qe;if(t){var n=t;if(!Pu(e,t)){if(jl(e))throw Error(A(418));t=Qt(n.nextSibling);var r=et;t&&Pu(e,t)?ff(r,n):(e.flags=e.flags&-4097|2,fe=!1,et=e)}}else{if(jl(e))throw Error(A(418));e.flags=e.flags&-4097|2,fe=!1,et=e}}}function Ru(e){for(e=e.return;e!==null&&e.tag!==5&&e.tag!==3&&e.tag!==13;)e=e.return;et=e}function Po(e){if(e!==et)return!1;if(!fe)return Ru(e),fe=!0,!1;var t;if((t=e.tag!==3)&&!(t=e.tag!==5)&&(t=e.type,t=t!=="head"&&t!=="body"&&!kl(e.type,e.memoizedProps)),t&&(t=qe)){if(jl(e))throw pf(),Error(A(418));for(;t;)ff(e,t),t=Qt(t.nextSibling)}if(Ru(e),e.tag===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(A(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="/$"){if(t===0){qe=Qt(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++}e=e.nextSibling}qe=null}}else qe=et?Qt(e.stateNode.nextSibling):null;return!0}function pf(){for(var e=qe;e;)e=Qt(e.nextSibling)}function nr(){qe=et=null,fe=!1}function Sa(e){ht===null?ht=[e]:ht.push(e)}var Rh=Ot.ReactCurrentBatchConfig;function xr(e,t,n){if(e=n.ref,e!==null&&typeof e!="function"&&typeof e!="object"){if(n._owner){if(n=n._owner,n){if(n.tag!==1)throw Error(A(309));var r=n.stateNode}if(!r)throw Error(A(147,e));var o=r,s=""+e;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===s?t.ref:(t=function(i){var l=o.refs;i===null?delete l[s]:l[s]=i},t._stringRef=s,t)}if(typeof e!="string")throw Error(A(284));if(!n._owner)throw Error(A(290,e))}return e}function Ro(e,t){throw e=Object.prototype.toString.call(t),Error(A(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function Ou(e){var t=e._init;return t(e._payload)}function mf(e){function t(_,d){if(e){var f=_.deletions;f===null?(_.deletions=[d],_.flags|=16):f.push(d)}}function n(_,d){if(!e)return null;for(;d!==null;)t(_,d),d=d.sibling;return null}function r(_,d){for(_=new Map;d!==null;)d.key!==null?_.set(d.key,d):_.set(d.index,d),d=d.sibling;return _}function o(_,d){return _=en(_,d),_.index=0,_.sibling=null,_}function s(_,d,f){return _.index=f,e?(f=_.alternate,f!==null?(f=f.index,f<d?(_.flags|=2,d):f):(_.flags|=2,d)):(_.flags|=1048576,d)}function i(_){return e&&_.alternate===null&&(_.flags|=2),_}function l(_,d,f,y){return d===null||d.tag!==6?(d=Oi(f,_.mode,y),d.return=_,d):(d=o(d,f),d.return=_,d)}function u(_,d,f,y){var w=f.type;return w===zn?p(_,d,f.props.children,y,f.key):d!==null&&(d.elementType===w||typeof w=="object"&&w!==null&&w.$$typeof===$t&&Ou(w)===d.type)?(y=o(d,f.props),y.ref=xr(_,d,f),y.return=_,y):(y=rs(f.type,f.key,f.props,null,_.mode,y),y.ref=xr(_,d,f),y.return=_,y)}function c(_,d,f,y){return d===null||d.tag!==4||d.stateNode.containerInfo!==f.containerInfo||d.stateNode.implementation!==f.implementation?(d=zi(f,_.mode,y),d.return=_,d):(d=o(d,f.children||[]),d.return=_,d)}function p(_,d,f,y,w){return d===null||d.tag!==7?(d=wn(f,_.mode,y,w),d.return=_,d):(d=o(d,f),d.return=_,d)}function m(_,d,f){if(typeof d=="string"&&d!==""||typeof d=="number")return d=Oi(""+d,_.mode,f),d.return=_,d;if(typeof d=="object"&&d!==null){switch(d.$$typeof){case No:return f=rs(d.type,d.key,d.props,null,_.mode,f),f.ref=xr(_,null,d),f.return=_,f;case On:return d=zi(d,_.mode,f),d.return=_,d;case $t:var y=d._init;return m(_,y(d._payload),f)}if(jr(d)||hr(d))return d=wn(d,_.mode,f,null),d.return=_,d;Ro(_,d)}return null}function h(_,d,f,y){var w=d!==null?d.key:null;if(typeof f=="string"&&f!==""||typeof f=="number")return w!==null?null:l(_,d,""+f,y);if(typeof f=="object"&&f!==null){switch(f.$$typeof){case No:return f.key===w?u(_,d,f,y):null;case On:return f.key===w?c(_,d,f,y):null;case $t:return w=f._init,h(_,d,w(f._payload),y)}if(jr(f)||hr(f))return w!==null?null:p(_,d,f,y,null);Ro(_,f)}return null}function g(_,d,f,y,w){if(typeof y=="string"&&y!==""||typeof y=="number")return _=_.get(f)||null,l(d,_,""+y,w);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case No:return _=_.get(y.key===null?f:y.key)||null,u(d,_,y,w);case On:return _=_.get(y.key===null?f:y.key)||null,c(d,_,y,w);case $t:var S=y._init;return g(_,d,f,S(y._payload),w)}if(jr(y)||hr(y))return _=_.get(f)||null,p(d,_,y,w,null);Ro(d,y)}return null}function v(_,d,f,y){for(var w=null,S=null,M=d,C=d=0,z=null;M!==null&&C<f.length;C++){M.index>C?(z=M,M=null):z=M.sibling;var P=h(_,M,f[C],y);if(P===null){M===null&&(M=z);break}e&&M&&P.alternate===null&&t(_,M),d=s(P,d,C),S===null?w=P:S.sibling=P,S=P,M=z}if(C===f.length)return n(_,M),fe&&cn(_,C),w;if(M===null){for(;C<f.length;C++)M=m(_,f[C],y),M!==null&&(d=s(M,d,C),S===null?w=M:S.sibling=M,S=M);return fe&&cn(_,C),w}for(M=r(_,M);C<f.length;C++)z=g(M,_,C,f[C],y),z!==null&&(e&&z.alternate!==null&&M.delete(z.key===null?C:z.key),d=s(z,d,C),S===null?w=z:S.sibling=z,S=z);return e&&M.forEach(function(te){return t(_,te)}),fe&&cn(_,C),w}function x(_,d,f,y){var w=hr(f);if(typeof w!="function")throw Error(A(150));if(f=w.call(f),f==null)throw Error(A(151));for(var S=w=null,M=d,C=d=0,z=null,P=f.next();M!==null&&!P.done;C++,P=f.next()){M.index>C?(z=M,M=null):z=M.sibling;var te=h(_,M,P.value,y);if(te===null){M===null&&(M=z);break}e&&M&&te.alternate===null&&t(_,M),d=s(te,d,C),S===null?w=te:S.sibling=te,S=te,M=z}if(P.done)return n(_,M),fe&&cn(_,C),w;if(M===null){for(;!P.done;C++,P=f.next())P=m(_,P.value,y),P!==null&&(d=s(P,d,C),S===null?w=P:S.sibling=P,S=P);return fe&&cn(_,C),w}for(M=r(_,M);!P.done;C++,P=f.next())P=g(M,_,C,P.value,y),P!==null&&(e&&P.alternate!==null&&M.delete(P.key===null?C:P.key),d=s(P,d,C),S===null?w=P:S.sibling=P,S=P);return e&&M.forEach(function(W){return t(_,W)}),fe&&cn(_,C),w}function L(_,d,f,y){if(typeof f=="object"&&f!==null&&f.type===zn&&f.key===null&&(f=f.props.children),typeof f=="object"&&f!==null){switch(f.$$typeof){case No:e:{for(var w=f.key,S=d;S!==null;){if(S.key===w){if(w=f.type,w===zn){if(S.tag===7){n(_,S.sibling),d=o(S,f.props.children),d.return=_,_=d;break e}}else if(S.elementType===w||typeof w=="object"&&w!==null&&w.$$typeof===$t&&Ou(w)===S.type){n(_,S.sibling),d=o(S,f.props),d.ref=xr(_,S,f),d.return=_,_=d;break e}n(_,S);break}else t(_,S);S=S.sibling}f.type===zn?(d=wn(f.props.children,_.mode,y,f.key),d.return=_,_=d):(y=rs(f.type,f.key,f.props,null,_.mode,y),y.ref=xr(_,d,f),y.return=_,_=y)}return i(_);case On:e:{for(S=f.key;d!==null;){if(d.key===S)if(d.tag===4&&d.stateNode.containerInfo===f.containerInfo&&d.stateNode.implementation===f.implementation){n(_,d.sibling),d=o(d,f.children||[]),d.return=_,_=d;break e}else{n(_,d);break}else t(_,d);d=d.sibling}d=zi(f,_.mode,y),d.return=_,_=d}return i(_);case $t:return S=f._init,L(_,d,S(f._payload),y)}if(jr(f))return v(_,d,f,y);if(hr(f))return x(_,d,f,y);Ro(_,f)}return typeof f=="string"&&f!==""||typeof f=="number"?(f=""+f,d!==null&&d.tag===6?(n(_,d.sibling),d=o(d,f),d.return=_,_=d):(n(_,d),d=Oi(f,_.mode,y),d.return=_,_=d),i(_)):n(_,d)}return L}var rr=mf(!0),hf=mf(!1),ws=sn(null),Ss=null,Un=null,ka=null;function Na(){ka=Un=Ss=null}function Ea(e){var t=ws.current;de(ws),e._currentValue=t}function Ll(e,t,n){for(;e!==null;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,r!==null&&(r.childLanes|=t)):r!==null&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function qn(e,t){Ss=e,ka=Un=null,e=e.dependencies,e!==null&&e.firstContext!==null&&(e.lanes&t&&(He=!0),e.firstContext=null)}function ct(e){var t=e._currentValue;if(ka!==e)if(e={context:e,memoizedValue:t,next:null},Un===null){if(Ss===null)throw Error(A(308));Un=e,Ss.dependencies={lanes:0,firstContext:e}}else Un=Un.next=e;return t}var _n=null;function Ca(e){_n===null?_n=[e]:_n.push(e)}function _f(e,t,n,r){var o=t.interleaved;return o===null?(n.next=n,Ca(t)):(n.next=o.next,o.next=n),t.interleaved=n,Pt(e,r)}function Pt(e,t){e.lanes|=t;var n=e.alternate;for(n!==null&&(n.lanes|=t),n=e,e=e.return;e!==null;)e.childLanes|=t,n=e.alternate,n!==null&&(n.childLanes|=t),n=e,e=e.return;return n.tag===3?n.stateNode:null}var Ft=!1;function ja(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function yf(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function bt(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Zt(e,t,n){var r=e.updateQueue;if(r===null)return null;if(r=r.shared,ne&2){var o=r.pending;return o===null?t.next=t:(t.next=o.next,o.next=t),r.pending=t,Pt(e,n)}return o=r.interleaved,o===null?(t.next=t,Ca(r)):(t.next=o.next,o.next=t),r.interleaved=t,Pt(e,n)}function Zo(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194240)!==0)){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,fa(e,n)}}function zu(e,t){var n=e.updateQueue,r=e.alternate;if(r!==null&&(r=r.updateQueue,n===r)){var o=null,s=null;if(n=n.firstBaseUpdate,n!==null){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};s===null?o=s=i:s=s.next=i,n=n.next}while(n!==null);s===null?o=s=t:s=s.next=t}else o=s=t;n={baseState:r.baseState,firstBaseUpdate:o,lastBaseUpdate:s,shared:r.shared,effects:r.effects},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function ks(e,t,n,r){var o=e.updateQueue;Ft=!1;var s=o.firstBaseUpdate,i=o.lastBaseUpdate,l=o.shared.pending;if(l!==null){o.shared.pending=null;var u=l,c=u.next;u.next=null,i===null?s=c:i.next=c,i=u;var p=e.alternate;p!==null&&(p=p.updateQueue,l=p.lastBaseUpdate,l!==i&&(l===null?p.firstBaseUpdate=c:l.next=c,p.lastBaseUpdate=u))}if(s!==null){var m=o.baseState;i=0,p=c=u=null,l=s;do{var h=l.lane,g=l.eventTime;if((r&h)===h){p!==null&&(p=p.next={eventTime:g,lane:0,tag:l.tag,payload:l.payload,callback:l.callback,next:null});e:{var v=e,x=l;switch(h=t,g=n,x.tag){case 1:if(v=x.payload,typeof v=="function"){m=v.call(g,m,h);break e}m=v;break e;case 3:v.flags=v.flags&-65537|128;case 0:if(v=x.payload,h=typeof v=="function"?v.call(g,m,h):v,h==null)break e;m=he({},m,h);break e;case 2:Ft=!0}}l.callback!==null&&l.lane!==0&&(e.flags|=64,h=o.effects,h===null?o.effects=[l]:h.push(l))}else g={eventTime:g,lane:h,tag:l.tag,payload:l.payload,callback:l.callback,next:null},p===null?(c=p=g,u=m):p=p.next=g,i|=h;if(l=l.next,l===null){if(l=o.shared.pending,l===null)break;h=l,l=h.next,h.next=null,o.lastBaseUpdate=h,o.shared.pending=null}}while(!0);if(p===null&&(u=m),o.baseState=u,o.firstBaseUpdate=c,o.lastBaseUpdate=p,t=o.shared.interleaved,t!==null){o=t;do i|=o.lane,o=o.next;while(o!==t)}else s===null&&(o.shared.lanes=0);Cn|=i,e.lanes=i,e.memoizedState=m}}function Du(e,t,n){if(e=t.effects,t.effects=null,e!==null)for(t=0;t<e.length;t++){var r=e[t],o=r.callback;if(o!==null){if(r.callback=null,r=n,typeof o!="function")throw Error(A(191,o));o.call(r)}}}var mo={},Nt=sn(mo),to=sn(mo),no=sn(mo);function yn(e){if(e===mo)throw Error(A(174));return e}function Ma(e,t){switch(ue(no,t),ue(to,e),ue(Nt,mo),e=t.nodeType,e){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:ul(null,"");break;default:e=e===8?t.parentNode:t,t=e.namespaceURI||null,e=e.tagName,t=ul(t,e)}de(Nt),ue(Nt,t)}function or(){de(Nt),de(to),de(no)}function vf(e){yn(no.current);var t=yn(Nt.current),n=ul(t,e.type);t!==n&&(ue(to,e),ue(Nt,n))}function La(e){to.current===e&&(de(Nt),de(to))}var pe=sn(0);function Ns(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||n.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Ti=[];function Ta(){for(var e=0;e<Ti.length;e++)Ti[e]._workInProgressVersionPrimary=null;Ti.length=0}var qo=Ot.ReactCurrentDispatcher,bi=Ot.ReactCurrentBatchConfig,En=0,me=null,ke=null,Ee=null,Es=!1,Dr=!1,ro=0,Oh=0;function Ie(){throw Error(A(321))}function ba(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!vt(e[n],t[n]))return!1;return!0}function Ia(e,t,n,r,o,s){if(En=s,me=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,qo.current=e===null||e.memoizedState===null?$h:Fh,e=n(r,o),Dr){s=0;do{if(Dr=!1,ro=0,25<=s)throw Error(A(301));s+=1,Ee=ke=null,t.updateQueue=null,qo.current=Xh,e=n(r,o)}while(Dr)}if(qo.current=Cs,t=ke!==null&&ke.next!==null,En=0,Ee=ke=me=null,Es=!1,t)throw Error(A(300));return e}function Aa(){var e=ro!==0;return ro=0,e}function xt(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Ee===null?me.memoizedState=Ee=e:Ee=Ee.next=e,Ee}function dt(){if(ke===null){var e=me.alternate;e=e!==null?e.memoizedState:null}else e=ke.next;var t=Ee===null?me.memoizedState:Ee.next;if(t!==null)Ee=t,ke=e;else{if(e===null)throw Error(A(310));ke=e,e={memoizedState:ke.memoizedState,baseState:ke.baseState,baseQueue:ke.baseQueue,queue:ke.queue,next:null},Ee===null?me.memoizedState=Ee=e:Ee=Ee.next=e}return Ee}function oo(e,t){return typeof t=="function"?t(e):t}function Ii(e){var t=dt(),n=t.queue;if(n===null)throw Error(A(311));n.lastRenderedReducer=e;var r=ke,o=r.baseQueue,s=n.pending;if(s!==null){if(o!==null){var i=o.next;o.next=s.next,s.next=i}r.baseQueue=o=s,n.pending=null}if(o!==null){s=o.next,r=r.baseState;var l=i=null,u=null,c=s;do{var p=c.lane;if((En&p)===p)u!==null&&(u=u.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var m={lane:p,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};u===null?(l=u=m,i=r):u=u.next=m,me.lanes|=p,Cn|=p}c=c.next}while(c!==null&&c!==s);u===null?i=r:u.next=l,vt(r,t.memoizedState)||(He=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=u,n.lastRenderedState=r}if(e=n.interleaved,e!==null){o=e;do s=o.lane,me.lanes|=s,Cn|=s,o=o.next;while(o!==e)}else o===null&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Ai(e){var t=dt(),n=t.queue;if(n===null)throw Error(A(311));n.lastRenderedReducer=e;var r=n.dispatch,o=n.pending,s=t.memoizedState;if(o!==null){n.pending=null;var i=o=o.next;do s=e(s,i.action),i=i.next;while(i!==o);vt(s,t.memoizedState)||(He=!0),t.memoizedState=s,t.baseQueue===null&&(t.baseState=s),n.lastRenderedState=s}return[s,r]}function gf(){}function xf(e,t){var n=me,r=dt(),o=t(),s=!vt(r.memoizedState,o);if(s&&(r.memoizedState=o,He=!0),r=r.queue,Pa(kf.bind(null,n,r,e),[e]),r.getSnapshot!==t||s||Ee!==null&&Ee.memoizedState.tag&1){if(n.flags|=2048,so(9,Sf.bind(null,n,r,o,t),void 0,null),Ce===null)throw Error(A(349));En&30||wf(n,t,o)}return o}function wf(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=me.updateQueue,t===null?(t={lastEffect:null,stores:null},me.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function Sf(e,t,n,r){t.value=n,t.getSnapshot=r,Nf(t)&&Ef(e)}function kf(e,t,n){return n(function(){Nf(t)&&Ef(e)})}function Nf(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!vt(e,n)}catch{return!0}}function Ef(e){var t=Pt(e,1);t!==null&&yt(t,e,1,-1)}function Bu(e){var t=xt();return typeof e=="function"&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:oo,lastRenderedState:e},t.queue=e,e=e.dispatch=Bh.bind(null,me,e),[t.memoizedState,e]}function so(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},t=me.updateQueue,t===null?(t={lastEffect:null,stores:null},me.updateQueue=t,t.lastEffect=e.next=e):(n=t.lastEffect,n===null?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e)),e}function Cf(){return dt().memoizedState}function Jo(e,t,n,r){var o=xt();me.flags|=e,o.memoizedState=so(1|t,n,void 0,r===void 0?null:r)}function Ks(e,t,n,r){var o=dt();r=r===void 0?null:r;var s=void 0;if(ke!==null){var i=ke.memoizedState;if(s=i.destroy,r!==null&&ba(r,i.deps)){o.memoizedState=so(t,n,s,r);return}}me.flags|=e,o.memoizedState=so(1|t,n,s,r)}function $u(e,t){return Jo(8390656,8,e,t)}function Pa(e,t){return Ks(2048,8,e,t)}function jf(e,t){return Ks(4,2,e,t)}function Mf(e,t){return Ks(4,4,e,t)}function Lf(e,t){if(typeof t=="function")return e=e(),t(e),function(){t(null)};if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Tf(e,t,n){return n=n!=null?n.concat([e]):null,Ks(4,4,Lf.bind(null,t,e),n)}function Ra(){}function bf(e,t){var n=dt();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&ba(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function If(e,t){var n=dt();t=t===void 0?null:t;var r=n.memoizedState;return r!==null&&t!==null&&ba(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Af(e,t,n){return En&21?(vt(n,t)||(n=zd(),me.lanes|=n,Cn|=n,e.baseState=!0),t):(e.baseState&&(e.baseState=!1,He=!0),e.memoizedState=n)}function zh(e,t){var n=ie;ie=n!==0&&4>n?n:4,e(!0);var r=bi.transition;bi.transition={};try{e(!1),t()}finally{ie=n,bi.transition=r}}function Pf(){return dt().memoizedState}function Dh(e,t,n){var r=Jt(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Rf(e))Of(t,n);else if(n=_f(e,t,n,r),n!==null){var o=$e();yt(n,e,r,o),zf(n,t,r)}}function Bh(e,t,n){var r=Jt(e),o={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Rf(e))Of(t,o);else{var s=e.alternate;if(e.lanes===0&&(s===null||s.lanes===0)&&(s=t.lastRenderedReducer,s!==null))try{var i=t.lastRenderedState,l=s(i,n);if(o.hasEagerState=!0,o.eagerState=l,vt(l,i)){var u=t.interleaved;u===null?(o.next=o,Ca(t)):(o.next=u.next,u.next=o),t.interleaved=o;return}}catch{}finally{}n=_f(e,t,o,r),n!==null&&(o=$e(),yt(n,e,r,o),zf(n,t,r))}}function Rf(e){var t=e.alternate;return e===me||t!==null&&t===me}function Of(e,t){Dr=Es=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function zf(e,t,n){if(n&4194240){var r=t.lanes;r&=e.pendingLanes,n|=r,t.lanes=n,fa(e,n)}}var Cs={readContext:ct,useCallback:Ie,useContext:Ie,useEffect:Ie,useImperativeHandle:Ie,useInsertionEffect:Ie,useLayoutEffect:Ie,useMemo:Ie,useReducer:Ie,useRef:Ie,useState:Ie,useDebugValue:Ie,useDeferredValue:Ie,useTransition:Ie,useMutableSource:Ie,useSyncExternalStore:Ie,useId:Ie,unstable_isNewReconciler:!1},$h={readContext:ct,useCallback:function(e,t){return xt().memoizedState=[e,t===void 0?null:t],e},useContext:ct,useEffect:$u,useImperativeHandle:function(e,t,n){return n=n!=null?n.concat([e]):null,Jo(4194308,4,Lf.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Jo(4194308,4,e,t)},useInsertionEffect:function(e,t){return Jo(4,2,e,t)},useMemo:function(e,t){var n=xt();return t=t===void 0?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=xt();return t=n!==void 0?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Dh.bind(null,me,e),[r.memoizedState,e]},useRef:function(e){var t=xt();return e={current:e},t.memoizedState=e},useState:Bu,useDebugValue:Ra,useDeferredValue:function(e){return xt().memoizedState=e},useTransition:function(){var e=Bu(!1),t=e[0];return e=zh.bind(null,e[1]),xt().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=me,o=xt();if(fe){if(n===void 0)throw Error(A(407));n=n()}else{if(n=t(),Ce===null)throw Error(A(349));En&30||wf(r,t,n)}o.memoizedState=n;var s={value:n,getSnapshot:t};return o.queue=s,$u(kf.bind(null,r,s,e),[e]),r.flags|=2048,so(9,Sf.bind(null,r,s,n,t),void 0,null),n},useId:function(){var e=xt(),t=Ce.identifierPrefix;if(fe){var n=Tt,r=Lt;n=(r&~(1<<32-_t(r)-1)).toString(32)+n,t=":"+t+"R"+n,n=ro++,0<n&&(t+="H"+n.toString(32)),t+=":"}else n=Oh++,t=":"+t+"r"+n.toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},Fh={readContext:ct,useCallback:bf,useContext:ct,useEffect:Pa,useImperativeHandle:Tf,useInsertionEffect:jf,useLayoutEffect:Mf,useMemo:If,useReducer:Ii,useRef:Cf,useState:function(){return Ii(oo)},useDebugValue:Ra,useDeferredValue:function(e){var t=dt();return Af(t,ke.memoizedState,e)},useTransition:function(){var e=Ii(oo)[0],t=dt().memoizedState;return[e,t]},useMutableSource:gf,useSyncExternalStore:xf,useId:Pf,unstable_isNewReconciler:!1},Xh={readContext:ct,useCallback:bf,useContext:ct,useEffect:Pa,useImperativeHandle:Tf,useInsertionEffect:jf,useLayoutEffect:Mf,useMemo:If,useReducer:Ai,useRef:Cf,useState:function(){return Ai(oo)},useDebugValue:Ra,useDeferredValue:function(e){var t=dt();return ke===null?t.memoizedState=e:Af(t,ke.memoizedState,e)},useTransition:function(){var e=Ai(oo)[0],t=dt().memoizedState;return[e,t]},useMutableSource:gf,useSyncExternalStore:xf,useId:Pf,unstable_isNewReconciler:!1};function pt(e,t){if(e&&e.defaultProps){t=he({},t),e=e.defaultProps;for(var n in e)t[n]===void 0&&(t[n]=e[n]);return t}return t}function Tl(e,t,n,r){t=e.memoizedState,n=n(r,t),n=n==null?t:he({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var Qs={isMounted:function(e){return(e=e._reactInternals)?bn(e)===e:!1},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=$e(),o=Jt(e),s=bt(r,o);s.payload=t,n!=null&&(s.callback=n),t=Zt(e,s,o),t!==null&&(yt(t,e,o,r),Zo(t,e,o))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=$e(),o=Jt(e),s=bt(r,o);s.tag=1,s.payload=t,n!=null&&(s.callback=n),t=Zt(e,s,o),t!==null&&(yt(t,e,o,r),Zo(t,e,o))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=$e(),r=Jt(e),o=bt(n,r);o.tag=2,t!=null&&(o.callback=t),t=Zt(e,o,r),t!==null&&(yt(t,e,r,n),Zo(t,e,r))}};function Fu(e,t,n,r,o,s,i){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(r,s,i):t.prototype&&t.prototype.isPureReactComponent?!Zr(n,r)||!Zr(o,s):!0}function Df(e,t,n){var r=!1,o=rn,s=t.contextType;return typeof s=="object"&&s!==null?s=ct(s):(o=Ge(t)?kn:Re.current,r=t.contextTypes,s=(r=r!=null)?tr(e,o):rn),t=new t(n,s),e.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=Qs,e.stateNode=t,t._reactInternals=e,r&&(e=e.stateNode,e.__reactInternalMemoizedUnmaskedChildContext=o,e.__reactInternalMemoizedMaskedChildContext=s),t}function Xu(e,t,n,r){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,r),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&Qs.enqueueReplaceState(t,t.state,null)}function bl(e,t,n,r){var o=e.stateNode;o.props=n,o.state=e.memoizedState,o.refs={},ja(e);var s=t.contextType;typeof s=="object"&&s!==null?o.context=ct(s):(s=Ge(t)?kn:Re.current,o.context=tr(e,s)),o.state=e.memoizedState,s=t.getDerivedStateFromProps,typeof s=="function"&&(Tl(e,t,s,n),o.state=e.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof o.getSnapshotBeforeUpdate=="function"||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(t=o.state,typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount(),t!==o.state&&Qs.enqueueReplaceState(o,o.state,null),ks(e,n,o,r),o.state=e.memoizedState),typeof o.componentDidMount=="function"&&(e.flags|=4194308)}function sr(e,t){try{var n="",r=t;do n+=_m(r),r=r.return;while(r);var o=n}catch(s){o=`
-Error generating stack: `+s.message+`
-`+s.stack}return{value:e,source:t,stack:o,digest:null}}function Pi(e,t,n){return{value:e,source:null,stack:n??null,digest:t??null}}function Il(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var Yh=typeof WeakMap=="function"?WeakMap:Map;function Bf(e,t,n){n=bt(-1,n),n.tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Ms||(Ms=!0,Xl=r),Il(e,t)},n}function $f(e,t,n){n=bt(-1,n),n.tag=3;var r=e.type.getDerivedStateFromError;if(typeof r=="function"){var o=t.value;n.payload=function(){return r(o)},n.callback=function(){Il(e,t)}}var s=e.stateNode;return s!==null&&typeof s.componentDidCatch=="function"&&(n.callback=function(){Il(e,t),typeof r!="function"&&(qt===null?qt=new Set([this]):qt.add(this));var i=t.stack;this.componentDidCatch(t.value,{componentStack:i!==null?i:""})}),n}function Yu(e,t,n){var r=e.pingCache;if(r===null){r=e.pingCache=new Yh;var o=new Set;r.set(t,o)}else o=r.get(t),o===void 0&&(o=new Set,r.set(t,o));o.has(n)||(o.add(n),e=r_.bind(null,e,t,n),t.then(e,e))}function Wu(e){do{var t;if((t=e.tag===13)&&(t=e.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return e;e=e.return}while(e!==null);return null}function Uu(e,t,n,r,o){return e.mode&1?(e.flags|=65536,e.lanes=o,e):(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,n.tag===1&&(n.alternate===null?n.tag=17:(t=bt(-1,1),t.tag=2,Zt(n,t,1))),n.lanes|=1),e)}var Wh=Ot.ReactCurrentOwner,He=!1;function De(e,t,n,r){t.child=e===null?hf(t,null,n,r):rr(t,e.child,n,r)}function Hu(e,t,n,r,o){n=n.render;var s=t.ref;return qn(t,o),r=Ia(e,t,n,r,s,o),n=Aa(),e!==null&&!He?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~o,Rt(e,t,o)):(fe&&n&&xa(t),t.flags|=1,De(e,t,r,o),t.child)}function Vu(e,t,n,r,o){if(e===null){var s=n.type;return typeof s=="function"&&!Ya(s)&&s.defaultProps===void 0&&n.compare===null&&n.defaultProps===void 0?(t.tag=15,t.type=s,Ff(e,t,s,r,o)):(e=rs(n.type,null,r,t,t.mode,o),e.ref=t.ref,e.return=t,t.child=e)}if(s=e.child,!(e.lanes&o)){var i=s.memoizedProps;if(n=n.compare,n=n!==null?n:Zr,n(i,r)&&e.ref===t.ref)return Rt(e,t,o)}return t.flags|=1,e=en(s,r),e.ref=t.ref,e.return=t,t.child=e}function Ff(e,t,n,r,o){if(e!==null){var s=e.memoizedProps;if(Zr(s,r)&&e.ref===t.ref)if(He=!1,t.pendingProps=r=s,(e.lanes&o)!==0)e.flags&131072&&(He=!0);else return t.lanes=e.lanes,Rt(e,t,o)}return Al(e,t,n,r,o)}function Xf(e,t,n){var r=t.pendingProps,o=r.children,s=e!==null?e.memoizedState:null;if(r.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},ue(Vn,Ze),Ze|=n;else{if(!(n&1073741824))return e=s!==null?s.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,ue(Vn,Ze),Ze|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=s!==null?s.baseLanes:n,ue(Vn,Ze),Ze|=r}else s!==null?(r=s.baseLanes|n,t.memoizedState=null):r=n,ue(Vn,Ze),Ze|=r;return De(e,t,o,n),t.child}function Yf(e,t){var n=t.ref;(e===null&&n!==null||e!==null&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function Al(e,t,n,r,o){var s=Ge(n)?kn:Re.current;return s=tr(t,s),qn(t,o),n=Ia(e,t,n,r,s,o),r=Aa(),e!==null&&!He?(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~o,Rt(e,t,o)):(fe&&r&&xa(t),t.flags|=1,De(e,t,n,o),t.child)}function Gu(e,t,n,r,o){if(Ge(n)){var s=!0;vs(t)}else s=!1;if(qn(t,o),t.stateNode===null)es(e,t),Df(t,n,r),bl(t,n,r,o),r=!0;else if(e===null){var i=t.stateNode,l=t.memoizedProps;i.props=l;var u=i.context,c=n.contextType;typeof c=="object"&&c!==null?c=ct(c):(c=Ge(n)?kn:Re.current,c=tr(t,c));var p=n.getDerivedStateFromProps,m=typeof p=="function"||typeof i.getSnapshotBeforeUpdate=="function";m||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(l!==r||u!==c)&&Xu(t,i,r,c),Ft=!1;var h=t.memoizedState;i.state=h,ks(t,r,i,o),u=t.memoizedState,l!==r||h!==u||Ve.current||Ft?(typeof p=="function"&&(Tl(t,n,p,r),u=t.memoizedState),(l=Ft||Fu(t,n,l,r,h,u,c))?(m||typeof i.UNSAFE_componentWillMount!="function"&&typeof i.componentWillMount!="function"||(typeof i.componentWillMount=="function"&&i.componentWillMount(),typeof i.UNSAFE_componentWillMount=="function"&&i.UNSAFE_componentWillMount()),typeof i.componentDidMount=="function"&&(t.flags|=4194308)):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=u),i.props=r,i.state=u,i.context=c,r=l):(typeof i.componentDidMount=="function"&&(t.flags|=4194308),r=!1)}else{i=t.stateNode,yf(e,t),l=t.memoizedProps,c=t.type===t.elementType?l:pt(t.type,l),i.props=c,m=t.pendingProps,h=i.context,u=n.contextType,typeof u=="object"&&u!==null?u=ct(u):(u=Ge(n)?kn:Re.current,u=tr(t,u));var g=n.getDerivedStateFromProps;(p=typeof g=="function"||typeof i.getSnapshotBeforeUpdate=="function")||typeof i.UNSAFE_componentWillReceiveProps!="function"&&typeof i.componentWillReceiveProps!="function"||(l!==m||h!==u)&&Xu(t,i,r,u),Ft=!1,h=t.memoizedState,i.state=h,ks(t,r,i,o);var v=t.memoizedState;l!==m||h!==v||Ve.current||Ft?(typeof g=="function"&&(Tl(t,n,g,r),v=t.memoizedState),(c=Ft||Fu(t,n,c,r,h,v,u)||!1)?(p||typeof i.UNSAFE_componentWillUpdate!="function"&&typeof i.componentWillUpdate!="function"||(typeof i.componentWillUpdate=="function"&&i.componentWillUpdate(r,v,u),typeof i.UNSAFE_componentWillUpdate=="function"&&i.UNSAFE_componentWillUpdate(r,v,u)),typeof i.componentDidUpdate=="function"&&(t.flags|=4),typeof i.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof i.componentDidUpdate!="function"||l===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||l===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=v),i.props=r,i.state=v,i.context=u,r=c):(typeof i.componentDidUpdate!="function"||l===e.memoizedProps&&h===e.memoizedState||(t.flags|=4),typeof i.getSnapshotBeforeUpdate!="function"||l===e.memoizedProps&&h===e.memoizedState||(t.flags|=1024),r=!1)}return Pl(e,t,n,r,s,o)}function Pl(e,t,n,r,o,s){Yf(e,t);var i=(t.flags&128)!==0;if(!r&&!i)return o&&Au(t,n,!1),Rt(e,t,s);r=t.stateNode,Wh.current=t;var l=i&&typeof n.getDerivedStateFromError!="function"?null:r.render();return t.flags|=1,e!==null&&i?(t.child=rr(t,e.child,null,s),t.child=rr(t,null,l,s)):De(e,t,l,s),t.memoizedState=r.state,o&&Au(t,n,!0),t.child}function Wf(e){var t=e.stateNode;t.pendingContext?Iu(e,t.pendingContext,t.pendingContext!==t.context):t.context&&Iu(e,t.context,!1),Ma(e,t.containerInfo)}function Ku(e,t,n,r,o){return nr(),Sa(o),t.flags|=256,De(e,t,n,r),t.child}var Rl={dehydrated:null,treeContext:null,retryLane:0};function Ol(e){return{baseLanes:e,cachePool:null,transitions:null}}function Uf(e,t,n){var r=t.pendingProps,o=pe.current,s=!1,i=(t.flags&128)!==0,l;if((l=i)||(l=e!==null&&e.memoizedState===null?!1:(o&2)!==0),l?(s=!0,t.flags&=-129):(e===null||e.memoizedState!==null)&&(o|=1),ue(pe,o&1),e===null)return Ml(t),e=t.memoizedState,e!==null&&(e=e.dehydrated,e!==null)?(t.mode&1?e.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(i=r.children,e=r.fallback,s?(r=t.mode,s=t.child,i={mode:"hidden",children:i},!(r&1)&&s!==null?(s.childLanes=0,s.pendingProps=i):s=Js(i,r,0,null),e=wn(e,r,n,null),s.return=t,e.return=t,s.sibling=e,t.child=s,t.child.memoizedState=Ol(n),t.memoizedState=Rl,e):Oa(t,i));if(o=e.memoizedState,o!==null&&(l=o.dehydrated,l!==null))return Uh(e,t,i,r,l,o,n);if(s){s=r.fallback,i=t.mode,o=e.child,l=o.sibling;var u={mode:"hidden",children:r.children};return!(i&1)&&t.child!==o?(r=t.child,r.childLanes=0,r.pendingProps=u,t.deletions=null):(r=en(o,u),r.subtreeFlags=o.subtreeFlags&14680064),l!==null?s=en(l,s):(s=wn(s,i,n,null),s.flags|=2),s.return=t,r.return=t,r.sibling=s,t.child=r,r=s,s=t.child,i=e.child.memoizedState,i=i===null?Ol(n):{baseLanes:i.baseLanes|n,cachePool:null,transitions:i.transitions},s.memoizedState=i,s.childLanes=e.childLanes&~n,t.memoizedState=Rl,r}return s=e.child,e=s.sibling,r=en(s,{mode:"visible",children:r.children}),!(t.mode&1)&&(r.lanes=n),r.return=t,r.sibling=null,e!==null&&(n=t.deletions,n===null?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=r,t.memoizedState=null,r}function Oa(e,t){return t=Js({mode:"visible",children:t},e.mode,0,null),t.return=e,e.child=t}function Oo(e,t,n,r){return r!==null&&Sa(r),rr(t,e.child,null,n),e=Oa(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Uh(e,t,n,r,o,s,i){if(n)return t.flags&256?(t.flags&=-257,r=Pi(Error(A(422))),Oo(e,t,i,r)):t.memoizedState!==null?(t.child=e.child,t.flags|=128,null):(s=r.fallback,o=t.mode,r=Js({mode:"visible",children:r.children},o,0,null),s=wn(s,o,i,null),s.flags|=2,r.return=t,s.return=t,r.sibling=s,t.child=r,t.mode&1&&rr(t,e.child,null,i),t.child.memoizedState=Ol(i),t.memoizedState=Rl,s);if(!(t.mode&1))return Oo(e,t,i,null);if(o.data==="$!"){if(r=o.nextSibling&&o.nextSibling.dataset,r)var l=r.dgst;return r=l,s=Error(A(419)),r=Pi(s,r,void 0),Oo(e,t,i,r)}if(l=(i&e.childLanes)!==0,He||l){if(r=Ce,r!==null){switch(i&-i){case 4:o=2;break;case 16:o=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:o=32;break;case 536870912:o=268435456;break;default:o=0}o=o&(r.suspendedLanes|i)?0:o,o!==0&&o!==s.retryLane&&(s.retryLane=o,Pt(e,o),yt(r,e,o,-1))}return Xa(),r=Pi(Error(A(421))),Oo(e,t,i,r)}return o.data==="$?"?(t.flags|=128,t.child=e.child,t=o_.bind(null,e),o._reactRetry=t,null):(e=s.treeContext,qe=Qt(o.nextSibling),et=t,fe=!0,ht=null,e!==null&&(st[it++]=Lt,st[it++]=Tt,st[it++]=Nn,Lt=e.id,Tt=e.overflow,Nn=t),t=Oa(t,r.children),t.flags|=4096,t)}function Qu(e,t,n){e.lanes|=t;var r=e.alternate;r!==null&&(r.lanes|=t),Ll(e.return,t,n)}function Ri(e,t,n,r,o){var s=e.memoizedState;s===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:o}:(s.isBackwards=t,s.rendering=null,s.renderingStartTime=0,s.last=r,s.tail=n,s.tailMode=o)}function Hf(e,t,n){var r=t.pendingProps,o=r.revealOrder,s=r.tail;if(De(e,t,r.children,n),r=pe.current,r&2)r=r&1|2,t.flags|=128;else{if(e!==null&&e.flags&128)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Qu(e,n,t);else if(e.tag===19)Qu(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(ue(pe,r),!(t.mode&1))t.memoizedState=null;else switch(o){case"forwards":for(n=t.child,o=null;n!==null;)e=n.alternate,e!==null&&Ns(e)===null&&(o=n),n=n.sibling;n=o,n===null?(o=t.child,t.child=null):(o=n.sibling,n.sibling=null),Ri(t,!1,o,n,s);break;case"backwards":for(n=null,o=t.child,t.child=null;o!==null;){if(e=o.alternate,e!==null&&Ns(e)===null){t.child=o;break}e=o.sibling,o.sibling=n,n=o,o=e}Ri(t,!0,n,null,s);break;case"together":Ri(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function es(e,t){!(t.mode&1)&&e!==null&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Rt(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Cn|=t.lanes,!(n&t.childLanes))return null;if(e!==null&&t.child!==e.child)throw Error(A(153));if(t.child!==null){for(e=t.child,n=en(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=en(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function Hh(e,t,n){switch(t.tag){case 3:Wf(t),nr();break;case 5:vf(t);break;case 1:Ge(t.type)&&vs(t);break;case 4:Ma(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,o=t.memoizedProps.value;ue(ws,r._currentValue),r._currentValue=o;break;case 13:if(r=t.memoizedState,r!==null)return r.dehydrated!==null?(ue(pe,pe.current&1),t.flags|=128,null):n&t.child.childLanes?Uf(e,t,n):(ue(pe,pe.current&1),e=Rt(e,t,n),e!==null?e.sibling:null);ue(pe,pe.current&1);break;case 19:if(r=(n&t.childLanes)!==0,e.flags&128){if(r)return Hf(e,t,n);t.flags|=128}if(o=t.memoizedState,o!==null&&(o.rendering=null,o.tail=null,o.lastEffect=null),ue(pe,pe.current),r)break;return null;case 22:case 23:return t.lanes=0,Xf(e,t,n)}return Rt(e,t,n)}var Vf,zl,Gf,Kf;Vf=function(e,t){for(var n=t.child;n!==null;){if(n.tag===5||n.tag===6)e.appendChild(n.stateNode);else if(n.tag!==4&&n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break;for(;n.sibling===null;){if(n.return===null||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}};zl=function(){};Gf=function(e,t,n,r){var o=e.memoizedProps;if(o!==r){e=t.stateNode,yn(Nt.current);var s=null;switch(n){case"input":o=sl(e,o),r=sl(e,r),s=[];break;case"select":o=he({},o,{value:void 0}),r=he({},r,{value:void 0}),s=[];break;case"textarea":o=al(e,o),r=al(e,r),s=[];break;default:typeof o.onClick!="function"&&typeof r.onClick=="function"&&(e.onclick=_s)}cl(n,r);var i;n=null;for(c in o)if(!r.hasOwnProperty(c)&&o.hasOwnProperty(c)&&o[c]!=null)if(c==="style"){var l=o[c];for(i in l)l.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else c!=="dangerouslySetInnerHTML"&&c!=="children"&&c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&c!=="autoFocus"&&(Wr.hasOwnProperty(c)?s||(s=[]):(s=s||[]).push(c,null));for(c in r){var u=r[c];if(l=o!=null?o[c]:void 0,r.hasOwnProperty(c)&&u!==l&&(u!=null||l!=null))if(c==="style")if(l){for(i in l)!l.hasOwnProperty(i)||u&&u.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in u)u.hasOwnProperty(i)&&l[i]!==u[i]&&(n||(n={}),n[i]=u[i])}else n||(s||(s=[]),s.push(c,n)),n=u;else c==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,l=l?l.__html:void 0,u!=null&&l!==u&&(s=s||[]).push(c,u)):c==="children"?typeof u!="string"&&typeof u!="number"||(s=s||[]).push(c,""+u):c!=="suppressContentEditableWarning"&&c!=="suppressHydrationWarning"&&(Wr.hasOwnProperty(c)?(u!=null&&c==="onScroll"&&ce("scroll",e),s||l===u||(s=[])):(s=s||[]).push(c,u))}n&&(s=s||[]).push("style",n);var c=s;(t.updateQueue=c)&&(t.flags|=4)}};Kf=function(e,t,n,r){n!==r&&(t.flags|=4)};function wr(e,t){if(!fe)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;n!==null;)n.alternate!==null&&(r=n),n=n.sibling;r===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Ae(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,r=0;if(t)for(var o=e.child;o!==null;)n|=o.lanes|o.childLanes,r|=o.subtreeFlags&14680064,r|=o.flags&14680064,o.return=e,o=o.sibling;else for(o=e.child;o!==null;)n|=o.lanes|o.childLanes,r|=o.subtreeFlags,r|=o.flags,o.return=e,o=o.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Vh(e,t,n){var r=t.pendingProps;switch(wa(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Ae(t),null;case 1:return Ge(t.type)&&ys(),Ae(t),null;case 3:return r=t.stateNode,or(),de(Ve),de(Re),Ta(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),(e===null||e.child===null)&&(Po(t)?t.flags|=4:e===null||e.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,ht!==null&&(Ul(ht),ht=null))),zl(e,t),Ae(t),null;case 5:La(t);var o=yn(no.current);if(n=t.type,e!==null&&t.stateNode!=null)Gf(e,t,n,r,o),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(t.stateNode===null)throw Error(A(166));return Ae(t),null}if(e=yn(Nt.current),Po(t)){r=t.stateNode,n=t.type;var s=t.memoizedProps;switch(r[St]=t,r[eo]=s,e=(t.mode&1)!==0,n){case"dialog":ce("cancel",r),ce("close",r);break;case"iframe":case"object":case"embed":ce("load",r);break;case"video":case"audio":for(o=0;o<Lr.length;o++)ce(Lr[o],r);break;case"source":ce("error",r);break;case"img":case"image":case"link":ce("error",r),ce("load",r);break;case"details":ce("toggle",r);break;case"input":su(r,s),ce("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!s.multiple},ce("invalid",r);break;case"textarea":lu(r,s),ce("invalid",r)}cl(n,s),o=null;for(var i in s)if(s.hasOwnProperty(i)){var l=s[i];i==="children"?typeof l=="string"?r.textContent!==l&&(s.suppressHydrationWarning!==!0&&Ao(r.textContent,l,e),o=["children",l]):typeof l=="number"&&r.textContent!==""+l&&(s.suppressHydrationWarning!==!0&&Ao(r.textContent,l,e),o=["children",""+l]):Wr.hasOwnProperty(i)&&l!=null&&i==="onScroll"&&ce("scroll",r)}switch(n){case"input":Eo(r),iu(r,s,!0);break;case"textarea":Eo(r),au(r);break;case"select":case"option":break;default:typeof s.onClick=="function"&&(r.onclick=_s)}r=o,t.updateQueue=r,r!==null&&(t.flags|=4)}else{i=o.nodeType===9?o:o.ownerDocument,e==="http://www.w3.org/1999/xhtml"&&(e=Sd(n)),e==="http://www.w3.org/1999/xhtml"?n==="script"?(e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):typeof r.is=="string"?e=i.createElement(n,{is:r.is}):(e=i.createElement(n),n==="select"&&(i=e,r.multiple?i.multiple=!0:r.size&&(i.size=r.size))):e=i.createElementNS(e,n),e[St]=t,e[eo]=r,Vf(e,t,!1,!1),t.stateNode=e;e:{switch(i=dl(n,r),n){case"dialog":ce("cancel",e),ce("close",e),o=r;break;case"iframe":case"object":case"embed":ce("load",e),o=r;break;case"video":case"audio":for(o=0;o<Lr.length;o++)ce(Lr[o],e);o=r;break;case"source":ce("error",e),o=r;break;case"img":case"image":case"link":ce("error",e),ce("load",e),o=r;break;case"details":ce("toggle",e),o=r;break;case"input":su(e,r),o=sl(e,r),ce("invalid",e);break;case"option":o=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},o=he({},r,{value:void 0}),ce("invalid",e);break;case"textarea":lu(e,r),o=al(e,r),ce("invalid",e);break;default:o=r}cl(n,o),l=o;for(s in l)if(l.hasOwnProperty(s)){var u=l[s];s==="style"?Ed(e,u):s==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,u!=null&&kd(e,u)):s==="children"?typeof u=="string"?(n!=="textarea"||u!=="")&&Ur(e,u):typeof u=="number"&&Ur(e,""+u):s!=="suppressContentEditableWarning"&&s!=="suppressHydrationWarning"&&s!=="autoFocus"&&(Wr.hasOwnProperty(s)?u!=null&&s==="onScroll"&&ce("scroll",e):u!=null&&ia(e,s,u,i))}switch(n){case"input":Eo(e),iu(e,r,!1);break;case"textarea":Eo(e),au(e);break;case"option":r.value!=null&&e.setAttribute("value",""+nn(r.value));break;case"select":e.multiple=!!r.multiple,s=r.value,s!=null?Gn(e,!!r.multiple,s,!1):r.defaultValue!=null&&Gn(e,!!r.multiple,r.defaultValue,!0);break;default:typeof o.onClick=="function"&&(e.onclick=_s)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return Ae(t),null;case 6:if(e&&t.stateNode!=null)Kf(e,t,e.memoizedProps,r);else{if(typeof r!="string"&&t.stateNode===null)throw Error(A(166));if(n=yn(no.current),yn(Nt.current),Po(t)){if(r=t.stateNode,n=t.memoizedProps,r[St]=t,(s=r.nodeValue!==n)&&(e=et,e!==null))switch(e.tag){case 3:Ao(r.nodeValue,n,(e.mode&1)!==0);break;case 5:e.memoizedProps.suppressHydrationWarning!==!0&&Ao(r.nodeValue,n,(e.mode&1)!==0)}s&&(t.flags|=4)}else r=(n.nodeType===9?n:n.ownerDocument).createTextNode(r),r[St]=t,t.stateNode=r}return Ae(t),null;case 13:if(de(pe),r=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(fe&&qe!==null&&t.mode&1&&!(t.flags&128))pf(),nr(),t.flags|=98560,s=!1;else if(s=Po(t),r!==null&&r.dehydrated!==null){if(e===null){if(!s)throw Error(A(318));if(s=t.memoizedState,s=s!==null?s.dehydrated:null,!s)throw Error(A(317));s[St]=t}else nr(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;Ae(t),s=!1}else ht!==null&&(Ul(ht),ht=null),s=!0;if(!s)return t.flags&65536?t:null}return t.flags&128?(t.lanes=n,t):(r=r!==null,r!==(e!==null&&e.memoizedState!==null)&&r&&(t.child.flags|=8192,t.mode&1&&(e===null||pe.current&1?Ne===0&&(Ne=3):Xa())),t.updateQueue!==null&&(t.flags|=4),Ae(t),null);case 4:return or(),zl(e,t),e===null&&qr(t.stateNode.containerInfo),Ae(t),null;case 10:return Ea(t.type._context),Ae(t),null;case 17:return Ge(t.type)&&ys(),Ae(t),null;case 19:if(de(pe),s=t.memoizedState,s===null)return Ae(t),null;if(r=(t.flags&128)!==0,i=s.rendering,i===null)if(r)wr(s,!1);else{if(Ne!==0||e!==null&&e.flags&128)for(e=t.child;e!==null;){if(i=Ns(e),i!==null){for(t.flags|=128,wr(s,!1),r=i.updateQueue,r!==null&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;n!==null;)s=n,e=r,s.flags&=14680066,i=s.alternate,i===null?(s.childLanes=0,s.lanes=e,s.child=null,s.subtreeFlags=0,s.memoizedProps=null,s.memoizedState=null,s.updateQueue=null,s.dependencies=null,s.stateNode=null):(s.childLanes=i.childLanes,s.lanes=i.lanes,s.child=i.child,s.subtreeFlags=0,s.deletions=null,s.memoizedProps=i.memoizedProps,s.memoizedState=i.memoizedState,s.updateQueue=i.updateQueue,s.type=i.type,e=i.dependencies,s.dependencies=e===null?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return ue(pe,pe.current&1|2),t.child}e=e.sibling}s.tail!==null&&xe()>ir&&(t.flags|=128,r=!0,wr(s,!1),t.lanes=4194304)}else{if(!r)if(e=Ns(i),e!==null){if(t.flags|=128,r=!0,n=e.updateQueue,n!==null&&(t.updateQueue=n,t.flags|=4),wr(s,!0),s.tail===null&&s.tailMode==="hidden"&&!i.alternate&&!fe)return Ae(t),null}else 2*xe()-s.renderingStartTime>ir&&n!==1073741824&&(t.flags|=128,r=!0,wr(s,!1),t.lanes=4194304);s.isBackwards?(i.sibling=t.child,t.child=i):(n=s.last,n!==null?n.sibling=i:t.child=i,s.last=i)}return s.tail!==null?(t=s.tail,s.rendering=t,s.tail=t.sibling,s.renderingStartTime=xe(),t.sibling=null,n=pe.current,ue(pe,r?n&1|2:n&1),t):(Ae(t),null);case 22:case 23:return Fa(),r=t.memoizedState!==null,e!==null&&e.memoizedState!==null!==r&&(t.flags|=8192),r&&t.mode&1?Ze&1073741824&&(Ae(t),t.subtreeFlags&6&&(t.flags|=8192)):Ae(t),null;case 24:return null;case 25:return null}throw Error(A(156,t.tag))}function Gh(e,t){switch(wa(t),t.tag){case 1:return Ge(t.type)&&ys(),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return or(),de(Ve),de(Re),Ta(),e=t.flags,e&65536&&!(e&128)?(t.flags=e&-65537|128,t):null;case 5:return La(t),null;case 13:if(de(pe),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(A(340));nr()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return de(pe),null;case 4:return or(),null;case 10:return Ea(t.type._context),null;case 22:case 23:return Fa(),null;case 24:return null;default:return null}}var zo=!1,Pe=!1,Kh=typeof WeakSet=="function"?WeakSet:Set,F=null;function Hn(e,t){var n=e.ref;if(n!==null)if(typeof n=="function")try{n(null)}catch(r){ye(e,t,r)}else n.current=null}function Dl(e,t,n){try{n()}catch(r){ye(e,t,r)}}var Zu=!1;function Qh(e,t){if(wl=ps,e=Jd(),ga(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var r=n.getSelection&&n.getSelection();if(r&&r.rangeCount!==0){n=r.anchorNode;var o=r.anchorOffset,s=r.focusNode;r=r.focusOffset;try{n.nodeType,s.nodeType}catch{n=null;break e}var i=0,l=-1,u=-1,c=0,p=0,m=e,h=null;t:for(;;){for(var g;m!==n||o!==0&&m.nodeType!==3||(l=i+o),m!==s||r!==0&&m.nodeType!==3||(u=i+r),m.nodeType===3&&(i+=m.nodeValue.length),(g=m.firstChild)!==null;)h=m,m=g;for(;;){if(m===e)break t;if(h===n&&++c===o&&(l=i),h===s&&++p===r&&(u=i),(g=m.nextSibling)!==null)break;m=h,h=m.parentNode}m=g}n=l===-1||u===-1?null:{start:l,end:u}}else n=null}n=n||{start:0,end:0}}else n=null;for(Sl={focusedElem:e,selectionRange:n},ps=!1,F=t;F!==null;)if(t=F,e=t.child,(t.subtreeFlags&1028)!==0&&e!==null)e.return=t,F=e;else for(;F!==null;){t=F;try{var v=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(v!==null){var x=v.memoizedProps,L=v.memoizedState,_=t.stateNode,d=_.getSnapshotBeforeUpdate(t.elementType===t.type?x:pt(t.type,x),L);_.__reactInternalSnapshotBeforeUpdate=d}break;case 3:var f=t.stateNode.containerInfo;f.nodeType===1?f.textContent="":f.nodeType===9&&f.documentElement&&f.removeChild(f.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(A(163))}}catch(y){ye(t,t.return,y)}if(e=t.sibling,e!==null){e.return=t.return,F=e;break}F=t.return}return v=Zu,Zu=!1,v}function Br(e,t,n){var r=t.updateQueue;if(r=r!==null?r.lastEffect:null,r!==null){var o=r=r.next;do{if((o.tag&e)===e){var s=o.destroy;o.destroy=void 0,s!==void 0&&Dl(t,n,s)}o=o.next}while(o!==r)}}function Zs(e,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function Bl(e){var t=e.ref;if(t!==null){var n=e.stateNode;switch(e.tag){case 5:e=n;break;default:e=n}typeof t=="function"?t(e):t.current=e}}function Qf(e){var t=e.alternate;t!==null&&(e.alternate=null,Qf(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&(delete t[St],delete t[eo],delete t[El],delete t[Ih],delete t[Ah])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function Zf(e){return e.tag===5||e.tag===3||e.tag===4}function qu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Zf(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function $l(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.nodeType===8?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(n.nodeType===8?(t=n.parentNode,t.insertBefore(e,n)):(t=n,t.appendChild(e)),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=_s));else if(r!==4&&(e=e.child,e!==null))for($l(e,t,n),e=e.sibling;e!==null;)$l(e,t,n),e=e.sibling}function Fl(e,t,n){var r=e.tag;if(r===5||r===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(r!==4&&(e=e.child,e!==null))for(Fl(e,t,n),e=e.sibling;e!==null;)Fl(e,t,n),e=e.sibling}var Me=null,mt=!1;function zt(e,t,n){for(n=n.child;n!==null;)qf(e,t,n),n=n.sibling}function qf(e,t,n){if(kt&&typeof kt.onCommitFiberUnmount=="function")try{kt.onCommitFiberUnmount(Ys,n)}catch{}switch(n.tag){case 5:Pe||Hn(n,t);case 6:var r=Me,o=mt;Me=null,zt(e,t,n),Me=r,mt=o,Me!==null&&(mt?(e=Me,n=n.stateNode,e.nodeType===8?e.parentNode.removeChild(n):e.removeChild(n)):Me.removeChild(n.stateNode));break;case 18:Me!==null&&(mt?(e=Me,n=n.stateNode,e.nodeType===8?Mi(e.parentNode,n):e.nodeType===1&&Mi(e,n),Kr(e)):Mi(Me,n.stateNode));break;case 4:r=Me,o=mt,Me=n.stateNode.containerInfo,mt=!0,zt(e,t,n),Me=r,mt=o;break;case 0:case 11:case 14:case 15:if(!Pe&&(r=n.updateQueue,r!==null&&(r=r.lastEffect,r!==null))){o=r=r.next;do{var s=o,i=s.destroy;s=s.tag,i!==void 0&&(s&2||s&4)&&Dl(n,t,i),o=o.next}while(o!==r)}zt(e,t,n);break;case 1:if(!Pe&&(Hn(n,t),r=n.stateNode,typeof r.componentWillUnmount=="function"))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(l){ye(n,t,l)}zt(e,t,n);break;case 21:zt(e,t,n);break;case 22:n.mode&1?(Pe=(r=Pe)||n.memoizedState!==null,zt(e,t,n),Pe=r):zt(e,t,n);break;default:zt(e,t,n)}}function Ju(e){var t=e.updateQueue;if(t!==null){e.updateQueue=null;var n=e.stateNode;n===null&&(n=e.stateNode=new Kh),t.forEach(function(r){var o=s_.bind(null,e,r);n.has(r)||(n.add(r),r.then(o,o))})}}function ft(e,t){var n=t.deletions;if(n!==null)for(var r=0;r<n.length;r++){var o=n[r];try{var s=e,i=t,l=i;e:for(;l!==null;){switch(l.tag){case 5:Me=l.stateNode,mt=!1;break e;case 3:Me=l.stateNode.containerInfo,mt=!0;break e;case 4:Me=l.stateNode.containerInfo,mt=!0;break e}l=l.return}if(Me===null)throw Error(A(160));qf(s,i,o),Me=null,mt=!1;var u=o.alternate;u!==null&&(u.return=null),o.return=null}catch(c){ye(o,t,c)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)Jf(t,e),t=t.sibling}function Jf(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(ft(t,e),gt(e),r&4){try{Br(3,e,e.return),Zs(3,e)}catch(x){ye(e,e.return,x)}try{Br(5,e,e.return)}catch(x){ye(e,e.return,x)}}break;case 1:ft(t,e),gt(e),r&512&&n!==null&&Hn(n,n.return);break;case 5:if(ft(t,e),gt(e),r&512&&n!==null&&Hn(n,n.return),e.flags&32){var o=e.stateNode;try{Ur(o,"")}catch(x){ye(e,e.return,x)}}if(r&4&&(o=e.stateNode,o!=null)){var s=e.memoizedProps,i=n!==null?n.memoizedProps:s,l=e.type,u=e.updateQueue;if(e.updateQueue=null,u!==null)try{l==="input"&&s.type==="radio"&&s.name!=null&&xd(o,s),dl(l,i);var c=dl(l,s);for(i=0;i<u.length;i+=2){var p=u[i],m=u[i+1];p==="style"?Ed(o,m):p==="dangerouslySetInnerHTML"?kd(o,m):p==="children"?Ur(o,m):ia(o,p,m,c)}switch(l){case"input":il(o,s);break;case"textarea":wd(o,s);break;case"select":var h=o._wrapperState.wasMultiple;o._wrapperState.wasMultiple=!!s.multiple;var g=s.value;g!=null?Gn(o,!!s.multiple,g,!1):h!==!!s.multiple&&(s.defaultValue!=null?Gn(o,!!s.multiple,s.defaultValue,!0):Gn(o,!!s.multiple,s.multiple?[]:"",!1))}o[eo]=s}catch(x){ye(e,e.return,x)}}break;case 6:if(ft(t,e),gt(e),r&4){if(e.stateNode===null)throw Error(A(162));o=e.stateNode,s=e.memoizedProps;try{o.nodeValue=s}catch(x){ye(e,e.return,x)}}break;case 3:if(ft(t,e),gt(e),r&4&&n!==null&&n.memoizedState.isDehydrated)try{Kr(t.containerInfo)}catch(x){ye(e,e.return,x)}break;case 4:ft(t,e),gt(e);break;case 13:ft(t,e),gt(e),o=e.child,o.flags&8192&&(s=o.memoizedState!==null,o.stateNode.isHidden=s,!s||o.alternate!==null&&o.alternate.memoizedState!==null||(Ba=xe())),r&4&&Ju(e);break;case 22:if(p=n!==null&&n.memoizedState!==null,e.mode&1?(Pe=(c=Pe)||p,ft(t,e),Pe=c):ft(t,e),gt(e),r&8192){if(c=e.memoizedState!==null,(e.stateNode.isHidden=c)&&!p&&e.mode&1)for(F=e,p=e.child;p!==null;){for(m=F=p;F!==null;){switch(h=F,g=h.child,h.tag){case 0:case 11:case 14:case 15:Br(4,h,h.return);break;case 1:Hn(h,h.return);var v=h.stateNode;if(typeof v.componentWillUnmount=="function"){r=h,n=h.return;try{t=r,v.props=t.memoizedProps,v.state=t.memoizedState,v.componentWillUnmount()}catch(x){ye(r,n,x)}}break;case 5:Hn(h,h.return);break;case 22:if(h.memoizedState!==null){tc(m);continue}}g!==null?(g.return=h,F=g):tc(m)}p=p.sibling}e:for(p=null,m=e;;){if(m.tag===5){if(p===null){p=m;try{o=m.stateNode,c?(s=o.style,typeof s.setProperty=="function"?s.setProperty("display","none","important"):s.display="none"):(l=m.stateNode,u=m.memoizedProps.style,i=u!=null&&u.hasOwnProperty("display")?u.display:null,l.style.display=Nd("display",i))}catch(x){ye(e,e.return,x)}}}else if(m.tag===6){if(p===null)try{m.stateNode.nodeValue=c?"":m.memoizedProps}catch(x){ye(e,e.return,x)}}else if((m.tag!==22&&m.tag!==23||m.memoizedState===null||m===e)&&m.child!==null){m.child.return=m,m=m.child;continue}if(m===e)break e;for(;m.sibling===null;){if(m.return===null||m.return===e)break e;p===m&&(p=null),m=m.return}p===m&&(p=null),m.sibling.return=m.return,m=m.sibling}}break;case 19:ft(t,e),gt(e),r&4&&Ju(e);break;case 21:break;default:ft(t,e),gt(e)}}function gt(e){var t=e.flags;if(t&2){try{e:{for(var n=e.return;n!==null;){if(Zf(n)){var r=n;break e}n=n.return}throw Error(A(160))}switch(r.tag){case 5:var o=r.stateNode;r.flags&32&&(Ur(o,""),r.flags&=-33);var s=qu(e);Fl(e,s,o);break;case 3:case 4:var i=r.stateNode.containerInfo,l=qu(e);$l(e,l,i);break;default:throw Error(A(161))}}catch(u){ye(e,e.return,u)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Zh(e,t,n){F=e,ep(e)}function ep(e,t,n){for(var r=(e.mode&1)!==0;F!==null;){var o=F,s=o.child;if(o.tag===22&&r){var i=o.memoizedState!==null||zo;if(!i){var l=o.alternate,u=l!==null&&l.memoizedState!==null||Pe;l=zo;var c=Pe;if(zo=i,(Pe=u)&&!c)for(F=o;F!==null;)i=F,u=i.child,i.tag===22&&i.memoizedState!==null?nc(o):u!==null?(u.return=i,F=u):nc(o);for(;s!==null;)F=s,ep(s),s=s.sibling;F=o,zo=l,Pe=c}ec(e)}else o.subtreeFlags&8772&&s!==null?(s.return=o,F=s):ec(e)}}function ec(e){for(;F!==null;){var t=F;if(t.flags&8772){var n=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:Pe||Zs(5,t);break;case 1:var r=t.stateNode;if(t.flags&4&&!Pe)if(n===null)r.componentDidMount();else{var o=t.elementType===t.type?n.memoizedProps:pt(t.type,n.memoizedProps);r.componentDidUpdate(o,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var s=t.updateQueue;s!==null&&Du(t,s,r);break;case 3:var i=t.updateQueue;if(i!==null){if(n=null,t.child!==null)switch(t.child.tag){case 5:n=t.child.stateNode;break;case 1:n=t.child.stateNode}Du(t,i,n)}break;case 5:var l=t.stateNode;if(n===null&&t.flags&4){n=l;var u=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":u.autoFocus&&n.focus();break;case"img":u.src&&(n.src=u.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var c=t.alternate;if(c!==null){var p=c.memoizedState;if(p!==null){var m=p.dehydrated;m!==null&&Kr(m)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(A(163))}Pe||t.flags&512&&Bl(t)}catch(h){ye(t,t.return,h)}}if(t===e){F=null;break}if(n=t.sibling,n!==null){n.return=t.return,F=n;break}F=t.return}}function tc(e){for(;F!==null;){var t=F;if(t===e){F=null;break}var n=t.sibling;if(n!==null){n.return=t.return,F=n;break}F=t.return}}function nc(e){for(;F!==null;){var t=F;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{Zs(4,t)}catch(u){ye(t,n,u)}break;case 1:var r=t.stateNode;if(typeof r.componentDidMount=="function"){var o=t.return;try{r.componentDidMount()}catch(u){ye(t,o,u)}}var s=t.return;try{Bl(t)}catch(u){ye(t,s,u)}break;case 5:var i=t.return;try{Bl(t)}catch(u){ye(t,i,u)}}}catch(u){ye(t,t.return,u)}if(t===e){F=null;break}var l=t.sibling;if(l!==null){l.return=t.return,F=l;break}F=t.return}}var qh=Math.ceil,js=Ot.ReactCurrentDispatcher,za=Ot.ReactCurrentOwner,at=Ot.ReactCurrentBatchConfig,ne=0,Ce=null,Se=null,Le=0,Ze=0,Vn=sn(0),Ne=0,io=null,Cn=0,qs=0,Da=0,$r=null,Ue=null,Ba=0,ir=1/0,Ct=null,Ms=!1,Xl=null,qt=null,Do=!1,Ht=null,Ls=0,Fr=0,Yl=null,ts=-1,ns=0;function $e(){return ne&6?xe():ts!==-1?ts:ts=xe()}function Jt(e){return e.mode&1?ne&2&&Le!==0?Le&-Le:Rh.transition!==null?(ns===0&&(ns=zd()),ns):(e=ie,e!==0||(e=window.event,e=e===void 0?16:Wd(e.type)),e):1}function yt(e,t,n,r){if(50<Fr)throw Fr=0,Yl=null,Error(A(185));co(e,n,r),(!(ne&2)||e!==Ce)&&(e===Ce&&(!(ne&2)&&(qs|=n),Ne===4&&Wt(e,Le)),Ke(e,r),n===1&&ne===0&&!(t.mode&1)&&(ir=xe()+500,Gs&&ln()))}function Ke(e,t){var n=e.callbackNode;Rm(e,t);var r=fs(e,e===Ce?Le:0);if(r===0)n!==null&&du(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(n!=null&&du(n),t===1)e.tag===0?Ph(rc.bind(null,e)):cf(rc.bind(null,e)),Th(function(){!(ne&6)&&ln()}),n=null;else{switch(Dd(r)){case 1:n=da;break;case 4:n=Rd;break;case 16:n=ds;break;case 536870912:n=Od;break;default:n=ds}n=ap(n,tp.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function tp(e,t){if(ts=-1,ns=0,ne&6)throw Error(A(327));var n=e.callbackNode;if(Jn()&&e.callbackNode!==n)return null;var r=fs(e,e===Ce?Le:0);if(r===0)return null;if(r&30||r&e.expiredLanes||t)t=Ts(e,r);else{t=r;var o=ne;ne|=2;var s=rp();(Ce!==e||Le!==t)&&(Ct=null,ir=xe()+500,xn(e,t));do try{t_();break}catch(l){np(e,l)}while(!0);Na(),js.current=s,ne=o,Se!==null?t=0:(Ce=null,Le=0,t=Ne)}if(t!==0){if(t===2&&(o=_l(e),o!==0&&(r=o,t=Wl(e,o))),t===1)throw n=io,xn(e,0),Wt(e,r),Ke(e,xe()),n;if(t===6)Wt(e,r);else{if(o=e.current.alternate,!(r&30)&&!Jh(o)&&(t=Ts(e,r),t===2&&(s=_l(e),s!==0&&(r=s,t=Wl(e,s))),t===1))throw n=io,xn(e,0),Wt(e,r),Ke(e,xe()),n;switch(e.finishedWork=o,e.finishedLanes=r,t){case 0:case 1:throw Error(A(345));case 2:dn(e,Ue,Ct);break;case 3:if(Wt(e,r),(r&130023424)===r&&(t=Ba+500-xe(),10<t)){if(fs(e,0)!==0)break;if(o=e.suspendedLanes,(o&r)!==r){$e(),e.pingedLanes|=e.suspendedLanes&o;break}e.timeoutHandle=Nl(dn.bind(null,e,Ue,Ct),t);break}dn(e,Ue,Ct);break;case 4:if(Wt(e,r),(r&4194240)===r)break;for(t=e.eventTimes,o=-1;0<r;){var i=31-_t(r);s=1<<i,i=t[i],i>o&&(o=i),r&=~s}if(r=o,r=xe()-r,r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*qh(r/1960))-r,10<r){e.timeoutHandle=Nl(dn.bind(null,e,Ue,Ct),r);break}dn(e,Ue,Ct);break;case 5:dn(e,Ue,Ct);break;default:throw Error(A(329))}}}return Ke(e,xe()),e.callbackNode===n?tp.bind(null,e):null}function Wl(e,t){var n=$r;return e.current.memoizedState.isDehydrated&&(xn(e,t).flags|=256),e=Ts(e,t),e!==2&&(t=Ue,Ue=n,t!==null&&Ul(t)),e}function Ul(e){Ue===null?Ue=e:Ue.push.apply(Ue,e)}function Jh(e){for(var t=e;;){if(t.flags&16384){var n=t.updateQueue;if(n!==null&&(n=n.stores,n!==null))for(var r=0;r<n.length;r++){var o=n[r],s=o.getSnapshot;o=o.value;try{if(!vt(s(),o))return!1}catch{return!1}}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Wt(e,t){for(t&=~Da,t&=~qs,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-_t(t),r=1<<n;e[n]=-1,t&=~r}}function rc(e){if(ne&6)throw Error(A(327));Jn();var t=fs(e,0);if(!(t&1))return Ke(e,xe()),null;var n=Ts(e,t);if(e.tag!==0&&n===2){var r=_l(e);r!==0&&(t=r,n=Wl(e,r))}if(n===1)throw n=io,xn(e,0),Wt(e,t),Ke(e,xe()),n;if(n===6)throw Error(A(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,dn(e,Ue,Ct),Ke(e,xe()),null}function $a(e,t){var n=ne;ne|=1;try{return e(t)}finally{ne=n,ne===0&&(ir=xe()+500,Gs&&ln())}}function jn(e){Ht!==null&&Ht.tag===0&&!(ne&6)&&Jn();var t=ne;ne|=1;var n=at.transition,r=ie;try{if(at.transition=null,ie=1,e)return e()}finally{ie=r,at.transition=n,ne=t,!(ne&6)&&ln()}}function Fa(){Ze=Vn.current,de(Vn)}function xn(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(n!==-1&&(e.timeoutHandle=-1,Lh(n)),Se!==null)for(n=Se.return;n!==null;){var r=n;switch(wa(r),r.tag){case 1:r=r.type.childContextTypes,r!=null&&ys();break;case 3:or(),de(Ve),de(Re),Ta();break;case 5:La(r);break;case 4:or();break;case 13:de(pe);break;case 19:de(pe);break;case 10:Ea(r.type._context);break;case 22:case 23:Fa()}n=n.return}if(Ce=e,Se=e=en(e.current,null),Le=Ze=t,Ne=0,io=null,Da=qs=Cn=0,Ue=$r=null,_n!==null){for(t=0;t<_n.length;t++)if(n=_n[t],r=n.interleaved,r!==null){n.interleaved=null;var o=r.next,s=n.pending;if(s!==null){var i=s.next;s.next=o,r.next=i}n.pending=r}_n=null}return e}function np(e,t){do{var n=Se;try{if(Na(),qo.current=Cs,Es){for(var r=me.memoizedState;r!==null;){var o=r.queue;o!==null&&(o.pending=null),r=r.next}Es=!1}if(En=0,Ee=ke=me=null,Dr=!1,ro=0,za.current=null,n===null||n.return===null){Ne=1,io=t,Se=null;break}e:{var s=e,i=n.return,l=n,u=t;if(t=Le,l.flags|=32768,u!==null&&typeof u=="object"&&typeof u.then=="function"){var c=u,p=l,m=p.tag;if(!(p.mode&1)&&(m===0||m===11||m===15)){var h=p.alternate;h?(p.updateQueue=h.updateQueue,p.memoizedState=h.memoizedState,p.lanes=h.lanes):(p.updateQueue=null,p.memoizedState=null)}var g=Wu(i);if(g!==null){g.flags&=-257,Uu(g,i,l,s,t),g.mode&1&&Yu(s,c,t),t=g,u=c;var v=t.updateQueue;if(v===null){var x=new Set;x.add(u),t.updateQueue=x}else v.add(u);break e}else{if(!(t&1)){Yu(s,c,t),Xa();break e}u=Error(A(426))}}else if(fe&&l.mode&1){var L=Wu(i);if(L!==null){!(L.flags&65536)&&(L.flags|=256),Uu(L,i,l,s,t),Sa(sr(u,l));break e}}s=u=sr(u,l),Ne!==4&&(Ne=2),$r===null?$r=[s]:$r.push(s),s=i;do{switch(s.tag){case 3:s.flags|=65536,t&=-t,s.lanes|=t;var _=Bf(s,u,t);zu(s,_);break e;case 1:l=u;var d=s.type,f=s.stateNode;if(!(s.flags&128)&&(typeof d.getDerivedStateFromError=="function"||f!==null&&typeof f.componentDidCatch=="function"&&(qt===null||!qt.has(f)))){s.flags|=65536,t&=-t,s.lanes|=t;var y=$f(s,l,t);zu(s,y);break e}}s=s.return}while(s!==null)}sp(n)}catch(w){t=w,Se===n&&n!==null&&(Se=n=n.return);continue}break}while(!0)}function rp(){var e=js.current;return js.current=Cs,e===null?Cs:e}function Xa(){(Ne===0||Ne===3||Ne===2)&&(Ne=4),Ce===null||!(Cn&268435455)&&!(qs&268435455)||Wt(Ce,Le)}function Ts(e,t){var n=ne;ne|=2;var r=rp();(Ce!==e||Le!==t)&&(Ct=null,xn(e,t));do try{e_();break}catch(o){np(e,o)}while(!0);if(Na(),ne=n,js.current=r,Se!==null)throw Error(A(261));return Ce=null,Le=0,Ne}function e_(){for(;Se!==null;)op(Se)}function t_(){for(;Se!==null&&!Cm();)op(Se)}function op(e){var t=lp(e.alternate,e,Ze);e.memoizedProps=e.pendingProps,t===null?sp(e):Se=t,za.current=null}function sp(e){var t=e;do{var n=t.alternate;if(e=t.return,t.flags&32768){if(n=Gh(n,t),n!==null){n.flags&=32767,Se=n;return}if(e!==null)e.flags|=32768,e.subtreeFlags=0,e.deletions=null;else{Ne=6,Se=null;return}}else if(n=Vh(n,t,Ze),n!==null){Se=n;return}if(t=t.sibling,t!==null){Se=t;return}Se=t=e}while(t!==null);Ne===0&&(Ne=5)}function dn(e,t,n){var r=ie,o=at.transition;try{at.transition=null,ie=1,n_(e,t,n,r)}finally{at.transition=o,ie=r}return null}function n_(e,t,n,r){do Jn();while(Ht!==null);if(ne&6)throw Error(A(327));n=e.finishedWork;var o=e.finishedLanes;if(n===null)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(A(177));e.callbackNode=null,e.callbackPriority=0;var s=n.lanes|n.childLanes;if(Om(e,s),e===Ce&&(Se=Ce=null,Le=0),!(n.subtreeFlags&2064)&&!(n.flags&2064)||Do||(Do=!0,ap(ds,function(){return Jn(),null})),s=(n.flags&15990)!==0,n.subtreeFlags&15990||s){s=at.transition,at.transition=null;var i=ie;ie=1;var l=ne;ne|=4,za.current=null,Qh(e,n),Jf(n,e),Sh(Sl),ps=!!wl,Sl=wl=null,e.current=n,Zh(n),jm(),ne=l,ie=i,at.transition=s}else e.current=n;if(Do&&(Do=!1,Ht=e,Ls=o),s=e.pendingLanes,s===0&&(qt=null),Tm(n.stateNode),Ke(e,xe()),t!==null)for(r=e.onRecoverableError,n=0;n<t.length;n++)o=t[n],r(o.value,{componentStack:o.stack,digest:o.digest});if(Ms)throw Ms=!1,e=Xl,Xl=null,e;return Ls&1&&e.tag!==0&&Jn(),s=e.pendingLanes,s&1?e===Yl?Fr++:(Fr=0,Yl=e):Fr=0,ln(),null}function Jn(){if(Ht!==null){var e=Dd(Ls),t=at.transition,n=ie;try{if(at.transition=null,ie=16>e?16:e,Ht===null)var r=!1;else{if(e=Ht,Ht=null,Ls=0,ne&6)throw Error(A(331));var o=ne;for(ne|=4,F=e.current;F!==null;){var s=F,i=s.child;if(F.flags&16){var l=s.deletions;if(l!==null){for(var u=0;u<l.length;u++){var c=l[u];for(F=c;F!==null;){var p=F;switch(p.tag){case 0:case 11:case 15:Br(8,p,s)}var m=p.child;if(m!==null)m.return=p,F=m;else for(;F!==null;){p=F;var h=p.sibling,g=p.return;if(Qf(p),p===c){F=null;break}if(h!==null){h.return=g,F=h;break}F=g}}}var v=s.alternate;if(v!==null){var x=v.child;if(x!==null){v.child=null;do{var L=x.sibling;x.sibling=null,x=L}while(x!==null)}}F=s}}if(s.subtreeFlags&2064&&i!==null)i.return=s,F=i;else e:for(;F!==null;){if(s=F,s.flags&2048)switch(s.tag){case 0:case 11:case 15:Br(9,s,s.return)}var _=s.sibling;if(_!==null){_.return=s.return,F=_;break e}F=s.return}}var d=e.current;for(F=d;F!==null;){i=F;var f=i.child;if(i.subtreeFlags&2064&&f!==null)f.return=i,F=f;else e:for(i=d;F!==null;){if(l=F,l.flags&2048)try{switch(l.tag){case 0:case 11:case 15:Zs(9,l)}}catch(w){ye(l,l.return,w)}if(l===i){F=null;break e}var y=l.sibling;if(y!==null){y.return=l.return,F=y;break e}F=l.return}}if(ne=o,ln(),kt&&typeof kt.onPostCommitFiberRoot=="function")try{kt.onPostCommitFiberRoot(Ys,e)}catch{}r=!0}return r}finally{ie=n,at.transition=t}}return!1}function oc(e,t,n){t=sr(n,t),t=Bf(e,t,1),e=Zt(e,t,1),t=$e(),e!==null&&(co(e,1,t),Ke(e,t))}function ye(e,t,n){if(e.tag===3)oc(e,e,n);else for(;t!==null;){if(t.tag===3){oc(t,e,n);break}else if(t.tag===1){var r=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof r.componentDidCatch=="function"&&(qt===null||!qt.has(r))){e=sr(n,e),e=$f(t,e,1),t=Zt(t,e,1),e=$e(),t!==null&&(co(t,1,e),Ke(t,e));break}}t=t.return}}function r_(e,t,n){var r=e.pingCache;r!==null&&r.delete(t),t=$e(),e.pingedLanes|=e.suspendedLanes&n,Ce===e&&(Le&n)===n&&(Ne===4||Ne===3&&(Le&130023424)===Le&&500>xe()-Ba?xn(e,0):Da|=n),Ke(e,t)}function ip(e,t){t===0&&(e.mode&1?(t=Mo,Mo<<=1,!(Mo&130023424)&&(Mo=4194304)):t=1);var n=$e();e=Pt(e,t),e!==null&&(co(e,t,n),Ke(e,n))}function o_(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),ip(e,n)}function s_(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,o=e.memoizedState;o!==null&&(n=o.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(A(314))}r!==null&&r.delete(t),ip(e,n)}var lp;lp=function(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps||Ve.current)He=!0;else{if(!(e.lanes&n)&&!(t.flags&128))return He=!1,Hh(e,t,n);He=!!(e.flags&131072)}else He=!1,fe&&t.flags&1048576&&df(t,xs,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;es(e,t),e=t.pendingProps;var o=tr(t,Re.current);qn(t,n),o=Ia(null,t,r,e,o,n);var s=Aa();return t.flags|=1,typeof o=="object"&&o!==null&&typeof o.render=="function"&&o.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Ge(r)?(s=!0,vs(t)):s=!1,t.memoizedState=o.state!==null&&o.state!==void 0?o.state:null,ja(t),o.updater=Qs,t.stateNode=o,o._reactInternals=t,bl(t,r,e,n),t=Pl(null,t,r,!0,s,n)):(t.tag=0,fe&&s&&xa(t),De(null,t,o,n),t=t.child),t;case 16:r=t.elementType;e:{switch(es(e,t),e=t.pendingProps,o=r._init,r=o(r._payload),t.type=r,o=t.tag=l_(r),e=pt(r,e),o){case 0:t=Al(null,t,r,e,n);break e;case 1:t=Gu(null,t,r,e,n);break e;case 11:t=Hu(null,t,r,e,n);break e;case 14:t=Vu(null,t,r,pt(r.type,e),n);break e}throw Error(A(306,r,""))}return t;case 0:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:pt(r,o),Al(e,t,r,o,n);case 1:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:pt(r,o),Gu(e,t,r,o,n);case 3:e:{if(Wf(t),e===null)throw Error(A(387));r=t.pendingProps,s=t.memoizedState,o=s.element,yf(e,t),ks(t,r,null,n);var i=t.memoizedState;if(r=i.element,s.isDehydrated)if(s={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},t.updateQueue.baseState=s,t.memoizedState=s,t.flags&256){o=sr(Error(A(423)),t),t=Ku(e,t,r,n,o);break e}else if(r!==o){o=sr(Error(A(424)),t),t=Ku(e,t,r,n,o);break e}else for(qe=Qt(t.stateNode.containerInfo.firstChild),et=t,fe=!0,ht=null,n=hf(t,null,r,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling;else{if(nr(),r===o){t=Rt(e,t,n);break e}De(e,t,r,n)}t=t.child}return t;case 5:return vf(t),e===null&&Ml(t),r=t.type,o=t.pendingProps,s=e!==null?e.memoizedProps:null,i=o.children,kl(r,o)?i=null:s!==null&&kl(r,s)&&(t.flags|=32),Yf(e,t),De(e,t,i,n),t.child;case 6:return e===null&&Ml(t),null;case 13:return Uf(e,t,n);case 4:return Ma(t,t.stateNode.containerInfo),r=t.pendingProps,e===null?t.child=rr(t,null,r,n):De(e,t,r,n),t.child;case 11:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:pt(r,o),Hu(e,t,r,o,n);case 7:return De(e,t,t.pendingProps,n),t.child;case 8:return De(e,t,t.pendingProps.children,n),t.child;case 12:return De(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,o=t.pendingProps,s=t.memoizedProps,i=o.value,ue(ws,r._currentValue),r._currentValue=i,s!==null)if(vt(s.value,i)){if(s.children===o.children&&!Ve.current){t=Rt(e,t,n);break e}}else for(s=t.child,s!==null&&(s.return=t);s!==null;){var l=s.dependencies;if(l!==null){i=s.child;for(var u=l.firstContext;u!==null;){if(u.context===r){if(s.tag===1){u=bt(-1,n&-n),u.tag=2;var c=s.updateQueue;if(c!==null){c=c.shared;var p=c.pending;p===null?u.next=u:(u.next=p.next,p.next=u),c.pending=u}}s.lanes|=n,u=s.alternate,u!==null&&(u.lanes|=n),Ll(s.return,n,t),l.lanes|=n;break}u=u.next}}else if(s.tag===10)i=s.type===t.type?null:s.child;else if(s.tag===18){if(i=s.return,i===null)throw Error(A(341));i.lanes|=n,l=i.alternate,l!==null&&(l.lanes|=n),Ll(i,n,t),i=s.sibling}else i=s.child;if(i!==null)i.return=s;else for(i=s;i!==null;){if(i===t){i=null;break}if(s=i.sibling,s!==null){s.return=i.return,i=s;break}i=i.return}s=i}De(e,t,o.children,n),t=t.child}return t;case 9:return o=t.type,r=t.pendingProps.children,qn(t,n),o=ct(o),r=r(o),t.flags|=1,De(e,t,r,n),t.child;case 14:return r=t.type,o=pt(r,t.pendingProps),o=pt(r.type,o),Vu(e,t,r,o,n);case 15:return Ff(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:pt(r,o),es(e,t),t.tag=1,Ge(r)?(e=!0,vs(t)):e=!1,qn(t,n),Df(t,r,o),bl(t,r,o,n),Pl(null,t,r,!0,e,n);case 19:return Hf(e,t,n);case 22:return Xf(e,t,n)}throw Error(A(156,t.tag))};function ap(e,t){return Pd(e,t)}function i_(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function lt(e,t,n,r){return new i_(e,t,n,r)}function Ya(e){return e=e.prototype,!(!e||!e.isReactComponent)}function l_(e){if(typeof e=="function")return Ya(e)?1:0;if(e!=null){if(e=e.$$typeof,e===aa)return 11;if(e===ua)return 14}return 2}function en(e,t){var n=e.alternate;return n===null?(n=lt(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&14680064,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function rs(e,t,n,r,o,s){var i=2;if(r=e,typeof e=="function")Ya(e)&&(i=1);else if(typeof e=="string")i=5;else e:switch(e){case zn:return wn(n.children,o,s,t);case la:i=8,o|=8;break;case tl:return e=lt(12,n,t,o|2),e.elementType=tl,e.lanes=s,e;case nl:return e=lt(13,n,t,o),e.elementType=nl,e.lanes=s,e;case rl:return e=lt(19,n,t,o),e.elementType=rl,e.lanes=s,e;case yd:return Js(n,o,s,t);default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case hd:i=10;break e;case _d:i=9;break e;case aa:i=11;break e;case ua:i=14;break e;case $t:i=16,r=null;break e}throw Error(A(130,e==null?e:typeof e,""))}return t=lt(i,n,t,o),t.elementType=e,t.type=r,t.lanes=s,t}function wn(e,t,n,r){return e=lt(7,e,r,t),e.lanes=n,e}function Js(e,t,n,r){return e=lt(22,e,r,t),e.elementType=yd,e.lanes=n,e.stateNode={isHidden:!1},e}function Oi(e,t,n){return e=lt(6,e,null,t),e.lanes=n,e}function zi(e,t,n){return t=lt(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function a_(e,t,n,r,o){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=yi(0),this.expirationTimes=yi(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=yi(0),this.identifierPrefix=r,this.onRecoverableError=o,this.mutableSourceEagerHydrationData=null}function Wa(e,t,n,r,o,s,i,l,u){return e=new a_(e,t,n,l,u),t===1?(t=1,s===!0&&(t|=8)):t=0,s=lt(3,null,null,t),e.current=s,s.stateNode=e,s.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},ja(s),e}function u_(e,t,n){var r=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:On,key:r==null?null:""+r,children:e,containerInfo:t,implementation:n}}function up(e){if(!e)return rn;e=e._reactInternals;e:{if(bn(e)!==e||e.tag!==1)throw Error(A(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Ge(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(t!==null);throw Error(A(171))}if(e.tag===1){var n=e.type;if(Ge(n))return uf(e,n,t)}return t}function cp(e,t,n,r,o,s,i,l,u){return e=Wa(n,r,!0,e,o,s,i,l,u),e.context=up(null),n=e.current,r=$e(),o=Jt(n),s=bt(r,o),s.callback=t??null,Zt(n,s,o),e.current.lanes=o,co(e,o,r),Ke(e,r),e}function ei(e,t,n,r){var o=t.current,s=$e(),i=Jt(o);return n=up(n),t.context===null?t.context=n:t.pendingContext=n,t=bt(s,i),t.payload={element:e},r=r===void 0?null:r,r!==null&&(t.callback=r),e=Zt(o,t,i),e!==null&&(yt(e,o,i,s),Zo(e,o,i)),i}function bs(e){if(e=e.current,!e.child)return null;switch(e.child.tag){case 5:return e.child.stateNode;default:return e.child.stateNode}}function sc(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Ua(e,t){sc(e,t),(e=e.alternate)&&sc(e,t)}function c_(){return null}var dp=typeof reportError=="function"?reportError:function(e){console.error(e)};function Ha(e){this._internalRoot=e}ti.prototype.render=Ha.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(A(409));ei(e,t,null,null)};ti.prototype.unmount=Ha.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;jn(function(){ei(null,e,null,null)}),t[At]=null}};function ti(e){this._internalRoot=e}ti.prototype.unstable_scheduleHydration=function(e){if(e){var t=Fd();e={blockedOn:null,target:e,priority:t};for(var n=0;n<Yt.length&&t!==0&&t<Yt[n].priority;n++);Yt.splice(n,0,e),n===0&&Yd(e)}};function Va(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function ni(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11&&(e.nodeType!==8||e.nodeValue!==" react-mount-point-unstable "))}function ic(){}function d_(e,t,n,r,o){if(o){if(typeof r=="function"){var s=r;r=function(){var c=bs(i);s.call(c)}}var i=cp(t,r,e,0,null,!1,!1,"",ic);return e._reactRootContainer=i,e[At]=i.current,qr(e.nodeType===8?e.parentNode:e),jn(),i}for(;o=e.lastChild;)e.removeChild(o);if(typeof r=="function"){var l=r;r=function(){var c=bs(u);l.call(c)}}var u=Wa(e,0,!1,null,null,!1,!1,"",ic);return e._reactRootContainer=u,e[At]=u.current,qr(e.nodeType===8?e.parentNode:e),jn(function(){ei(t,u,n,r)}),u}function ri(e,t,n,r,o){var s=n._reactRootContainer;if(s){var i=s;if(typeof o=="function"){var l=o;o=function(){var u=bs(i);l.call(u)}}ei(t,i,e,o)}else i=d_(n,t,e,o,r);return bs(i)}Bd=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=Mr(t.pendingLanes);n!==0&&(fa(t,n|1),Ke(t,xe()),!(ne&6)&&(ir=xe()+500,ln()))}break;case 13:jn(function(){var r=Pt(e,1);if(r!==null){var o=$e();yt(r,e,1,o)}}),Ua(e,1)}};pa=function(e){if(e.tag===13){var t=Pt(e,134217728);if(t!==null){var n=$e();yt(t,e,134217728,n)}Ua(e,134217728)}};$d=function(e){if(e.tag===13){var t=Jt(e),n=Pt(e,t);if(n!==null){var r=$e();yt(n,e,t,r)}Ua(e,t)}};Fd=function(){return ie};Xd=function(e,t){var n=ie;try{return ie=e,t()}finally{ie=n}};pl=function(e,t,n){switch(t){case"input":if(il(e,n),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var o=Vs(r);if(!o)throw Error(A(90));gd(r),il(r,o)}}}break;case"textarea":wd(e,n);break;case"select":t=n.value,t!=null&&Gn(e,!!n.multiple,t,!1)}};Md=$a;Ld=jn;var f_={usingClientEntryPoint:!1,Events:[po,Fn,Vs,Cd,jd,$a]},Sr={findFiberByHostInstance:hn,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},p_={bundleType:Sr.bundleType,version:Sr.version,rendererPackageName:Sr.rendererPackageName,rendererConfig:Sr.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:Ot.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return e=Id(e),e===null?null:e.stateNode},findFiberByHostInstance:Sr.findFiberByHostInstance||c_,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Bo=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Bo.isDisabled&&Bo.supportsFiber)try{Ys=Bo.inject(p_),kt=Bo}catch{}}rt.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=f_;rt.createPortal=function(e,t){var n=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Va(t))throw Error(A(200));return u_(e,t,null,n)};rt.createRoot=function(e,t){if(!Va(e))throw Error(A(299));var n=!1,r="",o=dp;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(r=t.identifierPrefix),t.onRecoverableError!==void 0&&(o=t.onRecoverableError)),t=Wa(e,1,!1,null,null,n,!1,r,o),e[At]=t.current,qr(e.nodeType===8?e.parentNode:e),new Ha(t)};rt.findDOMNode=function(e){if(e==null)return null;if(e.nodeType===1)return e;var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(A(188)):(e=Object.keys(e).join(","),Error(A(268,e)));return e=Id(t),e=e===null?null:e.stateNode,e};rt.flushSync=function(e){return jn(e)};rt.hydrate=function(e,t,n){if(!ni(t))throw Error(A(200));return ri(null,e,t,!0,n)};rt.hydrateRoot=function(e,t,n){if(!Va(e))throw Error(A(405));var r=n!=null&&n.hydratedSources||null,o=!1,s="",i=dp;if(n!=null&&(n.unstable_strictMode===!0&&(o=!0),n.identifierPrefix!==void 0&&(s=n.identifierPrefix),n.onRecoverableError!==void 0&&(i=n.onRecoverableError)),t=cp(t,null,e,1,n??null,o,!1,s,i),e[At]=t.current,qr(e),r)for(e=0;e<r.length;e++)n=r[e],o=n._getVersion,o=o(n._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[n,o]:t.mutableSourceEagerHydrationData.push(n,o);return new ti(t)};rt.render=function(e,t,n){if(!ni(t))throw Error(A(200));return ri(null,e,t,!1,n)};rt.unmountComponentAtNode=function(e){if(!ni(e))throw Error(A(40));return e._reactRootContainer?(jn(function(){ri(null,null,e,!1,function(){e._reactRootContainer=null,e[At]=null})}),!0):!1};rt.unstable_batchedUpdates=$a;rt.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!ni(n))throw Error(A(200));if(e==null||e._reactInternals===void 0)throw Error(A(38));return ri(e,t,n,!1,r)};rt.version="18.3.1-next-f1338f8080-20240426";function fp(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(fp)}catch(e){console.error(e)}}fp(),dd.exports=rt;var m_=dd.exports,pp,lc=m_;pp=lc.createRoot,lc.hydrateRoot;function k(e,t,n,r){let o=String((e==null?void 0:e[t])??n);return r?o.replace(/\{(\w+)\}/g,(s,i)=>{const l=r[i];return l==null?"":String(l)}):o}function h_({state:e}){const t=e.analysis_info_view,n=e.ui_text,r=Object.entries(t.parameters??{}),o=(t.analysis_type||"").trim().toLowerCase(),s=o?k(n,`simulation.analysis_label.${o}`,t.analysis_type):"";return a.jsx("div",{className:"tab-surface",children:a.jsxs("div",{className:"content-card content-card--scrollable",children:[a.jsxs("div",{className:"info-grid",children:[a.jsxs("div",{className:"info-row",children:[a.jsx("div",{className:"card-title",children:k(n,"simulation.analysis_info.analysis_type","Analysis Type")}),a.jsx("div",{className:"info-row__value",children:s||k(n,"simulation.analysis_info.not_loaded","Not Loaded")})]}),a.jsxs("div",{className:"info-row",children:[a.jsx("div",{className:"card-title",children:k(n,"simulation.analysis_info.executor","Executor")}),a.jsx("div",{className:"info-row__value",children:t.executor||k(n,"simulation.analysis_info.not_loaded","Not Loaded")})]}),a.jsxs("div",{className:"info-row",children:[a.jsx("div",{className:"card-title",children:k(n,"simulation.analysis_info.file","File")}),a.jsx("div",{className:"info-row__value",children:t.file_name||k(n,"simulation.analysis_info.not_loaded","Not Loaded")})]}),a.jsxs("div",{className:"info-row",children:[a.jsx("div",{className:"card-title",children:k(n,"simulation.analysis_info.x_axis","X Axis")}),a.jsx("div",{className:"info-row__value",children:t.x_axis_label||k(n,"simulation.analysis_info.undefined","Undefined")})]})]}),a.jsxs("div",{className:"content-card content-card--scrollable",children:[a.jsx("div",{className:"card-title",children:k(n,"simulation.analysis_info.parameters","Parameters")}),a.jsx("div",{className:"parameter-list",children:r.length?r.map(([i,l])=>a.jsxs("div",{className:"parameter-row",children:[a.jsx("div",{className:"parameter-row__key",children:i}),a.jsx("div",{className:"parameter-row__value",children:String(l??"")})]},i)):a.jsx("div",{className:"muted-text",children:k(n,"simulation.analysis_info.empty_parameters","No structured parameters are available.")})})]})]})})}function Ga({title:e,description:t,actions:n}){return a.jsxs("div",{className:"compact-toolbar",children:[a.jsxs("div",{className:"compact-toolbar__meta",children:[a.jsx("div",{className:"compact-toolbar__title",children:e}),t?a.jsx("div",{className:"compact-toolbar__description",children:t}):null]}),n?a.jsx("div",{className:"compact-toolbar__actions",children:n}):null]})}function __({state:e,bridge:t}){const n=e.asc_conversion_view,r=e.ui_text;return a.jsxs("div",{className:"tab-surface",children:[a.jsx(Ga,{title:k(r,"simulation.asc.title","ASC Conversion"),description:k(r,"simulation.asc.description","Choose one or more LTspice .asc files and the system will generate the corresponding .cir files in the current workspace directory.")}),a.jsx("div",{className:"content-card content-card--scrollable",children:a.jsxs("div",{className:"table-toolbar-grid",children:[a.jsxs("label",{className:"field-row field-row--grow",children:[a.jsx("span",{className:"field-row__label",children:k(r,"simulation.asc.files","ASC Files")}),a.jsx("input",{className:"field-input",value:n.selected_files_summary||k(r,"simulation.asc.not_selected","Not Selected"),readOnly:!0})]}),a.jsx("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!n.can_choose_files,onClick:()=>t==null?void 0:t.chooseAscFilesForConversion(),children:k(r,"simulation.asc.choose_and_convert","Choose and Convert")})]})})]})}const ac={width:0,height:0};function fr(){const[e,t]=N.useState(null),[n,r]=N.useState(ac),o=N.useMemo(()=>s=>{t(s)},[]);return N.useEffect(()=>{if(e===null){r(ac);return}const s=()=>{const l=Math.round(e.clientWidth),u=Math.round(e.clientHeight);r(c=>c.width===l&&c.height===u?c:{width:l,height:u})};if(s(),typeof ResizeObserver>"u")return window.addEventListener("resize",s),()=>{window.removeEventListener("resize",s)};const i=new ResizeObserver(()=>{s()});return i.observe(e),()=>{i.disconnect()}},[e]),{ref:o,width:n.width,height:n.height}}const y_=280,v_=220,g_=520,x_=320,w_=10,uc=16;function kr(e,t,n){return Math.min(Math.max(e,t),n)}function oi({sidebar:e,sidebarConfig:t,main:n,footer:r}){const o=!!e,s=!!(o&&(t!=null&&t.resizable)),i=(t==null?void 0:t.defaultSize)??y_,l=(t==null?void 0:t.minSize)??v_,u=(t==null?void 0:t.maxSize)??g_,c=(t==null?void 0:t.mainMinSize)??x_,{ref:p,width:m}=fr(),h=N.useRef(null),[g,v]=N.useState(i),x=N.useRef(null),[L,_]=N.useState(!1),d=N.useMemo(()=>{const C=m>0?Math.max(96,m-c-(s?w_:0)):u,z=Math.max(96,Math.min(u,C));return{min:Math.min(l,z),max:z}},[u,l,c,m,s]);N.useEffect(()=>{o&&v(C=>kr(C,d.min,d.max))},[o,d.max,d.min]),N.useEffect(()=>{if(!L)return;const C=W=>{const _e=x.current;if(_e===null)return;const ze=_e.startSize+W.clientX-_e.startX;v(kr(ze,d.min,d.max))},z=()=>{x.current=null,_(!1)},P=document.body.style.cursor,te=document.body.style.userSelect;return document.body.style.cursor="col-resize",document.body.style.userSelect="none",window.addEventListener("pointermove",C),window.addEventListener("pointerup",z),window.addEventListener("pointercancel",z),()=>{document.body.style.cursor=P,document.body.style.userSelect=te,window.removeEventListener("pointermove",C),window.removeEventListener("pointerup",z),window.removeEventListener("pointercancel",z)}},[L,d.max,d.min]);const f=o?kr(g,d.min,d.max):0,y=N.useMemo(()=>C=>{h.current=C,p(C)},[p]);N.useEffect(()=>{const C=h.current;if(C!==null){if(!o){C.style.removeProperty("--responsive-pane-sidebar-size");return}C.style.setProperty("--responsive-pane-sidebar-size",`${f}px`)}},[o,f]);const w=["responsive-pane",o?"responsive-pane--with-sidebar":"",s?"responsive-pane--resizable":"",L?"responsive-pane--dragging":""].filter(Boolean).join(" "),S=C=>{s&&(C.preventDefault(),x.current={startX:C.clientX,startSize:f},_(!0))},M=C=>{if(s){if(C.key==="ArrowLeft"){C.preventDefault(),v(z=>kr(z-uc,d.min,d.max));return}if(C.key==="ArrowRight"){C.preventDefault(),v(z=>kr(z+uc,d.min,d.max));return}if(C.key==="Home"){C.preventDefault(),v(d.min);return}C.key==="End"&&(C.preventDefault(),v(d.max))}};return a.jsxs("div",{className:"responsive-pane-shell",children:[a.jsxs("div",{ref:y,className:w,children:[o?a.jsx("aside",{className:"responsive-pane__sidebar",children:e}):null,o&&s?a.jsx("div",{role:"separator",tabIndex:0,"aria-label":"Adjust sidebar width","aria-orientation":"vertical",className:`responsive-pane__separator${L?" responsive-pane__separator--dragging":""}`,onPointerDown:S,onKeyDown:M}):null,a.jsx("section",{className:"responsive-pane__main",children:n})]}),r?a.jsx("div",{className:"responsive-pane__footer",children:r}):null]})}function mp({title:e,signalOptions:t,selectedSignalId:n,onSelectedSignalChange:r,rows:o,emptyMessage:s,uiText:i}){const l=t.find(u=>u.id===n)??t[0]??null;return a.jsxs("div",{className:"measurement-floating-panel",children:[a.jsxs("div",{className:"measurement-floating-panel__drag-bar","data-floating-panel-drag-handle":"true",children:[a.jsx("div",{className:"measurement-floating-panel__title",children:e}),a.jsx("div",{className:"measurement-floating-panel__drag-hint",children:k(i,"simulation.measurement.drag_hint","Drag to move")})]}),a.jsx("div",{className:"measurement-floating-panel__header",children:t.length>1?a.jsxs("label",{className:"measurement-floating-panel__selector","aria-label":k(i,"simulation.measurement.select_signal_aria","Select measurement signal"),"data-floating-panel-no-drag":"true",children:[a.jsx("span",{className:"measurement-floating-panel__selector-label",children:k(i,"common.signal","Signal")}),a.jsx("select",{className:"measurement-floating-panel__select",value:n,onChange:u=>r(u.target.value),children:t.map(u=>a.jsx("option",{value:u.id,children:u.label},u.id))})]}):l?a.jsx("div",{className:"measurement-floating-panel__chip",children:l.label}):null}),o.length?a.jsxs(a.Fragment,{children:[a.jsxs("div",{className:"measurement-floating-panel__columns","aria-hidden":"true",children:[a.jsx("span",{children:k(i,"common.signal","Signal")}),a.jsx("span",{children:"A"}),a.jsx("span",{children:"B"}),a.jsx("span",{children:"Δ"})]}),a.jsx("div",{className:"measurement-floating-panel__rows",children:o.map(u=>a.jsxs("div",{className:"measurement-floating-panel__row",children:[a.jsxs("div",{className:"measurement-floating-panel__signal",children:[a.jsx("svg",{className:"measurement-floating-panel__swatch",viewBox:"0 0 10 10","aria-hidden":"true",focusable:"false",children:a.jsx("circle",{cx:"5",cy:"5",r:"4",fill:u.color})}),a.jsx("span",{className:"measurement-floating-panel__signal-name",children:u.label})]}),a.jsx("div",{className:"measurement-floating-panel__value",children:u.valueA}),a.jsx("div",{className:"measurement-floating-panel__value",children:u.valueB}),a.jsx("div",{className:"measurement-floating-panel__value",children:u.delta})]},u.id))})]}):a.jsx("div",{className:"measurement-floating-panel__empty muted-text",children:s})]})}function S_({title:e,signalOptions:t,selectedSignalId:n,onSelectedSignalChange:r,rows:o,emptyMessage:s,uiText:i}){const l=t.find(u=>u.id===n)??t[0]??null;return a.jsxs("div",{className:"measurement-floating-panel measurement-floating-panel--point",children:[a.jsxs("div",{className:"measurement-floating-panel__drag-bar","data-floating-panel-drag-handle":"true",children:[a.jsx("div",{className:"measurement-floating-panel__title",children:e}),a.jsx("div",{className:"measurement-floating-panel__drag-hint",children:k(i,"simulation.measurement.drag_hint","Drag to move")})]}),a.jsx("div",{className:"measurement-floating-panel__header",children:t.length>1?a.jsxs("label",{className:"measurement-floating-panel__selector","aria-label":k(i,"simulation.measurement_point.select_signal_aria","Select measurement-point signal"),"data-floating-panel-no-drag":"true",children:[a.jsx("span",{className:"measurement-floating-panel__selector-label",children:k(i,"common.signal","Signal")}),a.jsx("select",{className:"measurement-floating-panel__select",value:n,onChange:u=>r(u.target.value),children:t.map(u=>a.jsx("option",{value:u.id,children:u.label},u.id))})]}):l?a.jsx("div",{className:"measurement-floating-panel__chip",children:l.label}):null}),o.length?a.jsx("div",{className:"measurement-point-floating-panel__rows",children:o.map(u=>a.jsxs("div",{className:"measurement-point-floating-panel__row",children:[a.jsx("div",{className:"measurement-point-floating-panel__label",children:u.label}),a.jsx("div",{className:"measurement-point-floating-panel__value",children:u.valueText})]},u.id))}):a.jsx("div",{className:"measurement-floating-panel__empty muted-text",children:s})]})}const k_=.7,N_=140,E_=96,cc=240,dc=10,fc=16;function Nr(e,t,n){return Math.min(Math.max(e,t),n)}function C_({primary:e,secondary:t,defaultPrimaryRatio:n=k_,minPrimarySize:r=N_,minSecondarySize:o=E_,resizable:s=!0}){const i=Nr(n,.15,.85),{ref:l,height:u}=fr(),c=N.useRef(null),[p,m]=N.useState(null),h=N.useRef(null),[g,v]=N.useState(!1),x=N.useMemo(()=>{const y=u>0?Math.max(72,u-o-(s?dc:0)):Math.max(r,cc),w=Math.max(72,y);return{min:Math.min(r,w),max:w}},[r,o,s,u]);N.useEffect(()=>{if(!g)return;const y=C=>{const z=h.current;if(z===null)return;const P=z.startSize+C.clientY-z.startY;m(Nr(P,x.min,x.max))},w=()=>{h.current=null,v(!1)},S=document.body.style.cursor,M=document.body.style.userSelect;return document.body.style.cursor="row-resize",document.body.style.userSelect="none",window.addEventListener("pointermove",y),window.addEventListener("pointerup",w),window.addEventListener("pointercancel",w),()=>{document.body.style.cursor=S,document.body.style.userSelect=M,window.removeEventListener("pointermove",y),window.removeEventListener("pointerup",w),window.removeEventListener("pointercancel",w)}},[g,x.max,x.min]);const L=Nr(p??(u>0?u-(s?dc:0):cc)*i,x.min,x.max),_=N.useMemo(()=>y=>{c.current=y,l(y)},[l]);N.useEffect(()=>{const y=c.current;y!==null&&y.style.setProperty("--resizable-stack-primary-size",`${L}px`)},[L]);const d=y=>{s&&(y.preventDefault(),h.current={startY:y.clientY,startSize:L},m(L),v(!0))},f=y=>{if(s){if(y.key==="ArrowUp"){y.preventDefault(),m(w=>Nr((w??L)-fc,x.min,x.max));return}if(y.key==="ArrowDown"){y.preventDefault(),m(w=>Nr((w??L)+fc,x.min,x.max));return}if(y.key==="Home"){y.preventDefault(),m(x.min);return}y.key==="End"&&(y.preventDefault(),m(x.max))}};return a.jsxs("div",{ref:_,className:`resizable-stack${g?" resizable-stack--dragging":""}`,children:[a.jsx("section",{className:"resizable-stack__primary",children:e}),s?a.jsx("div",{role:"separator",tabIndex:0,"aria-label":"Adjust section heights","aria-orientation":"horizontal",className:`resizable-stack__separator${g?" resizable-stack__separator--dragging":""}`,onPointerDown:d,onKeyDown:f}):null,a.jsx("section",{className:"resizable-stack__secondary",children:t})]})}function hp({selectableTitle:e,selectableItems:t,emptySelectableMessage:n,visibleTitle:r,visibleItems:o,emptyVisibleMessage:s,defaultPrimaryRatio:i=.7}){return a.jsx("div",{className:"content-card signal-sidebar",children:a.jsx(C_,{defaultPrimaryRatio:i,minPrimarySize:144,minSecondarySize:104,primary:a.jsxs("section",{className:"signal-sidebar__panel",children:[a.jsx("div",{className:"signal-sidebar__panel-header",children:a.jsx("div",{className:"signal-sidebar__panel-title",children:e})}),a.jsx("div",{className:"signal-sidebar__panel-body",children:a.jsx("div",{className:"signal-list signal-sidebar__selection-list",children:t.length?t.map(l=>a.jsxs("label",{className:"signal-item signal-item--checkbox",children:[a.jsxs("div",{className:"signal-item__stack",children:[a.jsx("span",{className:"signal-item__name",children:l.label}),l.meta?a.jsx("span",{className:"signal-item__meta",children:l.meta}):null]}),a.jsx("input",{type:"checkbox",checked:l.checked,onChange:u=>l.onCheckedChange(u.target.checked)})]},l.id)):a.jsx("div",{className:"signal-item",children:a.jsx("span",{className:"muted-text",children:n})})})})]}),secondary:a.jsxs("section",{className:"signal-sidebar__panel",children:[a.jsx("div",{className:"signal-sidebar__panel-header",children:a.jsx("div",{className:"signal-sidebar__panel-title",children:r})}),a.jsx("div",{className:"signal-sidebar__panel-body",children:a.jsx("div",{className:"signal-sidebar__visible-list",children:o.length?o.map(l=>a.jsxs("div",{className:"signal-sidebar__visible-item",children:[a.jsx("svg",{className:"signal-sidebar__visible-swatch",viewBox:"0 0 24 12","aria-hidden":"true",focusable:"false",children:a.jsx("line",{x1:"1",x2:"23",y1:"6",y2:"6",stroke:l.color,strokeWidth:"2",strokeLinecap:"round",strokeDasharray:l.lineStyle==="dash"?"6 4":void 0,className:"signal-sidebar__visible-line"})}),a.jsxs("div",{className:"signal-sidebar__visible-copy",children:[a.jsx("span",{className:"signal-sidebar__visible-name",children:l.label}),l.meta?a.jsx("span",{className:"signal-sidebar__visible-meta",children:l.meta}):null]})]},l.id)):a.jsx("div",{className:"muted-text",children:s})})})]})})})}const j_=10,M_='[data-floating-panel-drag-handle="true"]',L_=['[data-floating-panel-no-drag="true"]',"button","input","select","textarea","a"].join(", ");function $o(e,t,n){return Math.min(Math.max(e,t),n)}function T_({containerWidth:e,containerHeight:t,children:n,margin:r=j_,defaultTop:o,defaultRight:s}){const{ref:i,width:l,height:u}=fr(),c=N.useRef(null),p=N.useRef(null),[m,h]=N.useState(null),[g,v]=N.useState(!1),x=Math.max(r,o??r),L=Math.max(r,s??r),_=N.useMemo(()=>Math.max(r,e-l-r),[e,r,l]),d=N.useMemo(()=>Math.max(r,t-u-r),[t,r,u]),f=N.useMemo(()=>w=>({left:$o(w.left,r,_),top:$o(w.top,r,d)}),[r,_,d]);N.useEffect(()=>{h(w=>{if(w===null)return w;const S=f(w);return S.left===w.left&&S.top===w.top?w:S})},[f]),N.useEffect(()=>{if(!g)return;const w=z=>{const P=p.current;if(P===null||z.pointerId!==P.pointerId)return;const te=z.clientX-P.startClientX,W=z.clientY-P.startClientY;h(f({left:P.originLeft+te,top:P.originTop+W}))},S=z=>{const P=p.current;P===null||z!==P.pointerId||(p.current=null,v(!1))},M=z=>{S(z.pointerId)},C=z=>{S(z.pointerId)};return window.addEventListener("pointermove",w),window.addEventListener("pointerup",M),window.addEventListener("pointercancel",C),()=>{window.removeEventListener("pointermove",w),window.removeEventListener("pointerup",M),window.removeEventListener("pointercancel",C)}},[f,g]);const y=w=>{const S=w.target;if(S===null||S.closest(L_)||!S.closest(M_))return;const M=c.current,C=l||(M==null?void 0:M.offsetWidth)||0,z=Math.max(r,e-C-L),P=m??{left:z,top:$o(x,r,d)};w.preventDefault(),p.current={pointerId:w.pointerId,startClientX:w.clientX,startClientY:w.clientY,originLeft:P.left,originTop:P.top},h(P),v(!0)};return N.useLayoutEffect(()=>{const w=c.current;if(w!==null){if(m===null){w.style.top=`${$o(x,r,d)}px`,w.style.left="auto",w.style.right=`${L}px`;return}w.style.left=`${m.left}px`,w.style.top=`${m.top}px`,w.style.right="auto"}},[r,d,m,L,x]),a.jsx("div",{ref:w=>{i(w),c.current=w},className:`svg-chart__floating-panel-shell${g?" svg-chart__floating-panel-shell--dragging":""}`,onPointerDown:y,children:n})}const b_=1e-12;function si(e){return Math.abs(e)<=b_?0:e}function fn(e){return e.replace(/(\.\d*?[1-9])0+$/u,"$1").replace(/\.0+$/u,"").replace(/^-0$/u,"0")}function un(e){const t=si(e),n=Math.abs(t);return n>=100?fn(t.toFixed(0)):n>=10?fn(t.toFixed(1)):n>=1?fn(t.toFixed(2)):n>=.01?fn(t.toFixed(3)):fn(t.toExponential(2).replace("e+","e"))}function I_(e){if(e==null||!Number.isFinite(e))return"--";const t=si(e),n=Math.abs(t);return n===0?"0":n>=1e9?`${un(t/1e9)}G`:n>=1e6?`${un(t/1e6)}M`:n>=1e3?`${un(t/1e3)}k`:n>=.01?un(t):n>=.001?`${un(t/.001)}m`:n>=1e-6?`${un(t/1e-6)}u`:n>=1e-9?`${un(t/1e-9)}n`:fn(t.toExponential(2).replace("e+","e"))}function Mn(e,t=6){if(e==null||!Number.isFinite(e))return"--";const n=si(e);return n===0?"0":fn(n.toPrecision(t).replace("e+","e"))}const A_=900,P_=420,Ka=1e-12,R_="8 6";function Xt(e,t,n){return Math.min(Math.max(e,t),n)}function O_(e,t){if(!Number.isFinite(e)||e<=0)return 1;const n=e/Math.max(t,1),r=10**Math.floor(Math.log10(n)),o=n/r;return o<=1?1*r:o<=2?2*r:o<=2.5?2.5*r:o<=5?5*r:10*r}function Is(e,t){if(!Number.isFinite(e))return null;if(!t)return e;if(e<=0)return null;const n=Math.log10(e);return Number.isFinite(n)?n:null}function z_(e){return e==="right"?"right":"left"}function D_(e){return e==="dash"?"dash":"solid"}function B_(e,t,n){return e==="right"?n:t}function Di(e,t,n){if(e===null||t===null||!Number.isFinite(e)||!Number.isFinite(t))return null;const r=Is(e,n),o=Is(t,n);return r===null||o===null?null:r<=o?{min:r,max:o}:{min:o,max:r}}function Bi(e,t){if(e===null||t===null)return null;const n=Math.max(e.min,t.min),r=Math.min(e.max,t.max);return!Number.isFinite(n)||!Number.isFinite(r)||r<=n?null:{min:n,max:r}}function $_(e,t,n){const r=Math.min(e.x.length,e.y.length),o=[];for(let s=0;s<r;s+=1){const i=Is(e.x[s]??Number.NaN,t),l=Is(e.y[s]??Number.NaN,n);i===null||l===null||o.push({x:i,y:l})}return o}function $i(e,t,n){if(!e.length)return null;const r=Math.min(...e),o=Math.max(...e);if(!Number.isFinite(r)||!Number.isFinite(o))return null;if(Math.abs(o-r)<=Ka){const l=Math.max(Math.abs(r),n,1)*Math.max(t,.08);return{min:r-l,max:o+l}}const s=Math.max((o-r)*t,n);return{min:r-s,max:o+s}}function F_(e,t,n){const r=Math.max(240,Math.round(e)||A_),o=Math.max(180,Math.round(t)||P_),s=n?Xt(Math.round(r*.1),58,78):Xt(Math.round(r*.078),46,62),i=n?Xt(Math.round(r*.1),58,78):Xt(Math.round(r*.03),18,28),l=Xt(Math.round(o*.045),12,20),u=Xt(Math.round(o*.15),52,76),c=120,p=92,m=Math.max(c,r-c),h=Math.max(p,o-p),g=Math.min(1,m/Math.max(s+i,1)),v=Math.min(1,h/Math.max(l+u,1)),x=s*g,L=r-i*g,_=l*v,d=o-u*v;return{svgWidth:r,svgHeight:o,plotLeft:x,plotRight:L,plotTop:_,plotBottom:d}}function _p(e,t,n){const r=Math.max(t.max-t.min,Ka),o=(e-t.min)/r;return n.plotLeft+o*(n.plotRight-n.plotLeft)}function yp(e,t,n){const r=Math.max(t.max-t.min,Ka),o=(e-t.min)/r;return n.plotBottom-o*(n.plotBottom-n.plotTop)}function X_(e,t){const n=e.max-e.min,r=O_(n,t);if(!Number.isFinite(r)||r<=0)return[e.min,e.max];const o=Math.floor(e.min/r)*r,s=Math.ceil(e.max/r)*r,i=Math.min(128,Math.ceil((s-o)/r)+1),l=[];for(let u=0;u<i;u+=1){const c=si(o+r*u);c<e.min-r*.35||c>e.max+r*.35||l.push(c)}return l.length||l.push(e.min,e.max),l}function Fi(e,t,n,r,o){return X_(e,n).map(s=>({value:s,label:I_(o?10**s:s),position:r==="horizontal"?_p(s,e,t):yp(s,e,t)}))}function Y_(e,t,n,r){return e.map(o=>`${_p(o.x,t,r).toFixed(2)},${yp(o.y,n,r).toFixed(2)}`).join(" ")}function W_(e){return e==="dash"?R_:void 0}function U_({series:e,xLabel:t,yLabel:n,secondaryYLabel:r,logX:o,logY:s,rightLogY:i=!1,width:l,height:u,viewWindow:c}){const p=e.map(X=>{const T=z_(X.axis_key),O=D_(X.line_style),B=$_(X,o,B_(T,s,i));return{name:X.name,color:X.color||"#2563eb",axisKey:T,lineStyle:O,component:X.component||"",points:B}}).filter(X=>X.points.length>0);if(!p.length)return null;const m=p.some(X=>X.axisKey==="right"),h=F_(l,u,m),g=p.flatMap(X=>X.points.map(T=>T.x)),v=p.filter(X=>X.axisKey==="left"),x=p.filter(X=>X.axisKey==="right"),L=(v.length?v:p).flatMap(X=>X.points.map(T=>T.y)),_=x.flatMap(X=>X.points.map(T=>T.y)),d=$i(g,.02,o?.05:0),f=$i(L,.08,0),y=m?$i(_,.08,0):null;if(d===null||f===null)return null;const w=c!=null&&c.active?Bi(Di(c.xMin,c.xMax,o),d):null,S=c!=null&&c.active?Bi(Di(c.leftYMin,c.leftYMax,s),f):null,M=c!=null&&c.active&&y!==null?Bi(Di(c.rightYMin,c.rightYMax,i),y):null,C=w??d,z=S??f,P=y===null?null:M??y,te=Xt(Math.round((h.plotRight-h.plotLeft)/82),6,14),W=Xt(Math.round((h.plotBottom-h.plotTop)/40),6,12),_e=Fi(C,h,te,"horizontal",o),ze=Fi(z,h,W,"vertical",s),b=P===null?[]:Fi(P,h,W,"vertical",i),Q=p.map(X=>{const T=X.axisKey==="right"&&P!==null?P:z;return{name:X.name,color:X.color,axisKey:X.axisKey,lineStyle:X.lineStyle,component:X.component,polylinePoints:Y_(X.points,C,T,h),strokeDasharray:W_(X.lineStyle)}});return{viewport:h,xDomain:C,leftDomain:z,rightDomain:P,xLabel:t||"X",leftAxisLabel:n||(m?"Left axis":"Y"),rightAxisLabel:m?r||"Right axis":"",hasRightAxis:m,xTicks:_e,leftTicks:ze,rightTicks:b,renderedSeries:Q}}const Xi=5,H_=9,V_=9,G_=19,K_=34,pc=32,Q_=14,Z_=24,Yi=16,q_=12,mc=8;function J_(e,t){if(!Number.isFinite(e))return null;if(!t)return e;if(e<=0)return null;const n=Math.log10(e);return Number.isFinite(n)?n:null}function ey(e,t){if(!Number.isFinite(e))return null;if(!t)return e;if(e<=0)return null;const n=Math.log10(e);return Number.isFinite(n)?n:null}function hc(e,t){return t?10**e:e}function _c(e,t){return t?10**e:e}function ty(e,t,n){return e==="right"?n:t}function vp({title:e,headerActions:t,floatingPanels:n=[],measurementCursors:r,measurementPoint:o,series:s,xLabel:i,yLabel:l,secondaryYLabel:u,logX:c=!1,logY:p=!1,rightLogY:m=!1,viewWindow:h,onViewportChange:g,emptyMessage:v}){const{ref:x,width:L,height:_}=fr(),d=N.useRef(null),f=N.useRef(r==null?void 0:r.onCursorMove),y=N.useRef(o==null?void 0:o.onMove),w=N.useRef(g),S=N.useRef(null),M=N.useRef(null),[C,z]=N.useState(null),[P,te]=N.useState(null),[W,_e]=N.useState(null),ze=N.useId().replace(/[:]/g,""),b=N.useMemo(()=>U_({series:s,xLabel:i,yLabel:l,secondaryYLabel:u,logX:c,logY:p,rightLogY:m,width:L,height:_,viewWindow:h}),[_,L,c,p,m,u,s,h,i,l]),Q=(e==null?void 0:e.trim())??"",X=Q.length>0||t!==void 0,T=(b==null?void 0:b.viewport)??null,O=(T==null?void 0:T.plotLeft)??0,B=(T==null?void 0:T.plotRight)??0,E=(T==null?void 0:T.plotTop)??0,$=(T==null?void 0:T.plotBottom)??0,Y=(T==null?void 0:T.svgHeight)??0,le=(T==null?void 0:T.svgWidth)??0,U=(b==null?void 0:b.xDomain)??null,q=(b==null?void 0:b.leftDomain)??null,oe=(b==null?void 0:b.rightDomain)??null,se=(b==null?void 0:b.hasRightAxis)??!1,Et=(b==null?void 0:b.xTicks)??[],ho=(b==null?void 0:b.leftTicks)??[],ai=(b==null?void 0:b.rightTicks)??[],_o=(b==null?void 0:b.renderedSeries)??[],yo=(b==null?void 0:b.leftAxisLabel)??l,vo=(b==null?void 0:b.rightAxisLabel)??u??"",an=(E+$)/2,ui=(O+B)/2,ci=Math.min(Y-10,$+K_),go=pc,xo=le-pc;N.useEffect(()=>{f.current=r==null?void 0:r.onCursorMove},[r==null?void 0:r.onCursorMove]),N.useEffect(()=>{y.current=o==null?void 0:o.onMove},[o==null?void 0:o.onMove]),N.useEffect(()=>{w.current=g},[g]),N.useEffect(()=>{S.current=C},[C]),N.useEffect(()=>{M.current=W},[W]);const wo=I=>{if(U===null)return null;const re=d.current;if(re===null)return null;const H=re.getBoundingClientRect();if(H.width<=0)return null;const J=(I-H.left)/H.width*le,ve=Math.min(Math.max(J,O),B),ge=Math.max(B-O,1e-12),be=U.min+(ve-O)/ge*(U.max-U.min);return hc(be,c)},pr=I=>{if(U===null||I===null)return null;const re=J_(I,c);if(re===null)return null;const H=Math.min(Math.max(re,U.min),U.max),J=Math.max(U.max-U.min,1e-12);return O+(H-U.min)/J*(B-O)},di=(I,re)=>{if(I===null)return null;const H=ey(I,ty(re,p,m));if(H===null)return null;const J=re==="right"&&oe!==null?oe:q;if(J===null)return null;const ve=Math.min(Math.max(H,J.min),J.max),ge=Math.max(J.max-J.min,1e-12);return $-(ve-J.min)/ge*($-E)},mr=(I,re)=>{if(U===null||q===null)return null;const H=Math.min(Math.max(I,O),B),J=Math.min(Math.max(re,E),$),ve=Math.max(B-O,1e-12),ge=Math.max($-E,1e-12),be=U.min+(H-O)/ve*(U.max-U.min),So=q.min+($-J)/ge*(q.max-q.min),qa=oe===null?null:oe.min+($-J)/ge*(oe.max-oe.min);return{svgX:H,svgY:J,displayX:hc(be,c),leftDisplayY:_c(So,p),rightDisplayY:qa===null?null:_c(qa,m)}},R=(I,re)=>{const H=d.current;if(H===null)return null;const J=H.getBoundingClientRect();if(J.width<=0||J.height<=0)return null;const ve=(I-J.left)/J.width*le,ge=(re-J.top)/J.height*Y;return mr(ve,ge)},D=(I,re)=>{var J,ve;const H=wo(re);if(H!==null){if(z(I),te(H),I.kind==="measurement-cursor"){(J=f.current)==null||J.call(f,I.cursorId,H);return}(ve=y.current)==null||ve.call(y,H)}},V=(I,re)=>{if(w.current===void 0||S.current!==null)return;const H=R(I,re);H!==null&&_e({anchorSvgX:H.svgX,anchorSvgY:H.svgY,currentSvgX:H.svgX,currentSvgY:H.svgY})};N.useEffect(()=>{if(b===null||C===null){te(null);return}const I=H=>{var ge,be;const J=S.current;if(J===null)return;const ve=wo(H.clientX);if(ve!==null){if(te(ve),J.kind==="measurement-cursor"){(ge=f.current)==null||ge.call(f,J.cursorId,ve);return}(be=y.current)==null||be.call(y,ve)}},re=()=>{z(null),te(null)};return window.addEventListener("pointermove",I),window.addEventListener("pointerup",re),window.addEventListener("pointercancel",re),()=>{window.removeEventListener("pointermove",I),window.removeEventListener("pointerup",re),window.removeEventListener("pointercancel",re)}},[C,b,c,O,B,le,U==null?void 0:U.max,U==null?void 0:U.min]),N.useEffect(()=>{if(b===null||W===null)return;const I=H=>{const J=M.current;if(J===null)return;const ve=R(H.clientX,H.clientY);ve!==null&&_e({...J,currentSvgX:ve.svgX,currentSvgY:ve.svgY})},re=()=>{var So;const H=M.current;if(_e(null),H===null)return;const J=Math.abs(H.currentSvgX-H.anchorSvgX),ve=Math.abs(H.currentSvgY-H.anchorSvgY);if(J<mc||ve<mc)return;const ge=mr(Math.min(H.anchorSvgX,H.currentSvgX),Math.min(H.anchorSvgY,H.currentSvgY)),be=mr(Math.max(H.anchorSvgX,H.currentSvgX),Math.max(H.anchorSvgY,H.currentSvgY));ge===null||be===null||(So=w.current)==null||So.call(w,{active:!0,xMin:Math.min(ge.displayX,be.displayX),xMax:Math.max(ge.displayX,be.displayX),leftYMin:Math.min(ge.leftDisplayY,be.leftDisplayY),leftYMax:Math.max(ge.leftDisplayY,be.leftDisplayY),rightYMin:ge.rightDisplayY===null||be.rightDisplayY===null?null:Math.min(ge.rightDisplayY,be.rightDisplayY),rightYMax:ge.rightDisplayY===null||be.rightDisplayY===null?null:Math.max(ge.rightDisplayY,be.rightDisplayY)})};return window.addEventListener("pointermove",I),window.addEventListener("pointerup",re),window.addEventListener("pointercancel",re),()=>{window.removeEventListener("pointermove",I),window.removeEventListener("pointerup",re),window.removeEventListener("pointercancel",re)}},[W,b,q==null?void 0:q.max,q==null?void 0:q.min,c,p,$,O,B,E,oe==null?void 0:oe.max,oe==null?void 0:oe.min,m,Y,le,U==null?void 0:U.max,U==null?void 0:U.min]);const ae=[{id:"a",label:"A",visible:(r==null?void 0:r.cursorAVisible)??!1,displayX:(C==null?void 0:C.kind)==="measurement-cursor"&&C.cursorId==="a"&&P!==null?P:(r==null?void 0:r.cursorAX)??null},{id:"b",label:"B",visible:(r==null?void 0:r.cursorBVisible)??!1,displayX:(C==null?void 0:C.kind)==="measurement-cursor"&&C.cursorId==="b"&&P!==null?P:(r==null?void 0:r.cursorBX)??null}].map(I=>({...I,plotX:I.visible?pr(I.displayX):null,badgeText:`${I.label} ${Mn(I.displayX)}`})).filter(I=>I.visible&&I.plotX!==null),Qe=(C==null?void 0:C.kind)==="measurement-point"&&P!==null?P:(o==null?void 0:o.displayX)??null,je=o!=null&&o.visible?{plotX:pr(Qe),plotY:di(o.valueY,o.axisKey??"left")}:null,Ye=W===null?null:{x:Math.min(W.anchorSvgX,W.currentSvgX),y:Math.min(W.anchorSvgY,W.currentSvgY),width:Math.abs(W.currentSvgX-W.anchorSvgX),height:Math.abs(W.currentSvgY-W.anchorSvgY)};return a.jsxs("div",{className:"svg-chart-shell",children:[X?a.jsxs("div",{className:"svg-chart-header",children:[Q?a.jsx("div",{className:"svg-chart-title",children:Q}):a.jsx("div",{className:"svg-chart-header__spacer"}),t?a.jsx("div",{className:"svg-chart-header__actions",children:t}):null]}):null,b===null?a.jsx("div",{className:"svg-chart-empty muted-text",children:v}):a.jsxs("div",{ref:x,className:"svg-chart-frame",children:[a.jsxs("svg",{ref:d,viewBox:`0 0 ${le} ${Y}`,className:"svg-chart","aria-label":"Simulation series chart",children:[a.jsx("defs",{children:a.jsx("clipPath",{id:ze,children:a.jsx("rect",{x:O,y:E,width:B-O,height:$-E})})}),a.jsx("rect",{x:O,y:E,width:B-O,height:$-E,className:"svg-chart__plot-bg"}),ho.map(I=>a.jsx("line",{x1:O,x2:B,y1:I.position,y2:I.position,className:"svg-chart__grid"},`grid-y-${I.value}`)),Et.map(I=>a.jsx("line",{x1:I.position,x2:I.position,y1:E,y2:$,className:"svg-chart__grid"},`grid-x-${I.value}`)),a.jsx("line",{x1:O,x2:B,y1:$,y2:$,className:"svg-chart__axis"}),a.jsx("line",{x1:O,x2:O,y1:E,y2:$,className:"svg-chart__axis"}),se?a.jsx("line",{x1:B,x2:B,y1:E,y2:$,className:"svg-chart__axis"}):null,a.jsx("g",{clipPath:`url(#${ze})`,children:_o.map(I=>a.jsx("polyline",{fill:"none",stroke:I.color,strokeWidth:I.lineStyle==="dash"?"1.7":"2",strokeDasharray:I.strokeDasharray,strokeLinecap:"round",strokeLinejoin:"round",points:I.polylinePoints,className:"svg-chart__series"},I.name))}),a.jsx("rect",{x:O,y:E,width:B-O,height:$-E,className:"svg-chart__interaction-hitbox",onPointerDown:g?I=>{I.preventDefault(),V(I.clientX,I.clientY)}:void 0}),je&&je.plotX!==null&&je.plotY!==null?a.jsxs("g",{className:"svg-chart__measurement-point",onPointerDown:y.current?I=>{I.preventDefault(),I.stopPropagation(),D({kind:"measurement-point"},I.clientX)}:void 0,children:[a.jsx("line",{x1:je.plotX,x2:je.plotX,y1:E,y2:$,className:"svg-chart__measurement-point-line"}),a.jsx("line",{x1:je.plotX,x2:je.plotX,y1:E,y2:$,className:"svg-chart__measurement-point-hitbox-line"}),a.jsx("circle",{cx:je.plotX,cy:je.plotY,r:"10",className:"svg-chart__measurement-point-hitbox-marker"}),a.jsx("circle",{cx:je.plotX,cy:je.plotY,r:"4.5",className:"svg-chart__measurement-point-marker"})]}):null,ae.map(I=>(()=>{const re=Math.max(Z_,I.badgeText.length*6.7+q_),H=Math.min(Math.max(I.plotX??0,O+re/2+2),B-re/2-2);return a.jsxs("g",{className:"svg-chart__measurement-cursor",onPointerDown:f.current?J=>{J.preventDefault(),J.stopPropagation(),D({kind:"measurement-cursor",cursorId:I.id},J.clientX)}:void 0,children:[a.jsx("line",{x1:I.plotX??0,x2:I.plotX??0,y1:E,y2:$,className:"svg-chart__measurement-cursor-line"}),a.jsx("line",{x1:I.plotX??0,x2:I.plotX??0,y1:E,y2:$,className:"svg-chart__measurement-cursor-hitbox"}),a.jsx("rect",{x:H-re/2,y:E+2,rx:Yi/2,ry:Yi/2,width:re,height:Yi,className:"svg-chart__measurement-cursor-badge"}),a.jsx("text",{x:H,y:E+Q_,textAnchor:"middle",className:"svg-chart__measurement-cursor-label",children:I.badgeText})]},`measurement-cursor-${I.id}`)})()),ho.map(I=>a.jsxs("g",{children:[a.jsx("line",{x1:O,x2:O-Xi,y1:I.position,y2:I.position,className:"svg-chart__tick"}),a.jsx("text",{x:O-H_,y:I.position+4,textAnchor:"end",className:"svg-chart__tick-label",children:I.label})]},`left-tick-${I.value}`)),ai.map(I=>a.jsxs("g",{children:[a.jsx("line",{x1:B,x2:B+Xi,y1:I.position,y2:I.position,className:"svg-chart__tick"}),a.jsx("text",{x:B+V_,y:I.position+4,textAnchor:"start",className:"svg-chart__tick-label",children:I.label})]},`right-tick-${I.value}`)),Et.map(I=>a.jsxs("g",{children:[a.jsx("line",{x1:I.position,x2:I.position,y1:$,y2:$+Xi,className:"svg-chart__tick"}),a.jsx("text",{x:I.position,y:$+G_,textAnchor:"middle",className:"svg-chart__tick-label",children:I.label})]},`bottom-tick-${I.value}`)),a.jsx("text",{x:ui,y:ci,textAnchor:"middle",className:"svg-chart__axis-title",children:b.xLabel}),a.jsx("text",{x:go,y:an,textAnchor:"middle",transform:`rotate(-90 ${go} ${an})`,className:"svg-chart__axis-title",children:yo}),se?a.jsx("text",{x:xo,y:an,textAnchor:"middle",transform:`rotate(90 ${xo} ${an})`,className:"svg-chart__axis-title",children:vo}):null,Ye!==null?a.jsx("rect",{x:Ye.x,y:Ye.y,width:Ye.width,height:Ye.height,className:"svg-chart__viewport-selection"}):null]}),n.map(I=>a.jsx(T_,{containerWidth:L,containerHeight:_,defaultTop:I.defaultTop,defaultRight:I.defaultRight,children:I.content},I.id))]})]})}function gp(e,t){return((e==null?void 0:e.trim())??"")||t}function ny(e,t){const n=(e==null?void 0:e.trim().toLowerCase())??"";return n==="magnitude"?"Mag":n==="phase"?"Phase":t}function ry(e){return new Map(e.available_series.map(t=>[gp(t.group_key,t.name),t]))}function oy(e,t,n,r){return t.map(o=>({id:o.name,label:t.length>1?ny(o.component,o.name):e,color:o.color,valueA:n[o.name]??null,valueB:r[o.name]??null}))}function sy(e){const t=ry(e),n=new Map;for(const r of e.visible_series){const o=gp(r.group_key,r.name),s=n.get(o)??[];s.push(r),n.set(o,s)}return Array.from(n.entries()).map(([r,o])=>{const s=t.get(r),i=(s==null?void 0:s.name)||r;return{id:r,label:i,rows:oy(i,o,e.measurement.values_a,e.measurement.values_b)}})}function iy(e,t){return e===null||t===null?"--":Mn(t-e)}function ly({state:e,bridge:t}){const n=e.analysis_chart_view,r=e.ui_text,[o,s]=N.useState(""),i=n.chart_type_display_name||n.title||n.chart_type||k(r,"simulation.chart.default_title","Chart"),l=N.useMemo(()=>({active:n.viewport.active,xMin:n.viewport.x_min,xMax:n.viewport.x_max,leftYMin:n.viewport.left_y_min,leftYMax:n.viewport.left_y_max,rightYMin:n.viewport.right_y_min,rightYMax:n.viewport.right_y_max}),[n.viewport.active,n.viewport.left_y_max,n.viewport.left_y_min,n.viewport.right_y_max,n.viewport.right_y_min,n.viewport.x_max,n.viewport.x_min]),u=N.useMemo(()=>sy(n),[n]),c=N.useMemo(()=>u.map(S=>({id:S.id,label:S.label})),[u]),m=c.length>0||n.measurement_point.enabled,h=n.has_chart?a.jsxs(a.Fragment,{children:[a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!n.has_chart,onClick:()=>t==null?void 0:t.resetChartViewport(),children:k(r,"common.fit","Fit")}),a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!n.has_chart,onClick:()=>t==null?void 0:t.setChartMeasurementEnabled(!n.measurement_enabled),children:n.measurement_enabled?k(r,"simulation.chart.disable_measurement","Disable Measurement"):k(r,"simulation.chart.enable_measurement","Enable Measurement")}),a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!m,onClick:()=>t==null?void 0:t.setChartMeasurementPointEnabled(!n.measurement_point.enabled),children:n.measurement_point.enabled?k(r,"simulation.chart.disable_measurement_point","Disable Measurement Point"):k(r,"simulation.chart.enable_measurement_point","Enable Measurement Point")}),a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!n.available_series.length,onClick:()=>t==null?void 0:t.clearAllChartSeries(),children:k(r,"simulation.chart.clear_signals","Clear Signals")}),a.jsx("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!n.can_add_to_conversation,onClick:()=>t==null?void 0:t.addToConversation("chart"),children:k(r,"common.add_to_conversation","Add to Conversation")})]}):void 0,g=N.useMemo(()=>n.available_series.filter(S=>S.visible),[n.available_series]),v=N.useMemo(()=>n.available_series.map(S=>({id:S.name,label:S.name,checked:S.visible,onCheckedChange:M=>t==null?void 0:t.setChartSeriesVisible(S.name,M)})),[t,n.available_series]),x=N.useMemo(()=>g.map(S=>({id:S.name,label:S.name,color:S.color,lineStyle:S.line_style==="dash"?"dash":"solid"})),[g]),L=N.useMemo(()=>{var S;return n.measurement_point.target_id&&c.some(M=>M.id===n.measurement_point.target_id)?n.measurement_point.target_id:((S=c[0])==null?void 0:S.id)??""},[n.measurement_point.target_id,c]),_=N.useMemo(()=>{var S;return n.measurement_point.target_id&&c.some(M=>M.id===n.measurement_point.target_id)?n.measurement_point.target_id:((S=c[0])==null?void 0:S.id)??""},[n.measurement_point.target_id,c]);N.useEffect(()=>{s(S=>c.some(M=>M.id===S)?S:L)},[c,L]);const d=N.useMemo(()=>u.length?u.find(S=>S.id===o)??u[0]:null,[u,o]),f=N.useMemo(()=>((d==null?void 0:d.rows)??[]).map(S=>({id:S.id,label:S.label,color:S.color,valueA:Mn(S.valueA),valueB:Mn(S.valueB),delta:iy(S.valueA,S.valueB)})),[d]),y=N.useMemo(()=>n.measurement_point.values.map((S,M)=>({id:`${S.label}-${M}`,label:S.label,valueText:S.value_text})),[n.measurement_point.values]),w=N.useMemo(()=>{const S=[];return n.measurement_point.enabled&&S.push({id:"measurement-point",defaultTop:16,defaultRight:16,content:a.jsx(S_,{title:k(r,"simulation.chart.measurement_point","Measurement Point"),signalOptions:c,selectedSignalId:_,onSelectedSignalChange:M=>t==null?void 0:t.setChartMeasurementPointTarget(M),rows:y,emptyMessage:k(r,"simulation.chart.measurement_point_empty","No sampled values are available for the current measurement point."),uiText:r})}),n.measurement_enabled&&S.push({id:"measurement",defaultTop:n.measurement_point.enabled?204:16,defaultRight:16,content:a.jsx(mp,{title:k(r,"simulation.chart.measurement","Measurement"),signalOptions:c,selectedSignalId:(d==null?void 0:d.id)??"",onSelectedSignalChange:s,rows:f,emptyMessage:k(r,"simulation.chart.measurement_empty","No measurement values are available for the selected signal."),uiText:r})}),S},[d==null?void 0:d.id,t,n.measurement_enabled,n.measurement_point.enabled,f,y,_,c,r]);return a.jsx("div",{className:"tab-surface",children:a.jsx(oi,{sidebarConfig:{defaultSize:176,minSize:132,maxSize:360,mainMinSize:320,resizable:!0},sidebar:a.jsx(hp,{selectableTitle:k(r,"simulation.chart.select_signals","Select Signals"),selectableItems:v,emptySelectableMessage:k(r,"simulation.chart.no_selectable_series","No chart series are available for the current result."),visibleTitle:k(r,"simulation.chart.visible_series","Visible"),visibleItems:x,emptyVisibleMessage:k(r,"simulation.chart.no_visible_series","No signals are currently visible."),defaultPrimaryRatio:.7}),main:a.jsx("div",{className:"content-card content-card--canvas",children:a.jsx(vp,{title:n.has_chart?i:"",headerActions:h,floatingPanels:w,measurementCursors:{cursorAVisible:n.measurement_enabled,cursorBVisible:n.measurement_enabled,cursorAX:n.measurement.cursor_a_x,cursorBX:n.measurement.cursor_b_x,onCursorMove:(S,M)=>t==null?void 0:t.moveChartMeasurementCursor(S,M)},measurementPoint:{visible:n.measurement_point.enabled,displayX:n.measurement_point.point_x,valueY:n.measurement_point.plot_y,axisKey:n.measurement_point.plot_axis_key,onMove:S=>t==null?void 0:t.moveChartMeasurementPoint(S)},viewWindow:l,onViewportChange:S=>t==null?void 0:t.setChartViewport(S),series:n.visible_series,xLabel:n.x_label,yLabel:n.y_label,secondaryYLabel:n.secondary_y_label,logX:n.log_x,logY:n.log_y,rightLogY:n.right_log_y,emptyMessage:n.has_chart?k(r,"simulation.chart.empty_hidden","No series are currently displayed. Re-select them from the left sidebar."):k(r,"simulation.chart.empty_no_chart","No chart is available for the current result.")})})})})}const yc=2,ay=4,uy=280;function cy(e){return!Number.isFinite(e)||e<=0?yc:Math.max(yc,Math.min(ay,Math.floor(e/uy)))}function dy({state:e,bridge:t}){const n=e.simulation_runtime,{items:r}=e.circuit_selection_view,o=e.ui_text,{ref:s,width:i}=fr(),u=["circuit-selection-grid",`circuit-selection-grid--cols-${cy(i)}`].join(" ");return a.jsx("div",{className:"tab-surface",children:a.jsx("div",{ref:s,className:"content-card content-card--scrollable circuit-selection-surface",children:n.has_project?r.length===0?a.jsxs("div",{className:"surface-state-card surface-state-card--empty",children:[a.jsx("div",{className:"card-title",children:k(o,"simulation.circuit_selection.no_history","No simulation history yet")}),a.jsx("div",{className:"muted-text",children:k(o,"simulation.circuit_selection.no_history_hint","Run a simulation once and results will be grouped by circuit here.")})]}):a.jsx("div",{className:u,children:r.map(c=>a.jsx(fy,{item:c,uiText:o,onSelect:()=>{const p=c.latest_result;!t||!p.can_load||!p.result_path||t.loadResultByPath(p.result_path)}},c.circuit_absolute_path||c.circuit_file))}):a.jsxs("div",{className:"surface-state-card surface-state-card--empty",children:[a.jsx("div",{className:"card-title",children:k(o,"simulation.circuit_selection.no_project","No project is open yet")}),a.jsx("div",{className:"muted-text",children:k(o,"simulation.circuit_selection.no_project_hint","Open a project and run a simulation before choosing a circuit here.")})]})})})}function fy({item:e,uiText:t,onSelect:n}){const r=e.latest_result,o=[r.analysis_type,r.timestamp].filter(Boolean),s=[r.success?null:{label:k(t,"simulation.circuit_selection.latest_failed","Latest Failed"),modifier:" circuit-selection-card__badge--error"},e.is_current?{label:k(t,"common.current","Current"),modifier:" circuit-selection-card__badge--current"}:null,r.can_load?null:{label:k(t,"simulation.circuit_selection.not_loadable","Not Loadable"),modifier:""}].filter(u=>u!==null),i=["circuit-selection-card",e.is_current?"circuit-selection-card--active":"",r.can_load?"":"circuit-selection-card--disabled"].filter(Boolean).join(" "),l=e.circuit_display_name||r.file_name||k(t,"simulation.circuit_selection.unnamed_circuit","Unnamed Circuit");return a.jsxs("button",{type:"button",className:i,disabled:!r.can_load,onClick:n,title:e.circuit_absolute_path||e.circuit_file,...e.is_current?{"aria-current":"true"}:null,children:[a.jsxs("div",{className:"circuit-selection-card__header",children:[a.jsxs("div",{className:"circuit-selection-card__title-block",children:[a.jsx("div",{className:"circuit-selection-card__title",children:l}),a.jsx("div",{className:"circuit-selection-card__meta",children:o.length?k(t,"simulation.circuit_selection.latest_run","Latest: {meta}",{meta:o.join(" · ")}):k(t,"simulation.circuit_selection.latest_run_empty","Latest: No metadata")})]}),a.jsx("div",{className:"circuit-selection-card__run-count",children:k(t,"simulation.circuit_selection.run_count","{count} runs",{count:e.run_count})})]}),a.jsx("div",{className:"circuit-selection-card__footer",children:a.jsx("div",{className:"circuit-selection-card__badge-row",children:s.map(u=>a.jsx("span",{className:`circuit-selection-card__badge${u.modifier}`,children:u.label},u.label))})})]})}const vc={metrics:{key:"simulation.export.metrics",fallback:"Metrics"},charts:{key:"simulation.export.charts",fallback:"Charts"},waveforms:{key:"simulation.export.waveforms",fallback:"Waveforms"},analysis_info:{key:"simulation.export.analysis_info",fallback:"Analysis Info"},raw_data:{key:"simulation.export.raw_data",fallback:"Raw Data"},output_log:{key:"simulation.export.output_log",fallback:"Output Log"},op_result:{key:"simulation.export.op_result",fallback:"Operating Point Result"}};function py({state:e,bridge:t}){const n=e.export_view,r=e.ui_text,o=n.items.filter(i=>i.enabled),s=o.filter(i=>i.selected).length;return a.jsxs("div",{className:"tab-surface",children:[a.jsx(Ga,{title:k(r,"simulation.export.title","Export"),actions:a.jsx("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!n.can_export,onClick:()=>t==null?void 0:t.requestExport(),children:k(r,"simulation.export.export_selected","Export Selected Items")})}),a.jsxs("div",{className:"content-card content-card--scrollable",children:[a.jsxs("div",{className:"table-toolbar-grid",children:[a.jsxs("label",{className:"field-row field-row--grow",children:[a.jsx("span",{className:"field-row__label",children:k(r,"simulation.export.directory","Export Directory")}),a.jsx("input",{className:"field-input",value:n.selected_directory||k(r,"simulation.export.not_selected","Not Selected"),readOnly:!0})]}),a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!n.has_result,onClick:()=>t==null?void 0:t.chooseExportDirectory(),children:k(r,"simulation.export.choose_directory","Choose Directory")}),a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!n.selected_directory,onClick:()=>t==null?void 0:t.clearExportDirectory(),children:k(r,"simulation.export.clear_directory","Clear Directory")}),a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!o.length,onClick:()=>t==null?void 0:t.setAllExportTypesSelected(!0),children:k(r,"simulation.export.select_all","Select All")}),a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!s,onClick:()=>t==null?void 0:t.setAllExportTypesSelected(!1),children:k(r,"simulation.export.clear_selection","Clear Selection")})]}),a.jsx("div",{className:"export-grid",children:n.items.length?n.items.map(i=>{var l,u;return a.jsxs("label",{className:`export-item export-item--option${i.enabled?"":" export-item--disabled"}`,children:[a.jsx("input",{type:"checkbox",className:"export-item__checkbox",checked:i.selected,disabled:!i.enabled,onChange:c=>t==null?void 0:t.setExportTypeSelected(i.id,c.target.checked)}),a.jsx("span",{className:"export-item__label",children:k(r,((l=vc[i.id])==null?void 0:l.key)??"",((u=vc[i.id])==null?void 0:u.fallback)??(i.label||i.id))})]},i.id)}):a.jsx("div",{className:"export-item",children:a.jsx("div",{className:"muted-text",children:k(r,"simulation.export.empty","There are no exportable items yet.")})})}),a.jsxs("div",{className:"info-row",children:[a.jsx("div",{className:"card-title",children:k(r,"simulation.export.recent_project_directory","Recent Project Export Directory")}),a.jsx("div",{className:"info-row__value export-path-value",children:n.latest_project_export_root||k(r,"simulation.export.none","None")})]})]})]})}function my(e,t){const n=e.map(r=>`${r.name}${r.target}`);return`${t}${n.join("")}`}function gc(e){const t={};for(const n of e)t[n.name]=n.target;return t}function hy(e,t){for(const n of e)if((t[n.name]??"").trim()!==n.target.trim())return!0;return!1}function _y({state:e,bridge:t}){const n=e.metrics_view.items,r=e.metrics_view.source_file_path,o=e.metrics_view.can_add_to_conversation,s=e.ui_text,i=N.useMemo(()=>my(n,r),[n,r]),[l,u]=N.useState(()=>gc(n));N.useEffect(()=>{u(gc(n))},[i]);const p=N.useMemo(()=>hy(n,l),[n,l])&&t!==null&&r.length>0,m=(v,x)=>{u(L=>({...L,[v]:x}))},h=()=>{if(!p||t===null)return;const v={};for(const x of n){const L=(l[x.name]??"").trim();L?v[x.name]=L:v[x.name]=""}t.updateMetricTargets({sourceFilePath:r,targets:v})},g=()=>{o&&(t==null||t.addToConversation("metrics"))};return a.jsxs("div",{className:"tab-surface tab-surface--metrics",children:[a.jsxs("div",{className:"metrics-overlay",children:[a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!p,onClick:h,children:k(s,"simulation.metrics.confirm_changes","Confirm Changes")}),a.jsx("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!o,onClick:g,children:k(s,"common.add_to_conversation","Add to Conversation")})]}),n.length?a.jsx("div",{className:"metrics-matrix-scroll",children:a.jsxs("table",{className:"metrics-matrix",children:[a.jsx("thead",{children:a.jsxs("tr",{children:[a.jsx("th",{className:"metrics-matrix__corner","aria-hidden":"true"}),n.map(v=>a.jsxs("th",{className:"metrics-matrix__col-head",scope:"col",children:[a.jsx("span",{className:"metrics-matrix__metric-name",children:v.display_name||v.name}),v.unit?a.jsx("span",{className:"metrics-matrix__metric-unit",children:v.unit}):null]},v.name))]})}),a.jsxs("tbody",{children:[a.jsxs("tr",{children:[a.jsx("th",{className:"metrics-matrix__row-head",scope:"row",children:k(s,"common.current_value","Current Value")}),n.map(v=>a.jsx("td",{className:"metrics-matrix__current",children:v.value||"--"},v.name))]}),a.jsxs("tr",{children:[a.jsx("th",{className:"metrics-matrix__row-head",scope:"row",children:k(s,"common.target_value","Target Value")}),n.map(v=>a.jsx("td",{className:"metrics-matrix__target",children:a.jsx("input",{type:"text",className:"metrics-matrix__target-input",value:l[v.name]??"",placeholder:k(s,"simulation.metrics.target_placeholder","e.g. ≥ 20 dB"),spellCheck:!1,autoComplete:"off",onChange:x=>m(v.name,x.target.value)})},v.name))]})]})]})}):a.jsxs("div",{className:"metrics-matrix-empty",children:[a.jsx("div",{className:"metrics-matrix-empty__title",children:k(s,"simulation.metrics.empty_title","No Metrics")}),a.jsx("div",{className:"metrics-matrix-empty__hint",children:k(s,"simulation.metrics.empty_hint","Add `.MEASURE` statements to the SPICE file and run a simulation to generate metrics.")})]})]})}function yy({state:e,bridge:t}){const n=e.op_result_view,r=e.ui_text;return a.jsxs("div",{className:"tab-surface",children:[a.jsx(Ga,{title:k(r,"simulation.op_result.title","Operating Point Result"),description:k(r,"simulation.op_result.description","Local action area plus a structured result table."),actions:a.jsx("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!n.can_add_to_conversation,onClick:()=>t==null?void 0:t.addToConversation("op_result"),children:k(r,"common.add_to_conversation","Add to Conversation")})}),a.jsx(oi,{sidebar:a.jsx("div",{className:"content-card content-card--scrollable",children:a.jsxs("div",{className:"info-grid",children:[a.jsxs("div",{className:"info-row",children:[a.jsx("div",{className:"card-title",children:k(r,"simulation.op_result.result_file","Result File")}),a.jsx("div",{className:"info-row__value",children:n.file_name||k(r,"simulation.op_result.unnamed_result","Unnamed Result")})]}),a.jsxs("div",{className:"info-row",children:[a.jsx("div",{className:"card-title",children:k(r,"simulation.op_result.analysis_command","Analysis Command")}),a.jsx("div",{className:"info-row__value",children:n.analysis_command||".op"})]}),a.jsxs("div",{className:"info-row",children:[a.jsx("div",{className:"card-title",children:k(r,"simulation.op_result.row_count","Row Count")}),a.jsx("div",{className:"info-row__value",children:n.row_count})]}),a.jsxs("div",{className:"info-row",children:[a.jsx("div",{className:"card-title",children:k(r,"simulation.op_result.section_count","Section Count")}),a.jsx("div",{className:"info-row__value",children:n.section_count})]})]})}),main:a.jsx("div",{className:"content-card content-card--scrollable",children:a.jsx("div",{className:"op-stage op-stage--table",children:n.sections.length?n.sections.map(o=>a.jsxs("section",{className:"op-section",children:[a.jsxs("div",{className:"op-section__header",children:[a.jsx("div",{className:"card-title",children:o.title}),a.jsx("div",{className:"card-subtitle",children:k(r,"simulation.op_result.item_count","{count} items",{count:o.row_count})})]}),o.rows.length?a.jsx("div",{className:"op-row-list",children:o.rows.map(s=>a.jsxs("div",{className:"op-row",children:[a.jsx("div",{className:"op-row__name",children:s.name}),a.jsx("div",{className:"op-row__value",children:s.formatted_value||k(r,"simulation.op_result.invalid_value","Invalid Value")})]},`${o.id}:${s.name}`))}):a.jsx("div",{className:"muted-text",children:k(r,"simulation.op_result.empty_section","No results are available for the current section.")})]},o.id)):a.jsx("div",{className:"muted-text",children:k(r,"simulation.op_result.empty","The current result does not contain structured operating-point data.")})})})})]})}function vy({state:e,bridge:t}){const n=e.output_log_view,r=e.ui_text,[o,s]=N.useState(n.search_keyword),[i,l]=N.useState(n.current_filter||"all"),[u,c]=N.useState("idle");N.useEffect(()=>{s(n.search_keyword)},[n.search_keyword]),N.useEffect(()=>{l(n.current_filter||"all")},[n.current_filter]);const p=()=>{if(!t||!n.lines.length)return;const h=n.lines.map(g=>g.content).join(`
-`);t.copyTextToClipboard(h),c("copied"),window.setTimeout(()=>c("idle"),1500)},m=u==="copied"?k(r,"common.copied","Copied"):k(r,"common.copy","Copy");return a.jsx("div",{className:"tab-surface",children:a.jsxs("div",{className:"content-card content-card--scrollable",children:[a.jsxs("div",{className:"table-toolbar-grid",children:[a.jsxs("label",{className:"field-row field-row--grow",children:[a.jsx("span",{className:"field-row__label",children:k(r,"simulation.output_log.keyword","Keyword")}),a.jsx("input",{className:"field-input",value:o,onChange:h=>s(h.target.value),placeholder:k(r,"simulation.output_log.search_placeholder","Enter search keyword")})]}),a.jsx("button",{type:"button",className:"sim-compact-button",onClick:()=>t==null?void 0:t.searchOutputLog(o),children:k(r,"common.search","Search")}),a.jsxs("label",{className:"field-row",children:[a.jsx("span",{className:"field-row__label",children:k(r,"common.filter","Filter")}),a.jsxs("select",{className:"field-select",value:i,onChange:h=>l(h.target.value),children:[a.jsx("option",{value:"all",children:k(r,"common.all","All")}),a.jsx("option",{value:"error",children:k(r,"common.error","Error")}),a.jsx("option",{value:"warning",children:k(r,"common.warning","Warning")}),a.jsx("option",{value:"info",children:k(r,"common.info","Info")})]})]}),a.jsx("button",{type:"button",className:"sim-compact-button",onClick:()=>t==null?void 0:t.filterOutputLog(i),children:k(r,"simulation.output_log.apply_filter","Apply Filter")}),a.jsx("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!n.can_add_to_conversation,onClick:()=>t==null?void 0:t.addToConversation("output_log"),children:k(r,"common.add_to_conversation","Add to Conversation")}),a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!n.lines.length,onClick:p,children:m})]}),a.jsx("div",{className:"log-stage log-stage--lines",children:n.lines.length?n.lines.map(h=>a.jsxs("div",{className:`log-line log-line--${h.level}${h.line_number===n.selected_line_number?" log-line--selected":""}`,children:[a.jsx("span",{className:"log-line__number",children:h.line_number}),a.jsx("span",{className:"log-line__content",children:h.content})]},h.line_number)):a.jsx("div",{className:"muted-text",children:k(r,"simulation.output_log.empty","There are currently no log lines to display.")})})]})})}function gy(e,t){return e===null||t===null?"--":Mn(t-e)}function xy({state:e,bridge:t}){var L;const n=e.waveform_view,r=e.ui_text,[o,s]=N.useState(""),i=(e.analysis_info_view.analysis_type||"").trim().toLowerCase(),l=N.useMemo(()=>({active:n.viewport.active,xMin:n.viewport.x_min,xMax:n.viewport.x_max,leftYMin:n.viewport.left_y_min,leftYMax:n.viewport.left_y_max,rightYMin:n.viewport.right_y_min,rightYMax:n.viewport.right_y_max}),[n.viewport.active,n.viewport.left_y_max,n.viewport.left_y_min,n.viewport.right_y_max,n.viewport.right_y_min,n.viewport.x_max,n.viewport.x_min]),u=N.useMemo(()=>{const _=Array.from(new Set([...n.visible_series.map(f=>f.name),...Object.keys(n.measurement.values_a),...Object.keys(n.measurement.values_b)])),d=new Map(n.visible_series.map(f=>[f.name,f]));return _.map(f=>{var y;return{id:f,label:f,color:((y=d.get(f))==null?void 0:y.color)??"#1f77b4",valueA:n.measurement.values_a[f]??null,valueB:n.measurement.values_b[f]??null}})},[n.measurement.values_a,n.measurement.values_b,n.visible_series]),c=N.useMemo(()=>n.has_waveform?i==="tran"?k(r,"simulation.waveform.time_domain_title","Time-Domain Waveform"):i==="dc"?k(r,"simulation.waveform.dc_sweep_title","DC Sweep Waveform"):k(r,"simulation.waveform.default_title","Waveform"):"",[i,r,n.has_waveform]),p=n.has_waveform?a.jsxs(a.Fragment,{children:[a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!n.has_waveform,onClick:()=>t==null?void 0:t.resetWaveformViewport(),children:k(r,"common.fit","Fit")}),a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!n.has_waveform,onClick:()=>t==null?void 0:t.setCursorVisible("a",!n.cursor_a_visible),children:n.cursor_a_visible?k(r,"simulation.waveform.hide_cursor_a","Hide A"):k(r,"simulation.waveform.show_cursor_a","Show A")}),a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!n.has_waveform,onClick:()=>t==null?void 0:t.setCursorVisible("b",!n.cursor_b_visible),children:n.cursor_b_visible?k(r,"simulation.waveform.hide_cursor_b","Hide B"):k(r,"simulation.waveform.show_cursor_b","Show B")}),a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!n.signal_catalog.length,onClick:()=>t==null?void 0:t.clearAllSignals(),children:k(r,"simulation.waveform.clear_signals","Clear Signals")}),a.jsx("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!n.can_add_to_conversation,onClick:()=>t==null?void 0:t.addToConversation("waveform"),children:k(r,"common.add_to_conversation","Add to Conversation")})]}):void 0,m=N.useMemo(()=>n.signal_catalog.map(_=>({id:_.name,label:_.name,checked:_.visible,onCheckedChange:d=>t==null?void 0:t.setSignalVisible(_.name,d)})),[t,n.signal_catalog]),h=N.useMemo(()=>n.visible_series.map(_=>({id:_.name,label:_.name,color:_.color})),[n.signal_catalog,n.visible_series]),g=((L=u[0])==null?void 0:L.id)??"";N.useEffect(()=>{s(_=>u.some(d=>d.id===_)?_:g)},[u,g]);const v=N.useMemo(()=>u.length?u.find(_=>_.id===o)??u[0]:null,[u,o]),x=N.useMemo(()=>v===null?[]:[{id:v.id,label:v.label,color:v.color,valueA:Mn(v.valueA),valueB:Mn(v.valueB),delta:gy(v.valueA,v.valueB)}],[v]);return a.jsx("div",{className:"tab-surface",children:a.jsx(oi,{sidebarConfig:{defaultSize:176,minSize:132,maxSize:360,mainMinSize:320,resizable:!0},sidebar:a.jsx(hp,{selectableTitle:k(r,"simulation.waveform.select_signals","Select Signals"),selectableItems:m,emptySelectableMessage:k(r,"simulation.waveform.no_selectable_signals","No waveform signals are available for the current result."),visibleTitle:k(r,"simulation.waveform.visible_signals","Visible"),visibleItems:h,emptyVisibleMessage:k(r,"simulation.waveform.no_visible_signals","No signals are currently visible."),defaultPrimaryRatio:.7}),main:a.jsx("div",{className:"content-card content-card--canvas",children:a.jsx(vp,{title:c,headerActions:p,floatingPanels:n.cursor_a_visible||n.cursor_b_visible?[{id:"waveform-measurement",defaultTop:16,defaultRight:16,content:a.jsx(mp,{title:k(r,"simulation.waveform.measurement","Measurement"),signalOptions:u.map(_=>({id:_.id,label:_.label})),selectedSignalId:(v==null?void 0:v.id)??"",onSelectedSignalChange:s,rows:x,emptyMessage:k(r,"simulation.waveform.measurement_empty","No measurement values are available for the selected signal."),uiText:r})}]:[],measurementCursors:{cursorAVisible:n.cursor_a_visible,cursorBVisible:n.cursor_b_visible,cursorAX:n.measurement.cursor_a_x,cursorBX:n.measurement.cursor_b_x,onCursorMove:(_,d)=>t==null?void 0:t.moveCursor(_,d)},viewWindow:l,onViewportChange:_=>t==null?void 0:t.setWaveformViewport(_),series:n.visible_series,xLabel:n.x_axis_label,yLabel:n.y_label||"Waveform",secondaryYLabel:n.secondary_y_label,logX:n.log_x,emptyMessage:n.has_waveform?k(r,"simulation.waveform.empty_hidden","No waveform is currently displayed. Select signals from the left sidebar."):k(r,"simulation.waveform.empty_no_waveform","No waveform is available for the current result.")})})})})}const wy={circuit_selection:({state:e,bridge:t})=>a.jsx(dy,{state:e,bridge:t}),metrics:({state:e,bridge:t})=>a.jsx(_y,{state:e,bridge:t}),schematic:()=>null,chart:({state:e,bridge:t})=>a.jsx(ly,{state:e,bridge:t}),waveform:({state:e,bridge:t})=>a.jsx(xy,{state:e,bridge:t}),analysis_info:({state:e})=>a.jsx(h_,{state:e}),raw_data:()=>null,output_log:({state:e,bridge:t})=>a.jsx(vy,{state:e,bridge:t}),export:({state:e,bridge:t})=>a.jsx(py,{state:e,bridge:t}),asc_conversion:({state:e,bridge:t})=>a.jsx(__,{state:e,bridge:t}),op_result:({state:e,bridge:t})=>a.jsx(yy,{state:e,bridge:t})};function Sy({activeTab:e,state:t,bridge:n}){return a.jsx(a.Fragment,{children:wy[e]({state:t,bridge:n})})}const ky={circuit_selection:{key:"panel.simulation.tab.circuit_selection",fallback:"Circuit Selection"},metrics:{key:"panel.simulation.tab.metrics",fallback:"Metrics"},schematic:{key:"panel.simulation.tab.schematic",fallback:"Schematic"},chart:{key:"panel.simulation.tab.chart",fallback:"Chart"},waveform:{key:"panel.simulation.tab.waveform",fallback:"Waveform"},analysis_info:{key:"panel.simulation.tab.analysis_info",fallback:"Analysis Info"},raw_data:{key:"panel.simulation.tab.raw_data",fallback:"Raw Data"},output_log:{key:"panel.simulation.tab.output_log",fallback:"Output Log"},export:{key:"panel.simulation.tab.export",fallback:"Export"},asc_conversion:{key:"panel.simulation.tab.asc_conversion",fallback:"ASC Conversion"},op_result:{key:"panel.simulation.tab.op_result",fallback:"Operating Point Result"}};function Ny({activeTab:e,availableTabs:t,onTabSelect:n,uiText:r}){return a.jsxs("nav",{className:"simulation-tab-bar-shell","aria-label":k(r,"panel.simulation.tab_navigation","Simulation result tabs"),children:[a.jsx("span",{className:"simulation-tab-bar__title","aria-hidden":"true",children:k(r,"panel.simulation","Simulation Panel")}),a.jsx("div",{className:"simulation-tab-bar",role:"tablist","aria-orientation":"horizontal",children:t.map(o=>{const s=o===e,i=ky[o],l=i?k(r,i.key,i.fallback):o;return s?a.jsx("button",{type:"button",role:"tab","aria-selected":"true",className:"simulation-tab-chip simulation-tab-chip--active",onClick:()=>n(o),children:l},o):a.jsx("button",{type:"button",role:"tab","aria-selected":"false",className:"simulation-tab-chip",onClick:()=>n(o),children:l},o)})})]})}const Ey=new Set(["circuit_selection"]);function Cy({state:e,bridgeConnected:t,children:n,onTabSelect:r}){const o=e.simulation_runtime,s=e.surface_tabs.active_tab,i=e.surface_tabs.available_tabs,l=e.ui_text,u=!!o.status_message,c=!!o.error_message,p=o.is_empty&&!Ey.has(s),m=i.includes("circuit_selection"),h=o.awaiting_confirmation?"surface-state-card--warning":"surface-state-card--info";return a.jsxs("div",{className:"simulation-shell",children:[a.jsx("header",{className:"simulation-shell__header",children:a.jsx(Ny,{activeTab:s,availableTabs:i,onTabSelect:r,uiText:l})}),a.jsx("section",{className:"simulation-shell__body",children:a.jsx("div",{className:"simulation-active-surface",children:a.jsxs("div",{className:"simulation-active-surface__frame",children:[!t||c||u||p?a.jsxs("div",{className:"surface-state-stack",children:[t?null:a.jsxs("div",{className:"surface-state-card surface-state-card--warning",children:[a.jsx("div",{className:"card-title",children:k(l,"panel.simulation.bridge_disconnected_title","Frontend bridge is disconnected")}),a.jsx("div",{className:"muted-text",children:k(l,"panel.simulation.bridge_disconnected_message","Some local actions may be temporarily unavailable, but the current tab layout still reflects the authoritative state shell.")})]}),c?a.jsxs("div",{className:"surface-state-card surface-state-card--error",children:[a.jsx("div",{className:"card-title",children:k(l,"panel.simulation.error_title","Simulation Error")}),a.jsx("div",{className:"muted-text",children:o.error_message})]}):u?a.jsxs("div",{className:`surface-state-card ${h}`,children:[a.jsx("div",{className:"card-title",children:k(l,"panel.simulation.status_title","Runtime Status")}),a.jsx("div",{className:"muted-text",children:o.status_message})]}):null,p?a.jsxs("div",{className:"surface-state-card surface-state-card--empty",children:[a.jsx("div",{className:"card-title",children:k(l,"panel.simulation.empty_title","No Simulation Result Yet")}),a.jsx("div",{className:"muted-text",children:o.has_project?k(l,"panel.simulation.empty_with_project","Run a simulation once and the current tab will display the corresponding result."):k(l,"panel.simulation.empty_without_project","Open a project and run a simulation first.")}),m?a.jsx("div",{className:"surface-state-actions",children:a.jsx("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",onClick:()=>r("circuit_selection"),children:k(l,"panel.simulation.go_to_circuit_selection","Go to Circuit Selection")})}):null]}):null]}):null,a.jsx("div",{className:"simulation-active-surface__viewport",children:n})]})})})]})}const jy=28,My=32,Ly=64,Wi=96,xc=20,wc=4;function Bt(e,t,n){return e<t?t:e>n?n:e}function Ui(e,t){if(t.length<=1)return 0;const n=t.length-2,r=Math.max(0,e);let o=0,s=n;for(;o<=s;){const i=Math.floor((o+s)/2),l=t[i],u=t[i+1];if(r<l){s=i-1;continue}if(r>=u){o=i+1;continue}return i}return Bt(o,0,n)}function Ty(e){return e?{startRow:Math.min(e.anchor.row,e.focus.row),endRow:Math.max(e.anchor.row,e.focus.row),startCol:Math.min(e.anchor.col,e.focus.col),endCol:Math.max(e.anchor.col,e.focus.col)}:null}const by=N.memo(function({rawDataCopyResult:t,rawDataDocument:n,rawDataViewport:r,bridge:o,uiText:s}){const i=N.useRef(null),[l,u]=N.useState({width:0,height:0}),[c,p]=N.useState(0),[m,h]=N.useState(0),[g,v]=N.useState(null),[x,L]=N.useState(!1),[_,d]=N.useState(null),[f,y]=N.useState(0),w=n.row_count,S=n.columns,M=S.length,C=Math.max(n.row_height_px||jy,20),z=Math.max(n.column_header_height_px||My,24),P=Math.max(n.row_header_width_px||Ly,52),te=N.useMemo(()=>S.map(R=>Math.max(R.width_px||0,Wi)),[S]),W=N.useMemo(()=>{const R=[0];for(const D of te)R.push(R[R.length-1]+D);return R},[te]),_e=W[W.length-1]||0,ze=w*C,b=r.dataset_id===n.dataset_id&&r.version===n.version;N.useEffect(()=>{const R=i.current;if(!R)return;const D=()=>{u({width:R.clientWidth,height:R.clientHeight})};D();const V=new ResizeObserver(D);return V.observe(R),()=>{V.disconnect()}},[]),N.useEffect(()=>{const R=i.current;if(R&&R.scrollTo({left:0,top:0}),p(0),h(0),y(0),d(null),n.has_data&&w>0&&M>0){v({anchor:{row:0,col:0},focus:{row:0,col:0}});return}v(null)},[n.dataset_id,n.version,n.has_data,w,M]),N.useEffect(()=>{if(!_)return;const R=window.setTimeout(()=>{d(null)},1200);return()=>{window.clearTimeout(R)}},[_]),N.useEffect(()=>{if(!f||t.sequence<f||t.dataset_id!==n.dataset_id||t.version!==n.version)return;if(y(0),!t.success){d({kind:"copy_failed"});return}const R=Math.max(t.row_count,0),D=Math.max(t.col_count,0);d({kind:"copy_success",rows:R,cols:D})},[f,t,n.dataset_id,n.version]);const Q=N.useMemo(()=>{const R=new Map;if(!b)return R;for(const D of r.rows)R.set(D.row_index,D.values);return R},[b,r.rows]),X=Math.min(w,Math.max(0,Math.floor(m/C))),T=Math.min(w,Math.max(X,Math.ceil((m+Math.max(l.height,1))/C))),O=M>0?Bt(Ui(c,W),0,M-1):0,B=M>0?Math.min(M,Math.max(O+1,Ui(c+Math.max(l.width-1,0),W)+1)):0,E=N.useMemo(()=>!n.has_data||w<=0||M<=0||l.width<=0||l.height<=0?null:{rowStart:Math.max(0,X-xc),rowEnd:Math.min(w,T+xc),colStart:Math.max(0,O-wc),colEnd:Math.min(M,B+wc)},[l.height,l.width,M,n.has_data,w,B,O,T,X]);N.useEffect(()=>{!o||!E||!n.has_data||o.requestRawDataViewport({datasetId:n.dataset_id,version:n.version,rowStart:E.rowStart,rowEnd:E.rowEnd,colStart:E.colStart,colEnd:E.colEnd})},[o,n.dataset_id,n.has_data,n.version,E]);const $=N.useCallback((R,D)=>{if(!b||R<r.row_start||R>=r.row_end||D<r.col_start||D>=r.col_end)return"";const V=Q.get(R);return V&&V[D-r.col_start]||""},[r.col_end,r.col_start,r.row_end,r.row_start,b,Q]),Y=N.useMemo(()=>Ty(g),[g]),le=Y?`${Y.endRow-Y.startRow+1} × ${Y.endCol-Y.startCol+1}`:"",U=N.useCallback((R,D)=>{if(!n.has_data||w<=0||M<=0)return null;const V=i.current;if(!V)return null;const ae=V.getBoundingClientRect(),Qe=c+R-ae.left,je=m+D-ae.top;if(Qe<0||je<0)return null;const Ye=Bt(Math.floor(je/C),0,w-1),I=Bt(Ui(Qe,W),0,M-1);return{row:Ye,col:I}},[W,M,n.has_data,w,C,c,m]);N.useEffect(()=>{if(!x)return;const R=V=>{const ae=U(V.clientX,V.clientY);ae&&v(Qe=>Qe?{anchor:Qe.anchor,focus:ae}:{anchor:ae,focus:ae})},D=()=>{L(!1)};return window.addEventListener("mousemove",R),window.addEventListener("mouseup",D),()=>{window.removeEventListener("mousemove",R),window.removeEventListener("mouseup",D)}},[x,U]);const q=N.useCallback(R=>{const D=i.current;if(!D)return;const V=W[R.col]||0,ae=W[R.col+1]||V,Qe=R.row*C,je=Qe+C;let Ye=D.scrollLeft,I=D.scrollTop;V<Ye?Ye=V:ae>Ye+D.clientWidth&&(Ye=ae-D.clientWidth),Qe<I?I=Qe:je>I+D.clientHeight&&(I=je-D.clientHeight),(Ye!==D.scrollLeft||I!==D.scrollTop)&&D.scrollTo({left:Ye,top:I})},[W,C]),oe=N.useCallback((R,D)=>{v(V=>D&&V?{anchor:V.anchor,focus:R}:{anchor:R,focus:R}),q(R)},[q]),se=N.useCallback((R=!1)=>{!o||!Y||!n.has_data||(y(t.sequence+1),o.copyRawDataRange({datasetId:n.dataset_id,version:n.version,rowStart:Y.startRow,rowEnd:Y.endRow+1,colStart:Y.startCol,colEnd:Y.endCol+1,includeHeaders:R}),d(le?{kind:"copying_selection",selection:le}:{kind:"copying"}))},[o,t.sequence,n.dataset_id,n.has_data,n.version,le,Y]),Et=N.useCallback(()=>{const R=i.current;R&&(p(R.scrollLeft),h(R.scrollTop))},[]),ho=N.useCallback(R=>{var V;const D=U(R.clientX,R.clientY);D&&((V=i.current)==null||V.focus(),v(ae=>R.shiftKey&&ae?{anchor:ae.anchor,focus:D}:{anchor:D,focus:D}),L(!0),R.preventDefault())},[U]),ai=N.useCallback(R=>{if(!n.has_data||w<=0||M<=0)return;if((R.ctrlKey||R.metaKey)&&R.key.toLowerCase()==="c"){R.preventDefault(),se(!1);return}if((R.ctrlKey||R.metaKey)&&R.key.toLowerCase()==="a"){R.preventDefault(),v({anchor:{row:0,col:0},focus:{row:w-1,col:M-1}});return}const D=(g==null?void 0:g.focus)??{row:0,col:0};let V=null;R.key==="ArrowUp"?V={row:Bt(D.row-1,0,w-1),col:D.col}:R.key==="ArrowDown"?V={row:Bt(D.row+1,0,w-1),col:D.col}:R.key==="ArrowLeft"?V={row:D.row,col:Bt(D.col-1,0,M-1)}:R.key==="ArrowRight"?V={row:D.row,col:Bt(D.col+1,0,M-1)}:R.key==="Home"?V={row:D.row,col:0}:R.key==="End"&&(V={row:D.row,col:M-1}),V&&(R.preventDefault(),oe(V,R.shiftKey))},[M,se,n.has_data,w,g,oe]),_o=E?E.rowStart:0,yo=E?E.rowEnd:0,vo=E?E.colStart:0,an=E?E.colEnd:0,ui=N.useMemo(()=>{const R=[];for(let D=_o;D<yo;D+=1)for(let V=vo;V<an;V+=1){const ae=!!(Y&&D>=Y.startRow&&D<=Y.endRow&&V>=Y.startCol&&V<=Y.endCol);R.push(a.jsx("div",{className:ae?"raw-data-grid__cell raw-data-grid__cell--selected":"raw-data-grid__cell",style:{left:`${W[V]||0}px`,top:`${D*C}px`,width:`${te[V]||Wi}px`,height:`${C}px`},children:$(D,V)||"…"},`${D}:${V}`))}return R},[W,te,$,an,vo,yo,_o,C,Y]),ci=N.useMemo(()=>{var D,V;const R=[];for(let ae=O;ae<B;ae+=1){const Qe=!!(Y&&ae>=Y.startCol&&ae<=Y.endCol);R.push(a.jsx("div",{className:Qe?"raw-data-grid__header-cell raw-data-grid__header-cell--selected":"raw-data-grid__header-cell",style:{left:`${(W[ae]||0)-c}px`,width:`${te[ae]||Wi}px`,height:`${z}px`},children:((D=S[ae])==null?void 0:D.label)||""},((V=S[ae])==null?void 0:V.key)||`column-${ae}`))}return R},[W,z,te,S,c,Y,B,O]),go=N.useMemo(()=>{const R=[];for(let D=X;D<T;D+=1){const V=!!(Y&&D>=Y.startRow&&D<=Y.endRow);R.push(a.jsx("div",{className:V?"raw-data-grid__row-header-cell raw-data-grid__row-header-cell--selected":"raw-data-grid__row-header-cell",style:{top:`${D*C-m}px`,width:`${P}px`,height:`${C}px`},children:D+1},`row-${D}`))}return R},[P,C,m,Y,T,X]),xo=Y?a.jsx("div",{className:"raw-data-grid__selection",style:{left:`${W[Y.startCol]||0}px`,top:`${Y.startRow*C}px`,width:`${(W[Y.endCol+1]||0)-(W[Y.startCol]||0)}px`,height:`${(Y.endRow-Y.startRow+1)*C}px`}}):null,wo=_?_.kind==="copy_failed"?k(s,"simulation.raw_data.copy_failed","Copy failed"):_.kind==="copy_success"?k(s,"simulation.raw_data.copy_success","Copied {rows} × {cols}",{rows:_.rows,cols:_.cols}):_.kind==="copying_selection"?k(s,"simulation.raw_data.copying_selection","Copying {selection}",{selection:_.selection}):k(s,"simulation.raw_data.copying","Copying"):"",pr=k(s,"simulation.raw_data.empty","No raw data is available to display."),di=n.has_data?k(s,"simulation.raw_data.grid_summary","{rows} rows · {cols} columns",{rows:w,cols:M}):pr,mr=n.has_data?k(s,"simulation.raw_data.copy_shortcuts","Ctrl/Cmd + C to copy selection, Ctrl/Cmd + A to select all."):"";return a.jsx("div",{className:"tab-surface",children:a.jsxs("div",{className:"raw-data-grid-shell",children:[a.jsxs("div",{className:"raw-data-grid__statusbar",children:[a.jsx("span",{children:di}),a.jsx("span",{children:wo||mr})]}),n.has_data?a.jsxs("div",{className:"raw-data-grid__viewport-shell",style:{gridTemplateColumns:`${P}px minmax(0, 1fr)`,gridTemplateRows:`${z}px minmax(0, 1fr)`},children:[a.jsx("div",{className:"raw-data-grid__corner",children:"#"}),a.jsx("div",{className:"raw-data-grid__column-headers",children:ci}),a.jsx("div",{className:"raw-data-grid__row-headers",children:go}),a.jsx("div",{ref:i,className:"raw-data-grid__body-scroll",onKeyDown:ai,onScroll:Et,tabIndex:0,children:a.jsxs("div",{className:"raw-data-grid__body-content",onMouseDown:ho,style:{width:`${Math.max(_e,l.width)}px`,height:`${Math.max(ze,l.height)}px`},children:[ui,xo]})})]}):a.jsx("div",{className:"muted-text",children:pr})]})})}),Sc=108,kc=60,os=132,ss=82,we=76,Xr=110,We=82,Oe=94,In=90;function xp(e){return e==="left"||e==="right"||e==="top"||e==="bottom"}function Iy(e){return e.editable_fields.length?e.editable_fields.every(t=>!t.editable):!0}const Ay={r:{key:"simulation.schematic.type.resistor",fallback:"Resistor"},resistor:{key:"simulation.schematic.type.resistor",fallback:"Resistor"},c:{key:"simulation.schematic.type.capacitor",fallback:"Capacitor"},capacitor:{key:"simulation.schematic.type.capacitor",fallback:"Capacitor"},l:{key:"simulation.schematic.type.inductor",fallback:"Inductor"},inductor:{key:"simulation.schematic.type.inductor",fallback:"Inductor"},d:{key:"simulation.schematic.type.diode",fallback:"Diode"},diode:{key:"simulation.schematic.type.diode",fallback:"Diode"},v:{key:"simulation.schematic.type.voltage_source",fallback:"Voltage Source"},voltage_source:{key:"simulation.schematic.type.voltage_source",fallback:"Voltage Source"},i:{key:"simulation.schematic.type.current_source",fallback:"Current Source"},current_source:{key:"simulation.schematic.type.current_source",fallback:"Current Source"},gnd:{key:"simulation.schematic.type.ground",fallback:"Ground"},ground:{key:"simulation.schematic.type.ground",fallback:"Ground"},x:{key:"simulation.schematic.type.subcircuit",fallback:"Subcircuit"},subckt:{key:"simulation.schematic.type.subcircuit",fallback:"Subcircuit"},subckt_block:{key:"simulation.schematic.type.subcircuit",fallback:"Subcircuit"},controlled_source:{key:"simulation.schematic.type.controlled_source",fallback:"Controlled Source"},e:{key:"simulation.schematic.type.controlled_source",fallback:"Controlled Source"},f:{key:"simulation.schematic.type.controlled_source",fallback:"Controlled Source"},g:{key:"simulation.schematic.type.controlled_source",fallback:"Controlled Source"},h:{key:"simulation.schematic.type.controlled_source",fallback:"Controlled Source"},u:{key:"simulation.schematic.type.opamp",fallback:"Operational Amplifier"},opamp:{key:"simulation.schematic.type.opamp",fallback:"Operational Amplifier"},q:{key:"simulation.schematic.type.bjt",fallback:"BJT"},bjt:{key:"simulation.schematic.type.bjt",fallback:"BJT"},m:{key:"simulation.schematic.type.mos",fallback:"MOSFET"},mos:{key:"simulation.schematic.type.mos",fallback:"MOSFET"},j:{key:"simulation.schematic.type.jfet",fallback:"JFET"},jfet:{key:"simulation.schematic.type.jfet",fallback:"JFET"},unknown:{key:"simulation.schematic.type.unknown",fallback:"Unknown Component"}};function Py(e){return e.trim().toLowerCase()}function Ry(e,t){const n=[e.symbol_kind,e.kind,e.display_name].filter(r=>!!r);for(const r of n){const o=Ay[Py(r)];if(o)return k(t,o.key,o.fallback)}return e.display_name||e.kind||e.symbol_kind||"--"}function nt(e,t,n,r,o){return a.jsx("line",{x1:e,y1:t,x2:n,y2:r,stroke:o,strokeWidth:2.2,strokeLinecap:"round"})}function wp(e){const t=e.trim().toLowerCase();return t==="input"||t==="in"||t==="input_plus"||t==="input_minus"?"input":t==="output"||t==="out"?"output":t==="power"||t==="power_positive"||t==="power_negative"||t==="vcc"||t==="vdd"||t==="vee"||t==="vss"?"power":t==="ground"||t==="gnd"?"ground":"other"}function Sp(e,t,n){const r=e.port_side_hints[t.name];if(xp(r))return r;const o=wp(t.role);return o==="ground"?"bottom":o==="power"?"top":o==="output"?"right":o==="input"?"left":e.pins.length<=1?"top":e.pins.length===2?n===0?"left":"right":n%2===0?"left":"right"}function kp(e,t,n){const r=e.pins.map((o,s)=>({pinIndex:s,side:Sp(e,o,s)})).filter(o=>o.side===t).map(o=>o.pinIndex);return{order:Math.max(0,r.indexOf(n)),total:Math.max(1,r.length)}}function Np(e,t,n,r,o){return e==="left"?{x:0,y:o*(t+1)/(n+1),side:e}:e==="right"?{x:r,y:o*(t+1)/(n+1),side:e}:e==="top"?{x:r*(t+1)/(n+1),y:0,side:e}:{x:r*(t+1)/(n+1),y:o,side:e}}function pn(e,t,n,r,o){const s=Sp(e,t,n),i=kp(e,s,n);return Np(s,i.order,i.total,r,o)}function Oy(e){if(e.pins.length!==2)return!1;for(const t of e.pins){const n=e.port_side_hints[t.name];if(n==="top"||n==="bottom")return!0}return!1}function Ep(e){return Oy(e)?{width:kc,height:Sc}:{width:Sc,height:kc}}function zy(e,t,n){const{width:r,height:o}=Ep(e);return e.pins.length<=1?{x:r/2,y:0,side:"top"}:pn(e,t,n,r,o)}function ii(e,t,n){return t>e?a.jsx("g",{transform:`translate(${e} 0) rotate(90)`,children:n(t,e)}):n(e,t)}function Cp({width:e,height:t,appearance:n}){return ii(e,t,(r,o)=>{const s=o/2;return a.jsxs("g",{children:[nt(0,s,18,s,n.stroke),a.jsx("polyline",{points:`18,${s} 28,${s-10} 38,${s+10} 48,${s-10} 58,${s+10} 68,${s-10} 78,${s+10} 90,${s}`,fill:"none",stroke:n.stroke,strokeWidth:2.2,strokeLinejoin:"round",strokeLinecap:"round"}),nt(90,s,r,s,n.stroke)]})})}function Dy({width:e,height:t,appearance:n}){return ii(e,t,(r,o)=>{const s=o/2;return a.jsxs("g",{children:[nt(0,s,34,s,n.stroke),a.jsx("line",{x1:38,y1:12,x2:38,y2:o-12,stroke:n.stroke,strokeWidth:2.2}),a.jsx("line",{x1:70,y1:12,x2:70,y2:o-12,stroke:n.stroke,strokeWidth:2.2}),nt(74,s,r,s,n.stroke)]})})}function By({width:e,height:t,appearance:n}){return ii(e,t,(r,o)=>{const s=o/2;return a.jsxs("g",{children:[nt(0,s,20,s,n.stroke),a.jsx("path",{d:`M20 ${s} C26 ${s-15}, 34 ${s-15}, 40 ${s} C46 ${s-15}, 54 ${s-15}, 60 ${s} C66 ${s-15}, 74 ${s-15}, 80 ${s} C86 ${s-15}, 94 ${s-15}, 100 ${s}`,fill:"none",stroke:n.stroke,strokeWidth:2.2,strokeLinecap:"round"}),nt(100,s,r,s,n.stroke)]})})}function $y({width:e,height:t,appearance:n}){return ii(e,t,(r,o)=>{const s=o/2;return a.jsxs("g",{children:[nt(0,s,24,s,n.stroke),a.jsx("polygon",{points:`24,12 24,${o-12} 66,${s}`,fill:n.fill,stroke:n.stroke,strokeWidth:2.2}),a.jsx("line",{x1:72,y1:10,x2:72,y2:o-10,stroke:n.stroke,strokeWidth:2.2}),nt(72,s,r,s,n.stroke)]})})}function Fy({appearance:e}){const t=we/2;return a.jsxs("g",{children:[nt(t,0,t,14,e.stroke),a.jsx("circle",{cx:t,cy:t,r:24,fill:e.fill,stroke:e.stroke,strokeWidth:2.2}),a.jsx("line",{x1:t-7,y1:t-8,x2:t+7,y2:t-8,stroke:e.stroke,strokeWidth:2}),a.jsx("line",{x1:t,y1:t-14,x2:t,y2:t-2,stroke:e.stroke,strokeWidth:2}),a.jsx("line",{x1:t-7,y1:t+10,x2:t+7,y2:t+10,stroke:e.stroke,strokeWidth:2}),nt(t,we-14,t,we,e.stroke)]})}function Xy({appearance:e}){const t=we/2;return a.jsxs("g",{children:[nt(t,0,t,14,e.stroke),a.jsx("circle",{cx:t,cy:t,r:24,fill:e.fill,stroke:e.stroke,strokeWidth:2.2}),a.jsx("line",{x1:t,y1:t+12,x2:t,y2:t-8,stroke:e.stroke,strokeWidth:2}),a.jsx("polyline",{points:`${t-6},${t-2} ${t},${t-10} ${t+6},${t-2}`,fill:"none",stroke:e.stroke,strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"}),nt(t,we-14,t,we,e.stroke)]})}function Yy({appearance:e}){const t=we/2;return a.jsxs("g",{children:[nt(t,0,t,22,e.stroke),a.jsx("line",{x1:t-16,y1:26,x2:t+16,y2:26,stroke:e.stroke,strokeWidth:2.2}),a.jsx("line",{x1:t-10,y1:34,x2:t+10,y2:34,stroke:e.stroke,strokeWidth:2.2}),a.jsx("line",{x1:t-4,y1:42,x2:t+4,y2:42,stroke:e.stroke,strokeWidth:2.2})]})}function Wy({width:e,height:t,appearance:n}){return a.jsx("rect",{x:10,y:10,width:e-20,height:t-20,rx:12,fill:n.fill,stroke:n.stroke,strokeWidth:2.2})}function Uy({width:e,height:t,appearance:n}){const r=e/2,o=t/2;return a.jsx("g",{children:a.jsx("polygon",{points:`${r},8 ${e-8},${o} ${r},${t-8} 8,${o}`,fill:n.fill,stroke:n.stroke,strokeWidth:2.2})})}function Hy({appearance:e}){return a.jsxs("g",{children:[a.jsx("polygon",{points:`14,8 ${Xr-12},${We/2} 14,${We-8}`,fill:e.fill,stroke:e.stroke,strokeWidth:2.2}),a.jsx("line",{x1:22,y1:We*.34,x2:34,y2:We*.34,stroke:e.stroke,strokeWidth:2}),a.jsx("line",{x1:28,y1:We*.28,x2:28,y2:We*.4,stroke:e.stroke,strokeWidth:2}),a.jsx("line",{x1:22,y1:We*.66,x2:34,y2:We*.66,stroke:e.stroke,strokeWidth:2})]})}function Vy(e,t){return e==="collector"||e==="base"||e==="emitter"?e:t===1?"base":t===2?"emitter":"collector"}function jp(e,t){return e==="drain"||e==="gate"||e==="source"?e:t===1?"gate":t===2?"source":"drain"}function Mp(e){return e.symbol_variant==="pmos"?"pmos":"nmos"}function Gy(e){return e.symbol_variant==="pnp"?"pnp":"npn"}function Ky(e){return e.symbol_variant==="pjf"?"pjf":"njf"}const li=Oe*.56,wt=In/2,Lp=22,Tr=li-10,Qy=li-Lp,br=li+14,is=wt-17,Yr=wt+17,Tp=wt+8;function Zy(e){const t=Tr,n=Tp,r=br,o=Yr,s=r-t,i=o-n,l=Math.sqrt(s*s+i*i)||1,u=s/l,c=i/l,p=-c,m=u,h=10,g=4,v=e==="npn"?r:t+u*4,x=e==="npn"?o:n+c*4,L=e==="npn"?-1:1,_=v+L*u*h,d=x+L*c*h,f=_+p*g,y=d+m*g,w=_-p*g,S=d-m*g;return`${v},${x} ${f},${y} ${w},${S}`}function qy({component:e,appearance:t}){const n=Gy(e),r=t.stroke;return a.jsxs("g",{children:[a.jsx("line",{x1:0,y1:wt,x2:Qy,y2:wt,stroke:r,strokeWidth:2.2}),a.jsx("line",{x1:br,y1:is,x2:Oe,y2:is,stroke:r,strokeWidth:2.2}),a.jsx("line",{x1:br,y1:Yr,x2:Oe,y2:Yr,stroke:r,strokeWidth:2.2}),a.jsx("circle",{cx:li,cy:wt,r:Lp,fill:t.fill,stroke:r,strokeWidth:2.2}),a.jsx("line",{x1:Tr,y1:wt-12,x2:Tr,y2:wt+12,stroke:r,strokeWidth:2.4}),a.jsx("line",{x1:Tr,y1:wt-8,x2:br,y2:is,stroke:r,strokeWidth:2.2}),a.jsx("line",{x1:Tr,y1:Tp,x2:br,y2:Yr,stroke:r,strokeWidth:2.2}),a.jsx("polygon",{points:Zy(n),fill:r,stroke:r,strokeWidth:1,strokeLinejoin:"round"})]})}const vn=Oe*.58,Hl=vn-12,Jy=Hl-8,Vl=In/2,As=20,Ps=In-20,Nc=16,Ec=In-16;function ev(e){const t=vn+6,n=vn+14,r=4;return`${t},${e} ${n},${e-r} ${n},${e+r}`}function tv({component:e,appearance:t}){const n=Mp(e),r=t.stroke,o=n!=="pmos",s=o?As:Ps,i=o?Ps:As;return a.jsxs("g",{children:[a.jsx("line",{x1:0,y1:Vl,x2:Jy,y2:Vl,stroke:r,strokeWidth:2.2}),a.jsx("line",{x1:Hl,y1:Nc+2,x2:Hl,y2:Ec-2,stroke:r,strokeWidth:2.2}),a.jsx("line",{x1:vn,y1:Nc,x2:vn,y2:Ec,stroke:r,strokeWidth:2.2}),a.jsx("line",{x1:vn,y1:s,x2:Oe,y2:s,stroke:r,strokeWidth:2.2}),a.jsx("line",{x1:vn,y1:i,x2:Oe,y2:i,stroke:r,strokeWidth:2.2}),a.jsx("polygon",{points:ev(i),fill:r,stroke:r,strokeWidth:1,strokeLinejoin:"round"})]})}const mn=Oe*.58,Mt=In/2,Rs=20,Os=In-20,nv=Rs-4,rv=Os+4;function ov(e){if(e==="njf"){const s=mn-2,i=s-10;return`${s},${Mt} ${i},${Mt-4} ${i},${Mt+4}`}const r=mn-2;return`${r-10},${Mt} ${r},${Mt-4} ${r},${Mt+4}`}function sv({component:e,appearance:t}){const n=Ky(e),r=t.stroke;return a.jsxs("g",{children:[a.jsx("line",{x1:0,y1:Mt,x2:mn,y2:Mt,stroke:r,strokeWidth:2.2}),a.jsx("line",{x1:mn,y1:nv,x2:mn,y2:rv,stroke:r,strokeWidth:2.2}),a.jsx("line",{x1:mn,y1:Rs,x2:Oe,y2:Rs,stroke:r,strokeWidth:2.2}),a.jsx("line",{x1:mn,y1:Os,x2:Oe,y2:Os,stroke:r,strokeWidth:2.2}),a.jsx("polygon",{points:ov(n),fill:r,stroke:r,strokeWidth:1,strokeLinejoin:"round"})]})}function iv({width:e,height:t,appearance:n}){return a.jsxs("g",{children:[a.jsx("rect",{x:10,y:10,width:e-20,height:t-20,rx:12,fill:n.fill,stroke:n.stroke,strokeWidth:2.2,strokeDasharray:"6 4"}),a.jsx("text",{x:e/2,y:t/2+6,textAnchor:"middle",fontSize:24,fontWeight:700,fill:n.accent,children:"?"})]})}function lv(e,t,n){const r=e.port_side_hints[t.name];if(xp(r)){const o=kp(e,r,n);return Np(r,o.order,o.total,Xr,We)}return wp(t.role)==="output"||n===e.pins.length-1?{x:Xr,y:We/2,side:"right"}:n===0?{x:0,y:We*.34,side:"left"}:n===1?{x:0,y:We*.66,side:"left"}:pn(e,t,n,Xr,We)}function av(e,t,n){const r=Vy(t.role,n);return r==="base"?{x:0,y:wt,side:"left"}:r==="emitter"?{x:Oe,y:Yr,side:"right"}:{x:Oe,y:is,side:"right"}}function uv(e,t,n){const r=jp(t.role,n);return r==="gate"?{x:0,y:Mt,side:"left"}:r==="source"?{x:Oe,y:Os,side:"right"}:{x:Oe,y:Rs,side:"right"}}function cv(e,t,n){const r=jp(t.role,n);if(r==="gate")return{x:0,y:Vl,side:"left"};const o=Mp(e)!=="pmos";return r==="source"?{x:Oe,y:o?Ps:As,side:"right"}:{x:Oe,y:o?As:Ps,side:"right"}}const Fo={getDimensions(e){return Ep(e)},getPinAnchor(e,t,n){return zy(e,t,n)},render:Cp},Hi={width:we,height:we},Vi={width:os,height:ss},dv={width:Xr,height:We},Gi={width:Oe,height:In},Cc={resistor:{...Fo,render:Cp},capacitor:{...Fo,render:Dy},inductor:{...Fo,render:By},diode:{...Fo,render:$y},voltage_source:{getDimensions:()=>Hi,getPinAnchor(e,t,n){return n===0?{x:we/2,y:0,side:"top"}:n===1?{x:we/2,y:we,side:"bottom"}:pn(e,t,n,we,we)},render:Fy},current_source:{getDimensions:()=>Hi,getPinAnchor(e,t,n){return n===0?{x:we/2,y:0,side:"top"}:n===1?{x:we/2,y:we,side:"bottom"}:pn(e,t,n,we,we)},render:Xy},ground:{getDimensions:()=>Hi,getPinAnchor(){return{x:we/2,y:0,side:"top"}},render:Yy},subckt_block:{getDimensions:()=>Vi,getPinAnchor(e,t,n){return pn(e,t,n,os,ss)},render:Wy},controlled_source:{getDimensions:()=>Vi,getPinAnchor(e,t,n){return pn(e,t,n,os,ss)},render:Uy},opamp:{getDimensions:()=>dv,getPinAnchor(e,t,n){return lv(e,t,n)},render:Hy},bjt:{getDimensions:()=>Gi,getPinAnchor(e,t,n){return av(e,t,n)},render:qy},mos:{getDimensions:()=>Gi,getPinAnchor(e,t,n){return cv(e,t,n)},render:tv},jfet:{getDimensions:()=>Gi,getPinAnchor(e,t,n){return uv(e,t,n)},render:sv},unknown:{getDimensions:()=>Vi,getPinAnchor(e,t,n){return pn(e,t,n,os,ss)},render:iv}};function Ln(e){return Cc[e]??Cc.unknown}function fv(e){switch(e){case"top":return{dx:0,dy:-1,perpX:1,perpY:0};case"bottom":return{dx:0,dy:1,perpX:1,perpY:0};case"left":return{dx:-1,dy:0,perpX:0,perpY:1};case"right":return{dx:1,dy:0,perpX:0,perpY:1}}}const pv=[18,12,6],mv=3.5,hv=1.8;function _v(e,t,n){const r=e.x+t.dx*e.length,o=e.y+t.dy*e.length;return a.jsxs("g",{stroke:n.stroke,strokeWidth:hv,strokeLinecap:"round",fill:"none",children:[a.jsx("line",{x1:e.x,y1:e.y,x2:r,y2:o}),pv.map((s,i)=>{const l=i*mv,u=r+t.dx*l,c=o+t.dy*l,p=s/2;return a.jsx("line",{x1:u+t.perpX*p,y1:c+t.perpY*p,x2:u-t.perpX*p,y2:c-t.perpY*p},i)})]})}const Pn=8,jc=10,Mc=12,Lc=1.8;function yv(e){return e==="left"?"end":e==="right"?"start":"middle"}function vv(e,t,n){const r=e.x+t.dx*e.length,o=e.y+t.dy*e.length,s=r+t.dx*Pn,i=o+t.dy*Pn,l=r+t.perpX*(Pn/2),u=o+t.perpY*(Pn/2),c=r-t.perpX*(Pn/2),p=o-t.perpY*(Pn/2),m=s+t.dx*jc,h=i+t.dy*jc;return a.jsxs("g",{children:[a.jsx("line",{x1:e.x,y1:e.y,x2:r,y2:o,stroke:n.stroke,strokeWidth:Lc,strokeLinecap:"round"}),a.jsx("polygon",{points:`${s},${i} ${l},${u} ${c},${p}`,fill:n.fill,stroke:n.stroke,strokeWidth:Lc,strokeLinejoin:"round"}),e.label?a.jsx("text",{x:m,y:h+(t.dy>0?Mc:0),textAnchor:yv(e.side),fontSize:Mc,fontWeight:600,fill:n.text,children:e.label}):null]})}function gv(e,t){const n=fv(e.side);return e.kind==="ground"?_v(e,n,t):vv(e,n,t)}const bp="scope:";function lo(e){return e&&(e.display_name||e.instance_name||e.id)||""}const xv=/^(vcc|vdd|vee|vss|vbb|vaa|vdda|vssa|vbus|vsupply|v_supply|v_rail|v\+|v-)$/,wv=/^(0|gnd|agnd|dgnd|ground)$/,Sv=/^(vbias|vref|vcm|bias|ref|v_bias|v_ref|v_cm)/;function kv(e){return e.trim().toLowerCase()}function ao(e){return e.join(" / ")}function Nv(e){return`${bp}${ao(e)}`}function Ev(e){if(e.primitive_kind==="opamp")return"amplifier";switch(e.symbol_kind){case"ground":return"ground";case"voltage_source":case"current_source":return"supply";case"resistor":case"capacitor":case"inductor":case"diode":return"passive";case"bjt":case"mos":case"jfet":return"active";case"opamp":return"amplifier";case"controlled_source":return"controlled_source";case"subckt_block":return"block";default:return"unknown"}}function Cv(e){const t=e.role.trim().toLowerCase();return t==="input"||t==="in"||t==="input_plus"||t==="input_minus"?"input":t==="output"||t==="out"?"output":t==="power"||t==="vdd"||t==="vcc"||t==="power_positive"||t==="power_negative"?"power":t==="ground"||t==="gnd"||t==="vss"?"ground":t==="passive"||t==="anode"||t==="cathode"||t==="plus"||t==="minus"||t==="+"||t==="-"?"passive":"unknown"}function jv(e){return e==="left"||e==="right"||e==="top"||e==="bottom"?e:null}function Mv(e){return e.pins.map((t,n)=>({pin:t,index:n,role:Cv(t),hintedSide:jv(e.port_side_hints[t.name])}))}function Lv(e,t){if(e==="ground")return 90;if(e==="supply")return 10;const n=t.some(o=>o.role==="input"),r=t.some(o=>o.role==="output");return n&&!r?20:r&&!n?80:50}function Tv(e){const t=new Map;for(const n of e){const r=[...n.scope_path,n.name];t.set(ao(r),n.name)}return t}function bv(e,t){if(e.length===0)return"";const n=t.get(ao(e));return n||e[e.length-1]}function ls(e,t,n){const r=Nv(t),o=e.get(r);if(o)return o;const s={id:r,path:t,label:bv(t,n),depth:t.length,parentId:null,childGroupIds:[],componentIds:[]};if(e.set(r,s),t.length>0){const i=ls(e,t.slice(0,-1),n);s.parentId=i.id,i.childGroupIds.push(r)}return s}function Ip(e,t){if(t<=1)return"dangling";const n=kv(e.name);return wv.test(n)?"ground":xv.test(n)?"power":Sv.test(n)?"bias":"signal"}function Iv(e){return[...e].sort((t,n)=>{const r=t.placementPriority-n.placementPriority;if(r!==0)return r;const o=ao(t.component.scope_path).localeCompare(ao(n.component.scope_path));if(o!==0)return o;const s=lo(t.component),i=lo(n.component),l=s.localeCompare(i);return l!==0?l:t.component.id.localeCompare(n.component.id)})}const Av=new Set(["resistor","capacitor","inductor","diode"]);function Pv(e,t){if(!Av.has(e.symbol_kind)||e.pins.length!==2)return e;const n=e.pins[0],r=e.pins[1],o=t.get(Gl(e.id,n.name)),s=t.get(Gl(e.id,r.name));let i=null,l=null;return o==="power"?(i="top",l="bottom"):o==="ground"?(i="bottom",l="top"):s==="power"?(l="top",i="bottom"):s==="ground"&&(l="bottom",i="top"),i===null||l===null?e:{...e,port_side_hints:{...e.port_side_hints,[n.name]:i,[r.name]:l}}}function Rv(e){const t=new Map;for(const n of e.nets){const r=Ip(n,n.connections.length);for(const o of n.connections)t.set(Gl(o.component_id,o.pin_name),r)}return t}function Gl(e,t){return`${e}::${t}`}function Ov(e){const t=new Map;for(const n of e)t.set(n.component.id,new Set(n.component.pins.map(r=>r.name)));return t}const Ki=3;function zv(e){if(e.symbol_kind!=="mos"||e.pins.length<=Ki)return e;const t=e.pins[Ki],n=e.pins.slice(0,Ki),r={...e.port_side_hints};return delete r[t.name],{...e,pins:n,port_side_hints:r}}function Dv(e){const t=Tv(e.subcircuits),n=new Map;ls(n,[],t);const r=Rv(e),o=new Map,s=[];for(const m of e.components){const h=Pv(m,r),g=zv(h),v=Ev(g),x=Mv(g),L=ls(n,g.scope_path,t),_={component:g,role:v,pins:x,scopeGroupId:L.id,placementPriority:Lv(v,x)};o.set(g.id,_),s.push(_),L.componentIds.push(g.id)}const i=new Map,l=[],u=Ov(s);for(const m of e.nets){const h=m.connections.filter(f=>{if(!o.has(f.component_id))return!1;const y=u.get(f.component_id);return y?y.has(f.pin_name):!1}),g=Array.from(new Set(h.map(f=>f.component_id))),v=h.length,x=Ip(m,v),L=ls(n,m.scope_path,t),d={net:{...m,connections:h},category:x,pinCount:v,componentIds:g,scopeGroupId:L.id};i.set(m.id,d),l.push(d)}const c=Iv(s),p=Array.from(n.values());return{components:c,componentsById:o,nets:l,netsById:i,scopeGroups:p,scopeGroupsById:n,rootScopeGroupId:bp}}const Bv=3;function $v(e){const t=new Map;for(const n of e.nets)t.set(n.net.id,Fv(n));return t}function Fv(e){return e.pinCount<=1?"dangling":e.category==="ground"?"ground_rail":e.category==="power"?"power_rail":e.pinCount>=Bv?"signal_trunk":"branch"}const Xv="modulepreload",Yv=function(e,t){return new URL(e,t).href},Tc={},Wv=function(t,n,r){let o=Promise.resolve();if(n&&n.length>0){const i=document.getElementsByTagName("link"),l=document.querySelector("meta[property=csp-nonce]"),u=(l==null?void 0:l.nonce)||(l==null?void 0:l.getAttribute("nonce"));o=Promise.allSettled(n.map(c=>{if(c=Yv(c,r),c in Tc)return;Tc[c]=!0;const p=c.endsWith(".css"),m=p?'[rel="stylesheet"]':"";if(!!r)for(let v=i.length-1;v>=0;v--){const x=i[v];if(x.href===c&&(!p||x.rel==="stylesheet"))return}else if(document.querySelector(`link[href="${c}"]${m}`))return;const g=document.createElement("link");if(g.rel=p?"stylesheet":Xv,p||(g.as="script"),g.crossOrigin="",g.href=c,u&&g.setAttribute("nonce",u),document.head.appendChild(g),p)return new Promise((v,x)=>{g.addEventListener("load",v),g.addEventListener("error",()=>x(new Error(`Unable to preload CSS for ${c}`)))})}))}function s(i){const l=new Event("vite:preloadError",{cancelable:!0});if(l.payload=i,window.dispatchEvent(l),!l.defaultPrevented)throw i}return o.then(i=>{for(const l of i||[])l.status==="rejected"&&s(l.reason);return t().catch(s)})};let Qi=null;async function Uv(){return Qi===null&&(Qi=Wv(()=>import("./elk.bundled-KBy9_53M.js").then(e=>e.e),[],import.meta.url).then(e=>new e.default)),Qi}const lr=20,ar=22,bc=28,Ic=34,Hv="[top=28,left=28,bottom=28,right=28]",Vv="[top=40,left=40,bottom=40,right=40]",Xo=36,Ap={left:0,right:0,top:0,bottom:0};function Gv(e,t){const n=new Map;for(const r of e.components)n.set(r.component.id,{left:0,right:0,top:0,bottom:0});for(const r of e.nets){const o=t.get(r.net.id);if(!(o!=="ground_rail"&&o!=="power_rail"))for(const s of r.net.connections){const i=e.componentsById.get(s.component_id);if(!i||i.role==="supply"||i.role==="ground")continue;const l=i.pins.find(m=>m.pin.name===s.pin_name);if(!l)continue;const c=Ln(i.component.symbol_kind).getPinAnchor(i.component,l.pin,l.index),p=n.get(i.component.id);if(p)switch(c.side){case"left":p.left=Math.max(p.left,Xo);break;case"right":p.right=Math.max(p.right,Xo);break;case"top":p.top=Math.max(p.top,Xo);break;case"bottom":p.bottom=Math.max(p.bottom,Xo);break}}}return n}const Ac=120,Kv=112,Qv=32,Pc=2,Zv="hub:",Rc=4,qv={"elk.algorithm":"layered","elk.direction":"RIGHT","elk.edgeRouting":"ORTHOGONAL","elk.hierarchyHandling":"INCLUDE_CHILDREN","elk.layered.nodePlacement.strategy":"BRANDES_KOEPF","elk.layered.nodePlacement.bk.fixedAlignment":"BALANCED","elk.layered.crossingMinimization.strategy":"LAYER_SWEEP","elk.layered.cycleBreaking.strategy":"GREEDY","elk.layered.layering.strategy":"NETWORK_SIMPLEX","elk.layered.spacing.nodeNodeBetweenLayers":"72","elk.layered.spacing.edgeNodeBetweenLayers":"24","elk.layered.spacing.edgeEdgeBetweenLayers":"16","elk.layered.thoroughness":"12","elk.spacing.nodeNode":"52","elk.spacing.edgeNode":"18","elk.spacing.edgeEdge":"12","elk.spacing.portPort":"16","elk.padding":Vv,"elk.separateConnectedComponents":"true","elk.layered.considerModelOrder.strategy":"PREFER_EDGES","elk.aspectRatio":"2.0","elk.layered.feedbackEdges":"true"},Jv={"elk.padding":Hv},eg={"elk.portConstraints":"FIXED_SIDE"};function tg(e,t){let n=!1,r=!1;for(const o of t.nets)o.componentIds.includes(e.component.id)&&o.category!=="ground"&&(o.pinCount<2||(o.category==="power"?n=!0:r=!0));return r?"main":n?"rail":"drop"}function ng(e){const t=[],n=[],r=[];for(const o of e.components){if(o.role==="supply"){const s=tg(o,e);if(s==="drop")continue;s==="rail"?n.push(o):t.push(o);continue}o.role==="ground"?r.push(o):t.push(o)}return{mainComponents:t,powerRailOnly:n,groundRailOnly:r}}function Pp(e,t){return`port:${e}:${t}`}function rg(e){switch(e){case"left":return"WEST";case"right":return"EAST";case"top":return"NORTH";case"bottom":return"SOUTH"}}function og(e,t){const n=Ln(e.component.symbol_kind),r=n.getDimensions(e.component),o=e.pins.map(c=>{const p=n.getPinAnchor(e.component,c.pin,c.index);return{id:Pp(e.component.id,c.pin.name),width:0,height:0,layoutOptions:{"elk.port.side":rg(p.side)}}}),s=lr+t.left,i=lr+t.right,l=ar+t.top,u=ar+t.bottom;return{id:e.component.id,width:r.width+s+i,height:r.height+l+u,ports:o,layoutOptions:{...eg}}}function Rp(e,t){const n=[];for(const r of e.childGroupIds){const o=t.semantic.scopeGroupsById.get(r);if(!o)continue;const s=Rp(o,t);s&&n.push(s)}for(const r of e.componentIds){if(!t.mainComponentIds.has(r))continue;const o=t.componentNodesById.get(r);o&&n.push(o)}return n.length===0&&e.depth>0?null:{id:e.depth===0?"schematic-root":`scope:${e.id}`,children:n,layoutOptions:e.depth===0?{...qv}:{...Jv}}}function sg(e,t,n){const r=[],o=[];for(const s of e.nets){const i=t.get(s.net.id)??"branch";if(i==="power_rail"||i==="ground_rail"||i==="dangling")continue;const l=ig(s,n);if(l.length<2)continue;const u=lg(i);if(l.length===2){r.push({id:`edge:${s.net.id}`,sources:[l[0].portId],targets:[l[1].portId],layoutOptions:u});continue}const c=`${Zv}${s.net.id}`;o.push({id:c,width:Pc,height:Pc,layoutOptions:{"elk.portConstraints":"FREE"}}),l.forEach((p,m)=>{r.push({id:`edge:${s.net.id}:${m}`,sources:[p.portId],targets:[c],layoutOptions:u})})}return{edges:r,virtualHubNodes:o}}function ig(e,t){const n=[];for(const r of e.net.connections)t.has(r.component_id)&&n.push({portId:Pp(r.component_id,r.pin_name)});return n}function lg(e){return e==="signal_trunk"?{"elk.layered.priority.shortness":"10","elk.layered.priority.straightness":"10"}:{"elk.layered.priority.shortness":"1","elk.layered.priority.straightness":"5"}}function zs(e){return Math.round(e/Rc)*Rc}function ag(e,t){const n=new Map;function r(o,s,i){const l=s+(o.x??0),u=i+(o.y??0);if(t.has(o.id)){n.set(o.id,{node:o,absX:l,absY:u});return}if(o.children)for(const c of o.children)r(c,l,u)}return r(e,0,0),n}function ug(e,t){const n=new Map,r="scope:";function o(s,i,l){const u=i+(s.x??0),c=l+(s.y??0);if(s.id.startsWith(r)){const p=s.id.slice(r.length);t.scopeGroupsById.get(p)&&n.set(p,{x:u,y:c,width:s.width??0,height:s.height??0})}if(s.children)for(const p of s.children)o(p,u,c)}return o(e,0,0),n}function cg(e,t,n){const r=[];for(const o of e){const s=t.get(o.component.id);if(!s)continue;const l=Ln(o.component.symbol_kind).getDimensions(o.component),u=n.get(o.component.id)??Ap,c=lr+u.left,p=ar+u.top,m=lr+u.right,h=ar+u.bottom,g=zs(s.absX),v=zs(s.absY),x=s.node.width??l.width+c+m,L=s.node.height??l.height+p+h;r.push({componentId:o.component.id,scopeGroupId:o.scopeGroupId,box:{x:g,y:v,width:x,height:L},symbolBox:{x:g+c,y:v+p,width:l.width,height:l.height}})}return r}function dg(e,t,n,r){if(e.length===0&&t.length===0)return[];const o=fg(n),s=[],i=Oc(e,r,n);zc(e,i,(o.y??0)-Ac,o,"up",s);const l=Oc(t,r,n);return zc(t,l,(o.y??0)+(o.height??0)+Ac,o,"down",s),s}function fg(e){if(e.length===0)return{x:0,y:0,width:0,height:0};let t=Number.POSITIVE_INFINITY,n=Number.POSITIVE_INFINITY,r=Number.NEGATIVE_INFINITY,o=Number.NEGATIVE_INFINITY;for(const s of e)t=Math.min(t,s.box.x),n=Math.min(n,s.box.y),r=Math.max(r,s.box.x+s.box.width),o=Math.max(o,s.box.y+s.box.height);return{x:t,y:n,width:r-t,height:o-n}}function Oc(e,t,n){const r=new Map;for(const s of n)r.set(s.componentId,s);const o=new Map;for(const s of e){const i=[];for(const l of t.nets)if(l.componentIds.includes(s.component.id))for(const u of l.componentIds){if(u===s.component.id)continue;const c=r.get(u);c&&i.push(c.box.x+c.box.width/2)}if(i.length>0){const l=i.reduce((u,c)=>u+c,0);o.set(s.component.id,l/i.length)}}return o}function zc(e,t,n,r,o,s){if(e.length===0)return;const i=[...e].sort((c,p)=>{const m=t.get(c.component.id)??Number.POSITIVE_INFINITY,h=t.get(p.component.id)??Number.POSITIVE_INFINITY;return m!==h?m-h:c.component.id.localeCompare(p.component.id)}),l=[];let u=r.x+Qv;for(const c of i){const m=Ln(c.component.symbol_kind).getDimensions(c.component),h=m.width+lr*2,g=m.height+ar*2,v=t.get(c.component.id)??u,x=Math.max(v,u+h/2);l.push({component:c,centerX:x,width:h,height:g}),u=x+h/2+(Kv-h)}for(const c of l){const m=Ln(c.component.component.symbol_kind).getDimensions(c.component.component),h=zs(c.centerX-c.width/2),g=zs(o==="up"?n-c.height:n);s.push({componentId:c.component.component.id,scopeGroupId:c.component.scopeGroupId,box:{x:h,y:g,width:c.width,height:c.height},symbolBox:{x:h+lr,y:g+ar,width:m.width,height:m.height}})}}function Kl(e,t){if(e===null)return{...t};const n=Math.min(e.x,t.x),r=Math.min(e.y,t.y),o=Math.max(e.x+e.width,t.x+t.width),s=Math.max(e.y+e.height,t.y+t.height);return{x:n,y:r,width:o-n,height:s-r}}function pg(e,t,n){const r=new Map;for(const[o,s]of n){const i=t.scopeGroupsById.get(o);!i||i.depth===0||r.set(o,{scopeGroupId:o,depth:i.depth,label:i.label,bounds:{...s},componentIds:[]})}for(const o of e){let s=t.scopeGroupsById.get(o.scopeGroupId);for(;s&&s.depth>0;){const i=r.get(s.id);i?(i.bounds=Kl(i.bounds,o.box),i.componentIds.push(o.componentId)):r.set(s.id,{scopeGroupId:s.id,depth:s.depth,label:s.label,bounds:{...o.box},componentIds:[o.componentId]}),s=s.parentId?t.scopeGroupsById.get(s.parentId):void 0}}for(const o of r.values())o.bounds={x:o.bounds.x-bc,y:o.bounds.y-Ic,width:o.bounds.width+bc*2,height:o.bounds.height+Ic*2};return r}async function mg(e,t){if(e.components.length===0)return{componentPositions:[],componentsById:new Map,scopeGroupBounds:[],scopeGroupBoundsById:new Map,overallBounds:null};const{mainComponents:n,powerRailOnly:r,groundRailOnly:o}=ng(e),s=new Set(n.map(x=>x.component.id)),i=Gv(e,t);let l,u;if(n.length>0){const x=new Map;for(const M of n){const C=i.get(M.component.id)??Ap;x.set(M.component.id,og(M,C))}const L=e.scopeGroupsById.get(e.rootScopeGroupId);if(!L)throw new Error("[schematicElkLayout] Root scope group missing from semantic model");const _=Rp(L,{semantic:e,mainComponentIds:s,componentNodesById:x});if(!_)throw new Error("[schematicElkLayout] Failed to build ELK root node");const{edges:d,virtualHubNodes:f}=sg(e,t,s);_.edges=d,f.length>0&&(_.children=[..._.children??[],...f]);const w=await(await Uv()).layout(_),S=ag(w,s);l=cg(n,S,i),u=ug(w,e)}else l=[],u=new Map;const c=dg(r,o,l,e),p=[...l,...c],m=new Map;for(const x of p)m.set(x.componentId,x);const h=pg(p,e,u),g=Array.from(h.values()).sort((x,L)=>x.depth-L.depth);let v=null;for(const x of p)v=Kl(v,x.box);for(const x of g)v=Kl(v,x.bounds);return{componentPositions:p,componentsById:m,scopeGroupBounds:g,scopeGroupBoundsById:h,overallBounds:v}}const hg=26,_g=12;function Op(e){if(!e.stub)return null;const{x:t,y:n,side:r,length:o}=e.stub,s=_g;switch(r){case"top":return{x:t-s,y:n-o,width:s*2,height:o};case"bottom":return{x:t-s,y:n,width:s*2,height:o};case"left":return{x:t-o,y:n-s,width:o,height:s*2};case"right":return{x:t,y:n-s,width:o,height:s*2}}}const Dt=14,Ir=28,Yo=Ir*2,yg=24,vg=36,gg=.05,Zi=10,Dc=4,Je=1e-6,xg=8;function wg(e){const t=[];for(const n of e){const r=n.symbolBounds;t.push({id:t.length,left:r.x-Dt,right:r.x+r.width+Dt,top:r.y-Dt,bottom:r.y+r.height+Dt,ownerComponentId:n.component.id});for(const o of n.pins){const s=Op(o);s&&t.push({id:t.length,left:s.x-Dt,right:s.x+s.width+Dt,top:s.y-Dt,bottom:s.y+s.height+Dt,ownerComponentId:n.component.id})}}return t}function Sg(e,t,n,r,o,s){if(s.has(o.ownerComponentId))return!1;const i=Math.min(e,n),l=Math.max(e,n),u=Math.min(t,r),c=Math.max(t,r);return!(l<=o.left+Je||i>=o.right-Je||c<=o.top+Je||u>=o.bottom-Je)}function kg(e,t,n){return e>n.left+Je&&e<n.right-Je&&t>n.top+Je&&t<n.bottom-Je}function Ql(e){switch(e){case"left":return{dx:-1,dy:0};case"right":return{dx:1,dy:0};case"top":return{dx:0,dy:-1};case"bottom":return{dx:0,dy:1}}}function Ng(e,t){const n=new Set,r=new Set;for(const f of e)n.add(f.left),n.add(f.right),r.add(f.top),r.add(f.bottom);for(const f of t){n.add(f.x),r.add(f.y);const y=Ql(f.side);n.add(f.x+y.dx*Ir),r.add(f.y+y.dy*Ir)}const o=[...n].sort((f,y)=>f-y),s=[...r].sort((f,y)=>f-y);o.length>0&&(n.add(o[0]-Yo),n.add(o[o.length-1]+Yo)),s.length>0&&(r.add(s[0]-Yo),r.add(s[s.length-1]+Yo));const i=[...n].sort((f,y)=>f-y),l=[...r].sort((f,y)=>f-y),u=[],c=new Map;function p(f,y){return`${f}|${y}`}function m(f,y,w){const S=p(f,y),M=c.get(S);if(M!==void 0)return w===null&&u[M].ownedBy!==null&&(u[M].ownedBy=null),M;const C=u.length;return u.push({id:C,x:f,y,ownedBy:w}),c.set(S,C),C}const h=new Map;for(const f of t){const y=m(f.x,f.y,f.componentId),w=Ql(f.side),S=f.x+w.dx*Ir,M=f.y+w.dy*Ir,C=m(S,M,null);h.set(f.id,{pinId:f.id,pinVertexId:y,attachmentVertexId:C})}for(const f of i)for(const y of l){if(c.has(p(f,y)))continue;let w=!1;for(const S of e)if(kg(f,y,S)){w=!0;break}w||m(f,y,null)}const g=new Map,v=new Map;for(const f of u){let y=g.get(f.y);y||(y=[],g.set(f.y,y)),y.push(f.id);let w=v.get(f.x);w||(w=[],v.set(f.x,w)),w.push(f.id)}const x=[],L=new Map;function _(f){let y=L.get(f.from);y||(y=[],L.set(f.from,y)),y.push({to:f.to,edge:f});let w=L.get(f.to);w||(w=[],L.set(f.to,w)),w.push({to:f.from,edge:f})}function d(f,y,w){const S=u[f],M=u[y],C=Math.abs(w==="horizontal"?M.x-S.x:M.y-S.y);if(C<=Je)return;const z=new Set;S.ownedBy!==null&&z.add(S.ownedBy),M.ownedBy!==null&&z.add(M.ownedBy);for(const te of e)if(Sg(S.x,S.y,M.x,M.y,te,z))return;const P={index:x.length,from:f,to:y,axis:w,length:C};x.push(P),_(P)}for(const f of g.values()){f.sort((y,w)=>u[y].x-u[w].x);for(let y=1;y<f.length;y+=1)d(f[y-1],f[y],"horizontal")}for(const f of v.values()){f.sort((y,w)=>u[y].y-u[w].y);for(let y=1;y<f.length;y+=1)d(f[y-1],f[y],"vertical")}return{ovg:{vertices:u,edges:x,adjacency:L},endpointsByPinId:h}}function Eg(e,t,n){for(const r of t){const o=n.get(r.id);if(!o)continue;const s=e.adjacency.get(o.pinVertexId);if(!s)continue;const i=e.vertices[o.pinVertexId],l=Ql(r.side),u=[],c=[];for(const p of s){const m=e.vertices[p.to];let h=!1;l.dx!==0?m.y===i.y&&(h=l.dx>0?m.x>i.x:m.x<i.x):m.x===i.x&&(h=l.dy>0?m.y>i.y:m.y<i.y),h?u.push(p):c.push(p.to)}e.adjacency.set(o.pinVertexId,u);for(const p of c){const m=e.adjacency.get(p);m&&e.adjacency.set(p,m.filter(h=>h.to!==o.pinVertexId))}}}function Bc(e,t){return Math.abs(e.x-t.x)+Math.abs(e.y-t.y)}function $c(e,t){return`${e}|${t}`}function Fc(e,t){e.push(t);let n=e.length-1;for(;n>0;){const r=n-1>>>1;if(e[r].fCost<=e[n].fCost)break;const o=e[r];e[r]=e[n],e[n]=o,n=r}}function Cg(e){const t=e[0],n=e.pop();if(e.length>0&&n!==void 0){e[0]=n;let r=0;const o=e.length;for(;;){const s=2*r+1,i=2*r+2;let l=r;if(s<o&&e[s].fCost<e[l].fCost&&(l=s),i<o&&e[i].fCost<e[l].fCost&&(l=i),l===r)break;const u=e[r];e[r]=e[l],e[l]=u,r=l}}return t}const jg={xs:new Set,ys:new Set};function Mg(e,t,n,r,o,s=jg){const i=[],l=new Map,u=new Map,c=e.vertices[n];for(const p of t){const m=$c(p,"none");l.has(m)||(l.set(m,0),u.set(m,{prevStateKey:null,edgeIndex:null}),Fc(i,{stateKey:m,vertexId:p,lastAxis:"none",gCost:0,fCost:Bc(e.vertices[p],c)}))}for(;i.length>0;){const p=Cg(i),m=l.get(p.stateKey);if(m!==void 0&&m<p.gCost-Je)continue;if(p.vertexId===n){const g=[],v=[];let x=p.stateKey;for(;x!==null;){const L=parseInt(x.split("|")[0],10);g.push(L);const _=u.get(x);if(!_)break;_.edgeIndex!==null&&v.push(_.edgeIndex),x=_.prevStateKey}return g.reverse(),v.reverse(),{vertexPath:g,edgeIndices:v,totalCost:p.gCost}}const h=e.adjacency.get(p.vertexId);if(h)for(const g of h){const v=g.edge,x=v.axis,L=p.lastAxis!=="none"&&p.lastAxis!==x,_=r.has(v.index)?gg:1,d=o.get(v.index)??0,f=e.vertices[g.to],w=s.xs.has(f.x)||s.ys.has(f.y)?xg:0,S=Math.max(0,v.length*_+(L?yg:0)+d*vg-w),M=p.gCost+S,C=$c(g.to,x),z=l.get(C);if(z!==void 0&&z<=M+Je)continue;l.set(C,M),u.set(C,{prevStateKey:p.stateKey,edgeIndex:v.index});const P=Bc(e.vertices[g.to],c);Fc(i,{stateKey:C,vertexId:g.to,lastAxis:x,gCost:M,fCost:M+P})}}return null}function Lg(e,t){if(t.length<=2)return t[0];let n=0,r=0;for(const u of t){const c=e.vertices[u];n+=c.x,r+=c.y}const o=n/t.length,s=r/t.length;let i=t[0],l=Number.POSITIVE_INFINITY;for(const u of t){const c=e.vertices[u],p=c.x-o,m=c.y-s,h=p*p+m*m;h<l&&(l=h,i=u)}return i}function Tg(e,t,n){if(t.length===0)return null;const r={xs:new Set,ys:new Set};for(const l of t){const u=e.vertices[l];r.xs.add(u.x),r.ys.add(u.y)}const o=Lg(e,t),s={vertexIds:new Set([o]),edgeIndices:new Set},i=new Set;for(const l of t)l!==o&&i.add(l);for(;i.size>0;){let l=null;for(const u of i){const c=Mg(e,s.vertexIds,u,s.edgeIndices,n,r);c&&(l===null||c.totalCost<l.path.totalCost)&&(l={target:u,path:c})}if(l===null)return null;for(const u of l.path.vertexPath)s.vertexIds.add(u);for(const u of l.path.edgeIndices)s.edgeIndices.add(u);i.delete(l.target)}return s}function bg(e,t){const n=new Map;for(const r of t){const o=e.edges[r];let s=n.get(o.from);s||(s=[],n.set(o.from,s)),s.push({to:o.to,edge:o});let i=n.get(o.to);i||(i=[],n.set(o.to,i)),i.push({to:o.from,edge:o})}return n}function zp(e){let t=!1,n=!1;for(let r=1;r<e.length;r+=1)e[r].x!==e[r-1].x&&(t=!0),e[r].y!==e[r-1].y&&(n=!0);return t&&n?"mixed":t?"horizontal":n?"vertical":"mixed"}function Ig(e,t){const n=bg(e,t.edgeIndices),r=new Set,o=[];function s(l){const u=n.get(l);return!u||u.length!==2?!1:u[0].edge.axis===u[1].edge.axis}function i(l,u){const c=[],p=e.vertices[l];c.push({x:p.x,y:p.y});let m=u;r.add(m.index);let h=m.from===l?m.to:m.from,g=e.vertices[h];for(c.push({x:g.x,y:g.y});s(h);){const v=n.get(h);if(!v)break;const x=v.find(L=>L.edge.index!==m.index&&!r.has(L.edge.index));if(!x)break;r.add(x.edge.index),m=x.edge,h=x.to,g=e.vertices[h],c.push({x:g.x,y:g.y})}return{axis:zp(c),points:c}}for(const l of t.vertexIds){if(s(l))continue;const u=n.get(l);if(u)for(const c of u)r.has(c.edge.index)||o.push(i(l,c.edge))}return o}function Ag(e){const t=[];for(let n=0;n<e.length;n+=1){const r=e[n];for(let o=0;o<r.chains.length;o+=1){const s=r.chains[o];for(let i=0;i+1<s.points.length;i+=1){const l=s.points[i],u=s.points[i+1];l.x===u.x&&l.y===u.y||(l.y===u.y?t.push({bundleIndex:n,chainIndex:o,pointIndex:i,axis:"horizontal",constantCoord:l.y,spanStart:Math.min(l.x,u.x),spanEnd:Math.max(l.x,u.x)}):l.x===u.x&&t.push({bundleIndex:n,chainIndex:o,pointIndex:i,axis:"vertical",constantCoord:l.x,spanStart:Math.min(l.y,u.y),spanEnd:Math.max(l.y,u.y)}))}}}return t}function Pg(e,t){const n=e.filter(s=>s.axis===t),r=new Map;for(const s of n){let i=r.get(s.constantCoord);i||(i=[],r.set(s.constantCoord,i)),i.push(s)}const o=[];for(const s of r.values()){if(s.length<2)continue;const i=[...s].sort((c,p)=>c.spanStart-p.spanStart);let l=[i[0]],u=i[0].spanEnd;for(let c=1;c<i.length;c+=1){const p=i[c];p.spanStart<u-Je?(l.push(p),u=Math.max(u,p.spanEnd)):(l.length>=2&&o.push(l),l=[p],u=p.spanEnd)}l.length>=2&&o.push(l)}return o}function Rg(e,t,n){const r=e.length;if(r===0)return{newCenters:[]};const o=e.map((u,c)=>({index:c,size:u.size,desiredCenter:u.desiredCenter}));o.sort((u,c)=>u.desiredCenter-c.desiredCenter);const s=new Array(r);let i=t;for(const u of o){const c=i+u.size/2,p=Math.max(u.desiredCenter,c);s[u.index]=p,i=p+u.size/2}let l=n;for(let u=o.length-1;u>=0;u-=1){const c=o[u],p=l-c.size/2;s[c.index]>p&&(s[c.index]=p),l=s[c.index]-c.size/2}return{newCenters:s}}function Og(e){for(const t of["horizontal","vertical"]){const n=Ag(e),r=Pg(n,t);for(const o of r){const s=o.map(c=>({size:Zi,desiredCenter:c.constantCoord})),i=Math.min(...o.map(c=>c.constantCoord))-Zi*o.length,l=Math.max(...o.map(c=>c.constantCoord))+Zi*o.length,{newCenters:u}=Rg(s,i,l);for(let c=0;c<o.length;c+=1){const p=o[c],m=u[c];if(Math.abs(m-p.constantCoord)<=Je)continue;const h=e[p.bundleIndex].chains[p.chainIndex],g=h.points[p.pointIndex],v=h.points[p.pointIndex+1];t==="horizontal"?(g.y=m,v.y=m):(g.x=m,v.x=m)}}}}function Xc(e){return Math.round(e/Dc)*Dc}function zg(e){for(const t of e)for(const n of t.points)n.x=Xc(n.x),n.y=Xc(n.y)}function Dg(e,t){const n=[];for(let r=0;r<t.length;r+=1){const o=t[r],s=Bg(o.points);s.length<2||n.push({key:`${e}:route:${r}`,axis:zp(s),points:s})}return n}function Bg(e){if(e.length<=2)return e.slice();const t=[e[0]];for(let r=1;r<e.length-1;r+=1){const o=t[t.length-1],s=e[r],i=e[r+1],l=o.y===s.y&&s.y===i.y,u=o.x===s.x&&s.x===i.x;l||u||t.push(s)}t.push(e[e.length-1]);const n=[t[0]];for(let r=1;r<t.length;r+=1){const o=n[n.length-1],s=t[r];o.x===s.x&&o.y===s.y||n.push(s)}return n}function $g(e,t,n,r){const o=new Map;if(r.length===0)return o;const s=wg(r),i=[];for(const m of n.values())for(const h of m)i.push(h);if(i.length===0)return o;const{ovg:l,endpointsByPinId:u}=Ng(s,i);Eg(l,i,u);const c=[],p=new Map;for(const m of e.nets){const h=m.net.id,g=t.get(h);if(!g)continue;const v=n.get(h)??[];if(g==="dangling"||g==="ground_rail"||g==="power_rail"||v.length<2)continue;const x=[];for(const d of v){const f=u.get(d.id);f&&x.push(f.pinVertexId)}if(x.length<2)continue;const L=Tg(l,x,p);if(!L||L.edgeIndices.size===0)continue;for(const d of L.edgeIndices)p.set(d,(p.get(d)??0)+1);const _=Ig(l,L);c.push({netId:h,chains:_})}Og(c);for(const m of c)zg(m.chains);for(const m of c){const h=Dg(m.netId,m.chains);h.length>0&&o.set(m.netId,h)}return o}const Fg=1.2;function Xg(e){if(e===null)return!1;const t=e.maxX-e.minX,n=e.maxY-e.minY;return t<=0||n<=0?!1:n>t*Fg}function Yg(e){const t=e.minX,n=e.minY,r=e.maxY;return{point(o){return{x:t+(r-o.y),y:n+(o.x-t)}},rect(o){return{x:t+(r-o.y-o.height),y:n+(o.x-t),width:o.height,height:o.width}}}}const Dp={left:"top",top:"right",right:"bottom",bottom:"left"};function Wg(e,t){const n=t.point({x:e.x,y:e.y});return{kind:e.kind,label:e.label,side:Dp[e.side],x:n.x,y:n.y,length:e.length}}function Ug(e,t){const n=t.point({x:e.x,y:e.y});return{id:e.id,componentId:e.componentId,pin:e.pin,side:Dp[e.side],x:n.x,y:n.y,stub:e.stub?Wg(e.stub,t):null}}function Hg(e,t){return{component:e.component,rotation:90,bounds:t.rect(e.bounds),symbolBounds:t.rect(e.symbolBounds),pins:e.pins.map(n=>Ug(n,t)),nameLabel:e.nameLabel?{...e.nameLabel,...t.point({x:e.nameLabel.x,y:e.nameLabel.y})}:null,valueLabel:e.valueLabel?{...e.valueLabel,...t.point({x:e.valueLabel.x,y:e.valueLabel.y})}:null}}function Vg(e,t){return{id:e.id,label:e.label,depth:e.depth,bounds:t.rect(e.bounds)}}function Gg(e,t){return{net:e.net,segments:e.segments.map(n=>({key:n.key,axis:n.axis==="horizontal"?"vertical":n.axis==="vertical"?"horizontal":n.axis,points:n.points.map(r=>t.point(r))})),label:e.label?{...e.label,...t.point({x:e.label.x,y:e.label.y})}:null}}function Kg(e,t){const n=t.point({x:e.minX,y:e.minY}),r=t.point({x:e.maxX,y:e.maxY});return{minX:Math.min(n.x,r.x),minY:Math.min(n.y,r.y),maxX:Math.max(n.x,r.x),maxY:Math.max(n.y,r.y)}}function Qg(e){if(e.bounds===null)return e;const t=Yg(e.bounds);return{...e,components:e.components.map(n=>Hg(n,t)),groups:e.groups.map(n=>Vg(n,t)),nets:e.nets.map(n=>Gg(n,t)),bounds:Kg(e.bounds,t)}}const Zg=60,qg=.5,Wo=14,Jg=new Set(["signal_trunk","branch"]);function ex(e,t){return!(e.x+e.width<=t.x||t.x+t.width<=e.x||e.y+e.height<=t.y||t.y+t.height<=e.y)}function tx(e,t,n,r){const o={x:e.bounds.x+t-Wo,y:e.bounds.y+n-Wo,width:e.bounds.width+Wo*2,height:e.bounds.height+Wo*2};for(const s of r)if(s!==e&&ex(o,s.bounds))return!1;return!0}function nx(e,t,n){e.bounds.x+=t,e.bounds.y+=n,e.symbolBounds.x+=t,e.symbolBounds.y+=n;for(const r of e.pins)r.x+=t,r.y+=n,r.stub&&(r.stub.x+=t,r.stub.y+=n);e.nameLabel&&(e.nameLabel.x+=t,e.nameLabel.y+=n),e.valueLabel&&(e.valueLabel.x+=t,e.valueLabel.y+=n)}function rx(e){let t=0,n=0;for(const r of e)r.side==="top"||r.side==="bottom"?t+=1:(r.side==="left"||r.side==="right")&&(n+=1);return t===0&&n===0?null:t>n?"x":n>t?"y":null}function ox(e,t,n){const r=e.find(s=>n.has(s.componentId));if(r)return r;const o=[...e].sort((s,i)=>{const l=t==="x"?s.x:s.y,u=t==="x"?i.x:i.y;return l-u});return o[Math.floor(o.length/2)]}function sx(e,t,n){if(e.length===0)return;const r=new Set,o=Array.from(t.entries()).filter(([s,i])=>{if(i.length<2||i.length>4)return!1;const l=n.get(s);return l!==void 0&&Jg.has(l)}).sort(([,s],[,i])=>s.length-i.length);for(const[,s]of o){const i=rx(s);if(i===null)continue;const l=ox(s,i,r),u=i==="x"?l.x:l.y;r.add(l.componentId);for(const c of s){if(c===l||r.has(c.componentId))continue;const p=i==="x"?c.x:c.y,m=u-p;if(Math.abs(m)<qg){r.add(c.componentId);continue}if(Math.abs(m)>Zg)continue;const h=e.find(x=>x.component.id===c.componentId);if(!h)continue;const g=i==="x"?m:0,v=i==="y"?m:0;tx(h,g,v,e)&&(nx(h,g,v),r.add(c.componentId))}}}const ix=16.5,Bp=15,lx=36,ax=8,ux=54,cx=18,gn=4,dx=8,Yc=4,fx=6,px=14,Wc=6,mx=18,Sn=26,Ds=24;function $p(e,t,n,r){return Math.max(n,Math.ceil(e.length*t*.62+r))}function Qa(e){return $p(e,Bp,ux,cx)}function Bs(e,t){return $p(e,t==="name"?ix:Bp,lx,ax)}function tn(e,t,n,r){const o=e.textAnchor==="middle"?e.x-t/2:e.textAnchor==="end"?e.x-t:e.x,s=r==="middle"?e.y-n/2:e.y-n*.78;return{x:o,y:s,width:t,height:n}}function qi(e,t){return e.x<t.x+t.width&&e.x+e.width>t.x&&e.y<t.y+t.height&&e.y+e.height>t.y}function Zl(e,t){return{x:e.x-t,y:e.y-t,width:e.width+t*2,height:e.height+t*2}}function hx(e,t,n){return{x:Math.min(e.x,t.x)-n,y:Math.min(e.y,t.y)-n,width:Math.abs(e.x-t.x)+n*2,height:Math.abs(e.y-t.y)+n*2}}function _x(e){const t=e.component.symbol_kind;return t==="opamp"||t==="subckt_block"||t==="controlled_source"?{name:"top",value:"bottom"}:t==="ground"?{name:"bottom",value:"bottom"}:t==="bjt"||t==="mos"?{name:"top",value:"bottom"}:t==="voltage_source"||t==="current_source"?{name:"right",value:"left"}:{name:"top",value:"bottom"}}function Uc(e,t,n){const r=n.x,o=n.x+n.width,s=n.y,i=n.y+n.height,l=r+n.width/2,u=s+n.height/2;switch(t){case"top":return{text:e,x:l,y:s-fx,textAnchor:"middle"};case"bottom":return{text:e,x:l,y:i+px,textAnchor:"middle"};case"left":return{text:e,x:r-Wc,y:u+4,textAnchor:"end"};case"right":return{text:e,x:o+Wc,y:u+4,textAnchor:"start"}}}function yx(e){const t=new Map;for(const n of e){const r=_x(n),o=lo(n.component),s=n.component.display_value,i=o?Uc(o,r.name,n.symbolBounds):null,l=s?Uc(s,r.value,n.symbolBounds):null;t.set(n.component.id,{nameLabel:i,valueLabel:l})}return t}function vx(e){return e.key.endsWith(":trunk")?4:e.key.endsWith(":direct")?3:e.key.includes(":tap:")?2:1}function gx(e){const t=[];for(const n of e){const r=vx(n);for(let o=1;o<n.points.length;o+=1){const s=n.points[o-1],i=n.points[o],l=i.x-s.x,u=i.y-s.y,c=Math.hypot(l,u);c<mx||t.push({x:(s.x+i.x)/2,y:(s.y+i.y)/2,orientation:Math.abs(l)>=Math.abs(u)?"horizontal":"vertical",length:c,priority:r})}}return t.sort((n,r)=>r.priority-n.priority||r.length-n.length),t}function xx(e,t,n){const r=t.orientation==="horizontal"?[{text:e,x:t.x,y:t.y-(Sn/2+gn),textAnchor:"middle"},{text:e,x:t.x,y:t.y+(Sn/2+gn),textAnchor:"middle"}]:[{text:e,x:t.x+n.labelWidth/2+gn,y:t.y,textAnchor:"middle"},{text:e,x:t.x-n.labelWidth/2-gn,y:t.y,textAnchor:"middle"}];for(const o of r){const s=tn(o,n.labelWidth,Sn,"middle");if(!n.componentObstacles.some(i=>qi(s,i))&&!n.segmentObstacles.some(i=>qi(s,i))&&!n.placedLabelRects.some(i=>qi(s,i)))return o}return null}function wx(e,t,n){return t.orientation==="horizontal"?{text:e,x:t.x,y:t.y-(Sn/2+gn),textAnchor:"middle"}:{text:e,x:t.x+n/2+gn,y:t.y,textAnchor:"middle"}}function Sx(e){return e.map(t=>Zl(t.symbolBounds,dx))}function kx(e){const t=[];for(const n of e)for(const r of n.segments)for(let o=1;o<r.points.length;o+=1)t.push(hx(r.points[o-1],r.points[o],gn));return t}function Nx(e){const t=[];for(const n of e){if(n.nameLabel){const r=Bs(n.nameLabel.text,"name");t.push(Zl(tn(n.nameLabel,r,Ds,"baseline"),Yc))}if(n.valueLabel){const r=Bs(n.valueLabel.text,"value");t.push(Zl(tn(n.valueLabel,r,Ds,"baseline"),Yc))}}return t}function Ex(e,t){const n=new Map,r=Sx(t),o=kx(e),s=Nx(t),i=[...e].sort((l,u)=>{const c=l.segments.some(g=>g.key.endsWith(":trunk"))?1:0,p=u.segments.some(g=>g.key.endsWith(":trunk"))?1:0;if(c!==p)return p-c;const m=l.segments.some(g=>g.key.endsWith(":direct"))?1:0;return(u.segments.some(g=>g.key.endsWith(":direct"))?1:0)-m});for(const l of i){if(!l.net.name){n.set(l.net.id,null);continue}const u=Qa(l.net.name),c=gx(l.segments);if(c.length===0){n.set(l.net.id,null);continue}const p={labelWidth:u,componentObstacles:r,segmentObstacles:o,placedLabelRects:s};let m=null;for(const h of c)if(m=xx(l.net.name,h,p),m)break;m||(m=wx(l.net.name,c[0],u)),s.push(tn(m,u,Sn,"middle")),n.set(l.net.id,m)}return n}const Hc=56,Cx=.35,jx=2.6;function Mx(e,t,n){return Math.min(Math.max(e,t),n)}function ql(e,t){return e===null?{minX:t.x,minY:t.y,maxX:t.x,maxY:t.y}:{minX:Math.min(e.minX,t.x),minY:Math.min(e.minY,t.y),maxX:Math.max(e.maxX,t.x),maxY:Math.max(e.maxY,t.y)}}function Er(e,t,n,r,o){let s=ql(e,{x:t,y:n});return s=ql(s,{x:t+r,y:n+o}),s}function Lx(e){return Math.max(1,e.maxX-e.minX)}function Tx(e){return Math.max(1,e.maxY-e.minY)}function Za(e,t){return`port:${e}:${t}`}function bx(e,t){return`${e}::${t}`}const Vc=4;function Gc(e){return Math.round(e/Vc)*Vc}function Ix(e){const t=e.component,n=Ln(t.symbol_kind);return e.pins.map(r=>{const o=n.getPinAnchor(t,r.pin,r.index);return{portId:Za(t.id,r.pin.name),pin:r.pin,side:o.side,anchorX:o.x,anchorY:o.y}})}function Ax(e,t,n){const r=[];for(const s of t.componentPositions){const i=e.componentsById.get(s.componentId);if(!i)continue;const u=Ix(i).map(p=>{const m={id:p.portId,componentId:s.componentId,pin:p.pin,side:p.side,x:Gc(s.symbolBox.x+p.anchorX),y:Gc(s.symbolBox.y+p.anchorY),stub:null};return n.set(p.portId,m),m}),c={component:i.component,rotation:0,bounds:{...s.box},symbolBounds:{...s.symbolBox},pins:u,nameLabel:null,valueLabel:null};r.push(c)}const o=t.scopeGroupBounds.map(s=>({id:s.scopeGroupId,label:s.label,depth:s.depth,bounds:{...s.bounds}}));return{components:r,groups:o}}function Px(e,t){const n=Math.min(e.x,t.x),r=Math.min(e.y,t.y),o=Math.max(e.x+e.width,t.x+t.width),s=Math.max(e.y+e.height,t.y+t.height);return{x:n,y:r,width:o-n,height:s-r}}function Rx(e){for(const t of e)for(const n of t.pins){const r=Op(n);r&&(t.bounds=Px(t.bounds,r))}}function Ox(e,t,n){for(const r of e.nets){const o=t.get(r.net.id);if(o!=="ground_rail"&&o!=="power_rail")continue;const s=o==="ground_rail"?"ground":"power",i=o==="power_rail"?r.net.name.toUpperCase():"";for(const l of r.net.connections){const u=Za(l.component_id,l.pin_name),c=n.get(u);if(!c)continue;const p=e.componentsById.get(c.componentId);p&&(p.role==="supply"||p.role==="ground")||(c.stub={kind:s,label:i,side:c.side,x:c.x,y:c.y,length:hg})}}}function Fp(e,t){const n=new Map;for(const r of e.nets){const o=[];for(const s of r.net.connections){const i=t.get(Za(s.component_id,s.pin_name));i&&o.push(i)}n.set(r.net.id,o)}return n}function zx(e,t,n,r){const o=Fp(e,n),s=$g(e,t,o,r),i=[];for(const l of e.nets){const u=s.get(l.net.id)??[];u.length!==0&&i.push({net:l.net,segments:u,label:null})}return i}function Dx(e,t){const n=yx(e);for(const o of e){const s=n.get(o.component.id);s&&(o.nameLabel=s.nameLabel,o.valueLabel=s.valueLabel)}const r=Ex(t,e);for(const o of t)o.label=r.get(o.net.id)??null}function Bx(e,t,n){let r=null;for(const o of t)r=Er(r,o.bounds.x,o.bounds.y,o.bounds.width,o.bounds.height);for(const o of e){if(r=Er(r,o.bounds.x,o.bounds.y,o.bounds.width,o.bounds.height),o.nameLabel){const s=tn(o.nameLabel,Bs(o.nameLabel.text,"name"),Ds,"baseline");r=Er(r,s.x,s.y,s.width,s.height)}if(o.valueLabel){const s=tn(o.valueLabel,Bs(o.valueLabel.text,"value"),Ds,"baseline");r=Er(r,s.x,s.y,s.width,s.height)}}for(const o of n){for(const s of o.segments)for(const i of s.points)r=ql(r,i);if(o.label){const s=tn(o.label,Qa(o.label.text),Sn,"middle");r=Er(r,s.x,s.y,s.width,s.height)}}return r}function $x(){return{scale:1,offsetX:0,offsetY:0}}function Xp(e,t,n){const r=Math.max(1,t-Hc*2),o=Math.max(1,n-Hc*2),s=Mx(Math.min(r/Lx(e),o/Tx(e)),Cx,jx),i=(e.minX+e.maxX)/2,l=(e.minY+e.maxY)/2;return{scale:s,offsetX:t/2-i*s,offsetY:n/2-l*s}}function Fx(e,t,n,r){return{x:(e-n.left-r.offsetX)/r.scale,y:(t-n.top-r.offsetY)/r.scale}}async function Xx(e){const t=bx(e.document_id,e.revision);if(!e.has_schematic||e.components.length===0)return{requestKey:t,documentId:e.document_id,revision:e.revision,components:[],nets:[],groups:[],bounds:null};const n=Dv(e),r=$v(n),o=await mg(n,r),s=new Map,{components:i,groups:l}=Ax(n,o,s),u=Fp(n,s);sx(i,u,r),Ox(n,r,s),Rx(i);const c=zx(n,r,s,i);Dx(i,c);const p=Bx(i,l,c),m={components:i,nets:c,groups:l,bounds:p},h=Xg(p)?Qg(m):m;return{requestKey:t,documentId:e.document_id,revision:e.revision,components:h.components,nets:h.nets,groups:h.groups,bounds:h.bounds}}const Yx=.35,Wx=2.6;function Ux(e,t,n){return Math.min(Math.max(e,t),n)}function Hx(e){return e.map(t=>`${t.x},${t.y}`).join(" ")}function Kc(e){return e instanceof Element&&!!e.closest('[data-schematic-component="true"]')}function Vx(e){const t=Math.min(Math.max(e,1),4),n=.16+t*.04,r=.06+t*.025;return{stroke:`rgba(37, 99, 235, ${n})`,fill:`rgba(219, 234, 254, ${r})`,text:t>=3?"#1d4ed8":"#2563eb"}}function Gx(e,t,n){return e?{stroke:"#2563eb",fill:"#dbeafe",accent:"#1d4ed8",text:"#1e3a8a",pinFill:"#2563eb",readonly:n}:t?{stroke:n?"#64748b":"#3b82f6",fill:n?"#f1f5f9":"#eff6ff",accent:n?"#64748b":"#2563eb",text:n?"#475569":"#1e3a8a",pinFill:n?"#64748b":"#2563eb",readonly:n}:n?{stroke:"#94a3b8",fill:"#f8fafc",accent:"#64748b",text:"#475569",pinFill:"#94a3b8",readonly:n}:{stroke:"#0f172a",fill:"#ffffff",accent:"#1d4ed8",text:"#0f172a",pinFill:"#0f172a",readonly:n}}function Kx({schematicDocument:e,layoutResult:t,layoutPending:n,layoutError:r,selectedComponentId:o,uiText:s,viewState:i,onViewStateChange:l,onViewportSizeChange:u,onSelectComponent:c}){const{ref:p,width:m,height:h}=fr(),[g,v]=N.useState(""),[x,L]=N.useState(!1),_=N.useRef(null),d=N.useRef(!1),f=N.useRef(null),y=N.useCallback(E=>{f.current=E,p(E)},[p]);N.useEffect(()=>{u({width:m,height:h})},[h,u,m]),N.useEffect(()=>{g&&(((t==null?void 0:t.components.some(E=>E.component.id===g))??!1)||v(""))},[g,t]),N.useEffect(()=>{if(!x)return;const E=U=>{const q=_.current;if(q===null)return;const oe=U.clientX-q.startX,se=U.clientY-q.startY;!q.moved&&(Math.abs(oe)>3||Math.abs(se)>3)&&(q.moved=!0,d.current=!0),l({scale:i.scale,offsetX:q.offsetX+oe,offsetY:q.offsetY+se})},$=()=>{_.current=null,L(!1)},Y=document.body.style.cursor,le=document.body.style.userSelect;return document.body.style.cursor="grabbing",document.body.style.userSelect="none",window.addEventListener("pointermove",E),window.addEventListener("pointerup",$),window.addEventListener("pointercancel",$),()=>{document.body.style.cursor=Y,document.body.style.userSelect=le,window.removeEventListener("pointermove",E),window.removeEventListener("pointerup",$),window.removeEventListener("pointercancel",$)}},[l,x,i.scale]);const w=E=>{E.button!==0||Kc(E.target)||(_.current={startX:E.clientX,startY:E.clientY,offsetX:i.offsetX,offsetY:i.offsetY,moved:!1},d.current=!1,L(!0))},S=E=>{if(d.current){d.current=!1;return}Kc(E.target)},M=N.useRef(i),C=N.useRef(l),z=N.useRef({width:m,height:h});N.useEffect(()=>{M.current=i},[i]),N.useEffect(()=>{C.current=l},[l]),N.useEffect(()=>{z.current={width:m,height:h}},[m,h]),N.useEffect(()=>{const E=f.current;if(E===null)return;const $=Y=>{const{width:le,height:U}=z.current;if(le<=0||U<=0)return;Y.preventDefault();const q=M.current,oe=Ux(q.scale*(Y.deltaY<0?1.12:1/1.12),Yx,Wx);if(oe===q.scale)return;const se=E.getBoundingClientRect(),Et=Fx(Y.clientX,Y.clientY,se,q);C.current({scale:oe,offsetX:Y.clientX-se.left-Et.x*oe,offsetY:Y.clientY-se.top-Et.y*oe})};return E.addEventListener("wheel",$,{passive:!1}),()=>{E.removeEventListener("wheel",$)}},[]);const P=!!(t!=null&&t.bounds)&&m>0&&h>0,te=N.useCallback(()=>{const E=t==null?void 0:t.bounds;!E||m<=0||h<=0||l(Xp(E,m,h))},[h,t,l,m]),W=!!e.file_path,_e=(t==null?void 0:t.components)??[],ze=(t==null?void 0:t.groups)??[],b=(t==null?void 0:t.nets)??[],Q=W&&e.has_schematic&&_e.length>0,X=Math.max(m,320),T=Math.max(h,240),O=W?n&&e.has_schematic?k(s,"simulation.schematic.empty_layout_pending_title","Computing schematic layout"):r?k(s,"simulation.schematic.empty_layout_failed_title","Schematic layout failed"):k(s,"simulation.schematic.empty_not_renderable_title","The current document has no renderable schematic"):k(s,"simulation.schematic.empty_no_source_title","No schematic source file is available"),B=W?n&&e.has_schematic?k(s,"simulation.schematic.empty_layout_pending_description","Computing the schematic layout from the latest schematic document."):r||e.file_name||e.title||k(s,"simulation.schematic.empty_not_renderable_description","The current schematic document did not provide drawable components."):k(s,"simulation.schematic.empty_no_source_description","The current result does not yet provide a source file path that the schematic tab can consume.");return a.jsx("div",{className:"schematic-canvas",children:a.jsxs("div",{ref:y,className:`schematic-canvas__viewport${x?" schematic-canvas__viewport--dragging":""}`,onPointerDown:w,onClick:S,children:[Q?a.jsxs("svg",{className:"schematic-canvas__svg",width:X,height:T,viewBox:`0 0 ${X} ${T}`,children:[a.jsx("defs",{children:a.jsx("pattern",{id:"schematic-grid",width:"28",height:"28",patternUnits:"userSpaceOnUse",children:a.jsx("path",{d:"M 28 0 L 0 0 0 28",fill:"none",stroke:"rgba(148, 163, 184, 0.18)",strokeWidth:"1"})})}),a.jsx("rect",{x:0,y:0,width:X,height:T,fill:"url(#schematic-grid)"}),a.jsxs("g",{transform:`translate(${i.offsetX} ${i.offsetY}) scale(${i.scale})`,children:[ze.map(E=>{const $=Vx(E.depth);return a.jsxs("g",{className:"schematic-canvas__group",children:[a.jsx("rect",{x:E.bounds.x,y:E.bounds.y,width:E.bounds.width,height:E.bounds.height,rx:18,fill:$.fill,stroke:$.stroke,strokeWidth:1.5,strokeDasharray:"7 5"}),a.jsx("text",{x:E.bounds.x+16,y:E.bounds.y+18,className:"schematic-canvas__group-label",fill:$.text,children:E.label})]},E.id)}),b.map(E=>{const $=E.label?Qa(E.label.text):0,Y=E.label?tn(E.label,$,Sn,"middle"):null;return a.jsxs("g",{className:"schematic-canvas__net",children:[E.segments.map(le=>a.jsx("polyline",{points:Hx(le.points),fill:"none",stroke:"#94a3b8",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"},le.key)),E.label&&Y?a.jsxs("g",{children:[a.jsx("rect",{className:"schematic-canvas__net-label-backdrop",x:Y.x,y:Y.y,rx:8,width:Y.width,height:Y.height}),a.jsx("text",{className:"schematic-canvas__net-label",x:E.label.x,y:E.label.y,textAnchor:E.label.textAnchor,dominantBaseline:"middle",children:E.label.text})]}):null]},E.net.id)}),_e.map(E=>{const $=E.component.id===o,Y=E.component.id===g,le=Iy(E.component),U=Gx($,Y,le),q=Ln(E.component.symbol_kind),oe=E.rotation===90?`translate(${E.symbolBounds.x+E.symbolBounds.width} ${E.symbolBounds.y}) rotate(90)`:`translate(${E.symbolBounds.x} ${E.symbolBounds.y})`;return a.jsxs("g",{"data-schematic-component":"true",className:`schematic-canvas__component${$?" schematic-canvas__component--selected":""}${Y?" schematic-canvas__component--hovered":""}${le?" schematic-canvas__component--readonly":""}`,onMouseEnter:()=>v(E.component.id),onMouseLeave:()=>v(se=>se===E.component.id?"":se),onClick:se=>{se.stopPropagation(),c(E.component.id)},onKeyDown:se=>{(se.key==="Enter"||se.key===" ")&&(se.preventDefault(),c(E.component.id))},tabIndex:0,role:"button","aria-label":k(s,"simulation.schematic.select_component","Select component {name}",{name:lo(E.component)||E.component.id}),children:[a.jsx("rect",{className:"schematic-canvas__component-hit",x:E.bounds.x,y:E.bounds.y,width:E.bounds.width,height:E.bounds.height,fill:"transparent",pointerEvents:"all"}),a.jsx("g",{transform:oe,children:(()=>{const se=q.getDimensions(E.component);return q.render({component:E.component,width:se.width,height:se.height,appearance:U})})()}),E.pins.map(se=>{const Et={stroke:U.accent,fill:U.fill,text:U.text};return a.jsxs("g",{children:[se.stub?gv(se.stub,Et):null,a.jsx("circle",{cx:se.x,cy:se.y,r:4.4,fill:U.pinFill})]},se.id)}),E.nameLabel?a.jsx("text",{x:E.nameLabel.x,y:E.nameLabel.y,textAnchor:E.nameLabel.textAnchor,className:"schematic-canvas__instance-label",fill:U.text,children:E.nameLabel.text}):null,E.valueLabel?a.jsx("text",{x:E.valueLabel.x,y:E.valueLabel.y,textAnchor:E.valueLabel.textAnchor,className:"schematic-canvas__value-label",fill:U.accent,children:E.valueLabel.text}):null]},E.component.id)})]})]}):a.jsx("div",{className:"schematic-canvas__empty-state",children:a.jsxs("div",{className:`surface-state-card ${r||W?"surface-state-card--warning":"surface-state-card--empty"}`,children:[a.jsx("div",{className:"card-title",children:O}),a.jsx("div",{className:"muted-text",children:B}),e.parse_errors.length>0?a.jsx("div",{className:"surface-state-stack",children:e.parse_errors.slice(0,3).map((E,$)=>a.jsx("div",{className:"muted-text",children:E.message},`${E.source_file}-${E.line_index}-${$}`))}):null]})}),n||r||W&&Q&&e.parse_errors.length>0?a.jsx("div",{className:"schematic-canvas__floating-banner",children:a.jsxs("div",{className:"schematic-canvas__floating-banner-stack",children:[n?a.jsxs("div",{className:"surface-state-card",children:[a.jsx("div",{className:"card-title",children:k(s,"simulation.schematic.banner_layout_pending_title","Layout computation in progress")}),a.jsx("div",{className:"muted-text",children:k(s,"simulation.schematic.banner_layout_pending_description","Only the latest layout result for the current document and revision will be applied.")})]}):null,r?a.jsxs("div",{className:"surface-state-card surface-state-card--warning",children:[a.jsx("div",{className:"card-title",children:k(s,"simulation.schematic.banner_layout_failed_title","Layout failed")}),a.jsx("div",{className:"muted-text",children:r})]}):null,W&&Q&&e.parse_errors.length>0?a.jsxs("div",{className:"surface-state-card surface-state-card--warning",children:[a.jsx("div",{className:"card-title",children:k(s,"simulation.schematic.banner_parse_warnings_title","Parse Warnings")}),e.parse_errors.slice(0,2).map((E,$)=>a.jsx("div",{className:"muted-text",children:E.message},`${E.source_file}-${E.line_index}-${$}`))]}):null]})}):null,a.jsx("div",{className:"schematic-canvas__fit-overlay",children:a.jsx("button",{type:"button",className:"sim-compact-button",disabled:!P,onPointerDown:E=>E.stopPropagation(),onClick:te,children:k(s,"common.fit","Fit")})})]})})}function Qx({component:e,schematicWriteResult:t,fieldDrafts:n,pendingFieldRequestIds:r,staleDraftNotice:o,uiText:s,onDraftChange:i,onSubmitField:l}){const u=e?e.editable_fields.filter(x=>x.field_key==="value"):[],c=e!==null&&Object.keys(r).length>0,p=e?Ry(e,s):"--",m=lo(e)||"--",h=e===null?"":c?k(s,"simulation.schematic.write_pending_banner","Submitting changes and waiting for the backend to re-parse and refresh."):t.component_id===e.id&&t.request_id?t.result_type==="conflict"?k(s,"simulation.schematic.write_conflict_banner","The document changed. The submission for the old revision was rejected. Please edit again based on the current content."):t.error_message||(t.success?k(s,"simulation.schematic.write_success_banner","Changes were submitted. The current display follows the refreshed backend result."):""):"",g=c?"schematic-property-panel__write-banner schematic-property-panel__write-banner--pending":t.result_type==="conflict"?"schematic-property-panel__write-banner schematic-property-panel__write-banner--warning":`schematic-property-panel__write-banner${t.success?"":" schematic-property-panel__write-banner--error"}`,v=e!==null&&!c&&t.component_id===e.id?t.field_key:"";return a.jsxs("div",{className:"content-card schematic-property-panel",children:[e?a.jsxs(a.Fragment,{children:[a.jsx("div",{className:"schematic-property-panel__section",children:a.jsxs("div",{className:"schematic-property-panel__meta-grid",children:[a.jsxs("div",{className:"schematic-property-panel__meta-item",children:[a.jsx("span",{className:"schematic-property-panel__meta-label",children:k(s,"simulation.schematic.component_type","Component Type")}),a.jsx("span",{className:"schematic-property-panel__meta-value",children:p})]}),a.jsxs("div",{className:"schematic-property-panel__meta-item",children:[a.jsx("span",{className:"schematic-property-panel__meta-label",children:k(s,"simulation.schematic.component_name","Current Component Name")}),a.jsx("span",{className:"schematic-property-panel__meta-value",children:m})]})]})}),a.jsxs("div",{className:"schematic-property-panel__section",children:[a.jsx("div",{className:"card-title",children:k(s,"simulation.schematic.connected_nodes","Connected Nodes")}),a.jsx("div",{className:"schematic-property-panel__pin-list",children:e.pins.length>0?e.pins.map(x=>a.jsxs("div",{className:"schematic-property-panel__pin-item",children:[a.jsx("span",{className:"schematic-property-panel__pin-name",children:x.name}),a.jsx("span",{className:"schematic-property-panel__pin-node",children:x.node_id||"--"})]},`${e.id}-${x.name}`)):a.jsx("div",{className:"muted-text",children:k(s,"simulation.schematic.no_pins","This component has no pins to display.")})})]}),a.jsxs("div",{className:"schematic-property-panel__section schematic-property-panel__section--grow",children:[a.jsx("div",{className:"card-title",children:k(s,"simulation.schematic.component_value","Component Value")}),a.jsx("div",{className:"schematic-property-panel__field-list",children:u.length>0?u.map(x=>{const L=n[x.field_key]??x.raw_text,_=!!r[x.field_key],d=v===x.field_key&&!!t.request_id,f=x.raw_text||e.display_value||"";return a.jsxs("div",{className:`schematic-property-panel__field-card${x.editable?"":" schematic-property-panel__field-card--readonly"}`,children:[a.jsxs("div",{className:"schematic-property-panel__meta-grid",children:[a.jsxs("label",{className:"schematic-property-panel__field-label",children:[a.jsx("span",{className:"schematic-property-panel__field-caption",children:k(s,"simulation.schematic.current_value","Current Value")}),a.jsx("input",{className:"schematic-property-panel__input",type:"text",value:f,readOnly:!0})]}),a.jsxs("label",{className:"schematic-property-panel__field-label",children:[a.jsx("span",{className:"schematic-property-panel__field-caption",children:k(s,"simulation.schematic.replacement_value","Replacement Value")}),a.jsx("input",{className:"schematic-property-panel__input",type:"text",value:L,disabled:!x.editable||_,onChange:y=>i(x.field_key,y.target.value)})]})]}),x.editable?null:a.jsx("div",{className:"muted-text",children:x.readonly_reason||k(s,"simulation.schematic.value_not_editable","The current component value cannot be edited.")}),a.jsxs("div",{className:"schematic-property-panel__field-footer",children:[a.jsx("div",{className:"muted-text",children:_?k(s,"simulation.schematic.pending_write","Submitting changes..."):""}),a.jsx("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!x.editable||L===x.raw_text||_,onClick:()=>l(x),children:_?k(s,"common.submitting","Submitting..."):k(s,"common.submit","Submit")})]}),_?a.jsx("div",{className:"schematic-property-panel__write-message schematic-property-panel__write-message--pending",children:k(s,"simulation.schematic.pending_write_hint","Requesting backend write-back. The current display follows the refreshed backend result.")}):null,d&&t.error_message?a.jsx("div",{className:"schematic-property-panel__write-message schematic-property-panel__write-message--error",children:t.error_message}):null]},`${e.id}-${x.field_key}`)}):a.jsx("div",{className:"muted-text",children:k(s,"simulation.schematic.no_editable_value","This component has no editable value.")})})]})]}):a.jsxs("div",{className:"schematic-property-panel__section schematic-property-panel__section--grow",children:[a.jsx("div",{className:"card-title",children:k(s,"simulation.schematic.component_details","Component Details")}),a.jsx("div",{className:"muted-text",children:k(s,"simulation.schematic.component_details_hint","Select a component to inspect its type, connected nodes, and component value.")})]}),h?a.jsx("div",{className:g,children:h}):null,o?a.jsx("div",{className:"schematic-property-panel__write-banner schematic-property-panel__write-banner--warning",children:o}):null]})}function Ji(e,t){return`${e}::${t}`}function Zx(){return{result:null,pending:!1,error:"",fallbackErrorKey:""}}function qx(){return{width:0,height:0}}function Jx(e,t){return`${e}::${t}`}function Qc(e,t){return`${e}::${t}`}function e0({bridge:e,schematicDocument:t,schematicWriteResult:n,uiText:r}){const[o,s]=N.useState(null),[i,l]=N.useState({}),[u,c]=N.useState({}),[p,m]=N.useState(!1),[h,g]=N.useState(Zx),[v,x]=N.useState($x),[L,_]=N.useState(qx),d=N.useRef(0),f=N.useRef(""),y=N.useRef(""),w=N.useRef(""),S=N.useMemo(()=>o?t.components.find(b=>b.id===o)??null:null,[t.components,o]);N.useEffect(()=>{const b=`${t.document_id}::${t.revision}`,Q=Object.keys(i).length>0,X=Object.keys(u).length>0;w.current&&w.current!==b&&Q&&!X&&m(!0),w.current=b,l({}),c({})},[t.document_id,t.revision]),N.useEffect(()=>{n.request_id&&c(b=>{const Q=Object.entries(b).filter(([,X])=>X.requestId!==n.request_id);return Q.length===Object.keys(b).length?b:Object.fromEntries(Q)})},[n.request_id]),N.useEffect(()=>{o&&(t.components.some(b=>b.id===o)||s(null))},[t.components,o]),N.useEffect(()=>{o||!t.has_schematic||t.components.length===0||s(t.components[0].id)},[t.components,t.has_schematic,o]),N.useEffect(()=>{const b=Jx(t.document_id,t.revision);f.current=b,y.current=b,g(X=>({result:X.result,pending:!0,error:"",fallbackErrorKey:""}));let Q=!1;return Xx(t).then(X=>{Q||f.current!==X.requestKey||g({result:X,pending:!1,error:"",fallbackErrorKey:""})}).catch(X=>{Q||f.current!==b||g(T=>({result:T.result,pending:!1,error:X instanceof Error?X.message:"",fallbackErrorKey:X instanceof Error?"":"simulation.schematic.layout_failed"}))}),()=>{Q=!0}},[t.document_id,t.revision]),N.useEffect(()=>{var Q;const b=(Q=h.result)==null?void 0:Q.bounds;!b||L.width<=0||L.height<=0||h.result===null||y.current===h.result.requestKey&&(y.current="",x(Xp(b,L.width,L.height)))},[h.result,L.height,L.width]);const M=N.useCallback(b=>{x(Q=>Q.scale===b.scale&&Q.offsetX===b.offsetX&&Q.offsetY===b.offsetY?Q:b)},[]),C=N.useCallback(b=>{_(Q=>Q.width===b.width&&Q.height===b.height?Q:b)},[]),z=N.useMemo(()=>S===null?{}:Object.fromEntries(S.editable_fields.filter(b=>b.field_key==="value").map(b=>[b.field_key,i[Ji(S.id,b.field_key)]??b.raw_text])),[i,S]),P=N.useMemo(()=>S===null?{}:Object.fromEntries(Object.values(u).filter(b=>b.componentId===S.id).map(b=>[b.fieldKey,b.requestId])),[u,S]),te=(b,Q)=>{S!==null&&(m(!1),l(X=>({...X,[Ji(S.id,b)]:Q})))},W=b=>{if(S===null||!b.editable||!e||b.field_key!=="value")return;const Q=Ji(S.id,b.field_key),X=i[Q]??b.raw_text;if(X===b.raw_text||u[Qc(S.id,b.field_key)])return;m(!1),d.current+=1;const T=`${Date.now()}-${d.current}`;c(O=>({...O,[Qc(S.id,b.field_key)]:{requestId:T,documentId:t.document_id,revision:t.revision,componentId:S.id,fieldKey:b.field_key}})),e.updateSchematicValue({documentId:t.document_id,revision:t.revision,componentId:S.id,fieldKey:b.field_key,newText:X,requestId:T})},_e=p?k(r,"simulation.schematic.stale_draft_notice","The authoritative document was refreshed and local drafts for the old revision were discarded."):"",ze=h.error||(h.fallbackErrorKey?k(r,h.fallbackErrorKey,"Failed to compute the schematic layout."):"");return a.jsx("div",{className:"tab-surface",children:a.jsx(oi,{sidebarConfig:{defaultSize:320,minSize:280,maxSize:460,mainMinSize:360,resizable:!0},sidebar:a.jsx(Qx,{component:S,schematicWriteResult:n,fieldDrafts:z,pendingFieldRequestIds:P,staleDraftNotice:_e,uiText:r,onDraftChange:te,onSubmitField:W}),main:a.jsx("div",{className:"content-card content-card--canvas",children:a.jsx(Kx,{schematicDocument:t,layoutResult:h.result,layoutPending:h.pending,layoutError:ze,selectedComponentId:o,uiText:r,viewState:v,onViewStateChange:M,onViewportSizeChange:C,onSelectComponent:s})})})})}function t0({state:e,schematicDocument:t,schematicWriteResult:n,rawDataCopyResult:r,rawDataDocument:o,rawDataViewport:s,bridge:i,bridgeConnected:l,onTabSelect:u}){const c=e.surface_tabs.active_tab,p=e.ui_text,m=c==="schematic"||!!t.file_path,h=c==="raw_data"||o.has_data;return a.jsxs(Cy,{state:e,bridgeConnected:l,onTabSelect:u,children:[c==="raw_data"||c==="schematic"?null:a.jsx("div",{className:"tab-surface-shell",children:a.jsx(Sy,{activeTab:c,state:e,bridge:i})}),m?a.jsx("div",{className:c==="schematic"?"tab-surface-shell":"tab-surface-shell tab-surface-shell--hidden",children:a.jsx(e0,{bridge:i,schematicDocument:t,schematicWriteResult:n,uiText:p})}):null,h?a.jsx("div",{className:c==="raw_data"?"tab-surface-shell":"tab-surface-shell tab-surface-shell--hidden",children:a.jsx(by,{rawDataCopyResult:r,rawDataDocument:o,rawDataViewport:s,bridge:i,uiText:p})}):null]})}const n0=["circuit_selection","metrics","schematic","chart","waveform","analysis_info","raw_data","output_log","export","asc_conversion","op_result"],r0=new Set(["op_result"]),o0=n0.filter(e=>!r0.has(e)),s0={has_result:!1,result_path:"",file_path:"",file_name:"",analysis_type:"",analysis_label:"",executor:"",success:!1,timestamp:"",duration_seconds:0,version:0,session_id:"",x_axis_kind:"",x_axis_label:"",x_axis_scale:"",requested_x_range:null,actual_x_range:null,has_raw_output:!1},i0={cursor_a_x:null,cursor_b_x:null,values_a:{},values_b:{}},l0={enabled:!1,target_id:"",point_x:null,title:"",plot_series_name:"",plot_axis_key:"left",plot_y:null,values:[]},Zc={active:!1,x_min:null,x_max:null,left_y_min:null,left_y_max:null,right_y_min:null,right_y_max:null},a0={cursor_a_x:null,cursor_b_x:null,values_a:{},values_b:{}},u0={dataset_id:"",version:0,has_data:!1,row_count:0,column_count:0,row_header_width_px:0,row_height_px:0,column_header_height_px:0,columns:[]},c0={dataset_id:"",version:0,row_start:0,row_end:0,col_start:0,col_end:0,rows:[]},d0={dataset_id:"",version:0,sequence:0,success:!1,row_count:0,col_count:0},f0={document_id:"",revision:"",file_path:"",file_name:"",has_schematic:!1,title:"",components:[],nets:[],subcircuits:[],parse_errors:[],readonly_reasons:[]},p0={document_id:"",revision:"",request_id:"",success:!1,component_id:"",field_key:"",result_type:"",error_message:""},Jl={simulation_runtime:{status:"idle",status_message:"",error_message:"",project_root:"",has_project:!1,current_result_path:"",is_empty:!0,has_result:!1,has_error:!1,awaiting_confirmation:!1,current_result:s0},surface_tabs:{active_tab:"metrics",available_tabs:o0,has_op_result:!1},metrics_view:{items:[],source_file_path:"",can_add_to_conversation:!1},analysis_chart_view:{has_chart:!1,chart_count:0,can_export:!1,can_add_to_conversation:!1,title:"",chart_type:"",chart_type_display_name:"",x_label:"",y_label:"",secondary_y_label:"",log_x:!1,log_y:!1,right_log_y:!1,available_series:[],visible_series:[],visible_series_count:0,viewport:Zc,measurement_point:l0,measurement_enabled:!1,measurement:i0},waveform_view:{has_waveform:!1,signal_count:0,signal_names:[],can_export:!1,can_add_to_conversation:!1,displayed_signal_names:[],signal_catalog:[],visible_series:[],x_axis_label:"",y_label:"",secondary_y_label:"",log_x:!1,viewport:Zc,cursor_a_visible:!1,cursor_b_visible:!1,measurement:a0},analysis_info_view:{analysis_type:"",analysis_command:"",executor:"",file_name:"",x_axis_kind:"",x_axis_label:"",x_axis_scale:"",requested_x_range:null,actual_x_range:null,parameters:{}},output_log_view:{has_log:!1,can_add_to_conversation:!1,current_filter:"all",search_keyword:"",lines:[],selected_line_number:null},export_view:{has_result:!1,can_export:!1,items:[],selected_directory:"",latest_project_export_root:""},asc_conversion_view:{can_choose_files:!1,selected_files_summary:""},circuit_selection_view:{items:[],selected_circuit_file:""},op_result_view:{is_available:!1,file_name:"",analysis_command:"",row_count:0,section_count:0,sections:[],can_add_to_conversation:!1},ui_text:{}};function G(e){return e&&typeof e=="object"?e:{}}function j(e){return typeof e=="string"?e:""}function K(e){return typeof e=="boolean"?e:!1}function Z(e){return typeof e=="number"&&Number.isFinite(e)?e:0}function Be(e){return typeof e=="number"&&Number.isFinite(e)?e:null}function ut(e){return Array.isArray(e)?e.map(t=>String(t??"")).filter(Boolean):[]}function Uo(e){if(!Array.isArray(e)||e.length!==2)return null;const[t,n]=e;return[Z(t),Z(n)]}function $s(e){return Array.isArray(e)?e.map(t=>Z(t)):[]}function Fs(e){const t=G(e);return Object.fromEntries(Object.entries(t).map(([n,r])=>[n,Z(r)]))}function Rn(e){const t=G(e);return Object.fromEntries(Object.entries(t).map(([n,r])=>[n,j(r)]))}function m0(e){return Rn(e)}function qc(e){const t=G(e);return{active:K(t.active),x_min:Be(t.x_min),x_max:Be(t.x_max),left_y_min:Be(t.left_y_min),left_y_max:Be(t.left_y_max),right_y_min:Be(t.right_y_min),right_y_max:Be(t.right_y_max)}}function h0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{name:j(n.name),color:j(n.color),axis_key:j(n.axis_key),line_style:j(n.line_style),group_key:j(n.group_key),component:j(n.component),visible:K(n.visible),point_count:Z(n.point_count)}}):[]}function _0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{name:j(n.name),node_id:j(n.node_id),role:j(n.role)}}):[]}function y0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{field_key:j(n.field_key),label:j(n.label),raw_text:j(n.raw_text),display_text:j(n.display_text),editable:K(n.editable),readonly_reason:j(n.readonly_reason),value_kind:j(n.value_kind)}}):[]}function v0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{id:j(n.id),instance_name:j(n.instance_name),kind:j(n.kind),symbol_kind:j(n.symbol_kind)||"unknown",display_name:j(n.display_name),display_value:j(n.display_value),pins:_0(n.pins),node_ids:ut(n.node_ids),editable_fields:y0(n.editable_fields),scope_path:ut(n.scope_path),source_file:j(n.source_file),symbol_variant:j(n.symbol_variant),primitive_kind:j(n.primitive_kind),primitive_source:j(n.primitive_source),subckt_name:j(n.subckt_name),resolved_model_name:j(n.resolved_model_name),semantic_roles:ut(n.semantic_roles),pin_roles:Rn(n.pin_roles),port_side_hints:Rn(n.port_side_hints),label_slots:Rn(n.label_slots),polarity_marks:Rn(n.polarity_marks),render_hints:Rn(n.render_hints)}}):[]}function g0(e){return Array.isArray(e)?e.map(t=>{const n=G(t),r=Array.isArray(n.connections)?n.connections.map(o=>{const s=G(o);return{component_id:j(s.component_id),instance_name:j(s.instance_name),pin_name:j(s.pin_name),pin_role:j(s.pin_role)}}):[];return{id:j(n.id),name:j(n.name),scope_path:ut(n.scope_path),source_file:j(n.source_file),connections:r}}):[]}function x0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{name:j(n.name),port_names:ut(n.port_names),scope_path:ut(n.scope_path),source_file:j(n.source_file),component_ids:ut(n.component_ids),primitive_kind:j(n.primitive_kind)}}):[]}function w0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{message:j(n.message),source_file:j(n.source_file),line_text:j(n.line_text),line_index:Z(n.line_index),column_start:Z(n.column_start),column_end:Z(n.column_end)}}):[]}function S0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{name:j(n.name),color:j(n.color),axis_key:j(n.axis_key),line_style:j(n.line_style),group_key:j(n.group_key),component:j(n.component),x:$s(n.x),y:$s(n.y),point_count:Z(n.point_count),sampled_point_count:Z(n.sampled_point_count)}}):[]}function k0(e){const t=G(e);return{cursor_a_x:Be(t.cursor_a_x),cursor_b_x:Be(t.cursor_b_x),values_a:Fs(t.values_a),values_b:Fs(t.values_b)}}function N0(e){const t=G(e),n=Array.isArray(t.values)?t.values.map(r=>{const o=G(r);return{label:j(o.label),value_text:j(o.value_text)}}):[];return{enabled:K(t.enabled),target_id:j(t.target_id),point_x:Be(t.point_x),title:j(t.title),plot_series_name:j(t.plot_series_name),plot_axis_key:j(t.plot_axis_key)||"left",plot_y:Be(t.plot_y),values:n}}function E0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{name:j(n.name),visible:K(n.visible)}}):[]}function C0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{name:j(n.name),color:j(n.color),axis_key:j(n.axis_key),x:$s(n.x),y:$s(n.y),point_count:Z(n.point_count),sampled_point_count:Z(n.sampled_point_count)}}):[]}function j0(e){const t=G(e);return{cursor_a_x:Be(t.cursor_a_x),cursor_b_x:Be(t.cursor_b_x),values_a:Fs(t.values_a),values_b:Fs(t.values_b)}}function M0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{key:j(n.key),label:j(n.label),width_px:Z(n.width_px)}}):[]}function L0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{row_index:Z(n.row_index),values:ut(n.values)}}):[]}function T0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{line_number:Z(n.line_number),content:j(n.content),level:j(n.level)}}):[]}function b0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{name:j(n.name),display_name:j(n.display_name),value:j(n.value),unit:j(n.unit),raw_value:Be(n.raw_value),target:j(n.target)}}):[]}function I0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{id:j(n.id),label:j(n.label),selected:K(n.selected),enabled:K(n.enabled)}}):[]}function A0(e){const t=G(e);return{id:j(t.id),result_path:j(t.result_path),file_path:j(t.file_path),file_name:j(t.file_name),analysis_type:j(t.analysis_type),success:K(t.success),timestamp:j(t.timestamp),is_current:K(t.is_current),can_load:K(t.can_load)}}function P0(e){return Array.isArray(e)?e.map(t=>{const n=G(t);return{circuit_file:j(n.circuit_file),circuit_absolute_path:j(n.circuit_absolute_path),circuit_display_name:j(n.circuit_display_name),run_count:Z(n.run_count),is_current:K(n.is_current),latest_result:A0(n.latest_result)}}):[]}function R0(e){return Array.isArray(e)?e.map(t=>{const n=G(t),r=Array.isArray(n.rows)?n.rows.map(o=>{const s=G(o);return{name:j(s.name),formatted_value:j(s.formatted_value),raw_value:Be(s.raw_value),unit:j(s.unit)}}):[];return{id:j(n.id),title:j(n.title),row_count:Z(n.row_count),rows:r}}):[]}function O0(e){const t=G(e),n=G(t.simulation_runtime),r=G(t.surface_tabs),o=G(t.metrics_view),s=G(t.analysis_chart_view),i=G(t.waveform_view),l=G(t.analysis_info_view),u=G(t.output_log_view),c=G(t.export_view),p=G(t.asc_conversion_view),m=G(t.circuit_selection_view),h=G(t.op_result_view),g=n,v=G(n.current_result);return{simulation_runtime:{status:j(g.status)||Jl.simulation_runtime.status,status_message:j(g.status_message),error_message:j(g.error_message),project_root:j(g.project_root),has_project:K(g.has_project),current_result_path:j(g.current_result_path),is_empty:K(g.is_empty),has_result:K(g.has_result),has_error:K(g.has_error),awaiting_confirmation:K(g.awaiting_confirmation),current_result:{has_result:K(v.has_result),result_path:j(v.result_path),file_path:j(v.file_path),file_name:j(v.file_name),analysis_type:j(v.analysis_type),analysis_label:j(v.analysis_label),executor:j(v.executor),success:K(v.success),timestamp:j(v.timestamp),duration_seconds:Z(v.duration_seconds),version:Z(v.version),session_id:j(v.session_id),x_axis_kind:j(v.x_axis_kind),x_axis_label:j(v.x_axis_label),x_axis_scale:j(v.x_axis_scale),requested_x_range:Uo(v.requested_x_range),actual_x_range:Uo(v.actual_x_range),has_raw_output:K(v.has_raw_output)}},surface_tabs:{active_tab:j(r.active_tab)||Jl.surface_tabs.active_tab,available_tabs:ut(r.available_tabs),has_op_result:K(r.has_op_result)},metrics_view:{items:b0(o.items),source_file_path:j(o.source_file_path),can_add_to_conversation:K(o.can_add_to_conversation)},analysis_chart_view:{has_chart:K(s.has_chart),chart_count:Z(s.chart_count),can_export:K(s.can_export),can_add_to_conversation:K(s.can_add_to_conversation),title:j(s.title),chart_type:j(s.chart_type),chart_type_display_name:j(s.chart_type_display_name),x_label:j(s.x_label),y_label:j(s.y_label),secondary_y_label:j(s.secondary_y_label),log_x:K(s.log_x),log_y:K(s.log_y),right_log_y:K(s.right_log_y),available_series:h0(s.available_series),visible_series:S0(s.visible_series),visible_series_count:Z(s.visible_series_count),viewport:qc(s.viewport),measurement_point:N0(s.measurement_point),measurement_enabled:K(s.measurement_enabled),measurement:k0(s.measurement)},waveform_view:{has_waveform:K(i.has_waveform),signal_count:Z(i.signal_count),signal_names:ut(i.signal_names),can_export:K(i.can_export),can_add_to_conversation:K(i.can_add_to_conversation),displayed_signal_names:ut(i.displayed_signal_names),signal_catalog:E0(i.signal_catalog),visible_series:C0(i.visible_series),x_axis_label:j(i.x_axis_label),y_label:j(i.y_label),secondary_y_label:j(i.secondary_y_label),log_x:K(i.log_x),viewport:qc(i.viewport),cursor_a_visible:K(i.cursor_a_visible),cursor_b_visible:K(i.cursor_b_visible),measurement:j0(i.measurement)},analysis_info_view:{analysis_type:j(l.analysis_type),analysis_command:j(l.analysis_command),executor:j(l.executor),file_name:j(l.file_name),x_axis_kind:j(l.x_axis_kind),x_axis_label:j(l.x_axis_label),x_axis_scale:j(l.x_axis_scale),requested_x_range:Uo(l.requested_x_range),actual_x_range:Uo(l.actual_x_range),parameters:G(l.parameters)},output_log_view:{has_log:K(u.has_log),can_add_to_conversation:K(u.can_add_to_conversation),current_filter:j(u.current_filter)||"all",search_keyword:j(u.search_keyword),lines:T0(u.lines),selected_line_number:Be(u.selected_line_number)},export_view:{has_result:K(c.has_result),can_export:K(c.can_export),items:I0(c.items),selected_directory:j(c.selected_directory),latest_project_export_root:j(c.latest_project_export_root)},asc_conversion_view:{can_choose_files:K(p.can_choose_files),selected_files_summary:j(p.selected_files_summary)},circuit_selection_view:{items:P0(m.items),selected_circuit_file:j(m.selected_circuit_file)},op_result_view:{is_available:K(h.is_available),file_name:j(h.file_name),analysis_command:j(h.analysis_command),row_count:Z(h.row_count),section_count:Z(h.section_count),sections:R0(h.sections),can_add_to_conversation:K(h.can_add_to_conversation)},ui_text:m0(t.ui_text)}}function z0(e){const t=G(e);return{dataset_id:j(t.dataset_id),version:Z(t.version),has_data:K(t.has_data),row_count:Z(t.row_count),column_count:Z(t.column_count),row_header_width_px:Z(t.row_header_width_px),row_height_px:Z(t.row_height_px),column_header_height_px:Z(t.column_header_height_px),columns:M0(t.columns)}}function D0(e){const t=G(e);return{document_id:j(t.document_id),revision:j(t.revision),file_path:j(t.file_path),file_name:j(t.file_name),has_schematic:K(t.has_schematic),title:j(t.title),components:v0(t.components),nets:g0(t.nets),subcircuits:x0(t.subcircuits),parse_errors:w0(t.parse_errors),readonly_reasons:ut(t.readonly_reasons)}}function B0(e){const t=G(e);return{document_id:j(t.document_id),revision:j(t.revision),request_id:j(t.request_id),success:K(t.success),component_id:j(t.component_id),field_key:j(t.field_key),result_type:j(t.result_type),error_message:j(t.error_message)}}function $0(e){const t=G(e);return{dataset_id:j(t.dataset_id),version:Z(t.version),row_start:Z(t.row_start),row_end:Z(t.row_end),col_start:Z(t.col_start),col_end:Z(t.col_end),rows:L0(t.rows)}}function F0(e){const t=G(e);return{dataset_id:j(t.dataset_id),version:Z(t.version),sequence:Z(t.sequence),success:K(t.success),row_count:Z(t.row_count),col_count:Z(t.col_count)}}function X0(){const[e,t]=N.useState(Jl),[n,r]=N.useState(d0),[o,s]=N.useState(u0),[i,l]=N.useState(c0),[u,c]=N.useState(f0),[p,m]=N.useState(p0),[h,g]=N.useState(null),[v,x]=N.useState(!1);N.useEffect(()=>{const _={setState(d){t(O0(d))},setSchematicDocument(d){c(D0(d))},finishSchematicWrite(d){m(B0(d))},setRawDataDocument(d){s(z0(d))},setRawDataViewport(d){l($0(d))},finishRawDataCopy(d){r(F0(d))}};return window.simulationApp=_,()=>{delete window.simulationApp}},[]),N.useEffect(()=>{var d;if(!((d=window.qt)!=null&&d.webChannelTransport)||!window.QWebChannel)return;let _=!1;return new window.QWebChannel(window.qt.webChannelTransport,f=>{var w;if(_)return;const y=f.objects.simulationBridge??null;g(y),x(!!y),(w=y==null?void 0:y.markReady)==null||w.call(y)}),()=>{_=!0,g(null),x(!1)}},[]);const L=_=>{h==null||h.activateTab(_)};return a.jsx(t0,{state:e,schematicDocument:u,schematicWriteResult:p,rawDataCopyResult:n,rawDataDocument:o,rawDataViewport:i,bridge:h,bridgeConnected:v,onTabSelect:L})}const Jc=document.getElementById("root");Jc&&pp(Jc).render(a.jsx(X0,{}));
@@ -0,0 +1,10 @@
+var gh=Object.create;var{getPrototypeOf:_h,defineProperty:zc,getOwnPropertyNames:yh}=Object;var Bc=Object.prototype.hasOwnProperty;function vh(t){return this[t]}var Sh,xh,Wa=(t,r,i)=>{var o=t!=null&&typeof t==="object";if(o){var a=r?Sh??=new WeakMap:xh??=new WeakMap,s=a.get(t);if(s)return s}i=t!=null?gh(_h(t)):{};let l=r||!t||!t.__esModule||!Bc.call(t,"default")?zc(i,"default",{value:t,enumerable:!0}):i;if(t&&typeof t==="object"||typeof t==="function"){for(let c of yh(t))if(!Bc.call(l,c))zc(l,c,{get:vh.bind(t,c),enumerable:!0})}if(o)a.set(t,l);return l};var e=(t,r)=>()=>(r||t((r={exports:{}}).exports,r),r.exports);var $a=(t,r,i)=>()=>{if(t)try{r=t(t=0)}catch(o){i=[o]}if(i)throw i[0];return r};var n=((t)=>typeof require<"u"?require:typeof Proxy<"u"?new Proxy(t,{get:(r,i)=>(typeof require<"u"?require:r)[i]}):t)(function(t){if(typeof require<"u")return require.apply(this,arguments);throw Error('Dynamic require of "'+t+'" is not supported')});var Fc,Va,Ki,Vc=(t,r)=>{for(var[i,o,a]of Fc||[])for(var s=[t],l=globalThis,c=l.document,u,d,f,g,_;d=s.pop();)if(!Va[d]&&(f=o[d])){Va[d]=1;for(g=1;g<f.length;g++)s.push(a[f[g]]);if(!r&&d!==t&&(u=c&&c.head)){if(Ki===void 0)Ki=(g=c.querySelector("meta[property=csp-nonce]"))&&(g.nonce||g.getAttribute("nonce"))||"";if(_=c.createElement("link"),_.rel="modulepreload",_.crossOrigin="",Ki)_.nonce=Ki;_.href=new l.URL(f[0],i),u.appendChild(_)}}},bh=(t,r,i,o)=>{for(var a={},s=0;s<r.length;s++)a[r[s]]=i[s];(Fc||=[]).push([t,a,r]),Va||={},Vc(r[o],1)};bh(import.meta.url,["q9jzs38x","8sm9xejy"],[["./index-q9jzs38x.js"],["./elk.bundled-8sm9xejy.js",0]],0);
+function Ar(t,r,i){this.props=t,this.context=r,this.refs=$c,this.updater=i||Wc}function Hc(){}function Yc(t,r,i){this.props=t,this.context=r,this.refs=$c,this.updater=i||Wc}var wh,Wc,kh,$c,Ha,Ch,Jt,Nh,Eh,Ir,Ya=function(t,r){return{$$typeof:wh,type:t,compare:r===void 0?null:r}},ze=function(t,r){return Jt.current.useCallback(t,r)},H=function(t,r){return Jt.current.useEffect(t,r)},Ua=function(){return Jt.current.useId()},Xa=function(t,r){return Jt.current.useLayoutEffect(t,r)},U=function(t,r){return Jt.current.useMemo(t,r)},se=function(t){return Jt.current.useRef(t)},Y=function(t){return Jt.current.useState(t)};var Be=$a(()=>{wh=Symbol.for("react.memo"),Wc={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},kh=Object.assign,$c={};Ar.prototype.isReactComponent={};Ar.prototype.setState=function(t,r){if(typeof t!=="object"&&typeof t!=="function"&&t!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,t,r,"setState")};Ar.prototype.forceUpdate=function(t){this.updater.enqueueForceUpdate(this,t,"forceUpdate")};Hc.prototype=Ar.prototype;Ha=Yc.prototype=new Hc;Ha.constructor=Yc;kh(Ha,Ar.prototype);Ha.isPureReactComponent=!0;Ch={current:null},Jt={current:null},Nh={transition:null},Eh={ReactCurrentDispatcher:Jt,ReactCurrentBatchConfig:Nh,ReactCurrentOwner:Ch};Ir=Eh});var Zc=e(function(qn){function Ga(t,r){var i=t.length;t.push(r);e:for(;0<i;){var o=i-1>>>1,a=t[o];if(0<Zi(a,r))t[o]=r,t[i]=a,i=o;else break e}}function xt(t){return t.length===0?null:t[0]}function to(t){if(t.length===0)return null;var r=t[0],i=t.pop();if(i!==r){t[0]=i;e:for(var o=0,a=t.length,s=a>>>1;o<s;){var l=2*(o+1)-1,c=t[l],u=l+1,d=t[u];if(0>Zi(c,i))u<a&&0>Zi(d,c)?(t[o]=d,t[u]=i,o=u):(t[o]=c,t[l]=i,o=l);else if(u<a&&0>Zi(d,i))t[o]=d,t[u]=i,o=u;else break e}}return r}function Zi(t,r){var i=t.sortIndex-r.sortIndex;return i!==0?i:t.id-r.id}if(typeof performance==="object"&&typeof performance.now==="function")Ka=performance,qn.unstable_now=function(){return Ka.now()};else qi=Date,Qa=qi.now(),qn.unstable_now=function(){return qi.now()-Qa};var Ka,qi,Qa,Rt=[],en=[],Lh=1,mt=null,Fe=3,no=!1,Ln=!1,Or=!1,Xc=typeof setTimeout==="function"?setTimeout:null,jc=typeof clearTimeout==="function"?clearTimeout:null,Uc=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function Za(t){for(var r=xt(en);r!==null;){if(r.callback===null)to(en);else if(r.startTime<=t)to(en),r.sortIndex=r.expirationTime,Ga(Rt,r);else break;r=xt(en)}}function Ja(t){if(Or=!1,Za(t),!Ln)if(xt(Rt)!==null)Ln=!0,ts(es);else{var r=xt(en);r!==null&&ns(Ja,r.startTime-t)}}function es(t,r){Ln=!1,Or&&(Or=!1,jc(zr),zr=-1),no=!0;var i=Fe;try{Za(r);for(mt=xt(Rt);mt!==null&&(!(mt.expirationTime>r)||t&&!Qc());){var o=mt.callback;if(typeof o==="function"){mt.callback=null,Fe=mt.priorityLevel;var a=o(mt.expirationTime<=r);r=qn.unstable_now(),typeof a==="function"?mt.callback=a:mt===xt(Rt)&&to(Rt),Za(r)}else to(Rt);mt=xt(Rt)}if(mt!==null)var s=!0;else{var l=xt(en);l!==null&&ns(Ja,l.startTime-r),s=!1}return s}finally{mt=null,Fe=i,no=!1}}var ro=!1,Ji=null,zr=-1,Gc=5,Kc=-1;function Qc(){return qn.unstable_now()-Kc<Gc?!1:!0}function ja(){if(Ji!==null){var t=qn.unstable_now();Kc=t;var r=!0;try{r=Ji(!0,t)}finally{r?Dr():(ro=!1,Ji=null)}}else ro=!1}var Dr;if(typeof Uc==="function")Dr=function(){Uc(ja)};else if(typeof MessageChannel<"u")eo=new MessageChannel,qa=eo.port2,eo.port1.onmessage=ja,Dr=function(){qa.postMessage(null)};else Dr=function(){Xc(ja,0)};var eo,qa;function ts(t){Ji=t,ro||(ro=!0,Dr())}function ns(t,r){zr=Xc(function(){t(qn.unstable_now())},r)}qn.unstable_IdlePriority=5;qn.unstable_ImmediatePriority=1;qn.unstable_LowPriority=4;qn.unstable_NormalPriority=3;qn.unstable_Profiling=null;qn.unstable_UserBlockingPriority=2;qn.unstable_cancelCallback=function(t){t.callback=null};qn.unstable_continueExecution=function(){Ln||no||(Ln=!0,ts(es))};qn.unstable_forceFrameRate=function(t){0>t||125<t?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Gc=0<t?Math.floor(1000/t):5};qn.unstable_getCurrentPriorityLevel=function(){return Fe};qn.unstable_getFirstCallbackNode=function(){return xt(Rt)};qn.unstable_next=function(t){switch(Fe){case 1:case 2:case 3:var r=3;break;default:r=Fe}var i=Fe;Fe=r;try{return t()}finally{Fe=i}};qn.unstable_pauseExecution=function(){};qn.unstable_requestPaint=function(){};qn.unstable_runWithPriority=function(t,r){switch(t){case 1:case 2:case 3:case 4:case 5:break;default:t=3}var i=Fe;Fe=t;try{return r()}finally{Fe=i}};qn.unstable_scheduleCallback=function(t,r,i){var o=qn.unstable_now();switch(typeof i==="object"&&i!==null?(i=i.delay,i=typeof i==="number"&&0<i?o+i:o):i=o,t){case 1:var a=-1;break;case 2:a=250;break;case 5:a=1073741823;break;case 4:a=1e4;break;default:a=5000}return a=i+a,t={id:Lh++,callback:r,priorityLevel:t,startTime:i,expirationTime:a,sortIndex:-1},i>o?(t.sortIndex=i,Ga(en,t),xt(Rt)===null&&t===xt(en)&&(Or?(jc(zr),zr=-1):Or=!0,ns(Ja,i-o))):(t.sortIndex=a,Ga(Rt,t),Ln||no||(Ln=!0,ts(es))),t};qn.unstable_shouldYield=Qc;qn.unstable_wrapCallback=function(t){var r=Fe;return function(){var i=Fe;Fe=r;try{return t.apply(this,arguments)}finally{Fe=i}}}});function A(t){for(var r="https://reactjs.org/docs/error-decoder.html?invariant="+t,i=1;i<arguments.length;i++)r+="&args[]="+encodeURIComponent(arguments[i]);return"Minified React error #"+t+"; visit "+r+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function Wn(t,r){_r(t,r),_r(t+"Capture",r)}function _r(t,r){ui[t]=r;for(t=0;t<r.length;t++)td.add(r[t])}function Gh(t){if(ks.call(Jc,t))return!0;if(ks.call(qc,t))return!1;if(jh.test(t))return Jc[t]=!0;return qc[t]=!0,!1}function Kh(t,r,i,o){if(i!==null&&i.type===0)return!1;switch(typeof r){case"function":case"symbol":return!0;case"boolean":if(o)return!1;if(i!==null)return!i.acceptsBooleans;return t=t.toLowerCase().slice(0,5),t!=="data-"&&t!=="aria-";default:return!1}}function Qh(t,r,i,o){if(r===null||typeof r>"u"||Kh(t,r,i,o))return!0;if(o)return!1;if(i!==null)switch(i.type){case 3:return!r;case 4:return r===!1;case 5:return isNaN(r);case 6:return isNaN(r)||1>r}return!1}function Ge(t,r,i,o,a,s,l){this.acceptsBooleans=r===2||r===3||r===4,this.attributeName=o,this.attributeNamespace=a,this.mustUseProperty=i,this.propertyName=t,this.type=r,this.sanitizeURL=s,this.removeEmptyString=l}function vl(t){return t[1].toUpperCase()}function Sl(t,r,i,o){var a=De.hasOwnProperty(r)?De[r]:null;if(a!==null?a.type!==0:o||!(2<r.length)||r[0]!=="o"&&r[0]!=="O"||r[1]!=="n"&&r[1]!=="N")Qh(r,i,a,o)&&(i=null),o||a===null?Gh(r)&&(i===null?t.removeAttribute(r):t.setAttribute(r,""+i)):a.mustUseProperty?t[a.propertyName]=i===null?a.type===3?!1:"":i:(r=a.attributeName,o=a.attributeNamespace,i===null?t.removeAttribute(r):(a=a.type,i=a===3||a===4&&i===!0?"":""+i,o?t.setAttributeNS(o,r,i):t.setAttribute(r,i)))}function Br(t){if(t===null||typeof t!=="object")return null;return t=eu&&t[eu]||t["@@iterator"],typeof t==="function"?t:null}function Xr(t){if(rs===void 0)try{throw Error()}catch(i){var r=i.stack.trim().match(/\n( *(at )?)/);rs=r&&r[1]||""}return`
+`+rs+t}function os(t,r){if(!t||is)return"";is=!0;var i=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(r)if(r=function(){throw Error()},Object.defineProperty(r.prototype,"props",{set:function(){throw Error()}}),typeof Reflect==="object"&&Reflect.construct){try{Reflect.construct(r,[])}catch(d){var o=d}Reflect.construct(t,[],r)}else{try{r.call()}catch(d){o=d}t.call(r.prototype)}else{try{throw Error()}catch(d){o=d}t()}}catch(d){if(d&&o&&typeof d.stack==="string"){for(var a=d.stack.split(`
+`),s=o.stack.split(`
+`),l=a.length-1,c=s.length-1;1<=l&&0<=c&&a[l]!==s[c];)c--;for(;1<=l&&0<=c;l--,c--)if(a[l]!==s[c]){if(l!==1||c!==1)do if(l--,c--,0>c||a[l]!==s[c]){var u=`
+`+a[l].replace(" at new "," at ");return t.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",t.displayName)),u}while(1<=l&&0<=c);break}}}finally{is=!1,Error.prepareStackTrace=i}return(t=t?t.displayName||t.name:"")?Xr(t):""}function Zh(t){switch(t.tag){case 5:return Xr(t.type);case 16:return Xr("Lazy");case 13:return Xr("Suspense");case 19:return Xr("SuspenseList");case 0:case 2:case 15:return t=os(t.type,!1),t;case 11:return t=os(t.type.render,!1),t;case 1:return t=os(t.type,!0),t;default:return""}}function Ls(t){if(t==null)return null;if(typeof t==="function")return t.displayName||t.name||null;if(typeof t==="string")return t;switch(t){case tr:return"Fragment";case Ur:return"Portal";case Cs:return"Profiler";case xl:return"StrictMode";case Ns:return"Suspense";case Es:return"SuspenseList"}if(typeof t==="object")switch(t.$$typeof){case rd:return(t.displayName||"Context")+".Consumer";case nd:return(t._context.displayName||"Context")+".Provider";case bl:var r=t.render;return t=t.displayName,t||(t=r.displayName||r.name||"",t=t!==""?"ForwardRef("+t+")":"ForwardRef"),t;case wl:return r=t.displayName||null,r!==null?r:Ls(t.type)||"Memo";case nn:r=t._payload,t=t._init;try{return Ls(t(r))}catch(i){}}return null}function qh(t){var r=t.type;switch(t.tag){case 24:return"Cache";case 9:return(r.displayName||"Context")+".Consumer";case 10:return(r._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return t=r.render,t=t.displayName||t.name||"",r.displayName||(t!==""?"ForwardRef("+t+")":"ForwardRef");case 7:return"Fragment";case 5:return r;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return Ls(r);case 8:return r===xl?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof r==="function")return r.displayName||r.name||null;if(typeof r==="string")return r}return null}function _n(t){switch(typeof t){case"boolean":case"number":case"string":case"undefined":return t;case"object":return t;default:return""}}function od(t){var r=t.type;return(t=t.nodeName)&&t.toLowerCase()==="input"&&(r==="checkbox"||r==="radio")}function Jh(t){var r=od(t)?"checked":"value",i=Object.getOwnPropertyDescriptor(t.constructor.prototype,r),o=""+t[r];if(!t.hasOwnProperty(r)&&typeof i<"u"&&typeof i.get==="function"&&typeof i.set==="function"){var{get:a,set:s}=i;return Object.defineProperty(t,r,{configurable:!0,get:function(){return a.call(this)},set:function(l){o=""+l,s.call(this,l)}}),Object.defineProperty(t,r,{enumerable:i.enumerable}),{getValue:function(){return o},setValue:function(l){o=""+l},stopTracking:function(){t._valueTracker=null,delete t[r]}}}}function oo(t){t._valueTracker||(t._valueTracker=Jh(t))}function ad(t){if(!t)return!1;var r=t._valueTracker;if(!r)return!0;var i=r.getValue(),o="";return t&&(o=od(t)?t.checked?"true":"false":t.value),t=o,t!==i?(r.setValue(t),!0):!1}function Po(t){if(t=t||(typeof document<"u"?document:void 0),typeof t>"u")return null;try{return t.activeElement||t.body}catch(r){return t.body}}function Ms(t,r){var i=r.checked;return ve({},r,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:i!=null?i:t._wrapperState.initialChecked})}function tu(t,r){var i=r.defaultValue==null?"":r.defaultValue,o=r.checked!=null?r.checked:r.defaultChecked;i=_n(r.value!=null?r.value:i),t._wrapperState={initialChecked:o,initialValue:i,controlled:r.type==="checkbox"||r.type==="radio"?r.checked!=null:r.value!=null}}function sd(t,r){r=r.checked,r!=null&&Sl(t,"checked",r,!1)}function Rs(t,r){sd(t,r);var i=_n(r.value),o=r.type;if(i!=null)if(o==="number"){if(i===0&&t.value===""||t.value!=i)t.value=""+i}else t.value!==""+i&&(t.value=""+i);else if(o==="submit"||o==="reset"){t.removeAttribute("value");return}r.hasOwnProperty("value")?Ps(t,r.type,i):r.hasOwnProperty("defaultValue")&&Ps(t,r.type,_n(r.defaultValue)),r.checked==null&&r.defaultChecked!=null&&(t.defaultChecked=!!r.defaultChecked)}function nu(t,r,i){if(r.hasOwnProperty("value")||r.hasOwnProperty("defaultValue")){var o=r.type;if(!(o!=="submit"&&o!=="reset"||r.value!==void 0&&r.value!==null))return;r=""+t._wrapperState.initialValue,i||r===t.value||(t.value=r),t.defaultValue=r}i=t.name,i!==""&&(t.name=""),t.defaultChecked=!!t._wrapperState.initialChecked,i!==""&&(t.name=i)}function Ps(t,r,i){if(r!=="number"||Po(t.ownerDocument)!==t)i==null?t.defaultValue=""+t._wrapperState.initialValue:t.defaultValue!==""+i&&(t.defaultValue=""+i)}function dr(t,r,i,o){if(t=t.options,r){r={};for(var a=0;a<i.length;a++)r["$"+i[a]]=!0;for(i=0;i<t.length;i++)a=r.hasOwnProperty("$"+t[i].value),t[i].selected!==a&&(t[i].selected=a),a&&o&&(t[i].defaultSelected=!0)}else{i=""+_n(i),r=null;for(a=0;a<t.length;a++){if(t[a].value===i){t[a].selected=!0,o&&(t[a].defaultSelected=!0);return}r!==null||t[a].disabled||(r=t[a])}r!==null&&(r.selected=!0)}}function Ts(t,r){if(r.dangerouslySetInnerHTML!=null)throw Error(A(91));return ve({},r,{value:void 0,defaultValue:void 0,children:""+t._wrapperState.initialValue})}function ru(t,r){var i=r.value;if(i==null){if(i=r.children,r=r.defaultValue,i!=null){if(r!=null)throw Error(A(92));if(jr(i)){if(1<i.length)throw Error(A(93));i=i[0]}r=i}r==null&&(r=""),i=r}t._wrapperState={initialValue:_n(i)}}function ld(t,r){var i=_n(r.value),o=_n(r.defaultValue);i!=null&&(i=""+i,i!==t.value&&(t.value=i),r.defaultValue==null&&t.defaultValue!==i&&(t.defaultValue=i)),o!=null&&(t.defaultValue=""+o)}function iu(t){var r=t.textContent;r===t._wrapperState.initialValue&&r!==""&&r!==null&&(t.value=r)}function cd(t){switch(t){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function As(t,r){return t==null||t==="http://www.w3.org/1999/xhtml"?cd(r):t==="http://www.w3.org/2000/svg"&&r==="foreignObject"?"http://www.w3.org/1999/xhtml":t}function di(t,r){if(r){var i=t.firstChild;if(i&&i===t.lastChild&&i.nodeType===3){i.nodeValue=r;return}}t.textContent=r}function dd(t,r,i){return r==null||typeof r==="boolean"||r===""?"":i||typeof r!=="number"||r===0||ti.hasOwnProperty(t)&&ti[t]?(""+r).trim():r+"px"}function md(t,r){t=t.style;for(var i in r)if(r.hasOwnProperty(i)){var o=i.indexOf("--")===0,a=dd(i,r[i],o);i==="float"&&(i="cssFloat"),o?t.setProperty(i,a):t[i]=a}}function Is(t,r){if(r){if(tg[t]&&(r.children!=null||r.dangerouslySetInnerHTML!=null))throw Error(A(137,t));if(r.dangerouslySetInnerHTML!=null){if(r.children!=null)throw Error(A(60));if(typeof r.dangerouslySetInnerHTML!=="object"||!("__html"in r.dangerouslySetInnerHTML))throw Error(A(61))}if(r.style!=null&&typeof r.style!=="object")throw Error(A(62))}}function Ds(t,r){if(t.indexOf("-")===-1)return typeof r.is==="string";switch(t){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}function kl(t){return t=t.target||t.srcElement||window,t.correspondingUseElement&&(t=t.correspondingUseElement),t.nodeType===3?t.parentNode:t}function ou(t){if(t=ia(t)){if(typeof zs!=="function")throw Error(A(280));var r=t.stateNode;r&&(r=Dl(r),zs(t.stateNode,t.type,r))}}function ng(t){mr?pr?pr.push(t):pr=[t]:mr=t}function rg(){if(mr){var t=mr,r=pr;if(pr=mr=null,ou(t),r)for(t=0;t<r.length;t++)ou(r[t])}}function pd(t,r){return t(r)}function fd(){}function hd(t,r,i){if(as)return t(r,i);as=!0;try{return pd(t,r,i)}finally{if(as=!1,mr!==null||pr!==null)fd(),rg()}}function mi(t,r){var i=t.stateNode;if(i===null)return null;var o=Dl(i);if(o===null)return null;i=o[r];e:switch(r){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(o=!o.disabled)||(t=t.type,o=!(t==="button"||t==="input"||t==="select"||t==="textarea")),t=!o;break e;default:t=!1}if(t)return null;if(i&&typeof i!=="function")throw Error(A(231,r,typeof i));return i}function ig(t,r,i,o,a,s,l,c,u){var d=Array.prototype.slice.call(arguments,3);try{r.apply(i,d)}catch(f){this.onError(f)}}function ag(t,r,i,o,a,s,l,c,u){ni=!1,To=null,ig.apply(og,arguments)}function sg(t,r,i,o,a,s,l,c,u){if(ag.apply(this,arguments),ni){if(ni){var d=To;ni=!1,To=null}else throw Error(A(198));Ao||(Ao=!0,Fs=d)}}function $n(t){var r=t,i=t;if(t.alternate)for(;r.return;)r=r.return;else{t=r;do r=t,(r.flags&4098)!==0&&(i=r.return),t=r.return;while(t)}return r.tag===3?i:null}function gd(t){if(t.tag===13){var r=t.memoizedState;if(r===null&&(t=t.alternate,t!==null&&(r=t.memoizedState)),r!==null)return r.dehydrated}return null}function au(t){if($n(t)!==t)throw Error(A(188))}function lg(t){var r=t.alternate;if(!r){if(r=$n(t),r===null)throw Error(A(188));return r!==t?null:t}for(var i=t,o=r;;){var a=i.return;if(a===null)break;var s=a.alternate;if(s===null){if(o=a.return,o!==null){i=o;continue}break}if(a.child===s.child){for(s=a.child;s;){if(s===i)return au(a),t;if(s===o)return au(a),r;s=s.sibling}throw Error(A(188))}if(i.return!==o.return)i=a,o=s;else{for(var l=!1,c=a.child;c;){if(c===i){l=!0,i=a,o=s;break}if(c===o){l=!0,o=a,i=s;break}c=c.sibling}if(!l){for(c=s.child;c;){if(c===i){l=!0,i=s,o=a;break}if(c===o){l=!0,o=s,i=a;break}c=c.sibling}if(!l)throw Error(A(189))}}if(i.alternate!==o)throw Error(A(190))}if(i.tag!==3)throw Error(A(188));return i.stateNode.current===i?t:r}function cg(t){return t=lg(t),t!==null?_d(t):null}function _d(t){if(t.tag===5||t.tag===6)return t;for(t=t.child;t!==null;){var r=_d(t);if(r!==null)return r;t=t.sibling}return null}function fg(t){if(It&&typeof It.onCommitFiberRoot==="function")try{It.onCommitFiberRoot(ea,t,void 0,(t.current.flags&128)===128)}catch(r){}}function _g(t){return t>>>=0,t===0?32:31-(hg(t)/gg|0)|0}function Gr(t){switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return t&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return t}}function Do(t,r){var i=t.pendingLanes;if(i===0)return 0;var o=0,a=t.suspendedLanes,s=t.pingedLanes,l=i&268435455;if(l!==0){var c=l&~a;c!==0?o=Gr(c):(s&=l,s!==0&&(o=Gr(s)))}else l=i&~a,l!==0?o=Gr(l):s!==0&&(o=Gr(s));if(o===0)return 0;if(r!==0&&r!==o&&(r&a)===0&&(a=o&-o,s=r&-r,a>=s||a===16&&(s&4194240)!==0))return r;if((o&4)!==0&&(o|=i&16),r=t.entangledLanes,r!==0)for(t=t.entanglements,r&=o;0<r;)i=31-Nt(r),a=1<<i,o|=t[i],r&=~a;return o}function yg(t,r){switch(t){case 1:case 2:case 4:return r+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return r+5000;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function vg(t,r){for(var{suspendedLanes:i,pingedLanes:o,expirationTimes:a,pendingLanes:s}=t;0<s;){var l=31-Nt(s),c=1<<l,u=a[l];if(u===-1){if((c&i)===0||(c&o)!==0)a[l]=yg(c,r)}else u<=r&&(t.expiredLanes|=c);s&=~c}}function Vs(t){return t=t.pendingLanes&-1073741825,t!==0?t:t&1073741824?1073741824:0}function xd(){var t=so;return so<<=1,(so&4194240)===0&&(so=64),t}function ss(t){for(var r=[],i=0;31>i;i++)r.push(t);return r}function Ni(t,r,i){t.pendingLanes|=r,r!==536870912&&(t.suspendedLanes=0,t.pingedLanes=0),t=t.eventTimes,r=31-Nt(r),t[r]=i}function Sg(t,r){var i=t.pendingLanes&~r;t.pendingLanes=r,t.suspendedLanes=0,t.pingedLanes=0,t.expiredLanes&=r,t.mutableReadLanes&=r,t.entangledLanes&=r,r=t.entanglements;var o=t.eventTimes;for(t=t.expirationTimes;0<i;){var a=31-Nt(i),s=1<<a;r[a]=0,o[a]=-1,t[a]=-1,i&=~s}}function Nl(t,r){var i=t.entangledLanes|=r;for(t=t.entanglements;i;){var o=31-Nt(i),a=1<<o;a&r|t[o]&r&&(t[o]|=r),i&=~a}}function bd(t){return t&=-t,1<t?4<t?(t&268435455)!==0?16:536870912:4:1}function lu(t,r){switch(t){case"focusin":case"focusout":cn=null;break;case"dragenter":case"dragleave":un=null;break;case"mouseover":case"mouseout":dn=null;break;case"pointerover":case"pointerout":pi.delete(r.pointerId);break;case"gotpointercapture":case"lostpointercapture":fi.delete(r.pointerId)}}function Fr(t,r,i,o,a,s){if(t===null||t.nativeEvent!==s)return t={blockedOn:r,domEventName:i,eventSystemFlags:o,nativeEvent:s,targetContainers:[a]},r!==null&&(r=ia(r),r!==null&&El(r)),t;return t.eventSystemFlags|=o,r=t.targetContainers,a!==null&&r.indexOf(a)===-1&&r.push(a),t}function bg(t,r,i,o,a){switch(r){case"focusin":return cn=Fr(cn,t,r,i,o,a),!0;case"dragenter":return un=Fr(un,t,r,i,o,a),!0;case"mouseover":return dn=Fr(dn,t,r,i,o,a),!0;case"pointerover":var s=a.pointerId;return pi.set(s,Fr(pi.get(s)||null,t,r,i,o,a)),!0;case"gotpointercapture":return s=a.pointerId,fi.set(s,Fr(fi.get(s)||null,t,r,i,o,a)),!0}return!1}function Ed(t){var r=Tn(t.target);if(r!==null){var i=$n(r);if(i!==null){if(r=i.tag,r===13){if(r=gd(i),r!==null){t.blockedOn=r,Nd(t.priority,function(){kd(i)});return}}else if(r===3&&i.stateNode.current.memoizedState.isDehydrated){t.blockedOn=i.tag===3?i.stateNode.containerInfo:null;return}}}t.blockedOn=null}function So(t){if(t.blockedOn!==null)return!1;for(var r=t.targetContainers;0<r.length;){var i=$s(t.domEventName,t.eventSystemFlags,r[0],t.nativeEvent);if(i===null){i=t.nativeEvent;var o=new i.constructor(i.type,i);Os=o,i.target.dispatchEvent(o),Os=null}else return r=ia(i),r!==null&&El(r),t.blockedOn=i,!1;r.shift()}return!0}function cu(t,r,i){So(t)&&i.delete(r)}function wg(){Ws=!1,cn!==null&&So(cn)&&(cn=null),un!==null&&So(un)&&(un=null),dn!==null&&So(dn)&&(dn=null),pi.forEach(cu),fi.forEach(cu)}function Vr(t,r){t.blockedOn===r&&(t.blockedOn=null,Ws||(Ws=!0,ge.unstable_scheduleCallback(ge.unstable_NormalPriority,wg)))}function hi(t){function r(a){return Vr(a,t)}if(0<co.length){Vr(co[0],t);for(var i=1;i<co.length;i++){var o=co[i];o.blockedOn===t&&(o.blockedOn=null)}}cn!==null&&Vr(cn,t),un!==null&&Vr(un,t),dn!==null&&Vr(dn,t),pi.forEach(r),fi.forEach(r);for(i=0;i<on.length;i++)o=on[i],o.blockedOn===t&&(o.blockedOn=null);for(;0<on.length&&(i=on[0],i.blockedOn===null);)Ed(i),i.blockedOn===null&&on.shift()}function kg(t,r,i,o){var a=ce,s=fr.transition;fr.transition=null;try{ce=1,Ll(t,r,i,o)}finally{ce=a,fr.transition=s}}function Cg(t,r,i,o){var a=ce,s=fr.transition;fr.transition=null;try{ce=4,Ll(t,r,i,o)}finally{ce=a,fr.transition=s}}function Ll(t,r,i,o){if(Oo){var a=$s(t,r,i,o);if(a===null)ps(t,r,o,zo,i),lu(t,o);else if(bg(a,t,r,i,o))o.stopPropagation();else if(lu(t,o),r&4&&-1<xg.indexOf(t)){for(;a!==null;){var s=ia(a);if(s!==null&&wd(s),s=$s(t,r,i,o),s===null&&ps(t,r,o,zo,i),s===a)break;a=s}a!==null&&o.stopPropagation()}else ps(t,r,o,null,i)}}function $s(t,r,i,o){if(zo=null,t=kl(o),t=Tn(t),t!==null)if(r=$n(t),r===null)t=null;else if(i=r.tag,i===13){if(t=gd(r),t!==null)return t;t=null}else if(i===3){if(r.stateNode.current.memoizedState.isDehydrated)return r.tag===3?r.stateNode.containerInfo:null;t=null}else r!==t&&(t=null);return zo=t,null}function Ld(t){switch(t){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(mg()){case Cl:return 1;case vd:return 4;case Io:case pg:return 16;case Sd:return 536870912;default:return 16}default:return 16}}function Md(){if(xo)return xo;var t,r=Ml,i=r.length,o,a="value"in sn?sn.value:sn.textContent,s=a.length;for(t=0;t<i&&r[t]===a[t];t++);var l=i-t;for(o=1;o<=l&&r[i-o]===a[s-o];o++);return xo=a.slice(t,1<o?1-o:void 0)}function bo(t){var r=t.keyCode;return"charCode"in t?(t=t.charCode,t===0&&r===13&&(t=13)):t=r,t===10&&(t=13),32<=t||t===13?t:0}function uo(){return!0}function uu(){return!1}function st(t){function r(i,o,a,s,l){this._reactName=i,this._targetInst=a,this.type=o,this.nativeEvent=s,this.target=l,this.currentTarget=null;for(var c in t)t.hasOwnProperty(c)&&(i=t[c],this[c]=i?i(s):s[c]);return this.isDefaultPrevented=(s.defaultPrevented!=null?s.defaultPrevented:s.returnValue===!1)?uo:uu,this.isPropagationStopped=uu,this}return ve(r.prototype,{preventDefault:function(){this.defaultPrevented=!0;var i=this.nativeEvent;i&&(i.preventDefault?i.preventDefault():typeof i.returnValue!=="unknown"&&(i.returnValue=!1),this.isDefaultPrevented=uo)},stopPropagation:function(){var i=this.nativeEvent;i&&(i.stopPropagation?i.stopPropagation():typeof i.cancelBubble!=="unknown"&&(i.cancelBubble=!0),this.isPropagationStopped=uo)},persist:function(){},isPersistent:uo}),r}function Bg(t){var r=this.nativeEvent;return r.getModifierState?r.getModifierState(t):(t=zg[t])?!!r[t]:!1}function Pl(){return Bg}function Pd(t,r){switch(t){case"keyup":return Gg.indexOf(r.keyCode)!==-1;case"keydown":return r.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Td(t){return t=t.detail,typeof t==="object"&&"data"in t?t.data:null}function Qg(t,r){switch(t){case"compositionend":return Td(r);case"keypress":if(r.which!==32)return null;return hu=!0,fu;case"textInput":return t=r.data,t===fu&&hu?null:t;default:return null}}function Zg(t,r){if(nr)return t==="compositionend"||!Tl&&Pd(t,r)?(t=Md(),xo=Ml=sn=null,nr=!1,t):null;switch(t){case"paste":return null;case"keypress":if(!(r.ctrlKey||r.altKey||r.metaKey)||r.ctrlKey&&r.altKey){if(r.char&&1<r.char.length)return r.char;if(r.which)return String.fromCharCode(r.which)}return null;case"compositionend":return Rd&&r.locale!=="ko"?null:r.data;default:return null}}function gu(t){var r=t&&t.nodeName&&t.nodeName.toLowerCase();return r==="input"?!!qg[t.type]:r==="textarea"?!0:!1}function Ad(t,r,i,o){ng(o),r=Bo(r,"onChange"),0<r.length&&(i=new Rl("onChange","change",null,i,o),t.push({event:i,listeners:r}))}function Jg(t){Yd(t,0)}function na(t){var r=ei(t);if(ad(r))return t}function e_(t,r){if(t==="change")return r}function _u(){ii&&(ii.detachEvent("onpropertychange",Dd),gi=ii=null)}function Dd(t){if(t.propertyName==="value"&&na(gi)){var r=[];Ad(r,gi,t,kl(t)),hd(Jg,r)}}function t_(t,r,i){t==="focusin"?(_u(),ii=r,gi=i,ii.attachEvent("onpropertychange",Dd)):t==="focusout"&&_u()}function n_(t){if(t==="selectionchange"||t==="keyup"||t==="keydown")return na(gi)}function r_(t,r){if(t==="click")return na(r)}function i_(t,r){if(t==="input"||t==="change")return na(r)}function o_(t,r){return t===r&&(t!==0||1/t===1/r)||t!==t&&r!==r}function _i(t,r){if(Lt(t,r))return!0;if(typeof t!=="object"||t===null||typeof r!=="object"||r===null)return!1;var i=Object.keys(t),o=Object.keys(r);if(i.length!==o.length)return!1;for(o=0;o<i.length;o++){var a=i[o];if(!ks.call(r,a)||!Lt(t[a],r[a]))return!1}return!0}function yu(t){for(;t&&t.firstChild;)t=t.firstChild;return t}function vu(t,r){var i=yu(t);t=0;for(var o;i;){if(i.nodeType===3){if(o=t+i.textContent.length,t<=r&&o>=r)return{node:i,offset:r-t};t=o}e:{for(;i;){if(i.nextSibling){i=i.nextSibling;break e}i=i.parentNode}i=void 0}i=yu(i)}}function Od(t,r){return t&&r?t===r?!0:t&&t.nodeType===3?!1:r&&r.nodeType===3?Od(t,r.parentNode):("contains"in t)?t.contains(r):t.compareDocumentPosition?!!(t.compareDocumentPosition(r)&16):!1:!1}function zd(){for(var t=window,r=Po();r instanceof t.HTMLIFrameElement;){try{var i=typeof r.contentWindow.location.href==="string"}catch(o){i=!1}if(i)t=r.contentWindow;else break;r=Po(t.document)}return r}function Al(t){var r=t&&t.nodeName&&t.nodeName.toLowerCase();return r&&(r==="input"&&(t.type==="text"||t.type==="search"||t.type==="tel"||t.type==="url"||t.type==="password")||r==="textarea"||t.contentEditable==="true")}function a_(t){var r=zd(),i=t.focusedElem,o=t.selectionRange;if(r!==i&&i&&i.ownerDocument&&Od(i.ownerDocument.documentElement,i)){if(o!==null&&Al(i)){if(r=o.start,t=o.end,t===void 0&&(t=r),"selectionStart"in i)i.selectionStart=r,i.selectionEnd=Math.min(t,i.value.length);else if(t=(r=i.ownerDocument||document)&&r.defaultView||window,t.getSelection){t=t.getSelection();var a=i.textContent.length,s=Math.min(o.start,a);o=o.end===void 0?s:Math.min(o.end,a),!t.extend&&s>o&&(a=o,o=s,s=a),a=vu(i,s);var l=vu(i,o);a&&l&&(t.rangeCount!==1||t.anchorNode!==a.node||t.anchorOffset!==a.offset||t.focusNode!==l.node||t.focusOffset!==l.offset)&&(r=r.createRange(),r.setStart(a.node,a.offset),t.removeAllRanges(),s>o?(t.addRange(r),t.extend(l.node,l.offset)):(r.setEnd(l.node,l.offset),t.addRange(r)))}}r=[];for(t=i;t=t.parentNode;)t.nodeType===1&&r.push({element:t,left:t.scrollLeft,top:t.scrollTop});typeof i.focus==="function"&&i.focus();for(i=0;i<r.length;i++)t=r[i],t.element.scrollLeft=t.left,t.element.scrollTop=t.top}}function Su(t,r,i){var o=i.window===i?i.document:i.nodeType===9?i:i.ownerDocument;Ys||rr==null||rr!==Po(o)||(o=rr,("selectionStart"in o)&&Al(o)?o={start:o.selectionStart,end:o.selectionEnd}:(o=(o.ownerDocument&&o.ownerDocument.defaultView||window).getSelection(),o={anchorNode:o.anchorNode,anchorOffset:o.anchorOffset,focusNode:o.focusNode,focusOffset:o.focusOffset}),oi&&_i(oi,o)||(oi=o,o=Bo(Hs,"onSelect"),0<o.length&&(r=new Rl("onSelect","select",null,r,i),t.push({event:r,listeners:o}),r.target=rr)))}function mo(t,r){var i={};return i[t.toLowerCase()]=r.toLowerCase(),i["Webkit"+t]="webkit"+r,i["Moz"+t]="moz"+r,i}function ra(t){if(ds[t])return ds[t];if(!ir[t])return t;var r=ir[t],i;for(i in r)if(r.hasOwnProperty(i)&&i in Bd)return ds[t]=r[i];return t}function vn(t,r){Hd.set(t,r),Wn(r,[t])}function bu(t,r,i){var o=t.type||"unknown-event";t.currentTarget=i,sg(o,r,void 0,t),t.currentTarget=null}function Yd(t,r){r=(r&4)!==0;for(var i=0;i<t.length;i++){var o=t[i],a=o.event;o=o.listeners;e:{var s=void 0;if(r)for(var l=o.length-1;0<=l;l--){var c=o[l],u=c.instance,d=c.currentTarget;if(c=c.listener,u!==s&&a.isPropagationStopped())break e;bu(a,c,d),s=u}else for(l=0;l<o.length;l++){if(c=o[l],u=c.instance,d=c.currentTarget,c=c.listener,u!==s&&a.isPropagationStopped())break e;bu(a,c,d),s=u}}}if(Ao)throw t=Fs,Ao=!1,Fs=null,t}function pe(t,r){var i=r[Zs];i===void 0&&(i=r[Zs]=new Set);var o=t+"__bubble";i.has(o)||(Ud(r,t,2,!1),i.add(o))}function ms(t,r,i){var o=0;r&&(o|=4),Ud(i,t,o,r)}function Il(t){if(!t[po]){t[po]=!0,td.forEach(function(i){i!=="selectionchange"&&(l_.has(i)||ms(i,!1,t),ms(i,!0,t))});var r=t.nodeType===9?t:t.ownerDocument;r===null||r[po]||(r[po]=!0,ms("selectionchange",!1,r))}}function Ud(t,r,i,o){switch(Ld(r)){case 1:var a=kg;break;case 4:a=Cg;break;default:a=Ll}i=a.bind(null,r,i,t),a=void 0,!Bs||r!=="touchstart"&&r!=="touchmove"&&r!=="wheel"||(a=!0),o?a!==void 0?t.addEventListener(r,i,{capture:!0,passive:a}):t.addEventListener(r,i,!0):a!==void 0?t.addEventListener(r,i,{passive:a}):t.addEventListener(r,i,!1)}function ps(t,r,i,o,a){var s=o;if((r&1)===0&&(r&2)===0&&o!==null)e:for(;;){if(o===null)return;var l=o.tag;if(l===3||l===4){var c=o.stateNode.containerInfo;if(c===a||c.nodeType===8&&c.parentNode===a)break;if(l===4)for(l=o.return;l!==null;){var u=l.tag;if(u===3||u===4){if(u=l.stateNode.containerInfo,u===a||u.nodeType===8&&u.parentNode===a)return}l=l.return}for(;c!==null;){if(l=Tn(c),l===null)return;if(u=l.tag,u===5||u===6){o=s=l;continue e}c=c.parentNode}}o=o.return}hd(function(){var d=s,f=kl(i),g=[];e:{var _=Hd.get(t);if(_!==void 0){var x=Rl,b=t;switch(t){case"keypress":if(bo(i)===0)break e;case"keydown":case"keyup":x=Vg;break;case"focusin":b="focus",x=us;break;case"focusout":b="blur",x=us;break;case"beforeblur":case"afterblur":x=us;break;case"click":if(i.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":x=du;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":x=Lg;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":x=Hg;break;case Fd:case Vd:case Wd:x=Pg;break;case $d:x=Ug;break;case"scroll":x=Ng;break;case"wheel":x=jg;break;case"copy":case"cut":case"paste":x=Ag;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":x=pu}var w=(r&4)!==0,P=!w&&t==="scroll",y=w?_!==null?_+"Capture":null:_;w=[];for(var p=d,h;p!==null;){h=p;var v=h.stateNode;if(h.tag===5&&v!==null&&(h=v,y!==null&&(v=mi(p,y),v!=null&&w.push(yi(p,v,h)))),P)break;p=p.return}0<w.length&&(_=new x(_,b,null,i,f),g.push({event:_,listeners:w}))}}if((r&7)===0){e:{if(_=t==="mouseover"||t==="pointerover",x=t==="mouseout"||t==="pointerout",_&&i!==Os&&(b=i.relatedTarget||i.fromElement)&&(Tn(b)||b[Nr]))break e;if(x||_){if(_=f.window===f?f:(_=f.ownerDocument)?_.defaultView||_.parentWindow:window,x){if(b=i.relatedTarget||i.toElement,x=d,b=b?Tn(b):null,b!==null&&(P=$n(b),b!==P||b.tag!==5&&b.tag!==6))b=null}else x=null,b=d;if(x!==b){if(w=du,v="onMouseLeave",y="onMouseEnter",p="mouse",t==="pointerout"||t==="pointerover")w=pu,v="onPointerLeave",y="onPointerEnter",p="pointer";if(P=x==null?_:ei(x),h=b==null?_:ei(b),_=new w(v,p+"leave",x,i,f),_.target=P,_.relatedTarget=h,v=null,Tn(f)===d&&(w=new w(y,p+"enter",b,i,f),w.target=h,w.relatedTarget=P,v=w),P=v,x&&b)t:{w=x,y=b,p=0;for(h=w;h;h=Jn(h))p++;h=0;for(v=y;v;v=Jn(v))h++;for(;0<p-h;)w=Jn(w),p--;for(;0<h-p;)y=Jn(y),h--;for(;p--;){if(w===y||y!==null&&w===y.alternate)break t;w=Jn(w),y=Jn(y)}w=null}else w=null;x!==null&&wu(g,_,x,w,!1),b!==null&&P!==null&&wu(g,P,b,w,!0)}}}e:{if(_=d?ei(d):window,x=_.nodeName&&_.nodeName.toLowerCase(),x==="select"||x==="input"&&_.type==="file")var k=e_;else if(gu(_))if(Id)k=i_;else{k=n_;var C=t_}else(x=_.nodeName)&&x.toLowerCase()==="input"&&(_.type==="checkbox"||_.type==="radio")&&(k=r_);if(k&&(k=k(t,d))){Ad(g,k,i,f);break e}C&&C(t,_,d),t==="focusout"&&(C=_._wrapperState)&&C.controlled&&_.type==="number"&&Ps(_,"number",_.value)}switch(C=d?ei(d):window,t){case"focusin":if(gu(C)||C.contentEditable==="true")rr=C,Hs=d,oi=null;break;case"focusout":oi=Hs=rr=null;break;case"mousedown":Ys=!0;break;case"contextmenu":case"mouseup":case"dragend":Ys=!1,Su(g,i,f);break;case"selectionchange":if(s_)break;case"keydown":case"keyup":Su(g,i,f)}var R;if(Tl)e:{switch(t){case"compositionstart":var L="onCompositionStart";break e;case"compositionend":L="onCompositionEnd";break e;case"compositionupdate":L="onCompositionUpdate";break e}L=void 0}else nr?Pd(t,i)&&(L="onCompositionEnd"):t==="keydown"&&i.keyCode===229&&(L="onCompositionStart");if(L&&(Rd&&i.locale!=="ko"&&(nr||L!=="onCompositionStart"?L==="onCompositionEnd"&&nr&&(R=Md()):(sn=f,Ml=("value"in sn)?sn.value:sn.textContent,nr=!0)),C=Bo(d,L),0<C.length&&(L=new mu(L,t,null,i,f),g.push({event:L,listeners:C}),R?L.data=R:(R=Td(i),R!==null&&(L.data=R)))),R=Kg?Qg(t,i):Zg(t,i))d=Bo(d,"onBeforeInput"),0<d.length&&(f=new mu("onBeforeInput","beforeinput",null,i,f),g.push({event:f,listeners:d}),f.data=R)}Yd(g,r)})}function yi(t,r,i){return{instance:t,listener:r,currentTarget:i}}function Bo(t,r){for(var i=r+"Capture",o=[];t!==null;){var a=t,s=a.stateNode;a.tag===5&&s!==null&&(a=s,s=mi(t,i),s!=null&&o.unshift(yi(t,s,a)),s=mi(t,r),s!=null&&o.push(yi(t,s,a))),t=t.return}return o}function Jn(t){if(t===null)return null;do t=t.return;while(t&&t.tag!==5);return t?t:null}function wu(t,r,i,o,a){for(var s=r._reactName,l=[];i!==null&&i!==o;){var c=i,u=c.alternate,d=c.stateNode;if(u!==null&&u===o)break;c.tag===5&&d!==null&&(c=d,a?(u=mi(i,s),u!=null&&l.unshift(yi(i,u,c))):a||(u=mi(i,s),u!=null&&l.push(yi(i,u,c)))),i=i.return}l.length!==0&&t.push({event:r,listeners:l})}function ku(t){return(typeof t==="string"?t:""+t).replace(c_,`
+`).replace(u_,"")}function fo(t,r,i){if(r=ku(r),ku(t)!==r&&i)throw Error(A(425))}function Fo(){}function Ks(t,r){return t==="textarea"||t==="noscript"||typeof r.children==="string"||typeof r.children==="number"||typeof r.dangerouslySetInnerHTML==="object"&&r.dangerouslySetInnerHTML!==null&&r.dangerouslySetInnerHTML.__html!=null}function p_(t){setTimeout(function(){throw t})}function fs(t,r){var i=r,o=0;do{var a=i.nextSibling;if(t.removeChild(i),a&&a.nodeType===8)if(i=a.data,i==="/$"){if(o===0){t.removeChild(a),hi(r);return}o--}else i!=="$"&&i!=="$?"&&i!=="$!"||o++;i=a}while(i);hi(r)}function mn(t){for(;t!=null;t=t.nextSibling){var r=t.nodeType;if(r===1||r===3)break;if(r===8){if(r=t.data,r==="$"||r==="$!"||r==="$?")break;if(r==="/$")return null}}return t}function Nu(t){t=t.previousSibling;for(var r=0;t;){if(t.nodeType===8){var i=t.data;if(i==="$"||i==="$!"||i==="$?"){if(r===0)return t;r--}else i==="/$"&&r++}t=t.previousSibling}return null}function Tn(t){var r=t[At];if(r)return r;for(var i=t.parentNode;i;){if(r=i[Nr]||i[At]){if(i=r.alternate,r.child!==null||i!==null&&i.child!==null)for(t=Nu(t);t!==null;){if(i=t[At])return i;t=Nu(t)}return r}t=i,i=t.parentNode}return null}function ia(t){return t=t[At]||t[Nr],!t||t.tag!==5&&t.tag!==6&&t.tag!==13&&t.tag!==3?null:t}function ei(t){if(t.tag===5||t.tag===6)return t.stateNode;throw Error(A(33))}function Dl(t){return t[vi]||null}function Sn(t){return{current:t}}function fe(t){0>or||(t.current=qs[or],qs[or]=null,or--)}function de(t,r){or++,qs[or]=t.current,t.current=r}function yr(t,r){var i=t.type.contextTypes;if(!i)return yn;var o=t.stateNode;if(o&&o.__reactInternalMemoizedUnmaskedChildContext===r)return o.__reactInternalMemoizedMaskedChildContext;var a={},s;for(s in i)a[s]=r[s];return o&&(t=t.stateNode,t.__reactInternalMemoizedUnmaskedChildContext=r,t.__reactInternalMemoizedMaskedChildContext=a),a}function et(t){return t=t.childContextTypes,t!==null&&t!==void 0}function Vo(){fe(Je),fe(He)}function Eu(t,r,i){if(He.current!==yn)throw Error(A(168));de(He,r),de(Je,i)}function Xd(t,r,i){var o=t.stateNode;if(r=r.childContextTypes,typeof o.getChildContext!=="function")return i;o=o.getChildContext();for(var a in o)if(!(a in r))throw Error(A(108,qh(t)||"Unknown",a));return ve({},i,o)}function Wo(t){return t=(t=t.stateNode)&&t.__reactInternalMemoizedMergedChildContext||yn,zn=He.current,de(He,t),de(Je,Je.current),!0}function Lu(t,r,i){var o=t.stateNode;if(!o)throw Error(A(169));i?(t=Xd(t,r,zn),o.__reactInternalMemoizedMergedChildContext=t,fe(Je),fe(He),de(He,t)):fe(Je),de(Je,i)}function jd(t){$t===null?$t=[t]:$t.push(t)}function g_(t){oa=!0,jd(t)}function xn(){if(!hs&&$t!==null){hs=!0;var t=0,r=ce;try{var i=$t;for(ce=1;t<i.length;t++){var o=i[t];do o=o(!0);while(o!==null)}$t=null,oa=!1}catch(a){throw $t!==null&&($t=$t.slice(t+1)),yd(Cl,xn),a}finally{ce=r,hs=!1}}return null}function Rn(t,r){ar[sr++]=Ho,ar[sr++]=$o,$o=t,Ho=r}function Gd(t,r,i){pt[ft++]=Ht,pt[ft++]=Yt,pt[ft++]=Bn,Bn=t;var o=Ht;t=Yt;var a=32-Nt(o)-1;o&=~(1<<a),i+=1;var s=32-Nt(r)+a;if(30<s){var l=a-a%5;s=(o&(1<<l)-1).toString(32),o>>=l,a-=l,Ht=1<<32-Nt(r)+a|i<<a|o,Yt=s+t}else Ht=1<<s|i<<a|o,Yt=t}function Ol(t){t.return!==null&&(Rn(t,1),Gd(t,1,0))}function zl(t){for(;t===$o;)$o=ar[--sr],ar[sr]=null,Ho=ar[--sr],ar[sr]=null;for(;t===Bn;)Bn=pt[--ft],pt[ft]=null,Yt=pt[--ft],pt[ft]=null,Ht=pt[--ft],pt[ft]=null}function Kd(t,r){var i=ht(5,null,null,0);i.elementType="DELETED",i.stateNode=r,i.return=t,r=t.deletions,r===null?(t.deletions=[i],t.flags|=16):r.push(i)}function Mu(t,r){switch(t.tag){case 5:var i=t.type;return r=r.nodeType!==1||i.toLowerCase()!==r.nodeName.toLowerCase()?null:r,r!==null?(t.stateNode=r,at=t,ot=mn(r.firstChild),!0):!1;case 6:return r=t.pendingProps===""||r.nodeType!==3?null:r,r!==null?(t.stateNode=r,at=t,ot=null,!0):!1;case 13:return r=r.nodeType!==8?null:r,r!==null?(i=Bn!==null?{id:Ht,overflow:Yt}:null,t.memoizedState={dehydrated:r,treeContext:i,retryLane:1073741824},i=ht(18,null,null,0),i.stateNode=r,i.return=t,t.child=i,at=t,ot=null,!0):!1;default:return!1}}function Js(t){return(t.mode&1)!==0&&(t.flags&128)===0}function el(t){if(he){var r=ot;if(r){var i=r;if(!Mu(t,r)){if(Js(t))throw Error(A(418));r=mn(i.nextSibling);var o=at;r&&Mu(t,r)?Kd(o,i):(t.flags=t.flags&-4097|2,he=!1,at=t)}}else{if(Js(t))throw Error(A(418));t.flags=t.flags&-4097|2,he=!1,at=t}}}function Ru(t){for(t=t.return;t!==null&&t.tag!==5&&t.tag!==3&&t.tag!==13;)t=t.return;at=t}function ho(t){if(t!==at)return!1;if(!he)return Ru(t),he=!0,!1;var r;if((r=t.tag!==3)&&!(r=t.tag!==5)&&(r=t.type,r=r!=="head"&&r!=="body"&&!Ks(t.type,t.memoizedProps)),r&&(r=ot)){if(Js(t))throw Qd(),Error(A(418));for(;r;)Kd(t,r),r=mn(r.nextSibling)}if(Ru(t),t.tag===13){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(A(317));e:{t=t.nextSibling;for(r=0;t;){if(t.nodeType===8){var i=t.data;if(i==="/$"){if(r===0){ot=mn(t.nextSibling);break e}r--}else i!=="$"&&i!=="$!"&&i!=="$?"||r++}t=t.nextSibling}ot=null}}else ot=at?mn(t.stateNode.nextSibling):null;return!0}function Qd(){for(var t=ot;t;)t=mn(t.nextSibling)}function vr(){ot=at=null,he=!1}function Bl(t){Ct===null?Ct=[t]:Ct.push(t)}function $r(t,r,i){if(t=i.ref,t!==null&&typeof t!=="function"&&typeof t!=="object"){if(i._owner){if(i=i._owner,i){if(i.tag!==1)throw Error(A(309));var o=i.stateNode}if(!o)throw Error(A(147,t));var a=o,s=""+t;if(r!==null&&r.ref!==null&&typeof r.ref==="function"&&r.ref._stringRef===s)return r.ref;return r=function(l){var c=a.refs;l===null?delete c[s]:c[s]=l},r._stringRef=s,r}if(typeof t!=="string")throw Error(A(284));if(!i._owner)throw Error(A(290,t))}return t}function go(t,r){throw t=Object.prototype.toString.call(r),Error(A(31,t==="[object Object]"?"object with keys {"+Object.keys(r).join(", ")+"}":t))}function Pu(t){var r=t._init;return r(t._payload)}function Zd(t){function r(y,p){if(t){var h=y.deletions;h===null?(y.deletions=[p],y.flags|=16):h.push(p)}}function i(y,p){if(!t)return null;for(;p!==null;)r(y,p),p=p.sibling;return null}function o(y,p){for(y=new Map;p!==null;)p.key!==null?y.set(p.key,p):y.set(p.index,p),p=p.sibling;return y}function a(y,p){return y=gn(y,p),y.index=0,y.sibling=null,y}function s(y,p,h){if(y.index=h,!t)return y.flags|=1048576,p;if(h=y.alternate,h!==null)return h=h.index,h<p?(y.flags|=2,p):h;return y.flags|=2,p}function l(y){return t&&y.alternate===null&&(y.flags|=2),y}function c(y,p,h,v){if(p===null||p.tag!==6)return p=bs(h,y.mode,v),p.return=y,p;return p=a(p,h),p.return=y,p}function u(y,p,h,v){var k=h.type;if(k===tr)return f(y,p,h.props.children,v,h.key);if(p!==null&&(p.elementType===k||typeof k==="object"&&k!==null&&k.$$typeof===nn&&Pu(k)===p.type))return v=a(p,h.props),v.ref=$r(y,p,h),v.return=y,v;return v=Ro(h.type,h.key,h.props,null,y.mode,v),v.ref=$r(y,p,h),v.return=y,v}function d(y,p,h,v){if(p===null||p.tag!==4||p.stateNode.containerInfo!==h.containerInfo||p.stateNode.implementation!==h.implementation)return p=ws(h,y.mode,v),p.return=y,p;return p=a(p,h.children||[]),p.return=y,p}function f(y,p,h,v,k){if(p===null||p.tag!==7)return p=On(h,y.mode,v,k),p.return=y,p;return p=a(p,h),p.return=y,p}function g(y,p,h){if(typeof p==="string"&&p!==""||typeof p==="number")return p=bs(""+p,y.mode,h),p.return=y,p;if(typeof p==="object"&&p!==null){switch(p.$$typeof){case io:return h=Ro(p.type,p.key,p.props,null,y.mode,h),h.ref=$r(y,null,p),h.return=y,h;case Ur:return p=ws(p,y.mode,h),p.return=y,p;case nn:var v=p._init;return g(y,v(p._payload),h)}if(jr(p)||Br(p))return p=On(p,y.mode,h,null),p.return=y,p;go(y,p)}return null}function _(y,p,h,v){var k=p!==null?p.key:null;if(typeof h==="string"&&h!==""||typeof h==="number")return k!==null?null:c(y,p,""+h,v);if(typeof h==="object"&&h!==null){switch(h.$$typeof){case io:return h.key===k?u(y,p,h,v):null;case Ur:return h.key===k?d(y,p,h,v):null;case nn:return k=h._init,_(y,p,k(h._payload),v)}if(jr(h)||Br(h))return k!==null?null:f(y,p,h,v,null);go(y,h)}return null}function x(y,p,h,v,k){if(typeof v==="string"&&v!==""||typeof v==="number")return y=y.get(h)||null,c(p,y,""+v,k);if(typeof v==="object"&&v!==null){switch(v.$$typeof){case io:return y=y.get(v.key===null?h:v.key)||null,u(p,y,v,k);case Ur:return y=y.get(v.key===null?h:v.key)||null,d(p,y,v,k);case nn:var C=v._init;return x(y,p,h,C(v._payload),k)}if(jr(v)||Br(v))return y=y.get(h)||null,f(p,y,v,k,null);go(p,v)}return null}function b(y,p,h,v){for(var k=null,C=null,R=p,L=p=0,B=null;R!==null&&L<h.length;L++){R.index>L?(B=R,R=null):B=R.sibling;var D=_(y,R,h[L],v);if(D===null){R===null&&(R=B);break}t&&R&&D.alternate===null&&r(y,R),p=s(D,p,L),C===null?k=D:C.sibling=D,C=D,R=B}if(L===h.length)return i(y,R),he&&Rn(y,L),k;if(R===null){for(;L<h.length;L++)R=g(y,h[L],v),R!==null&&(p=s(R,p,L),C===null?k=R:C.sibling=R,C=R);return he&&Rn(y,L),k}for(R=o(y,R);L<h.length;L++)B=x(R,y,L,h[L],v),B!==null&&(t&&B.alternate!==null&&R.delete(B.key===null?L:B.key),p=s(B,p,L),C===null?k=B:C.sibling=B,C=B);return t&&R.forEach(function(ie){return r(y,ie)}),he&&Rn(y,L),k}function w(y,p,h,v){var k=Br(h);if(typeof k!=="function")throw Error(A(150));if(h=k.call(h),h==null)throw Error(A(151));for(var C=k=null,R=p,L=p=0,B=null,D=h.next();R!==null&&!D.done;L++,D=h.next()){R.index>L?(B=R,R=null):B=R.sibling;var ie=_(y,R,D.value,v);if(ie===null){R===null&&(R=B);break}t&&R&&ie.alternate===null&&r(y,R),p=s(ie,p,L),C===null?k=ie:C.sibling=ie,C=ie,R=B}if(D.done)return i(y,R),he&&Rn(y,L),k;if(R===null){for(;!D.done;L++,D=h.next())D=g(y,D.value,v),D!==null&&(p=s(D,p,L),C===null?k=D:C.sibling=D,C=D);return he&&Rn(y,L),k}for(R=o(y,R);!D.done;L++,D=h.next())D=x(R,y,L,D.value,v),D!==null&&(t&&D.alternate!==null&&R.delete(D.key===null?L:D.key),p=s(D,p,L),C===null?k=D:C.sibling=D,C=D);return t&&R.forEach(function(X){return r(y,X)}),he&&Rn(y,L),k}function P(y,p,h,v){if(typeof h==="object"&&h!==null&&h.type===tr&&h.key===null&&(h=h.props.children),typeof h==="object"&&h!==null){switch(h.$$typeof){case io:e:{for(var k=h.key,C=p;C!==null;){if(C.key===k){if(k=h.type,k===tr){if(C.tag===7){i(y,C.sibling),p=a(C,h.props.children),p.return=y,y=p;break e}}else if(C.elementType===k||typeof k==="object"&&k!==null&&k.$$typeof===nn&&Pu(k)===C.type){i(y,C.sibling),p=a(C,h.props),p.ref=$r(y,C,h),p.return=y,y=p;break e}i(y,C);break}else r(y,C);C=C.sibling}h.type===tr?(p=On(h.props.children,y.mode,v,h.key),p.return=y,y=p):(v=Ro(h.type,h.key,h.props,null,y.mode,v),v.ref=$r(y,p,h),v.return=y,y=v)}return l(y);case Ur:e:{for(C=h.key;p!==null;){if(p.key===C)if(p.tag===4&&p.stateNode.containerInfo===h.containerInfo&&p.stateNode.implementation===h.implementation){i(y,p.sibling),p=a(p,h.children||[]),p.return=y,y=p;break e}else{i(y,p);break}else r(y,p);p=p.sibling}p=ws(h,y.mode,v),p.return=y,y=p}return l(y);case nn:return C=h._init,P(y,p,C(h._payload),v)}if(jr(h))return b(y,p,h,v);if(Br(h))return w(y,p,h,v);go(y,h)}return typeof h==="string"&&h!==""||typeof h==="number"?(h=""+h,p!==null&&p.tag===6?(i(y,p.sibling),p=a(p,h),p.return=y,y=p):(i(y,p),p=bs(h,y.mode,v),p.return=y,y=p),l(y)):i(y,p)}return P}function Vl(){Fl=lr=Uo=null}function Wl(t){var r=Yo.current;fe(Yo),t._currentValue=r}function tl(t,r,i){for(;t!==null;){var o=t.alternate;if((t.childLanes&r)!==r?(t.childLanes|=r,o!==null&&(o.childLanes|=r)):o!==null&&(o.childLanes&r)!==r&&(o.childLanes|=r),t===i)break;t=t.return}}function hr(t,r){Uo=t,Fl=lr=null,t=t.dependencies,t!==null&&t.firstContext!==null&&((t.lanes&r)!==0&&(qe=!0),t.firstContext=null)}function _t(t){var r=t._currentValue;if(Fl!==t)if(t={context:t,memoizedValue:r,next:null},lr===null){if(Uo===null)throw Error(A(308));lr=t,Uo.dependencies={lanes:0,firstContext:t}}else lr=lr.next=t;return r}function $l(t){An===null?An=[t]:An.push(t)}function Jd(t,r,i,o){var a=r.interleaved;return a===null?(i.next=i,$l(r)):(i.next=a.next,a.next=i),r.interleaved=i,jt(t,o)}function jt(t,r){t.lanes|=r;var i=t.alternate;i!==null&&(i.lanes|=r),i=t;for(t=t.return;t!==null;)t.childLanes|=r,i=t.alternate,i!==null&&(i.childLanes|=r),i=t,t=t.return;return i.tag===3?i.stateNode:null}function Hl(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function em(t,r){t=t.updateQueue,r.updateQueue===t&&(r.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,effects:t.effects})}function Ut(t,r){return{eventTime:t,lane:r,tag:0,payload:null,callback:null,next:null}}function pn(t,r,i){var o=t.updateQueue;if(o===null)return null;if(o=o.shared,(re&2)!==0){var a=o.pending;return a===null?r.next=r:(r.next=a.next,a.next=r),o.pending=r,jt(t,i)}return a=o.interleaved,a===null?(r.next=r,$l(o)):(r.next=a.next,a.next=r),o.interleaved=r,jt(t,i)}function ko(t,r,i){if(r=r.updateQueue,r!==null&&(r=r.shared,(i&4194240)!==0)){var o=r.lanes;o&=t.pendingLanes,i|=o,r.lanes=i,Nl(t,i)}}function Tu(t,r){var i=t.updateQueue,o=t.alternate;if(o!==null&&(o=o.updateQueue,i===o)){var a=null,s=null;if(i=i.firstBaseUpdate,i!==null){do{var l={eventTime:i.eventTime,lane:i.lane,tag:i.tag,payload:i.payload,callback:i.callback,next:null};s===null?a=s=l:s=s.next=l,i=i.next}while(i!==null);s===null?a=s=r:s=s.next=r}else a=s=r;i={baseState:o.baseState,firstBaseUpdate:a,lastBaseUpdate:s,shared:o.shared,effects:o.effects},t.updateQueue=i;return}t=i.lastBaseUpdate,t===null?i.firstBaseUpdate=r:t.next=r,i.lastBaseUpdate=r}function Xo(t,r,i,o){var a=t.updateQueue;rn=!1;var s=a.firstBaseUpdate,l=a.lastBaseUpdate,c=a.shared.pending;if(c!==null){a.shared.pending=null;var u=c,d=u.next;u.next=null,l===null?s=d:l.next=d,l=u;var f=t.alternate;f!==null&&(f=f.updateQueue,c=f.lastBaseUpdate,c!==l&&(c===null?f.firstBaseUpdate=d:c.next=d,f.lastBaseUpdate=u))}if(s!==null){var g=a.baseState;l=0,f=d=u=null,c=s;do{var _=c.lane,x=c.eventTime;if((o&_)===_){f!==null&&(f=f.next={eventTime:x,lane:0,tag:c.tag,payload:c.payload,callback:c.callback,next:null});e:{var b=t,w=c;switch(_=r,x=i,w.tag){case 1:if(b=w.payload,typeof b==="function"){g=b.call(x,g,_);break e}g=b;break e;case 3:b.flags=b.flags&-65537|128;case 0:if(b=w.payload,_=typeof b==="function"?b.call(x,g,_):b,_===null||_===void 0)break e;g=ve({},g,_);break e;case 2:rn=!0}}c.callback!==null&&c.lane!==0&&(t.flags|=64,_=a.effects,_===null?a.effects=[c]:_.push(c))}else x={eventTime:x,lane:_,tag:c.tag,payload:c.payload,callback:c.callback,next:null},f===null?(d=f=x,u=g):f=f.next=x,l|=_;if(c=c.next,c===null)if(c=a.shared.pending,c===null)break;else _=c,c=_.next,_.next=null,a.lastBaseUpdate=_,a.shared.pending=null}while(1);if(f===null&&(u=g),a.baseState=u,a.firstBaseUpdate=d,a.lastBaseUpdate=f,r=a.shared.interleaved,r!==null){a=r;do l|=a.lane,a=a.next;while(a!==r)}else s===null&&(a.shared.lanes=0);Vn|=l,t.lanes=l,t.memoizedState=g}}function Au(t,r,i){if(t=r.effects,r.effects=null,t!==null)for(r=0;r<t.length;r++){var o=t[r],a=o.callback;if(a!==null){if(o.callback=null,o=i,typeof a!=="function")throw Error(A(191,a));a.call(o)}}}function In(t){if(t===Li)throw Error(A(174));return t}function Yl(t,r){switch(de(xi,r),de(Si,t),de(Dt,Li),t=r.nodeType,t){case 9:case 11:r=(r=r.documentElement)?r.namespaceURI:As(null,"");break;default:t=t===8?r.parentNode:r,r=t.namespaceURI||null,t=t.tagName,r=As(r,t)}fe(Dt),de(Dt,r)}function xr(){fe(Dt),fe(Si),fe(xi)}function tm(t){In(xi.current);var r=In(Dt.current),i=As(r,t.type);r!==i&&(de(Si,t),de(Dt,i))}function Ul(t){Si.current===t&&(fe(Dt),fe(Si))}function jo(t){for(var r=t;r!==null;){if(r.tag===13){var i=r.memoizedState;if(i!==null&&(i=i.dehydrated,i===null||i.data==="$?"||i.data==="$!"))return r}else if(r.tag===19&&r.memoizedProps.revealOrder!==void 0){if((r.flags&128)!==0)return r}else if(r.child!==null){r.child.return=r,r=r.child;continue}if(r===t)break;for(;r.sibling===null;){if(r.return===null||r.return===t)return null;r=r.return}r.sibling.return=r.return,r=r.sibling}return null}function Xl(){for(var t=0;t<gs.length;t++)gs[t]._workInProgressVersionPrimary=null;gs.length=0}function Ve(){throw Error(A(321))}function jl(t,r){if(r===null)return!1;for(var i=0;i<r.length&&i<t.length;i++)if(!Lt(t[i],r[i]))return!1;return!0}function Gl(t,r,i,o,a,s){if(Fn=s,ye=r,r.memoizedState=null,r.updateQueue=null,r.lanes=0,Co.current=t===null||t.memoizedState===null?b_:w_,t=i(o,a),ai){s=0;do{if(ai=!1,bi=0,25<=s)throw Error(A(301));s+=1,Re=Ne=null,r.updateQueue=null,Co.current=k_,t=i(o,a)}while(ai)}if(Co.current=Ko,r=Ne!==null&&Ne.next!==null,Fn=0,Re=Ne=ye=null,Go=!1,r)throw Error(A(300));return t}function Kl(){var t=bi!==0;return bi=0,t}function Tt(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Re===null?ye.memoizedState=Re=t:Re=Re.next=t,Re}function yt(){if(Ne===null){var t=ye.alternate;t=t!==null?t.memoizedState:null}else t=Ne.next;var r=Re===null?ye.memoizedState:Re.next;if(r!==null)Re=r,Ne=t;else{if(t===null)throw Error(A(310));Ne=t,t={memoizedState:Ne.memoizedState,baseState:Ne.baseState,baseQueue:Ne.baseQueue,queue:Ne.queue,next:null},Re===null?ye.memoizedState=Re=t:Re=Re.next=t}return Re}function wi(t,r){return typeof r==="function"?r(t):r}function ys(t){var r=yt(),i=r.queue;if(i===null)throw Error(A(311));i.lastRenderedReducer=t;var o=Ne,a=o.baseQueue,s=i.pending;if(s!==null){if(a!==null){var l=a.next;a.next=s.next,s.next=l}o.baseQueue=a=s,i.pending=null}if(a!==null){s=a.next,o=o.baseState;var c=l=null,u=null,d=s;do{var f=d.lane;if((Fn&f)===f)u!==null&&(u=u.next={lane:0,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null}),o=d.hasEagerState?d.eagerState:t(o,d.action);else{var g={lane:f,action:d.action,hasEagerState:d.hasEagerState,eagerState:d.eagerState,next:null};u===null?(c=u=g,l=o):u=u.next=g,ye.lanes|=f,Vn|=f}d=d.next}while(d!==null&&d!==s);u===null?l=o:u.next=c,Lt(o,r.memoizedState)||(qe=!0),r.memoizedState=o,r.baseState=l,r.baseQueue=u,i.lastRenderedState=o}if(t=i.interleaved,t!==null){a=t;do s=a.lane,ye.lanes|=s,Vn|=s,a=a.next;while(a!==t)}else a===null&&(i.lanes=0);return[r.memoizedState,i.dispatch]}function vs(t){var r=yt(),i=r.queue;if(i===null)throw Error(A(311));i.lastRenderedReducer=t;var{dispatch:o,pending:a}=i,s=r.memoizedState;if(a!==null){i.pending=null;var l=a=a.next;do s=t(s,l.action),l=l.next;while(l!==a);Lt(s,r.memoizedState)||(qe=!0),r.memoizedState=s,r.baseQueue===null&&(r.baseState=s),i.lastRenderedState=s}return[s,o]}function nm(){}function rm(t,r){var i=ye,o=yt(),a=r(),s=!Lt(o.memoizedState,a);if(s&&(o.memoizedState=a,qe=!0),o=o.queue,Ql(am.bind(null,i,o,t),[t]),o.getSnapshot!==r||s||Re!==null&&Re.memoizedState.tag&1){if(i.flags|=2048,ki(9,om.bind(null,i,o,a,r),void 0,null),Pe===null)throw Error(A(349));(Fn&30)!==0||im(i,r,a)}return a}function im(t,r,i){t.flags|=16384,t={getSnapshot:r,value:i},r=ye.updateQueue,r===null?(r={lastEffect:null,stores:null},ye.updateQueue=r,r.stores=[t]):(i=r.stores,i===null?r.stores=[t]:i.push(t))}function om(t,r,i,o){r.value=i,r.getSnapshot=o,sm(r)&&lm(t)}function am(t,r,i){return i(function(){sm(r)&&lm(t)})}function sm(t){var r=t.getSnapshot;t=t.value;try{var i=r();return!Lt(t,i)}catch(o){return!0}}function lm(t){var r=jt(t,1);r!==null&&Et(r,t,1,-1)}function Iu(t){var r=Tt();return typeof t==="function"&&(t=t()),r.memoizedState=r.baseState=t,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:wi,lastRenderedState:t},r.queue=t,t=t.dispatch=x_.bind(null,ye,t),[r.memoizedState,t]}function ki(t,r,i,o){return t={tag:t,create:r,destroy:i,deps:o,next:null},r=ye.updateQueue,r===null?(r={lastEffect:null,stores:null},ye.updateQueue=r,r.lastEffect=t.next=t):(i=r.lastEffect,i===null?r.lastEffect=t.next=t:(o=i.next,i.next=t,t.next=o,r.lastEffect=t)),t}function cm(){return yt().memoizedState}function No(t,r,i,o){var a=Tt();ye.flags|=t,a.memoizedState=ki(1|r,i,void 0,o===void 0?null:o)}function aa(t,r,i,o){var a=yt();o=o===void 0?null:o;var s=void 0;if(Ne!==null){var l=Ne.memoizedState;if(s=l.destroy,o!==null&&jl(o,l.deps)){a.memoizedState=ki(r,i,s,o);return}}ye.flags|=t,a.memoizedState=ki(1|r,i,s,o)}function Du(t,r){return No(8390656,8,t,r)}function Ql(t,r){return aa(2048,8,t,r)}function um(t,r){return aa(4,2,t,r)}function dm(t,r){return aa(4,4,t,r)}function mm(t,r){if(typeof r==="function")return t=t(),r(t),function(){r(null)};if(r!==null&&r!==void 0)return t=t(),r.current=t,function(){r.current=null}}function pm(t,r,i){return i=i!==null&&i!==void 0?i.concat([t]):null,aa(4,4,mm.bind(null,r,t),i)}function Zl(){}function fm(t,r){var i=yt();r=r===void 0?null:r;var o=i.memoizedState;if(o!==null&&r!==null&&jl(r,o[1]))return o[0];return i.memoizedState=[t,r],t}function hm(t,r){var i=yt();r=r===void 0?null:r;var o=i.memoizedState;if(o!==null&&r!==null&&jl(r,o[1]))return o[0];return t=t(),i.memoizedState=[t,r],t}function gm(t,r,i){if((Fn&21)===0)return t.baseState&&(t.baseState=!1,qe=!0),t.memoizedState=i;return Lt(i,r)||(i=xd(),ye.lanes|=i,Vn|=i,t.baseState=!0),r}function v_(t,r){var i=ce;ce=i!==0&&4>i?i:4,t(!0);var o=_s.transition;_s.transition={};try{t(!1),r()}finally{ce=i,_s.transition=o}}function _m(){return yt().memoizedState}function S_(t,r,i){var o=hn(t);if(i={lane:o,action:i,hasEagerState:!1,eagerState:null,next:null},ym(t))vm(r,i);else if(i=Jd(t,r,i,o),i!==null){var a=je();Et(i,t,o,a),Sm(i,r,o)}}function x_(t,r,i){var o=hn(t),a={lane:o,action:i,hasEagerState:!1,eagerState:null,next:null};if(ym(t))vm(r,a);else{var s=t.alternate;if(t.lanes===0&&(s===null||s.lanes===0)&&(s=r.lastRenderedReducer,s!==null))try{var l=r.lastRenderedState,c=s(l,i);if(a.hasEagerState=!0,a.eagerState=c,Lt(c,l)){var u=r.interleaved;u===null?(a.next=a,$l(r)):(a.next=u.next,u.next=a),r.interleaved=a;return}}catch(d){}finally{}i=Jd(t,r,a,o),i!==null&&(a=je(),Et(i,t,o,a),Sm(i,r,o))}}function ym(t){var r=t.alternate;return t===ye||r!==null&&r===ye}function vm(t,r){ai=Go=!0;var i=t.pending;i===null?r.next=r:(r.next=i.next,i.next=r),t.pending=r}function Sm(t,r,i){if((i&4194240)!==0){var o=r.lanes;o&=t.pendingLanes,i|=o,r.lanes=i,Nl(t,i)}}function wt(t,r){if(t&&t.defaultProps){r=ve({},r),t=t.defaultProps;for(var i in t)r[i]===void 0&&(r[i]=t[i]);return r}return r}function nl(t,r,i,o){r=t.memoizedState,i=i(o,r),i=i===null||i===void 0?r:ve({},r,i),t.memoizedState=i,t.lanes===0&&(t.updateQueue.baseState=i)}function Ou(t,r,i,o,a,s,l){return t=t.stateNode,typeof t.shouldComponentUpdate==="function"?t.shouldComponentUpdate(o,s,l):r.prototype&&r.prototype.isPureReactComponent?!_i(i,o)||!_i(a,s):!0}function xm(t,r,i){var o=!1,a=yn,s=r.contextType;return typeof s==="object"&&s!==null?s=_t(s):(a=et(r)?zn:He.current,o=r.contextTypes,s=(o=o!==null&&o!==void 0)?yr(t,a):yn),r=new r(i,s),t.memoizedState=r.state!==null&&r.state!==void 0?r.state:null,r.updater=sa,t.stateNode=r,r._reactInternals=t,o&&(t=t.stateNode,t.__reactInternalMemoizedUnmaskedChildContext=a,t.__reactInternalMemoizedMaskedChildContext=s),r}function zu(t,r,i,o){t=r.state,typeof r.componentWillReceiveProps==="function"&&r.componentWillReceiveProps(i,o),typeof r.UNSAFE_componentWillReceiveProps==="function"&&r.UNSAFE_componentWillReceiveProps(i,o),r.state!==t&&sa.enqueueReplaceState(r,r.state,null)}function rl(t,r,i,o){var a=t.stateNode;a.props=i,a.state=t.memoizedState,a.refs={},Hl(t);var s=r.contextType;typeof s==="object"&&s!==null?a.context=_t(s):(s=et(r)?zn:He.current,a.context=yr(t,s)),a.state=t.memoizedState,s=r.getDerivedStateFromProps,typeof s==="function"&&(nl(t,r,s,i),a.state=t.memoizedState),typeof r.getDerivedStateFromProps==="function"||typeof a.getSnapshotBeforeUpdate==="function"||typeof a.UNSAFE_componentWillMount!=="function"&&typeof a.componentWillMount!=="function"||(r=a.state,typeof a.componentWillMount==="function"&&a.componentWillMount(),typeof a.UNSAFE_componentWillMount==="function"&&a.UNSAFE_componentWillMount(),r!==a.state&&sa.enqueueReplaceState(a,a.state,null),Xo(t,i,a,o),a.state=t.memoizedState),typeof a.componentDidMount==="function"&&(t.flags|=4194308)}function br(t,r){try{var i="",o=r;do i+=Zh(o),o=o.return;while(o);var a=i}catch(s){a=`
+Error generating stack: `+s.message+`
+`+s.stack}return{value:t,source:r,stack:a,digest:null}}function Ss(t,r,i){return{value:t,source:null,stack:i!=null?i:null,digest:r!=null?r:null}}function il(t,r){try{console.error(r.value)}catch(i){setTimeout(function(){throw i})}}function bm(t,r,i){i=Ut(-1,i),i.tag=3,i.payload={element:null};var o=r.value;return i.callback=function(){Zo||(Zo=!0,fl=o),il(t,r)},i}function wm(t,r,i){i=Ut(-1,i),i.tag=3;var o=t.type.getDerivedStateFromError;if(typeof o==="function"){var a=r.value;i.payload=function(){return o(a)},i.callback=function(){il(t,r)}}var s=t.stateNode;return s!==null&&typeof s.componentDidCatch==="function"&&(i.callback=function(){il(t,r),typeof o!=="function"&&(fn===null?fn=new Set([this]):fn.add(this));var l=r.stack;this.componentDidCatch(r.value,{componentStack:l!==null?l:""})}),i}function Bu(t,r,i){var o=t.pingCache;if(o===null){o=t.pingCache=new C_;var a=new Set;o.set(r,a)}else a=o.get(r),a===void 0&&(a=new Set,o.set(r,a));a.has(i)||(a.add(i),t=V_.bind(null,t,r,i),r.then(t,t))}function Fu(t){do{var r;if(r=t.tag===13)r=t.memoizedState,r=r!==null?r.dehydrated!==null?!0:!1:!0;if(r)return t;t=t.return}while(t!==null);return null}function Vu(t,r,i,o,a){if((t.mode&1)===0)return t===r?t.flags|=65536:(t.flags|=128,i.flags|=131072,i.flags&=-52805,i.tag===1&&(i.alternate===null?i.tag=17:(r=Ut(-1,1),r.tag=2,pn(i,r,1))),i.lanes|=1),t;return t.flags|=65536,t.lanes=a,t}function Xe(t,r,i,o){r.child=t===null?qd(r,null,i,o):Sr(r,t.child,i,o)}function Wu(t,r,i,o,a){i=i.render;var s=r.ref;if(hr(r,a),o=Gl(t,r,i,o,s,a),i=Kl(),t!==null&&!qe)return r.updateQueue=t.updateQueue,r.flags&=-2053,t.lanes&=~a,Gt(t,r,a);return he&&i&&Ol(r),r.flags|=1,Xe(t,r,o,a),r.child}function $u(t,r,i,o,a){if(t===null){var s=i.type;if(typeof s==="function"&&!oc(s)&&s.defaultProps===void 0&&i.compare===null&&i.defaultProps===void 0)return r.tag=15,r.type=s,km(t,r,s,o,a);return t=Ro(i.type,null,o,r,r.mode,a),t.ref=r.ref,t.return=r,r.child=t}if(s=t.child,(t.lanes&a)===0){var l=s.memoizedProps;if(i=i.compare,i=i!==null?i:_i,i(l,o)&&t.ref===r.ref)return Gt(t,r,a)}return r.flags|=1,t=gn(s,o),t.ref=r.ref,t.return=r,r.child=t}function km(t,r,i,o,a){if(t!==null){var s=t.memoizedProps;if(_i(s,o)&&t.ref===r.ref)if(qe=!1,r.pendingProps=o=s,(t.lanes&a)!==0)(t.flags&131072)!==0&&(qe=!0);else return r.lanes=t.lanes,Gt(t,r,a)}return ol(t,r,i,o,a)}function Cm(t,r,i){var o=r.pendingProps,a=o.children,s=t!==null?t.memoizedState:null;if(o.mode==="hidden")if((r.mode&1)===0)r.memoizedState={baseLanes:0,cachePool:null,transitions:null},de(ur,it),it|=i;else{if((i&1073741824)===0)return t=s!==null?s.baseLanes|i:i,r.lanes=r.childLanes=1073741824,r.memoizedState={baseLanes:t,cachePool:null,transitions:null},r.updateQueue=null,de(ur,it),it|=t,null;r.memoizedState={baseLanes:0,cachePool:null,transitions:null},o=s!==null?s.baseLanes:i,de(ur,it),it|=o}else s!==null?(o=s.baseLanes|i,r.memoizedState=null):o=i,de(ur,it),it|=o;return Xe(t,r,a,i),r.child}function Nm(t,r){var i=r.ref;if(t===null&&i!==null||t!==null&&t.ref!==i)r.flags|=512,r.flags|=2097152}function ol(t,r,i,o,a){var s=et(i)?zn:He.current;if(s=yr(r,s),hr(r,a),i=Gl(t,r,i,o,s,a),o=Kl(),t!==null&&!qe)return r.updateQueue=t.updateQueue,r.flags&=-2053,t.lanes&=~a,Gt(t,r,a);return he&&o&&Ol(r),r.flags|=1,Xe(t,r,i,a),r.child}function Hu(t,r,i,o,a){if(et(i)){var s=!0;Wo(r)}else s=!1;if(hr(r,a),r.stateNode===null)Eo(t,r),xm(r,i,o),rl(r,i,o,a),o=!0;else if(t===null){var{stateNode:l,memoizedProps:c}=r;l.props=c;var u=l.context,d=i.contextType;typeof d==="object"&&d!==null?d=_t(d):(d=et(i)?zn:He.current,d=yr(r,d));var f=i.getDerivedStateFromProps,g=typeof f==="function"||typeof l.getSnapshotBeforeUpdate==="function";g||typeof l.UNSAFE_componentWillReceiveProps!=="function"&&typeof l.componentWillReceiveProps!=="function"||(c!==o||u!==d)&&zu(r,l,o,d),rn=!1;var _=r.memoizedState;l.state=_,Xo(r,o,l,a),u=r.memoizedState,c!==o||_!==u||Je.current||rn?(typeof f==="function"&&(nl(r,i,f,o),u=r.memoizedState),(c=rn||Ou(r,i,c,o,_,u,d))?(g||typeof l.UNSAFE_componentWillMount!=="function"&&typeof l.componentWillMount!=="function"||(typeof l.componentWillMount==="function"&&l.componentWillMount(),typeof l.UNSAFE_componentWillMount==="function"&&l.UNSAFE_componentWillMount()),typeof l.componentDidMount==="function"&&(r.flags|=4194308)):(typeof l.componentDidMount==="function"&&(r.flags|=4194308),r.memoizedProps=o,r.memoizedState=u),l.props=o,l.state=u,l.context=d,o=c):(typeof l.componentDidMount==="function"&&(r.flags|=4194308),o=!1)}else{l=r.stateNode,em(t,r),c=r.memoizedProps,d=r.type===r.elementType?c:wt(r.type,c),l.props=d,g=r.pendingProps,_=l.context,u=i.contextType,typeof u==="object"&&u!==null?u=_t(u):(u=et(i)?zn:He.current,u=yr(r,u));var x=i.getDerivedStateFromProps;(f=typeof x==="function"||typeof l.getSnapshotBeforeUpdate==="function")||typeof l.UNSAFE_componentWillReceiveProps!=="function"&&typeof l.componentWillReceiveProps!=="function"||(c!==g||_!==u)&&zu(r,l,o,u),rn=!1,_=r.memoizedState,l.state=_,Xo(r,o,l,a);var b=r.memoizedState;c!==g||_!==b||Je.current||rn?(typeof x==="function"&&(nl(r,i,x,o),b=r.memoizedState),(d=rn||Ou(r,i,d,o,_,b,u)||!1)?(f||typeof l.UNSAFE_componentWillUpdate!=="function"&&typeof l.componentWillUpdate!=="function"||(typeof l.componentWillUpdate==="function"&&l.componentWillUpdate(o,b,u),typeof l.UNSAFE_componentWillUpdate==="function"&&l.UNSAFE_componentWillUpdate(o,b,u)),typeof l.componentDidUpdate==="function"&&(r.flags|=4),typeof l.getSnapshotBeforeUpdate==="function"&&(r.flags|=1024)):(typeof l.componentDidUpdate!=="function"||c===t.memoizedProps&&_===t.memoizedState||(r.flags|=4),typeof l.getSnapshotBeforeUpdate!=="function"||c===t.memoizedProps&&_===t.memoizedState||(r.flags|=1024),r.memoizedProps=o,r.memoizedState=b),l.props=o,l.state=b,l.context=u,o=d):(typeof l.componentDidUpdate!=="function"||c===t.memoizedProps&&_===t.memoizedState||(r.flags|=4),typeof l.getSnapshotBeforeUpdate!=="function"||c===t.memoizedProps&&_===t.memoizedState||(r.flags|=1024),o=!1)}return al(t,r,i,o,s,a)}function al(t,r,i,o,a,s){Nm(t,r);var l=(r.flags&128)!==0;if(!o&&!l)return a&&Lu(r,i,!1),Gt(t,r,s);o=r.stateNode,N_.current=r;var c=l&&typeof i.getDerivedStateFromError!=="function"?null:o.render();return r.flags|=1,t!==null&&l?(r.child=Sr(r,t.child,null,s),r.child=Sr(r,null,c,s)):Xe(t,r,c,s),r.memoizedState=o.state,a&&Lu(r,i,!0),r.child}function Em(t){var r=t.stateNode;r.pendingContext?Eu(t,r.pendingContext,r.pendingContext!==r.context):r.context&&Eu(t,r.context,!1),Yl(t,r.containerInfo)}function Yu(t,r,i,o,a){return vr(),Bl(a),r.flags|=256,Xe(t,r,i,o),r.child}function ll(t){return{baseLanes:t,cachePool:null,transitions:null}}function Lm(t,r,i){var o=r.pendingProps,a=_e.current,s=!1,l=(r.flags&128)!==0,c;if((c=l)||(c=t!==null&&t.memoizedState===null?!1:(a&2)!==0),c)s=!0,r.flags&=-129;else if(t===null||t.memoizedState!==null)a|=1;if(de(_e,a&1),t===null){if(el(r),t=r.memoizedState,t!==null&&(t=t.dehydrated,t!==null))return(r.mode&1)===0?r.lanes=1:t.data==="$!"?r.lanes=8:r.lanes=1073741824,null;return l=o.children,t=o.fallback,s?(o=r.mode,s=r.child,l={mode:"hidden",children:l},(o&1)===0&&s!==null?(s.childLanes=0,s.pendingProps=l):s=ua(l,o,0,null),t=On(t,o,i,null),s.return=r,t.return=r,s.sibling=t,r.child=s,r.child.memoizedState=ll(i),r.memoizedState=sl,t):ql(r,l)}if(a=t.memoizedState,a!==null&&(c=a.dehydrated,c!==null))return E_(t,r,l,o,c,a,i);if(s){s=o.fallback,l=r.mode,a=t.child,c=a.sibling;var u={mode:"hidden",children:o.children};return(l&1)===0&&r.child!==a?(o=r.child,o.childLanes=0,o.pendingProps=u,r.deletions=null):(o=gn(a,u),o.subtreeFlags=a.subtreeFlags&14680064),c!==null?s=gn(c,s):(s=On(s,l,i,null),s.flags|=2),s.return=r,o.return=r,o.sibling=s,r.child=o,o=s,s=r.child,l=t.child.memoizedState,l=l===null?ll(i):{baseLanes:l.baseLanes|i,cachePool:null,transitions:l.transitions},s.memoizedState=l,s.childLanes=t.childLanes&~i,r.memoizedState=sl,o}return s=t.child,t=s.sibling,o=gn(s,{mode:"visible",children:o.children}),(r.mode&1)===0&&(o.lanes=i),o.return=r,o.sibling=null,t!==null&&(i=r.deletions,i===null?(r.deletions=[t],r.flags|=16):i.push(t)),r.child=o,r.memoizedState=null,o}function ql(t,r){return r=ua({mode:"visible",children:r},t.mode,0,null),r.return=t,t.child=r}function _o(t,r,i,o){return o!==null&&Bl(o),Sr(r,t.child,null,i),t=ql(r,r.pendingProps.children),t.flags|=2,r.memoizedState=null,t}function E_(t,r,i,o,a,s,l){if(i){if(r.flags&256)return r.flags&=-257,o=Ss(Error(A(422))),_o(t,r,l,o);if(r.memoizedState!==null)return r.child=t.child,r.flags|=128,null;return s=o.fallback,a=r.mode,o=ua({mode:"visible",children:o.children},a,0,null),s=On(s,a,l,null),s.flags|=2,o.return=r,s.return=r,o.sibling=s,r.child=o,(r.mode&1)!==0&&Sr(r,t.child,null,l),r.child.memoizedState=ll(l),r.memoizedState=sl,s}if((r.mode&1)===0)return _o(t,r,l,null);if(a.data==="$!"){if(o=a.nextSibling&&a.nextSibling.dataset,o)var c=o.dgst;return o=c,s=Error(A(419)),o=Ss(s,o,void 0),_o(t,r,l,o)}if(c=(l&t.childLanes)!==0,qe||c){if(o=Pe,o!==null){switch(l&-l){case 4:a=2;break;case 16:a=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:a=32;break;case 536870912:a=268435456;break;default:a=0}a=(a&(o.suspendedLanes|l))!==0?0:a,a!==0&&a!==s.retryLane&&(s.retryLane=a,jt(t,a),Et(o,t,a,-1))}return ic(),o=Ss(Error(A(421))),_o(t,r,l,o)}if(a.data==="$?")return r.flags|=128,r.child=t.child,r=W_.bind(null,t),a._reactRetry=r,null;return t=s.treeContext,ot=mn(a.nextSibling),at=r,he=!0,Ct=null,t!==null&&(pt[ft++]=Ht,pt[ft++]=Yt,pt[ft++]=Bn,Ht=t.id,Yt=t.overflow,Bn=r),r=ql(r,o.children),r.flags|=4096,r}function Uu(t,r,i){t.lanes|=r;var o=t.alternate;o!==null&&(o.lanes|=r),tl(t.return,r,i)}function xs(t,r,i,o,a){var s=t.memoizedState;s===null?t.memoizedState={isBackwards:r,rendering:null,renderingStartTime:0,last:o,tail:i,tailMode:a}:(s.isBackwards=r,s.rendering=null,s.renderingStartTime=0,s.last=o,s.tail=i,s.tailMode=a)}function Mm(t,r,i){var o=r.pendingProps,a=o.revealOrder,s=o.tail;if(Xe(t,r,o.children,i),o=_e.current,(o&2)!==0)o=o&1|2,r.flags|=128;else{if(t!==null&&(t.flags&128)!==0)e:for(t=r.child;t!==null;){if(t.tag===13)t.memoizedState!==null&&Uu(t,i,r);else if(t.tag===19)Uu(t,i,r);else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===r)break e;for(;t.sibling===null;){if(t.return===null||t.return===r)break e;t=t.return}t.sibling.return=t.return,t=t.sibling}o&=1}if(de(_e,o),(r.mode&1)===0)r.memoizedState=null;else switch(a){case"forwards":i=r.child;for(a=null;i!==null;)t=i.alternate,t!==null&&jo(t)===null&&(a=i),i=i.sibling;i=a,i===null?(a=r.child,r.child=null):(a=i.sibling,i.sibling=null),xs(r,!1,a,i,s);break;case"backwards":i=null,a=r.child;for(r.child=null;a!==null;){if(t=a.alternate,t!==null&&jo(t)===null){r.child=a;break}t=a.sibling,a.sibling=i,i=a,a=t}xs(r,!0,i,null,s);break;case"together":xs(r,!1,null,null,void 0);break;default:r.memoizedState=null}return r.child}function Eo(t,r){(r.mode&1)===0&&t!==null&&(t.alternate=null,r.alternate=null,r.flags|=2)}function Gt(t,r,i){if(t!==null&&(r.dependencies=t.dependencies),Vn|=r.lanes,(i&r.childLanes)===0)return null;if(t!==null&&r.child!==t.child)throw Error(A(153));if(r.child!==null){t=r.child,i=gn(t,t.pendingProps),r.child=i;for(i.return=r;t.sibling!==null;)t=t.sibling,i=i.sibling=gn(t,t.pendingProps),i.return=r;i.sibling=null}return r.child}function L_(t,r,i){switch(r.tag){case 3:Em(r),vr();break;case 5:tm(r);break;case 1:et(r.type)&&Wo(r);break;case 4:Yl(r,r.stateNode.containerInfo);break;case 10:var o=r.type._context,a=r.memoizedProps.value;de(Yo,o._currentValue),o._currentValue=a;break;case 13:if(o=r.memoizedState,o!==null){if(o.dehydrated!==null)return de(_e,_e.current&1),r.flags|=128,null;if((i&r.child.childLanes)!==0)return Lm(t,r,i);return de(_e,_e.current&1),t=Gt(t,r,i),t!==null?t.sibling:null}de(_e,_e.current&1);break;case 19:if(o=(i&r.childLanes)!==0,(t.flags&128)!==0){if(o)return Mm(t,r,i);r.flags|=128}if(a=r.memoizedState,a!==null&&(a.rendering=null,a.tail=null,a.lastEffect=null),de(_e,_e.current),o)break;else return null;case 22:case 23:return r.lanes=0,Cm(t,r,i)}return Gt(t,r,i)}function Hr(t,r){if(!he)switch(t.tailMode){case"hidden":r=t.tail;for(var i=null;r!==null;)r.alternate!==null&&(i=r),r=r.sibling;i===null?t.tail=null:i.sibling=null;break;case"collapsed":i=t.tail;for(var o=null;i!==null;)i.alternate!==null&&(o=i),i=i.sibling;o===null?r||t.tail===null?t.tail=null:t.tail.sibling=null:o.sibling=null}}function We(t){var r=t.alternate!==null&&t.alternate.child===t.child,i=0,o=0;if(r)for(var a=t.child;a!==null;)i|=a.lanes|a.childLanes,o|=a.subtreeFlags&14680064,o|=a.flags&14680064,a.return=t,a=a.sibling;else for(a=t.child;a!==null;)i|=a.lanes|a.childLanes,o|=a.subtreeFlags,o|=a.flags,a.return=t,a=a.sibling;return t.subtreeFlags|=o,t.childLanes=i,r}function M_(t,r,i){var o=r.pendingProps;switch(zl(r),r.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return We(r),null;case 1:return et(r.type)&&Vo(),We(r),null;case 3:if(o=r.stateNode,xr(),fe(Je),fe(He),Xl(),o.pendingContext&&(o.context=o.pendingContext,o.pendingContext=null),t===null||t.child===null)ho(r)?r.flags|=4:t===null||t.memoizedState.isDehydrated&&(r.flags&256)===0||(r.flags|=1024,Ct!==null&&(_l(Ct),Ct=null));return cl(t,r),We(r),null;case 5:Ul(r);var a=In(xi.current);if(i=r.type,t!==null&&r.stateNode!=null)Pm(t,r,i,o,a),t.ref!==r.ref&&(r.flags|=512,r.flags|=2097152);else{if(!o){if(r.stateNode===null)throw Error(A(166));return We(r),null}if(t=In(Dt.current),ho(r)){o=r.stateNode,i=r.type;var s=r.memoizedProps;switch(o[At]=r,o[vi]=s,t=(r.mode&1)!==0,i){case"dialog":pe("cancel",o),pe("close",o);break;case"iframe":case"object":case"embed":pe("load",o);break;case"video":case"audio":for(a=0;a<Jr.length;a++)pe(Jr[a],o);break;case"source":pe("error",o);break;case"img":case"image":case"link":pe("error",o),pe("load",o);break;case"details":pe("toggle",o);break;case"input":tu(o,s),pe("invalid",o);break;case"select":o._wrapperState={wasMultiple:!!s.multiple},pe("invalid",o);break;case"textarea":ru(o,s),pe("invalid",o)}Is(i,s),a=null;for(var l in s)if(s.hasOwnProperty(l)){var c=s[l];l==="children"?typeof c==="string"?o.textContent!==c&&(s.suppressHydrationWarning!==!0&&fo(o.textContent,c,t),a=["children",c]):typeof c==="number"&&o.textContent!==""+c&&(s.suppressHydrationWarning!==!0&&fo(o.textContent,c,t),a=["children",""+c]):ui.hasOwnProperty(l)&&c!=null&&l==="onScroll"&&pe("scroll",o)}switch(i){case"input":oo(o),nu(o,s,!0);break;case"textarea":oo(o),iu(o);break;case"select":case"option":break;default:typeof s.onClick==="function"&&(o.onclick=Fo)}o=a,r.updateQueue=o,o!==null&&(r.flags|=4)}else{l=a.nodeType===9?a:a.ownerDocument,t==="http://www.w3.org/1999/xhtml"&&(t=cd(i)),t==="http://www.w3.org/1999/xhtml"?i==="script"?(t=l.createElement("div"),t.innerHTML="<script></script>",t=t.removeChild(t.firstChild)):typeof o.is==="string"?t=l.createElement(i,{is:o.is}):(t=l.createElement(i),i==="select"&&(l=t,o.multiple?l.multiple=!0:o.size&&(l.size=o.size))):t=l.createElementNS(t,i),t[At]=r,t[vi]=o,Rm(t,r,!1,!1),r.stateNode=t;e:{switch(l=Ds(i,o),i){case"dialog":pe("cancel",t),pe("close",t),a=o;break;case"iframe":case"object":case"embed":pe("load",t),a=o;break;case"video":case"audio":for(a=0;a<Jr.length;a++)pe(Jr[a],t);a=o;break;case"source":pe("error",t),a=o;break;case"img":case"image":case"link":pe("error",t),pe("load",t),a=o;break;case"details":pe("toggle",t),a=o;break;case"input":tu(t,o),a=Ms(t,o),pe("invalid",t);break;case"option":a=o;break;case"select":t._wrapperState={wasMultiple:!!o.multiple},a=ve({},o,{value:void 0}),pe("invalid",t);break;case"textarea":ru(t,o),a=Ts(t,o),pe("invalid",t);break;default:a=o}Is(i,a),c=a;for(s in c)if(c.hasOwnProperty(s)){var u=c[s];s==="style"?md(t,u):s==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,u!=null&&ud(t,u)):s==="children"?typeof u==="string"?(i!=="textarea"||u!=="")&&di(t,u):typeof u==="number"&&di(t,""+u):s!=="suppressContentEditableWarning"&&s!=="suppressHydrationWarning"&&s!=="autoFocus"&&(ui.hasOwnProperty(s)?u!=null&&s==="onScroll"&&pe("scroll",t):u!=null&&Sl(t,s,u,l))}switch(i){case"input":oo(t),nu(t,o,!1);break;case"textarea":oo(t),iu(t);break;case"option":o.value!=null&&t.setAttribute("value",""+_n(o.value));break;case"select":t.multiple=!!o.multiple,s=o.value,s!=null?dr(t,!!o.multiple,s,!1):o.defaultValue!=null&&dr(t,!!o.multiple,o.defaultValue,!0);break;default:typeof a.onClick==="function"&&(t.onclick=Fo)}switch(i){case"button":case"input":case"select":case"textarea":o=!!o.autoFocus;break e;case"img":o=!0;break e;default:o=!1}}o&&(r.flags|=4)}r.ref!==null&&(r.flags|=512,r.flags|=2097152)}return We(r),null;case 6:if(t&&r.stateNode!=null)Tm(t,r,t.memoizedProps,o);else{if(typeof o!=="string"&&r.stateNode===null)throw Error(A(166));if(i=In(xi.current),In(Dt.current),ho(r)){if(o=r.stateNode,i=r.memoizedProps,o[At]=r,s=o.nodeValue!==i){if(t=at,t!==null)switch(t.tag){case 3:fo(o.nodeValue,i,(t.mode&1)!==0);break;case 5:t.memoizedProps.suppressHydrationWarning!==!0&&fo(o.nodeValue,i,(t.mode&1)!==0)}}s&&(r.flags|=4)}else o=(i.nodeType===9?i:i.ownerDocument).createTextNode(o),o[At]=r,r.stateNode=o}return We(r),null;case 13:if(fe(_e),o=r.memoizedState,t===null||t.memoizedState!==null&&t.memoizedState.dehydrated!==null){if(he&&ot!==null&&(r.mode&1)!==0&&(r.flags&128)===0)Qd(),vr(),r.flags|=98560,s=!1;else if(s=ho(r),o!==null&&o.dehydrated!==null){if(t===null){if(!s)throw Error(A(318));if(s=r.memoizedState,s=s!==null?s.dehydrated:null,!s)throw Error(A(317));s[At]=r}else vr(),(r.flags&128)===0&&(r.memoizedState=null),r.flags|=4;We(r),s=!1}else Ct!==null&&(_l(Ct),Ct=null),s=!0;if(!s)return r.flags&65536?r:null}if((r.flags&128)!==0)return r.lanes=i,r;return o=o!==null,o!==(t!==null&&t.memoizedState!==null)&&o&&(r.child.flags|=8192,(r.mode&1)!==0&&(t===null||(_e.current&1)!==0?Ee===0&&(Ee=3):ic())),r.updateQueue!==null&&(r.flags|=4),We(r),null;case 4:return xr(),cl(t,r),t===null&&Il(r.stateNode.containerInfo),We(r),null;case 10:return Wl(r.type._context),We(r),null;case 17:return et(r.type)&&Vo(),We(r),null;case 19:if(fe(_e),s=r.memoizedState,s===null)return We(r),null;if(o=(r.flags&128)!==0,l=s.rendering,l===null)if(o)Hr(s,!1);else{if(Ee!==0||t!==null&&(t.flags&128)!==0)for(t=r.child;t!==null;){if(l=jo(t),l!==null){r.flags|=128,Hr(s,!1),o=l.updateQueue,o!==null&&(r.updateQueue=o,r.flags|=4),r.subtreeFlags=0,o=i;for(i=r.child;i!==null;)s=i,t=o,s.flags&=14680066,l=s.alternate,l===null?(s.childLanes=0,s.lanes=t,s.child=null,s.subtreeFlags=0,s.memoizedProps=null,s.memoizedState=null,s.updateQueue=null,s.dependencies=null,s.stateNode=null):(s.childLanes=l.childLanes,s.lanes=l.lanes,s.child=l.child,s.subtreeFlags=0,s.deletions=null,s.memoizedProps=l.memoizedProps,s.memoizedState=l.memoizedState,s.updateQueue=l.updateQueue,s.type=l.type,t=l.dependencies,s.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),i=i.sibling;return de(_e,_e.current&1|2),r.child}t=t.sibling}s.tail!==null&&be()>wr&&(r.flags|=128,o=!0,Hr(s,!1),r.lanes=4194304)}else{if(!o)if(t=jo(l),t!==null){if(r.flags|=128,o=!0,i=t.updateQueue,i!==null&&(r.updateQueue=i,r.flags|=4),Hr(s,!0),s.tail===null&&s.tailMode==="hidden"&&!l.alternate&&!he)return We(r),null}else 2*be()-s.renderingStartTime>wr&&i!==1073741824&&(r.flags|=128,o=!0,Hr(s,!1),r.lanes=4194304);s.isBackwards?(l.sibling=r.child,r.child=l):(i=s.last,i!==null?i.sibling=l:r.child=l,s.last=l)}if(s.tail!==null)return r=s.tail,s.rendering=r,s.tail=r.sibling,s.renderingStartTime=be(),r.sibling=null,i=_e.current,de(_e,o?i&1|2:i&1),r;return We(r),null;case 22:case 23:return rc(),o=r.memoizedState!==null,t!==null&&t.memoizedState!==null!==o&&(r.flags|=8192),o&&(r.mode&1)!==0?(it&1073741824)!==0&&(We(r),r.subtreeFlags&6&&(r.flags|=8192)):We(r),null;case 24:return null;case 25:return null}throw Error(A(156,r.tag))}function R_(t,r){switch(zl(r),r.tag){case 1:return et(r.type)&&Vo(),t=r.flags,t&65536?(r.flags=t&-65537|128,r):null;case 3:return xr(),fe(Je),fe(He),Xl(),t=r.flags,(t&65536)!==0&&(t&128)===0?(r.flags=t&-65537|128,r):null;case 5:return Ul(r),null;case 13:if(fe(_e),t=r.memoizedState,t!==null&&t.dehydrated!==null){if(r.alternate===null)throw Error(A(340));vr()}return t=r.flags,t&65536?(r.flags=t&-65537|128,r):null;case 19:return fe(_e),null;case 4:return xr(),null;case 10:return Wl(r.type._context),null;case 22:case 23:return rc(),null;case 24:return null;default:return null}}function cr(t,r){var i=t.ref;if(i!==null)if(typeof i==="function")try{i(null)}catch(o){Se(t,r,o)}else i.current=null}function ul(t,r,i){try{i()}catch(o){Se(t,r,o)}}function T_(t,r){if(js=Oo,t=zd(),Al(t)){if("selectionStart"in t)var i={start:t.selectionStart,end:t.selectionEnd};else e:{i=(i=t.ownerDocument)&&i.defaultView||window;var o=i.getSelection&&i.getSelection();if(o&&o.rangeCount!==0){i=o.anchorNode;var a=o.anchorOffset,s=o.focusNode;o=o.focusOffset;try{i.nodeType,s.nodeType}catch(v){i=null;break e}var l=0,c=-1,u=-1,d=0,f=0,g=t,_=null;t:for(;;){for(var x;;){if(g!==i||a!==0&&g.nodeType!==3||(c=l+a),g!==s||o!==0&&g.nodeType!==3||(u=l+o),g.nodeType===3&&(l+=g.nodeValue.length),(x=g.firstChild)===null)break;_=g,g=x}for(;;){if(g===t)break t;if(_===i&&++d===a&&(c=l),_===s&&++f===o&&(u=l),(x=g.nextSibling)!==null)break;g=_,_=g.parentNode}g=x}i=c===-1||u===-1?null:{start:c,end:u}}else i=null}i=i||{start:0,end:0}}else i=null;Gs={focusedElem:t,selectionRange:i},Oo=!1;for(F=r;F!==null;)if(r=F,t=r.child,(r.subtreeFlags&1028)!==0&&t!==null)t.return=r,F=t;else for(;F!==null;){r=F;try{var b=r.alternate;if((r.flags&1024)!==0)switch(r.tag){case 0:case 11:case 15:break;case 1:if(b!==null){var w=b.memoizedProps,P=b.memoizedState,y=r.stateNode,p=y.getSnapshotBeforeUpdate(r.elementType===r.type?w:wt(r.type,w),P);y.__reactInternalSnapshotBeforeUpdate=p}break;case 3:var h=r.stateNode.containerInfo;h.nodeType===1?h.textContent="":h.nodeType===9&&h.documentElement&&h.removeChild(h.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(A(163))}}catch(v){Se(r,r.return,v)}if(t=r.sibling,t!==null){t.return=r.return,F=t;break}F=r.return}return b=Xu,Xu=!1,b}function si(t,r,i){var o=r.updateQueue;if(o=o!==null?o.lastEffect:null,o!==null){var a=o=o.next;do{if((a.tag&t)===t){var s=a.destroy;a.destroy=void 0,s!==void 0&&ul(r,i,s)}a=a.next}while(a!==o)}}function la(t,r){if(r=r.updateQueue,r=r!==null?r.lastEffect:null,r!==null){var i=r=r.next;do{if((i.tag&t)===t){var o=i.create;i.destroy=o()}i=i.next}while(i!==r)}}function dl(t){var r=t.ref;if(r!==null){var i=t.stateNode;switch(t.tag){case 5:t=i;break;default:t=i}typeof r==="function"?r(t):r.current=t}}function Am(t){var r=t.alternate;r!==null&&(t.alternate=null,Am(r)),t.child=null,t.deletions=null,t.sibling=null,t.tag===5&&(r=t.stateNode,r!==null&&(delete r[At],delete r[vi],delete r[Zs],delete r[f_],delete r[h_])),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}function Im(t){return t.tag===5||t.tag===3||t.tag===4}function ju(t){e:for(;;){for(;t.sibling===null;){if(t.return===null||Im(t.return))return null;t=t.return}t.sibling.return=t.return;for(t=t.sibling;t.tag!==5&&t.tag!==6&&t.tag!==18;){if(t.flags&2)continue e;if(t.child===null||t.tag===4)continue e;else t.child.return=t,t=t.child}if(!(t.flags&2))return t.stateNode}}function ml(t,r,i){var o=t.tag;if(o===5||o===6)t=t.stateNode,r?i.nodeType===8?i.parentNode.insertBefore(t,r):i.insertBefore(t,r):(i.nodeType===8?(r=i.parentNode,r.insertBefore(t,i)):(r=i,r.appendChild(t)),i=i._reactRootContainer,i!==null&&i!==void 0||r.onclick!==null||(r.onclick=Fo));else if(o!==4&&(t=t.child,t!==null))for(ml(t,r,i),t=t.sibling;t!==null;)ml(t,r,i),t=t.sibling}function pl(t,r,i){var o=t.tag;if(o===5||o===6)t=t.stateNode,r?i.insertBefore(t,r):i.appendChild(t);else if(o!==4&&(t=t.child,t!==null))for(pl(t,r,i),t=t.sibling;t!==null;)pl(t,r,i),t=t.sibling}function tn(t,r,i){for(i=i.child;i!==null;)Dm(t,r,i),i=i.sibling}function Dm(t,r,i){if(It&&typeof It.onCommitFiberUnmount==="function")try{It.onCommitFiberUnmount(ea,i)}catch(c){}switch(i.tag){case 5:$e||cr(i,r);case 6:var o=Ae,a=kt;Ae=null,tn(t,r,i),Ae=o,kt=a,Ae!==null&&(kt?(t=Ae,i=i.stateNode,t.nodeType===8?t.parentNode.removeChild(i):t.removeChild(i)):Ae.removeChild(i.stateNode));break;case 18:Ae!==null&&(kt?(t=Ae,i=i.stateNode,t.nodeType===8?fs(t.parentNode,i):t.nodeType===1&&fs(t,i),hi(t)):fs(Ae,i.stateNode));break;case 4:o=Ae,a=kt,Ae=i.stateNode.containerInfo,kt=!0,tn(t,r,i),Ae=o,kt=a;break;case 0:case 11:case 14:case 15:if(!$e&&(o=i.updateQueue,o!==null&&(o=o.lastEffect,o!==null))){a=o=o.next;do{var s=a,l=s.destroy;s=s.tag,l!==void 0&&((s&2)!==0?ul(i,r,l):(s&4)!==0&&ul(i,r,l)),a=a.next}while(a!==o)}tn(t,r,i);break;case 1:if(!$e&&(cr(i,r),o=i.stateNode,typeof o.componentWillUnmount==="function"))try{o.props=i.memoizedProps,o.state=i.memoizedState,o.componentWillUnmount()}catch(c){Se(i,r,c)}tn(t,r,i);break;case 21:tn(t,r,i);break;case 22:i.mode&1?($e=(o=$e)||i.memoizedState!==null,tn(t,r,i),$e=o):tn(t,r,i);break;default:tn(t,r,i)}}function Gu(t){var r=t.updateQueue;if(r!==null){t.updateQueue=null;var i=t.stateNode;i===null&&(i=t.stateNode=new P_),r.forEach(function(o){var a=$_.bind(null,t,o);i.has(o)||(i.add(o),o.then(a,a))})}}function bt(t,r){var i=r.deletions;if(i!==null)for(var o=0;o<i.length;o++){var a=i[o];try{var s=t,l=r,c=l;e:for(;c!==null;){switch(c.tag){case 5:Ae=c.stateNode,kt=!1;break e;case 3:Ae=c.stateNode.containerInfo,kt=!0;break e;case 4:Ae=c.stateNode.containerInfo,kt=!0;break e}c=c.return}if(Ae===null)throw Error(A(160));Dm(s,l,a),Ae=null,kt=!1;var u=a.alternate;u!==null&&(u.return=null),a.return=null}catch(d){Se(a,r,d)}}if(r.subtreeFlags&12854)for(r=r.child;r!==null;)Om(r,t),r=r.sibling}function Om(t,r){var{alternate:i,flags:o}=t;switch(t.tag){case 0:case 11:case 14:case 15:if(bt(r,t),Pt(t),o&4){try{si(3,t,t.return),la(3,t)}catch(w){Se(t,t.return,w)}try{si(5,t,t.return)}catch(w){Se(t,t.return,w)}}break;case 1:bt(r,t),Pt(t),o&512&&i!==null&&cr(i,i.return);break;case 5:if(bt(r,t),Pt(t),o&512&&i!==null&&cr(i,i.return),t.flags&32){var a=t.stateNode;try{di(a,"")}catch(w){Se(t,t.return,w)}}if(o&4&&(a=t.stateNode,a!=null)){var s=t.memoizedProps,l=i!==null?i.memoizedProps:s,{type:c,updateQueue:u}=t;if(t.updateQueue=null,u!==null)try{c==="input"&&s.type==="radio"&&s.name!=null&&sd(a,s),Ds(c,l);var d=Ds(c,s);for(l=0;l<u.length;l+=2){var f=u[l],g=u[l+1];f==="style"?md(a,g):f==="dangerouslySetInnerHTML"?ud(a,g):f==="children"?di(a,g):Sl(a,f,g,d)}switch(c){case"input":Rs(a,s);break;case"textarea":ld(a,s);break;case"select":var _=a._wrapperState.wasMultiple;a._wrapperState.wasMultiple=!!s.multiple;var x=s.value;x!=null?dr(a,!!s.multiple,x,!1):_!==!!s.multiple&&(s.defaultValue!=null?dr(a,!!s.multiple,s.defaultValue,!0):dr(a,!!s.multiple,s.multiple?[]:"",!1))}a[vi]=s}catch(w){Se(t,t.return,w)}}break;case 6:if(bt(r,t),Pt(t),o&4){if(t.stateNode===null)throw Error(A(162));a=t.stateNode,s=t.memoizedProps;try{a.nodeValue=s}catch(w){Se(t,t.return,w)}}break;case 3:if(bt(r,t),Pt(t),o&4&&i!==null&&i.memoizedState.isDehydrated)try{hi(r.containerInfo)}catch(w){Se(t,t.return,w)}break;case 4:bt(r,t),Pt(t);break;case 13:bt(r,t),Pt(t),a=t.child,a.flags&8192&&(s=a.memoizedState!==null,a.stateNode.isHidden=s,!s||a.alternate!==null&&a.alternate.memoizedState!==null||(tc=be())),o&4&&Gu(t);break;case 22:if(f=i!==null&&i.memoizedState!==null,t.mode&1?($e=(d=$e)||f,bt(r,t),$e=d):bt(r,t),Pt(t),o&8192){if(d=t.memoizedState!==null,(t.stateNode.isHidden=d)&&!f&&(t.mode&1)!==0)for(F=t,f=t.child;f!==null;){for(g=F=f;F!==null;){switch(_=F,x=_.child,_.tag){case 0:case 11:case 14:case 15:si(4,_,_.return);break;case 1:cr(_,_.return);var b=_.stateNode;if(typeof b.componentWillUnmount==="function"){o=_,i=_.return;try{r=o,b.props=r.memoizedProps,b.state=r.memoizedState,b.componentWillUnmount()}catch(w){Se(o,i,w)}}break;case 5:cr(_,_.return);break;case 22:if(_.memoizedState!==null){Qu(g);continue}}x!==null?(x.return=_,F=x):Qu(g)}f=f.sibling}e:for(f=null,g=t;;){if(g.tag===5){if(f===null){f=g;try{a=g.stateNode,d?(s=a.style,typeof s.setProperty==="function"?s.setProperty("display","none","important"):s.display="none"):(c=g.stateNode,u=g.memoizedProps.style,l=u!==void 0&&u!==null&&u.hasOwnProperty("display")?u.display:null,c.style.display=dd("display",l))}catch(w){Se(t,t.return,w)}}}else if(g.tag===6){if(f===null)try{g.stateNode.nodeValue=d?"":g.memoizedProps}catch(w){Se(t,t.return,w)}}else if((g.tag!==22&&g.tag!==23||g.memoizedState===null||g===t)&&g.child!==null){g.child.return=g,g=g.child;continue}if(g===t)break e;for(;g.sibling===null;){if(g.return===null||g.return===t)break e;f===g&&(f=null),g=g.return}f===g&&(f=null),g.sibling.return=g.return,g=g.sibling}}break;case 19:bt(r,t),Pt(t),o&4&&Gu(t);break;case 21:break;default:bt(r,t),Pt(t)}}function Pt(t){var r=t.flags;if(r&2){try{e:{for(var i=t.return;i!==null;){if(Im(i)){var o=i;break e}i=i.return}throw Error(A(160))}switch(o.tag){case 5:var a=o.stateNode;o.flags&32&&(di(a,""),o.flags&=-33);var s=ju(t);pl(t,s,a);break;case 3:case 4:var l=o.stateNode.containerInfo,c=ju(t);ml(t,c,l);break;default:throw Error(A(161))}}catch(u){Se(t,t.return,u)}t.flags&=-3}r&4096&&(t.flags&=-4097)}function A_(t,r,i){F=t,zm(t,r,i)}function zm(t,r,i){for(var o=(t.mode&1)!==0;F!==null;){var a=F,s=a.child;if(a.tag===22&&o){var l=a.memoizedState!==null||yo;if(!l){var c=a.alternate,u=c!==null&&c.memoizedState!==null||$e;c=yo;var d=$e;if(yo=l,($e=u)&&!d)for(F=a;F!==null;)l=F,u=l.child,l.tag===22&&l.memoizedState!==null?Zu(a):u!==null?(u.return=l,F=u):Zu(a);for(;s!==null;)F=s,zm(s,r,i),s=s.sibling;F=a,yo=c,$e=d}Ku(t,r,i)}else(a.subtreeFlags&8772)!==0&&s!==null?(s.return=a,F=s):Ku(t,r,i)}}function Ku(t){for(;F!==null;){var r=F;if((r.flags&8772)!==0){var i=r.alternate;try{if((r.flags&8772)!==0)switch(r.tag){case 0:case 11:case 15:$e||la(5,r);break;case 1:var o=r.stateNode;if(r.flags&4&&!$e)if(i===null)o.componentDidMount();else{var a=r.elementType===r.type?i.memoizedProps:wt(r.type,i.memoizedProps);o.componentDidUpdate(a,i.memoizedState,o.__reactInternalSnapshotBeforeUpdate)}var s=r.updateQueue;s!==null&&Au(r,s,o);break;case 3:var l=r.updateQueue;if(l!==null){if(i=null,r.child!==null)switch(r.child.tag){case 5:i=r.child.stateNode;break;case 1:i=r.child.stateNode}Au(r,l,i)}break;case 5:var c=r.stateNode;if(i===null&&r.flags&4){i=c;var u=r.memoizedProps;switch(r.type){case"button":case"input":case"select":case"textarea":u.autoFocus&&i.focus();break;case"img":u.src&&(i.src=u.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(r.memoizedState===null){var d=r.alternate;if(d!==null){var f=d.memoizedState;if(f!==null){var g=f.dehydrated;g!==null&&hi(g)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(A(163))}$e||r.flags&512&&dl(r)}catch(_){Se(r,r.return,_)}}if(r===t){F=null;break}if(i=r.sibling,i!==null){i.return=r.return,F=i;break}F=r.return}}function Qu(t){for(;F!==null;){var r=F;if(r===t){F=null;break}var i=r.sibling;if(i!==null){i.return=r.return,F=i;break}F=r.return}}function Zu(t){for(;F!==null;){var r=F;try{switch(r.tag){case 0:case 11:case 15:var i=r.return;try{la(4,r)}catch(u){Se(r,i,u)}break;case 1:var o=r.stateNode;if(typeof o.componentDidMount==="function"){var a=r.return;try{o.componentDidMount()}catch(u){Se(r,a,u)}}var s=r.return;try{dl(r)}catch(u){Se(r,s,u)}break;case 5:var l=r.return;try{dl(r)}catch(u){Se(r,l,u)}}}catch(u){Se(r,r.return,u)}if(r===t){F=null;break}var c=r.sibling;if(c!==null){c.return=r.return,F=c;break}F=r.return}}function je(){return(re&6)!==0?be():Lo!==-1?Lo:Lo=be()}function hn(t){if((t.mode&1)===0)return 1;if((re&2)!==0&&Ie!==0)return Ie&-Ie;if(__.transition!==null)return Mo===0&&(Mo=xd()),Mo;if(t=ce,t!==0)return t;return t=window.event,t=t===void 0?16:Ld(t.type),t}function Et(t,r,i,o){if(50<ci)throw ci=0,hl=null,Error(A(185));if(Ni(t,i,o),(re&2)===0||t!==Pe)t===Pe&&((re&2)===0&&(ca|=i),Ee===4&&an(t,Ie)),tt(t,o),i===1&&re===0&&(r.mode&1)===0&&(wr=be()+500,oa&&xn())}function tt(t,r){var i=t.callbackNode;vg(t,r);var o=Do(t,t===Pe?Ie:0);if(o===0)i!==null&&su(i),t.callbackNode=null,t.callbackPriority=0;else if(r=o&-o,t.callbackPriority!==r){if(i!=null&&su(i),r===1)t.tag===0?g_(qu.bind(null,t)):jd(qu.bind(null,t)),m_(function(){(re&6)===0&&xn()}),i=null;else{switch(bd(o)){case 1:i=Cl;break;case 4:i=vd;break;case 16:i=Io;break;case 536870912:i=Sd;break;default:i=Io}i=Um(i,Bm.bind(null,t))}t.callbackPriority=r,t.callbackNode=i}}function Bm(t,r){if(Lo=-1,Mo=0,(re&6)!==0)throw Error(A(327));var i=t.callbackNode;if(gr()&&t.callbackNode!==i)return null;var o=Do(t,t===Pe?Ie:0);if(o===0)return null;if((o&30)!==0||(o&t.expiredLanes)!==0||r)r=Jo(t,o);else{r=o;var a=re;re|=2;var s=Vm();if(Pe!==t||Ie!==r)Wt=null,wr=be()+500,Dn(t,r);do try{B_();break}catch(c){Fm(t,c)}while(1);Vl(),Qo.current=s,re=a,ke!==null?r=0:(Pe=null,Ie=0,r=Ee)}if(r!==0){if(r===2&&(a=Vs(t),a!==0&&(o=a,r=gl(t,a))),r===1)throw i=Ci,Dn(t,0),an(t,o),tt(t,be()),i;if(r===6)an(t,o);else{if(a=t.current.alternate,(o&30)===0&&!D_(a)&&(r=Jo(t,o),r===2&&(s=Vs(t),s!==0&&(o=s,r=gl(t,s))),r===1))throw i=Ci,Dn(t,0),an(t,o),tt(t,be()),i;switch(t.finishedWork=a,t.finishedLanes=o,r){case 0:case 1:throw Error(A(345));case 2:Pn(t,Ze,Wt);break;case 3:if(an(t,o),(o&130023424)===o&&(r=tc+500-be(),10<r)){if(Do(t,0)!==0)break;if(a=t.suspendedLanes,(a&o)!==o){je(),t.pingedLanes|=t.suspendedLanes&a;break}t.timeoutHandle=Qs(Pn.bind(null,t,Ze,Wt),r);break}Pn(t,Ze,Wt);break;case 4:if(an(t,o),(o&4194240)===o)break;r=t.eventTimes;for(a=-1;0<o;){var l=31-Nt(o);s=1<<l,l=r[l],l>a&&(a=l),o&=~s}if(o=a,o=be()-o,o=(120>o?120:480>o?480:1080>o?1080:1920>o?1920:3000>o?3000:4320>o?4320:1960*I_(o/1960))-o,10<o){t.timeoutHandle=Qs(Pn.bind(null,t,Ze,Wt),o);break}Pn(t,Ze,Wt);break;case 5:Pn(t,Ze,Wt);break;default:throw Error(A(329))}}}return tt(t,be()),t.callbackNode===i?Bm.bind(null,t):null}function gl(t,r){var i=li;return t.current.memoizedState.isDehydrated&&(Dn(t,r).flags|=256),t=Jo(t,r),t!==2&&(r=Ze,Ze=i,r!==null&&_l(r)),t}function _l(t){Ze===null?Ze=t:Ze.push.apply(Ze,t)}function D_(t){for(var r=t;;){if(r.flags&16384){var i=r.updateQueue;if(i!==null&&(i=i.stores,i!==null))for(var o=0;o<i.length;o++){var a=i[o],s=a.getSnapshot;a=a.value;try{if(!Lt(s(),a))return!1}catch(l){return!1}}}if(i=r.child,r.subtreeFlags&16384&&i!==null)i.return=r,r=i;else{if(r===t)break;for(;r.sibling===null;){if(r.return===null||r.return===t)return!0;r=r.return}r.sibling.return=r.return,r=r.sibling}}return!0}function an(t,r){r&=~ec,r&=~ca,t.suspendedLanes|=r,t.pingedLanes&=~r;for(t=t.expirationTimes;0<r;){var i=31-Nt(r),o=1<<i;t[i]=-1,r&=~o}}function qu(t){if((re&6)!==0)throw Error(A(327));gr();var r=Do(t,0);if((r&1)===0)return tt(t,be()),null;var i=Jo(t,r);if(t.tag!==0&&i===2){var o=Vs(t);o!==0&&(r=o,i=gl(t,o))}if(i===1)throw i=Ci,Dn(t,0),an(t,r),tt(t,be()),i;if(i===6)throw Error(A(345));return t.finishedWork=t.current.alternate,t.finishedLanes=r,Pn(t,Ze,Wt),tt(t,be()),null}function O_(t,r){var i=re;re|=1;try{return t(r)}finally{re=i,re===0&&(wr=be()+500,oa&&xn())}}function nc(t){ln!==null&&ln.tag===0&&(re&6)===0&&gr();var r=re;re|=1;var i=gt.transition,o=ce;try{if(gt.transition=null,ce=1,t)return t()}finally{ce=o,gt.transition=i,re=r,(re&6)===0&&xn()}}function rc(){it=ur.current,fe(ur)}function Dn(t,r){t.finishedWork=null,t.finishedLanes=0;var i=t.timeoutHandle;if(i!==-1&&(t.timeoutHandle=-1,d_(i)),ke!==null)for(i=ke.return;i!==null;){var o=i;switch(zl(o),o.tag){case 1:o=o.type.childContextTypes,o!==null&&o!==void 0&&Vo();break;case 3:xr(),fe(Je),fe(He),Xl();break;case 5:Ul(o);break;case 4:xr();break;case 13:fe(_e);break;case 19:fe(_e);break;case 10:Wl(o.type._context);break;case 22:case 23:rc()}i=i.return}if(Pe=t,ke=t=gn(t.current,null),Ie=it=r,Ee=0,Ci=null,ec=ca=Vn=0,Ze=li=null,An!==null){for(r=0;r<An.length;r++)if(i=An[r],o=i.interleaved,o!==null){i.interleaved=null;var a=o.next,s=i.pending;if(s!==null){var l=s.next;s.next=a,o.next=l}i.pending=o}An=null}return t}function Fm(t,r){do{var i=ke;try{if(Vl(),Co.current=Ko,Go){for(var o=ye.memoizedState;o!==null;){var a=o.queue;a!==null&&(a.pending=null),o=o.next}Go=!1}if(Fn=0,Re=Ne=ye=null,ai=!1,bi=0,Jl.current=null,i===null||i.return===null){Ee=1,Ci=r,ke=null;break}e:{var s=t,l=i.return,c=i,u=r;if(r=Ie,c.flags|=32768,u!==null&&typeof u==="object"&&typeof u.then==="function"){var d=u,f=c,g=f.tag;if((f.mode&1)===0&&(g===0||g===11||g===15)){var _=f.alternate;_?(f.updateQueue=_.updateQueue,f.memoizedState=_.memoizedState,f.lanes=_.lanes):(f.updateQueue=null,f.memoizedState=null)}var x=Fu(l);if(x!==null){x.flags&=-257,Vu(x,l,c,s,r),x.mode&1&&Bu(s,d,r),r=x,u=d;var b=r.updateQueue;if(b===null){var w=new Set;w.add(u),r.updateQueue=w}else b.add(u);break e}else{if((r&1)===0){Bu(s,d,r),ic();break e}u=Error(A(426))}}else if(he&&c.mode&1){var P=Fu(l);if(P!==null){(P.flags&65536)===0&&(P.flags|=256),Vu(P,l,c,s,r),Bl(br(u,c));break e}}s=u=br(u,c),Ee!==4&&(Ee=2),li===null?li=[s]:li.push(s),s=l;do{switch(s.tag){case 3:s.flags|=65536,r&=-r,s.lanes|=r;var y=bm(s,u,r);Tu(s,y);break e;case 1:c=u;var p=s.type,h=s.stateNode;if((s.flags&128)===0&&(typeof p.getDerivedStateFromError==="function"||h!==null&&typeof h.componentDidCatch==="function"&&(fn===null||!fn.has(h)))){s.flags|=65536,r&=-r,s.lanes|=r;var v=wm(s,c,r);Tu(s,v);break e}}s=s.return}while(s!==null)}$m(i)}catch(k){r=k,ke===i&&i!==null&&(ke=i=i.return);continue}break}while(1)}function Vm(){var t=Qo.current;return Qo.current=Ko,t===null?Ko:t}function ic(){if(Ee===0||Ee===3||Ee===2)Ee=4;Pe===null||(Vn&268435455)===0&&(ca&268435455)===0||an(Pe,Ie)}function Jo(t,r){var i=re;re|=2;var o=Vm();if(Pe!==t||Ie!==r)Wt=null,Dn(t,r);do try{z_();break}catch(a){Fm(t,a)}while(1);if(Vl(),re=i,Qo.current=o,ke!==null)throw Error(A(261));return Pe=null,Ie=0,Ee}function z_(){for(;ke!==null;)Wm(ke)}function B_(){for(;ke!==null&&!ug();)Wm(ke)}function Wm(t){var r=Ym(t.alternate,t,it);t.memoizedProps=t.pendingProps,r===null?$m(t):ke=r,Jl.current=null}function $m(t){var r=t;do{var i=r.alternate;if(t=r.return,(r.flags&32768)===0){if(i=M_(i,r,it),i!==null){ke=i;return}}else{if(i=R_(i,r),i!==null){i.flags&=32767,ke=i;return}if(t!==null)t.flags|=32768,t.subtreeFlags=0,t.deletions=null;else{Ee=6,ke=null;return}}if(r=r.sibling,r!==null){ke=r;return}ke=r=t}while(r!==null);Ee===0&&(Ee=5)}function Pn(t,r,i){var o=ce,a=gt.transition;try{gt.transition=null,ce=1,F_(t,r,i,o)}finally{gt.transition=a,ce=o}return null}function F_(t,r,i,o){do gr();while(ln!==null);if((re&6)!==0)throw Error(A(327));i=t.finishedWork;var a=t.finishedLanes;if(i===null)return null;if(t.finishedWork=null,t.finishedLanes=0,i===t.current)throw Error(A(177));t.callbackNode=null,t.callbackPriority=0;var s=i.lanes|i.childLanes;if(Sg(t,s),t===Pe&&(ke=Pe=null,Ie=0),(i.subtreeFlags&2064)===0&&(i.flags&2064)===0||vo||(vo=!0,Um(Io,function(){return gr(),null})),s=(i.flags&15990)!==0,(i.subtreeFlags&15990)!==0||s){s=gt.transition,gt.transition=null;var l=ce;ce=1;var c=re;re|=4,Jl.current=null,T_(t,i),Om(i,t),a_(Gs),Oo=!!js,Gs=js=null,t.current=i,A_(i,t,a),dg(),re=c,ce=l,gt.transition=s}else t.current=i;if(vo&&(vo=!1,ln=t,qo=a),s=t.pendingLanes,s===0&&(fn=null),fg(i.stateNode,o),tt(t,be()),r!==null)for(o=t.onRecoverableError,i=0;i<r.length;i++)a=r[i],o(a.value,{componentStack:a.stack,digest:a.digest});if(Zo)throw Zo=!1,t=fl,fl=null,t;return(qo&1)!==0&&t.tag!==0&&gr(),s=t.pendingLanes,(s&1)!==0?t===hl?ci++:(ci=0,hl=t):ci=0,xn(),null}function gr(){if(ln!==null){var t=bd(qo),r=gt.transition,i=ce;try{if(gt.transition=null,ce=16>t?16:t,ln===null)var o=!1;else{if(t=ln,ln=null,qo=0,(re&6)!==0)throw Error(A(331));var a=re;re|=4;for(F=t.current;F!==null;){var s=F,l=s.child;if((F.flags&16)!==0){var c=s.deletions;if(c!==null){for(var u=0;u<c.length;u++){var d=c[u];for(F=d;F!==null;){var f=F;switch(f.tag){case 0:case 11:case 15:si(8,f,s)}var g=f.child;if(g!==null)g.return=f,F=g;else for(;F!==null;){f=F;var _=f.sibling,x=f.return;if(Am(f),f===d){F=null;break}if(_!==null){_.return=x,F=_;break}F=x}}}var b=s.alternate;if(b!==null){var w=b.child;if(w!==null){b.child=null;do{var P=w.sibling;w.sibling=null,w=P}while(w!==null)}}F=s}}if((s.subtreeFlags&2064)!==0&&l!==null)l.return=s,F=l;else e:for(;F!==null;){if(s=F,(s.flags&2048)!==0)switch(s.tag){case 0:case 11:case 15:si(9,s,s.return)}var y=s.sibling;if(y!==null){y.return=s.return,F=y;break e}F=s.return}}var p=t.current;for(F=p;F!==null;){l=F;var h=l.child;if((l.subtreeFlags&2064)!==0&&h!==null)h.return=l,F=h;else e:for(l=p;F!==null;){if(c=F,(c.flags&2048)!==0)try{switch(c.tag){case 0:case 11:case 15:la(9,c)}}catch(k){Se(c,c.return,k)}if(c===l){F=null;break e}var v=c.sibling;if(v!==null){v.return=c.return,F=v;break e}F=c.return}}if(re=a,xn(),It&&typeof It.onPostCommitFiberRoot==="function")try{It.onPostCommitFiberRoot(ea,t)}catch(k){}o=!0}return o}finally{ce=i,gt.transition=r}}return!1}function Ju(t,r,i){r=br(i,r),r=bm(t,r,1),t=pn(t,r,1),r=je(),t!==null&&(Ni(t,1,r),tt(t,r))}function Se(t,r,i){if(t.tag===3)Ju(t,t,i);else for(;r!==null;){if(r.tag===3){Ju(r,t,i);break}else if(r.tag===1){var o=r.stateNode;if(typeof r.type.getDerivedStateFromError==="function"||typeof o.componentDidCatch==="function"&&(fn===null||!fn.has(o))){t=br(i,t),t=wm(r,t,1),r=pn(r,t,1),t=je(),r!==null&&(Ni(r,1,t),tt(r,t));break}}r=r.return}}function V_(t,r,i){var o=t.pingCache;o!==null&&o.delete(r),r=je(),t.pingedLanes|=t.suspendedLanes&i,Pe===t&&(Ie&i)===i&&(Ee===4||Ee===3&&(Ie&130023424)===Ie&&500>be()-tc?Dn(t,0):ec|=i),tt(t,r)}function Hm(t,r){r===0&&((t.mode&1)===0?r=1:(r=lo,lo<<=1,(lo&130023424)===0&&(lo=4194304)));var i=je();t=jt(t,r),t!==null&&(Ni(t,r,i),tt(t,i))}function W_(t){var r=t.memoizedState,i=0;r!==null&&(i=r.retryLane),Hm(t,i)}function $_(t,r){var i=0;switch(t.tag){case 13:var{stateNode:o,memoizedState:a}=t;a!==null&&(i=a.retryLane);break;case 19:o=t.stateNode;break;default:throw Error(A(314))}o!==null&&o.delete(r),Hm(t,i)}function Um(t,r){return yd(t,r)}function H_(t,r,i,o){this.tag=t,this.key=i,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=r,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=o,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function ht(t,r,i,o){return new H_(t,r,i,o)}function oc(t){return t=t.prototype,!(!t||!t.isReactComponent)}function Y_(t){if(typeof t==="function")return oc(t)?1:0;if(t!==void 0&&t!==null){if(t=t.$$typeof,t===bl)return 11;if(t===wl)return 14}return 2}function gn(t,r){var i=t.alternate;return i===null?(i=ht(t.tag,r,t.key,t.mode),i.elementType=t.elementType,i.type=t.type,i.stateNode=t.stateNode,i.alternate=t,t.alternate=i):(i.pendingProps=r,i.type=t.type,i.flags=0,i.subtreeFlags=0,i.deletions=null),i.flags=t.flags&14680064,i.childLanes=t.childLanes,i.lanes=t.lanes,i.child=t.child,i.memoizedProps=t.memoizedProps,i.memoizedState=t.memoizedState,i.updateQueue=t.updateQueue,r=t.dependencies,i.dependencies=r===null?null:{lanes:r.lanes,firstContext:r.firstContext},i.sibling=t.sibling,i.index=t.index,i.ref=t.ref,i}function Ro(t,r,i,o,a,s){var l=2;if(o=t,typeof t==="function")oc(t)&&(l=1);else if(typeof t==="string")l=5;else e:switch(t){case tr:return On(i.children,a,s,r);case xl:l=8,a|=8;break;case Cs:return t=ht(12,i,r,a|2),t.elementType=Cs,t.lanes=s,t;case Ns:return t=ht(13,i,r,a),t.elementType=Ns,t.lanes=s,t;case Es:return t=ht(19,i,r,a),t.elementType=Es,t.lanes=s,t;case id:return ua(i,a,s,r);default:if(typeof t==="object"&&t!==null)switch(t.$$typeof){case nd:l=10;break e;case rd:l=9;break e;case bl:l=11;break e;case wl:l=14;break e;case nn:l=16,o=null;break e}throw Error(A(130,t==null?t:typeof t,""))}return r=ht(l,i,r,a),r.elementType=t,r.type=o,r.lanes=s,r}function On(t,r,i,o){return t=ht(7,t,o,r),t.lanes=i,t}function ua(t,r,i,o){return t=ht(22,t,o,r),t.elementType=id,t.lanes=i,t.stateNode={isHidden:!1},t}function bs(t,r,i){return t=ht(6,t,null,r),t.lanes=i,t}function ws(t,r,i){return r=ht(4,t.children!==null?t.children:[],t.key,r),r.lanes=i,r.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},r}function U_(t,r,i,o,a){this.tag=r,this.containerInfo=t,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=ss(0),this.expirationTimes=ss(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=ss(0),this.identifierPrefix=o,this.onRecoverableError=a,this.mutableSourceEagerHydrationData=null}function Xm(t,r,i,o,a,s,l,c,u){return t=new U_(t,r,i,c,u),r===1?(r=1,s===!0&&(r|=8)):r=0,s=ht(3,null,null,r),t.current=s,s.stateNode=t,s.memoizedState={element:o,isDehydrated:i,cache:null,transitions:null,pendingSuspenseBoundaries:null},Hl(s),t}function jm(t){if(!t)return yn;t=t._reactInternals;e:{if($n(t)!==t||t.tag!==1)throw Error(A(170));var r=t;do{switch(r.tag){case 3:r=r.stateNode.context;break e;case 1:if(et(r.type)){r=r.stateNode.__reactInternalMemoizedMergedChildContext;break e}}r=r.return}while(r!==null);throw Error(A(171))}if(t.tag===1){var i=t.type;if(et(i))return Xd(t,i,r)}return r}function X_(t,r,i,o,a,s,l,c,u){return t=Xm(i,o,!0,t,a,s,l,c,u),t.context=jm(null),i=t.current,o=je(),a=hn(i),s=Ut(o,a),s.callback=r!==void 0&&r!==null?r:null,pn(i,s,a),t.current.lanes=a,Ni(t,a,o),tt(t,o),t}function Gm(t,r,i,o){var a=r.current,s=je(),l=hn(a);return i=jm(i),r.context===null?r.context=i:r.pendingContext=i,r=Ut(s,l),r.payload={element:t},o=o===void 0?null:o,o!==null&&(r.callback=o),t=pn(a,r,l),t!==null&&(Et(t,a,l,s),ko(t,a,l)),l}function ed(t,r){if(t=t.memoizedState,t!==null&&t.dehydrated!==null){var i=t.retryLane;t.retryLane=i!==0&&i<r?i:r}}function ac(t,r){ed(t,r),(t=t.alternate)&&ed(t,r)}function j_(){return null}function sc(t){this._internalRoot=t}function da(t){this._internalRoot=t}function Qm(t){return!(!t||t.nodeType!==1&&t.nodeType!==9&&t.nodeType!==11)}var ge,td,ui,Xt,ks,jh,qc,Jc,De,yl,Kt,io,Ur,tr,xl,Cs,nd,rd,bl,Ns,Es,wl,nn,id,eu,ve,rs,is=!1,jr,ao,ud,ti,eg,tg,Os=null,zs=null,mr=null,pr=null,as=!1,Bs=!1,Mn,ni=!1,To=null,Ao=!1,Fs=null,og,yd,su,ug,dg,be,mg,Cl,vd,Io,pg,Sd,ea=null,It=null,Nt,hg,gg,so=64,lo=4194304,ce=0,wd,El,kd,Cd,Nd,Ws=!1,co,cn=null,un=null,dn=null,pi,fi,on,xg,fr,Oo=!0,zo=null,sn=null,Ml=null,xo=null,kr,Rl,Ei,Ng,ls,cs,Wr,ta,du,Eg,Lg,Mg,us,Rg,Pg,Tg,Ag,Ig,mu,Dg,Og,zg,Fg,Vg,Wg,pu,$g,Hg,Yg,Ug,Xg,jg,Gg,Tl,ri=null,Kg,Rd,fu,hu=!1,nr=!1,qg,ii=null,gi=null,Id=!1,Kr,Qr,wo,Lt,s_,rr=null,Hs=null,oi=null,Ys=!1,ir,ds,Bd,Fd,Vd,Wd,$d,Hd,xu,qr,Us,Xs,Zr,Jr,l_,po,c_,u_,js=null,Gs=null,Qs,d_,Cu,m_,Cr,At,vi,Nr,Zs,f_,h_,qs,or=-1,yn,He,Je,zn,$t=null,oa=!1,hs=!1,ar,sr=0,$o=null,Ho=0,pt,ft=0,Bn=null,Ht=1,Yt="",at=null,ot=null,he=!1,Ct=null,__,Sr,qd,Yo,Uo=null,lr=null,Fl=null,An=null,rn=!1,Li,Dt,Si,xi,_e,gs,Co,_s,Fn=0,ye=null,Ne=null,Re=null,Go=!1,ai=!1,bi=0,y_=0,Ko,b_,w_,k_,sa,C_,N_,qe=!1,sl,Rm,cl,Pm,Tm,yo=!1,$e=!1,P_,F=null,Xu=!1,Ae=null,kt=!1,I_,Qo,Jl,gt,re=0,Pe=null,ke=null,Ie=0,it=0,ur,Ee=0,Ci=null,Vn=0,ca=0,ec=0,li=null,Ze=null,tc=0,wr=1/0,Wt=null,Zo=!1,fl=null,fn=null,vo=!1,ln=null,qo=0,ci=0,hl=null,Lo=-1,Mo=0,Ym,Km,Yr,G_,er,lc=function(t,r){if(!Qm(t))throw Error(A(299));var i=!1,o="",a=Km;return r!==null&&r!==void 0&&(r.unstable_strictMode===!0&&(i=!0),r.identifierPrefix!==void 0&&(o=r.identifierPrefix),r.onRecoverableError!==void 0&&(a=r.onRecoverableError)),r=Xm(t,1,!1,null,null,i,!1,o,a),t[Nr]=r.current,Il(t.nodeType===8?t.parentNode:t),new sc(r)},cc=function(t,r,i){if(!Qm(t))throw Error(A(405));var o=i!=null&&i.hydratedSources||null,a=!1,s="",l=Km;if(i!==null&&i!==void 0&&(i.unstable_strictMode===!0&&(a=!0),i.identifierPrefix!==void 0&&(s=i.identifierPrefix),i.onRecoverableError!==void 0&&(l=i.onRecoverableError)),r=X_(r,null,t,1,i!=null?i:null,a,!1,s,l),t[Nr]=r.current,Il(t),o)for(t=0;t<o.length;t++)i=o[t],a=i._getVersion,a=a(i._source),r.mutableSourceEagerHydrationData==null?r.mutableSourceEagerHydrationData=[i,a]:r.mutableSourceEagerHydrationData.push(i,a);return new da(r)};var Zm=$a(()=>{Be();ge=Wa(Zc());td=new Set,ui={};Xt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),ks=Object.prototype.hasOwnProperty,jh=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,qc={},Jc={};De={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(t){De[t]=new Ge(t,0,!1,t,null,!1,!1)});[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(t){var r=t[0];De[r]=new Ge(r,1,!1,t[1],null,!1,!1)});["contentEditable","draggable","spellCheck","value"].forEach(function(t){De[t]=new Ge(t,2,!1,t.toLowerCase(),null,!1,!1)});["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(t){De[t]=new Ge(t,2,!1,t,null,!1,!1)});"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(t){De[t]=new Ge(t,3,!1,t.toLowerCase(),null,!1,!1)});["checked","multiple","muted","selected"].forEach(function(t){De[t]=new Ge(t,3,!0,t,null,!1,!1)});["capture","download"].forEach(function(t){De[t]=new Ge(t,4,!1,t,null,!1,!1)});["cols","rows","size","span"].forEach(function(t){De[t]=new Ge(t,6,!1,t,null,!1,!1)});["rowSpan","start"].forEach(function(t){De[t]=new Ge(t,5,!1,t.toLowerCase(),null,!1,!1)});yl=/[\-:]([a-z])/g;"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(t){var r=t.replace(yl,vl);De[r]=new Ge(r,1,!1,t,null,!1,!1)});"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(t){var r=t.replace(yl,vl);De[r]=new Ge(r,1,!1,t,"http://www.w3.org/1999/xlink",!1,!1)});["xml:base","xml:lang","xml:space"].forEach(function(t){var r=t.replace(yl,vl);De[r]=new Ge(r,1,!1,t,"http://www.w3.org/XML/1998/namespace",!1,!1)});["tabIndex","crossOrigin"].forEach(function(t){De[t]=new Ge(t,1,!1,t.toLowerCase(),null,!1,!1)});De.xlinkHref=new Ge("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1);["src","href","action","formAction"].forEach(function(t){De[t]=new Ge(t,1,!1,t.toLowerCase(),null,!0,!0)});Kt=Ir,io=Symbol.for("react.element"),Ur=Symbol.for("react.portal"),tr=Symbol.for("react.fragment"),xl=Symbol.for("react.strict_mode"),Cs=Symbol.for("react.profiler"),nd=Symbol.for("react.provider"),rd=Symbol.for("react.context"),bl=Symbol.for("react.forward_ref"),Ns=Symbol.for("react.suspense"),Es=Symbol.for("react.suspense_list"),wl=Symbol.for("react.memo"),nn=Symbol.for("react.lazy"),id=Symbol.for("react.offscreen"),eu=Symbol.iterator;ve=Object.assign;jr=Array.isArray;ud=function(t){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(r,i,o,a){MSApp.execUnsafeLocalFunction(function(){return t(r,i,o,a)})}:t}(function(t,r){if(t.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in t)t.innerHTML=r;else{ao=ao||document.createElement("div"),ao.innerHTML="<svg>"+r.valueOf().toString()+"</svg>";for(r=ao.firstChild;t.firstChild;)t.removeChild(t.firstChild);for(;r.firstChild;)t.appendChild(r.firstChild)}});ti={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},eg=["Webkit","ms","Moz","O"];Object.keys(ti).forEach(function(t){eg.forEach(function(r){r=r+t.charAt(0).toUpperCase()+t.substring(1),ti[r]=ti[t]})});tg=ve({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});if(Xt)try{Mn={},Object.defineProperty(Mn,"passive",{get:function(){Bs=!0}}),window.addEventListener("test",Mn,Mn),window.removeEventListener("test",Mn,Mn)}catch(t){Bs=!1}og={onError:function(t){ni=!0,To=t}};yd=ge.unstable_scheduleCallback,su=ge.unstable_cancelCallback,ug=ge.unstable_shouldYield,dg=ge.unstable_requestPaint,be=ge.unstable_now,mg=ge.unstable_getCurrentPriorityLevel,Cl=ge.unstable_ImmediatePriority,vd=ge.unstable_UserBlockingPriority,Io=ge.unstable_NormalPriority,pg=ge.unstable_LowPriority,Sd=ge.unstable_IdlePriority;Nt=Math.clz32?Math.clz32:_g,hg=Math.log,gg=Math.LN2;co=[],pi=new Map,fi=new Map,on=[],xg="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");fr=Kt.ReactCurrentBatchConfig;kr={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(t){return t.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Rl=st(kr),Ei=ve({},kr,{view:0,detail:0}),Ng=st(Ei),ta=ve({},Ei,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Pl,button:0,buttons:0,relatedTarget:function(t){return t.relatedTarget===void 0?t.fromElement===t.srcElement?t.toElement:t.fromElement:t.relatedTarget},movementX:function(t){if("movementX"in t)return t.movementX;return t!==Wr&&(Wr&&t.type==="mousemove"?(ls=t.screenX-Wr.screenX,cs=t.screenY-Wr.screenY):cs=ls=0,Wr=t),ls},movementY:function(t){return"movementY"in t?t.movementY:cs}}),du=st(ta),Eg=ve({},ta,{dataTransfer:0}),Lg=st(Eg),Mg=ve({},Ei,{relatedTarget:0}),us=st(Mg),Rg=ve({},kr,{animationName:0,elapsedTime:0,pseudoElement:0}),Pg=st(Rg),Tg=ve({},kr,{clipboardData:function(t){return"clipboardData"in t?t.clipboardData:window.clipboardData}}),Ag=st(Tg),Ig=ve({},kr,{data:0}),mu=st(Ig),Dg={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Og={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},zg={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};Fg=ve({},Ei,{key:function(t){if(t.key){var r=Dg[t.key]||t.key;if(r!=="Unidentified")return r}return t.type==="keypress"?(t=bo(t),t===13?"Enter":String.fromCharCode(t)):t.type==="keydown"||t.type==="keyup"?Og[t.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Pl,charCode:function(t){return t.type==="keypress"?bo(t):0},keyCode:function(t){return t.type==="keydown"||t.type==="keyup"?t.keyCode:0},which:function(t){return t.type==="keypress"?bo(t):t.type==="keydown"||t.type==="keyup"?t.keyCode:0}}),Vg=st(Fg),Wg=ve({},ta,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),pu=st(Wg),$g=ve({},Ei,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Pl}),Hg=st($g),Yg=ve({},kr,{propertyName:0,elapsedTime:0,pseudoElement:0}),Ug=st(Yg),Xg=ve({},ta,{deltaX:function(t){return"deltaX"in t?t.deltaX:("wheelDeltaX"in t)?-t.wheelDeltaX:0},deltaY:function(t){return"deltaY"in t?t.deltaY:("wheelDeltaY"in t)?-t.wheelDeltaY:("wheelDelta"in t)?-t.wheelDelta:0},deltaZ:0,deltaMode:0}),jg=st(Xg),Gg=[9,13,27,32],Tl=Xt&&"CompositionEvent"in window;Xt&&"documentMode"in document&&(ri=document.documentMode);Kg=Xt&&"TextEvent"in window&&!ri,Rd=Xt&&(!Tl||ri&&8<ri&&11>=ri),fu=String.fromCharCode(32);qg={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};if(Xt){if(Xt){if(Qr="oninput"in document,!Qr)wo=document.createElement("div"),wo.setAttribute("oninput","return;"),Qr=typeof wo.oninput==="function";Kr=Qr}else Kr=!1;Id=Kr&&(!document.documentMode||9<document.documentMode)}Lt=typeof Object.is==="function"?Object.is:o_;s_=Xt&&"documentMode"in document&&11>=document.documentMode;ir={animationend:mo("Animation","AnimationEnd"),animationiteration:mo("Animation","AnimationIteration"),animationstart:mo("Animation","AnimationStart"),transitionend:mo("Transition","TransitionEnd")},ds={},Bd={};Xt&&(Bd=document.createElement("div").style,("AnimationEvent"in window)||(delete ir.animationend.animation,delete ir.animationiteration.animation,delete ir.animationstart.animation),("TransitionEvent"in window)||delete ir.transitionend.transition);Fd=ra("animationend"),Vd=ra("animationiteration"),Wd=ra("animationstart"),$d=ra("transitionend"),Hd=new Map,xu="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");for(Zr=0;Zr<xu.length;Zr++)qr=xu[Zr],Us=qr.toLowerCase(),Xs=qr[0].toUpperCase()+qr.slice(1),vn(Us,"on"+Xs);vn(Fd,"onAnimationEnd");vn(Vd,"onAnimationIteration");vn(Wd,"onAnimationStart");vn("dblclick","onDoubleClick");vn("focusin","onFocus");vn("focusout","onBlur");vn($d,"onTransitionEnd");_r("onMouseEnter",["mouseout","mouseover"]);_r("onMouseLeave",["mouseout","mouseover"]);_r("onPointerEnter",["pointerout","pointerover"]);_r("onPointerLeave",["pointerout","pointerover"]);Wn("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));Wn("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));Wn("onBeforeInput",["compositionend","keypress","textInput","paste"]);Wn("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));Wn("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));Wn("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));Jr="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),l_=new Set("cancel close invalid load scroll toggle".split(" ").concat(Jr));po="_reactListening"+Math.random().toString(36).slice(2);c_=/\r\n?/g,u_=/\u0000|\uFFFD/g;Qs=typeof setTimeout==="function"?setTimeout:void 0,d_=typeof clearTimeout==="function"?clearTimeout:void 0,Cu=typeof Promise==="function"?Promise:void 0,m_=typeof queueMicrotask==="function"?queueMicrotask:typeof Cu<"u"?function(t){return Cu.resolve(null).then(t).catch(p_)}:Qs;Cr=Math.random().toString(36).slice(2),At="__reactFiber$"+Cr,vi="__reactProps$"+Cr,Nr="__reactContainer$"+Cr,Zs="__reactEvents$"+Cr,f_="__reactListeners$"+Cr,h_="__reactHandles$"+Cr;qs=[];yn={},He=Sn(yn),Je=Sn(!1),zn=yn;ar=[],pt=[];__=Kt.ReactCurrentBatchConfig;Sr=Zd(!0),qd=Zd(!1),Yo=Sn(null);Li={},Dt=Sn(Li),Si=Sn(Li),xi=Sn(Li);_e=Sn(0);gs=[];Co=Kt.ReactCurrentDispatcher,_s=Kt.ReactCurrentBatchConfig;Ko={readContext:_t,useCallback:Ve,useContext:Ve,useEffect:Ve,useImperativeHandle:Ve,useInsertionEffect:Ve,useLayoutEffect:Ve,useMemo:Ve,useReducer:Ve,useRef:Ve,useState:Ve,useDebugValue:Ve,useDeferredValue:Ve,useTransition:Ve,useMutableSource:Ve,useSyncExternalStore:Ve,useId:Ve,unstable_isNewReconciler:!1},b_={readContext:_t,useCallback:function(t,r){return Tt().memoizedState=[t,r===void 0?null:r],t},useContext:_t,useEffect:Du,useImperativeHandle:function(t,r,i){return i=i!==null&&i!==void 0?i.concat([t]):null,No(4194308,4,mm.bind(null,r,t),i)},useLayoutEffect:function(t,r){return No(4194308,4,t,r)},useInsertionEffect:function(t,r){return No(4,2,t,r)},useMemo:function(t,r){var i=Tt();return r=r===void 0?null:r,t=t(),i.memoizedState=[t,r],t},useReducer:function(t,r,i){var o=Tt();return r=i!==void 0?i(r):r,o.memoizedState=o.baseState=r,t={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:r},o.queue=t,t=t.dispatch=S_.bind(null,ye,t),[o.memoizedState,t]},useRef:function(t){var r=Tt();return t={current:t},r.memoizedState=t},useState:Iu,useDebugValue:Zl,useDeferredValue:function(t){return Tt().memoizedState=t},useTransition:function(){var t=Iu(!1),r=t[0];return t=v_.bind(null,t[1]),Tt().memoizedState=t,[r,t]},useMutableSource:function(){},useSyncExternalStore:function(t,r,i){var o=ye,a=Tt();if(he){if(i===void 0)throw Error(A(407));i=i()}else{if(i=r(),Pe===null)throw Error(A(349));(Fn&30)!==0||im(o,r,i)}a.memoizedState=i;var s={value:i,getSnapshot:r};return a.queue=s,Du(am.bind(null,o,s,t),[t]),o.flags|=2048,ki(9,om.bind(null,o,s,i,r),void 0,null),i},useId:function(){var t=Tt(),r=Pe.identifierPrefix;if(he){var i=Yt,o=Ht;i=(o&~(1<<32-Nt(o)-1)).toString(32)+i,r=":"+r+"R"+i,i=bi++,0<i&&(r+="H"+i.toString(32)),r+=":"}else i=y_++,r=":"+r+"r"+i.toString(32)+":";return t.memoizedState=r},unstable_isNewReconciler:!1},w_={readContext:_t,useCallback:fm,useContext:_t,useEffect:Ql,useImperativeHandle:pm,useInsertionEffect:um,useLayoutEffect:dm,useMemo:hm,useReducer:ys,useRef:cm,useState:function(){return ys(wi)},useDebugValue:Zl,useDeferredValue:function(t){var r=yt();return gm(r,Ne.memoizedState,t)},useTransition:function(){var t=ys(wi)[0],r=yt().memoizedState;return[t,r]},useMutableSource:nm,useSyncExternalStore:rm,useId:_m,unstable_isNewReconciler:!1},k_={readContext:_t,useCallback:fm,useContext:_t,useEffect:Ql,useImperativeHandle:pm,useInsertionEffect:um,useLayoutEffect:dm,useMemo:hm,useReducer:vs,useRef:cm,useState:function(){return vs(wi)},useDebugValue:Zl,useDeferredValue:function(t){var r=yt();return Ne===null?r.memoizedState=t:gm(r,Ne.memoizedState,t)},useTransition:function(){var t=vs(wi)[0],r=yt().memoizedState;return[t,r]},useMutableSource:nm,useSyncExternalStore:rm,useId:_m,unstable_isNewReconciler:!1};sa={isMounted:function(t){return(t=t._reactInternals)?$n(t)===t:!1},enqueueSetState:function(t,r,i){t=t._reactInternals;var o=je(),a=hn(t),s=Ut(o,a);s.payload=r,i!==void 0&&i!==null&&(s.callback=i),r=pn(t,s,a),r!==null&&(Et(r,t,a,o),ko(r,t,a))},enqueueReplaceState:function(t,r,i){t=t._reactInternals;var o=je(),a=hn(t),s=Ut(o,a);s.tag=1,s.payload=r,i!==void 0&&i!==null&&(s.callback=i),r=pn(t,s,a),r!==null&&(Et(r,t,a,o),ko(r,t,a))},enqueueForceUpdate:function(t,r){t=t._reactInternals;var i=je(),o=hn(t),a=Ut(i,o);a.tag=2,r!==void 0&&r!==null&&(a.callback=r),r=pn(t,a,o),r!==null&&(Et(r,t,o,i),ko(r,t,o))}};C_=typeof WeakMap==="function"?WeakMap:Map;N_=Kt.ReactCurrentOwner;sl={dehydrated:null,treeContext:null,retryLane:0};Rm=function(t,r){for(var i=r.child;i!==null;){if(i.tag===5||i.tag===6)t.appendChild(i.stateNode);else if(i.tag!==4&&i.child!==null){i.child.return=i,i=i.child;continue}if(i===r)break;for(;i.sibling===null;){if(i.return===null||i.return===r)return;i=i.return}i.sibling.return=i.return,i=i.sibling}};cl=function(){};Pm=function(t,r,i,o){var a=t.memoizedProps;if(a!==o){t=r.stateNode,In(Dt.current);var s=null;switch(i){case"input":a=Ms(t,a),o=Ms(t,o),s=[];break;case"select":a=ve({},a,{value:void 0}),o=ve({},o,{value:void 0}),s=[];break;case"textarea":a=Ts(t,a),o=Ts(t,o),s=[];break;default:typeof a.onClick!=="function"&&typeof o.onClick==="function"&&(t.onclick=Fo)}Is(i,o);var l;i=null;for(d in a)if(!o.hasOwnProperty(d)&&a.hasOwnProperty(d)&&a[d]!=null)if(d==="style"){var c=a[d];for(l in c)c.hasOwnProperty(l)&&(i||(i={}),i[l]="")}else d!=="dangerouslySetInnerHTML"&&d!=="children"&&d!=="suppressContentEditableWarning"&&d!=="suppressHydrationWarning"&&d!=="autoFocus"&&(ui.hasOwnProperty(d)?s||(s=[]):(s=s||[]).push(d,null));for(d in o){var u=o[d];if(c=a!=null?a[d]:void 0,o.hasOwnProperty(d)&&u!==c&&(u!=null||c!=null))if(d==="style")if(c){for(l in c)!c.hasOwnProperty(l)||u&&u.hasOwnProperty(l)||(i||(i={}),i[l]="");for(l in u)u.hasOwnProperty(l)&&c[l]!==u[l]&&(i||(i={}),i[l]=u[l])}else i||(s||(s=[]),s.push(d,i)),i=u;else d==="dangerouslySetInnerHTML"?(u=u?u.__html:void 0,c=c?c.__html:void 0,u!=null&&c!==u&&(s=s||[]).push(d,u)):d==="children"?typeof u!=="string"&&typeof u!=="number"||(s=s||[]).push(d,""+u):d!=="suppressContentEditableWarning"&&d!=="suppressHydrationWarning"&&(ui.hasOwnProperty(d)?(u!=null&&d==="onScroll"&&pe("scroll",t),s||c===u||(s=[])):(s=s||[]).push(d,u))}i&&(s=s||[]).push("style",i);var d=s;if(r.updateQueue=d)r.flags|=4}};Tm=function(t,r,i,o){i!==o&&(r.flags|=4)};P_=typeof WeakSet==="function"?WeakSet:Set;I_=Math.ceil,Qo=Kt.ReactCurrentDispatcher,Jl=Kt.ReactCurrentOwner,gt=Kt.ReactCurrentBatchConfig,ur=Sn(0);Ym=function(t,r,i){if(t!==null)if(t.memoizedProps!==r.pendingProps||Je.current)qe=!0;else{if((t.lanes&i)===0&&(r.flags&128)===0)return qe=!1,L_(t,r,i);qe=(t.flags&131072)!==0?!0:!1}else qe=!1,he&&(r.flags&1048576)!==0&&Gd(r,Ho,r.index);switch(r.lanes=0,r.tag){case 2:var o=r.type;Eo(t,r),t=r.pendingProps;var a=yr(r,He.current);hr(r,i),a=Gl(null,r,o,t,a,i);var s=Kl();return r.flags|=1,typeof a==="object"&&a!==null&&typeof a.render==="function"&&a.$$typeof===void 0?(r.tag=1,r.memoizedState=null,r.updateQueue=null,et(o)?(s=!0,Wo(r)):s=!1,r.memoizedState=a.state!==null&&a.state!==void 0?a.state:null,Hl(r),a.updater=sa,r.stateNode=a,a._reactInternals=r,rl(r,o,t,i),r=al(null,r,o,!0,s,i)):(r.tag=0,he&&s&&Ol(r),Xe(null,r,a,i),r=r.child),r;case 16:o=r.elementType;e:{switch(Eo(t,r),t=r.pendingProps,a=o._init,o=a(o._payload),r.type=o,a=r.tag=Y_(o),t=wt(o,t),a){case 0:r=ol(null,r,o,t,i);break e;case 1:r=Hu(null,r,o,t,i);break e;case 11:r=Wu(null,r,o,t,i);break e;case 14:r=$u(null,r,o,wt(o.type,t),i);break e}throw Error(A(306,o,""))}return r;case 0:return o=r.type,a=r.pendingProps,a=r.elementType===o?a:wt(o,a),ol(t,r,o,a,i);case 1:return o=r.type,a=r.pendingProps,a=r.elementType===o?a:wt(o,a),Hu(t,r,o,a,i);case 3:e:{if(Em(r),t===null)throw Error(A(387));o=r.pendingProps,s=r.memoizedState,a=s.element,em(t,r),Xo(r,o,null,i);var l=r.memoizedState;if(o=l.element,s.isDehydrated)if(s={element:o,isDehydrated:!1,cache:l.cache,pendingSuspenseBoundaries:l.pendingSuspenseBoundaries,transitions:l.transitions},r.updateQueue.baseState=s,r.memoizedState=s,r.flags&256){a=br(Error(A(423)),r),r=Yu(t,r,o,i,a);break e}else if(o!==a){a=br(Error(A(424)),r),r=Yu(t,r,o,i,a);break e}else for(ot=mn(r.stateNode.containerInfo.firstChild),at=r,he=!0,Ct=null,i=qd(r,null,o,i),r.child=i;i;)i.flags=i.flags&-3|4096,i=i.sibling;else{if(vr(),o===a){r=Gt(t,r,i);break e}Xe(t,r,o,i)}r=r.child}return r;case 5:return tm(r),t===null&&el(r),o=r.type,a=r.pendingProps,s=t!==null?t.memoizedProps:null,l=a.children,Ks(o,a)?l=null:s!==null&&Ks(o,s)&&(r.flags|=32),Nm(t,r),Xe(t,r,l,i),r.child;case 6:return t===null&&el(r),null;case 13:return Lm(t,r,i);case 4:return Yl(r,r.stateNode.containerInfo),o=r.pendingProps,t===null?r.child=Sr(r,null,o,i):Xe(t,r,o,i),r.child;case 11:return o=r.type,a=r.pendingProps,a=r.elementType===o?a:wt(o,a),Wu(t,r,o,a,i);case 7:return Xe(t,r,r.pendingProps,i),r.child;case 8:return Xe(t,r,r.pendingProps.children,i),r.child;case 12:return Xe(t,r,r.pendingProps.children,i),r.child;case 10:e:{if(o=r.type._context,a=r.pendingProps,s=r.memoizedProps,l=a.value,de(Yo,o._currentValue),o._currentValue=l,s!==null)if(Lt(s.value,l)){if(s.children===a.children&&!Je.current){r=Gt(t,r,i);break e}}else for(s=r.child,s!==null&&(s.return=r);s!==null;){var c=s.dependencies;if(c!==null){l=s.child;for(var u=c.firstContext;u!==null;){if(u.context===o){if(s.tag===1){u=Ut(-1,i&-i),u.tag=2;var d=s.updateQueue;if(d!==null){d=d.shared;var f=d.pending;f===null?u.next=u:(u.next=f.next,f.next=u),d.pending=u}}s.lanes|=i,u=s.alternate,u!==null&&(u.lanes|=i),tl(s.return,i,r),c.lanes|=i;break}u=u.next}}else if(s.tag===10)l=s.type===r.type?null:s.child;else if(s.tag===18){if(l=s.return,l===null)throw Error(A(341));l.lanes|=i,c=l.alternate,c!==null&&(c.lanes|=i),tl(l,i,r),l=s.sibling}else l=s.child;if(l!==null)l.return=s;else for(l=s;l!==null;){if(l===r){l=null;break}if(s=l.sibling,s!==null){s.return=l.return,l=s;break}l=l.return}s=l}Xe(t,r,a.children,i),r=r.child}return r;case 9:return a=r.type,o=r.pendingProps.children,hr(r,i),a=_t(a),o=o(a),r.flags|=1,Xe(t,r,o,i),r.child;case 14:return o=r.type,a=wt(o,r.pendingProps),a=wt(o.type,a),$u(t,r,o,a,i);case 15:return km(t,r,r.type,r.pendingProps,i);case 17:return o=r.type,a=r.pendingProps,a=r.elementType===o?a:wt(o,a),Eo(t,r),r.tag=1,et(o)?(t=!0,Wo(r)):t=!1,hr(r,i),xm(r,o,a),rl(r,o,a,i),al(null,r,o,!0,t,i);case 19:return Mm(t,r,i);case 22:return Cm(t,r,i)}throw Error(A(156,r.tag))};Km=typeof reportError==="function"?reportError:function(t){console.error(t)};da.prototype.render=sc.prototype.render=function(t){var r=this._internalRoot;if(r===null)throw Error(A(409));Gm(t,r,null,null)};da.prototype.unmount=sc.prototype.unmount=function(){var t=this._internalRoot;if(t!==null){this._internalRoot=null;var r=t.containerInfo;nc(function(){Gm(null,t,null,null)}),r[Nr]=null}};da.prototype.unstable_scheduleHydration=function(t){if(t){var r=Cd();t={blockedOn:null,target:t,priority:r};for(var i=0;i<on.length&&r!==0&&r<on[i].priority;i++);on.splice(i,0,t),i===0&&Ed(t)}};wd=function(t){switch(t.tag){case 3:var r=t.stateNode;if(r.current.memoizedState.isDehydrated){var i=Gr(r.pendingLanes);i!==0&&(Nl(r,i|1),tt(r,be()),(re&6)===0&&(wr=be()+500,xn()))}break;case 13:nc(function(){var o=jt(t,1);if(o!==null){var a=je();Et(o,t,1,a)}}),ac(t,1)}};El=function(t){if(t.tag===13){var r=jt(t,134217728);if(r!==null){var i=je();Et(r,t,134217728,i)}ac(t,134217728)}};kd=function(t){if(t.tag===13){var r=hn(t),i=jt(t,r);if(i!==null){var o=je();Et(i,t,r,o)}ac(t,r)}};Cd=function(){return ce};Nd=function(t,r){var i=ce;try{return ce=t,r()}finally{ce=i}};zs=function(t,r,i){switch(r){case"input":if(Rs(t,i),r=i.name,i.type==="radio"&&r!=null){for(i=t;i.parentNode;)i=i.parentNode;i=i.querySelectorAll("input[name="+JSON.stringify(""+r)+'][type="radio"]');for(r=0;r<i.length;r++){var o=i[r];if(o!==t&&o.form===t.form){var a=Dl(o);if(!a)throw Error(A(90));ad(o),Rs(o,a)}}}break;case"textarea":ld(t,i);break;case"select":r=i.value,r!=null&&dr(t,!!i.multiple,r,!1)}};pd=O_;fd=nc;Yr={findFiberByHostInstance:Tn,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},G_={bundleType:Yr.bundleType,version:Yr.version,rendererPackageName:Yr.rendererPackageName,rendererConfig:Yr.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:Kt.ReactCurrentDispatcher,findHostInstanceByFiber:function(t){return t=cg(t),t===null?null:t.stateNode},findFiberByHostInstance:Yr.findFiberByHostInstance||j_,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){if(er=__REACT_DEVTOOLS_GLOBAL_HOOK__,!er.isDisabled&&er.supportsFiber)try{ea=er.inject(G_),It=er}catch(t){}}});function qm(){if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!=="function")return;try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(qm)}catch(t){console.error(t)}}var Jm=$a(()=>{Zm();qm()});var ep=e(function(Z_){Jm();Z_.createRoot=lc,Z_.hydrateRoot=cc;var Q_});Be();var fh=Wa(ep(),1);function S(t,r,i,o){let a=String(t?.[r]??i);if(!o)return a;return a.replace(/\{(\w+)\}/g,(s,l)=>{let c=o[l];return c===void 0||c===null?"":String(c)})}Be();var q_=Symbol.for("react.element"),J_=Symbol.for("react.fragment"),ey=Object.prototype.hasOwnProperty,ty=Ir.ReactCurrentOwner,ny={key:!0,ref:!0,__self:!0,__source:!0};function tp(t,r,i){var o,a={},s=null,l=null;i!==void 0&&(s=""+i),r.key!==void 0&&(s=""+r.key),r.ref!==void 0&&(l=r.ref);for(o in r)ey.call(r,o)&&!ny.hasOwnProperty(o)&&(a[o]=r[o]);if(t&&t.defaultProps)for(o in r=t.defaultProps,r)a[o]===void 0&&(a[o]=r[o]);return{$$typeof:q_,type:t,key:s,ref:l,props:a,_owner:ty.current}}var Mt=J_,m=tp,N=tp;function np({state:t}){let{analysis_info_view:r,ui_text:i}=t,o=Object.entries(r.parameters??{}),a=(r.analysis_type||"").trim().toLowerCase(),s=a?S(i,`simulation.analysis_label.${a}`,r.analysis_type):"";return m("div",{className:"tab-surface",children:N("div",{className:"content-card content-card--scrollable",children:[N("div",{className:"info-grid",children:[N("div",{className:"info-row",children:[m("div",{className:"card-title",children:S(i,"simulation.analysis_info.analysis_type","Analysis Type")}),m("div",{className:"info-row__value",children:s||S(i,"simulation.analysis_info.not_loaded","Not Loaded")})]}),N("div",{className:"info-row",children:[m("div",{className:"card-title",children:S(i,"simulation.analysis_info.executor","Executor")}),m("div",{className:"info-row__value",children:r.executor||S(i,"simulation.analysis_info.not_loaded","Not Loaded")})]}),N("div",{className:"info-row",children:[m("div",{className:"card-title",children:S(i,"simulation.analysis_info.file","File")}),m("div",{className:"info-row__value",children:r.file_name||S(i,"simulation.analysis_info.not_loaded","Not Loaded")})]}),N("div",{className:"info-row",children:[m("div",{className:"card-title",children:S(i,"simulation.analysis_info.x_axis","X Axis")}),m("div",{className:"info-row__value",children:r.x_axis_label||S(i,"simulation.analysis_info.undefined","Undefined")})]})]}),N("div",{className:"content-card content-card--scrollable",children:[m("div",{className:"card-title",children:S(i,"simulation.analysis_info.parameters","Parameters")}),m("div",{className:"parameter-list",children:o.length?o.map(([l,c])=>N("div",{className:"parameter-row",children:[m("div",{className:"parameter-row__key",children:l}),m("div",{className:"parameter-row__value",children:String(c??"")})]},l)):m("div",{className:"muted-text",children:S(i,"simulation.analysis_info.empty_parameters","No structured parameters are available.")})})]})]})})}function Er({title:t,description:r,actions:i}){return N("div",{className:"compact-toolbar",children:[N("div",{className:"compact-toolbar__meta",children:[m("div",{className:"compact-toolbar__title",children:t}),r?m("div",{className:"compact-toolbar__description",children:r}):null]}),i?m("div",{className:"compact-toolbar__actions",children:i}):null]})}function rp({state:t,bridge:r}){let{asc_conversion_view:i,ui_text:o}=t;return N("div",{className:"tab-surface",children:[m(Er,{title:S(o,"simulation.asc.title","ASC Conversion"),description:S(o,"simulation.asc.description","Choose one or more LTspice .asc files and the system will generate the corresponding .cir files in the current workspace directory.")}),m("div",{className:"content-card content-card--scrollable",children:N("div",{className:"table-toolbar-grid",children:[N("label",{className:"field-row field-row--grow",children:[m("span",{className:"field-row__label",children:S(o,"simulation.asc.files","ASC Files")}),m("input",{className:"field-input",value:i.selected_files_summary||S(o,"simulation.asc.not_selected","Not Selected"),readOnly:!0})]}),m("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!i.can_choose_files,onClick:()=>r?.chooseAscFilesForConversion(),children:S(o,"simulation.asc.choose_and_convert","Choose and Convert")})]})})]})}Be();Be();Be();var ip={width:0,height:0};function vt(){let[t,r]=Y(null),[i,o]=Y(ip),a=U(()=>(s)=>{r(s)},[]);return H(()=>{if(t===null){o(ip);return}let s=()=>{let c=Math.round(t.clientWidth),u=Math.round(t.clientHeight);o((d)=>{if(d.width===c&&d.height===u)return d;return{width:c,height:u}})};if(s(),typeof ResizeObserver>"u")return window.addEventListener("resize",s),()=>{window.removeEventListener("resize",s)};let l=new ResizeObserver(()=>{s()});return l.observe(t),()=>{l.disconnect()}},[t]),{ref:a,width:i.width,height:i.height}}var ry=280,iy=220,oy=520,ay=320,sy=10,op=16;function Mi(t,r,i){return Math.min(Math.max(t,r),i)}function bn({sidebar:t,sidebarConfig:r,main:i,footer:o}){let a=Boolean(t),s=Boolean(a&&r?.resizable),l=r?.defaultSize??ry,c=r?.minSize??iy,u=r?.maxSize??oy,d=r?.mainMinSize??ay,{ref:f,width:g}=vt(),_=se(null),[x,b]=Y(l),w=se(null),[P,y]=Y(!1),p=U(()=>{let L=g>0?Math.max(96,g-d-(s?sy:0)):u,B=Math.max(96,Math.min(u,L));return{min:Math.min(c,B),max:B}},[u,c,d,g,s]);H(()=>{if(!a)return;b((L)=>Mi(L,p.min,p.max))},[a,p.max,p.min]),H(()=>{if(!P)return;let L=(X)=>{let Oe=w.current;if(Oe===null)return;let dt=Oe.startSize+X.clientX-Oe.startX;b(Mi(dt,p.min,p.max))},B=()=>{w.current=null,y(!1)},D=document.body.style.cursor,ie=document.body.style.userSelect;return document.body.style.cursor="col-resize",document.body.style.userSelect="none",window.addEventListener("pointermove",L),window.addEventListener("pointerup",B),window.addEventListener("pointercancel",B),()=>{document.body.style.cursor=D,document.body.style.userSelect=ie,window.removeEventListener("pointermove",L),window.removeEventListener("pointerup",B),window.removeEventListener("pointercancel",B)}},[P,p.max,p.min]);let h=a?Mi(x,p.min,p.max):0,v=U(()=>(L)=>{_.current=L,f(L)},[f]);H(()=>{let L=_.current;if(L===null)return;if(!a){L.style.removeProperty("--responsive-pane-sidebar-size");return}L.style.setProperty("--responsive-pane-sidebar-size",`${h}px`)},[a,h]);let k=["responsive-pane",a?"responsive-pane--with-sidebar":"",s?"responsive-pane--resizable":"",P?"responsive-pane--dragging":""].filter(Boolean).join(" ");return N("div",{className:"responsive-pane-shell",children:[N("div",{ref:v,className:k,children:[a?m("aside",{className:"responsive-pane__sidebar",children:t}):null,a&&s?m("div",{role:"separator",tabIndex:0,"aria-label":"Adjust sidebar width","aria-orientation":"vertical",className:`responsive-pane__separator${P?" responsive-pane__separator--dragging":""}`,onPointerDown:(L)=>{if(!s)return;L.preventDefault(),w.current={startX:L.clientX,startSize:h},y(!0)},onKeyDown:(L)=>{if(!s)return;if(L.key==="ArrowLeft"){L.preventDefault(),b((B)=>Mi(B-op,p.min,p.max));return}if(L.key==="ArrowRight"){L.preventDefault(),b((B)=>Mi(B+op,p.min,p.max));return}if(L.key==="Home"){L.preventDefault(),b(p.min);return}if(L.key==="End")L.preventDefault(),b(p.max)}}):null,m("section",{className:"responsive-pane__main",children:i})]}),o?m("div",{className:"responsive-pane__footer",children:o}):null]})}function ma({title:t,signalOptions:r,selectedSignalId:i,onSelectedSignalChange:o,rows:a,emptyMessage:s,uiText:l}){let c=r.find((u)=>u.id===i)??r[0]??null;return N("div",{className:"measurement-floating-panel",children:[N("div",{className:"measurement-floating-panel__drag-bar","data-floating-panel-drag-handle":"true",children:[m("div",{className:"measurement-floating-panel__title",children:t}),m("div",{className:"measurement-floating-panel__drag-hint",children:S(l,"simulation.measurement.drag_hint","Drag to move")})]}),m("div",{className:"measurement-floating-panel__header",children:r.length>1?N("label",{className:"measurement-floating-panel__selector","aria-label":S(l,"simulation.measurement.select_signal_aria","Select measurement signal"),"data-floating-panel-no-drag":"true",children:[m("span",{className:"measurement-floating-panel__selector-label",children:S(l,"common.signal","Signal")}),m("select",{className:"measurement-floating-panel__select",value:i,onChange:(u)=>o(u.target.value),children:r.map((u)=>m("option",{value:u.id,children:u.label},u.id))})]}):c?m("div",{className:"measurement-floating-panel__chip",children:c.label}):null}),a.length?N(Mt,{children:[N("div",{className:"measurement-floating-panel__columns","aria-hidden":"true",children:[m("span",{children:S(l,"common.signal","Signal")}),m("span",{children:"A"}),m("span",{children:"B"}),m("span",{children:"Δ"})]}),m("div",{className:"measurement-floating-panel__rows",children:a.map((u)=>N("div",{className:"measurement-floating-panel__row",children:[N("div",{className:"measurement-floating-panel__signal",children:[m("svg",{className:"measurement-floating-panel__swatch",viewBox:"0 0 10 10","aria-hidden":"true",focusable:"false",children:m("circle",{cx:"5",cy:"5",r:"4",fill:u.color})}),m("span",{className:"measurement-floating-panel__signal-name",children:u.label})]}),m("div",{className:"measurement-floating-panel__value",children:u.valueA}),m("div",{className:"measurement-floating-panel__value",children:u.valueB}),m("div",{className:"measurement-floating-panel__value",children:u.delta})]},u.id))})]}):m("div",{className:"measurement-floating-panel__empty muted-text",children:s})]})}function ap({title:t,signalOptions:r,selectedSignalId:i,onSelectedSignalChange:o,rows:a,emptyMessage:s,uiText:l}){let c=r.find((u)=>u.id===i)??r[0]??null;return N("div",{className:"measurement-floating-panel measurement-floating-panel--point",children:[N("div",{className:"measurement-floating-panel__drag-bar","data-floating-panel-drag-handle":"true",children:[m("div",{className:"measurement-floating-panel__title",children:t}),m("div",{className:"measurement-floating-panel__drag-hint",children:S(l,"simulation.measurement.drag_hint","Drag to move")})]}),m("div",{className:"measurement-floating-panel__header",children:r.length>1?N("label",{className:"measurement-floating-panel__selector","aria-label":S(l,"simulation.measurement_point.select_signal_aria","Select measurement-point signal"),"data-floating-panel-no-drag":"true",children:[m("span",{className:"measurement-floating-panel__selector-label",children:S(l,"common.signal","Signal")}),m("select",{className:"measurement-floating-panel__select",value:i,onChange:(u)=>o(u.target.value),children:r.map((u)=>m("option",{value:u.id,children:u.label},u.id))})]}):c?m("div",{className:"measurement-floating-panel__chip",children:c.label}):null}),a.length?m("div",{className:"measurement-point-floating-panel__rows",children:a.map((u)=>N("div",{className:"measurement-point-floating-panel__row",children:[m("div",{className:"measurement-point-floating-panel__label",children:u.label}),m("div",{className:"measurement-point-floating-panel__value",children:u.valueText})]},u.id))}):m("div",{className:"measurement-floating-panel__empty muted-text",children:s})]})}Be();var ly=0.7,cy=140,uy=96,sp=240,lp=10,cp=16;function Ri(t,r,i){return Math.min(Math.max(t,r),i)}function up({primary:t,secondary:r,defaultPrimaryRatio:i=ly,minPrimarySize:o=cy,minSecondarySize:a=uy,resizable:s=!0}){let l=Ri(i,0.15,0.85),{ref:c,height:u}=vt(),d=se(null),[f,g]=Y(null),_=se(null),[x,b]=Y(!1),w=U(()=>{let v=u>0?Math.max(72,u-a-(s?lp:0)):Math.max(o,sp),k=Math.max(72,v);return{min:Math.min(o,k),max:k}},[o,a,s,u]);H(()=>{if(!x)return;let v=(L)=>{let B=_.current;if(B===null)return;let D=B.startSize+L.clientY-B.startY;g(Ri(D,w.min,w.max))},k=()=>{_.current=null,b(!1)},C=document.body.style.cursor,R=document.body.style.userSelect;return document.body.style.cursor="row-resize",document.body.style.userSelect="none",window.addEventListener("pointermove",v),window.addEventListener("pointerup",k),window.addEventListener("pointercancel",k),()=>{document.body.style.cursor=C,document.body.style.userSelect=R,window.removeEventListener("pointermove",v),window.removeEventListener("pointerup",k),window.removeEventListener("pointercancel",k)}},[x,w.max,w.min]);let P=Ri(f??(u>0?u-(s?lp:0):sp)*l,w.min,w.max),y=U(()=>(v)=>{d.current=v,c(v)},[c]);return H(()=>{let v=d.current;if(v===null)return;v.style.setProperty("--resizable-stack-primary-size",`${P}px`)},[P]),N("div",{ref:y,className:`resizable-stack${x?" resizable-stack--dragging":""}`,children:[m("section",{className:"resizable-stack__primary",children:t}),s?m("div",{role:"separator",tabIndex:0,"aria-label":"Adjust section heights","aria-orientation":"horizontal",className:`resizable-stack__separator${x?" resizable-stack__separator--dragging":""}`,onPointerDown:(v)=>{if(!s)return;v.preventDefault(),_.current={startY:v.clientY,startSize:P},g(P),b(!0)},onKeyDown:(v)=>{if(!s)return;if(v.key==="ArrowUp"){v.preventDefault(),g((k)=>Ri((k??P)-cp,w.min,w.max));return}if(v.key==="ArrowDown"){v.preventDefault(),g((k)=>Ri((k??P)+cp,w.min,w.max));return}if(v.key==="Home"){v.preventDefault(),g(w.min);return}if(v.key==="End")v.preventDefault(),g(w.max)}}):null,m("section",{className:"resizable-stack__secondary",children:r})]})}function pa({selectableTitle:t,selectableItems:r,emptySelectableMessage:i,visibleTitle:o,visibleItems:a,emptyVisibleMessage:s,defaultPrimaryRatio:l=0.7}){return m("div",{className:"content-card signal-sidebar",children:m(up,{defaultPrimaryRatio:l,minPrimarySize:144,minSecondarySize:104,primary:N("section",{className:"signal-sidebar__panel",children:[m("div",{className:"signal-sidebar__panel-header",children:m("div",{className:"signal-sidebar__panel-title",children:t})}),m("div",{className:"signal-sidebar__panel-body",children:m("div",{className:"signal-list signal-sidebar__selection-list",children:r.length?r.map((c)=>N("label",{className:"signal-item signal-item--checkbox",children:[N("div",{className:"signal-item__stack",children:[m("span",{className:"signal-item__name",children:c.label}),c.meta?m("span",{className:"signal-item__meta",children:c.meta}):null]}),m("input",{type:"checkbox",checked:c.checked,onChange:(u)=>c.onCheckedChange(u.target.checked)})]},c.id)):m("div",{className:"signal-item",children:m("span",{className:"muted-text",children:i})})})})]}),secondary:N("section",{className:"signal-sidebar__panel",children:[m("div",{className:"signal-sidebar__panel-header",children:m("div",{className:"signal-sidebar__panel-title",children:o})}),m("div",{className:"signal-sidebar__panel-body",children:m("div",{className:"signal-sidebar__visible-list",children:a.length?a.map((c)=>N("div",{className:"signal-sidebar__visible-item",children:[m("svg",{className:"signal-sidebar__visible-swatch",viewBox:"0 0 24 12","aria-hidden":"true",focusable:"false",children:m("line",{x1:"1",x2:"23",y1:"6",y2:"6",stroke:c.color,strokeWidth:"2",strokeLinecap:"round",strokeDasharray:c.lineStyle==="dash"?"6 4":void 0,className:"signal-sidebar__visible-line"})}),N("div",{className:"signal-sidebar__visible-copy",children:[m("span",{className:"signal-sidebar__visible-name",children:c.label}),c.meta?m("span",{className:"signal-sidebar__visible-meta",children:c.meta}):null]})]},c.id)):m("div",{className:"muted-text",children:s})})})]})})})}Be();Be();var dy=10,my='[data-floating-panel-drag-handle="true"]',py=['[data-floating-panel-no-drag="true"]',"button","input","select","textarea","a"].join(", ");function fa(t,r,i){return Math.min(Math.max(t,r),i)}function dp({containerWidth:t,containerHeight:r,children:i,margin:o=dy,defaultTop:a,defaultRight:s}){let{ref:l,width:c,height:u}=vt(),d=se(null),f=se(null),[g,_]=Y(null),[x,b]=Y(!1),w=Math.max(o,a??o),P=Math.max(o,s??o),y=U(()=>Math.max(o,t-c-o),[t,o,c]),p=U(()=>Math.max(o,r-u-o),[r,o,u]),h=U(()=>(k)=>({left:fa(k.left,o,y),top:fa(k.top,o,p)}),[o,y,p]);H(()=>{_((k)=>{if(k===null)return k;let C=h(k);if(C.left===k.left&&C.top===k.top)return k;return C})},[h]),H(()=>{if(!x)return;let k=(B)=>{let D=f.current;if(D===null||B.pointerId!==D.pointerId)return;let ie=B.clientX-D.startClientX,X=B.clientY-D.startClientY;_(h({left:D.originLeft+ie,top:D.originTop+X}))},C=(B)=>{let D=f.current;if(D===null||B!==D.pointerId)return;f.current=null,b(!1)},R=(B)=>{C(B.pointerId)},L=(B)=>{C(B.pointerId)};return window.addEventListener("pointermove",k),window.addEventListener("pointerup",R),window.addEventListener("pointercancel",L),()=>{window.removeEventListener("pointermove",k),window.removeEventListener("pointerup",R),window.removeEventListener("pointercancel",L)}},[h,x]);let v=(k)=>{let C=k.target;if(C===null)return;if(C.closest(py))return;if(!C.closest(my))return;let R=d.current,L=c||R?.offsetWidth||0,B=Math.max(o,t-L-P),D=g??{left:B,top:fa(w,o,p)};k.preventDefault(),f.current={pointerId:k.pointerId,startClientX:k.clientX,startClientY:k.clientY,originLeft:D.left,originTop:D.top},_(D),b(!0)};return Xa(()=>{let k=d.current;if(k===null)return;if(g===null){k.style.top=`${fa(w,o,p)}px`,k.style.left="auto",k.style.right=`${P}px`;return}k.style.left=`${g.left}px`,k.style.top=`${g.top}px`,k.style.right="auto"},[o,p,g,P,w]),m("div",{ref:(k)=>{l(k),d.current=k},className:`svg-chart__floating-panel-shell${x?" svg-chart__floating-panel-shell--dragging":""}`,onPointerDown:v,children:i})}function Pi(t){return Math.abs(t)<=0.000000000001?0:t}function Yn(t){return t.replace(/(\.\d*?[1-9])0+$/u,"$1").replace(/\.0+$/u,"").replace(/^-0$/u,"0")}function Hn(t){let r=Pi(t),i=Math.abs(r);if(i>=100)return Yn(r.toFixed(0));if(i>=10)return Yn(r.toFixed(1));if(i>=1)return Yn(r.toFixed(2));if(i>=0.01)return Yn(r.toFixed(3));return Yn(r.toExponential(2).replace("e+","e"))}function mp(t){if(t==null||!Number.isFinite(t))return"--";let r=Pi(t),i=Math.abs(r);if(i===0)return"0";if(i>=1e9)return`${Hn(r/1e9)}G`;if(i>=1e6)return`${Hn(r/1e6)}M`;if(i>=1000)return`${Hn(r/1000)}k`;if(i>=0.01)return Hn(r);if(i>=0.001)return`${Hn(r/0.001)}m`;if(i>=0.000001)return`${Hn(r/0.000001)}u`;if(i>=0.000000001)return`${Hn(r/0.000000001)}n`;return Yn(r.toExponential(2).replace("e+","e"))}function Ot(t,r=6){if(t==null||!Number.isFinite(t))return"--";let i=Pi(t);if(i===0)return"0";return Yn(i.toPrecision(r).replace("e+","e"))}var fy=900,hy=420,fc=0.000000000001,gy="8 6";function wn(t,r,i){return Math.min(Math.max(t,r),i)}function _y(t,r){if(!Number.isFinite(t)||t<=0)return 1;let i=t/Math.max(r,1),o=10**Math.floor(Math.log10(i)),a=i/o;if(a<=1)return 1*o;if(a<=2)return 2*o;if(a<=2.5)return 2.5*o;if(a<=5)return 5*o;return 10*o}function ha(t,r){if(!Number.isFinite(t))return null;if(!r)return t;if(t<=0)return null;let i=Math.log10(t);return Number.isFinite(i)?i:null}function yy(t){return t==="right"?"right":"left"}function vy(t){return t==="dash"?"dash":"solid"}function Sy(t,r,i){return t==="right"?i:r}function uc(t,r,i){if(t===null||r===null||!Number.isFinite(t)||!Number.isFinite(r))return null;let o=ha(t,i),a=ha(r,i);if(o===null||a===null)return null;return o<=a?{min:o,max:a}:{min:a,max:o}}function dc(t,r){if(t===null||r===null)return null;let i=Math.max(t.min,r.min),o=Math.min(t.max,r.max);if(!Number.isFinite(i)||!Number.isFinite(o)||o<=i)return null;return{min:i,max:o}}function xy(t,r,i){let o=Math.min(t.x.length,t.y.length),a=[];for(let s=0;s<o;s+=1){let l=ha(t.x[s]??Number.NaN,r),c=ha(t.y[s]??Number.NaN,i);if(l===null||c===null)continue;a.push({x:l,y:c})}return a}function mc(t,r,i){if(!t.length)return null;let o=Math.min(...t),a=Math.max(...t);if(!Number.isFinite(o)||!Number.isFinite(a))return null;if(Math.abs(a-o)<=fc){let c=Math.max(Math.abs(o),i,1)*Math.max(r,0.08);return{min:o-c,max:a+c}}let s=Math.max((a-o)*r,i);return{min:o-s,max:a+s}}function by(t,r,i){let o=Math.max(240,Math.round(t)||fy),a=Math.max(180,Math.round(r)||hy),s=i?wn(Math.round(o*0.1),58,78):wn(Math.round(o*0.078),46,62),l=i?wn(Math.round(o*0.1),58,78):wn(Math.round(o*0.03),18,28),c=wn(Math.round(a*0.045),12,20),u=wn(Math.round(a*0.15),52,76),d=120,f=92,g=Math.max(120,o-120),_=Math.max(92,a-92),x=Math.min(1,g/Math.max(s+l,1)),b=Math.min(1,_/Math.max(c+u,1)),w=s*x,P=o-l*x,y=c*b,p=a-u*b;return{svgWidth:o,svgHeight:a,plotLeft:w,plotRight:P,plotTop:y,plotBottom:p}}function pp(t,r,i){let o=Math.max(r.max-r.min,fc),a=(t-r.min)/o;return i.plotLeft+a*(i.plotRight-i.plotLeft)}function fp(t,r,i){let o=Math.max(r.max-r.min,fc),a=(t-r.min)/o;return i.plotBottom-a*(i.plotBottom-i.plotTop)}function wy(t,r){let i=t.max-t.min,o=_y(i,r);if(!Number.isFinite(o)||o<=0)return[t.min,t.max];let a=Math.floor(t.min/o)*o,s=Math.ceil(t.max/o)*o,l=Math.min(128,Math.ceil((s-a)/o)+1),c=[];for(let u=0;u<l;u+=1){let d=Pi(a+o*u);if(d<t.min-o*0.35||d>t.max+o*0.35)continue;c.push(d)}if(!c.length)c.push(t.min,t.max);return c}function pc(t,r,i,o,a){return wy(t,i).map((s)=>({value:s,label:mp(a?10**s:s),position:o==="horizontal"?pp(s,t,r):fp(s,t,r)}))}function ky(t,r,i,o){return t.map((a)=>`${pp(a.x,r,o).toFixed(2)},${fp(a.y,i,o).toFixed(2)}`).join(" ")}function Cy(t){return t==="dash"?gy:void 0}function hp({series:t,xLabel:r,yLabel:i,secondaryYLabel:o,logX:a,logY:s,rightLogY:l=!1,width:c,height:u,viewWindow:d}){let f=t.map((V)=>{let oe=yy(V.axis_key),J=vy(V.line_style),ue=xy(V,a,Sy(oe,s,l));return{name:V.name,color:V.color||"#2563eb",axisKey:oe,lineStyle:J,component:V.component||"",points:ue}}).filter((V)=>V.points.length>0);if(!f.length)return null;let g=f.some((V)=>V.axisKey==="right"),_=by(c,u,g),x=f.flatMap((V)=>V.points.map((oe)=>oe.x)),b=f.filter((V)=>V.axisKey==="left"),w=f.filter((V)=>V.axisKey==="right"),P=(b.length?b:f).flatMap((V)=>V.points.map((oe)=>oe.y)),y=w.flatMap((V)=>V.points.map((oe)=>oe.y)),p=mc(x,0.02,a?0.05:0),h=mc(P,0.08,0),v=g?mc(y,0.08,0):null;if(p===null||h===null)return null;let k=d?.active?dc(uc(d.xMin,d.xMax,a),p):null,C=d?.active?dc(uc(d.leftYMin,d.leftYMax,s),h):null,R=d?.active&&v!==null?dc(uc(d.rightYMin,d.rightYMax,l),v):null,L=k??p,B=C??h,D=v===null?null:R??v,ie=wn(Math.round((_.plotRight-_.plotLeft)/82),6,14),X=wn(Math.round((_.plotBottom-_.plotTop)/40),6,12),Oe=pc(L,_,ie,"horizontal",a),dt=pc(B,_,X,"vertical",s),O=D===null?[]:pc(D,_,X,"vertical",l),te=f.map((V)=>{let oe=V.axisKey==="right"&&D!==null?D:B;return{name:V.name,color:V.color,axisKey:V.axisKey,lineStyle:V.lineStyle,component:V.component,polylinePoints:ky(V.points,L,oe,_),strokeDasharray:Cy(V.lineStyle)}});return{viewport:_,xDomain:L,leftDomain:B,rightDomain:D,xLabel:r||"X",leftAxisLabel:i||(g?"Left axis":"Y"),rightAxisLabel:g?o||"Right axis":"",hasRightAxis:g,xTicks:Oe,leftTicks:dt,rightTicks:O,renderedSeries:te}}var hc=5,Ny=9,Ey=9,Ly=19,My=34,gp=32,Ry=14,Py=24,gc=16,Ty=12,_p=8;function Ay(t,r){if(!Number.isFinite(t))return null;if(!r)return t;if(t<=0)return null;let i=Math.log10(t);return Number.isFinite(i)?i:null}function Iy(t,r){if(!Number.isFinite(t))return null;if(!r)return t;if(t<=0)return null;let i=Math.log10(t);return Number.isFinite(i)?i:null}function yp(t,r){return r?10**t:t}function vp(t,r){if(!r)return t;return 10**t}function Dy(t,r,i){return t==="right"?i:r}function ga({title:t,headerActions:r,floatingPanels:i=[],measurementCursors:o,measurementPoint:a,series:s,xLabel:l,yLabel:c,secondaryYLabel:u,logX:d=!1,logY:f=!1,rightLogY:g=!1,viewWindow:_,onViewportChange:x,emptyMessage:b}){let{ref:w,width:P,height:y}=vt(),p=se(null),h=se(o?.onCursorMove),v=se(a?.onMove),k=se(x),C=se(null),R=se(null),[L,B]=Y(null),[D,ie]=Y(null),[X,Oe]=Y(null),dt=Ua().replace(/[:]/g,""),O=U(()=>hp({series:s,xLabel:l,yLabel:c,secondaryYLabel:u,logX:d,logY:f,rightLogY:g,width:P,height:y,viewWindow:_}),[y,P,d,f,g,u,s,_,l,c]),te=t?.trim()??"",V=te.length>0||r!==void 0,oe=O?.viewport??null,J=oe?.plotLeft??0,ue=oe?.plotRight??0,M=oe?.plotTop??0,j=oe?.plotBottom??0,W=oe?.svgHeight??0,we=oe?.svgWidth??0,ee=O?.xDomain??null,me=O?.leftDomain??null,xe=O?.rightDomain??null,le=O?.hasRightAxis??!1,Vt=O?.xTicks??[],$i=O?.leftTicks??[],Oa=O?.rightTicks??[],Hi=O?.renderedSeries??[],Yi=O?.leftAxisLabel??c,Ui=O?.rightAxisLabel??(u??""),En=(M+j)/2,za=(J+ue)/2,Ba=Math.min(W-10,j+My),Xi=gp,ji=we-gp;H(()=>{h.current=o?.onCursorMove},[o?.onCursorMove]),H(()=>{v.current=a?.onMove},[a?.onMove]),H(()=>{k.current=x},[x]),H(()=>{C.current=L},[L]),H(()=>{R.current=X},[X]);let Gi=(T)=>{if(ee===null)return null;let ae=p.current;if(ae===null)return null;let K=ae.getBoundingClientRect();if(K.width<=0)return null;let ne=(T-K.left)/K.width*we,Le=Math.min(Math.max(ne,J),ue),Me=Math.max(ue-J,0.000000000001),rt=ee.min+(Le-J)/Me*(ee.max-ee.min);return yp(rt,d)},Pr=(T)=>{if(ee===null)return null;if(T===null)return null;let ae=Ay(T,d);if(ae===null)return null;let K=Math.min(Math.max(ae,ee.min),ee.max),ne=Math.max(ee.max-ee.min,0.000000000001);return J+(K-ee.min)/ne*(ue-J)},Fa=(T,ae)=>{if(T===null)return null;let K=Iy(T,Dy(ae,f,g));if(K===null)return null;let ne=ae==="right"&&xe!==null?xe:me;if(ne===null)return null;let Le=Math.min(Math.max(K,ne.min),ne.max),Me=Math.max(ne.max-ne.min,0.000000000001);return j-(Le-ne.min)/Me*(j-M)},Tr=(T,ae)=>{if(ee===null||me===null)return null;let K=Math.min(Math.max(T,J),ue),ne=Math.min(Math.max(ae,M),j),Le=Math.max(ue-J,0.000000000001),Me=Math.max(j-M,0.000000000001),rt=ee.min+(K-J)/Le*(ee.max-ee.min),hh=me.min+(j-ne)/Me*(me.max-me.min),Oc=xe===null?null:xe.min+(j-ne)/Me*(xe.max-xe.min);return{svgX:K,svgY:ne,displayX:yp(rt,d),leftDisplayY:vp(hh,f),rightDisplayY:Oc===null?null:vp(Oc,g)}},I=(T,ae)=>{let K=p.current;if(K===null)return null;let ne=K.getBoundingClientRect();if(ne.width<=0||ne.height<=0)return null;let Le=(T-ne.left)/ne.width*we,Me=(ae-ne.top)/ne.height*W;return Tr(Le,Me)},z=(T,ae)=>{let K=Gi(ae);if(K===null)return;if(B(T),ie(K),T.kind==="measurement-cursor"){h.current?.(T.cursorId,K);return}v.current?.(K)},Q=(T,ae)=>{if(k.current===void 0||C.current!==null)return;let K=I(T,ae);if(K===null)return;Oe({anchorSvgX:K.svgX,anchorSvgY:K.svgY,currentSvgX:K.svgX,currentSvgY:K.svgY})};H(()=>{if(O===null||L===null){ie(null);return}let T=(K)=>{let ne=C.current;if(ne===null)return;let Le=Gi(K.clientX);if(Le===null)return;if(ie(Le),ne.kind==="measurement-cursor"){h.current?.(ne.cursorId,Le);return}v.current?.(Le)},ae=()=>{B(null),ie(null)};return window.addEventListener("pointermove",T),window.addEventListener("pointerup",ae),window.addEventListener("pointercancel",ae),()=>{window.removeEventListener("pointermove",T),window.removeEventListener("pointerup",ae),window.removeEventListener("pointercancel",ae)}},[L,O,d,J,ue,we,ee?.max,ee?.min]),H(()=>{if(O===null||X===null)return;let T=(K)=>{let ne=R.current;if(ne===null)return;let Le=I(K.clientX,K.clientY);if(Le===null)return;Oe({...ne,currentSvgX:Le.svgX,currentSvgY:Le.svgY})},ae=()=>{let K=R.current;if(Oe(null),K===null)return;let ne=Math.abs(K.currentSvgX-K.anchorSvgX),Le=Math.abs(K.currentSvgY-K.anchorSvgY);if(ne<_p||Le<_p)return;let Me=Tr(Math.min(K.anchorSvgX,K.currentSvgX),Math.min(K.anchorSvgY,K.currentSvgY)),rt=Tr(Math.max(K.anchorSvgX,K.currentSvgX),Math.max(K.anchorSvgY,K.currentSvgY));if(Me===null||rt===null)return;k.current?.({active:!0,xMin:Math.min(Me.displayX,rt.displayX),xMax:Math.max(Me.displayX,rt.displayX),leftYMin:Math.min(Me.leftDisplayY,rt.leftDisplayY),leftYMax:Math.max(Me.leftDisplayY,rt.leftDisplayY),rightYMin:Me.rightDisplayY===null||rt.rightDisplayY===null?null:Math.min(Me.rightDisplayY,rt.rightDisplayY),rightYMax:Me.rightDisplayY===null||rt.rightDisplayY===null?null:Math.max(Me.rightDisplayY,rt.rightDisplayY)})};return window.addEventListener("pointermove",T),window.addEventListener("pointerup",ae),window.addEventListener("pointercancel",ae),()=>{window.removeEventListener("pointermove",T),window.removeEventListener("pointerup",ae),window.removeEventListener("pointercancel",ae)}},[X,O,me?.max,me?.min,d,f,j,J,ue,M,xe?.max,xe?.min,g,W,we,ee?.max,ee?.min]);let Ke=[{id:"a",label:"A",visible:o?.cursorAVisible??!1,displayX:L?.kind==="measurement-cursor"&&L.cursorId==="a"&&D!==null?D:o?.cursorAX??null},{id:"b",label:"B",visible:o?.cursorBVisible??!1,displayX:L?.kind==="measurement-cursor"&&L.cursorId==="b"&&D!==null?D:o?.cursorBX??null}].map((T)=>({...T,plotX:T.visible?Pr(T.displayX):null,badgeText:`${T.label} ${Ot(T.displayX)}`})).filter((T)=>T.visible&&T.plotX!==null),St=L?.kind==="measurement-point"&&D!==null?D:a?.displayX??null,Te=a?.visible?{plotX:Pr(St),plotY:Fa(a.valueY,a.axisKey??"left")}:null,Qe=X===null?null:{x:Math.min(X.anchorSvgX,X.currentSvgX),y:Math.min(X.anchorSvgY,X.currentSvgY),width:Math.abs(X.currentSvgX-X.anchorSvgX),height:Math.abs(X.currentSvgY-X.anchorSvgY)};return N("div",{className:"svg-chart-shell",children:[V?N("div",{className:"svg-chart-header",children:[te?m("div",{className:"svg-chart-title",children:te}):m("div",{className:"svg-chart-header__spacer"}),r?m("div",{className:"svg-chart-header__actions",children:r}):null]}):null,O===null?m("div",{className:"svg-chart-empty muted-text",children:b}):N("div",{ref:w,className:"svg-chart-frame",children:[N("svg",{ref:p,viewBox:`0 0 ${we} ${W}`,className:"svg-chart","aria-label":"Simulation series chart",children:[m("defs",{children:m("clipPath",{id:dt,children:m("rect",{x:J,y:M,width:ue-J,height:j-M})})}),m("rect",{x:J,y:M,width:ue-J,height:j-M,className:"svg-chart__plot-bg"}),$i.map((T)=>m("line",{x1:J,x2:ue,y1:T.position,y2:T.position,className:"svg-chart__grid"},`grid-y-${T.value}`)),Vt.map((T)=>m("line",{x1:T.position,x2:T.position,y1:M,y2:j,className:"svg-chart__grid"},`grid-x-${T.value}`)),m("line",{x1:J,x2:ue,y1:j,y2:j,className:"svg-chart__axis"}),m("line",{x1:J,x2:J,y1:M,y2:j,className:"svg-chart__axis"}),le?m("line",{x1:ue,x2:ue,y1:M,y2:j,className:"svg-chart__axis"}):null,m("g",{clipPath:`url(#${dt})`,children:Hi.map((T)=>m("polyline",{fill:"none",stroke:T.color,strokeWidth:T.lineStyle==="dash"?"1.7":"2",strokeDasharray:T.strokeDasharray,strokeLinecap:"round",strokeLinejoin:"round",points:T.polylinePoints,className:"svg-chart__series"},T.name))}),m("rect",{x:J,y:M,width:ue-J,height:j-M,className:"svg-chart__interaction-hitbox",onPointerDown:x?(T)=>{T.preventDefault(),Q(T.clientX,T.clientY)}:void 0}),Te&&Te.plotX!==null&&Te.plotY!==null?N("g",{className:"svg-chart__measurement-point",onPointerDown:v.current?(T)=>{T.preventDefault(),T.stopPropagation(),z({kind:"measurement-point"},T.clientX)}:void 0,children:[m("line",{x1:Te.plotX,x2:Te.plotX,y1:M,y2:j,className:"svg-chart__measurement-point-line"}),m("line",{x1:Te.plotX,x2:Te.plotX,y1:M,y2:j,className:"svg-chart__measurement-point-hitbox-line"}),m("circle",{cx:Te.plotX,cy:Te.plotY,r:"10",className:"svg-chart__measurement-point-hitbox-marker"}),m("circle",{cx:Te.plotX,cy:Te.plotY,r:"4.5",className:"svg-chart__measurement-point-marker"})]}):null,Ke.map((T)=>(()=>{let ae=Math.max(Py,T.badgeText.length*6.7+Ty),K=Math.min(Math.max(T.plotX??0,J+ae/2+2),ue-ae/2-2);return N("g",{className:"svg-chart__measurement-cursor",onPointerDown:h.current?(ne)=>{ne.preventDefault(),ne.stopPropagation(),z({kind:"measurement-cursor",cursorId:T.id},ne.clientX)}:void 0,children:[m("line",{x1:T.plotX??0,x2:T.plotX??0,y1:M,y2:j,className:"svg-chart__measurement-cursor-line"}),m("line",{x1:T.plotX??0,x2:T.plotX??0,y1:M,y2:j,className:"svg-chart__measurement-cursor-hitbox"}),m("rect",{x:K-ae/2,y:M+2,rx:gc/2,ry:gc/2,width:ae,height:gc,className:"svg-chart__measurement-cursor-badge"}),m("text",{x:K,y:M+Ry,textAnchor:"middle",className:"svg-chart__measurement-cursor-label",children:T.badgeText})]},`measurement-cursor-${T.id}`)})()),$i.map((T)=>N("g",{children:[m("line",{x1:J,x2:J-hc,y1:T.position,y2:T.position,className:"svg-chart__tick"}),m("text",{x:J-Ny,y:T.position+4,textAnchor:"end",className:"svg-chart__tick-label",children:T.label})]},`left-tick-${T.value}`)),Oa.map((T)=>N("g",{children:[m("line",{x1:ue,x2:ue+hc,y1:T.position,y2:T.position,className:"svg-chart__tick"}),m("text",{x:ue+Ey,y:T.position+4,textAnchor:"start",className:"svg-chart__tick-label",children:T.label})]},`right-tick-${T.value}`)),Vt.map((T)=>N("g",{children:[m("line",{x1:T.position,x2:T.position,y1:j,y2:j+hc,className:"svg-chart__tick"}),m("text",{x:T.position,y:j+Ly,textAnchor:"middle",className:"svg-chart__tick-label",children:T.label})]},`bottom-tick-${T.value}`)),m("text",{x:za,y:Ba,textAnchor:"middle",className:"svg-chart__axis-title",children:O.xLabel}),m("text",{x:Xi,y:En,textAnchor:"middle",transform:`rotate(-90 ${Xi} ${En})`,className:"svg-chart__axis-title",children:Yi}),le?m("text",{x:ji,y:En,textAnchor:"middle",transform:`rotate(90 ${ji} ${En})`,className:"svg-chart__axis-title",children:Ui}):null,Qe!==null?m("rect",{x:Qe.x,y:Qe.y,width:Qe.width,height:Qe.height,className:"svg-chart__viewport-selection"}):null]}),i.map((T)=>m(dp,{containerWidth:P,containerHeight:y,defaultTop:T.defaultTop,defaultRight:T.defaultRight,children:T.content},T.id))]})]})}function Sp(t,r){return(t?.trim()??"")||r}function Oy(t,r){let i=t?.trim().toLowerCase()??"";if(i==="magnitude")return"Mag";if(i==="phase")return"Phase";return r}function zy(t){return new Map(t.available_series.map((r)=>[Sp(r.group_key,r.name),r]))}function By(t,r,i,o){return r.map((a)=>({id:a.name,label:r.length>1?Oy(a.component,a.name):t,color:a.color,valueA:i[a.name]??null,valueB:o[a.name]??null}))}function xp(t){let r=zy(t),i=new Map;for(let o of t.visible_series){let a=Sp(o.group_key,o.name),s=i.get(a)??[];s.push(o),i.set(a,s)}return Array.from(i.entries()).map(([o,a])=>{let l=r.get(o)?.name||o;return{id:o,label:l,rows:By(l,a,t.measurement.values_a,t.measurement.values_b)}})}function Fy(t,r){if(t===null||r===null)return"--";return Ot(r-t)}function bp({state:t,bridge:r}){let{analysis_chart_view:i,ui_text:o}=t,[a,s]=Y(""),l=i.chart_type_display_name||i.title||i.chart_type||S(o,"simulation.chart.default_title","Chart"),c=U(()=>({active:i.viewport.active,xMin:i.viewport.x_min,xMax:i.viewport.x_max,leftYMin:i.viewport.left_y_min,leftYMax:i.viewport.left_y_max,rightYMin:i.viewport.right_y_min,rightYMax:i.viewport.right_y_max}),[i.viewport.active,i.viewport.left_y_max,i.viewport.left_y_min,i.viewport.right_y_max,i.viewport.right_y_min,i.viewport.x_max,i.viewport.x_min]),u=U(()=>xp(i),[i]),d=U(()=>u.map((C)=>({id:C.id,label:C.label})),[u]),g=d.length>0||i.measurement_point.enabled,_=i.has_chart?N(Mt,{children:[m("button",{type:"button",className:"sim-compact-button",disabled:!i.has_chart,onClick:()=>r?.resetChartViewport(),children:S(o,"common.fit","Fit")}),m("button",{type:"button",className:"sim-compact-button",disabled:!i.has_chart,onClick:()=>r?.setChartMeasurementEnabled(!i.measurement_enabled),children:i.measurement_enabled?S(o,"simulation.chart.disable_measurement","Disable Measurement"):S(o,"simulation.chart.enable_measurement","Enable Measurement")}),m("button",{type:"button",className:"sim-compact-button",disabled:!g,onClick:()=>r?.setChartMeasurementPointEnabled(!i.measurement_point.enabled),children:i.measurement_point.enabled?S(o,"simulation.chart.disable_measurement_point","Disable Measurement Point"):S(o,"simulation.chart.enable_measurement_point","Enable Measurement Point")}),m("button",{type:"button",className:"sim-compact-button",disabled:!i.available_series.length,onClick:()=>r?.clearAllChartSeries(),children:S(o,"simulation.chart.clear_signals","Clear Signals")}),m("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!i.can_add_to_conversation,onClick:()=>r?.addToConversation("chart"),children:S(o,"common.add_to_conversation","Add to Conversation")})]}):void 0,x=U(()=>i.available_series.filter((C)=>C.visible),[i.available_series]),b=U(()=>i.available_series.map((C)=>({id:C.name,label:C.name,checked:C.visible,onCheckedChange:(R)=>r?.setChartSeriesVisible(C.name,R)})),[r,i.available_series]),w=U(()=>x.map((C)=>({id:C.name,label:C.name,color:C.color,lineStyle:C.line_style==="dash"?"dash":"solid"})),[x]),P=U(()=>{if(i.measurement_point.target_id&&d.some((C)=>C.id===i.measurement_point.target_id))return i.measurement_point.target_id;return d[0]?.id??""},[i.measurement_point.target_id,d]),y=U(()=>{if(i.measurement_point.target_id&&d.some((C)=>C.id===i.measurement_point.target_id))return i.measurement_point.target_id;return d[0]?.id??""},[i.measurement_point.target_id,d]);H(()=>{s((C)=>{if(d.some((R)=>R.id===C))return C;return P})},[d,P]);let p=U(()=>{if(!u.length)return null;return u.find((C)=>C.id===a)??u[0]},[u,a]),h=U(()=>(p?.rows??[]).map((C)=>({id:C.id,label:C.label,color:C.color,valueA:Ot(C.valueA),valueB:Ot(C.valueB),delta:Fy(C.valueA,C.valueB)})),[p]),v=U(()=>i.measurement_point.values.map((C,R)=>({id:`${C.label}-${R}`,label:C.label,valueText:C.value_text})),[i.measurement_point.values]),k=U(()=>{let C=[];if(i.measurement_point.enabled)C.push({id:"measurement-point",defaultTop:16,defaultRight:16,content:m(ap,{title:S(o,"simulation.chart.measurement_point","Measurement Point"),signalOptions:d,selectedSignalId:y,onSelectedSignalChange:(R)=>r?.setChartMeasurementPointTarget(R),rows:v,emptyMessage:S(o,"simulation.chart.measurement_point_empty","No sampled values are available for the current measurement point."),uiText:o})});if(i.measurement_enabled)C.push({id:"measurement",defaultTop:i.measurement_point.enabled?204:16,defaultRight:16,content:m(ma,{title:S(o,"simulation.chart.measurement","Measurement"),signalOptions:d,selectedSignalId:p?.id??"",onSelectedSignalChange:s,rows:h,emptyMessage:S(o,"simulation.chart.measurement_empty","No measurement values are available for the selected signal."),uiText:o})});return C},[p?.id,r,i.measurement_enabled,i.measurement_point.enabled,h,v,y,d,o]);return m("div",{className:"tab-surface",children:m(bn,{sidebarConfig:{defaultSize:176,minSize:132,maxSize:360,mainMinSize:320,resizable:!0},sidebar:m(pa,{selectableTitle:S(o,"simulation.chart.select_signals","Select Signals"),selectableItems:b,emptySelectableMessage:S(o,"simulation.chart.no_selectable_series","No chart series are available for the current result."),visibleTitle:S(o,"simulation.chart.visible_series","Visible"),visibleItems:w,emptyVisibleMessage:S(o,"simulation.chart.no_visible_series","No signals are currently visible."),defaultPrimaryRatio:0.7}),main:m("div",{className:"content-card content-card--canvas",children:m(ga,{title:i.has_chart?l:"",headerActions:_,floatingPanels:k,measurementCursors:{cursorAVisible:i.measurement_enabled,cursorBVisible:i.measurement_enabled,cursorAX:i.measurement.cursor_a_x,cursorBX:i.measurement.cursor_b_x,onCursorMove:(C,R)=>r?.moveChartMeasurementCursor(C,R)},measurementPoint:{visible:i.measurement_point.enabled,displayX:i.measurement_point.point_x,valueY:i.measurement_point.plot_y,axisKey:i.measurement_point.plot_axis_key,onMove:(C)=>r?.moveChartMeasurementPoint(C)},viewWindow:c,onViewportChange:(C)=>r?.setChartViewport(C),series:i.visible_series,xLabel:i.x_label,yLabel:i.y_label,secondaryYLabel:i.secondary_y_label,logX:i.log_x,logY:i.log_y,rightLogY:i.right_log_y,emptyMessage:i.has_chart?S(o,"simulation.chart.empty_hidden","No series are currently displayed. Re-select them from the left sidebar."):S(o,"simulation.chart.empty_no_chart","No chart is available for the current result.")})})})})}var wp=2,Vy=4,Wy=280;function $y(t){if(!Number.isFinite(t)||t<=0)return wp;return Math.max(wp,Math.min(Vy,Math.floor(t/Wy)))}function kp({state:t,bridge:r}){let i=t.simulation_runtime,{items:o}=t.circuit_selection_view,a=t.ui_text,{ref:s,width:l}=vt(),u=["circuit-selection-grid",`circuit-selection-grid--cols-${$y(l)}`].join(" ");return m("div",{className:"tab-surface",children:m("div",{ref:s,className:"content-card content-card--scrollable circuit-selection-surface",children:!i.has_project?N("div",{className:"surface-state-card surface-state-card--empty",children:[m("div",{className:"card-title",children:S(a,"simulation.circuit_selection.no_project","No project is open yet")}),m("div",{className:"muted-text",children:S(a,"simulation.circuit_selection.no_project_hint","Open a project and run a simulation before choosing a circuit here.")})]}):o.length===0?N("div",{className:"surface-state-card surface-state-card--empty",children:[m("div",{className:"card-title",children:S(a,"simulation.circuit_selection.no_history","No simulation history yet")}),m("div",{className:"muted-text",children:S(a,"simulation.circuit_selection.no_history_hint","Run a simulation once and results will be grouped by circuit here.")})]}):m("div",{className:u,children:o.map((d)=>m(Hy,{item:d,uiText:a,onSelect:()=>{let f=d.latest_result;if(!r||!f.can_load||!f.result_path)return;r.loadResultByPath(f.result_path)},onCompare:()=>{if(!r||d.comparison_result_paths.length<2)return;r.compareResultsByPath(d.comparison_result_paths)}},d.circuit_absolute_path||d.circuit_file))})})})}function Hy({item:t,uiText:r,onSelect:i,onCompare:o}){let a=t.latest_result,s=[a.analysis_type,a.timestamp].filter(Boolean),l=[!a.success?{label:S(r,"simulation.circuit_selection.latest_failed","Latest Failed"),modifier:" circuit-selection-card__badge--error"}:null,t.is_current?{label:S(r,"common.current","Current"),modifier:" circuit-selection-card__badge--current"}:null,!a.can_load?{label:S(r,"simulation.circuit_selection.not_loadable","Not Loadable"),modifier:""}:null].filter((f)=>f!==null),c=["circuit-selection-card",t.is_current?"circuit-selection-card--active":"",!a.can_load?"circuit-selection-card--disabled":""].filter(Boolean).join(" "),u=t.circuit_display_name||a.file_name||S(r,"simulation.circuit_selection.unnamed_circuit","Unnamed Circuit"),d=t.comparison_result_paths.length;return N("div",{className:"circuit-selection-card-cell",children:[N("button",{type:"button",className:c,disabled:!a.can_load,onClick:i,title:t.circuit_absolute_path||t.circuit_file,...t.is_current?{"aria-current":"true"}:null,children:[N("div",{className:"circuit-selection-card__header",children:[N("div",{className:"circuit-selection-card__title-block",children:[m("div",{className:"circuit-selection-card__title",children:u}),m("div",{className:"circuit-selection-card__meta",children:s.length?S(r,"simulation.circuit_selection.latest_run","Latest: {meta}",{meta:s.join(" · ")}):S(r,"simulation.circuit_selection.latest_run_empty","Latest: No metadata")})]}),m("div",{className:"circuit-selection-card__run-count",children:S(r,"simulation.circuit_selection.run_count","{count} runs",{count:t.run_count})})]}),m("div",{className:"circuit-selection-card__footer",children:m("div",{className:"circuit-selection-card__badge-row",children:l.map((f)=>m("span",{className:`circuit-selection-card__badge${f.modifier}`,children:f.label},f.label))})})]}),d>=2?m("button",{type:"button",className:"sim-compact-button circuit-selection-card__compare",onClick:o,children:S(r,"simulation.circuit_selection.compare_runs","Compare {count} runs",{count:d})}):null]})}var Cp={metrics:{key:"simulation.export.metrics",fallback:"Metrics"},charts:{key:"simulation.export.charts",fallback:"Charts"},waveforms:{key:"simulation.export.waveforms",fallback:"Waveforms"},analysis_info:{key:"simulation.export.analysis_info",fallback:"Analysis Info"},raw_data:{key:"simulation.export.raw_data",fallback:"Raw Data"},output_log:{key:"simulation.export.output_log",fallback:"Output Log"},op_result:{key:"simulation.export.op_result",fallback:"Operating Point Result"}};function Np({state:t,bridge:r}){let{export_view:i,ui_text:o}=t,a=i.items.filter((l)=>l.enabled),s=a.filter((l)=>l.selected).length;return N("div",{className:"tab-surface",children:[m(Er,{title:S(o,"simulation.export.title","Export"),actions:m("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!i.can_export,onClick:()=>r?.requestExport(),children:S(o,"simulation.export.export_selected","Export Selected Items")})}),N("div",{className:"content-card content-card--scrollable",children:[N("div",{className:"table-toolbar-grid",children:[N("label",{className:"field-row field-row--grow",children:[m("span",{className:"field-row__label",children:S(o,"simulation.export.directory","Export Directory")}),m("input",{className:"field-input",value:i.selected_directory||S(o,"simulation.export.not_selected","Not Selected"),readOnly:!0})]}),m("button",{type:"button",className:"sim-compact-button",disabled:!i.has_result,onClick:()=>r?.chooseExportDirectory(),children:S(o,"simulation.export.choose_directory","Choose Directory")}),m("button",{type:"button",className:"sim-compact-button",disabled:!i.selected_directory,onClick:()=>r?.clearExportDirectory(),children:S(o,"simulation.export.clear_directory","Clear Directory")}),m("button",{type:"button",className:"sim-compact-button",disabled:!a.length,onClick:()=>r?.setAllExportTypesSelected(!0),children:S(o,"simulation.export.select_all","Select All")}),m("button",{type:"button",className:"sim-compact-button",disabled:!s,onClick:()=>r?.setAllExportTypesSelected(!1),children:S(o,"simulation.export.clear_selection","Clear Selection")})]}),m("div",{className:"export-grid",children:i.items.length?i.items.map((l)=>N("label",{className:`export-item export-item--option${l.enabled?"":" export-item--disabled"}`,children:[m("input",{type:"checkbox",className:"export-item__checkbox",checked:l.selected,disabled:!l.enabled,onChange:(c)=>r?.setExportTypeSelected(l.id,c.target.checked)}),m("span",{className:"export-item__label",children:S(o,Cp[l.id]?.key??"",Cp[l.id]?.fallback??(l.label||l.id))})]},l.id)):m("div",{className:"export-item",children:m("div",{className:"muted-text",children:S(o,"simulation.export.empty","There are no exportable items yet.")})})}),N("div",{className:"info-row",children:[m("div",{className:"card-title",children:S(o,"simulation.export.recent_project_directory","Recent Project Export Directory")}),m("div",{className:"info-row__value export-path-value",children:i.latest_project_export_root||S(o,"simulation.export.none","None")})]})]})]})}Be();function Yy(t,r){let i=t.map((o)=>`${o.name}\x01${o.target}`);return`${r}\x02${i.join("\x03")}`}function Ep(t){let r={};for(let i of t)r[i.name]=i.target;return r}function Uy(t,r){for(let i of t)if((r[i.name]??"").trim()!==i.target.trim())return!0;return!1}function Lp({state:t,bridge:r}){let i=t.metrics_view.items,o=t.metrics_view.source_file_path,a=t.metrics_view.can_add_to_conversation,s=t.ui_text,l=U(()=>Yy(i,o),[i,o]),[c,u]=Y(()=>Ep(i));H(()=>{u(Ep(i))},[l]);let f=U(()=>Uy(i,c),[i,c])&&r!==null&&o.length>0,g=(b,w)=>{u((P)=>({...P,[b]:w}))},_=()=>{if(!f||r===null)return;let b={};for(let w of i){let P=(c[w.name]??"").trim();if(P)b[w.name]=P;else b[w.name]=""}r.updateMetricTargets({sourceFilePath:o,targets:b})},x=()=>{if(!a)return;r?.addToConversation("metrics")};return N("div",{className:"tab-surface tab-surface--metrics",children:[N("div",{className:"metrics-overlay",children:[m("button",{type:"button",className:"sim-compact-button",disabled:!f,onClick:_,children:S(s,"simulation.metrics.confirm_changes","Confirm Changes")}),m("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!a,onClick:x,children:S(s,"common.add_to_conversation","Add to Conversation")})]}),i.length?m("div",{className:"metrics-matrix-scroll",children:N("table",{className:"metrics-matrix",children:[m("thead",{children:N("tr",{children:[m("th",{className:"metrics-matrix__corner","aria-hidden":"true"}),i.map((b)=>N("th",{className:"metrics-matrix__col-head",scope:"col",children:[m("span",{className:"metrics-matrix__metric-name",children:b.display_name||b.name}),b.unit?m("span",{className:"metrics-matrix__metric-unit",children:b.unit}):null]},b.name))]})}),N("tbody",{children:[N("tr",{children:[m("th",{className:"metrics-matrix__row-head",scope:"row",children:S(s,"common.current_value","Current Value")}),i.map((b)=>m("td",{className:"metrics-matrix__current",children:b.value||"--"},b.name))]}),N("tr",{children:[m("th",{className:"metrics-matrix__row-head",scope:"row",children:S(s,"common.target_value","Target Value")}),i.map((b)=>m("td",{className:"metrics-matrix__target",children:m("input",{type:"text",className:"metrics-matrix__target-input",value:c[b.name]??"",placeholder:S(s,"simulation.metrics.target_placeholder","e.g. ≥ 20 dB"),spellCheck:!1,autoComplete:"off",onChange:(w)=>g(b.name,w.target.value)})},b.name))]})]})]})}):N("div",{className:"metrics-matrix-empty",children:[m("div",{className:"metrics-matrix-empty__title",children:S(s,"simulation.metrics.empty_title","No Metrics")}),m("div",{className:"metrics-matrix-empty__hint",children:S(s,"simulation.metrics.empty_hint","Add `.MEASURE` statements to the SPICE file and run a simulation to generate metrics.")})]})]})}function Mp({state:t,bridge:r}){let{op_result_view:i,ui_text:o}=t;return N("div",{className:"tab-surface",children:[m(Er,{title:S(o,"simulation.op_result.title","Operating Point Result"),description:S(o,"simulation.op_result.description","Local action area plus a structured result table."),actions:m("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!i.can_add_to_conversation,onClick:()=>r?.addToConversation("op_result"),children:S(o,"common.add_to_conversation","Add to Conversation")})}),m(bn,{sidebar:m("div",{className:"content-card content-card--scrollable",children:N("div",{className:"info-grid",children:[N("div",{className:"info-row",children:[m("div",{className:"card-title",children:S(o,"simulation.op_result.result_file","Result File")}),m("div",{className:"info-row__value",children:i.file_name||S(o,"simulation.op_result.unnamed_result","Unnamed Result")})]}),N("div",{className:"info-row",children:[m("div",{className:"card-title",children:S(o,"simulation.op_result.analysis_command","Analysis Command")}),m("div",{className:"info-row__value",children:i.analysis_command||".op"})]}),N("div",{className:"info-row",children:[m("div",{className:"card-title",children:S(o,"simulation.op_result.row_count","Row Count")}),m("div",{className:"info-row__value",children:i.row_count})]}),N("div",{className:"info-row",children:[m("div",{className:"card-title",children:S(o,"simulation.op_result.section_count","Section Count")}),m("div",{className:"info-row__value",children:i.section_count})]})]})}),main:m("div",{className:"content-card content-card--scrollable",children:m("div",{className:"op-stage op-stage--table",children:i.sections.length?i.sections.map((a)=>N("section",{className:"op-section",children:[N("div",{className:"op-section__header",children:[m("div",{className:"card-title",children:a.title}),m("div",{className:"card-subtitle",children:S(o,"simulation.op_result.item_count","{count} items",{count:a.row_count})})]}),a.rows.length?m("div",{className:"op-row-list",children:a.rows.map((s)=>N("div",{className:"op-row",children:[m("div",{className:"op-row__name",children:s.name}),m("div",{className:"op-row__value",children:s.formatted_value||S(o,"simulation.op_result.invalid_value","Invalid Value")})]},`${a.id}:${s.name}`))}):m("div",{className:"muted-text",children:S(o,"simulation.op_result.empty_section","No results are available for the current section.")})]},a.id)):m("div",{className:"muted-text",children:S(o,"simulation.op_result.empty","The current result does not contain structured operating-point data.")})})})})]})}Be();function Rp({state:t,bridge:r}){let{output_log_view:i,ui_text:o}=t,[a,s]=Y(i.search_keyword),[l,c]=Y(i.current_filter||"all"),[u,d]=Y("idle");H(()=>{s(i.search_keyword)},[i.search_keyword]),H(()=>{c(i.current_filter||"all")},[i.current_filter]);let f=()=>{if(!r||!i.lines.length)return;let _=i.lines.map((x)=>x.content).join(`
+`);r.copyTextToClipboard(_),d("copied"),window.setTimeout(()=>d("idle"),1500)},g=u==="copied"?S(o,"common.copied","Copied"):S(o,"common.copy","Copy");return m("div",{className:"tab-surface",children:N("div",{className:"content-card content-card--scrollable",children:[N("div",{className:"table-toolbar-grid",children:[N("label",{className:"field-row field-row--grow",children:[m("span",{className:"field-row__label",children:S(o,"simulation.output_log.keyword","Keyword")}),m("input",{className:"field-input",value:a,onChange:(_)=>s(_.target.value),placeholder:S(o,"simulation.output_log.search_placeholder","Enter search keyword")})]}),m("button",{type:"button",className:"sim-compact-button",onClick:()=>r?.searchOutputLog(a),children:S(o,"common.search","Search")}),N("label",{className:"field-row",children:[m("span",{className:"field-row__label",children:S(o,"common.filter","Filter")}),N("select",{className:"field-select",value:l,onChange:(_)=>c(_.target.value),children:[m("option",{value:"all",children:S(o,"common.all","All")}),m("option",{value:"error",children:S(o,"common.error","Error")}),m("option",{value:"warning",children:S(o,"common.warning","Warning")}),m("option",{value:"info",children:S(o,"common.info","Info")})]})]}),m("button",{type:"button",className:"sim-compact-button",onClick:()=>r?.filterOutputLog(l),children:S(o,"simulation.output_log.apply_filter","Apply Filter")}),m("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!i.can_add_to_conversation,onClick:()=>r?.addToConversation("output_log"),children:S(o,"common.add_to_conversation","Add to Conversation")}),m("button",{type:"button",className:"sim-compact-button",disabled:!i.lines.length,onClick:f,children:g})]}),m("div",{className:"log-stage log-stage--lines",children:i.lines.length?i.lines.map((_)=>N("div",{className:`log-line log-line--${_.level}${_.line_number===i.selected_line_number?" log-line--selected":""}`,children:[m("span",{className:"log-line__number",children:_.line_number}),m("span",{className:"log-line__content",children:_.content})]},_.line_number)):m("div",{className:"muted-text",children:S(o,"simulation.output_log.empty","There are currently no log lines to display.")})})]})})}Be();function Xy(t,r){if(t===null||r===null)return"--";return Ot(r-t)}function jy(t,r){let i=[],o=[],a=[],s=()=>{if(o.length){let c=t.runs[i.length];i.push({name:`${t.signal_name} #${i.length+1}${c?.label?` (${c.label})`:""}`,color:t.run_color,axis_key:"left",x:o,y:a})}o=[],a=[]};return t.runs_x.forEach((c,u)=>{let d=t.runs_y[u]??null;if(c===null||d===null){s();return}o.push(c),a.push(d)}),s(),[{key:"lower",label:S(r,"simulation.waveform.comparison_lower","Min"),values:t.lower},{key:"upper",label:S(r,"simulation.waveform.comparison_upper","Max"),values:t.upper}].forEach(({label:c,values:u})=>{i.push({name:`${t.signal_name} (${c})`,color:t.mean_color,axis_key:"left",line_style:"dash",x:t.x,y:u})}),i.push({name:`${t.signal_name} (${S(r,"simulation.waveform.comparison_mean","Mean")})`,color:t.mean_color,axis_key:"left",x:t.x,y:t.mean}),i}function Pp({state:t,bridge:r}){let{waveform_view:i,ui_text:o}=t,[a,s]=Y(""),l=(t.analysis_info_view.analysis_type||"").trim().toLowerCase(),c=U(()=>({active:i.viewport.active,xMin:i.viewport.x_min,xMax:i.viewport.x_max,leftYMin:i.viewport.left_y_min,leftYMax:i.viewport.left_y_max,rightYMin:i.viewport.right_y_min,rightYMax:i.viewport.right_y_max}),[i.viewport.active,i.viewport.left_y_max,i.viewport.left_y_min,i.viewport.right_y_max,i.viewport.right_y_min,i.viewport.x_max,i.viewport.x_min]),u=U(()=>{let p=Array.from(new Set([...i.visible_series.map((v)=>v.name),...Object.keys(i.measurement.values_a),...Object.keys(i.measurement.values_b)])),h=new Map(i.visible_series.map((v)=>[v.name,v]));return p.map((v)=>({id:v,label:v,color:h.get(v)?.color??"#1f77b4",valueA:i.measurement.values_a[v]??null,valueB:i.measurement.values_b[v]??null}))},[i.measurement.values_a,i.measurement.values_b,i.visible_series]),d=i.comparison,f=U(()=>d?jy(d,o):null,[d,o]),g=U(()=>{if(d){let p=Object.keys(d.skipped).length,h=S(o,"simulation.waveform.comparison_title","{signal} · {count} runs",{signal:d.signal_name,count:d.run_count});return p?`${h} · ${S(o,"simulation.waveform.comparison_skipped","{count} skipped",{count:p})}`:h}if(!i.has_waveform)return"";if(l==="tran")return S(o,"simulation.waveform.time_domain_title","Time-Domain Waveform");if(l==="dc")return S(o,"simulation.waveform.dc_sweep_title","DC Sweep Waveform");return S(o,"simulation.waveform.default_title","Waveform")},[d,l,o,i.has_waveform]),_=i.has_waveform?N(Mt,{children:[m("button",{type:"button",className:"sim-compact-button",disabled:!i.has_waveform,onClick:()=>r?.resetWaveformViewport(),children:S(o,"common.fit","Fit")}),m("button",{type:"button",className:"sim-compact-button",disabled:!i.has_waveform,onClick:()=>r?.setCursorVisible("a",!i.cursor_a_visible),children:i.cursor_a_visible?S(o,"simulation.waveform.hide_cursor_a","Hide A"):S(o,"simulation.waveform.show_cursor_a","Show A")}),m("button",{type:"button",className:"sim-compact-button",disabled:!i.has_waveform,onClick:()=>r?.setCursorVisible("b",!i.cursor_b_visible),children:i.cursor_b_visible?S(o,"simulation.waveform.hide_cursor_b","Hide B"):S(o,"simulation.waveform.show_cursor_b","Show B")}),m("button",{type:"button",className:"sim-compact-button",disabled:!i.signal_catalog.length,onClick:()=>r?.clearAllSignals(),children:S(o,"simulation.waveform.clear_signals","Clear Signals")}),m("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!i.can_add_to_conversation,onClick:()=>r?.addToConversation("waveform"),children:S(o,"common.add_to_conversation","Add to Conversation")})]}):void 0,x=U(()=>i.signal_catalog.map((p)=>({id:p.name,label:p.name,checked:p.visible,onCheckedChange:(h)=>r?.setSignalVisible(p.name,h)})),[r,i.signal_catalog]),b=U(()=>{if(d)return[{id:"comparison-runs",label:`${d.signal_name} × ${d.run_count}`,color:d.run_color},{id:"comparison-mean",label:`${d.signal_name} (${S(o,"simulation.waveform.comparison_mean","Mean")})`,color:d.mean_color}];return i.visible_series.map((p)=>({id:p.name,label:p.name,color:p.color}))},[d,o,i.signal_catalog,i.visible_series]),w=u[0]?.id??"";H(()=>{s((p)=>{if(u.some((h)=>h.id===p))return p;return w})},[u,w]);let P=U(()=>{if(!u.length)return null;return u.find((p)=>p.id===a)??u[0]},[u,a]),y=U(()=>{if(P===null)return[];return[{id:P.id,label:P.label,color:P.color,valueA:Ot(P.valueA),valueB:Ot(P.valueB),delta:Xy(P.valueA,P.valueB)}]},[P]);return m("div",{className:"tab-surface",children:m(bn,{sidebarConfig:{defaultSize:176,minSize:132,maxSize:360,mainMinSize:320,resizable:!0},sidebar:m(pa,{selectableTitle:S(o,"simulation.waveform.select_signals","Select Signals"),selectableItems:x,emptySelectableMessage:S(o,"simulation.waveform.no_selectable_signals","No waveform signals are available for the current result."),visibleTitle:S(o,"simulation.waveform.visible_signals","Visible"),visibleItems:b,emptyVisibleMessage:S(o,"simulation.waveform.no_visible_signals","No signals are currently visible."),defaultPrimaryRatio:0.7}),main:m("div",{className:"content-card content-card--canvas",children:m(ga,{title:g,headerActions:_,floatingPanels:i.cursor_a_visible||i.cursor_b_visible?[{id:"waveform-measurement",defaultTop:16,defaultRight:16,content:m(ma,{title:S(o,"simulation.waveform.measurement","Measurement"),signalOptions:u.map((p)=>({id:p.id,label:p.label})),selectedSignalId:P?.id??"",onSelectedSignalChange:s,rows:y,emptyMessage:S(o,"simulation.waveform.measurement_empty","No measurement values are available for the selected signal."),uiText:o})}]:[],measurementCursors:{cursorAVisible:i.cursor_a_visible,cursorBVisible:i.cursor_b_visible,cursorAX:i.measurement.cursor_a_x,cursorBX:i.measurement.cursor_b_x,onCursorMove:(p,h)=>r?.moveCursor(p,h)},viewWindow:c,onViewportChange:(p)=>r?.setWaveformViewport(p),series:f??i.visible_series,xLabel:i.x_axis_label,yLabel:i.y_label||"Waveform",secondaryYLabel:i.secondary_y_label,logX:i.log_x,emptyMessage:i.has_waveform?S(o,"simulation.waveform.empty_hidden","No waveform is currently displayed. Select signals from the left sidebar."):S(o,"simulation.waveform.empty_no_waveform","No waveform is available for the current result.")})})})})}var Gy={circuit_selection:({state:t,bridge:r})=>m(kp,{state:t,bridge:r}),metrics:({state:t,bridge:r})=>m(Lp,{state:t,bridge:r}),schematic:()=>null,chart:({state:t,bridge:r})=>m(bp,{state:t,bridge:r}),waveform:({state:t,bridge:r})=>m(Pp,{state:t,bridge:r}),analysis_info:({state:t})=>m(np,{state:t}),raw_data:()=>null,output_log:({state:t,bridge:r})=>m(Rp,{state:t,bridge:r}),export:({state:t,bridge:r})=>m(Np,{state:t,bridge:r}),asc_conversion:({state:t,bridge:r})=>m(rp,{state:t,bridge:r}),op_result:({state:t,bridge:r})=>m(Mp,{state:t,bridge:r})};function Tp({activeTab:t,state:r,bridge:i}){return m(Mt,{children:Gy[t]({state:r,bridge:i})})}var Ky={circuit_selection:{key:"panel.simulation.tab.circuit_selection",fallback:"Circuit Selection"},metrics:{key:"panel.simulation.tab.metrics",fallback:"Metrics"},schematic:{key:"panel.simulation.tab.schematic",fallback:"Schematic"},chart:{key:"panel.simulation.tab.chart",fallback:"Chart"},waveform:{key:"panel.simulation.tab.waveform",fallback:"Waveform"},analysis_info:{key:"panel.simulation.tab.analysis_info",fallback:"Analysis Info"},raw_data:{key:"panel.simulation.tab.raw_data",fallback:"Raw Data"},output_log:{key:"panel.simulation.tab.output_log",fallback:"Output Log"},export:{key:"panel.simulation.tab.export",fallback:"Export"},asc_conversion:{key:"panel.simulation.tab.asc_conversion",fallback:"ASC Conversion"},op_result:{key:"panel.simulation.tab.op_result",fallback:"Operating Point Result"}};function Ap({activeTab:t,availableTabs:r,onTabSelect:i,uiText:o}){return N("nav",{className:"simulation-tab-bar-shell","aria-label":S(o,"panel.simulation.tab_navigation","Simulation result tabs"),children:[m("span",{className:"simulation-tab-bar__title","aria-hidden":"true",children:S(o,"panel.simulation","Simulation Panel")}),m("div",{className:"simulation-tab-bar",role:"tablist","aria-orientation":"horizontal",children:r.map((a)=>{let s=a===t,l=Ky[a],c=l?S(o,l.key,l.fallback):a;if(s)return m("button",{type:"button",role:"tab","aria-selected":"true",className:"simulation-tab-chip simulation-tab-chip--active",onClick:()=>i(a),children:c},a);return m("button",{type:"button",role:"tab","aria-selected":"false",className:"simulation-tab-chip",onClick:()=>i(a),children:c},a)})})]})}var Qy=new Set(["circuit_selection"]);function Ip({state:t,bridgeConnected:r,children:i,onTabSelect:o}){let a=t.simulation_runtime,s=t.surface_tabs.active_tab,l=t.surface_tabs.available_tabs,c=t.ui_text,u=Boolean(a.status_message),d=Boolean(a.error_message),f=a.is_empty&&!Qy.has(s),g=l.includes("circuit_selection"),_=a.awaiting_confirmation?"surface-state-card--warning":"surface-state-card--info";return N("div",{className:"simulation-shell",children:[m("header",{className:"simulation-shell__header",children:m(Ap,{activeTab:s,availableTabs:l,onTabSelect:o,uiText:c})}),m("section",{className:"simulation-shell__body",children:m("div",{className:"simulation-active-surface",children:N("div",{className:"simulation-active-surface__frame",children:[!r||d||u||f?N("div",{className:"surface-state-stack",children:[!r?N("div",{className:"surface-state-card surface-state-card--warning",children:[m("div",{className:"card-title",children:S(c,"panel.simulation.bridge_disconnected_title","Frontend bridge is disconnected")}),m("div",{className:"muted-text",children:S(c,"panel.simulation.bridge_disconnected_message","Some local actions may be temporarily unavailable, but the current tab layout still reflects the authoritative state shell.")})]}):null,d?N("div",{className:"surface-state-card surface-state-card--error",children:[m("div",{className:"card-title",children:S(c,"panel.simulation.error_title","Simulation Error")}),m("div",{className:"muted-text",children:a.error_message})]}):u?N("div",{className:`surface-state-card ${_}`,children:[m("div",{className:"card-title",children:S(c,"panel.simulation.status_title","Runtime Status")}),m("div",{className:"muted-text",children:a.status_message})]}):null,f?N("div",{className:"surface-state-card surface-state-card--empty",children:[m("div",{className:"card-title",children:S(c,"panel.simulation.empty_title","No Simulation Result Yet")}),m("div",{className:"muted-text",children:a.has_project?S(c,"panel.simulation.empty_with_project","Run a simulation once and the current tab will display the corresponding result."):S(c,"panel.simulation.empty_without_project","Open a project and run a simulation first.")}),g?m("div",{className:"surface-state-actions",children:m("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",onClick:()=>o("circuit_selection"),children:S(c,"panel.simulation.go_to_circuit_selection","Go to Circuit Selection")})}):null]}):null]}):null,m("div",{className:"simulation-active-surface__viewport",children:i})]})})})]})}Be();var Zy=28,qy=32,Jy=64,_c=96,Dp=20,Op=4;function kn(t,r,i){if(t<r)return r;if(t>i)return i;return t}function yc(t,r){if(r.length<=1)return 0;let i=r.length-2,o=Math.max(0,t),a=0,s=i;while(a<=s){let l=Math.floor((a+s)/2),c=r[l],u=r[l+1];if(o<c){s=l-1;continue}if(o>=u){a=l+1;continue}return l}return kn(a,0,i)}function ev(t){if(!t)return null;return{startRow:Math.min(t.anchor.row,t.focus.row),endRow:Math.max(t.anchor.row,t.focus.row),startCol:Math.min(t.anchor.col,t.focus.col),endCol:Math.max(t.anchor.col,t.focus.col)}}var zp=Ya(function({rawDataCopyResult:r,rawDataDocument:i,rawDataViewport:o,bridge:a,uiText:s}){let l=se(null),[c,u]=Y({width:0,height:0}),[d,f]=Y(0),[g,_]=Y(0),[x,b]=Y(null),[w,P]=Y(!1),[y,p]=Y(null),[h,v]=Y(0),{row_count:k,columns:C}=i,R=C.length,L=Math.max(i.row_height_px||Zy,20),B=Math.max(i.column_header_height_px||qy,24),D=Math.max(i.row_header_width_px||Jy,52),ie=U(()=>C.map((I)=>Math.max(I.width_px||0,_c)),[C]),X=U(()=>{let I=[0];for(let z of ie)I.push(I[I.length-1]+z);return I},[ie]),Oe=X[X.length-1]||0,dt=k*L,O=o.dataset_id===i.dataset_id&&o.version===i.version;H(()=>{let I=l.current;if(!I)return;let z=()=>{u({width:I.clientWidth,height:I.clientHeight})};z();let Q=new ResizeObserver(z);return Q.observe(I),()=>{Q.disconnect()}},[]),H(()=>{let I=l.current;if(I)I.scrollTo({left:0,top:0});if(f(0),_(0),v(0),p(null),i.has_data&&k>0&&R>0){b({anchor:{row:0,col:0},focus:{row:0,col:0}});return}b(null)},[i.dataset_id,i.version,i.has_data,k,R]),H(()=>{if(!y)return;let I=window.setTimeout(()=>{p(null)},1200);return()=>{window.clearTimeout(I)}},[y]),H(()=>{if(!h)return;if(r.sequence<h)return;if(r.dataset_id!==i.dataset_id||r.version!==i.version)return;if(v(0),!r.success){p({kind:"copy_failed"});return}let I=Math.max(r.row_count,0),z=Math.max(r.col_count,0);p({kind:"copy_success",rows:I,cols:z})},[h,r,i.dataset_id,i.version]);let te=U(()=>{let I=new Map;if(!O)return I;for(let z of o.rows)I.set(z.row_index,z.values);return I},[O,o.rows]),V=Math.min(k,Math.max(0,Math.floor(g/L))),oe=Math.min(k,Math.max(V,Math.ceil((g+Math.max(c.height,1))/L))),J=R>0?kn(yc(d,X),0,R-1):0,ue=R>0?Math.min(R,Math.max(J+1,yc(d+Math.max(c.width-1,0),X)+1)):0,M=U(()=>{if(!i.has_data||k<=0||R<=0||c.width<=0||c.height<=0)return null;return{rowStart:Math.max(0,V-Dp),rowEnd:Math.min(k,oe+Dp),colStart:Math.max(0,J-Op),colEnd:Math.min(R,ue+Op)}},[c.height,c.width,R,i.has_data,k,ue,J,oe,V]);H(()=>{if(!a||!M||!i.has_data)return;a.requestRawDataViewport({datasetId:i.dataset_id,version:i.version,rowStart:M.rowStart,rowEnd:M.rowEnd,colStart:M.colStart,colEnd:M.colEnd})},[a,i.dataset_id,i.has_data,i.version,M]);let j=ze((I,z)=>{if(!O)return"";if(I<o.row_start||I>=o.row_end)return"";if(z<o.col_start||z>=o.col_end)return"";let Q=te.get(I);if(!Q)return"";return Q[z-o.col_start]||""},[o.col_end,o.col_start,o.row_end,o.row_start,O,te]),W=U(()=>ev(x),[x]),we=W?`${W.endRow-W.startRow+1} × ${W.endCol-W.startCol+1}`:"",ee=ze((I,z)=>{if(!i.has_data||k<=0||R<=0)return null;let Q=l.current;if(!Q)return null;let Ke=Q.getBoundingClientRect(),St=d+I-Ke.left,Te=g+z-Ke.top;if(St<0||Te<0)return null;let Qe=kn(Math.floor(Te/L),0,k-1),T=kn(yc(St,X),0,R-1);return{row:Qe,col:T}},[X,R,i.has_data,k,L,d,g]);H(()=>{if(!w)return;let I=(Q)=>{let Ke=ee(Q.clientX,Q.clientY);if(!Ke)return;b((St)=>St?{anchor:St.anchor,focus:Ke}:{anchor:Ke,focus:Ke})},z=()=>{P(!1)};return window.addEventListener("mousemove",I),window.addEventListener("mouseup",z),()=>{window.removeEventListener("mousemove",I),window.removeEventListener("mouseup",z)}},[w,ee]);let me=ze((I)=>{let z=l.current;if(!z)return;let Q=X[I.col]||0,Ke=X[I.col+1]||Q,St=I.row*L,Te=St+L,{scrollLeft:Qe,scrollTop:T}=z;if(Q<Qe)Qe=Q;else if(Ke>Qe+z.clientWidth)Qe=Ke-z.clientWidth;if(St<T)T=St;else if(Te>T+z.clientHeight)T=Te-z.clientHeight;if(Qe!==z.scrollLeft||T!==z.scrollTop)z.scrollTo({left:Qe,top:T})},[X,L]),xe=ze((I,z)=>{b((Q)=>{if(z&&Q)return{anchor:Q.anchor,focus:I};return{anchor:I,focus:I}}),me(I)},[me]),le=ze((I=!1)=>{if(!a||!W||!i.has_data)return;v(r.sequence+1),a.copyRawDataRange({datasetId:i.dataset_id,version:i.version,rowStart:W.startRow,rowEnd:W.endRow+1,colStart:W.startCol,colEnd:W.endCol+1,includeHeaders:I}),p(we?{kind:"copying_selection",selection:we}:{kind:"copying"})},[a,r.sequence,i.dataset_id,i.has_data,i.version,we,W]),Vt=ze(()=>{let I=l.current;if(!I)return;f(I.scrollLeft),_(I.scrollTop)},[]),$i=ze((I)=>{let z=ee(I.clientX,I.clientY);if(!z)return;l.current?.focus(),b((Q)=>{if(I.shiftKey&&Q)return{anchor:Q.anchor,focus:z};return{anchor:z,focus:z}}),P(!0),I.preventDefault()},[ee]),Oa=ze((I)=>{if(!i.has_data||k<=0||R<=0)return;if((I.ctrlKey||I.metaKey)&&I.key.toLowerCase()==="c"){I.preventDefault(),le(!1);return}if((I.ctrlKey||I.metaKey)&&I.key.toLowerCase()==="a"){I.preventDefault(),b({anchor:{row:0,col:0},focus:{row:k-1,col:R-1}});return}let z=x?.focus??{row:0,col:0},Q=null;if(I.key==="ArrowUp")Q={row:kn(z.row-1,0,k-1),col:z.col};else if(I.key==="ArrowDown")Q={row:kn(z.row+1,0,k-1),col:z.col};else if(I.key==="ArrowLeft")Q={row:z.row,col:kn(z.col-1,0,R-1)};else if(I.key==="ArrowRight")Q={row:z.row,col:kn(z.col+1,0,R-1)};else if(I.key==="Home")Q={row:z.row,col:0};else if(I.key==="End")Q={row:z.row,col:R-1};if(!Q)return;I.preventDefault(),xe(Q,I.shiftKey)},[R,le,i.has_data,k,x,xe]),Hi=M?M.rowStart:0,Yi=M?M.rowEnd:0,Ui=M?M.colStart:0,En=M?M.colEnd:0,za=U(()=>{let I=[];for(let z=Hi;z<Yi;z+=1)for(let Q=Ui;Q<En;Q+=1){let Ke=Boolean(W&&z>=W.startRow&&z<=W.endRow&&Q>=W.startCol&&Q<=W.endCol);I.push(m("div",{className:Ke?"raw-data-grid__cell raw-data-grid__cell--selected":"raw-data-grid__cell",style:{left:`${X[Q]||0}px`,top:`${z*L}px`,width:`${ie[Q]||_c}px`,height:`${L}px`},children:j(z,Q)||"…"},`${z}:${Q}`))}return I},[X,ie,j,En,Ui,Yi,Hi,L,W]),Ba=U(()=>{let I=[];for(let z=J;z<ue;z+=1){let Q=Boolean(W&&z>=W.startCol&&z<=W.endCol);I.push(m("div",{className:Q?"raw-data-grid__header-cell raw-data-grid__header-cell--selected":"raw-data-grid__header-cell",style:{left:`${(X[z]||0)-d}px`,width:`${ie[z]||_c}px`,height:`${B}px`},children:C[z]?.label||""},C[z]?.key||`column-${z}`))}return I},[X,B,ie,C,d,W,ue,J]),Xi=U(()=>{let I=[];for(let z=V;z<oe;z+=1){let Q=Boolean(W&&z>=W.startRow&&z<=W.endRow);I.push(m("div",{className:Q?"raw-data-grid__row-header-cell raw-data-grid__row-header-cell--selected":"raw-data-grid__row-header-cell",style:{top:`${z*L-g}px`,width:`${D}px`,height:`${L}px`},children:z+1},`row-${z}`))}return I},[D,L,g,W,oe,V]),ji=W?m("div",{className:"raw-data-grid__selection",style:{left:`${X[W.startCol]||0}px`,top:`${W.startRow*L}px`,width:`${(X[W.endCol+1]||0)-(X[W.startCol]||0)}px`,height:`${(W.endRow-W.startRow+1)*L}px`}}):null,Gi=!y?"":y.kind==="copy_failed"?S(s,"simulation.raw_data.copy_failed","Copy failed"):y.kind==="copy_success"?S(s,"simulation.raw_data.copy_success","Copied {rows} × {cols}",{rows:y.rows,cols:y.cols}):y.kind==="copying_selection"?S(s,"simulation.raw_data.copying_selection","Copying {selection}",{selection:y.selection}):S(s,"simulation.raw_data.copying","Copying"),Pr=S(s,"simulation.raw_data.empty","No raw data is available to display."),Fa=i.has_data?S(s,"simulation.raw_data.grid_summary","{rows} rows · {cols} columns",{rows:k,cols:R}):Pr,Tr=i.has_data?S(s,"simulation.raw_data.copy_shortcuts","Ctrl/Cmd + C to copy selection, Ctrl/Cmd + A to select all."):"";return m("div",{className:"tab-surface",children:N("div",{className:"raw-data-grid-shell",children:[N("div",{className:"raw-data-grid__statusbar",children:[m("span",{children:Fa}),m("span",{children:Gi||Tr})]}),i.has_data?N("div",{className:"raw-data-grid__viewport-shell",style:{gridTemplateColumns:`${D}px minmax(0, 1fr)`,gridTemplateRows:`${B}px minmax(0, 1fr)`},children:[m("div",{className:"raw-data-grid__corner",children:"#"}),m("div",{className:"raw-data-grid__column-headers",children:Ba}),m("div",{className:"raw-data-grid__row-headers",children:Xi}),m("div",{ref:l,className:"raw-data-grid__body-scroll",onKeyDown:Oa,onScroll:Vt,tabIndex:0,children:N("div",{className:"raw-data-grid__body-content",onMouseDown:$i,style:{width:`${Math.max(Oe,c.width)}px`,height:`${Math.max(dt,c.height)}px`},children:[za,ji]})})]}):m("div",{className:"muted-text",children:Pr})]})})});Be();Be();var Bp=108,Fp=60,ya=132,va=82,Ce=76,Ii=110,nt=82,Ye=94,Gn=90;function Xp(t){return t==="left"||t==="right"||t==="top"||t==="bottom"}function jp(t){if(!t.editable_fields.length)return!0;return t.editable_fields.every((r)=>!r.editable)}var tv={r:{key:"simulation.schematic.type.resistor",fallback:"Resistor"},resistor:{key:"simulation.schematic.type.resistor",fallback:"Resistor"},c:{key:"simulation.schematic.type.capacitor",fallback:"Capacitor"},capacitor:{key:"simulation.schematic.type.capacitor",fallback:"Capacitor"},l:{key:"simulation.schematic.type.inductor",fallback:"Inductor"},inductor:{key:"simulation.schematic.type.inductor",fallback:"Inductor"},d:{key:"simulation.schematic.type.diode",fallback:"Diode"},diode:{key:"simulation.schematic.type.diode",fallback:"Diode"},v:{key:"simulation.schematic.type.voltage_source",fallback:"Voltage Source"},voltage_source:{key:"simulation.schematic.type.voltage_source",fallback:"Voltage Source"},i:{key:"simulation.schematic.type.current_source",fallback:"Current Source"},current_source:{key:"simulation.schematic.type.current_source",fallback:"Current Source"},gnd:{key:"simulation.schematic.type.ground",fallback:"Ground"},ground:{key:"simulation.schematic.type.ground",fallback:"Ground"},x:{key:"simulation.schematic.type.subcircuit",fallback:"Subcircuit"},subckt:{key:"simulation.schematic.type.subcircuit",fallback:"Subcircuit"},subckt_block:{key:"simulation.schematic.type.subcircuit",fallback:"Subcircuit"},controlled_source:{key:"simulation.schematic.type.controlled_source",fallback:"Controlled Source"},e:{key:"simulation.schematic.type.controlled_source",fallback:"Controlled Source"},f:{key:"simulation.schematic.type.controlled_source",fallback:"Controlled Source"},g:{key:"simulation.schematic.type.controlled_source",fallback:"Controlled Source"},h:{key:"simulation.schematic.type.controlled_source",fallback:"Controlled Source"},u:{key:"simulation.schematic.type.opamp",fallback:"Operational Amplifier"},opamp:{key:"simulation.schematic.type.opamp",fallback:"Operational Amplifier"},q:{key:"simulation.schematic.type.bjt",fallback:"BJT"},bjt:{key:"simulation.schematic.type.bjt",fallback:"BJT"},m:{key:"simulation.schematic.type.mos",fallback:"MOSFET"},mos:{key:"simulation.schematic.type.mos",fallback:"MOSFET"},j:{key:"simulation.schematic.type.jfet",fallback:"JFET"},jfet:{key:"simulation.schematic.type.jfet",fallback:"JFET"},unknown:{key:"simulation.schematic.type.unknown",fallback:"Unknown Component"}};function nv(t){return t.trim().toLowerCase()}function Gp(t,r){let i=[t.symbol_kind,t.kind,t.display_name].filter((o)=>Boolean(o));for(let o of i){let a=tv[nv(o)];if(a)return S(r,a.key,a.fallback)}return t.display_name||t.kind||t.symbol_kind||"--"}function lt(t,r,i,o,a){return m("line",{x1:t,y1:r,x2:i,y2:o,stroke:a,strokeWidth:2.2,strokeLinecap:"round"})}function Kp(t){let r=t.trim().toLowerCase();if(r==="input"||r==="in"||r==="input_plus"||r==="input_minus")return"input";if(r==="output"||r==="out")return"output";if(r==="power"||r==="power_positive"||r==="power_negative"||r==="vcc"||r==="vdd"||r==="vee"||r==="vss")return"power";if(r==="ground"||r==="gnd")return"ground";return"other"}function Qp(t,r,i){let o=t.port_side_hints[r.name];if(Xp(o))return o;let a=Kp(r.role);if(a==="ground")return"bottom";if(a==="power")return"top";if(a==="output")return"right";if(a==="input")return"left";if(t.pins.length<=1)return"top";if(t.pins.length===2)return i===0?"left":"right";return i%2===0?"left":"right"}function Zp(t,r,i){let o=t.pins.map((a,s)=>({pinIndex:s,side:Qp(t,a,s)})).filter((a)=>a.side===r).map((a)=>a.pinIndex);return{order:Math.max(0,o.indexOf(i)),total:Math.max(1,o.length)}}function qp(t,r,i,o,a){if(t==="left")return{x:0,y:a*(r+1)/(i+1),side:t};if(t==="right")return{x:o,y:a*(r+1)/(i+1),side:t};if(t==="top")return{x:o*(r+1)/(i+1),y:0,side:t};return{x:o*(r+1)/(i+1),y:a,side:t}}function Un(t,r,i,o,a){let s=Qp(t,r,i),l=Zp(t,s,i);return qp(s,l.order,l.total,o,a)}function rv(t){if(t.pins.length!==2)return!1;for(let r of t.pins){let i=t.port_side_hints[r.name];if(i==="top"||i==="bottom")return!0}return!1}function Jp(t){if(rv(t))return{width:Fp,height:Bp};return{width:Bp,height:Fp}}function iv(t,r,i){let{width:o,height:a}=Jp(t);if(t.pins.length<=1)return{x:o/2,y:0,side:"top"};return Un(t,r,i,o,a)}function Ca(t,r,i){if(r>t)return m("g",{transform:`translate(${t} 0) rotate(90)`,children:i(r,t)});return i(t,r)}function ef({width:t,height:r,appearance:i}){return Ca(t,r,(o,a)=>{let s=a/2;return N("g",{children:[lt(0,s,18,s,i.stroke),m("polyline",{points:`18,${s} 28,${s-10} 38,${s+10} 48,${s-10} 58,${s+10} 68,${s-10} 78,${s+10} 90,${s}`,fill:"none",stroke:i.stroke,strokeWidth:2.2,strokeLinejoin:"round",strokeLinecap:"round"}),lt(90,s,o,s,i.stroke)]})})}function ov({width:t,height:r,appearance:i}){return Ca(t,r,(o,a)=>{let s=a/2;return N("g",{children:[lt(0,s,34,s,i.stroke),m("line",{x1:38,y1:12,x2:38,y2:a-12,stroke:i.stroke,strokeWidth:2.2}),m("line",{x1:70,y1:12,x2:70,y2:a-12,stroke:i.stroke,strokeWidth:2.2}),lt(74,s,o,s,i.stroke)]})})}function av({width:t,height:r,appearance:i}){return Ca(t,r,(o,a)=>{let s=a/2;return N("g",{children:[lt(0,s,20,s,i.stroke),m("path",{d:`M20 ${s} C26 ${s-15}, 34 ${s-15}, 40 ${s} C46 ${s-15}, 54 ${s-15}, 60 ${s} C66 ${s-15}, 74 ${s-15}, 80 ${s} C86 ${s-15}, 94 ${s-15}, 100 ${s}`,fill:"none",stroke:i.stroke,strokeWidth:2.2,strokeLinecap:"round"}),lt(100,s,o,s,i.stroke)]})})}function sv({width:t,height:r,appearance:i}){return Ca(t,r,(o,a)=>{let s=a/2;return N("g",{children:[lt(0,s,24,s,i.stroke),m("polygon",{points:`24,12 24,${a-12} 66,${s}`,fill:i.fill,stroke:i.stroke,strokeWidth:2.2}),m("line",{x1:72,y1:10,x2:72,y2:a-10,stroke:i.stroke,strokeWidth:2.2}),lt(72,s,o,s,i.stroke)]})})}function lv({appearance:t}){let r=Ce/2;return N("g",{children:[lt(r,0,r,14,t.stroke),m("circle",{cx:r,cy:r,r:24,fill:t.fill,stroke:t.stroke,strokeWidth:2.2}),m("line",{x1:r-7,y1:r-8,x2:r+7,y2:r-8,stroke:t.stroke,strokeWidth:2}),m("line",{x1:r,y1:r-14,x2:r,y2:r-2,stroke:t.stroke,strokeWidth:2}),m("line",{x1:r-7,y1:r+10,x2:r+7,y2:r+10,stroke:t.stroke,strokeWidth:2}),lt(r,Ce-14,r,Ce,t.stroke)]})}function cv({appearance:t}){let r=Ce/2;return N("g",{children:[lt(r,0,r,14,t.stroke),m("circle",{cx:r,cy:r,r:24,fill:t.fill,stroke:t.stroke,strokeWidth:2.2}),m("line",{x1:r,y1:r+12,x2:r,y2:r-8,stroke:t.stroke,strokeWidth:2}),m("polyline",{points:`${r-6},${r-2} ${r},${r-10} ${r+6},${r-2}`,fill:"none",stroke:t.stroke,strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"}),lt(r,Ce-14,r,Ce,t.stroke)]})}function uv({appearance:t}){let r=Ce/2;return N("g",{children:[lt(r,0,r,22,t.stroke),m("line",{x1:r-16,y1:26,x2:r+16,y2:26,stroke:t.stroke,strokeWidth:2.2}),m("line",{x1:r-10,y1:34,x2:r+10,y2:34,stroke:t.stroke,strokeWidth:2.2}),m("line",{x1:r-4,y1:42,x2:r+4,y2:42,stroke:t.stroke,strokeWidth:2.2})]})}function dv({width:t,height:r,appearance:i}){return m("rect",{x:10,y:10,width:t-20,height:r-20,rx:12,fill:i.fill,stroke:i.stroke,strokeWidth:2.2})}function mv({width:t,height:r,appearance:i}){let o=t/2,a=r/2;return m("g",{children:m("polygon",{points:`${o},8 ${t-8},${a} ${o},${r-8} 8,${a}`,fill:i.fill,stroke:i.stroke,strokeWidth:2.2})})}function pv({appearance:t}){return N("g",{children:[m("polygon",{points:`14,8 ${Ii-12},${nt/2} 14,${nt-8}`,fill:t.fill,stroke:t.stroke,strokeWidth:2.2}),m("line",{x1:22,y1:nt*0.34,x2:34,y2:nt*0.34,stroke:t.stroke,strokeWidth:2}),m("line",{x1:28,y1:nt*0.28,x2:28,y2:nt*0.4,stroke:t.stroke,strokeWidth:2}),m("line",{x1:22,y1:nt*0.66,x2:34,y2:nt*0.66,stroke:t.stroke,strokeWidth:2})]})}function fv(t,r){if(t==="collector"||t==="base"||t==="emitter")return t;if(r===1)return"base";if(r===2)return"emitter";return"collector"}function tf(t,r){if(t==="drain"||t==="gate"||t==="source")return t;if(r===1)return"gate";if(r===2)return"source";return"drain"}function nf(t){return t.symbol_variant==="pmos"?"pmos":"nmos"}function hv(t){return t.symbol_variant==="pnp"?"pnp":"npn"}function gv(t){return t.symbol_variant==="pjf"?"pjf":"njf"}var Na=Ye*0.56,zt=Gn/2,rf=22,Ti=Na-10,_v=Na-rf,Ai=Na+14,Sa=zt-17,Di=zt+17,of=zt+8;function yv(t){let r=Ti,i=of,o=Ai,a=Di,s=o-r,l=a-i,c=Math.sqrt(s*s+l*l)||1,u=s/c,d=l/c,f=-d,g=u,_=10,x=4,b=t==="npn"?o:r+u*4,w=t==="npn"?a:i+d*4,P=t==="npn"?-1:1,y=b+P*u*10,p=w+P*d*10,h=y+f*4,v=p+g*4,k=y-f*4,C=p-g*4;return`${b},${w} ${h},${v} ${k},${C}`}function vv({component:t,appearance:r}){let i=hv(t),o=r.stroke;return N("g",{children:[m("line",{x1:0,y1:zt,x2:_v,y2:zt,stroke:o,strokeWidth:2.2}),m("line",{x1:Ai,y1:Sa,x2:Ye,y2:Sa,stroke:o,strokeWidth:2.2}),m("line",{x1:Ai,y1:Di,x2:Ye,y2:Di,stroke:o,strokeWidth:2.2}),m("circle",{cx:Na,cy:zt,r:rf,fill:r.fill,stroke:o,strokeWidth:2.2}),m("line",{x1:Ti,y1:zt-12,x2:Ti,y2:zt+12,stroke:o,strokeWidth:2.4}),m("line",{x1:Ti,y1:zt-8,x2:Ai,y2:Sa,stroke:o,strokeWidth:2.2}),m("line",{x1:Ti,y1:of,x2:Ai,y2:Di,stroke:o,strokeWidth:2.2}),m("polygon",{points:yv(i),fill:o,stroke:o,strokeWidth:1,strokeLinejoin:"round"})]})}var jn=Ye*0.58,bc=jn-12,Sv=bc-8,wc=Gn/2,xa=20,ba=Gn-20,Vp=16,Wp=Gn-16;function xv(t){let r=jn+6,i=jn+14,o=4;return`${r},${t} ${i},${t-4} ${i},${t+4}`}function bv({component:t,appearance:r}){let i=nf(t),o=r.stroke,a=i!=="pmos",s=a?xa:ba,l=a?ba:xa;return N("g",{children:[m("line",{x1:0,y1:wc,x2:Sv,y2:wc,stroke:o,strokeWidth:2.2}),m("line",{x1:bc,y1:Vp+2,x2:bc,y2:Wp-2,stroke:o,strokeWidth:2.2}),m("line",{x1:jn,y1:Vp,x2:jn,y2:Wp,stroke:o,strokeWidth:2.2}),m("line",{x1:jn,y1:s,x2:Ye,y2:s,stroke:o,strokeWidth:2.2}),m("line",{x1:jn,y1:l,x2:Ye,y2:l,stroke:o,strokeWidth:2.2}),m("polygon",{points:xv(l),fill:o,stroke:o,strokeWidth:1,strokeLinejoin:"round"})]})}var Xn=Ye*0.58,Qt=Gn/2,wa=20,ka=Gn-20,wv=wa-4,kv=ka+4;function Cv(t){if(t==="njf"){let s=Xn-2,l=s-10;return`${s},${Qt} ${l},${Qt-4} ${l},${Qt+4}`}let o=Xn-2;return`${o-10},${Qt} ${o},${Qt-4} ${o},${Qt+4}`}function Nv({component:t,appearance:r}){let i=gv(t),o=r.stroke;return N("g",{children:[m("line",{x1:0,y1:Qt,x2:Xn,y2:Qt,stroke:o,strokeWidth:2.2}),m("line",{x1:Xn,y1:wv,x2:Xn,y2:kv,stroke:o,strokeWidth:2.2}),m("line",{x1:Xn,y1:wa,x2:Ye,y2:wa,stroke:o,strokeWidth:2.2}),m("line",{x1:Xn,y1:ka,x2:Ye,y2:ka,stroke:o,strokeWidth:2.2}),m("polygon",{points:Cv(i),fill:o,stroke:o,strokeWidth:1,strokeLinejoin:"round"})]})}function Ev({width:t,height:r,appearance:i}){return N("g",{children:[m("rect",{x:10,y:10,width:t-20,height:r-20,rx:12,fill:i.fill,stroke:i.stroke,strokeWidth:2.2,strokeDasharray:"6 4"}),m("text",{x:t/2,y:r/2+6,textAnchor:"middle",fontSize:24,fontWeight:700,fill:i.accent,children:"?"})]})}function Lv(t,r,i){let o=t.port_side_hints[r.name];if(Xp(o)){let a=Zp(t,o,i);return qp(o,a.order,a.total,Ii,nt)}if(Kp(r.role)==="output"||i===t.pins.length-1)return{x:Ii,y:nt/2,side:"right"};if(i===0)return{x:0,y:nt*0.34,side:"left"};if(i===1)return{x:0,y:nt*0.66,side:"left"};return Un(t,r,i,Ii,nt)}function Mv(t,r,i){let o=fv(r.role,i);if(o==="base")return{x:0,y:zt,side:"left"};if(o==="emitter")return{x:Ye,y:Di,side:"right"};return{x:Ye,y:Sa,side:"right"}}function Rv(t,r,i){let o=tf(r.role,i);if(o==="gate")return{x:0,y:Qt,side:"left"};if(o==="source")return{x:Ye,y:ka,side:"right"};return{x:Ye,y:wa,side:"right"}}function Pv(t,r,i){let o=tf(r.role,i);if(o==="gate")return{x:0,y:wc,side:"left"};let a=nf(t)!=="pmos";if(o==="source")return{x:Ye,y:a?ba:xa,side:"right"};return{x:Ye,y:a?xa:ba,side:"right"}}var _a={getDimensions(t){return Jp(t)},getPinAnchor(t,r,i){return iv(t,r,i)},render:ef},vc={width:Ce,height:Ce},Sc={width:ya,height:va},Tv={width:Ii,height:nt},xc={width:Ye,height:Gn},$p={resistor:{..._a,render:ef},capacitor:{..._a,render:ov},inductor:{..._a,render:av},diode:{..._a,render:sv},voltage_source:{getDimensions:()=>vc,getPinAnchor(t,r,i){if(i===0)return{x:Ce/2,y:0,side:"top"};if(i===1)return{x:Ce/2,y:Ce,side:"bottom"};return Un(t,r,i,Ce,Ce)},render:lv},current_source:{getDimensions:()=>vc,getPinAnchor(t,r,i){if(i===0)return{x:Ce/2,y:0,side:"top"};if(i===1)return{x:Ce/2,y:Ce,side:"bottom"};return Un(t,r,i,Ce,Ce)},render:cv},ground:{getDimensions:()=>vc,getPinAnchor(){return{x:Ce/2,y:0,side:"top"}},render:uv},subckt_block:{getDimensions:()=>Sc,getPinAnchor(t,r,i){return Un(t,r,i,ya,va)},render:dv},controlled_source:{getDimensions:()=>Sc,getPinAnchor(t,r,i){return Un(t,r,i,ya,va)},render:mv},opamp:{getDimensions:()=>Tv,getPinAnchor(t,r,i){return Lv(t,r,i)},render:pv},bjt:{getDimensions:()=>xc,getPinAnchor(t,r,i){return Mv(t,r,i)},render:vv},mos:{getDimensions:()=>xc,getPinAnchor(t,r,i){return Pv(t,r,i)},render:bv},jfet:{getDimensions:()=>xc,getPinAnchor(t,r,i){return Rv(t,r,i)},render:Nv},unknown:{getDimensions:()=>Sc,getPinAnchor(t,r,i){return Un(t,r,i,ya,va)},render:Ev}};function Bt(t){return $p[t]??$p.unknown}function Av(t){switch(t){case"top":return{dx:0,dy:-1,perpX:1,perpY:0};case"bottom":return{dx:0,dy:1,perpX:1,perpY:0};case"left":return{dx:-1,dy:0,perpX:0,perpY:1};case"right":return{dx:1,dy:0,perpX:0,perpY:1}}}var Iv=[18,12,6],Dv=3.5,Ov=1.8;function zv(t,r,i){let o=t.x+r.dx*t.length,a=t.y+r.dy*t.length;return N("g",{stroke:i.stroke,strokeWidth:Ov,strokeLinecap:"round",fill:"none",children:[m("line",{x1:t.x,y1:t.y,x2:o,y2:a}),Iv.map((s,l)=>{let c=l*Dv,u=o+r.dx*c,d=a+r.dy*c,f=s/2;return m("line",{x1:u+r.perpX*f,y1:d+r.perpY*f,x2:u-r.perpX*f,y2:d-r.perpY*f},l)})]})}var Lr=8,Hp=10,Yp=12,Up=1.8;function Bv(t){if(t==="left")return"end";if(t==="right")return"start";return"middle"}function Fv(t,r,i){let o=t.x+r.dx*t.length,a=t.y+r.dy*t.length,s=o+r.dx*Lr,l=a+r.dy*Lr,c=o+r.perpX*(Lr/2),u=a+r.perpY*(Lr/2),d=o-r.perpX*(Lr/2),f=a-r.perpY*(Lr/2),g=s+r.dx*Hp,_=l+r.dy*Hp;return N("g",{children:[m("line",{x1:t.x,y1:t.y,x2:o,y2:a,stroke:i.stroke,strokeWidth:Up,strokeLinecap:"round"}),m("polygon",{points:`${s},${l} ${c},${u} ${d},${f}`,fill:i.fill,stroke:i.stroke,strokeWidth:Up,strokeLinejoin:"round"}),t.label?m("text",{x:g,y:_+(r.dy>0?Yp:0),textAnchor:Bv(t.side),fontSize:Yp,fontWeight:600,fill:i.text,children:t.label}):null]})}function af(t,r){let i=Av(t.side);if(t.kind==="ground")return zv(t,i,r);return Fv(t,i,r)}var kc="scope:";function Zt(t){if(!t)return"";return t.display_name||t.instance_name||t.id||""}var Vv=/^(vcc|vdd|vee|vss|vbb|vaa|vdda|vssa|vbus|vsupply|v_supply|v_rail|v\+|v-)$/,Wv=/^(0|gnd|agnd|dgnd|ground)$/,$v=/^(vbias|vref|vcm|bias|ref|v_bias|v_ref|v_cm)/;function Hv(t){return t.trim().toLowerCase()}function Oi(t){return t.join(" / ")}function Yv(t){return`${kc}${Oi(t)}`}function Uv(t){if(t.primitive_kind==="opamp")return"amplifier";switch(t.symbol_kind){case"ground":return"ground";case"voltage_source":case"current_source":return"supply";case"resistor":case"capacitor":case"inductor":case"diode":return"passive";case"bjt":case"mos":case"jfet":return"active";case"opamp":return"amplifier";case"controlled_source":return"controlled_source";case"subckt_block":return"block";default:return"unknown"}}function Xv(t){let r=t.role.trim().toLowerCase();if(r==="input"||r==="in"||r==="input_plus"||r==="input_minus")return"input";if(r==="output"||r==="out")return"output";if(r==="power"||r==="vdd"||r==="vcc"||r==="power_positive"||r==="power_negative")return"power";if(r==="ground"||r==="gnd"||r==="vss")return"ground";if(r==="passive"||r==="anode"||r==="cathode"||r==="plus"||r==="minus"||r==="+"||r==="-")return"passive";return"unknown"}function jv(t){if(t==="left"||t==="right"||t==="top"||t==="bottom")return t;return null}function Gv(t){return t.pins.map((r,i)=>({pin:r,index:i,role:Xv(r),hintedSide:jv(t.port_side_hints[r.name])}))}function Kv(t,r){if(t==="ground")return 90;if(t==="supply")return 10;let i=r.some((a)=>a.role==="input"),o=r.some((a)=>a.role==="output");if(i&&!o)return 20;if(o&&!i)return 80;return 50}function Qv(t){let r=new Map;for(let i of t){let o=[...i.scope_path,i.name];r.set(Oi(o),i.name)}return r}function Zv(t,r){if(t.length===0)return"";let i=r.get(Oi(t));if(i)return i;return t[t.length-1]}function Ea(t,r,i){let o=Yv(r),a=t.get(o);if(a)return a;let s={id:o,path:r,label:Zv(r,i),depth:r.length,parentId:null,childGroupIds:[],componentIds:[]};if(t.set(o,s),r.length>0){let l=Ea(t,r.slice(0,-1),i);s.parentId=l.id,l.childGroupIds.push(o)}return s}function sf(t,r){if(r<=1)return"dangling";let i=Hv(t.name);if(Wv.test(i))return"ground";if(Vv.test(i))return"power";if($v.test(i))return"bias";return"signal"}function qv(t){return[...t].sort((r,i)=>{let o=r.placementPriority-i.placementPriority;if(o!==0)return o;let a=Oi(r.component.scope_path).localeCompare(Oi(i.component.scope_path));if(a!==0)return a;let s=Zt(r.component),l=Zt(i.component),c=s.localeCompare(l);if(c!==0)return c;return r.component.id.localeCompare(i.component.id)})}var Jv=new Set(["resistor","capacitor","inductor","diode"]);function eS(t,r){if(!Jv.has(t.symbol_kind))return t;if(t.pins.length!==2)return t;let i=t.pins[0],o=t.pins[1],a=r.get(Nc(t.id,i.name)),s=r.get(Nc(t.id,o.name)),l=null,c=null;if(a==="power")l="top",c="bottom";else if(a==="ground")l="bottom",c="top";else if(s==="power")c="top",l="bottom";else if(s==="ground")c="bottom",l="top";if(l===null||c===null)return t;return{...t,port_side_hints:{...t.port_side_hints,[i.name]:l,[o.name]:c}}}function tS(t){let r=new Map;for(let i of t.nets){let o=sf(i,i.connections.length);for(let a of i.connections)r.set(Nc(a.component_id,a.pin_name),o)}return r}function Nc(t,r){return`${t}::${r}`}function nS(t){let r=new Map;for(let i of t)r.set(i.component.id,new Set(i.component.pins.map((o)=>o.name)));return r}var Cc=3;function rS(t){if(t.symbol_kind!=="mos")return t;if(t.pins.length<=Cc)return t;let r=t.pins[Cc],i=t.pins.slice(0,Cc),o={...t.port_side_hints};return delete o[r.name],{...t,pins:i,port_side_hints:o}}function lf(t){let r=Qv(t.subcircuits),i=new Map;Ea(i,[],r);let o=tS(t),a=new Map,s=[];for(let g of t.components){let _=eS(g,o),x=rS(_),b=Uv(x),w=Gv(x),P=Ea(i,x.scope_path,r),y={component:x,role:b,pins:w,scopeGroupId:P.id,placementPriority:Kv(b,w)};a.set(x.id,y),s.push(y),P.componentIds.push(x.id)}let l=new Map,c=[],u=nS(s);for(let g of t.nets){let _=g.connections.filter((h)=>{if(!a.has(h.component_id))return!1;let v=u.get(h.component_id);if(!v)return!1;return v.has(h.pin_name)}),x=Array.from(new Set(_.map((h)=>h.component_id))),b=_.length,w=sf(g,b),P=Ea(i,g.scope_path,r),p={net:{...g,connections:_},category:w,pinCount:b,componentIds:x,scopeGroupId:P.id};l.set(g.id,p),c.push(p)}let d=qv(s),f=Array.from(i.values());return{components:d,componentsById:a,nets:c,netsById:l,scopeGroups:f,scopeGroupsById:i,rootScopeGroupId:kc}}function cf(t){let r=new Map;for(let i of t.nets)r.set(i.net.id,iS(i));return r}function iS(t){if(t.pinCount<=1)return"dangling";if(t.category==="ground")return"ground_rail";if(t.category==="power")return"power_rail";if(t.pinCount>=3)return"signal_trunk";return"branch"}var Ec=null;async function oS(){if(Ec===null)Ec=(Vc("8sm9xejy"),import("./elk.bundled-8sm9xejy.js").then((m)=>Wa(m.default,1))).then((t)=>new t.default);return Ec}var Mr=20,Rr=22,uf=28,df=34,aS="[top=28,left=28,bottom=28,right=28]",sS="[top=40,left=40,bottom=40,right=40]",La=36,_f={left:0,right:0,top:0,bottom:0};function lS(t,r){let i=new Map;for(let o of t.components)i.set(o.component.id,{left:0,right:0,top:0,bottom:0});for(let o of t.nets){let a=r.get(o.net.id);if(a!=="ground_rail"&&a!=="power_rail")continue;for(let s of o.net.connections){let l=t.componentsById.get(s.component_id);if(!l)continue;if(l.role==="supply"||l.role==="ground")continue;let c=l.pins.find((g)=>g.pin.name===s.pin_name);if(!c)continue;let d=Bt(l.component.symbol_kind).getPinAnchor(l.component,c.pin,c.index),f=i.get(l.component.id);if(!f)continue;switch(d.side){case"left":f.left=Math.max(f.left,La);break;case"right":f.right=Math.max(f.right,La);break;case"top":f.top=Math.max(f.top,La);break;case"bottom":f.bottom=Math.max(f.bottom,La);break}}}return i}var mf=120,cS=112,uS=32,pf=2,dS="hub:",ff=4,mS={"elk.algorithm":"layered","elk.direction":"RIGHT","elk.edgeRouting":"ORTHOGONAL","elk.hierarchyHandling":"INCLUDE_CHILDREN","elk.layered.nodePlacement.strategy":"BRANDES_KOEPF","elk.layered.nodePlacement.bk.fixedAlignment":"BALANCED","elk.layered.crossingMinimization.strategy":"LAYER_SWEEP","elk.layered.cycleBreaking.strategy":"GREEDY","elk.layered.layering.strategy":"NETWORK_SIMPLEX","elk.layered.spacing.nodeNodeBetweenLayers":"72","elk.layered.spacing.edgeNodeBetweenLayers":"24","elk.layered.spacing.edgeEdgeBetweenLayers":"16","elk.layered.thoroughness":"12","elk.spacing.nodeNode":"52","elk.spacing.edgeNode":"18","elk.spacing.edgeEdge":"12","elk.spacing.portPort":"16","elk.padding":sS,"elk.separateConnectedComponents":"true","elk.layered.considerModelOrder.strategy":"PREFER_EDGES","elk.aspectRatio":"2.0","elk.layered.feedbackEdges":"true"},pS={"elk.padding":aS},fS={"elk.portConstraints":"FIXED_SIDE"};function hS(t,r){let i=!1,o=!1;for(let a of r.nets){if(!a.componentIds.includes(t.component.id))continue;if(a.category==="ground")continue;if(a.pinCount<2)continue;if(a.category==="power")i=!0;else o=!0}if(o)return"main";if(i)return"rail";return"drop"}function gS(t){let r=[],i=[],o=[];for(let a of t.components){if(a.role==="supply"){let s=hS(a,t);if(s==="drop")continue;if(s==="rail")i.push(a);else r.push(a);continue}if(a.role==="ground")o.push(a);else r.push(a)}return{mainComponents:r,powerRailOnly:i,groundRailOnly:o}}function yf(t,r){return`port:${t}:${r}`}function _S(t){switch(t){case"left":return"WEST";case"right":return"EAST";case"top":return"NORTH";case"bottom":return"SOUTH"}}function yS(t,r){let i=Bt(t.component.symbol_kind),o=i.getDimensions(t.component),a=t.pins.map((d)=>{let f=i.getPinAnchor(t.component,d.pin,d.index);return{id:yf(t.component.id,d.pin.name),width:0,height:0,layoutOptions:{"elk.port.side":_S(f.side)}}}),s=Mr+r.left,l=Mr+r.right,c=Rr+r.top,u=Rr+r.bottom;return{id:t.component.id,width:o.width+s+l,height:o.height+c+u,ports:a,layoutOptions:{...fS}}}function vf(t,r){let i=[];for(let o of t.childGroupIds){let a=r.semantic.scopeGroupsById.get(o);if(!a)continue;let s=vf(a,r);if(s)i.push(s)}for(let o of t.componentIds){if(!r.mainComponentIds.has(o))continue;let a=r.componentNodesById.get(o);if(a)i.push(a)}if(i.length===0&&t.depth>0)return null;return{id:t.depth===0?"schematic-root":`scope:${t.id}`,children:i,layoutOptions:t.depth===0?{...mS}:{...pS}}}function vS(t,r,i){let o=[],a=[];for(let s of t.nets){let l=r.get(s.net.id)??"branch";if(l==="power_rail"||l==="ground_rail"||l==="dangling")continue;let c=SS(s,i);if(c.length<2)continue;let u=xS(l);if(c.length===2){o.push({id:`edge:${s.net.id}`,sources:[c[0].portId],targets:[c[1].portId],layoutOptions:u});continue}let d=`${dS}${s.net.id}`;a.push({id:d,width:pf,height:pf,layoutOptions:{"elk.portConstraints":"FREE"}}),c.forEach((f,g)=>{o.push({id:`edge:${s.net.id}:${g}`,sources:[f.portId],targets:[d],layoutOptions:u})})}return{edges:o,virtualHubNodes:a}}function SS(t,r){let i=[];for(let o of t.net.connections){if(!r.has(o.component_id))continue;i.push({portId:yf(o.component_id,o.pin_name)})}return i}function xS(t){if(t==="signal_trunk")return{"elk.layered.priority.shortness":"10","elk.layered.priority.straightness":"10"};return{"elk.layered.priority.shortness":"1","elk.layered.priority.straightness":"5"}}function Ma(t){return Math.round(t/ff)*ff}function bS(t,r){let i=new Map;function o(a,s,l){let c=s+(a.x??0),u=l+(a.y??0);if(r.has(a.id)){i.set(a.id,{node:a,absX:c,absY:u});return}if(a.children)for(let d of a.children)o(d,c,u)}return o(t,0,0),i}function wS(t,r){let i=new Map,o="scope:";function a(s,l,c){let u=l+(s.x??0),d=c+(s.y??0);if(s.id.startsWith("scope:")){let f=s.id.slice(6);if(r.scopeGroupsById.get(f))i.set(f,{x:u,y:d,width:s.width??0,height:s.height??0})}if(s.children)for(let f of s.children)a(f,u,d)}return a(t,0,0),i}function kS(t,r,i){let o=[];for(let a of t){let s=r.get(a.component.id);if(!s)continue;let c=Bt(a.component.symbol_kind).getDimensions(a.component),u=i.get(a.component.id)??_f,d=Mr+u.left,f=Rr+u.top,g=Mr+u.right,_=Rr+u.bottom,x=Ma(s.absX),b=Ma(s.absY),w=s.node.width??c.width+d+g,P=s.node.height??c.height+f+_;o.push({componentId:a.component.id,scopeGroupId:a.scopeGroupId,box:{x,y:b,width:w,height:P},symbolBox:{x:x+d,y:b+f,width:c.width,height:c.height}})}return o}function CS(t,r,i,o){if(t.length===0&&r.length===0)return[];let a=NS(i),s=[],l=hf(t,o,i);gf(t,l,(a.y??0)-mf,a,"up",s);let c=hf(r,o,i);return gf(r,c,(a.y??0)+(a.height??0)+mf,a,"down",s),s}function NS(t){if(t.length===0)return{x:0,y:0,width:0,height:0};let{POSITIVE_INFINITY:r,POSITIVE_INFINITY:i,NEGATIVE_INFINITY:o,NEGATIVE_INFINITY:a}=Number;for(let s of t)r=Math.min(r,s.box.x),i=Math.min(i,s.box.y),o=Math.max(o,s.box.x+s.box.width),a=Math.max(a,s.box.y+s.box.height);return{x:r,y:i,width:o-r,height:a-i}}function hf(t,r,i){let o=new Map;for(let s of i)o.set(s.componentId,s);let a=new Map;for(let s of t){let l=[];for(let c of r.nets){if(!c.componentIds.includes(s.component.id))continue;for(let u of c.componentIds){if(u===s.component.id)continue;let d=o.get(u);if(d)l.push(d.box.x+d.box.width/2)}}if(l.length>0){let c=l.reduce((u,d)=>u+d,0);a.set(s.component.id,c/l.length)}}return a}function gf(t,r,i,o,a,s){if(t.length===0)return;let l=[...t].sort((d,f)=>{let g=r.get(d.component.id)??Number.POSITIVE_INFINITY,_=r.get(f.component.id)??Number.POSITIVE_INFINITY;if(g!==_)return g-_;return d.component.id.localeCompare(f.component.id)}),c=[],u=o.x+uS;for(let d of l){let g=Bt(d.component.symbol_kind).getDimensions(d.component),_=g.width+Mr*2,x=g.height+Rr*2,b=r.get(d.component.id)??u,w=Math.max(b,u+_/2);c.push({component:d,centerX:w,width:_,height:x}),u=w+_/2+(cS-_)}for(let d of c){let g=Bt(d.component.component.symbol_kind).getDimensions(d.component.component),_=Ma(d.centerX-d.width/2),x=Ma(a==="up"?i-d.height:i);s.push({componentId:d.component.component.id,scopeGroupId:d.component.scopeGroupId,box:{x:_,y:x,width:d.width,height:d.height},symbolBox:{x:_+Mr,y:x+Rr,width:g.width,height:g.height}})}}function Lc(t,r){if(t===null)return{...r};let i=Math.min(t.x,r.x),o=Math.min(t.y,r.y),a=Math.max(t.x+t.width,r.x+r.width),s=Math.max(t.y+t.height,r.y+r.height);return{x:i,y:o,width:a-i,height:s-o}}function ES(t,r,i){let o=new Map;for(let[a,s]of i){let l=r.scopeGroupsById.get(a);if(!l||l.depth===0)continue;o.set(a,{scopeGroupId:a,depth:l.depth,label:l.label,bounds:{...s},componentIds:[]})}for(let a of t){let s=r.scopeGroupsById.get(a.scopeGroupId);while(s&&s.depth>0){let l=o.get(s.id);if(l)l.bounds=Lc(l.bounds,a.box),l.componentIds.push(a.componentId);else o.set(s.id,{scopeGroupId:s.id,depth:s.depth,label:s.label,bounds:{...a.box},componentIds:[a.componentId]});s=s.parentId?r.scopeGroupsById.get(s.parentId):void 0}}for(let a of o.values())a.bounds={x:a.bounds.x-uf,y:a.bounds.y-df,width:a.bounds.width+uf*2,height:a.bounds.height+df*2};return o}async function Sf(t,r){if(t.components.length===0)return{componentPositions:[],componentsById:new Map,scopeGroupBounds:[],scopeGroupBoundsById:new Map,overallBounds:null};let{mainComponents:i,powerRailOnly:o,groundRailOnly:a}=gS(t),s=new Set(i.map((w)=>w.component.id)),l=lS(t,r),c,u;if(i.length>0){let w=new Map;for(let R of i){let L=l.get(R.component.id)??_f;w.set(R.component.id,yS(R,L))}let P=t.scopeGroupsById.get(t.rootScopeGroupId);if(!P)throw Error("[schematicElkLayout] Root scope group missing from semantic model");let y=vf(P,{semantic:t,mainComponentIds:s,componentNodesById:w});if(!y)throw Error("[schematicElkLayout] Failed to build ELK root node");let{edges:p,virtualHubNodes:h}=vS(t,r,s);if(y.edges=p,h.length>0)y.children=[...y.children??[],...h];let k=await(await oS()).layout(y),C=bS(k,s);c=kS(i,C,l),u=wS(k,t)}else c=[],u=new Map;let d=CS(o,a,c,t),f=[...c,...d],g=new Map;for(let w of f)g.set(w.componentId,w);let _=ES(f,t,u),x=Array.from(_.values()).sort((w,P)=>w.depth-P.depth),b=null;for(let w of f)b=Lc(b,w.box);for(let w of x)b=Lc(b,w.bounds);return{componentPositions:f,componentsById:g,scopeGroupBounds:x,scopeGroupBoundsById:_,overallBounds:b}}var xf=26;function Ra(t){if(!t.stub)return null;let{x:r,y:i,side:o,length:a}=t.stub,s=12;switch(o){case"top":return{x:r-s,y:i-a,width:s*2,height:a};case"bottom":return{x:r-s,y:i,width:s*2,height:a};case"left":return{x:r-a,y:i-s,width:a,height:s*2};case"right":return{x:r,y:i-s,width:a,height:s*2}}}var Cn=14,zi=28,Pa=zi*2,LS=24,MS=36,RS=0.05,Mc=10,bf=4,ct=0.000001,PS=8;function TS(t){let r=[];for(let i of t){let o=i.symbolBounds;r.push({id:r.length,left:o.x-Cn,right:o.x+o.width+Cn,top:o.y-Cn,bottom:o.y+o.height+Cn,ownerComponentId:i.component.id});for(let a of i.pins){let s=Ra(a);if(!s)continue;r.push({id:r.length,left:s.x-Cn,right:s.x+s.width+Cn,top:s.y-Cn,bottom:s.y+s.height+Cn,ownerComponentId:i.component.id})}}return r}function AS(t,r,i,o,a,s){if(s.has(a.ownerComponentId))return!1;let l=Math.min(t,i),c=Math.max(t,i),u=Math.min(r,o),d=Math.max(r,o);if(c<=a.left+ct)return!1;if(l>=a.right-ct)return!1;if(d<=a.top+ct)return!1;if(u>=a.bottom-ct)return!1;return!0}function IS(t,r,i){return t>i.left+ct&&t<i.right-ct&&r>i.top+ct&&r<i.bottom-ct}function Rc(t){switch(t){case"left":return{dx:-1,dy:0};case"right":return{dx:1,dy:0};case"top":return{dx:0,dy:-1};case"bottom":return{dx:0,dy:1}}}function DS(t,r){let i=new Set,o=new Set;for(let h of t)i.add(h.left),i.add(h.right),o.add(h.top),o.add(h.bottom);for(let h of r){i.add(h.x),o.add(h.y);let v=Rc(h.side);i.add(h.x+v.dx*zi),o.add(h.y+v.dy*zi)}let a=[...i].sort((h,v)=>h-v),s=[...o].sort((h,v)=>h-v);if(a.length>0)i.add(a[0]-Pa),i.add(a[a.length-1]+Pa);if(s.length>0)o.add(s[0]-Pa),o.add(s[s.length-1]+Pa);let l=[...i].sort((h,v)=>h-v),c=[...o].sort((h,v)=>h-v),u=[],d=new Map;function f(h,v){return`${h}|${v}`}function g(h,v,k){let C=f(h,v),R=d.get(C);if(R!==void 0){if(k===null&&u[R].ownedBy!==null)u[R].ownedBy=null;return R}let L=u.length;return u.push({id:L,x:h,y:v,ownedBy:k}),d.set(C,L),L}let _=new Map;for(let h of r){let v=g(h.x,h.y,h.componentId),k=Rc(h.side),C=h.x+k.dx*zi,R=h.y+k.dy*zi,L=g(C,R,null);_.set(h.id,{pinId:h.id,pinVertexId:v,attachmentVertexId:L})}for(let h of l)for(let v of c){if(d.has(f(h,v)))continue;let k=!1;for(let C of t)if(IS(h,v,C)){k=!0;break}if(!k)g(h,v,null)}let x=new Map,b=new Map;for(let h of u){let v=x.get(h.y);if(!v)v=[],x.set(h.y,v);v.push(h.id);let k=b.get(h.x);if(!k)k=[],b.set(h.x,k);k.push(h.id)}let w=[],P=new Map;function y(h){let v=P.get(h.from);if(!v)v=[],P.set(h.from,v);v.push({to:h.to,edge:h});let k=P.get(h.to);if(!k)k=[],P.set(h.to,k);k.push({to:h.from,edge:h})}function p(h,v,k){let C=u[h],R=u[v],L=k==="horizontal"?Math.abs(R.x-C.x):Math.abs(R.y-C.y);if(L<=ct)return;let B=new Set;if(C.ownedBy!==null)B.add(C.ownedBy);if(R.ownedBy!==null)B.add(R.ownedBy);for(let ie of t)if(AS(C.x,C.y,R.x,R.y,ie,B))return;let D={index:w.length,from:h,to:v,axis:k,length:L};w.push(D),y(D)}for(let h of x.values()){h.sort((v,k)=>u[v].x-u[k].x);for(let v=1;v<h.length;v+=1)p(h[v-1],h[v],"horizontal")}for(let h of b.values()){h.sort((v,k)=>u[v].y-u[k].y);for(let v=1;v<h.length;v+=1)p(h[v-1],h[v],"vertical")}return{ovg:{vertices:u,edges:w,adjacency:P},endpointsByPinId:_}}function OS(t,r,i){for(let o of r){let a=i.get(o.id);if(!a)continue;let s=t.adjacency.get(a.pinVertexId);if(!s)continue;let l=t.vertices[a.pinVertexId],c=Rc(o.side),u=[],d=[];for(let f of s){let g=t.vertices[f.to],_=!1;if(c.dx!==0){if(g.y===l.y)_=c.dx>0?g.x>l.x:g.x<l.x}else if(g.x===l.x)_=c.dy>0?g.y>l.y:g.y<l.y;if(_)u.push(f);else d.push(f.to)}t.adjacency.set(a.pinVertexId,u);for(let f of d){let g=t.adjacency.get(f);if(!g)continue;t.adjacency.set(f,g.filter((_)=>_.to!==a.pinVertexId))}}}function wf(t,r){return Math.abs(t.x-r.x)+Math.abs(t.y-r.y)}function kf(t,r){return`${t}|${r}`}function Cf(t,r){t.push(r);let i=t.length-1;while(i>0){let o=i-1>>>1;if(t[o].fCost<=t[i].fCost)break;let a=t[o];t[o]=t[i],t[i]=a,i=o}}function zS(t){let r=t[0],i=t.pop();if(t.length>0&&i!==void 0){t[0]=i;let o=0,a=t.length;while(!0){let s=2*o+1,l=2*o+2,c=o;if(s<a&&t[s].fCost<t[c].fCost)c=s;if(l<a&&t[l].fCost<t[c].fCost)c=l;if(c===o)break;let u=t[o];t[o]=t[c],t[c]=u,o=c}}return r}var BS={xs:new Set,ys:new Set};function FS(t,r,i,o,a,s=BS){let l=[],c=new Map,u=new Map,d=t.vertices[i];for(let f of r){let g=kf(f,"none");if(c.has(g))continue;c.set(g,0),u.set(g,{prevStateKey:null,edgeIndex:null}),Cf(l,{stateKey:g,vertexId:f,lastAxis:"none",gCost:0,fCost:wf(t.vertices[f],d)})}while(l.length>0){let f=zS(l),g=c.get(f.stateKey);if(g!==void 0&&g<f.gCost-ct)continue;if(f.vertexId===i){let x=[],b=[],w=f.stateKey;while(w!==null){let P=parseInt(w.split("|")[0],10);x.push(P);let y=u.get(w);if(!y)break;if(y.edgeIndex!==null)b.push(y.edgeIndex);w=y.prevStateKey}return x.reverse(),b.reverse(),{vertexPath:x,edgeIndices:b,totalCost:f.gCost}}let _=t.adjacency.get(f.vertexId);if(!_)continue;for(let x of _){let b=x.edge,w=b.axis,P=f.lastAxis!=="none"&&f.lastAxis!==w,y=o.has(b.index)?RS:1,p=a.get(b.index)??0,h=t.vertices[x.to],k=s.xs.has(h.x)||s.ys.has(h.y)?PS:0,C=Math.max(0,b.length*y+(P?LS:0)+p*MS-k),R=f.gCost+C,L=kf(x.to,w),B=c.get(L);if(B!==void 0&&B<=R+ct)continue;c.set(L,R),u.set(L,{prevStateKey:f.stateKey,edgeIndex:b.index});let D=wf(t.vertices[x.to],d);Cf(l,{stateKey:L,vertexId:x.to,lastAxis:w,gCost:R,fCost:R+D})}}return null}function VS(t,r){if(r.length<=2)return r[0];let i=0,o=0;for(let u of r){let d=t.vertices[u];i+=d.x,o+=d.y}let a=i/r.length,s=o/r.length,l=r[0],c=Number.POSITIVE_INFINITY;for(let u of r){let d=t.vertices[u],f=d.x-a,g=d.y-s,_=f*f+g*g;if(_<c)c=_,l=u}return l}function WS(t,r,i){if(r.length===0)return null;let o={xs:new Set,ys:new Set};for(let c of r){let u=t.vertices[c];o.xs.add(u.x),o.ys.add(u.y)}let a=VS(t,r),s={vertexIds:new Set([a]),edgeIndices:new Set},l=new Set;for(let c of r)if(c!==a)l.add(c);while(l.size>0){let c=null;for(let u of l){let d=FS(t,s.vertexIds,u,s.edgeIndices,i,o);if(!d)continue;if(c===null||d.totalCost<c.path.totalCost)c={target:u,path:d}}if(c===null)return null;for(let u of c.path.vertexPath)s.vertexIds.add(u);for(let u of c.path.edgeIndices)s.edgeIndices.add(u);l.delete(c.target)}return s}function $S(t,r){let i=new Map;for(let o of r){let a=t.edges[o],s=i.get(a.from);if(!s)s=[],i.set(a.from,s);s.push({to:a.to,edge:a});let l=i.get(a.to);if(!l)l=[],i.set(a.to,l);l.push({to:a.from,edge:a})}return i}function Ef(t){let r=!1,i=!1;for(let o=1;o<t.length;o+=1){if(t[o].x!==t[o-1].x)r=!0;if(t[o].y!==t[o-1].y)i=!0}if(r&&i)return"mixed";if(r)return"horizontal";if(i)return"vertical";return"mixed"}function HS(t,r){let i=$S(t,r.edgeIndices),o=new Set,a=[];function s(c){let u=i.get(c);if(!u||u.length!==2)return!1;return u[0].edge.axis===u[1].edge.axis}function l(c,u){let d=[],f=t.vertices[c];d.push({x:f.x,y:f.y});let g=u;o.add(g.index);let _=g.from===c?g.to:g.from,x=t.vertices[_];d.push({x:x.x,y:x.y});while(s(_)){let b=i.get(_);if(!b)break;let w=b.find((P)=>P.edge.index!==g.index&&!o.has(P.edge.index));if(!w)break;o.add(w.edge.index),g=w.edge,_=w.to,x=t.vertices[_],d.push({x:x.x,y:x.y})}return{axis:Ef(d),points:d}}for(let c of r.vertexIds){if(s(c))continue;let u=i.get(c);if(!u)continue;for(let d of u){if(o.has(d.edge.index))continue;a.push(l(c,d.edge))}}return a}function YS(t){let r=[];for(let i=0;i<t.length;i+=1){let o=t[i];for(let a=0;a<o.chains.length;a+=1){let s=o.chains[a];for(let l=0;l+1<s.points.length;l+=1){let c=s.points[l],u=s.points[l+1];if(c.x===u.x&&c.y===u.y)continue;if(c.y===u.y)r.push({bundleIndex:i,chainIndex:a,pointIndex:l,axis:"horizontal",constantCoord:c.y,spanStart:Math.min(c.x,u.x),spanEnd:Math.max(c.x,u.x)});else if(c.x===u.x)r.push({bundleIndex:i,chainIndex:a,pointIndex:l,axis:"vertical",constantCoord:c.x,spanStart:Math.min(c.y,u.y),spanEnd:Math.max(c.y,u.y)})}}}return r}function US(t,r){let i=t.filter((s)=>s.axis===r),o=new Map;for(let s of i){let l=o.get(s.constantCoord);if(!l)l=[],o.set(s.constantCoord,l);l.push(s)}let a=[];for(let s of o.values()){if(s.length<2)continue;let l=[...s].sort((d,f)=>d.spanStart-f.spanStart),c=[l[0]],u=l[0].spanEnd;for(let d=1;d<l.length;d+=1){let f=l[d];if(f.spanStart<u-ct)c.push(f),u=Math.max(u,f.spanEnd);else{if(c.length>=2)a.push(c);c=[f],u=f.spanEnd}}if(c.length>=2)a.push(c)}return a}function XS(t,r,i){let o=t.length;if(o===0)return{newCenters:[]};let a=t.map((u,d)=>({index:d,size:u.size,desiredCenter:u.desiredCenter}));a.sort((u,d)=>u.desiredCenter-d.desiredCenter);let s=Array(o),l=r;for(let u of a){let d=l+u.size/2,f=Math.max(u.desiredCenter,d);s[u.index]=f,l=f+u.size/2}let c=i;for(let u=a.length-1;u>=0;u-=1){let d=a[u],f=c-d.size/2;if(s[d.index]>f)s[d.index]=f;c=s[d.index]-d.size/2}return{newCenters:s}}function jS(t){for(let r of["horizontal","vertical"]){let i=YS(t),o=US(i,r);for(let a of o){let s=a.map((d)=>({size:Mc,desiredCenter:d.constantCoord})),l=Math.min(...a.map((d)=>d.constantCoord))-Mc*a.length,c=Math.max(...a.map((d)=>d.constantCoord))+Mc*a.length,{newCenters:u}=XS(s,l,c);for(let d=0;d<a.length;d+=1){let f=a[d],g=u[d];if(Math.abs(g-f.constantCoord)<=ct)continue;let _=t[f.bundleIndex].chains[f.chainIndex],x=_.points[f.pointIndex],b=_.points[f.pointIndex+1];if(r==="horizontal")x.y=g,b.y=g;else x.x=g,b.x=g}}}}function Nf(t){return Math.round(t/bf)*bf}function GS(t){for(let r of t)for(let i of r.points)i.x=Nf(i.x),i.y=Nf(i.y)}function KS(t,r){let i=[];for(let o=0;o<r.length;o+=1){let a=r[o],s=QS(a.points);if(s.length<2)continue;i.push({key:`${t}:route:${o}`,axis:Ef(s),points:s})}return i}function QS(t){if(t.length<=2)return t.slice();let r=[t[0]];for(let o=1;o<t.length-1;o+=1){let a=r[r.length-1],s=t[o],l=t[o+1],c=a.y===s.y&&s.y===l.y,u=a.x===s.x&&s.x===l.x;if(c||u)continue;r.push(s)}r.push(t[t.length-1]);let i=[r[0]];for(let o=1;o<r.length;o+=1){let a=i[i.length-1],s=r[o];if(a.x===s.x&&a.y===s.y)continue;i.push(s)}return i}function Lf(t,r,i,o){let a=new Map;if(o.length===0)return a;let s=TS(o),l=[];for(let g of i.values())for(let _ of g)l.push(_);if(l.length===0)return a;let{ovg:c,endpointsByPinId:u}=DS(s,l);OS(c,l,u);let d=[],f=new Map;for(let g of t.nets){let _=g.net.id,x=r.get(_);if(!x)continue;let b=i.get(_)??[];if(x==="dangling")continue;if(x==="ground_rail"||x==="power_rail")continue;if(b.length<2)continue;let w=[];for(let p of b){let h=u.get(p.id);if(h)w.push(h.pinVertexId)}if(w.length<2)continue;let P=WS(c,w,f);if(!P||P.edgeIndices.size===0)continue;for(let p of P.edgeIndices)f.set(p,(f.get(p)??0)+1);let y=HS(c,P);d.push({netId:_,chains:y})}jS(d);for(let g of d)GS(g.chains);for(let g of d){let _=KS(g.netId,g.chains);if(_.length>0)a.set(g.netId,_)}return a}function Mf(t){if(t===null)return!1;let r=t.maxX-t.minX,i=t.maxY-t.minY;if(r<=0||i<=0)return!1;return i>r*1.2}function ZS(t){let{minX:r,minY:i,maxY:o}=t;return{point(a){return{x:r+(o-a.y),y:i+(a.x-r)}},rect(a){return{x:r+(o-a.y-a.height),y:i+(a.x-r),width:a.height,height:a.width}}}}var Rf={left:"top",top:"right",right:"bottom",bottom:"left"};function qS(t,r){let i=r.point({x:t.x,y:t.y});return{kind:t.kind,label:t.label,side:Rf[t.side],x:i.x,y:i.y,length:t.length}}function JS(t,r){let i=r.point({x:t.x,y:t.y});return{id:t.id,componentId:t.componentId,pin:t.pin,side:Rf[t.side],x:i.x,y:i.y,stub:t.stub?qS(t.stub,r):null}}function ex(t,r){return{component:t.component,rotation:90,bounds:r.rect(t.bounds),symbolBounds:r.rect(t.symbolBounds),pins:t.pins.map((i)=>JS(i,r)),nameLabel:t.nameLabel?{...t.nameLabel,...r.point({x:t.nameLabel.x,y:t.nameLabel.y})}:null,valueLabel:t.valueLabel?{...t.valueLabel,...r.point({x:t.valueLabel.x,y:t.valueLabel.y})}:null}}function tx(t,r){return{id:t.id,label:t.label,depth:t.depth,bounds:r.rect(t.bounds)}}function nx(t,r){return{net:t.net,segments:t.segments.map((i)=>({key:i.key,axis:i.axis==="horizontal"?"vertical":i.axis==="vertical"?"horizontal":i.axis,points:i.points.map((o)=>r.point(o))})),label:t.label?{...t.label,...r.point({x:t.label.x,y:t.label.y})}:null}}function rx(t,r){let i=r.point({x:t.minX,y:t.minY}),o=r.point({x:t.maxX,y:t.maxY});return{minX:Math.min(i.x,o.x),minY:Math.min(i.y,o.y),maxX:Math.max(i.x,o.x),maxY:Math.max(i.y,o.y)}}function Pf(t){if(t.bounds===null)return t;let r=ZS(t.bounds);return{...t,components:t.components.map((i)=>ex(i,r)),groups:t.groups.map((i)=>tx(i,r)),nets:t.nets.map((i)=>nx(i,r)),bounds:rx(t.bounds,r)}}var ix=new Set(["signal_trunk","branch"]);function ox(t,r){return!(t.x+t.width<=r.x||r.x+r.width<=t.x||t.y+t.height<=r.y||r.y+r.height<=t.y)}function ax(t,r,i,o){let a={x:t.bounds.x+r-14,y:t.bounds.y+i-14,width:t.bounds.width+28,height:t.bounds.height+28};for(let s of o){if(s===t)continue;if(ox(a,s.bounds))return!1}return!0}function sx(t,r,i){t.bounds.x+=r,t.bounds.y+=i,t.symbolBounds.x+=r,t.symbolBounds.y+=i;for(let o of t.pins)if(o.x+=r,o.y+=i,o.stub)o.stub.x+=r,o.stub.y+=i;if(t.nameLabel)t.nameLabel.x+=r,t.nameLabel.y+=i;if(t.valueLabel)t.valueLabel.x+=r,t.valueLabel.y+=i}function lx(t){let r=0,i=0;for(let o of t)if(o.side==="top"||o.side==="bottom")r+=1;else if(o.side==="left"||o.side==="right")i+=1;if(r===0&&i===0)return null;if(r>i)return"x";if(i>r)return"y";return null}function cx(t,r,i){let o=t.find((s)=>i.has(s.componentId));if(o)return o;let a=[...t].sort((s,l)=>{let c=r==="x"?s.x:s.y,u=r==="x"?l.x:l.y;return c-u});return a[Math.floor(a.length/2)]}function Tf(t,r,i){if(t.length===0)return;let o=new Set,a=Array.from(r.entries()).filter(([s,l])=>{if(l.length<2||l.length>4)return!1;let c=i.get(s);return c!==void 0&&ix.has(c)}).sort(([,s],[,l])=>s.length-l.length);for(let[,s]of a){let l=lx(s);if(l===null)continue;let c=cx(s,l,o),u=l==="x"?c.x:c.y;o.add(c.componentId);for(let d of s){if(d===c)continue;if(o.has(d.componentId))continue;let f=l==="x"?d.x:d.y,g=u-f;if(Math.abs(g)<0.5){o.add(d.componentId);continue}if(Math.abs(g)>60)continue;let _=t.find((w)=>w.component.id===d.componentId);if(!_)continue;let x=l==="x"?g:0,b=l==="y"?g:0;if(!ax(_,x,b,t))continue;sx(_,x,b),o.add(d.componentId)}}}var ux=16.5,Of=15,dx=36,mx=8,px=54,fx=18,Kn=4,hx=8,Af=4,gx=6,_x=14,If=6,yx=18,qt=26,Bi=24;function zf(t,r,i,o){return Math.max(i,Math.ceil(t.length*r*0.62+o))}function Vi(t){return zf(t,Of,px,fx)}function Fi(t,r){return zf(t,r==="name"?ux:Of,dx,mx)}function Ft(t,r,i,o){let a=t.textAnchor==="middle"?t.x-r/2:t.textAnchor==="end"?t.x-r:t.x,s=o==="middle"?t.y-i/2:t.y-i*0.78;return{x:a,y:s,width:r,height:i}}function Pc(t,r){return t.x<r.x+r.width&&t.x+t.width>r.x&&t.y<r.y+r.height&&t.y+t.height>r.y}function Tc(t,r){return{x:t.x-r,y:t.y-r,width:t.width+r*2,height:t.height+r*2}}function vx(t,r,i){return{x:Math.min(t.x,r.x)-i,y:Math.min(t.y,r.y)-i,width:Math.abs(t.x-r.x)+i*2,height:Math.abs(t.y-r.y)+i*2}}function Sx(t){let r=t.component.symbol_kind;if(r==="opamp"||r==="subckt_block"||r==="controlled_source")return{name:"top",value:"bottom"};if(r==="ground")return{name:"bottom",value:"bottom"};if(r==="bjt"||r==="mos")return{name:"top",value:"bottom"};if(r==="voltage_source"||r==="current_source")return{name:"right",value:"left"};return{name:"top",value:"bottom"}}function Df(t,r,i){let o=i.x,a=i.x+i.width,s=i.y,l=i.y+i.height,c=o+i.width/2,u=s+i.height/2;switch(r){case"top":return{text:t,x:c,y:s-gx,textAnchor:"middle"};case"bottom":return{text:t,x:c,y:l+_x,textAnchor:"middle"};case"left":return{text:t,x:o-If,y:u+4,textAnchor:"end"};case"right":return{text:t,x:a+If,y:u+4,textAnchor:"start"}}}function Bf(t){let r=new Map;for(let i of t){let o=Sx(i),a=Zt(i.component),s=i.component.display_value,l=a?Df(a,o.name,i.symbolBounds):null,c=s?Df(s,o.value,i.symbolBounds):null;r.set(i.component.id,{nameLabel:l,valueLabel:c})}return r}function xx(t){if(t.key.endsWith(":trunk"))return 4;if(t.key.endsWith(":direct"))return 3;if(t.key.includes(":tap:"))return 2;return 1}function bx(t){let r=[];for(let i of t){let o=xx(i);for(let a=1;a<i.points.length;a+=1){let s=i.points[a-1],l=i.points[a],c=l.x-s.x,u=l.y-s.y,d=Math.hypot(c,u);if(d<yx)continue;r.push({x:(s.x+l.x)/2,y:(s.y+l.y)/2,orientation:Math.abs(c)>=Math.abs(u)?"horizontal":"vertical",length:d,priority:o})}}return r.sort((i,o)=>o.priority-i.priority||o.length-i.length),r}function wx(t,r,i){let o=r.orientation==="horizontal"?[{text:t,x:r.x,y:r.y-(qt/2+Kn),textAnchor:"middle"},{text:t,x:r.x,y:r.y+(qt/2+Kn),textAnchor:"middle"}]:[{text:t,x:r.x+i.labelWidth/2+Kn,y:r.y,textAnchor:"middle"},{text:t,x:r.x-i.labelWidth/2-Kn,y:r.y,textAnchor:"middle"}];for(let a of o){let s=Ft(a,i.labelWidth,qt,"middle");if(i.componentObstacles.some((l)=>Pc(s,l)))continue;if(i.segmentObstacles.some((l)=>Pc(s,l)))continue;if(i.placedLabelRects.some((l)=>Pc(s,l)))continue;return a}return null}function kx(t,r,i){if(r.orientation==="horizontal")return{text:t,x:r.x,y:r.y-(qt/2+Kn),textAnchor:"middle"};return{text:t,x:r.x+i/2+Kn,y:r.y,textAnchor:"middle"}}function Cx(t){return t.map((r)=>Tc(r.symbolBounds,hx))}function Nx(t){let r=[];for(let i of t)for(let o of i.segments)for(let a=1;a<o.points.length;a+=1)r.push(vx(o.points[a-1],o.points[a],Kn));return r}function Ex(t){let r=[];for(let i of t){if(i.nameLabel){let o=Fi(i.nameLabel.text,"name");r.push(Tc(Ft(i.nameLabel,o,Bi,"baseline"),Af))}if(i.valueLabel){let o=Fi(i.valueLabel.text,"value");r.push(Tc(Ft(i.valueLabel,o,Bi,"baseline"),Af))}}return r}function Ff(t,r){let i=new Map,o=Cx(r),a=Nx(t),s=Ex(r),l=[...t].sort((c,u)=>{let d=c.segments.some((x)=>x.key.endsWith(":trunk"))?1:0,f=u.segments.some((x)=>x.key.endsWith(":trunk"))?1:0;if(d!==f)return f-d;let g=c.segments.some((x)=>x.key.endsWith(":direct"))?1:0;return(u.segments.some((x)=>x.key.endsWith(":direct"))?1:0)-g});for(let c of l){if(!c.net.name){i.set(c.net.id,null);continue}let u=Vi(c.net.name),d=bx(c.segments);if(d.length===0){i.set(c.net.id,null);continue}let f={labelWidth:u,componentObstacles:o,segmentObstacles:a,placedLabelRects:s},g=null;for(let _ of d)if(g=wx(c.net.name,_,f),g)break;if(!g)g=kx(c.net.name,d[0],u);s.push(Ft(g,u,qt,"middle")),i.set(c.net.id,g)}return i}var Vf=56,Lx=0.35,Mx=2.6;function Rx(t,r,i){return Math.min(Math.max(t,r),i)}function Ac(t,r){if(t===null)return{minX:r.x,minY:r.y,maxX:r.x,maxY:r.y};return{minX:Math.min(t.minX,r.x),minY:Math.min(t.minY,r.y),maxX:Math.max(t.maxX,r.x),maxY:Math.max(t.maxY,r.y)}}function Wi(t,r,i,o,a){let s=Ac(t,{x:r,y:i});return s=Ac(s,{x:r+o,y:i+a}),s}function Px(t){return Math.max(1,t.maxX-t.minX)}function Tx(t){return Math.max(1,t.maxY-t.minY)}function Ic(t,r){return`port:${t}:${r}`}function Ax(t,r){return`${t}::${r}`}var Wf=4;function $f(t){return Math.round(t/Wf)*Wf}function Ix(t){let r=t.component,i=Bt(r.symbol_kind);return t.pins.map((o)=>{let a=i.getPinAnchor(r,o.pin,o.index);return{portId:Ic(r.id,o.pin.name),pin:o.pin,side:a.side,anchorX:a.x,anchorY:a.y}})}function Dx(t,r,i){let o=[];for(let s of r.componentPositions){let l=t.componentsById.get(s.componentId);if(!l)continue;let u=Ix(l).map((f)=>{let g={id:f.portId,componentId:s.componentId,pin:f.pin,side:f.side,x:$f(s.symbolBox.x+f.anchorX),y:$f(s.symbolBox.y+f.anchorY),stub:null};return i.set(f.portId,g),g}),d={component:l.component,rotation:0,bounds:{...s.box},symbolBounds:{...s.symbolBox},pins:u,nameLabel:null,valueLabel:null};o.push(d)}let a=r.scopeGroupBounds.map((s)=>({id:s.scopeGroupId,label:s.label,depth:s.depth,bounds:{...s.bounds}}));return{components:o,groups:a}}function Ox(t,r){let i=Math.min(t.x,r.x),o=Math.min(t.y,r.y),a=Math.max(t.x+t.width,r.x+r.width),s=Math.max(t.y+t.height,r.y+r.height);return{x:i,y:o,width:a-i,height:s-o}}function zx(t){for(let r of t)for(let i of r.pins){let o=Ra(i);if(!o)continue;r.bounds=Ox(r.bounds,o)}}function Bx(t,r,i){for(let o of t.nets){let a=r.get(o.net.id);if(a!=="ground_rail"&&a!=="power_rail")continue;let s=a==="ground_rail"?"ground":"power",l=a==="power_rail"?o.net.name.toUpperCase():"";for(let c of o.net.connections){let u=Ic(c.component_id,c.pin_name),d=i.get(u);if(!d)continue;let f=t.componentsById.get(d.componentId);if(f&&(f.role==="supply"||f.role==="ground"))continue;d.stub={kind:s,label:l,side:d.side,x:d.x,y:d.y,length:xf}}}}function Hf(t,r){let i=new Map;for(let o of t.nets){let a=[];for(let s of o.net.connections){let l=r.get(Ic(s.component_id,s.pin_name));if(l)a.push(l)}i.set(o.net.id,a)}return i}function Fx(t,r,i,o){let a=Hf(t,i),s=Lf(t,r,a,o),l=[];for(let c of t.nets){let u=s.get(c.net.id)??[];if(u.length===0)continue;l.push({net:c.net,segments:u,label:null})}return l}function Vx(t,r){let i=Bf(t);for(let a of t){let s=i.get(a.component.id);if(s)a.nameLabel=s.nameLabel,a.valueLabel=s.valueLabel}let o=Ff(r,t);for(let a of r)a.label=o.get(a.net.id)??null}function Wx(t,r,i){let o=null;for(let a of r)o=Wi(o,a.bounds.x,a.bounds.y,a.bounds.width,a.bounds.height);for(let a of t){if(o=Wi(o,a.bounds.x,a.bounds.y,a.bounds.width,a.bounds.height),a.nameLabel){let s=Ft(a.nameLabel,Fi(a.nameLabel.text,"name"),Bi,"baseline");o=Wi(o,s.x,s.y,s.width,s.height)}if(a.valueLabel){let s=Ft(a.valueLabel,Fi(a.valueLabel.text,"value"),Bi,"baseline");o=Wi(o,s.x,s.y,s.width,s.height)}}for(let a of i){for(let s of a.segments)for(let l of s.points)o=Ac(o,l);if(a.label){let s=Ft(a.label,Vi(a.label.text),qt,"middle");o=Wi(o,s.x,s.y,s.width,s.height)}}return o}function Yf(){return{scale:1,offsetX:0,offsetY:0}}function Ta(t,r,i){let o=Math.max(1,r-Vf*2),a=Math.max(1,i-Vf*2),s=Rx(Math.min(o/Px(t),a/Tx(t)),Lx,Mx),l=(t.minX+t.maxX)/2,c=(t.minY+t.maxY)/2;return{scale:s,offsetX:r/2-l*s,offsetY:i/2-c*s}}function Uf(t,r,i,o){return{x:(t-i.left-o.offsetX)/o.scale,y:(r-i.top-o.offsetY)/o.scale}}async function Xf(t){let r=Ax(t.document_id,t.revision);if(!t.has_schematic||t.components.length===0)return{requestKey:r,documentId:t.document_id,revision:t.revision,components:[],nets:[],groups:[],bounds:null};let i=lf(t),o=cf(i),a=await Sf(i,o),s=new Map,{components:l,groups:c}=Dx(i,a,s),u=Hf(i,s);Tf(l,u,o),Bx(i,o,s),zx(l);let d=Fx(i,o,s,l);Vx(l,d);let f=Wx(l,c,d),g={components:l,nets:d,groups:c,bounds:f},_=Mf(f)?Pf(g):g;return{requestKey:r,documentId:t.document_id,revision:t.revision,components:_.components,nets:_.nets,groups:_.groups,bounds:_.bounds}}var $x=0.35,Hx=2.6;function Yx(t,r,i){return Math.min(Math.max(t,r),i)}function Ux(t){return t.map((r)=>`${r.x},${r.y}`).join(" ")}function jf(t){return t instanceof Element&&Boolean(t.closest('[data-schematic-component="true"]'))}function Xx(t){let r=Math.min(Math.max(t,1),4),i=0.16+r*0.04,o=0.06+r*0.025;return{stroke:`rgba(37, 99, 235, ${i})`,fill:`rgba(219, 234, 254, ${o})`,text:r>=3?"#1d4ed8":"#2563eb"}}function jx(t,r,i){if(t)return{stroke:"#2563eb",fill:"#dbeafe",accent:"#1d4ed8",text:"#1e3a8a",pinFill:"#2563eb",readonly:i};if(r)return{stroke:i?"#64748b":"#3b82f6",fill:i?"#f1f5f9":"#eff6ff",accent:i?"#64748b":"#2563eb",text:i?"#475569":"#1e3a8a",pinFill:i?"#64748b":"#2563eb",readonly:i};if(i)return{stroke:"#94a3b8",fill:"#f8fafc",accent:"#64748b",text:"#475569",pinFill:"#94a3b8",readonly:i};return{stroke:"#0f172a",fill:"#ffffff",accent:"#1d4ed8",text:"#0f172a",pinFill:"#0f172a",readonly:i}}function Gf({schematicDocument:t,layoutResult:r,layoutPending:i,layoutError:o,selectedComponentId:a,uiText:s,viewState:l,onViewStateChange:c,onViewportSizeChange:u,onSelectComponent:d}){let{ref:f,width:g,height:_}=vt(),[x,b]=Y(""),[w,P]=Y(!1),y=se(null),p=se(!1),h=se(null),v=ze((M)=>{h.current=M,f(M)},[f]);H(()=>{u({width:g,height:_})},[_,u,g]),H(()=>{if(!x)return;if(!(r?.components.some((M)=>M.component.id===x)??!1))b("")},[x,r]),H(()=>{if(!w)return;let M=(ee)=>{let me=y.current;if(me===null)return;let xe=ee.clientX-me.startX,le=ee.clientY-me.startY;if(!me.moved&&(Math.abs(xe)>3||Math.abs(le)>3))me.moved=!0,p.current=!0;c({scale:l.scale,offsetX:me.offsetX+xe,offsetY:me.offsetY+le})},j=()=>{y.current=null,P(!1)},W=document.body.style.cursor,we=document.body.style.userSelect;return document.body.style.cursor="grabbing",document.body.style.userSelect="none",window.addEventListener("pointermove",M),window.addEventListener("pointerup",j),window.addEventListener("pointercancel",j),()=>{document.body.style.cursor=W,document.body.style.userSelect=we,window.removeEventListener("pointermove",M),window.removeEventListener("pointerup",j),window.removeEventListener("pointercancel",j)}},[c,w,l.scale]);let k=(M)=>{if(M.button!==0||jf(M.target))return;y.current={startX:M.clientX,startY:M.clientY,offsetX:l.offsetX,offsetY:l.offsetY,moved:!1},p.current=!1,P(!0)},C=(M)=>{if(p.current){p.current=!1;return}if(!jf(M.target))return},R=se(l),L=se(c),B=se({width:g,height:_});H(()=>{R.current=l},[l]),H(()=>{L.current=c},[c]),H(()=>{B.current={width:g,height:_}},[g,_]),H(()=>{let M=h.current;if(M===null)return;let j=(W)=>{let{width:we,height:ee}=B.current;if(we<=0||ee<=0)return;W.preventDefault();let me=R.current,xe=Yx(me.scale*(W.deltaY<0?1.12:0.8928571428571428),$x,Hx);if(xe===me.scale)return;let le=M.getBoundingClientRect(),Vt=Uf(W.clientX,W.clientY,le,me);L.current({scale:xe,offsetX:W.clientX-le.left-Vt.x*xe,offsetY:W.clientY-le.top-Vt.y*xe})};return M.addEventListener("wheel",j,{passive:!1}),()=>{M.removeEventListener("wheel",j)}},[]);let D=Boolean(r?.bounds)&&g>0&&_>0,ie=ze(()=>{let M=r?.bounds;if(!M||g<=0||_<=0)return;c(Ta(M,g,_))},[_,r,c,g]),X=Boolean(t.file_path),Oe=r?.components??[],dt=r?.groups??[],O=r?.nets??[],te=X&&t.has_schematic&&Oe.length>0,V=Math.max(g,320),oe=Math.max(_,240),J=!X?S(s,"simulation.schematic.empty_no_source_title","No schematic source file is available"):i&&t.has_schematic?S(s,"simulation.schematic.empty_layout_pending_title","Computing schematic layout"):o?S(s,"simulation.schematic.empty_layout_failed_title","Schematic layout failed"):S(s,"simulation.schematic.empty_not_renderable_title","The current document has no renderable schematic"),ue=!X?S(s,"simulation.schematic.empty_no_source_description","The current result does not yet provide a source file path that the schematic tab can consume."):i&&t.has_schematic?S(s,"simulation.schematic.empty_layout_pending_description","Computing the schematic layout from the latest schematic document."):o||t.file_name||t.title||S(s,"simulation.schematic.empty_not_renderable_description","The current schematic document did not provide drawable components.");return m("div",{className:"schematic-canvas",children:N("div",{ref:v,className:`schematic-canvas__viewport${w?" schematic-canvas__viewport--dragging":""}`,onPointerDown:k,onClick:C,children:[te?N("svg",{className:"schematic-canvas__svg",width:V,height:oe,viewBox:`0 0 ${V} ${oe}`,children:[m("defs",{children:m("pattern",{id:"schematic-grid",width:"28",height:"28",patternUnits:"userSpaceOnUse",children:m("path",{d:"M 28 0 L 0 0 0 28",fill:"none",stroke:"rgba(148, 163, 184, 0.18)",strokeWidth:"1"})})}),m("rect",{x:0,y:0,width:V,height:oe,fill:"url(#schematic-grid)"}),N("g",{transform:`translate(${l.offsetX} ${l.offsetY}) scale(${l.scale})`,children:[dt.map((M)=>{let j=Xx(M.depth);return N("g",{className:"schematic-canvas__group",children:[m("rect",{x:M.bounds.x,y:M.bounds.y,width:M.bounds.width,height:M.bounds.height,rx:18,fill:j.fill,stroke:j.stroke,strokeWidth:1.5,strokeDasharray:"7 5"}),m("text",{x:M.bounds.x+16,y:M.bounds.y+18,className:"schematic-canvas__group-label",fill:j.text,children:M.label})]},M.id)}),O.map((M)=>{let j=M.label?Vi(M.label.text):0,W=M.label?Ft(M.label,j,qt,"middle"):null;return N("g",{className:"schematic-canvas__net",children:[M.segments.map((we)=>m("polyline",{points:Ux(we.points),fill:"none",stroke:"#94a3b8",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"},we.key)),M.label&&W?N("g",{children:[m("rect",{className:"schematic-canvas__net-label-backdrop",x:W.x,y:W.y,rx:8,width:W.width,height:W.height}),m("text",{className:"schematic-canvas__net-label",x:M.label.x,y:M.label.y,textAnchor:M.label.textAnchor,dominantBaseline:"middle",children:M.label.text})]}):null]},M.net.id)}),Oe.map((M)=>{let j=M.component.id===a,W=M.component.id===x,we=jp(M.component),ee=jx(j,W,we),me=Bt(M.component.symbol_kind),xe=M.rotation===90?`translate(${M.symbolBounds.x+M.symbolBounds.width} ${M.symbolBounds.y}) rotate(90)`:`translate(${M.symbolBounds.x} ${M.symbolBounds.y})`;return N("g",{"data-schematic-component":"true",className:`schematic-canvas__component${j?" schematic-canvas__component--selected":""}${W?" schematic-canvas__component--hovered":""}${we?" schematic-canvas__component--readonly":""}`,onMouseEnter:()=>b(M.component.id),onMouseLeave:()=>b((le)=>le===M.component.id?"":le),onClick:(le)=>{le.stopPropagation(),d(M.component.id)},onKeyDown:(le)=>{if(le.key==="Enter"||le.key===" ")le.preventDefault(),d(M.component.id)},tabIndex:0,role:"button","aria-label":S(s,"simulation.schematic.select_component","Select component {name}",{name:Zt(M.component)||M.component.id}),children:[m("rect",{className:"schematic-canvas__component-hit",x:M.bounds.x,y:M.bounds.y,width:M.bounds.width,height:M.bounds.height,fill:"transparent",pointerEvents:"all"}),m("g",{transform:xe,children:(()=>{let le=me.getDimensions(M.component);return me.render({component:M.component,width:le.width,height:le.height,appearance:ee})})()}),M.pins.map((le)=>{let Vt={stroke:ee.accent,fill:ee.fill,text:ee.text};return N("g",{children:[le.stub?af(le.stub,Vt):null,m("circle",{cx:le.x,cy:le.y,r:4.4,fill:ee.pinFill})]},le.id)}),M.nameLabel?m("text",{x:M.nameLabel.x,y:M.nameLabel.y,textAnchor:M.nameLabel.textAnchor,className:"schematic-canvas__instance-label",fill:ee.text,children:M.nameLabel.text}):null,M.valueLabel?m("text",{x:M.valueLabel.x,y:M.valueLabel.y,textAnchor:M.valueLabel.textAnchor,className:"schematic-canvas__value-label",fill:ee.accent,children:M.valueLabel.text}):null]},M.component.id)})]})]}):m("div",{className:"schematic-canvas__empty-state",children:N("div",{className:`surface-state-card ${o?"surface-state-card--warning":X?"surface-state-card--warning":"surface-state-card--empty"}`,children:[m("div",{className:"card-title",children:J}),m("div",{className:"muted-text",children:ue}),t.parse_errors.length>0?m("div",{className:"surface-state-stack",children:t.parse_errors.slice(0,3).map((M,j)=>m("div",{className:"muted-text",children:M.message},`${M.source_file}-${M.line_index}-${j}`))}):null]})}),i||o||X&&te&&t.parse_errors.length>0?m("div",{className:"schematic-canvas__floating-banner",children:N("div",{className:"schematic-canvas__floating-banner-stack",children:[i?N("div",{className:"surface-state-card",children:[m("div",{className:"card-title",children:S(s,"simulation.schematic.banner_layout_pending_title","Layout computation in progress")}),m("div",{className:"muted-text",children:S(s,"simulation.schematic.banner_layout_pending_description","Only the latest layout result for the current document and revision will be applied.")})]}):null,o?N("div",{className:"surface-state-card surface-state-card--warning",children:[m("div",{className:"card-title",children:S(s,"simulation.schematic.banner_layout_failed_title","Layout failed")}),m("div",{className:"muted-text",children:o})]}):null,X&&te&&t.parse_errors.length>0?N("div",{className:"surface-state-card surface-state-card--warning",children:[m("div",{className:"card-title",children:S(s,"simulation.schematic.banner_parse_warnings_title","Parse Warnings")}),t.parse_errors.slice(0,2).map((M,j)=>m("div",{className:"muted-text",children:M.message},`${M.source_file}-${M.line_index}-${j}`))]}):null]})}):null,m("div",{className:"schematic-canvas__fit-overlay",children:m("button",{type:"button",className:"sim-compact-button",disabled:!D,onPointerDown:(M)=>M.stopPropagation(),onClick:ie,children:S(s,"common.fit","Fit")})})]})})}function Kf({component:t,schematicWriteResult:r,fieldDrafts:i,pendingFieldRequestIds:o,staleDraftNotice:a,uiText:s,onDraftChange:l,onSubmitField:c}){let u=t?t.editable_fields.filter((w)=>w.field_key==="value"):[],d=t!==null&&Object.keys(o).length>0,f=t?Gp(t,s):"--",g=Zt(t)||"--",_=t===null?"":d?S(s,"simulation.schematic.write_pending_banner","Submitting changes and waiting for the backend to re-parse and refresh."):r.component_id===t.id&&r.request_id?r.result_type==="conflict"?S(s,"simulation.schematic.write_conflict_banner","The document changed. The submission for the old revision was rejected. Please edit again based on the current content."):r.error_message||(r.success?S(s,"simulation.schematic.write_success_banner","Changes were submitted. The current display follows the refreshed backend result."):""):"",x=d?"schematic-property-panel__write-banner schematic-property-panel__write-banner--pending":r.result_type==="conflict"?"schematic-property-panel__write-banner schematic-property-panel__write-banner--warning":`schematic-property-panel__write-banner${r.success?"":" schematic-property-panel__write-banner--error"}`,b=t!==null&&!d&&r.component_id===t.id?r.field_key:"";return N("div",{className:"content-card schematic-property-panel",children:[t?N(Mt,{children:[m("div",{className:"schematic-property-panel__section",children:N("div",{className:"schematic-property-panel__meta-grid",children:[N("div",{className:"schematic-property-panel__meta-item",children:[m("span",{className:"schematic-property-panel__meta-label",children:S(s,"simulation.schematic.component_type","Component Type")}),m("span",{className:"schematic-property-panel__meta-value",children:f})]}),N("div",{className:"schematic-property-panel__meta-item",children:[m("span",{className:"schematic-property-panel__meta-label",children:S(s,"simulation.schematic.component_name","Current Component Name")}),m("span",{className:"schematic-property-panel__meta-value",children:g})]})]})}),N("div",{className:"schematic-property-panel__section",children:[m("div",{className:"card-title",children:S(s,"simulation.schematic.connected_nodes","Connected Nodes")}),m("div",{className:"schematic-property-panel__pin-list",children:t.pins.length>0?t.pins.map((w)=>N("div",{className:"schematic-property-panel__pin-item",children:[m("span",{className:"schematic-property-panel__pin-name",children:w.name}),m("span",{className:"schematic-property-panel__pin-node",children:w.node_id||"--"})]},`${t.id}-${w.name}`)):m("div",{className:"muted-text",children:S(s,"simulation.schematic.no_pins","This component has no pins to display.")})})]}),N("div",{className:"schematic-property-panel__section schematic-property-panel__section--grow",children:[m("div",{className:"card-title",children:S(s,"simulation.schematic.component_value","Component Value")}),m("div",{className:"schematic-property-panel__field-list",children:u.length>0?u.map((w)=>{let P=i[w.field_key]??w.raw_text,y=Boolean(o[w.field_key]),p=b===w.field_key&&Boolean(r.request_id),h=w.raw_text||t.display_value||"";return N("div",{className:`schematic-property-panel__field-card${w.editable?"":" schematic-property-panel__field-card--readonly"}`,children:[N("div",{className:"schematic-property-panel__meta-grid",children:[N("label",{className:"schematic-property-panel__field-label",children:[m("span",{className:"schematic-property-panel__field-caption",children:S(s,"simulation.schematic.current_value","Current Value")}),m("input",{className:"schematic-property-panel__input",type:"text",value:h,readOnly:!0})]}),N("label",{className:"schematic-property-panel__field-label",children:[m("span",{className:"schematic-property-panel__field-caption",children:S(s,"simulation.schematic.replacement_value","Replacement Value")}),m("input",{className:"schematic-property-panel__input",type:"text",value:P,disabled:!w.editable||y,onChange:(v)=>l(w.field_key,v.target.value)})]})]}),!w.editable?m("div",{className:"muted-text",children:w.readonly_reason||S(s,"simulation.schematic.value_not_editable","The current component value cannot be edited.")}):null,N("div",{className:"schematic-property-panel__field-footer",children:[m("div",{className:"muted-text",children:y?S(s,"simulation.schematic.pending_write","Submitting changes..."):""}),m("button",{type:"button",className:"sim-compact-button sim-compact-button--accent",disabled:!w.editable||P===w.raw_text||y,onClick:()=>c(w),children:y?S(s,"common.submitting","Submitting..."):S(s,"common.submit","Submit")})]}),y?m("div",{className:"schematic-property-panel__write-message schematic-property-panel__write-message--pending",children:S(s,"simulation.schematic.pending_write_hint","Requesting backend write-back. The current display follows the refreshed backend result.")}):null,p&&r.error_message?m("div",{className:"schematic-property-panel__write-message schematic-property-panel__write-message--error",children:r.error_message}):null]},`${t.id}-${w.field_key}`)}):m("div",{className:"muted-text",children:S(s,"simulation.schematic.no_editable_value","This component has no editable value.")})})]})]}):N("div",{className:"schematic-property-panel__section schematic-property-panel__section--grow",children:[m("div",{className:"card-title",children:S(s,"simulation.schematic.component_details","Component Details")}),m("div",{className:"muted-text",children:S(s,"simulation.schematic.component_details_hint","Select a component to inspect its type, connected nodes, and component value.")})]}),_?m("div",{className:x,children:_}):null,a?m("div",{className:"schematic-property-panel__write-banner schematic-property-panel__write-banner--warning",children:a}):null]})}function Dc(t,r){return`${t}::${r}`}function Gx(){return{result:null,pending:!1,error:"",fallbackErrorKey:""}}function Kx(){return{width:0,height:0}}function Qx(t,r){return`${t}::${r}`}function Qf(t,r){return`${t}::${r}`}function Zf({bridge:t,schematicDocument:r,schematicWriteResult:i,uiText:o}){let[a,s]=Y(null),[l,c]=Y({}),[u,d]=Y({}),[f,g]=Y(!1),[_,x]=Y(Gx),[b,w]=Y(Yf),[P,y]=Y(Kx),p=se(0),h=se(""),v=se(""),k=se(""),C=U(()=>{if(!a)return null;return r.components.find((O)=>O.id===a)??null},[r.components,a]);H(()=>{let O=`${r.document_id}::${r.revision}`,te=Object.keys(l).length>0,V=Object.keys(u).length>0;if(k.current&&k.current!==O&&te&&!V)g(!0);k.current=O,c({}),d({})},[r.document_id,r.revision]),H(()=>{if(!i.request_id)return;d((O)=>{let te=Object.entries(O).filter(([,V])=>V.requestId!==i.request_id);if(te.length===Object.keys(O).length)return O;return Object.fromEntries(te)})},[i.request_id]),H(()=>{if(!a)return;if(!r.components.some((O)=>O.id===a))s(null)},[r.components,a]),H(()=>{if(a)return;if(!r.has_schematic||r.components.length===0)return;s(r.components[0].id)},[r.components,r.has_schematic,a]),H(()=>{let O=Qx(r.document_id,r.revision);h.current=O,v.current=O,x((V)=>({result:V.result,pending:!0,error:"",fallbackErrorKey:""}));let te=!1;return Xf(r).then((V)=>{if(te||h.current!==V.requestKey)return;x({result:V,pending:!1,error:"",fallbackErrorKey:""})}).catch((V)=>{if(te||h.current!==O)return;x((oe)=>({result:oe.result,pending:!1,error:V instanceof Error?V.message:"",fallbackErrorKey:V instanceof Error?"":"simulation.schematic.layout_failed"}))}),()=>{te=!0}},[r.document_id,r.revision]),H(()=>{let O=_.result?.bounds;if(!O||P.width<=0||P.height<=0||_.result===null)return;if(v.current!==_.result.requestKey)return;v.current="",w(Ta(O,P.width,P.height))},[_.result,P.height,P.width]);let R=ze((O)=>{w((te)=>{if(te.scale===O.scale&&te.offsetX===O.offsetX&&te.offsetY===O.offsetY)return te;return O})},[]),L=ze((O)=>{y((te)=>{if(te.width===O.width&&te.height===O.height)return te;return O})},[]),B=U(()=>{if(C===null)return{};return Object.fromEntries(C.editable_fields.filter((O)=>O.field_key==="value").map((O)=>[O.field_key,l[Dc(C.id,O.field_key)]??O.raw_text]))},[l,C]),D=U(()=>{if(C===null)return{};return Object.fromEntries(Object.values(u).filter((O)=>O.componentId===C.id).map((O)=>[O.fieldKey,O.requestId]))},[u,C]),ie=(O,te)=>{if(C===null)return;g(!1),c((V)=>({...V,[Dc(C.id,O)]:te}))},X=(O)=>{if(C===null||!O.editable||!t)return;if(O.field_key!=="value")return;let te=Dc(C.id,O.field_key),V=l[te]??O.raw_text;if(V===O.raw_text)return;if(u[Qf(C.id,O.field_key)])return;g(!1),p.current+=1;let oe=`${Date.now()}-${p.current}`;d((J)=>({...J,[Qf(C.id,O.field_key)]:{requestId:oe,documentId:r.document_id,revision:r.revision,componentId:C.id,fieldKey:O.field_key}})),t.updateSchematicValue({documentId:r.document_id,revision:r.revision,componentId:C.id,fieldKey:O.field_key,newText:V,requestId:oe})},Oe=f?S(o,"simulation.schematic.stale_draft_notice","The authoritative document was refreshed and local drafts for the old revision were discarded."):"",dt=_.error||(_.fallbackErrorKey?S(o,_.fallbackErrorKey,"Failed to compute the schematic layout."):"");return m("div",{className:"tab-surface",children:m(bn,{sidebarConfig:{defaultSize:320,minSize:280,maxSize:460,mainMinSize:360,resizable:!0},sidebar:m(Kf,{component:C,schematicWriteResult:i,fieldDrafts:B,pendingFieldRequestIds:D,staleDraftNotice:Oe,uiText:o,onDraftChange:ie,onSubmitField:X}),main:m("div",{className:"content-card content-card--canvas",children:m(Gf,{schematicDocument:r,layoutResult:_.result,layoutPending:_.pending,layoutError:dt,selectedComponentId:a,uiText:o,viewState:b,onViewStateChange:R,onViewportSizeChange:L,onSelectComponent:s})})})})}function qf({state:t,schematicDocument:r,schematicWriteResult:i,rawDataCopyResult:o,rawDataDocument:a,rawDataViewport:s,bridge:l,bridgeConnected:c,onTabSelect:u}){let d=t.surface_tabs.active_tab,f=t.ui_text,g=d==="schematic"||Boolean(r.file_path),_=d==="raw_data"||a.has_data;return N(Ip,{state:t,bridgeConnected:c,onTabSelect:u,children:[d==="raw_data"||d==="schematic"?null:m("div",{className:"tab-surface-shell",children:m(Tp,{activeTab:d,state:t,bridge:l})}),g?m("div",{className:d==="schematic"?"tab-surface-shell":"tab-surface-shell tab-surface-shell--hidden",children:m(Zf,{bridge:l,schematicDocument:r,schematicWriteResult:i,uiText:f})}):null,_?m("div",{className:d==="raw_data"?"tab-surface-shell":"tab-surface-shell tab-surface-shell--hidden",children:m(zp,{rawDataCopyResult:o,rawDataDocument:a,rawDataViewport:s,bridge:l,uiText:f})}):null]})}var Zx=["circuit_selection","metrics","schematic","chart","waveform","analysis_info","raw_data","output_log","export","asc_conversion","op_result"],qx=new Set(["op_result"]),Jx=Zx.filter((t)=>!qx.has(t)),eb={has_result:!1,result_path:"",file_path:"",file_name:"",analysis_type:"",analysis_label:"",executor:"",success:!1,timestamp:"",duration_seconds:0,version:0,session_id:"",x_axis_kind:"",x_axis_label:"",x_axis_scale:"",requested_x_range:null,actual_x_range:null,has_raw_output:!1},tb={cursor_a_x:null,cursor_b_x:null,values_a:{},values_b:{}},nb={enabled:!1,target_id:"",point_x:null,title:"",plot_series_name:"",plot_axis_key:"left",plot_y:null,values:[]},Jf={active:!1,x_min:null,x_max:null,left_y_min:null,left_y_max:null,right_y_min:null,right_y_max:null},rb={cursor_a_x:null,cursor_b_x:null,values_a:{},values_b:{}},nh={dataset_id:"",version:0,has_data:!1,row_count:0,column_count:0,row_header_width_px:0,row_height_px:0,column_header_height_px:0,columns:[]},rh={dataset_id:"",version:0,row_start:0,row_end:0,col_start:0,col_end:0,rows:[]},ih={dataset_id:"",version:0,sequence:0,success:!1,row_count:0,col_count:0},oh={document_id:"",revision:"",file_path:"",file_name:"",has_schematic:!1,title:"",components:[],nets:[],subcircuits:[],parse_errors:[],readonly_reasons:[]},ah={document_id:"",revision:"",request_id:"",success:!1,component_id:"",field_key:"",result_type:"",error_message:""},Ia={simulation_runtime:{status:"idle",status_message:"",error_message:"",project_root:"",has_project:!1,current_result_path:"",is_empty:!0,has_result:!1,has_error:!1,awaiting_confirmation:!1,current_result:eb},surface_tabs:{active_tab:"metrics",available_tabs:Jx,has_op_result:!1},metrics_view:{items:[],source_file_path:"",can_add_to_conversation:!1},analysis_chart_view:{has_chart:!1,chart_count:0,can_export:!1,can_add_to_conversation:!1,title:"",chart_type:"",chart_type_display_name:"",x_label:"",y_label:"",secondary_y_label:"",log_x:!1,log_y:!1,right_log_y:!1,available_series:[],visible_series:[],visible_series_count:0,viewport:Jf,measurement_point:nb,measurement_enabled:!1,measurement:tb},waveform_view:{has_waveform:!1,signal_count:0,signal_names:[],can_export:!1,can_add_to_conversation:!1,displayed_signal_names:[],signal_catalog:[],visible_series:[],x_axis_label:"",y_label:"",secondary_y_label:"",log_x:!1,viewport:Jf,cursor_a_visible:!1,cursor_b_visible:!1,measurement:rb,comparison:null},analysis_info_view:{analysis_type:"",analysis_command:"",executor:"",file_name:"",x_axis_kind:"",x_axis_label:"",x_axis_scale:"",requested_x_range:null,actual_x_range:null,parameters:{}},output_log_view:{has_log:!1,can_add_to_conversation:!1,current_filter:"all",search_keyword:"",lines:[],selected_line_number:null},export_view:{has_result:!1,can_export:!1,items:[],selected_directory:"",latest_project_export_root:""},asc_conversion_view:{can_choose_files:!1,selected_files_summary:""},circuit_selection_view:{items:[],selected_circuit_file:""},op_result_view:{is_available:!1,file_name:"",analysis_command:"",row_count:0,section_count:0,sections:[],can_add_to_conversation:!1},ui_text:{}};function G(t){return t&&typeof t==="object"?t:{}}function E(t){return typeof t==="string"?t:""}function Z(t){return typeof t==="boolean"?t:!1}function q(t){return typeof t==="number"&&Number.isFinite(t)?t:0}function Ue(t){return typeof t==="number"&&Number.isFinite(t)?t:null}function ut(t){if(!Array.isArray(t))return[];return t.map((r)=>String(r??"")).filter(Boolean)}function Aa(t){if(!Array.isArray(t)||t.length!==2)return null;let[r,i]=t;return[q(r),q(i)]}function Nn(t){if(!Array.isArray(t))return[];return t.map((r)=>q(r))}function Da(t){let r=G(t);return Object.fromEntries(Object.entries(r).map(([i,o])=>[i,q(o)]))}function Qn(t){let r=G(t);return Object.fromEntries(Object.entries(r).map(([i,o])=>[i,E(o)]))}function ib(t){return Qn(t)}function eh(t){let r=G(t);return{active:Z(r.active),x_min:Ue(r.x_min),x_max:Ue(r.x_max),left_y_min:Ue(r.left_y_min),left_y_max:Ue(r.left_y_max),right_y_min:Ue(r.right_y_min),right_y_max:Ue(r.right_y_max)}}function ob(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{name:E(i.name),color:E(i.color),axis_key:E(i.axis_key),line_style:E(i.line_style),group_key:E(i.group_key),component:E(i.component),visible:Z(i.visible),point_count:q(i.point_count)}})}function ab(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{name:E(i.name),node_id:E(i.node_id),role:E(i.role)}})}function sb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{field_key:E(i.field_key),label:E(i.label),raw_text:E(i.raw_text),display_text:E(i.display_text),editable:Z(i.editable),readonly_reason:E(i.readonly_reason),value_kind:E(i.value_kind)}})}function lb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{id:E(i.id),instance_name:E(i.instance_name),kind:E(i.kind),symbol_kind:E(i.symbol_kind)||"unknown",display_name:E(i.display_name),display_value:E(i.display_value),pins:ab(i.pins),node_ids:ut(i.node_ids),editable_fields:sb(i.editable_fields),scope_path:ut(i.scope_path),source_file:E(i.source_file),symbol_variant:E(i.symbol_variant),primitive_kind:E(i.primitive_kind),primitive_source:E(i.primitive_source),subckt_name:E(i.subckt_name),resolved_model_name:E(i.resolved_model_name),semantic_roles:ut(i.semantic_roles),pin_roles:Qn(i.pin_roles),port_side_hints:Qn(i.port_side_hints),label_slots:Qn(i.label_slots),polarity_marks:Qn(i.polarity_marks),render_hints:Qn(i.render_hints)}})}function cb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r),o=Array.isArray(i.connections)?i.connections.map((a)=>{let s=G(a);return{component_id:E(s.component_id),instance_name:E(s.instance_name),pin_name:E(s.pin_name),pin_role:E(s.pin_role)}}):[];return{id:E(i.id),name:E(i.name),scope_path:ut(i.scope_path),source_file:E(i.source_file),connections:o}})}function ub(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{name:E(i.name),port_names:ut(i.port_names),scope_path:ut(i.scope_path),source_file:E(i.source_file),component_ids:ut(i.component_ids),primitive_kind:E(i.primitive_kind)}})}function db(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{message:E(i.message),source_file:E(i.source_file),line_text:E(i.line_text),line_index:q(i.line_index),column_start:q(i.column_start),column_end:q(i.column_end)}})}function mb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{name:E(i.name),color:E(i.color),axis_key:E(i.axis_key),line_style:E(i.line_style),group_key:E(i.group_key),component:E(i.component),x:Nn(i.x),y:Nn(i.y),point_count:q(i.point_count),sampled_point_count:q(i.sampled_point_count)}})}function pb(t){let r=G(t);return{cursor_a_x:Ue(r.cursor_a_x),cursor_b_x:Ue(r.cursor_b_x),values_a:Da(r.values_a),values_b:Da(r.values_b)}}function fb(t){let r=G(t),i=Array.isArray(r.values)?r.values.map((o)=>{let a=G(o);return{label:E(a.label),value_text:E(a.value_text)}}):[];return{enabled:Z(r.enabled),target_id:E(r.target_id),point_x:Ue(r.point_x),title:E(r.title),plot_series_name:E(r.plot_series_name),plot_axis_key:E(r.plot_axis_key)||"left",plot_y:Ue(r.plot_y),values:i}}function hb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{name:E(i.name),visible:Z(i.visible)}})}function gb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{name:E(i.name),color:E(i.color),axis_key:E(i.axis_key),x:Nn(i.x),y:Nn(i.y),point_count:q(i.point_count),sampled_point_count:q(i.sampled_point_count)}})}function _b(t){let r=G(t);return{cursor_a_x:Ue(r.cursor_a_x),cursor_b_x:Ue(r.cursor_b_x),values_a:Da(r.values_a),values_b:Da(r.values_b)}}function th(t){if(!Array.isArray(t))return[];return t.map((r)=>Ue(r))}function yb(t){if(!t||typeof t!=="object")return null;let r=G(t),i=Array.isArray(r.runs)?r.runs:[];return{signal_name:E(r.signal_name),run_count:q(r.run_count),run_color:E(r.run_color),mean_color:E(r.mean_color),runs_x:th(r.runs_x),runs_y:th(r.runs_y),runs:i.map((o)=>{let a=G(o);return{bundle_id:E(a.bundle_id),label:E(a.label),signal_name:E(a.signal_name)}}),skipped:Qn(r.skipped),reference_index:q(r.reference_index),x:Nn(r.x),mean:Nn(r.mean),lower:Nn(r.lower),upper:Nn(r.upper),source_points:q(r.source_points)}}function vb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{key:E(i.key),label:E(i.label),width_px:q(i.width_px)}})}function Sb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{row_index:q(i.row_index),values:ut(i.values)}})}function xb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{line_number:q(i.line_number),content:E(i.content),level:E(i.level)}})}function bb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{name:E(i.name),display_name:E(i.display_name),value:E(i.value),unit:E(i.unit),raw_value:Ue(i.raw_value),target:E(i.target)}})}function wb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{id:E(i.id),label:E(i.label),selected:Z(i.selected),enabled:Z(i.enabled)}})}function kb(t){let r=G(t);return{id:E(r.id),result_path:E(r.result_path),file_path:E(r.file_path),file_name:E(r.file_name),analysis_type:E(r.analysis_type),success:Z(r.success),timestamp:E(r.timestamp),is_current:Z(r.is_current),can_load:Z(r.can_load)}}function Cb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r);return{circuit_file:E(i.circuit_file),circuit_absolute_path:E(i.circuit_absolute_path),circuit_display_name:E(i.circuit_display_name),run_count:q(i.run_count),is_current:Z(i.is_current),latest_result:kb(i.latest_result),comparison_result_paths:ut(i.comparison_result_paths)}})}function Nb(t){if(!Array.isArray(t))return[];return t.map((r)=>{let i=G(r),o=Array.isArray(i.rows)?i.rows.map((a)=>{let s=G(a);return{name:E(s.name),formatted_value:E(s.formatted_value),raw_value:Ue(s.raw_value),unit:E(s.unit)}}):[];return{id:E(i.id),title:E(i.title),row_count:q(i.row_count),rows:o}})}function sh(t){let r=G(t),i=G(r.simulation_runtime),o=G(r.surface_tabs),a=G(r.metrics_view),s=G(r.analysis_chart_view),l=G(r.waveform_view),c=G(r.analysis_info_view),u=G(r.output_log_view),d=G(r.export_view),f=G(r.asc_conversion_view),g=G(r.circuit_selection_view),_=G(r.op_result_view),x=i,b=G(i.current_result);return{simulation_runtime:{status:E(x.status)||Ia.simulation_runtime.status,status_message:E(x.status_message),error_message:E(x.error_message),project_root:E(x.project_root),has_project:Z(x.has_project),current_result_path:E(x.current_result_path),is_empty:Z(x.is_empty),has_result:Z(x.has_result),has_error:Z(x.has_error),awaiting_confirmation:Z(x.awaiting_confirmation),current_result:{has_result:Z(b.has_result),result_path:E(b.result_path),file_path:E(b.file_path),file_name:E(b.file_name),analysis_type:E(b.analysis_type),analysis_label:E(b.analysis_label),executor:E(b.executor),success:Z(b.success),timestamp:E(b.timestamp),duration_seconds:q(b.duration_seconds),version:q(b.version),session_id:E(b.session_id),x_axis_kind:E(b.x_axis_kind),x_axis_label:E(b.x_axis_label),x_axis_scale:E(b.x_axis_scale),requested_x_range:Aa(b.requested_x_range),actual_x_range:Aa(b.actual_x_range),has_raw_output:Z(b.has_raw_output)}},surface_tabs:{active_tab:E(o.active_tab)||Ia.surface_tabs.active_tab,available_tabs:ut(o.available_tabs),has_op_result:Z(o.has_op_result)},metrics_view:{items:bb(a.items),source_file_path:E(a.source_file_path),can_add_to_conversation:Z(a.can_add_to_conversation)},analysis_chart_view:{has_chart:Z(s.has_chart),chart_count:q(s.chart_count),can_export:Z(s.can_export),can_add_to_conversation:Z(s.can_add_to_conversation),title:E(s.title),chart_type:E(s.chart_type),chart_type_display_name:E(s.chart_type_display_name),x_label:E(s.x_label),y_label:E(s.y_label),secondary_y_label:E(s.secondary_y_label),log_x:Z(s.log_x),log_y:Z(s.log_y),right_log_y:Z(s.right_log_y),available_series:ob(s.available_series),visible_series:mb(s.visible_series),visible_series_count:q(s.visible_series_count),viewport:eh(s.viewport),measurement_point:fb(s.measurement_point),measurement_enabled:Z(s.measurement_enabled),measurement:pb(s.measurement)},waveform_view:{has_waveform:Z(l.has_waveform),signal_count:q(l.signal_count),signal_names:ut(l.signal_names),can_export:Z(l.can_export),can_add_to_conversation:Z(l.can_add_to_conversation),displayed_signal_names:ut(l.displayed_signal_names),signal_catalog:hb(l.signal_catalog),visible_series:gb(l.visible_series),x_axis_label:E(l.x_axis_label),y_label:E(l.y_label),secondary_y_label:E(l.secondary_y_label),log_x:Z(l.log_x),viewport:eh(l.viewport),cursor_a_visible:Z(l.cursor_a_visible),cursor_b_visible:Z(l.cursor_b_visible),measurement:_b(l.measurement),comparison:yb(l.comparison)},analysis_info_view:{analysis_type:E(c.analysis_type),analysis_command:E(c.analysis_command),executor:E(c.executor),file_name:E(c.file_name),x_axis_kind:E(c.x_axis_kind),x_axis_label:E(c.x_axis_label),x_axis_scale:E(c.x_axis_scale),requested_x_range:Aa(c.requested_x_range),actual_x_range:Aa(c.actual_x_range),parameters:G(c.parameters)},output_log_view:{has_log:Z(u.has_log),can_add_to_conversation:Z(u.can_add_to_conversation),current_filter:E(u.current_filter)||"all",search_keyword:E(u.search_keyword),lines:xb(u.lines),selected_line_number:Ue(u.selected_line_number)},export_view:{has_result:Z(d.has_result),can_export:Z(d.can_export),items:wb(d.items),selected_directory:E(d.selected_directory),latest_project_export_root:E(d.latest_project_export_root)},asc_conversion_view:{can_choose_files:Z(f.can_choose_files),selected_files_summary:E(f.selected_files_summary)},circuit_selection_view:{items:Cb(g.items),selected_circuit_file:E(g.selected_circuit_file)},op_result_view:{is_available:Z(_.is_available),file_name:E(_.file_name),analysis_command:E(_.analysis_command),row_count:q(_.row_count),section_count:q(_.section_count),sections:Nb(_.sections),can_add_to_conversation:Z(_.can_add_to_conversation)},ui_text:ib(r.ui_text)}}function lh(t){let r=G(t);return{dataset_id:E(r.dataset_id),version:q(r.version),has_data:Z(r.has_data),row_count:q(r.row_count),column_count:q(r.column_count),row_header_width_px:q(r.row_header_width_px),row_height_px:q(r.row_height_px),column_header_height_px:q(r.column_header_height_px),columns:vb(r.columns)}}function ch(t){let r=G(t);return{document_id:E(r.document_id),revision:E(r.revision),file_path:E(r.file_path),file_name:E(r.file_name),has_schematic:Z(r.has_schematic),title:E(r.title),components:lb(r.components),nets:cb(r.nets),subcircuits:ub(r.subcircuits),parse_errors:db(r.parse_errors),readonly_reasons:ut(r.readonly_reasons)}}function uh(t){let r=G(t);return{document_id:E(r.document_id),revision:E(r.revision),request_id:E(r.request_id),success:Z(r.success),component_id:E(r.component_id),field_key:E(r.field_key),result_type:E(r.result_type),error_message:E(r.error_message)}}function dh(t){let r=G(t);return{dataset_id:E(r.dataset_id),version:q(r.version),row_start:q(r.row_start),row_end:q(r.row_end),col_start:q(r.col_start),col_end:q(r.col_end),rows:Sb(r.rows)}}function mh(t){let r=G(t);return{dataset_id:E(r.dataset_id),version:q(r.version),sequence:q(r.sequence),success:Z(r.success),row_count:q(r.row_count),col_count:q(r.col_count)}}function Eb(){let[t,r]=Y(Ia),[i,o]=Y(ih),[a,s]=Y(nh),[l,c]=Y(rh),[u,d]=Y(oh),[f,g]=Y(ah),[_,x]=Y(null),[b,w]=Y(!1);return H(()=>{let y={setState(p){r(sh(p))},setSchematicDocument(p){d(ch(p))},finishSchematicWrite(p){g(uh(p))},setRawDataDocument(p){s(lh(p))},setRawDataViewport(p){c(dh(p))},finishRawDataCopy(p){o(mh(p))}};return window.simulationApp=y,()=>{delete window.simulationApp}},[]),H(()=>{if(!window.qt?.webChannelTransport||!window.QWebChannel)return;let y=!1;return new window.QWebChannel(window.qt.webChannelTransport,(p)=>{if(y)return;let h=p.objects.simulationBridge??null;x(h),w(Boolean(h)),h?.markReady?.()}),()=>{y=!0,x(null),w(!1)}},[]),m(qf,{state:t,schematicDocument:u,schematicWriteResult:f,rawDataCopyResult:i,rawDataDocument:a,rawDataViewport:l,bridge:_,bridgeConnected:b,onTabSelect:(y)=>{_?.activateTab(y)}})}var ph=document.getElementById("root");if(ph)fh.createRoot(ph).render(m(Eb,{}));export{e,n};
@@ -16,6 +16,7 @@
 - model_registry: LLM 模型注册表
 - embedding_model_registry: 嵌入模型注册表
 - async_runtime: qasync 异步运行时（Qt + asyncio 融合事件循环）
+- lazy_import: 包级延迟导出（推迟重型子模块导入）
 
 三层状态分离架构（新）：
 - UIState (presentation/ui_state.py): 纯 UI 状态
@@ -12,6 +12,9 @@ from shared.constants.paths import (
     CONVERSATIONS_DIR,
     TEMP_DIR,
     CHECKPOINTS_DB,
+    FILE_NAME_INDEX_FILE,
+    DEPENDENCY_GRAPH_FILE,
+    EMBEDDING_CONFIG_FILE,
 )
 
 __all__ = [
@@ -22,4 +25,7 @@ __all__ = [
     "CONVERSATIONS_DIR",
     "TEMP_DIR",
     "CHECKPOINTS_DB",
+    "FILE_NAME_INDEX_FILE",
+    "DEPENDENCY_GRAPH_FILE",
+    "EMBEDDING_CONFIG_FILE",
 ]
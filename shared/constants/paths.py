@@ -58,6 +58,19 @@ TEMP_DIR = f"{SYSTEM_DIR}/temp"
 # LangGraph 检查点数据库（相对于项目根目录）
 CHECKPOINTS_DB = f"{SYSTEM_DIR}/checkpoints.sqlite3"
 
+# ============================================================
+# 索引相关路径
+# ============================================================
+
+# 文件名索引快照（相对于项目根目录）
+FILE_NAME_INDEX_FILE = f"{SYSTEM_DIR}/file_name_index.json"
+
+# 电路依赖图缓存（相对于项目根目录）
+DEPENDENCY_GRAPH_FILE = f"{SYSTEM_DIR}/dependency_graph.json"
+
+# 项目级嵌入模型配置覆盖（相对于项目根目录）
+EMBEDDING_CONFIG_FILE = f"{SYSTEM_DIR}/embedding_config.json"
+
 # ============================================================
 # 模块导出
 # ============================================================
@@ -69,4 +82,7 @@ __all__ = [
     "CONVERSATIONS_DIR",
     "TEMP_DIR",
     "CHECKPOINTS_DB",
+    "FILE_NAME_INDEX_FILE",
+    "DEPENDENCY_GRAPH_FILE",
+    "EMBEDDING_CONFIG_FILE",
 ]
@@ -17,6 +17,10 @@
     
     # 查询模型列表
     models = EmbeddingModelRegistry.list_models("zhipu")
+
+本地厂商（local）：
+- 使用 vendor/models/embeddings/ 下随包分发的 sentence-transformers 模型，
+  在独立进程中做 CPU 批量推理，无需 API Key、不受网络延迟与限速影响
 """
 
 import logging
@@ -65,6 +69,31 @@ ZHIPU_EMBEDDING_PROVIDER = EmbeddingProviderConfig(
 )
 
 
+# 本地嵌入模型（目录名与 infrastructure/utils/model_config.py 中的 EMBEDDING_MODEL_DIR 一致）
+LOCAL_EMBEDDING_MODELS = [
+    EmbeddingModelConfig(
+        id="local:gte-modernbert-base",
+        provider="local",
+        name="gte-modernbert-base",
+        display_name="GTE ModernBERT Base",
+        dimensions=768,
+        max_tokens=8192,
+        is_local=True,
+        description="随包分发的本地嵌入模型，CPU 推理，768 维向量",
+    ),
+]
+
+LOCAL_EMBEDDING_PROVIDER = EmbeddingProviderConfig(
+    id="local",
+    display_name="本地模型",
+    base_url="",
+    default_model="gte-modernbert-base",
+    requires_api_key=False,
+    is_local=True,
+    implemented=True,
+)
+
+
 # ============================================================
 # 嵌入模型注册表
 # ============================================================
@@ -101,7 +130,9 @@ class EmbeddingModelRegistry:
         # 注册内置厂商
         cls.register_provider(ZHIPU_EMBEDDING_PROVIDER)
         
-        for model in ZHIPU_EMBEDDING_MODELS:
+        cls.register_provider(LOCAL_EMBEDDING_PROVIDER)
+        
+        for model in ZHIPU_EMBEDDING_MODELS + LOCAL_EMBEDDING_MODELS:
             cls.register_model(model)
         
         cls._initialized = True
@@ -271,6 +302,8 @@ class EmbeddingModelRegistry:
 
 __all__ = [
     "EmbeddingModelRegistry",
+    "LOCAL_EMBEDDING_MODELS",
+    "LOCAL_EMBEDDING_PROVIDER",
     "ZHIPU_EMBEDDING_MODELS",
     "ZHIPU_EMBEDDING_PROVIDER",
 ]
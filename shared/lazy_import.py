@@ -0,0 +1,78 @@
+# Lazy Package Exports
+"""
+包级延迟导出
+
+职责：
+- 让包的 __init__ 保留原有的便捷导出名，但推迟子模块导入到首次访问
+- 避免 `import 包.子模块` 时顺带拉起整包的重型依赖
+
+设计背景：
+- Python 导入任意子模块前都会先执行其父包的 __init__
+- 若 __init__ 中聚合导入了 langchain_core / langgraph 等重型库，
+  启动路径上只需要一个轻量子模块也要付出整包的导入成本
+- PEP 562 的模块级 __getattr__ 可在首次访问导出名时再导入对应子模块
+
+使用示例：
+    # 包的 __init__.py
+    from shared.lazy_import import lazy_exports
+
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        "domain.rag.embedder": ("Embedder",),
+        "domain.rag.vector_store": ("RAGQueryResult", "VectorStore"),
+    })
+
+    # 调用方写法不变
+    from domain.rag import Embedder
+"""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package_name: str,
+    exports: Dict[str, Iterable[str]],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    构造包级 __getattr__ / __dir__
+
+    Args:
+        package_name: 包名，通常传入 __name__
+        exports: 子模块全名 -> 该子模块导出的名字列表
+
+    Returns:
+        (__getattr__, __dir__)，直接赋值给包模块的同名属性
+
+    Raises:
+        ValueError: 同一导出名对应多个子模块
+    """
+    owners: Dict[str, str] = {}
+    for module_name, names in exports.items():
+        for name in names:
+            if name in owners:
+                raise ValueError(f"导出名重复: {name} ({owners[name]}, {module_name})")
+            owners[name] = module_name
+
+    def __getattr__(name: str) -> Any:
+        module_name = owners.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(import_module(module_name), name)
+        # 缓存到包命名空间，后续访问不再经过 __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(owners))
+
+    return __getattr__, __dir__
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "lazy_exports",
+]
@@ -25,6 +25,9 @@
     # 获取服务（运行时）
     event_bus = ServiceLocator.get(SVC_EVENT_BUS)
     
+    # 注册延迟工厂（启动时），首次获取时才构造实例
+    ServiceLocator.register_factory(SVC_FILE_SEARCH_SERVICE, FileSearchService)
+    
     # 延迟获取模式（推荐）
     class MyClass:
         def __init__(self):
@@ -37,7 +40,8 @@
             return self._event_bus
 """
 
-from typing import Any, Dict, Optional, TypeVar
+import threading
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 T = TypeVar('T')
 
@@ -67,7 +71,8 @@ class ServiceLocator:
     
     线程安全说明：
     - 注册操作仅在启动阶段（单线程）执行
-    - 运行时仅执行读取操作，无需加锁
+    - 已构造实例的读取无需加锁
+    - 延迟工厂的构造在锁内执行，后台预热线程与主线程并发获取时只构造一次
     """
 
     # 单例实例
@@ -76,6 +81,12 @@ class ServiceLocator:
     # 服务注册表
     _services: Dict[str, Any] = {}
 
+    # 延迟工厂表：首次获取时构造并移入 _services
+    _factories: Dict[str, Callable[[], Any]] = {}
+
+    # 延迟工厂构造锁（可重入：工厂内部可以获取其他延迟服务）
+    _factory_lock = threading.RLock()
+
     def __new__(cls) -> 'ServiceLocator':
         """确保单例"""
         if cls._instance is None:
@@ -114,12 +125,64 @@ class ServiceLocator:
         if service is None:
             raise ValueError(f"服务实例不能为 None: {name}")
 
+        cls._factories.pop(name, None)
         cls._services[name] = service
 
+    @classmethod
+    def register_factory(cls, name: str, factory: Callable[[], Any]) -> None:
+        """
+        注册延迟工厂
+        
+        服务在首次 get() / get_optional() 时才构造，构造结果缓存为普通实例。
+        只适用于构造函数不订阅事件、不产生副作用的服务；
+        需要在启动时就监听事件的服务仍应使用 register()。
+        
+        Args:
+            name: 服务名
+            factory: 无参可调用对象，返回服务实例
+            
+        Raises:
+            ValueError: 服务名为空或 factory 不可调用
+        """
+        if not name:
+            raise ValueError("服务名不能为空")
+        if not callable(factory):
+            raise ValueError(f"服务工厂不可调用: {name}")
+
+        with cls._factory_lock:
+            cls._services.pop(name, None)
+            cls._factories[name] = factory
+
     @classmethod
     def unregister(cls, name: str) -> None:
-        """注销服务实例，不存在时静默忽略"""
-        cls._services.pop(name, None)
+        """注销服务实例或未构造的工厂，不存在时静默忽略"""
+        with cls._factory_lock:
+            cls._factories.pop(name, None)
+            cls._services.pop(name, None)
+
+    @classmethod
+    def _construct(cls, name: str) -> Optional[Any]:
+        """
+        执行延迟工厂，未注册工厂且无实例时返回 None
+        
+        工厂抛出的异常原样向上传播，工厂保留以便下次重试。
+        """
+        if name not in cls._factories:
+            # 并发场景下工厂可能刚被其他线程消费，实例已先于工厂移除写入
+            return cls._services.get(name)
+        with cls._factory_lock:
+            service = cls._services.get(name)
+            if service is not None:
+                return service
+            factory = cls._factories.get(name)
+            if factory is None:
+                return None
+            service = factory()
+            if service is None:
+                raise ValueError(f"服务工厂返回了 None: {name}")
+            cls._services[name] = service
+            del cls._factories[name]
+            return service
 
     @classmethod
     def get(cls, name: str) -> Any:
@@ -135,9 +198,12 @@ class ServiceLocator:
         Raises:
             ServiceNotFoundError: 服务未注册
         """
-        if name not in cls._services:
+        service = cls._services.get(name)
+        if service is None:
+            service = cls._construct(name)
+        if service is None:
             raise ServiceNotFoundError(name)
-        return cls._services[name]
+        return service
 
     @classmethod
     def get_optional(cls, name: str) -> Optional[Any]:
@@ -153,12 +219,15 @@ class ServiceLocator:
         Returns:
             服务实例，不存在时返回 None
         """
-        return cls._services.get(name)
+        service = cls._services.get(name)
+        if service is None:
+            service = cls._construct(name)
+        return service
 
     @classmethod
     def has(cls, name: str) -> bool:
         """
-        检查服务是否已注册
+        检查服务是否已注册（含尚未构造的延迟工厂）
         
         Args:
             name: 服务名
@@ -166,6 +235,22 @@ class ServiceLocator:
         Returns:
             bool: 服务是否存在
         """
+        return name in cls._services or name in cls._factories
+
+    @classmethod
+    def is_constructed(cls, name: str) -> bool:
+        """
+        检查服务实例是否已构造
+        
+        用于调试和诊断：区分已构造的实例与尚未触发的延迟工厂，
+        本身不会触发工厂。
+        
+        Args:
+            name: 服务名
+            
+        Returns:
+            bool: 实例是否已存在
+        """
         return name in cls._services
 
     @classmethod
@@ -175,7 +260,9 @@ class ServiceLocator:
         
         仅用于测试场景，生产环境不应调用此方法。
         """
-        cls._services.clear()
+        with cls._factory_lock:
+            cls._services.clear()
+            cls._factories.clear()
 
     @classmethod
     def get_all_names(cls) -> list:
@@ -185,9 +272,11 @@ class ServiceLocator:
         用于调试和诊断。
         
         Returns:
-            list: 服务名列表
+            list: 服务名列表（含尚未构造的延迟工厂）
         """
-        return list(cls._services.keys())
+        return list(cls._services.keys()) + [
+            name for name in cls._factories if name not in cls._services
+        ]
 
     @classmethod
     def get_service_count(cls) -> int:
@@ -195,9 +284,9 @@ class ServiceLocator:
         获取已注册服务数量
         
         Returns:
-            int: 服务数量
+            int: 服务数量（含尚未构造的延迟工厂）
         """
-        return len(cls._services)
+        return len(cls.get_all_names())
 
 
 # ============================================================
@@ -0,0 +1,232 @@
+# Workspace Exclusions - Generated Tree Filtering
+"""
+工作区排除规则
+
+职责：
+- 统一定义工作区中应被忽略的生成目录、临时文件后缀和系统文件名
+- 供文件监听（FileWatchTask）与文件名索引（FileNameIndex）共用，
+  保证"监听不到的文件"与"索引不到的文件"是同一集合
+- 合并用户配置的额外排除目录（CONFIG_WORKSPACE_EXCLUDED_DIRS）
+
+规则说明：
+- 目录规则为不含 "/" 的名称时，匹配任意层级的同名目录
+- 目录规则含 "/" 时，视为相对工作区根目录的路径前缀（如 "build/generated"）
+- 文件名规则匹配完整文件名或文件名后缀（如 "~" 匹配编辑器备份文件）
+
+使用示例：
+    from shared.workspace_exclusions import get_workspace_exclusions
+
+    exclusions = get_workspace_exclusions()
+    if exclusions.is_excluded_path("simulation_results/run_1/raw.json"):
+        ...
+"""
+
+from pathlib import PurePath
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+
+# ============================================================
+# 默认规则
+# ============================================================
+
+# 默认排除的目录名（系统元数据、仿真产物、版本控制、工具缓存）
+DEFAULT_EXCLUDED_DIRS = frozenset({
+    ".circuit_ai",
+    "simulation_results",
+    ".git",
+    "__pycache__",
+    ".vscode",
+    ".idea",
+    "node_modules",
+    ".venv",
+    "venv",
+    ".pytest_cache",
+    ".mypy_cache",
+})
+
+# 默认排除的文件后缀
+DEFAULT_EXCLUDED_EXTENSIONS = frozenset({
+    ".tmp",
+    ".swp",
+    ".bak",
+    ".pyc",
+    ".pyo",
+    ".log",
+})
+
+# 默认排除的文件名模式（完整名称或名称后缀）
+DEFAULT_EXCLUDED_NAME_PATTERNS = frozenset({
+    "~",  # 备份文件后缀
+    ".DS_Store",
+    "Thumbs.db",
+    "desktop.ini",
+})
+
+
+# ============================================================
+# 排除规则
+# ============================================================
+
+class WorkspaceExclusions:
+    """
+    工作区排除规则集合
+
+    不可变对象，可在线程间共享。
+    """
+
+    def __init__(
+        self,
+        excluded_dirs: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+        excluded_extensions: Iterable[str] = DEFAULT_EXCLUDED_EXTENSIONS,
+        excluded_name_patterns: Iterable[str] = DEFAULT_EXCLUDED_NAME_PATTERNS,
+    ):
+        """
+        初始化排除规则
+
+        Args:
+            excluded_dirs: 排除的目录名或相对路径前缀
+            excluded_extensions: 排除的文件后缀（含点号）
+            excluded_name_patterns: 排除的文件名模式
+        """
+        dir_names = set()
+        dir_prefixes = set()
+        for entry in excluded_dirs:
+            normalized = str(entry or "").replace("\\", "/").strip("/")
+            if not normalized:
+                continue
+            if "/" in normalized:
+                dir_prefixes.add(normalized)
+            else:
+                dir_names.add(normalized)
+
+        self._dir_names: FrozenSet[str] = frozenset(dir_names)
+        self._dir_prefixes: Tuple[str, ...] = tuple(sorted(dir_prefixes))
+        self._extensions: FrozenSet[str] = frozenset(
+            ext.lower() for ext in excluded_extensions if ext
+        )
+        self._name_patterns: Tuple[str, ...] = tuple(
+            sorted(pattern for pattern in excluded_name_patterns if pattern)
+        )
+
+    @property
+    def signature(self) -> str:
+        """规则签名，用于判断持久化数据是否基于相同规则生成"""
+        return "|".join([
+            ",".join(sorted(self._dir_names)),
+            ",".join(self._dir_prefixes),
+            ",".join(sorted(self._extensions)),
+            ",".join(self._name_patterns),
+        ])
+
+    def is_excluded_dir(self, name: str, relative_path: str = "") -> bool:
+        """
+        检查目录是否应被排除
+
+        Args:
+            name: 目录名
+            relative_path: 目录相对工作区根目录的路径（用于前缀规则）
+
+        Returns:
+            bool: 是否排除
+        """
+        if name in self._dir_names:
+            return True
+        if self._dir_prefixes and relative_path:
+            normalized = relative_path.replace("\\", "/")
+            for prefix in self._dir_prefixes:
+                if normalized == prefix or normalized.startswith(prefix + "/"):
+                    return True
+        return False
+
+    def is_excluded_file(self, name: str) -> bool:
+        """
+        检查文件名是否应被排除
+
+        Args:
+            name: 文件名
+
+        Returns:
+            bool: 是否排除
+        """
+        for pattern in self._name_patterns:
+            if name == pattern or name.endswith(pattern):
+                return True
+        dot = name.rfind(".")
+        return dot > 0 and name[dot:].lower() in self._extensions
+
+    def is_excluded_path(self, relative_path: str, is_directory: bool = False) -> bool:
+        """
+        检查相对路径是否应被排除（任一上级目录被排除即排除）
+
+        Args:
+            relative_path: 相对工作区根目录的路径
+            is_directory: 路径本身是否为目录
+
+        Returns:
+            bool: 是否排除
+        """
+        parts = PurePath(relative_path.replace("\\", "/")).parts
+        if not parts:
+            return False
+
+        dir_parts = parts if is_directory else parts[:-1]
+        for index, part in enumerate(dir_parts):
+            if self.is_excluded_dir(part, "/".join(parts[:index + 1])):
+                return True
+
+        if is_directory:
+            return False
+        return self.is_excluded_file(parts[-1])
+
+
+# ============================================================
+# 配置合并
+# ============================================================
+
+def get_workspace_exclusions(
+    extra_dirs: Optional[Iterable[str]] = None,
+) -> WorkspaceExclusions:
+    """
+    获取当前生效的工作区排除规则
+
+    在默认规则基础上合并配置项 CONFIG_WORKSPACE_EXCLUDED_DIRS
+    以及调用方传入的额外目录。
+
+    Args:
+        extra_dirs: 额外排除的目录名或相对路径前缀
+
+    Returns:
+        WorkspaceExclusions: 排除规则
+    """
+    excluded_dirs = set(DEFAULT_EXCLUDED_DIRS)
+    if extra_dirs:
+        excluded_dirs.update(extra_dirs)
+
+    try:
+        from shared.service_locator import ServiceLocator
+        from shared.service_names import SVC_CONFIG_MANAGER
+        from infrastructure.config.settings import CONFIG_WORKSPACE_EXCLUDED_DIRS
+
+        config_manager = ServiceLocator.get_optional(SVC_CONFIG_MANAGER)
+        if config_manager:
+            configured = config_manager.get(CONFIG_WORKSPACE_EXCLUDED_DIRS, [])
+            if isinstance(configured, str):
+                configured = [configured]
+            excluded_dirs.update(str(entry) for entry in configured or [])
+    except Exception:
+        pass
+
+    return WorkspaceExclusions(excluded_dirs=excluded_dirs)
+
+
+# ============================================================
+# 模块导出
+# ============================================================
+
+__all__ = [
+    "DEFAULT_EXCLUDED_DIRS",
+    "DEFAULT_EXCLUDED_EXTENSIONS",
+    "DEFAULT_EXCLUDED_NAME_PATTERNS",
+    "WorkspaceExclusions",
+    "get_workspace_exclusions",
+]
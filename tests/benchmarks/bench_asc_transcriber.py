@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+LTspice ASC 转写基准
+
+生成网格状原理图（水平 / 竖直导线 + 电阻 + 网络标签，默认 10k 导线），
+比较：
+- 网络解析：逐导线扫描全部端点（旧实现，O(导线 × 端点)）与坐标轴
+  索引（_AxisPointIndex）的耗时；旧实现只在 --legacy-max 以内的规模上运行
+- 批量转换：convert_files 逐个转换（max_workers=1）与进程池并行
+
+使用方法：
+    python tests/benchmarks/bench_asc_transcriber.py [--wires 1000,3000,10000] [--files 8]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from domain.simulation.spice import ltspice_asc_to_cir_transcriber as transcriber_module  # noqa: E402
+from domain.simulation.spice.ltspice_asc_to_cir_transcriber import LtspiceAscToCirTranscriber  # noqa: E402
+
+GRID = 64
+
+
+def generate_asc(wire_count: int) -> str:
+    """每行一条由短导线串成的水平链，相邻行之间每隔 8 段接一条竖直导线"""
+    columns = 64
+    rows = max(1, wire_count // (columns + columns // 8))
+    lines = ["Version 4", "SHEET 1 8000 8000"]
+    wires = 0
+    for row in range(rows):
+        y = row * GRID * 2
+        for column in range(columns):
+            lines.append(f"WIRE {column * GRID} {y} {(column + 1) * GRID} {y}")
+            wires += 1
+        if row:
+            for column in range(0, columns, 8):
+                lines.append(f"WIRE {column * GRID} {y - GRID * 2} {column * GRID} {y}")
+                wires += 1
+        lines.append(f"FLAG 0 {y} ROW{row}")
+    for row in range(0, rows, 4):
+        lines.append(f"SYMBOL res {columns * GRID + 16} {row * GRID * 2 - 16} R0")
+        lines.append(f"SYMATTR InstName R{row}")
+        lines.append("SYMATTR Value 1k")
+    lines.append("TEXT 0 -64 Left 2 !.op")
+    return "\n".join(lines) + "\n"
+
+
+def legacy_resolve_point_nets(points, wires):
+    dsu = transcriber_module._DisjointSet(len(points))
+    point_index = {point: index for index, point in enumerate(points)}
+    for wire in wires:
+        on_segment = [point for point in points if transcriber_module._point_on_segment(point, wire)]
+        if len(on_segment) < 2:
+            continue
+        ordered = sorted(on_segment, key=lambda p: (p.x, p.y) if wire.start.x != wire.end.x else (p.y, p.x))
+        for left, right in zip(ordered, ordered[1:]):
+            dsu.union(point_index[left], point_index[right])
+    return dsu
+
+
+def bench_net_resolution(transcriber, wire_counts, legacy_max):
+    print("net resolution")
+    for wire_count in wire_counts:
+        document = transcriber._parse_asc_content(generate_asc(wire_count), "bench.asc")
+        symbols = transcriber._resolve_symbols(document, [])
+        started = time.perf_counter()
+        nets = transcriber._resolve_point_nets(document, symbols)
+        indexed = time.perf_counter() - started
+        line = f"  {len(document.wires):6d} wires {len(nets):6d} points  indexed {indexed * 1000:8.1f}ms"
+        if len(document.wires) <= legacy_max:
+            points = list(nets)
+            started = time.perf_counter()
+            legacy_resolve_point_nets(points, document.wires)
+            line += f"  legacy {(time.perf_counter() - started) * 1000:9.1f}ms"
+        print(line)
+
+
+def bench_batch(transcriber, file_count, wire_count):
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths = []
+        for index in range(file_count):
+            path = root / f"sheet{index}.asc"
+            path.write_text(generate_asc(wire_count), encoding="utf-8")
+            paths.append(str(path))
+        print(f"batch conversion: {file_count} files x {wire_count} wires")
+        for label, max_workers in (("sequential", 1), ("pool", transcriber_module.recommended_batch_workers(file_count))):
+            started = time.perf_counter()
+            execution = transcriber.convert_files(paths, str(root / label), max_workers=max_workers)
+            elapsed = time.perf_counter() - started
+            assert len(execution.converted_files) == file_count, execution.failed_files
+            print(f"  {label:<10} {elapsed:6.2f}s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--wires", default="1000,3000,10000")
+    parser.add_argument("--legacy-max", type=int, default=3000)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--batch-wires", type=int, default=10000)
+    args = parser.parse_args()
+
+    transcriber = LtspiceAscToCirTranscriber()
+    bench_net_resolution(transcriber, [int(value) for value in args.wires.split(",")], args.legacy_max)
+    bench_batch(transcriber, args.files, args.batch_wires)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+模糊代码块匹配基准
+
+语料：resources/models 下未加密的大型 .lib 模型库（ADI.lib、ADI1.lib、LTC.lib 等）。
+对每个库随机抽取若干代码块并注入空白/数值扰动，比较：
+- baseline：逐窗口重新规范化 + difflib.SequenceMatcher（旧实现）
+- block_matcher：BlockMatcher.find_best（逐行规范化一次 + 锚点 + rapidfuzz）
+
+使用方法：
+    python tests/benchmarks/bench_fuzzy_block_matcher.py [--blocks 5] [--baseline]
+"""
+
+import argparse
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from infrastructure.file_intelligence.search.fuzzy.block_matcher import BlockMatcher  # noqa: E402
+from infrastructure.persistence.file_manager import FileManager  # noqa: E402
+
+
+CORPUS_DIR = PROJECT_ROOT / "resources" / "models"
+MIN_CORPUS_LINES = 2000
+
+
+def load_corpus():
+    corpus = []
+    for path in sorted(CORPUS_DIR.rglob("*.lib")):
+        text = path.read_text(encoding="utf-8", errors="ignore")
+        if "Encrypted" in text[:200]:
+            continue
+        lines = text.split("\n")
+        if len(lines) >= MIN_CORPUS_LINES:
+            corpus.append((path.relative_to(PROJECT_ROOT), lines))
+    return corpus
+
+
+def perturb(lines, rng):
+    block = list(lines)
+    index = rng.randrange(len(block))
+    block[index] = block[index].replace(" ", "  ", 1) + " "
+    index = rng.randrange(len(block))
+    block[index] = block[index].replace("E", "e", 1)
+    return "\n".join(block)
+
+
+def baseline_best(file_manager, content_lines, search):
+    normalized_search = file_manager._normalize_whitespace(search)
+    line_count = len(search.strip().split("\n"))
+    best_score, best_start = 0.0, -1
+    for start in range(len(content_lines) - line_count + 1):
+        window = file_manager._normalize_whitespace("\n".join(content_lines[start:start + line_count]))
+        score = SequenceMatcher(None, normalized_search, window).ratio()
+        if score > best_score:
+            best_score, best_start = score, start
+    return best_start, best_score
+
+
+def block_matcher_best(file_manager, content_lines, search):
+    matcher = BlockMatcher(content_lines, file_manager._normalize_line_whitespace, skip_empty_lines=True)
+    match = matcher.find_best(file_manager._normalize_whitespace(search), search.strip().split("\n"), 0.9)
+    return (match.start_line, match.score) if match else (-1, 0.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blocks", type=int, default=5, help="每个库抽取的代码块数")
+    parser.add_argument("--block-lines", type=int, default=12, help="代码块行数")
+    parser.add_argument("--baseline", action="store_true", help="同时运行旧实现（较慢）")
+    parser.add_argument("--seed", type=int, default=2026)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    file_manager = FileManager()
+
+    print(f"{'library':<40} {'lines':>7} {'block_matcher ms':>17} {'baseline ms':>12} {'agree':>6}")
+    for path, content_lines in load_corpus():
+        searches = []
+        for _ in range(args.blocks):
+            start = rng.randrange(len(content_lines) - args.block_lines)
+            searches.append(perturb(content_lines[start:start + args.block_lines], rng))
+
+        started = time.perf_counter()
+        fast_results = [block_matcher_best(file_manager, content_lines, search) for search in searches]
+        fast_ms = (time.perf_counter() - started) * 1000 / len(searches)
+
+        baseline_ms = "-"
+        agree = "-"
+        if args.baseline:
+            started = time.perf_counter()
+            slow_results = [baseline_best(file_manager, content_lines, search) for search in searches]
+            baseline_ms = f"{(time.perf_counter() - started) * 1000 / len(searches):.1f}"
+            agree = str(all(fast[0] == slow[0] for fast, slow in zip(fast_results, slow_results)))
+
+        print(f"{str(path):<40} {len(content_lines):>7} {fast_ms:>17.2f} {baseline_ms:>12} {agree:>6}")
+
+
+if __name__ == "__main__":
+    main()
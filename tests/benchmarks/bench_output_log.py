@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+仿真输出日志读取基准
+
+生成带导出头部的噪声瞬态日志（默认 300k 行），比较：
+- legacy：每次查询都 splitlines 并为每行检测级别（旧实现的全量解析）
+- index：OutputLogIndex 一次构建并写盘，之后从磁盘加载，按需读取行区间
+
+查询包括：摘要、错误行、一页按级别过滤的警告、尾部 20 行、关键词搜索
+（首次搜索包含词项索引构建）。
+
+使用方法：
+    python tests/benchmarks/bench_output_log.py [--lines 300000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from domain.simulation.data.output_log_index import OutputLogIndex  # noqa: E402
+from domain.simulation.data.simulation_output_reader import simulation_output_reader  # noqa: E402
+
+HEADER = "# artifact_type: output_log\n# circuit_file: bench.cir\n\n"
+
+
+def generate_log(line_count: int) -> str:
+    lines = []
+    for i in range(line_count):
+        if i % 4999 == 0:
+            lines.append(f"Error: timestep too small at t={i * 1e-9:.4e}; trouble with node n{i % 97}")
+        elif i % 211 == 0:
+            lines.append(f"Warning: floating node net_{i % 311}")
+        else:
+            lines.append(f"step {i} time={i * 1e-9:.6e} delta={1e-12:.3e} order=2 iter={i % 7}")
+    return "\n".join(lines) + "\n"
+
+
+def timed(label: str, func) -> None:
+    started = time.perf_counter()
+    result = func()
+    elapsed = (time.perf_counter() - started) * 1000
+    size = len(result) if hasattr(result, "__len__") else result
+    print(f"  {label:<28} {elapsed:9.1f}ms  ({size})")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=300000)
+    args = parser.parse_args()
+
+    raw_output = generate_log(args.lines)
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = Path(tmp) / "output_log.txt"
+        index_path = Path(tmp) / "output_log.index.npz"
+        text_path.write_text(HEADER + raw_output, encoding="utf-8")
+        print(f"{args.lines} lines, {text_path.stat().st_size / 1e6:.1f}MB")
+
+        def parse():
+            return simulation_output_reader.get_output_log_from_text(raw_output, max_lines=args.lines)
+
+        print("legacy (full parse per query)")
+        timed("errors", lambda: [line for line in parse() if line.is_error()])
+        timed("warnings page 100..150", lambda: [line for line in parse() if line.is_warning()][100:150])
+        timed("search 'trouble'", lambda: [line for line in parse() if "trouble" in line.content.lower()])
+
+        print("index")
+        timed("build + save", lambda: OutputLogIndex.build(text_path, index_path).save())
+        timed("load", lambda: OutputLogIndex.load(text_path, index_path).total_lines)
+        index = OutputLogIndex.load(text_path, index_path)
+        timed("summary", lambda: index.summary().to_dict())
+        timed("errors", lambda: index.read_level("error"))
+        timed("warnings page 100..150", lambda: index.read_level("warning", offset=100, limit=50))
+        timed("tail 20", lambda: index.tail(20))
+        timed("search 'trouble' (terms)", lambda: index.search("trouble"))
+        timed("search 'trouble' (warm)", lambda: index.search("trouble"))
+        timed("reload with terms", lambda: OutputLogIndex.load(text_path, index_path).total_lines)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
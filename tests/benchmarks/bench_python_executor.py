@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Python 脚本执行器基准
+
+对同一仿真脚本做参数扫描（默认 100 次运行），脚本返回 time 轴与
+若干信号（每条 --points 个点）。比较：
+- legacy：每次运行启动 ``sys.executable -c``，导入脚本与 numpy，
+  结果经 json.dumps / stdout / json.loads 回传（旧实现）
+- pool：PythonExecutor + PythonWorkerPool，常驻子进程 + 二进制缓冲区
+
+输出每种方式的总耗时与单次运行的 p50 / p95。
+
+使用方法：
+    python tests/benchmarks/bench_python_executor.py [--runs 100] [--points 20000] [--signals 4]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from domain.simulation.executor.python_executor import PythonExecutor  # noqa: E402
+from domain.simulation.executor.python_worker_pool import PythonWorkerPool  # noqa: E402
+
+
+SCRIPT = """
+import numpy as np
+
+def run_simulation(config):
+    t = np.linspace(0.0, 1e-3, config["points"])
+    signals = {
+        f"v{i}": (np.sin(2 * np.pi * 1e3 * (i + 1) * t) * config["gain"]).tolist()
+        for i in range(config["signals"])
+    }
+    return {"success": True, "data": {"time": t.tolist(), "signals": signals}}
+"""
+
+LEGACY_WRAPPER = """
+import sys, json
+sys.path.insert(0, {script_dir!r})
+module = __import__({stem!r})
+print(json.dumps(module.run_simulation({config}), default=str))
+"""
+
+
+def run_legacy(script_path: Path, config: dict) -> float:
+    started = time.perf_counter()
+    code = LEGACY_WRAPPER.format(
+        script_dir=str(script_path.parent), stem=script_path.stem, config=json.dumps(config)
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, cwd=script_path.parent
+    )
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+    signals = {name: np.array(values) for name, values in result["data"]["signals"].items()}
+    assert len(signals) == config["signals"]
+    return time.perf_counter() - started
+
+
+def run_pool(executor: PythonExecutor, script_path: Path, config: dict) -> float:
+    started = time.perf_counter()
+    result = executor.execute(str(script_path), config)
+    assert result.success, result.error
+    return time.perf_counter() - started
+
+
+def report(label: str, durations: list) -> None:
+    ordered = sorted(durations)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{label:<8} total {sum(durations):7.2f}s  "
+        f"p50 {statistics.median(durations) * 1000:7.1f}ms  p95 {p95 * 1000:7.1f}ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--signals", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script_path = Path(tmp) / "bench_sweep.py"
+        script_path.write_text(textwrap.dedent(SCRIPT), encoding="utf-8")
+        configs = [
+            {"gain": 1.0 + i / args.runs, "points": args.points, "signals": args.signals}
+            for i in range(args.runs)
+        ]
+
+        print(f"{args.runs} runs, {args.signals} signals x {args.points} points")
+        report("legacy", [run_legacy(script_path, config) for config in configs])
+
+        pool = PythonWorkerPool()
+        try:
+            executor = PythonExecutor(worker_pool=pool)
+            report("pool", [run_pool(executor, script_path, config) for config in configs])
+            print(f"pool stats: {pool.get_stats()}")
+        finally:
+            pool.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+启动耗时基准（首窗耗时回归）
+
+每轮启动一个全新的解释器子进程（offscreen Qt），按 bootstrap.run() 的顺序执行
+Phase -1 ~ 2.3（导入 bootstrap、Phase 0/1、QApplication、qasync、MainWindow.show），
+读取 application.startup_profile 的阶段时间戳，报告首窗耗时的中位数与最小值；
+随后执行 Phase 3 并等待后台预热完成，单独报告预热耗时。
+
+--importtime 额外以 `python -X importtime` 运行一次，输出导入耗时排行，
+以及 langgraph / chromadb / tiktoken 等重型库的首次导入链。
+
+--budget-ms 设定首窗耗时预算，中位数超出时退出码为 1，可用于回归检查。
+
+使用方法：
+    python tests/benchmarks/bench_startup.py [--repeat 5] [--importtime] [--budget-ms 2000]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from application.startup_profile import format_importtime_report, parse_importtime  # noqa: E402
+
+
+WINDOW_MARK = "Phase 2.3 MainWindow 显示"
+
+WATCHED_MODULES = (
+    "langgraph",
+    "langchain_core",
+    "chromadb",
+    "tiktoken",
+    "fitz",
+    "matplotlib",
+    "httpx",
+    "pyqtgraph",
+)
+
+# 子进程探针：与 bootstrap.run() 相同的阶段顺序，不进入事件循环
+PROBE = """
+import json, sys
+sys.path.insert(0, {root!r})
+import application.bootstrap as bootstrap
+from application.startup_profile import startup_profile
+bootstrap._init_phase_0()
+startup_profile.mark("Phase 0 基础设施")
+bootstrap._init_phase_1()
+startup_profile.mark("Phase 1 核心管理器")
+from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+startup_profile.mark("Phase 2.1 QApplication 创建")
+from shared.async_runtime import init_async_runtime
+init_async_runtime(app)
+from presentation.main_window import MainWindow
+window = MainWindow()
+startup_profile.mark("Phase 2.2 MainWindow 创建")
+window.show()
+app.processEvents()
+startup_profile.mark({window_mark!r})
+if {run_phase3!r}:
+    bootstrap._delayed_init()
+    from application.startup_warmup import get_startup_warmup
+    warmup = get_startup_warmup()
+    warmup.wait(timeout=120)
+    startup_profile.mark("预热全部完成")
+    bootstrap._shutdown_services()
+marks = {{mark.label: mark.elapsed_ms for mark in startup_profile.get_marks()}}
+sys.__stdout__.write("STARTUP_MARKS=" + json.dumps(marks, ensure_ascii=False) + "\\n")
+"""
+
+
+def run_probe(run_phase3: bool, importtime: bool = False) -> subprocess.CompletedProcess:
+    code = PROBE.format(root=str(PROJECT_ROOT), window_mark=WINDOW_MARK, run_phase3=run_phase3)
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    return subprocess.run(
+        command + ["-c", code],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        timeout=300,
+    )
+
+
+def parse_marks(completed: subprocess.CompletedProcess) -> dict:
+    for line in completed.stdout.splitlines():
+        if line.startswith("STARTUP_MARKS="):
+            return json.loads(line[len("STARTUP_MARKS="):])
+    raise RuntimeError(f"probe failed (exit {completed.returncode}):\n{completed.stderr[-2000:]}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--importtime", action="store_true", help="输出 -X importtime 导入耗时排行")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=None, help="首窗耗时预算（中位数）")
+    args = parser.parse_args()
+
+    window_times = []
+    last_marks = {}
+    for _ in range(args.repeat):
+        last_marks = parse_marks(run_probe(run_phase3=False))
+        window_times.append(last_marks[WINDOW_MARK])
+
+    print(f"time-to-window over {args.repeat} cold starts")
+    print(f"  median {statistics.median(window_times):9.1f}ms")
+    print(f"  min    {min(window_times):9.1f}ms")
+    print("phase marks (last run)")
+    previous = 0.0
+    for label, elapsed in last_marks.items():
+        print(f"  {elapsed:9.1f}ms  +{elapsed - previous:8.1f}ms  {label}")
+        previous = elapsed
+
+    full_marks = parse_marks(run_probe(run_phase3=True))
+    print("after window (one run)")
+    for label in ("Phase 3 延迟初始化", "预热全部完成"):
+        if label in full_marks:
+            print(f"  {full_marks[label] - full_marks[WINDOW_MARK]:9.1f}ms  {label}")
+
+    if args.importtime:
+        completed = run_probe(run_phase3=False, importtime=True)
+        parse_marks(completed)
+        print()
+        print(format_importtime_report(parse_importtime(completed.stderr), top=args.top, watch=WATCHED_MODULES))
+
+    if args.budget_ms is not None and statistics.median(window_times) > args.budget_ms:
+        print(f"FAIL: median time-to-window exceeds budget {args.budget_ms:.0f}ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
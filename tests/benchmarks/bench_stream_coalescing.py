@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+流式增量合并基准
+
+回放 SSE 流（默认合成一段智谱格式的长推理 + 正文输出，也可以用
+--sse 指定抓包保存的原始 SSE 文本），经 ZhipuStreamHandler →
+AgentLoop._stream_llm_response → 事件回调，回调端模拟会话面板的
+"绘制"：累积 step 文本并序列化整份显示状态（对应 Qt 信号 → React
+面板的 JSON 快照）。比较：
+- per_delta：每个 provider delta 发一次事件（旧行为）
+- coalesced：StreamChunkCoalescer 默认窗口（25ms / 2048 字符）
+
+输出 UI 事件数、绘制总耗时，以及 chunk-to-paint 延迟
+（delta 到达 → 包含它的那次绘制完成）的 p50 / p95 / max。
+
+使用方法：
+    python tests/benchmarks/bench_stream_coalescing.py [--reasoning 6000] [--content 3000] [--delta-ms 1]
+    python tests/benchmarks/bench_stream_coalescing.py --sse captured_stream.txt
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from domain.llm.agent import agent_loop as agent_loop_module  # noqa: E402
+from domain.llm.agent.agent_loop import EVENT_STREAM_CHUNK, AgentLoop  # noqa: E402
+from domain.llm.agent.stream_coalescer import StreamChunkCoalescer  # noqa: E402
+from domain.llm.agent.tool_registry import ToolRegistry  # noqa: E402
+from domain.llm.agent.types import ToolContext  # noqa: E402
+from infrastructure.llm_adapters.zhipu.zhipu_stream_handler import ZhipuStreamHandler  # noqa: E402
+
+
+def synthesize_sse(reasoning_deltas, content_deltas, seed=7):
+    rng = random.Random(seed)
+    words = ["增益", "带宽", "相位裕度", "gain", "the", "opamp", "node", "V(out)", "1.2k", "稳定"]
+    lines = []
+    for kind, count in (("reasoning_content", reasoning_deltas), ("content", content_deltas)):
+        for _ in range(count):
+            text = rng.choice(words) + rng.choice([" ", "", "，", "\n"])
+            delta = {kind: text}
+            lines.append("data: " + json.dumps({"choices": [{"delta": delta, "finish_reason": None}]}, ensure_ascii=False))
+    lines.append('data: {"choices":[{"delta":{},"finish_reason":"stop"}],"usage":{"prompt_tokens":1}}')
+    lines.append("data: [DONE]")
+    return lines
+
+
+def load_sse(path):
+    return [line for line in Path(path).read_text(encoding="utf-8").splitlines() if line.startswith("data:")]
+
+
+class ReplayResponse:
+    """按固定间隔逐行吐出 SSE，并记录每个 delta 的到达时间"""
+
+    def __init__(self, lines, delta_seconds, arrivals):
+        self._lines = lines
+        self._delta_seconds = delta_seconds
+        self._arrivals = arrivals
+
+    async def aiter_text(self):
+        totals = {"reasoning": 0, "content": 0}
+        for line in self._lines:
+            if self._delta_seconds:
+                await asyncio.sleep(self._delta_seconds)
+            payload = line[5:].strip()
+            if payload and payload != "[DONE]":
+                delta = json.loads(payload)["choices"][0].get("delta", {})
+                for key, chunk_type in (("reasoning_content", "reasoning"), ("content", "content")):
+                    if delta.get(key):
+                        totals[chunk_type] += len(delta[key])
+                        self._arrivals[chunk_type].append((totals[chunk_type], time.perf_counter()))
+            yield line + "\n"
+
+
+class ReplayClient:
+    def __init__(self, lines, delta_seconds, arrivals):
+        self._lines = lines
+        self._delta_seconds = delta_seconds
+        self._arrivals = arrivals
+
+    async def chat_stream(self, **kwargs):
+        handler = ZhipuStreamHandler()
+        response = ReplayResponse(self._lines, self._delta_seconds, self._arrivals)
+        async for chunk in handler.iterate_response(response):
+            yield chunk
+
+
+class PaintSimulator:
+    """模拟会话面板：累积文本 + 序列化整份显示状态"""
+
+    def __init__(self, arrivals):
+        self._arrivals = arrivals
+        self._cursor = {"reasoning": 0, "content": 0}
+        self._painted = {"reasoning": 0, "content": 0}
+        self._text = {"reasoning": "", "content": ""}
+        self.events = 0
+        self.paint_seconds = 0.0
+        self.latencies = []
+
+    def __call__(self, event_type, data):
+        if event_type != EVENT_STREAM_CHUNK:
+            return
+        started = time.perf_counter()
+        chunk_type = data["chunk_type"]
+        self._text[chunk_type] += data["text"]
+        json.dumps({"steps": [{"reasoning_content": self._text["reasoning"], "content": self._text["content"]}]})
+        finished = time.perf_counter()
+        self.events += 1
+        self.paint_seconds += finished - started
+        self._painted[chunk_type] += len(data["text"])
+        pending = self._arrivals[chunk_type]
+        index = self._cursor[chunk_type]
+        while index < len(pending) and pending[index][0] <= self._painted[chunk_type]:
+            self.latencies.append(finished - pending[index][1])
+            index += 1
+        self._cursor[chunk_type] = index
+
+
+def run_once(lines, delta_seconds, coalesced):
+    arrivals = {"reasoning": [], "content": []}
+    painter = PaintSimulator(arrivals)
+    original = agent_loop_module.StreamChunkCoalescer
+    if not coalesced:
+        agent_loop_module.StreamChunkCoalescer = functools.partial(StreamChunkCoalescer, interval=0, max_chars=1)
+    try:
+        loop = AgentLoop(
+            client=ReplayClient(lines, delta_seconds, arrivals),
+            registry=ToolRegistry(),
+            context=ToolContext(project_root=str(PROJECT_ROOT)),
+            model="replay",
+        )
+        started = time.perf_counter()
+        asyncio.run(loop.run([], on_event=painter))
+        elapsed = time.perf_counter() - started
+    finally:
+        agent_loop_module.StreamChunkCoalescer = original
+    return painter, elapsed
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sse", help="抓包保存的原始 SSE 文本（每行 data: ...）")
+    parser.add_argument("--reasoning", type=int, default=6000, help="合成流的推理 delta 数")
+    parser.add_argument("--content", type=int, default=3000, help="合成流的正文 delta 数")
+    parser.add_argument("--delta-ms", type=float, default=0.2, help="delta 到达间隔（毫秒）")
+    args = parser.parse_args()
+
+    lines = load_sse(args.sse) if args.sse else synthesize_sse(args.reasoning, args.content)
+    print(f"SSE lines: {len(lines)}, delta interval: {args.delta_ms}ms")
+    for label, coalesced in (("per_delta", False), ("coalesced", True)):
+        painter, elapsed = run_once(lines, args.delta_ms / 1000.0, coalesced)
+        latencies_ms = [value * 1000 for value in painter.latencies]
+        print(
+            f"{label:>10}: events={painter.events:6d} paint={painter.paint_seconds * 1000:9.1f}ms "
+            f"wall={elapsed * 1000:9.1f}ms "
+            f"latency p50={percentile(latencies_ms, 0.5):7.2f}ms "
+            f"p95={percentile(latencies_ms, 0.95):7.2f}ms "
+            f"max={max(latencies_ms, default=0.0):7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+跨结果波形比较基准
+
+生成 N 次蒙特卡洛瞬态运行（默认 50 次 × 100k 采样 × 4 信号，各运行时间轴
+略有不同），写成结果包后比较：
+- 旧做法：逐个 SimulationResult 完整加载并构建金字塔取显示数据
+- WaveformComparisonService.compare 冷读取（未归档 / 归档结果包）与缓存命中
+- 视口缩放时的叠加抽取（全部运行一次 min/max 抽取）
+
+使用方法：
+    python tests/benchmarks/bench_waveform_comparison.py [--runs 50] [--samples 100000] [--signals 4]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from domain.simulation.data.simulation_artifact_persistence import simulation_artifact_persistence  # noqa: E402
+from domain.simulation.data.waveform_comparison import WaveformComparisonService  # noqa: E402
+from domain.simulation.data.waveform_data_service import WaveformDataService  # noqa: E402
+from domain.simulation.models.simulation_result import SimulationData, SimulationResult  # noqa: E402
+from domain.simulation.service.simulation_bundle_archiver import simulation_bundle_archiver  # noqa: E402
+from domain.simulation.service.simulation_result_repository import simulation_result_repository  # noqa: E402
+
+
+def timed(label: str, func, repeat: int = 1):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        value = func()
+    elapsed = (time.perf_counter() - started) * 1000 / repeat
+    print(f"  {label:<34} {elapsed:9.2f}ms")
+    return value
+
+
+def build_bundles(project_root: Path, runs: int, samples: int, signals: int) -> list:
+    rng = np.random.default_rng(0)
+    bundle_ids = []
+    for index in range(runs):
+        t = np.sort(rng.uniform(0.0, 1e-3, samples))
+        t[0], t[-1] = 0.0, 1e-3
+        gains = 1.0 + 0.05 * rng.normal(size=(signals, 1))
+        y = gains * np.sin(2 * np.pi * 5e3 * t)
+        result = SimulationResult(
+            executor="spice",
+            file_path="mc.cir",
+            analysis_type="tran",
+            success=True,
+            data=SimulationData(time=t, signals={f"V(n{k})": y[k] for k in range(signals)}),
+            timestamp=f"2026-01-01T00:{index // 60:02d}:{index % 60:02d}",
+        )
+        outcome = simulation_artifact_persistence.persist_bundle(str(project_root), result, {})
+        bundle_ids.append(Path(outcome.export_root).relative_to(project_root).as_posix())
+    return bundle_ids
+
+
+def legacy_overlay(project_root: Path, bundle_ids: list) -> None:
+    """旧做法：逐个完整加载 result.json 并构建金字塔"""
+    service = WaveformDataService(cache_size=len(bundle_ids))
+    for bundle_id in bundle_ids:
+        loaded = simulation_result_repository.load(str(project_root), f"{bundle_id}/result.json")
+        service.get_initial_data(loaded.data, "V(n0)", target_points=1000)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--samples", type=int, default=100000)
+    parser.add_argument("--signals", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_root = Path(tmp)
+        bundle_ids = build_bundles(project_root, args.runs, args.samples, args.signals)
+        print(f"{args.runs} runs x {args.samples} samples x {args.signals} signals")
+
+        timed("legacy full load + pyramid", lambda: legacy_overlay(project_root, bundle_ids))
+        service = WaveformComparisonService()
+        comparison = timed(
+            "compare (json, cold)",
+            lambda: service.compare(str(project_root), bundle_ids, ["V(n0)"])["V(n0)"],
+        )
+        timed("compare (cached)", lambda: service.compare(str(project_root), bundle_ids, ["V(n0)"]), repeat=3)
+
+        for bundle_id in bundle_ids:
+            simulation_bundle_archiver.archive_bundle(project_root / bundle_id)
+        service.clear_cache()
+        timed("compare (archived, cold)", lambda: service.compare(str(project_root), bundle_ids, ["V(n0)"]))
+
+        print(f"overlay ({comparison.run_count} runs, grid {len(comparison.x)})")
+        timed("statistics (mean/std/envelope)", lambda: (comparison.mean, comparison.std, comparison.lower, comparison.upper))
+        timed("overlay full range", lambda: comparison.overlay(), repeat=20)
+        timed("overlay zoom 10%", lambda: comparison.overlay(4e-4, 5e-4), repeat=20)
+        timed("flattened runs", lambda: comparison.overlay(4e-4, 5e-4).flattened_runs(), repeat=20)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
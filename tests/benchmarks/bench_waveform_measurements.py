@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+波形测量内核基准
+
+生成多信号瞬态数据（默认 200k 采样 × 8 信号），比较：
+- 信号统计：逐采样 Python 累加（旧 _SignalAggregator 的做法）与
+  summarize_series 一次向量化计算；CSV 第一遍扫描的逐单元 float()
+  解析与分块 np.loadtxt 解析
+- 光标读数：逐信号 np.interp 与 interpolate_columns 共用区间查找
+- 批量穿越：信号 × 扫描点 的 10%–90% 穿越时间（.MEASURE TRIG/TARG 交叉校验）
+
+使用方法：
+    python tests/benchmarks/bench_waveform_measurements.py [--samples 200000] [--signals 8]
+"""
+
+import argparse
+import csv
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from domain.llm.agent.tools.simulation_series_stats import _scan_pass1, read_series_csv  # noqa: E402
+from domain.simulation.data import waveform_measurements as wm  # noqa: E402
+
+
+def timed(label: str, func, repeat: int = 1) -> None:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - started) * 1000 / repeat
+    print(f"  {label:<34} {elapsed:9.2f}ms")
+
+
+def legacy_summary(y: np.ndarray) -> list:
+    """旧实现：逐行逐信号更新标量累加器"""
+    results = []
+    for row in y.tolist():
+        samples, total, low, high, last, crossings = 0, 0.0, math.inf, -math.inf, None, 0
+        for value in row:
+            if not math.isfinite(value):
+                continue
+            samples += 1
+            total += value
+            low = min(low, value)
+            high = max(high, value)
+            if last is not None and last * value < 0:
+                crossings += 1
+            last = value
+        results.append((samples, low, high, total, crossings))
+    return results
+
+
+def legacy_csv_pass1(csv_path: Path) -> list:
+    """旧实现的第一遍：csv.reader 逐行、逐单元 float()，再逐采样累加"""
+    columns = None
+    with csv_path.open("r", encoding="utf-8", newline="") as handle:
+        for line in handle:
+            if not line.strip() or line.startswith("#"):
+                continue
+            break
+        for row in csv.reader(handle):
+            values = [float(cell) if cell else math.nan for cell in row]
+            if columns is None:
+                columns = [[] for _ in values]
+            for column, value in zip(columns, values):
+                column.append(value)
+    return legacy_summary(np.array(columns[1:]))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=200000)
+    parser.add_argument("--signals", type=int, default=8)
+    parser.add_argument("--sweep-points", type=int, default=16)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    t = np.linspace(0.0, 1e-3, args.samples)
+    phases = rng.uniform(0, 2 * np.pi, (args.signals, 1))
+    y = np.sin(2 * np.pi * 5e3 * t + phases) + 0.01 * rng.normal(size=(args.signals, args.samples))
+    print(f"{args.samples} samples x {args.signals} signals")
+
+    print("series statistics")
+    timed("legacy per-sample loop", lambda: legacy_summary(y))
+    timed("summarize_series", lambda: wm.summarize_series(y), repeat=5)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "raw_data.csv"
+        with csv_path.open("w", encoding="utf-8", newline="") as handle:
+            handle.write("# artifact_type: raw_data\n\n")
+            writer = csv.writer(handle)
+            writer.writerow(["time", *(f"V(n{index})" for index in range(args.signals))])
+            writer.writerows(np.column_stack([t, y.T]).tolist())
+        timed("csv pass 1 legacy (per cell)", lambda: legacy_csv_pass1(csv_path))
+        timed("csv pass 1 chunked (loadtxt)", lambda: _scan_pass1(csv_path))
+        timed("read_series_csv (2 passes)", lambda: read_series_csv(csv_path))
+
+    print("cursor readout (2 cursors)")
+    cursors = [2.5e-4, 7.5e-4]
+    timed("np.interp per signal", lambda: [[np.interp(x, t, row) for row in y] for x in cursors], repeat=50)
+    columns = list(y)
+    timed("interpolate_columns", lambda: wm.interpolate_columns(t, columns, cursors), repeat=50)
+
+    print(f"level crossings ({args.signals} signals x {args.sweep_points} sweep points)")
+    taus = np.linspace(2e-5, 1e-4, args.sweep_points)[None, :, None] * (1 + np.arange(args.signals))[:, None, None] / args.signals
+    steps = 1.0 - np.exp(-t / taus) * np.cos(2 * np.pi * 1e4 * t)
+    timed("crossing_x 10%", lambda: wm.crossing_x(t, steps, 0.1, edge=wm.EDGE_RISE))
+    timed("crossing_x 10% -> 90%", lambda: wm.crossing_x(
+        t, steps, 0.9, edge=wm.EDGE_RISE, after_x=wm.crossing_x(t, steps, 0.1, edge=wm.EDGE_RISE),
+    ))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
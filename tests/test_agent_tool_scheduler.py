@@ -0,0 +1,131 @@
+import asyncio
+import threading
+from typing import Any, Dict, List
+
+from domain.llm.agent.tool_registry import ToolRegistry
+from domain.llm.agent.tool_scheduler import ToolScheduler
+from domain.llm.agent.tools.patch_file import PatchFileTool
+from domain.llm.agent.tools.run_simulation import RunSimulationTool
+from domain.llm.agent.types import BaseTool, ToolContext, ToolResult
+from shared.tracing import SpanType, TracingContext
+
+
+class _RecordingTool(BaseTool):
+    def __init__(self, name: str, log: List[str], *, read_only: bool, blocking: bool, barrier=None):
+        self._name = name
+        self._log = log
+        self._read_only = read_only
+        self._blocking = blocking
+        self._barrier = barrier
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return self._name
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        return {"type": "object", "properties": {"key": {"type": "string"}}, "required": []}
+
+    @property
+    def is_read_only(self) -> bool:
+        return self._read_only
+
+    @property
+    def runs_blocking_io(self) -> bool:
+        return self._blocking
+
+    def get_resource_key(self, params, context):
+        return params.get("key") or super().get_resource_key(params, context)
+
+    async def execute(self, tool_call_id, params, context) -> ToolResult:
+        self._log.append(f"start:{tool_call_id}")
+        if self._barrier is not None:
+            # 两个只读调用必须同时在跑才能通过栅栏
+            self._barrier.wait(timeout=5)
+        else:
+            await asyncio.sleep(0.01)
+        self._log.append(f"end:{tool_call_id}")
+        return ToolResult(content=f"{tool_call_id}@{threading.current_thread().name}")
+
+
+def _call(call_id: str, name: str, **arguments) -> Dict[str, Any]:
+    return {"id": call_id, "type": "function", "function": {"name": name, "arguments": arguments}}
+
+
+async def _noop_start(tc_info) -> None:
+    return None
+
+
+async def _noop_end(tc_info, result) -> None:
+    return None
+
+
+def test_read_only_blocking_calls_run_concurrently_off_loop():
+    log: List[str] = []
+    registry = ToolRegistry()
+    registry.register(_RecordingTool("read", log, read_only=True, blocking=True, barrier=threading.Barrier(2)))
+    scheduler = ToolScheduler(registry, ToolContext(project_root="."))
+    spans = []
+    TracingContext.set_span_finished_callback(spans.append)
+    try:
+        results = asyncio.run(scheduler.run(
+            [_call("a", "read"), _call("b", "read"), _call("c", "missing")],
+            _noop_start,
+            _noop_end,
+        ))
+    finally:
+        TracingContext.set_span_finished_callback(None)
+
+    assert [r.content.split("@")[0] for r in results[:2]] == ["a", "b"]
+    assert all("@agent-tool" in r.content for r in results[:2])
+    assert results[2].is_error and "not found" in results[2].content
+    tool_spans = [s for s in spans if s.operation_name == SpanType.AGENTIC_TOOL]
+    assert len(tool_spans) == 2
+    assert all(s.metadata["execution"] == "worker" for s in tool_spans)
+    assert all(s.outputs["latency_ms"] >= 0 for s in tool_spans)
+
+
+def test_mutating_calls_serialize_in_call_order():
+    log: List[str] = []
+    registry = ToolRegistry()
+    registry.register(_RecordingTool("read", log, read_only=True, blocking=False))
+    registry.register(_RecordingTool("write", log, read_only=False, blocking=False))
+    scheduler = ToolScheduler(registry, ToolContext(project_root="."))
+
+    planned = scheduler.plan([
+        _call("r1", "read"),
+        _call("w1", "write", key="a"),
+        _call("w2", "write", key="b"),
+        _call("w3", "write", key="a"),
+        _call("r2", "read"),
+    ])
+    assert [entry.depends_on for entry in planned] == [[], [0], [0, 1], [0, 1, 2], [1, 2, 3]]
+
+    results = asyncio.run(scheduler.run(
+        [_call("w1", "write", key="a"), _call("w3", "write", key="a")],
+        _noop_start,
+        _noop_end,
+    ))
+    assert [r.content.split("@")[0] for r in results] == ["w1", "w3"]
+    assert log == ["start:w1", "end:w1", "start:w3", "end:w3"]
+
+
+def test_simulation_waits_for_earlier_patch_of_same_circuit(tmp_path):
+    (tmp_path / "a.cir").write_text("* a\n.end\n", encoding="utf-8")
+    registry = ToolRegistry()
+    registry.register(PatchFileTool())
+    registry.register(RunSimulationTool())
+    scheduler = ToolScheduler(registry, ToolContext(project_root=str(tmp_path)))
+
+    planned = scheduler.plan([
+        _call("p", "patch_file", path="a.cir", old_text="* a", new_text="* b"),
+        _call("s", "run_simulation", file_path="a.cir"),
+    ])
+
+    assert [entry.prepared_error for entry in planned] == [None, None]
+    assert planned[0].resource_key != planned[1].resource_key
+    assert planned[1].depends_on == [0]
@@ -0,0 +1,190 @@
+import json
+import shutil
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from domain.simulation.data import simulation_artifact_persistence as persistence_module
+from domain.simulation.data.simulation_artifact_exporter import (
+    CATEGORY_OUTPUT_LOG,
+    CATEGORY_RAW_DATA,
+    simulation_artifact_exporter,
+)
+from domain.simulation.data.simulation_artifact_persistence import (
+    EXPORT_STATUS_FAILED,
+    EXPORT_STATUS_PENDING,
+    EXPORT_STATUS_RUNNING,
+    EXPORT_STATUS_READY,
+    ensure_bundle_categories,
+    simulation_artifact_persistence,
+)
+from domain.simulation.data.simulation_output_reader import simulation_output_reader
+from domain.simulation.models.simulation_result import SimulationData, SimulationResult
+from presentation.panels.simulation import simulation_conversation_attachment_coordinator as coordinator_module
+from presentation.panels.simulation.simulation_conversation_attachment_coordinator import (
+    ATTACHMENT_EXPORT_WAIT_SECONDS,
+    SimulationConversationAttachmentCoordinator,
+)
+from shared.service_locator import ServiceLocator
+from shared.service_names import SVC_EVENT_BUS
+
+
+def _make_result() -> SimulationResult:
+    return SimulationResult(
+        executor="spice",
+        file_path="amp.cir",
+        analysis_type="tran",
+        success=True,
+        data=SimulationData(
+            time=np.array([0.0, 1e-6, 2e-6]),
+            signals={"V(out)": np.array([0.0, 0.5, 1.0])},
+            signal_types={"V(out)": "voltage"},
+        ),
+        raw_output="Simulation started\nSimulation finished",
+        timestamp="2026-04-06T00:10:00",
+        x_axis_kind="time",
+        x_axis_label="Time (s)",
+        analysis_command=".tran 1u 2u",
+    )
+
+
+def _category_status(export_root: Path) -> dict:
+    manifest_path = simulation_artifact_exporter.export_manifest_path(export_root)
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    return payload["data"]["category_status"]
+
+
+def test_deferred_bundle_commits_result_and_reader_pulls_category(tmp_path: Path):
+    # 占住后台 I/O 队列，保证派生类别在断言期间仍处于 pending
+    release = threading.Event()
+    persistence_module._export_queue().submit(release.wait)
+    try:
+        outcome = simulation_artifact_persistence.persist_bundle(
+            str(tmp_path), _make_result(), {}, defer_derived_exports=True
+        )
+        root = outcome.export_root
+
+        assert (root / "result.json").exists()
+        assert CATEGORY_OUTPUT_LOG in outcome.pending_categories
+        assert set(_category_status(root).values()) == {EXPORT_STATUS_PENDING}
+        assert not simulation_artifact_exporter.output_log_paths(root).json_path.exists()
+
+        status = ensure_bundle_categories(root, [CATEGORY_OUTPUT_LOG])
+
+        assert status == {CATEGORY_OUTPUT_LOG: EXPORT_STATUS_READY}
+        assert simulation_artifact_exporter.output_log_paths(root).json_path.exists()
+        assert _category_status(root)[CATEGORY_RAW_DATA] == EXPORT_STATUS_PENDING
+    finally:
+        release.set()
+
+    assert outcome.wait_for_exports(timeout=10)
+    assert set(_category_status(root).values()) == {EXPORT_STATUS_READY}
+    assert simulation_artifact_exporter.raw_data_paths(root).csv_path.exists()
+    persistence_module._export_queue().submit(lambda: None).result(timeout=10)
+    assert persistence_module._export_key(root) not in persistence_module._ACTIVE_EXPORT_JOBS
+
+
+def test_pending_category_left_by_previous_run_is_resumed(tmp_path: Path):
+    result = _make_result()
+    outcome = simulation_artifact_persistence.persist_bundle(str(tmp_path), result, {})
+    root = outcome.export_root
+    manifest_path = simulation_artifact_exporter.export_manifest_path(root)
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    payload["data"]["category_status"][CATEGORY_OUTPUT_LOG] = EXPORT_STATUS_PENDING
+    manifest_path.write_text(json.dumps(payload), encoding="utf-8")
+    shutil.rmtree(simulation_artifact_exporter.output_log_paths(root).json_path.parent)
+
+    # 没有 result 时只报告状态，不做导出
+    assert ensure_bundle_categories(root, [CATEGORY_OUTPUT_LOG]) == {
+        CATEGORY_OUTPUT_LOG: EXPORT_STATUS_PENDING
+    }
+
+    status = ensure_bundle_categories(root, [CATEGORY_OUTPUT_LOG], result=result)
+
+    assert status == {CATEGORY_OUTPUT_LOG: EXPORT_STATUS_READY}
+    assert simulation_artifact_exporter.output_log_paths(root).json_path.exists()
+    assert set(_category_status(root).values()) == {EXPORT_STATUS_READY}
+
+
+class _RecordingEventBus:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, event_type, payload):
+        self.published.append((event_type, payload))
+
+
+def test_readers_and_attachments_pull_pending_category_before_reading(tmp_path: Path):
+    result = _make_result()
+    release = threading.Event()
+    persistence_module._export_queue().submit(release.wait)
+    event_bus = _RecordingEventBus()
+    ServiceLocator.register(SVC_EVENT_BUS, event_bus)
+    try:
+        outcome = simulation_artifact_persistence.persist_bundle(
+            str(tmp_path), result, {}, defer_derived_exports=True
+        )
+        root = outcome.export_root
+        log_paths = simulation_artifact_exporter.output_log_paths(root)
+        # 模拟后台导出写到一半：文件已存在但内容不完整
+        log_paths.text_path.parent.mkdir(parents=True, exist_ok=True)
+        log_paths.text_path.write_text("# artifact_type: output_log\n", encoding="utf-8")
+        result_path = simulation_artifact_exporter.result_json_path(root).relative_to(tmp_path).as_posix()
+
+        # 读取器按类别状态等待 / 拉取导出，而不是看到文件存在就读取
+        index = simulation_output_reader.get_output_log_index(result_path, str(tmp_path))
+        assert index is not None
+        assert _category_status(root)[CATEGORY_OUTPUT_LOG] == EXPORT_STATUS_READY
+
+        coordinator = SimulationConversationAttachmentCoordinator(None, None)
+        metrics_path = coordinator.attach_metrics(str(tmp_path), str(root), result, [])
+        log_path = coordinator.attach_output_log(str(tmp_path), str(root), result)
+        assert "Simulation finished" in Path(log_path).read_text(encoding="utf-8")
+        assert Path(metrics_path).is_file() and len(event_bus.published) == 4
+    finally:
+        ServiceLocator.unregister(SVC_EVENT_BUS)
+        release.set()
+    assert outcome.wait_for_exports(timeout=10)
+
+
+def test_attachments_fall_back_to_synchronous_export_after_failed_category(tmp_path: Path, monkeypatch):
+    result = _make_result()
+    outcome = simulation_artifact_persistence.persist_bundle(str(tmp_path), result, {})
+    root = outcome.export_root
+    manifest_path = simulation_artifact_exporter.export_manifest_path(root)
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    payload["data"]["category_status"][CATEGORY_OUTPUT_LOG] = EXPORT_STATUS_FAILED
+    manifest_path.write_text(json.dumps(payload), encoding="utf-8")
+    log_paths = simulation_artifact_exporter.output_log_paths(root)
+    # 后台导出失败时留下的不完整文件
+    log_paths.text_path.write_text("# artifact_type: output_log\n", encoding="utf-8")
+
+    requested_timeouts = []
+
+    def recording_ensure(export_root, categories, result=None, timeout=None):
+        requested_timeouts.append(timeout)
+        return ensure_bundle_categories(export_root, categories, result=result, timeout=timeout)
+
+    monkeypatch.setattr(coordinator_module, "ensure_bundle_categories", recording_ensure)
+    event_bus = _RecordingEventBus()
+    ServiceLocator.register(SVC_EVENT_BUS, event_bus)
+    try:
+        coordinator = SimulationConversationAttachmentCoordinator(None, None)
+        log_path = coordinator.attach_output_log(str(tmp_path), str(root), result)
+        assert "Simulation finished" in Path(log_path).read_text(encoding="utf-8")
+        assert requested_timeouts == [ATTACHMENT_EXPORT_WAIT_SECONDS]
+
+        # 仍在后台写入的类别不阻塞 UI，直接报告
+        monkeypatch.setattr(
+            coordinator_module,
+            "ensure_bundle_categories",
+            lambda export_root, categories, result=None, timeout=None: {
+                category: EXPORT_STATUS_RUNNING for category in categories
+            },
+        )
+        with pytest.raises(RuntimeError, match="still exporting"):
+            coordinator.attach_metrics(str(tmp_path), str(root), result, [])
+    finally:
+        ServiceLocator.unregister(SVC_EVENT_BUS)
@@ -0,0 +1,75 @@
+from pathlib import Path
+
+from domain.simulation.spice.bundled_library_index import (
+    build_bundled_library_index,
+    compute_resource_fingerprint,
+    read_bundled_library_index,
+    write_bundled_library_index,
+)
+
+
+def _make_models_dir(root: Path) -> Path:
+    models_dir = root / "models"
+    (models_dir / "sub" / "opamps").mkdir(parents=True)
+    (models_dir / "cmp").mkdir()
+    (models_dir / "sub" / "opamps" / "amp.sub").write_text(
+        "* generic amplifier\n"
+        ".subckt AMP1 in out vcc vee\n"
+        "R1 in out 1k\n"
+        ".ends AMP1\n",
+        encoding="utf-8",
+    )
+    (models_dir / "sub" / "lt_only.lib").write_text(
+        ".subckt LT1001 1 2 3 4 5\n"
+        "A1 0 0 0 0 0 0 0 0 OTA g=1\n"
+        ".ends LT1001\n",
+        encoding="utf-8",
+    )
+    (models_dir / "cmp" / "standard.bjt").write_text(
+        ".model 2N3904 NPN(IS=1e-14 BF=300\n"
+        "+ mfg=Generic)\n"
+        "* comment\n"
+        ".model 2N3906 PNP(IS=1e-14)\n",
+        encoding="utf-8",
+    )
+    return models_dir
+
+
+def test_index_round_trips_through_serialized_file(tmp_path: Path) -> None:
+    models_dir = _make_models_dir(tmp_path)
+    fingerprint = compute_resource_fingerprint(models_dir)
+    index = build_bundled_library_index(models_dir, fingerprint)
+
+    assert [header.name for header in index.subcircuit_headers] == ["lt1001", "amp1"]
+    amp = index.subcircuit_headers[1]
+    assert amp.ports == ("in", "out", "vcc", "vee")
+    assert amp.leading_comment_lines == ("* generic amplifier",)
+    assert amp.trailing_lines == ("R1 in out 1k", ".ends AMP1")
+    assert index.scan_for(models_dir / "sub" / "lt_only.lib").incompatible_reasons == ("OTA",)
+    assert index.scan_for(models_dir / "sub" / "opamps" / "amp.sub").is_compatible
+    assert [(block.name, block.text.count("\n")) for block in index.model_blocks] == [("2n3904", 1), ("2n3906", 0)]
+
+    cache_path = tmp_path / "cache" / "index.json.gz"
+    assert write_bundled_library_index(index, models_dir, cache_path)
+    loaded = read_bundled_library_index(cache_path, models_dir, fingerprint, "cache")
+
+    assert loaded is not None and loaded.origin == "cache"
+    assert loaded.subcircuit_headers == index.subcircuit_headers
+    assert loaded.model_blocks == index.model_blocks
+    assert {path.name: scan for path, scan in loaded.library_scans.items()} == {
+        path.name: scan for path, scan in index.library_scans.items()
+    }
+
+
+def test_resource_change_invalidates_serialized_index(tmp_path: Path) -> None:
+    models_dir = _make_models_dir(tmp_path)
+    fingerprint = compute_resource_fingerprint(models_dir)
+    cache_path = tmp_path / "index.json.gz"
+    write_bundled_library_index(build_bundled_library_index(models_dir, fingerprint), models_dir, cache_path)
+
+    (models_dir / "sub" / "extra.sub").write_text(".subckt EXTRA a b\n.ends\n", encoding="utf-8")
+    changed = compute_resource_fingerprint(models_dir)
+
+    assert changed != fingerprint
+    assert read_bundled_library_index(cache_path, models_dir, changed, "cache") is None
+    assert "extra" in {header.name for header in build_bundled_library_index(models_dir, changed).subcircuit_headers}
@@ -0,0 +1,114 @@
+import os
+from pathlib import Path
+
+from domain.dependency.scanner.dependency_scanner import DependencyScanner
+from domain.dependency.service.dependency_graph_service import DependencyGraphService
+from domain.simulation.executor.circuit_analyzer import CircuitAnalyzer
+from shared.constants.paths import DEPENDENCY_GRAPH_FILE
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _age_tree(root: Path, seconds: int = 60) -> None:
+    """把文件 mtime 调到过去，使其落在哈希校验窗口之外"""
+    past = os.stat(root).st_mtime - seconds
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (past, past))
+
+
+def _make_project(root: Path) -> None:
+    _write(root / "amp.cir", "* amp\n.include models/opamp.lib\nX1 in out opamp\n.tran 1u 1m\n.end\n")
+    _write(root / "filter.cir", "* filter\n.include stage.sub\n.ac dec 10 1 1meg\n.end\n")
+    _write(root / "stage.sub", ".subckt stage a b\n.lib models/opamp.lib\n.ends\n")
+    _write(root / "models" / "opamp.lib", ".subckt opamp in out\nR1 in out 1k\n.ends\n")
+    _write(root / "params.cir", ".param gain=10\n")
+    _write(root / "broken.cir", ".include missing.lib\n.op\n")
+    _write(root / "simulation_results" / "run_1" / "amp.cir", ".include models/opamp.lib\n.op\n")
+
+
+def test_affected_simulations_follow_nested_includes(tmp_path: Path):
+    _make_project(tmp_path)
+    graph = DependencyGraphService()
+    graph.refresh(str(tmp_path))
+
+    affected = graph.get_affected_simulations("models/opamp.lib")
+
+    assert affected == [str(tmp_path / "amp.cir"), str(tmp_path / "filter.cir")]
+    assert graph.get_dependents("models/opamp.lib", transitive=False) == [
+        str(tmp_path / "amp.cir"),
+        str(tmp_path / "stage.sub"),
+    ]
+
+
+def test_reopen_reuses_cached_records(tmp_path: Path):
+    _make_project(tmp_path)
+    _age_tree(tmp_path)
+    first = DependencyGraphService()
+    first.refresh(str(tmp_path))
+    assert first.parsed_count == 6
+    assert (tmp_path / DEPENDENCY_GRAPH_FILE).exists()
+
+    _write(tmp_path / "params.cir", ".param gain=20\n")
+    reopened = DependencyGraphService()
+    reopened.refresh(str(tmp_path))
+
+    assert reopened.parsed_count == 1
+    assert reopened.reused_count == 5
+
+
+def test_file_events_update_graph_incrementally(tmp_path: Path):
+    _make_project(tmp_path)
+    graph = DependencyGraphService()
+    graph.refresh(str(tmp_path))
+    assert graph.get_affected_simulations("missing.lib") == []
+
+    _write(tmp_path / "missing.lib", ".model D1 D\n")
+    graph._on_file_changed({"data": {"path": str(tmp_path / "missing.lib"), "event_type": "created"}})
+    assert graph.get_affected_simulations("missing.lib") == [str(tmp_path / "broken.cir")]
+
+    _write(tmp_path / "filter.cir", "* filter\n.ac dec 10 1 1meg\n.end\n")
+    graph._on_file_changed({"data": {"path": "filter.cir", "operation": "update"}})
+    assert graph.get_affected_simulations("models/opamp.lib") == [str(tmp_path / "amp.cir")]
+
+    (tmp_path / "amp.cir").unlink()
+    graph._on_file_changed({"data": {"path": str(tmp_path / "amp.cir"), "event_type": "deleted"}})
+    assert graph.get_affected_simulations("models/opamp.lib") == []
+
+
+def test_file_events_through_symlinked_root_match_graph_keys(tmp_path: Path):
+    real_root = tmp_path / "real"
+    _make_project(real_root)
+    link_root = tmp_path / "link"
+    link_root.symlink_to(real_root, target_is_directory=True)
+    graph = DependencyGraphService()
+    graph.refresh(str(link_root))
+
+    (real_root / "amp.cir").unlink()
+    graph._on_file_changed({"data": {"path": str(link_root / "models" / ".." / "amp.cir"), "event_type": "deleted"}})
+
+    assert graph.get_affected_simulations("models/opamp.lib") == [str(real_root / "filter.cir")]
+
+
+def test_health_report_and_analyzer_share_cached_graph(tmp_path: Path):
+    _make_project(tmp_path)
+    graph = DependencyGraphService()
+
+    report = DependencyScanner(graph_service=graph).scan(str(tmp_path))
+    assert report.scanned_files == 6
+    assert [dep.raw_path for dep in report.get_missing_dependencies()] == ["missing.lib"]
+    parsed = graph.parsed_count
+
+    analyzer = CircuitAnalyzer(graph_service=graph)
+    infos = {info.path: info for info in analyzer.scan_circuit_files(str(tmp_path))}
+
+    assert graph.parsed_count <= parsed
+    assert infos["amp.cir"].file_type == "main"
+    assert infos["params.cir"].file_type == "parameter"
+    assert analyzer.build_dependency_graph(str(tmp_path))["amp.cir"] == [
+        os.path.join("models", "opamp.lib")
+    ]
+    assert analyzer.get_resimulation_targets(str(tmp_path), "stage.sub") == ["filter.cir"]
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from domain.rag.embedder import Embedder, TokenRateLimiter, plan_embedding_batches
+
+
+class _EmbeddingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.calls += 1
+            throttled = server.calls == 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(0.05)
+        with server.lock:
+            server.in_flight -= 1
+        if throttled:
+            body = b"{}"
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+        else:
+            server.batches.append(payload["input"])
+            # 打乱 data 顺序，由 index 还原
+            items = [
+                {"index": i, "embedding": [float(len(text))]}
+                for i, text in reversed(list(enumerate(payload["input"])))
+            ]
+            body = json.dumps({"data": items}).encode()
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubEmbedder(Embedder):
+    def __init__(self, base_url: str):
+        super().__init__()
+        self._base_url = base_url
+
+    def _get_embedding_config(self):
+        return "zhipu", "embedding-3", self._base_url, 2, 5
+
+    def _get_api_key(self) -> str:
+        return "key"
+
+    def _get_throughput_config(self):
+        return 3, 0
+
+
+@pytest.fixture
+def embedding_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EmbeddingHandler)
+    server.lock = threading.Lock()
+    server.calls = 0
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.batches = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server, f"http://127.0.0.1:{server.server_address[1]}/api/paas/v4/embeddings"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_plan_embedding_batches_adapts_to_token_lengths():
+    assert plan_embedding_batches([10, 10, 10, 10, 10], max_items=2, max_tokens=100) == [(0, 2), (2, 4), (4, 5)]
+    assert plan_embedding_batches([60, 50, 5, 5, 200, 1], max_items=8, max_tokens=100) == [(0, 1), (1, 4), (4, 5), (5, 6)]
+    assert plan_embedding_batches([], max_items=4, max_tokens=100) == []
+
+
+def test_token_rate_limiter_queues_reservations_behind_debt():
+    now = [0.0]
+    limiter = TokenRateLimiter(600, clock=lambda: now[0])
+
+    assert limiter.reserve(600) == 0.0
+    assert limiter.reserve(100) == pytest.approx(10.0)
+    now[0] = 5.0
+    assert limiter.reserve(50) == pytest.approx(10.0)
+    assert TokenRateLimiter(0).reserve(10_000) == 0.0
+
+
+def test_embed_texts_async_runs_batches_concurrently_and_keeps_order(embedding_server):
+    server, url = embedding_server
+    texts = ["a" * n for n in range(1, 10)]
+
+    async def run():
+        vectors = await _StubEmbedder(url).embed_texts_async(texts)
+        from infrastructure.utils.http_client_pool import get_http_client_registry
+        await get_http_client_registry().aclose_loop_clients()
+        return vectors
+
+    vectors = asyncio.run(run())
+
+    assert vectors == [[float(n)] for n in range(1, 10)]
+    # 9 条按每批 2 条切成 5 批，首个请求被 429 后重试
+    assert server.calls == 6
+    assert sorted(len(batch) for batch in server.batches) == [1, 2, 2, 2, 2]
+    assert 1 < server.max_in_flight <= 3
+
+
+def test_sync_embed_texts_retries_and_matches_async_result(embedding_server):
+    server, url = embedding_server
+
+    assert _StubEmbedder(url).embed_texts(["xy", "abc", "q"]) == [[2.0], [3.0], [1.0]]
+    assert server.calls == 3
+    assert server.max_in_flight == 1
@@ -0,0 +1,127 @@
+import os
+from pathlib import Path
+
+from application.tasks.file_watch_task import CircuitFileEventHandler
+from infrastructure.file_intelligence.search.file_search_service import (
+    FileNameIndex,
+    FileSearchService,
+)
+from shared.constants.paths import FILE_NAME_INDEX_FILE
+from shared.workspace_exclusions import WorkspaceExclusions
+
+
+def _write(path: Path, text: str = "* netlist\n") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _make_project(root: Path) -> None:
+    _write(root / "amp.cir")
+    _write(root / "models" / "opamp.lib")
+    _write(root / "models" / "vendor" / "adi.lib")
+    _write(root / "simulation_results" / "run_1" / "raw.json", "{}")
+    _write(root / ".circuit_ai" / "conversations" / "c.json", "{}")
+    _write(root / "models" / "backup.cir~")
+
+
+def _age_tree(root: Path, seconds: int = 60) -> None:
+    """把目录 mtime 调到过去，使其落在快照的可信窗口之外"""
+    past = os.stat(root).st_mtime - seconds
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def test_build_skips_generated_trees(tmp_path: Path):
+    _make_project(tmp_path)
+    index = FileNameIndex()
+
+    index.build(tmp_path)
+
+    assert sorted(index.get_all_files()) == sorted([
+        "amp.cir",
+        os.path.join("models", "opamp.lib"),
+        os.path.join("models", "vendor", "adi.lib"),
+    ])
+
+
+def test_configured_prefix_exclusion(tmp_path: Path):
+    _make_project(tmp_path)
+    index = FileNameIndex()
+
+    index.build(tmp_path, exclude_patterns=["models/vendor"])
+
+    assert os.path.join("models", "vendor", "adi.lib") not in index.get_all_files()
+    assert os.path.join("models", "opamp.lib") in index.get_all_files()
+
+
+def test_snapshot_reconcile_only_rescans_changed_directories(tmp_path: Path):
+    _make_project(tmp_path)
+    _age_tree(tmp_path)
+    snapshot = tmp_path / FILE_NAME_INDEX_FILE
+
+    first = FileNameIndex()
+    first.build(tmp_path, snapshot_path=snapshot)
+    assert first.save_snapshot(snapshot)
+
+    _write(tmp_path / "models" / "vendor" / "ltc.lib")
+
+    reopened = FileNameIndex()
+    count = reopened.build(tmp_path, snapshot_path=snapshot)
+
+    assert count == 4
+    assert reopened.scanned_dir_count == 1
+    assert reopened.reused_dir_count == 2
+    assert [match[0] for match in reopened.search_by_name("ltc")] == [
+        os.path.join("models", "vendor", "ltc.lib")
+    ]
+
+
+def test_snapshot_from_other_exclusions_is_ignored(tmp_path: Path):
+    _make_project(tmp_path)
+    _age_tree(tmp_path)
+    snapshot = tmp_path / FILE_NAME_INDEX_FILE
+    first = FileNameIndex()
+    first.build(tmp_path, snapshot_path=snapshot)
+    first.save_snapshot(snapshot)
+
+    reopened = FileNameIndex()
+    reopened.build(tmp_path, exclude_patterns=["vendor"], snapshot_path=snapshot)
+
+    assert reopened.reused_dir_count == 0
+    assert os.path.join("models", "vendor", "adi.lib") not in reopened.get_all_files()
+
+
+def test_service_applies_watcher_events_with_shared_exclusions(tmp_path: Path):
+    _make_project(tmp_path)
+    service = FileSearchService()
+    service.build_index(tmp_path)
+    assert (tmp_path / FILE_NAME_INDEX_FILE).exists()
+
+    new_file = tmp_path / "models" / "new.cir"
+    _write(new_file)
+    generated = tmp_path / "simulation_results" / "run_2" / "raw.json"
+    _write(generated, "{}")
+    service._on_file_changed({"data": {"path": str(new_file), "event_type": "created"}})
+    service._on_file_changed({"data": {"path": str(generated), "event_type": "created"}})
+    service._on_file_changed({
+        "data": {
+            "path": str(tmp_path / "models" / "vendor"),
+            "event_type": "deleted",
+            "is_directory": True,
+        }
+    })
+
+    files = service._file_index.get_all_files()
+    assert files[os.path.join("models", "new.cir")] == str(new_file)
+    assert not any(path.startswith("simulation_results") for path in files)
+    assert os.path.join("models", "vendor", "adi.lib") not in files
+
+
+def test_file_watcher_uses_workspace_exclusions(tmp_path: Path):
+    handler = CircuitFileEventHandler(receiver=None, watch_root=tmp_path)
+    handler._exclusions = WorkspaceExclusions(excluded_dirs={"build_out", "models/vendor"})
+
+    assert handler._should_ignore(str(tmp_path / "build_out" / "a.cir"))
+    assert handler._should_ignore(str(tmp_path / "models" / "vendor"), is_directory=True)
+    assert not handler._should_ignore(str(tmp_path / "models" / "opamp.lib"))
+    assert handler._should_ignore(str(tmp_path / "amp.cir.swp"))
@@ -0,0 +1,115 @@
+from pathlib import Path
+
+from rapidfuzz.distance import Indel
+
+from infrastructure.file_intelligence.search.fuzzy.block_matcher import BlockMatcher
+from infrastructure.file_intelligence.search.fuzzy.fuzzy_matcher import FuzzyMatcher
+from infrastructure.file_intelligence.search.fuzzy.similarity_algorithms import (
+    SimilarityAlgorithms,
+)
+from infrastructure.file_intelligence.search.fuzzy.text_normalizer import (
+    NormalizeOptions,
+    TextNormalizer,
+)
+from infrastructure.persistence.file_manager import FileManager
+
+
+_ADI_LIB = Path(__file__).resolve().parents[1] / "resources" / "models" / "sub" / "ADI.lib"
+
+
+def _read_lib_lines() -> list[str]:
+    return _ADI_LIB.read_text(encoding="utf-8", errors="ignore").split("\n")
+
+
+def _mutated_block(lines: list[str], start: int, count: int) -> str:
+    block = list(lines[start:start + count])
+    block[1] = block[1].replace(" ", "   ", 1) + "  "
+    block[-2] = block[-2].replace("E", "e", 1)
+    return "\n".join(block)
+
+
+def _brute_force_best(file_manager: FileManager, content_lines, search: str):
+    normalized_search = file_manager._normalize_whitespace(search)
+    line_count = len(search.strip().split("\n"))
+    best_score = 0.0
+    best_start = -1
+    for start in range(len(content_lines) - line_count + 1):
+        window = file_manager._normalize_whitespace("\n".join(content_lines[start:start + line_count]))
+        score = Indel.normalized_similarity(normalized_search, window)
+        if score > best_score:
+            best_score = score
+            best_start = start
+    return best_start, best_score
+
+
+def test_block_matcher_agrees_with_brute_force_on_model_library():
+    file_manager = FileManager()
+    content_lines = _read_lib_lines()[:3000]
+    search = _mutated_block(content_lines, 1200, 12)
+
+    matcher = BlockMatcher(content_lines, file_manager._normalize_line_whitespace, skip_empty_lines=True)
+    match = matcher.find_best(
+        file_manager._normalize_whitespace(search),
+        search.strip().split("\n"),
+        0.0,
+    )
+
+    assert (match.start_line, match.score) == _brute_force_best(file_manager, content_lines, search)
+
+
+def test_block_matcher_prefers_first_of_identical_blocks():
+    content_lines = ["x", "a", "b", "c", "y", "a", "b", "c", "z"]
+    matcher = BlockMatcher(content_lines, str.strip)
+
+    match = matcher.find_best("a\nb\nc", ["a", "b", "c"], 0.9)
+
+    assert match.start_line == 1
+    assert match.score == 1.0
+
+
+def test_block_matcher_returns_none_below_threshold():
+    matcher = BlockMatcher(["alpha", "beta", "gamma"], str.strip)
+
+    assert matcher.find_best("zzzz\nqqqq", ["zzzz", "qqqq"], 0.9) is None
+
+
+def test_fuzzy_patch_on_large_model_library(tmp_path: Path):
+    content_lines = _read_lib_lines()
+    lib_path = tmp_path / "ADI.lib"
+    lib_path.write_text("\n".join(content_lines), encoding="utf-8")
+    search = _mutated_block(content_lines, 9000, 10)
+
+    file_manager = FileManager()
+    file_manager.set_work_dir(tmp_path)
+    replace_count, matched = file_manager.patch_file(
+        lib_path, search, "* REPLACED BLOCK", fuzzy=True
+    )
+
+    assert replace_count == 1
+    assert matched == "\n".join(content_lines[9000:9010])
+    patched_lines = lib_path.read_text(encoding="utf-8").split("\n")
+    assert patched_lines[9000] == "* REPLACED BLOCK"
+    assert patched_lines[9001:] == content_lines[9010:]
+
+
+def test_find_similar_content_matches_per_window_normalization():
+    content = "\n".join(_read_lib_lines()[4990:5040])
+    query = "R10 72 73 2.894E+02\nR20 73  98 1.592E-02\nC10 72 73 1.000E-06"
+    options = NormalizeOptions(ignore_whitespace=True, ignore_empty_lines=False)
+    content_lines = content.split("\n")
+    normalized_query = TextNormalizer.normalize_for_matching(query.strip(), options)
+    expected_starts = [
+        start + 1
+        for start in range(len(content_lines) - 2)
+        if SimilarityAlgorithms.partial_ratio(
+            normalized_query,
+            TextNormalizer.normalize_for_matching("\n".join(content_lines[start:start + 3]), options),
+        ) >= 0.85
+    ]
+
+    results = FuzzyMatcher().find_similar_content(query, content, threshold=0.85)
+
+    assert results
+    assert results[0]["score"] == 1.0
+    assert {result["start_line"] for result in results} <= set(expected_starts)
+    assert results[0]["start_line"] in expected_starts
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from infrastructure.llm_adapters.openai_compatible_client import OpenAICompatibleClient
+from infrastructure.utils.http_client_pool import (
+    HttpClientRegistry,
+    close_http_clients,
+    get_http_client_registry,
+)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        self.rfile.read(length)
+        self.server.peers.append(self.client_address)
+        self.server.auth.append(self.headers.get("Authorization"))
+        if self.path.endswith("/stream"):
+            body = b'data: {"choices":[{"delta":{"content":"hi"},"finish_reason":"stop"}]}\n\ndata: [DONE]\n\n'
+            content_type = "text/event-stream"
+        else:
+            body = json.dumps({
+                "choices": [{"message": {"content": "pong"}, "finish_reason": "stop"}],
+            }).encode()
+            content_type = "application/json"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.peers = []
+    server.auth = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_sync_and_async_requests_reuse_pooled_connections(stub_server):
+    server, base_url = stub_server
+    registry = HttpClientRegistry()
+
+    for key in ("a", "b", "c"):
+        response = registry.bind(base_url, headers={"Authorization": key}).post("/chat/completions", json={})
+        assert response.status_code == 200
+
+    async def stream_twice():
+        for _ in range(2):
+            async with registry.bind_async(base_url, headers={"Authorization": "s"}) as client:
+                async with client.stream("POST", "/stream", json={}) as response:
+                    await response.aread()
+        await registry.aclose()
+
+    asyncio.run(stream_twice())
+
+    # 3 次同步请求共用一个连接，2 次异步请求共用另一个连接
+    assert len(set(server.peers)) == 2
+    assert server.auth == ["a", "b", "c", "s", "s"]
+    origin = registry.get_stats()["origins"][f"http://127.0.0.1:{server.server_address[1]}"]
+    assert origin["requests"] == 5
+    assert origin["new_connections"] == 2
+    assert origin["reused_connections"] == 3
+    assert origin["latency_ms_max"] > 0
+
+
+def test_llm_client_uses_process_wide_pool_until_shutdown(stub_server):
+    server, base_url = stub_server
+    close_http_clients()
+    client = OpenAICompatibleClient(provider_id="qwen", api_key="k", base_url=base_url, model="m")
+
+    assert client.chat([{"role": "user", "content": "ping"}]).content == "pong"
+    assert client.chat([{"role": "user", "content": "ping"}]).content == "pong"
+    assert len(set(server.peers)) == 1
+    assert server.auth == ["Bearer k", "Bearer k"]
+
+    registry = get_http_client_registry()
+    stats = close_http_clients()
+    assert stats["origins"][f"http://127.0.0.1:{server.server_address[1]}"]["reused_connections"] == 1
+    assert get_http_client_registry() is not registry
+
+
+def test_close_schedules_each_async_client_on_its_own_running_loop():
+    registry = HttpClientRegistry()
+    loops = [asyncio.new_event_loop() for _ in range(3)]
+    threads = [threading.Thread(target=loop.run_forever, daemon=True) for loop in loops]
+    for thread in threads:
+        thread.start()
+    closed_on = {}
+    done = threading.Event()
+
+    async def open_client(index):
+        client = registry.get_async_client("http://127.0.0.1:1/v1")
+        original_aclose = client.aclose
+
+        async def aclose():
+            closed_on[index] = asyncio.get_running_loop()
+            await original_aclose()
+            if len(closed_on) == len(loops):
+                done.set()
+
+        client.aclose = aclose
+        return client
+
+    try:
+        clients = [
+            asyncio.run_coroutine_threadsafe(open_client(index), loop).result(timeout=5)
+            for index, loop in enumerate(loops)
+        ]
+        registry.close()
+
+        assert done.wait(timeout=5)
+        assert all(closed_on[index] is loop for index, loop in enumerate(loops))
+        assert all(client.is_closed for client in clients)
+    finally:
+        for loop, thread in zip(loops, threads):
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
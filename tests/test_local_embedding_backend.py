@@ -0,0 +1,79 @@
+import asyncio
+import os
+
+import pytest
+
+from domain.rag import embedder as embedder_module
+from domain.rag.embedder import Embedder
+from infrastructure.utils.local_embedding_backend import LocalEmbeddingBackend
+
+
+def _fake_loader(model_path, backend, batch_size):
+    parent_pid = os.getppid()
+
+    def encode(texts):
+        if "crash" in texts:
+            os._exit(3)
+        return [[float(len(text)), float(batch_size), float(parent_pid != os.getpid())] for text in texts]
+
+    return encode
+
+
+def _failing_loader(model_path, backend, batch_size):
+    raise FileNotFoundError(f"no model at {model_path}")
+
+
+def test_backend_embeds_in_child_process_and_restarts_after_crash():
+    backend = LocalEmbeddingBackend("unused", batch_size=8, loader=_fake_loader)
+    try:
+        backend.warm_up().join(timeout=60)
+        assert backend.is_running
+        first_pid = backend._process.pid
+        assert first_pid != os.getpid()
+
+        assert backend.embed(["ab", "abcd"]) == [[2.0, 8.0, 1.0], [4.0, 8.0, 1.0]]
+        assert asyncio.run(backend.embed_async(["xyz"])) == [[3.0, 8.0, 1.0]]
+
+        # 子进程中途退出：自动重启一次后报告错误，之后的请求照常处理
+        with pytest.raises(RuntimeError):
+            backend.embed(["crash"])
+        assert backend.embed(["a"]) == [[1.0, 8.0, 1.0]]
+        assert backend._process.pid != first_pid
+
+        stats = backend.get_stats()
+        assert stats["requests"] == 4
+        assert stats["starts"] == 3
+    finally:
+        backend.close()
+    assert not backend.is_running
+
+
+def test_backend_reports_model_load_failure():
+    backend = LocalEmbeddingBackend("/missing/model", loader=_failing_loader)
+    with pytest.raises(RuntimeError, match="no model at /missing/model"):
+        backend.embed(["x"])
+    assert not backend.is_running
+
+
+def test_embedder_routes_project_local_provider_to_backend(monkeypatch):
+    backend = LocalEmbeddingBackend("unused", loader=_fake_loader)
+    requested = []
+
+    def fake_get_backend(model_path, backend_name, batch_size):
+        requested.append(backend_name)
+        return backend
+
+    monkeypatch.setattr(embedder_module, "get_local_embedding_backend", fake_get_backend)
+    embedder = Embedder()
+    embedder.set_project_config({"provider": "local", "local_backend": "onnx"})
+    try:
+        assert embedder.model_id == "local:gte-modernbert-base"
+        assert embedder.embed_texts(["abc"])[0][0] == 3.0
+        assert asyncio.run(embedder.embed_texts_async(["abcde"]))[0][0] == 5.0
+        assert requested == ["onnx", "onnx"]
+    finally:
+        backend.close()
+
+    embedder.set_project_config({"provider": "local", "local_backend": "gpu"})
+    with pytest.raises(RuntimeError, match="Unsupported local embedding backend"):
+        embedder.embed_texts(["abc"])
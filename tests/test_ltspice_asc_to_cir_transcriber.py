@@ -147,3 +147,79 @@ def test_transcriber_degrades_three_node_mos_to_body_tied_source(tmp_path: Path)
     assert any("body 节点" in warning for warning in result.warnings)
     assert result.degraded is True
     assert result.validation_errors == ()
+
+
+def test_axis_point_index_matches_exhaustive_segment_scan():
+    import random
+
+    from domain.simulation.spice.ltspice_asc_to_cir_transcriber import (
+        _AxisPointIndex,
+        _Point,
+        _WireSegment,
+        _point_on_segment,
+    )
+
+    rng = random.Random(3)
+    points = list({_Point(rng.randrange(0, 20) * 16, rng.randrange(0, 20) * 16) for _ in range(300)})
+    wires = []
+    for _ in range(200):
+        start = _Point(rng.randrange(0, 20) * 16, rng.randrange(0, 20) * 16)
+        kind = rng.randrange(3)
+        if kind == 0:
+            end = _Point(start.x, rng.randrange(0, 20) * 16)
+        elif kind == 1:
+            end = _Point(rng.randrange(0, 20) * 16, start.y)
+        else:
+            offset = rng.randrange(1, 5) * 16
+            end = _Point(start.x + offset, start.y - offset)
+        wires.append(_WireSegment(start, end))
+
+    index = _AxisPointIndex(points)
+    for wire in wires:
+        expected = {point for point in points if _point_on_segment(point, wire)}
+        found = index.points_on(wire)
+        assert set(found) == expected
+        axis = (lambda p: (p.y, p.x)) if wire.start.x == wire.end.x else (lambda p: (p.x, p.y))
+        assert found == sorted(found, key=axis)
+
+
+def test_convert_files_in_process_pool_matches_sequential(tmp_path: Path):
+    (tmp_path / "copy").mkdir()
+    paths = [
+        str(_write_asc_file(tmp_path, "amplifier.asc", AMPLIFIER_ASC)),
+        str(_write_asc_file(tmp_path, "unknown.asc", UNKNOWN_SYMBOL_ASC)),
+        str(tmp_path / "missing.asc"),
+        str(_write_asc_file(tmp_path / "copy", "amplifier.asc", AMPLIFIER_ASC)),
+    ]
+    transcriber = LtspiceAscToCirTranscriber()
+
+    sequential = transcriber.convert_files(paths, str(tmp_path / "seq"), max_workers=1)
+    pooled = transcriber.convert_files(paths, str(tmp_path / "pool"), max_workers=2)
+
+    assert [Path(item.output_path).name for item in pooled.converted_files] == [
+        "amplifier.cir", "unknown.cir", "amplifier_2.cir",
+    ]
+    assert [Path(path).name for path, _ in pooled.failed_files] == ["missing.asc"]
+    for left, right in zip(sequential.converted_files, pooled.converted_files):
+        assert Path(left.output_path).read_text(encoding="utf-8") == Path(right.output_path).read_text(encoding="utf-8")
+        assert left.warnings == right.warnings
+
+
+def test_batch_conversion_uses_process_pool_only_when_requested(tmp_path: Path, monkeypatch):
+    from domain.simulation.spice import ltspice_asc_to_cir_transcriber as transcriber_module
+
+    paths = [str(_write_asc_file(tmp_path, f"amp{index}.asc", AMPLIFIER_ASC)) for index in range(5)]
+
+    def no_process_pool(*_args, **_kwargs):
+        raise AssertionError("convert_files must not spawn processes unless max_workers is given")
+
+    monkeypatch.setattr(transcriber_module, "ProcessPoolExecutor", no_process_pool)
+    execution = LtspiceAscToCirTranscriber().convert_files(paths, str(tmp_path / "out"))
+
+    assert len(execution.converted_files) == 5 and not execution.failed_files
+    assert transcriber_module.recommended_batch_workers(3) == 1
+    assert transcriber_module.recommended_batch_workers(5) >= 1
+    assert transcriber_module._transcribe_in_batch_worker(paths[0], str(tmp_path)) == (
+        None,
+        "ASC 批量转换子进程未初始化",
+    )
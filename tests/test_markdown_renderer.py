@@ -24,3 +24,89 @@ def test_pipe_table_preserves_inline_math_tokens_for_katex_rendering():
 
     assert "<table>" in html
     assert "$y$" in html
+
+
+_MIXED_DOCUMENT = (
+    "# 标题\n"
+    "段落 $x^2$ 与 **粗体**。\n"
+    "\n"
+    "```python\n"
+    "x = 1\n"
+    "\n"
+    "y = 2\n"
+    "```\n"
+    "\n"
+    "- a\n"
+    "- b\n"
+    "\n"
+    "- c\n"
+    "\n"
+    "$$\n"
+    "a+b\n"
+    "\n"
+    "=c\n"
+    "$$\n"
+    "\n"
+    "结论\n"
+    "| A | B |\n"
+    "|---|---|\n"
+    "| 1 | $y$ |\n"
+    "\n"
+    "    缩进代码\n"
+    "\n"
+    "    仍是代码\n"
+    "\n"
+    "结尾"
+)
+
+
+def test_block_rendering_matches_whole_document_rendering():
+    from infrastructure.utils.markdown_renderer import MarkdownRenderer, split_markdown_blocks
+
+    renderer = MarkdownRenderer()
+    blocks = split_markdown_blocks(_MIXED_DOCUMENT)
+
+    assert any(block.startswith("```python") and block.endswith("```") for block in blocks)
+    assert any(block.startswith("$$") and block.endswith("$$") for block in blocks)
+    assert renderer.render_markdown(_MIXED_DOCUMENT) == renderer._render_block(_MIXED_DOCUMENT)
+
+
+def test_streaming_growth_only_rerenders_trailing_block():
+    from infrastructure.utils.markdown_renderer import MarkdownRenderer
+
+    renderer = MarkdownRenderer()
+    for end in range(1, len(_MIXED_DOCUMENT) + 1):
+        renderer.render_markdown(_MIXED_DOCUMENT[:end])
+    streamed = renderer.rendered_block_count
+
+    # 每个前缀只渲染末尾块，加上每个定稿块各渲染一次
+    assert streamed < len(_MIXED_DOCUMENT) + 20
+
+    # 历史消息再次序列化时整条命中缓存
+    renderer.render_markdown(_MIXED_DOCUMENT)
+    assert renderer.rendered_block_count == streamed
+
+
+_CONTAINER_DOCUMENTS = [
+    "> 引用第一段\n\n> 引用第二段\n\n正文",
+    "> a\n> b\n\n>c\n\n\n> d\n\n# 标题\n\n> e",
+    "> 引用\n惰性续行\n\n> 仍在引用中",
+    "# 标题\n- a\n\n- b\n\n后文",
+    "说明：\n\n1. 第一步\n\n   细节段落\n\n2. 第二步\n\n- 另一列表\n\n- 项",
+    "- a\n\n  > 列表内引用\n\n- b\n\n> 列表后的引用\n\n> 续",
+    "> ```\n> code\n> ```\n\n> 结论\n\n```\n> 不是引用\n```\n\n> 真引用",
+    "---\n\n- a\n\n---\n\n- b",
+    _MIXED_DOCUMENT,
+]
+
+
+def test_incremental_rendering_matches_full_rendering_for_containers():
+    from infrastructure.utils.markdown_renderer import MarkdownRenderer
+
+    renderer = MarkdownRenderer()
+    for document in _CONTAINER_DOCUMENTS:
+        lines = document.split("\n")
+        # 逐行前缀模拟流式增长，每一步都要与整体渲染一致
+        for end in range(1, len(lines) + 1):
+            prefix = "\n".join(lines[:end])
+            assert renderer.render_markdown(prefix) == renderer._render_block(prefix), prefix
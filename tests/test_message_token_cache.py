@@ -0,0 +1,94 @@
+from domain.llm.llm_message_builder import LLMMessageBuilder
+from domain.llm.message_helpers import (
+    create_ai_message,
+    create_human_message,
+    dict_to_message,
+    message_to_dict,
+)
+from domain.llm.message_token_cache import TOKEN_COUNT_KEY, count_messages_tokens
+from domain.llm.token_counter import (
+    _estimate_tokens,
+    count_message_tokens,
+    count_tokens,
+    count_tokens_many,
+)
+from domain.llm.token_monitor import TokenMonitor
+
+
+def test_count_tokens_many_matches_single_counts():
+    texts = ["Hello, world!", "", "中文内容，测试。", ".model 2N3904 NPN(IS=1e-14)\n" * 5]
+
+    assert count_tokens_many(texts) == [count_tokens(text) for text in texts]
+
+
+def test_estimate_tokens_matches_character_classes():
+    assert _estimate_tokens("") == 0
+    assert _estimate_tokens("中文中文中文") == 4
+    assert _estimate_tokens("a,b.\n") == 3
+    assert _estimate_tokens("abcd    efgh") == 3
+
+
+def test_cached_message_counts_match_payload_counts():
+    messages = [
+        create_human_message("设计一个放大器"),
+        create_ai_message("好的", reasoning_content="先确定增益和带宽"),
+    ]
+    builder = LLMMessageBuilder()
+
+    counts = count_messages_tokens(messages, payload_builder=builder.build_message)
+
+    assert sum(counts) + 3 == count_message_tokens(builder.build_messages(messages))
+    for message, tokens in zip(messages, counts):
+        assert message.additional_kwargs[TOKEN_COUNT_KEY]["tokens"] == tokens
+
+
+def test_cached_messages_are_not_rebuilt():
+    messages = [create_human_message("first"), create_ai_message("second")]
+    built = []
+
+    def build_payload(message):
+        built.append(message)
+        return LLMMessageBuilder().build_message(message)
+
+    first = count_messages_tokens(messages, payload_builder=build_payload)
+    messages.append(create_human_message("third"))
+    second = count_messages_tokens(messages, payload_builder=build_payload)
+
+    assert second[:2] == first
+    assert built == messages[:2] + [messages[2]]
+
+
+def test_cache_invalidates_when_content_changes():
+    message = create_ai_message("short")
+    count_messages_tokens([message])
+    stale_entry = dict(message.additional_kwargs[TOKEN_COUNT_KEY])
+
+    message.content = "a much longer answer that clearly needs more tokens"
+    tokens = count_messages_tokens([message])[0]
+
+    assert tokens > stale_entry["tokens"]
+    assert message.additional_kwargs[TOKEN_COUNT_KEY]["content_hash"] != stale_entry["content_hash"]
+
+
+def test_token_count_cache_is_persisted_with_message():
+    message = create_ai_message("persist me", reasoning_content="why")
+    tokens = count_messages_tokens([message])[0]
+
+    restored = dict_to_message(message_to_dict(message))
+    built = []
+
+    def build_payload(msg):
+        built.append(msg)
+        return LLMMessageBuilder().build_message(msg)
+
+    assert count_messages_tokens([restored], payload_builder=build_payload) == [tokens]
+    assert built == []
+
+
+def test_token_monitor_usage_counts_working_messages():
+    messages = [create_human_message("hello"), create_ai_message("hi there")]
+    usage = TokenMonitor().calculate_usage({"messages": messages})
+
+    payloads = LLMMessageBuilder().build_messages(messages)
+    assert usage["message_tokens"] == count_message_tokens(payloads)
+    assert all(TOKEN_COUNT_KEY in message.additional_kwargs for message in messages)
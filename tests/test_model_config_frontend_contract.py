@@ -175,3 +175,51 @@ def test_model_config_controller_unsubscribes_language_events_on_deactivate():
     assert len(event_bus.subscriptions) == 1
     assert len(event_bus.unsubscriptions) == 1
     assert event_bus.subscriptions[0][0] == event_bus.unsubscriptions[0][0]
+
+
+class _FakeLocalEmbeddingBackend:
+    def __init__(self):
+        self.requests = []
+
+    def embed(self, _texts):
+        raise AssertionError("the connection test must not block on the synchronous embed")
+
+    async def embed_async(self, texts):
+        self.requests.append(list(texts))
+        return [[0.1, 0.2, 0.3]]
+
+
+def test_model_config_controller_runs_local_embedding_test_off_the_ui_thread(monkeypatch):
+    import asyncio
+
+    from presentation.model_config import model_config_controller
+
+    backend = _FakeLocalEmbeddingBackend()
+    monkeypatch.setattr(model_config_controller, "get_local_embedding_backend", lambda *_args: backend)
+    emitted_statuses = []
+    controller = ModelConfigController(
+        config_manager=None,
+        llm_runtime_config_manager=None,
+        credential_manager=None,
+        event_bus=None,
+        i18n_manager=None,
+        logger=None,
+        on_state_changed=lambda _state: emitted_statuses.append(controller._draft.embedding_validation_status),
+        on_close_requested=lambda: None,
+        on_confirm_requested=lambda **_payload: None,
+        on_notice_requested=lambda *_args, **_kwargs: None,
+    )
+    controller._draft = ModelConfigDraft(active_tab="embedding", embedding_provider="local")
+
+    async def run_test_connection():
+        controller.request_test_connection()
+        # 请求本身只发出 testing 状态，推理在任务中等待
+        assert emitted_statuses == ["testing"]
+        assert controller._connection_test_task is not None
+        await controller._connection_test_task
+
+    asyncio.run(run_test_connection())
+
+    assert backend.requests == [["ping"]]
+    assert emitted_statuses == ["testing", "verified"]
+    assert controller._connection_test_task is None
@@ -0,0 +1,124 @@
+import json
+import os
+import re
+from pathlib import Path
+
+from domain.llm.agent.tools.read_output_log import ReadOutputLogTool
+from domain.llm.agent.utils.truncate import DEFAULT_MAX_BYTES, DEFAULT_MAX_LINES, truncate_head
+from domain.simulation.data.output_log_index import OutputLogIndex, open_output_log_index
+from domain.simulation.data.simulation_artifact_exporter import simulation_artifact_exporter
+from domain.simulation.data.simulation_output_reader import simulation_output_reader
+
+
+HEADER = "# artifact_type: output_log\n# circuit_file: amp.cir\n\n"
+
+
+def _noisy_log(line_count: int) -> str:
+    lines = []
+    for i in range(line_count):
+        if i % 997 == 0:
+            lines.append(f"Error on line {i}: timestep too small; trouble with node n{i % 13}")
+        elif i % 101 == 0:
+            lines.append(f"Warning: floating node net_{i} ***")
+        elif i % 50 == 0:
+            lines.append(f"Température {i} ℃\r")
+        else:
+            lines.append(f"step {i} time={i * 1e-9:.3e} vout=1.25")
+    return "\n".join(lines) + "\n"
+
+
+def _write_bundle(root: Path, raw_output: str) -> Path:
+    bundle = root / "simulation_results" / "amp" / "2026-01-01_00-00-00"
+    paths = simulation_artifact_exporter.output_log_paths(bundle)
+    paths.directory.mkdir(parents=True)
+    paths.text_path.write_bytes((HEADER + raw_output).encode("utf-8"))
+    (bundle / "result.json").write_text(
+        json.dumps({"raw_output": raw_output, "analysis_type": "tran"}), encoding="utf-8"
+    )
+    return bundle
+
+
+def test_index_reads_match_full_parse(tmp_path: Path) -> None:
+    raw_output = _noisy_log(30000)
+    bundle = _write_bundle(tmp_path, raw_output)
+    paths = simulation_artifact_exporter.output_log_paths(bundle)
+    expected = simulation_output_reader.get_output_log_from_text(raw_output, max_lines=10**9)
+
+    index = OutputLogIndex.build(paths.text_path, paths.index_path)
+
+    assert index.total_lines == len(expected)
+    assert index.read_lines() == expected
+    assert index.read_lines(12345, 12400) == expected[12345:12400]
+    assert index.tail(20) == expected[-20:]
+    assert index.read_level("error") == [line for line in expected if line.is_error()]
+    assert index.read_level("warning", offset=3, limit=5) == [line for line in expected if line.is_warning()][3:8]
+    for keyword, case_sensitive in (("TIMESTEP too", False), ("net_", True), ("℃", False), ("***", False), ("", False)):
+        needle = keyword if case_sensitive else keyword.lower()
+        hits = [
+            line for line in expected
+            if keyword and needle in (line.content if case_sensitive else line.content.lower())
+        ]
+        assert index.search(keyword, case_sensitive=case_sensitive) == hits, keyword
+    regex = re.compile(r"n(1|2)\b", re.IGNORECASE)
+    assert index.search_regex(regex) == [line for line in expected if regex.search(line.content)]
+
+    # section='all' 只读取文件开头，结果与对全文截断一致
+    full_text = paths.text_path.read_text(encoding="utf-8")
+    assert ReadOutputLogTool._truncate_indexed_log(index) == truncate_head(
+        full_text, max_lines=DEFAULT_MAX_LINES, max_bytes=DEFAULT_MAX_BYTES
+    )
+
+
+def test_index_is_persisted_and_invalidated_by_source_changes(tmp_path: Path) -> None:
+    bundle = _write_bundle(tmp_path, _noisy_log(2000))
+    paths = simulation_artifact_exporter.output_log_paths(bundle)
+
+    index = open_output_log_index(paths.text_path, paths.index_path)
+    assert paths.index_path.is_file()
+    index.search("trouble")
+    reloaded = OutputLogIndex.load(paths.text_path, paths.index_path)
+    assert reloaded is not None and reloaded.has_term_index
+    assert reloaded.search("trouble") == index.search("trouble")
+
+    paths.text_path.write_text(HEADER + "fatal: singular matrix\n", encoding="utf-8")
+    os.utime(paths.text_path, ns=(1, 1))
+    assert OutputLogIndex.load(paths.text_path, paths.index_path) is None
+    refreshed = open_output_log_index(paths.text_path, paths.index_path)
+    assert refreshed.total_lines == 1 and refreshed.first_error() == "fatal: singular matrix"
+
+
+def test_reader_uses_bundle_index_for_whole_log(tmp_path: Path) -> None:
+    raw_output = _noisy_log(25000)
+    bundle = _write_bundle(tmp_path, raw_output)
+    sim_result_path = (bundle / "result.json").relative_to(tmp_path).as_posix()
+    expected = simulation_output_reader.get_output_log_from_text(raw_output, max_lines=10**9)
+    expected_errors = [line for line in expected if line.is_error()]
+
+    summary = simulation_output_reader.get_simulation_summary(sim_result_path, str(tmp_path))
+    assert summary.total_lines == 25000
+    assert summary.error_count == len(expected_errors)
+    assert summary.first_error == expected_errors[0].content
+    assert summary.analysis_type == "tran"
+
+    assert simulation_output_reader.get_output_log(sim_result_path, str(tmp_path), max_lines=100) == expected[:100]
+    assert simulation_output_reader.get_error_lines(sim_result_path, str(tmp_path)) == expected_errors
+    assert simulation_output_reader.search_log(sim_result_path, str(tmp_path), "Floating") == [
+        line for line in expected if "floating" in line.content.lower()
+    ]
+    assert simulation_output_reader.get_output_log_page(
+        sim_result_path, str(tmp_path), offset=10, limit=3, level="error"
+    ) == expected_errors[10:13]
+
+
+def test_ascii_level_detection_matches_per_line_detection(tmp_path: Path) -> None:
+    raw_output = "\n".join([
+        "errors: 0", "error_count=1", "xerror", "ERROR at t=0", "warning:error", "no  convergence",
+        "No Convergence in step", "floating-point", "missing", "deprecated_option", "Aborted",
+        "\x0cabort", "notice_", "warn", "fatal",
+    ])
+    bundle = _write_bundle(tmp_path, raw_output)
+    paths = simulation_artifact_exporter.output_log_paths(bundle)
+
+    index = OutputLogIndex.build(paths.text_path, paths.index_path)
+
+    assert index.read_lines() == simulation_output_reader.get_output_log_from_text(raw_output, max_lines=100)
@@ -0,0 +1,152 @@
+import os
+import textwrap
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from domain.simulation.executor.python_executor import PythonExecutor
+from domain.simulation.executor.python_worker_pool import PythonWorkerPool
+from domain.simulation.models.simulation_error import SimulationErrorType
+
+
+@pytest.fixture
+def pool():
+    pool = PythonWorkerPool(max_idle_workers=1)
+    try:
+        yield pool
+    finally:
+        pool.shutdown()
+
+
+def _write_script(path: Path, body: str) -> Path:
+    path.write_text(textwrap.dedent(body), encoding="utf-8")
+    return path
+
+
+def test_worker_is_reused_and_script_reloaded_on_change(tmp_path: Path, pool) -> None:
+    script = _write_script(tmp_path / "sweep.py", """
+        import os
+        import numpy as np
+        CALLS = []
+
+        def run_simulation(config):
+            CALLS.append(config["gain"])
+            print("debug line")
+            t = np.linspace(0, 1, 5000)
+            return {
+                "success": True,
+                "data": {
+                    "time": t,
+                    "signals": {"out": t * config["gain"], "calls": [len(CALLS)], "pid": [os.getpid()]},
+                },
+            }
+    """)
+    executor = PythonExecutor(worker_pool=pool)
+
+    first = executor.execute(str(script), {"gain": 2.0})
+    second = executor.execute(str(script), {"gain": 3.0})
+
+    assert first.success and second.success
+    assert first.data.time.dtype == np.float64 and first.data.time.shape == (5000,)
+    np.testing.assert_allclose(second.data.signals["out"], second.data.time * 3.0)
+    assert second.data.signals["calls"][0] == 2
+    assert second.data.signals["pid"][0] == first.data.signals["pid"][0] != os.getpid()
+    assert second.raw_output == "debug line\n"
+
+    # 脚本变化（大小与 mtime）后重新加载，模块状态重置
+    script.write_text(script.read_text(encoding="utf-8") + "\n# edited\n", encoding="utf-8")
+    third = executor.execute(str(script), {"gain": 1.0})
+    assert third.data.signals["calls"][0] == 1
+    assert pool.get_stats()["warm_runs"] == 2
+
+
+def test_timeout_kills_worker_and_pool_recovers(tmp_path: Path, pool) -> None:
+    script = _write_script(tmp_path / "slow.py", """
+        import time
+
+        def run_simulation(config):
+            time.sleep(config.get("sleep", 0))
+            return {"success": True, "data": {"signals": {"x": [1, 2, 3]}}}
+    """)
+    executor = PythonExecutor(worker_pool=pool)
+
+    result = executor.execute(str(script), {"sleep": 30, "timeout": 0.5})
+
+    assert not result.success
+    assert result.error.type == SimulationErrorType.TIMEOUT
+    assert pool.get_stats()["timeouts"] == 1
+    recovered = executor.execute(str(script), {})
+    assert recovered.success
+    assert recovered.data.signals["x"].tolist() == [1, 2, 3]
+
+
+def test_script_errors_and_crashes_are_reported(tmp_path: Path, pool) -> None:
+    failing = _write_script(tmp_path / "failing.py", """
+        def run_simulation(config):
+            raise ValueError("bad corner")
+    """)
+    crashing = _write_script(tmp_path / "crashing.py", """
+        import os
+
+        def run_simulation(config):
+            os._exit(7)
+    """)
+    executor = PythonExecutor(worker_pool=pool)
+
+    failed = executor.execute(str(failing), {})
+    assert not failed.success
+    assert "执行失败: bad corner" in failed.error.message
+    assert "ValueError" in failed.error.message
+
+    crashed = executor.execute(str(crashing), {})
+    assert not crashed.success
+    assert "返回码 7" in crashed.error.message
+
+
+def test_sibling_modules_do_not_leak_between_script_directories(tmp_path: Path, pool) -> None:
+    scripts = {}
+    for project, value in (("a", 1.0), ("b", 2.0)):
+        directory = tmp_path / project
+        directory.mkdir()
+        _write_script(directory / "helper.py", f"VALUE = {value}\n")
+        scripts[project] = _write_script(directory / "sweep.py", """
+            import helper
+
+            def run_simulation(config):
+                return {"success": True, "data": {"signals": {"value": [helper.VALUE]}}}
+        """)
+    executor = PythonExecutor(worker_pool=pool)
+
+    def value(project: str) -> float:
+        result = executor.execute(str(scripts[project]), {})
+        assert result.success, result.error
+        return float(result.data.signals["value"][0])
+
+    assert value("a") == 1.0
+    # 同名脚本、同名 helper 位于不同目录：各自加载
+    assert value("b") == 2.0
+    assert value("a") == 1.0
+
+    # 只修改 helper，脚本本身未变化：重新加载
+    _write_script(tmp_path / "a" / "helper.py", "VALUE = 10.0  # edited\n")
+    assert value("a") == 10.0
+    assert pool.get_stats()["warm_runs"] >= 3
+
+
+def test_dead_idle_workers_are_closed_outside_the_pool_lock(pool) -> None:
+    lock_held_during_close = []
+
+    class _DeadWorker:
+        is_alive = False
+
+        def close(self):
+            lock_held_during_close.append(pool._lock.locked())
+
+    live_worker = object()
+    pool._idle.extend([_DeadWorker(), _DeadWorker()])
+    pool._start_worker = lambda: live_worker
+
+    assert pool._acquire() == (live_worker, False)
+    assert lock_held_during_close == [False, False]
+    assert pool._idle == []
@@ -0,0 +1,110 @@
+import asyncio
+
+from domain.rag.chunker import Chunk
+from domain.rag.keyword_index import KeywordIndex, reciprocal_rank_fusion, tokenize
+from domain.rag.rag_manager import RAGManager
+from domain.rag.vector_store import QueryHit
+
+
+def _chunk(path: str, index: int, content: str) -> Chunk:
+    return Chunk(
+        content=content,
+        chunk_id=f"{path}#{index}",
+        file_path=path,
+        chunk_index=index,
+        file_type=".cir",
+        start_char=0,
+        end_char=len(content),
+    )
+
+
+def _build_index(tmp_path) -> KeywordIndex:
+    index = KeywordIndex(str(tmp_path / "keyword_index.json"))
+    index.upsert_file("amp.cir", [
+        _chunk("amp.cir", 0, "* 同相放大器\nXU1 in fb out LT1001\nR1 fb 0 1k"),
+        _chunk("amp.cir", 1, ".model 2N3904 NPN(IS=6.7e-15 BF=416)"),
+    ])
+    index.upsert_file("notes.md", [_chunk("notes.md", 0, "The opamp gain bandwidth limits V(out) slew")])
+    return index
+
+
+def test_keyword_index_matches_symbols_and_stays_in_sync(tmp_path):
+    index = _build_index(tmp_path)
+
+    assert "lt1001" in tokenize("XU1 LT1001") and ".model" in tokenize(".model Q1")
+    assert index.search("LT1001")[0].chunk_index == 0
+    assert index.search(".model 2N3904")[0].content.startswith(".model")
+    assert index.search("放大器")[0].file_path == "amp.cir"
+
+    index.upsert_file("amp.cir", [_chunk("amp.cir", 0, "R2 out 0 10k")])
+    assert index.search("LT1001") == []
+    index.save()
+
+    reloaded = KeywordIndex(str(tmp_path / "keyword_index.json"))
+    assert reloaded.load()
+    assert reloaded.chunk_ids() == {"amp.cir#0", "notes.md#0"}
+    assert reloaded.search("v(out)")[0].file_path == "notes.md"
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    a = QueryHit(content="a", file_path="x", score=0.9, chunk_index=0)
+    b = QueryHit(content="b", file_path="x", score=0.8, chunk_index=1)
+    c = QueryHit(content="c", file_path="y", score=7.0, chunk_index=0)
+
+    fused = reciprocal_rank_fusion([[a, b], [c, b]], top_k=2)
+
+    assert [hit.content for hit in fused] == ["b", "a"]
+
+
+class _FakeStore:
+    def __init__(self, keyword_index: KeywordIndex):
+        self.is_initialized = True
+        self._keyword_index = keyword_index
+        self.vector_queries = 0
+
+    def keyword_query(self, query_text, top_k=10):
+        return self._keyword_index.search(query_text, top_k=top_k)
+
+    def query(self, vector, top_k=10):
+        self.vector_queries += 1
+        return [QueryHit(content="semantic", file_path="notes.md", score=0.5, chunk_index=0)]
+
+
+class _CountingEmbedder:
+    model_name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_single(self, text):
+        self.calls += 1
+        return [1.0]
+
+    async def embed_texts_async(self, texts):
+        self.calls += 1
+        return [[1.0] for _ in texts]
+
+
+def test_symbol_queries_skip_embedding_and_query_vectors_are_cached(tmp_path):
+    manager = RAGManager()
+    manager._project_root = str(tmp_path)
+    manager._vector_store = _FakeStore(_build_index(tmp_path))
+    manager._embedder = _CountingEmbedder()
+
+    symbol = manager.query("LT1001")
+    assert symbol.chunks[0].content.startswith("* 同相放大器")
+    assert manager._embedder.calls == 0
+
+    manager.query("how is the opamp slew limited")
+    manager.query("how is the opamp slew limited")
+    assert manager._embedder.calls == 1
+    assert manager._vector_store.vector_queries == 2
+
+    manager._worker.start_and_wait()
+    try:
+        result = asyncio.run(manager.query_async("how is the opamp slew limited"))
+        asyncio.run(manager.query_async(".model 2N3904"))
+    finally:
+        manager.stop()
+    assert manager._embedder.calls == 1
+    assert result.chunks[0].file_path == "notes.md"
@@ -217,3 +217,55 @@ def test_simulation_artifact_exporter_exports_full_raw_data_snapshot(sample_resu
     table_lines = table_block.splitlines()
     assert table_lines[0] == "Time (s),V(out),V(in)"
     assert table_lines[2] == "0.1,2.0,0.6"
+
+
+def test_raw_data_csv_is_streamed_in_blocks_matching_row_writer(sample_result: SimulationResult, tmp_path):
+    import csv
+    import io
+
+    time = np.linspace(0.0, 1e-3, 11)
+    complex_signal = np.exp(1j * time * 1e3)
+    complex_signal[[0, 5]] = [1.5 + 0j, 2.5 + 0j]
+    sample_result.data = SimulationData(
+        time=time,
+        signals={
+            "V(out)": np.where(np.arange(11) % 4 == 0, np.nan, time * 3.3),
+            "I(R1)": complex_signal,
+        },
+    )
+    snapshot = WaveformDataService().build_table_snapshot(sample_result)
+    expected = io.StringIO()
+    writer = csv.writer(expected)
+    writer.writerow([snapshot.x_label, *snapshot.signal_names])
+    for row in range(snapshot.total_rows):
+        writer.writerow([float(snapshot.x_values[row])] + [
+            float(value) if np.isfinite(value) else ""
+            for value in (snapshot.signal_columns[name][row] for name in snapshot.signal_names)
+        ])
+
+    csv_path = tmp_path / "raw_data.csv"
+    row_count = simulation_artifact_exporter.write_csv_columns_with_header(
+        csv_path,
+        sample_result,
+        "raw_data",
+        [snapshot.x_label, *snapshot.signal_names],
+        [snapshot.x_values, *(snapshot.signal_columns[name] for name in snapshot.signal_names)],
+        blank_non_finite=[False, True, True],
+        chunk_rows=4,
+    )
+
+    with csv_path.open(newline="", encoding="utf-8") as handle:
+        _, _, table = handle.read().partition("\n\n")
+    assert row_count == 11
+    assert table == expected.getvalue()
+
+
+def test_table_column_conversion_matches_scalar_rule():
+    service = WaveformDataService()
+    complex_values = np.array([1.5 + 0j, 2.0 + 1e-3j, -3.0 + 1e-16j])
+
+    column = service._to_table_column(complex_values)
+
+    assert column[0] == 1.5 and column[2] == -3.0
+    assert np.isnan(column[1])
+    assert [service._to_table_scalar_value(value) for value in complex_values] == [1.5, None, -3.0]
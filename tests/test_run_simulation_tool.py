@@ -0,0 +1,76 @@
+import asyncio
+from pathlib import Path
+
+import numpy as np
+
+from domain.llm.agent.tools.run_simulation import RunSimulationTool
+from domain.llm.agent.types import ToolContext
+from domain.simulation.data.simulation_artifact_exporter import simulation_artifact_exporter
+from domain.simulation.data.simulation_artifact_persistence import simulation_artifact_persistence
+from domain.simulation.models.simulation_job import JobOrigin, SimulationJob
+from domain.simulation.models.simulation_result import SimulationData, SimulationResult
+from domain.simulation.service.simulation_result_repository import simulation_result_repository
+
+
+class _SupersedingJobManager:
+    """提交的 job 在排队时立刻被同一电路的新提交取代"""
+
+    def __init__(self, result_path: str, export_root: str):
+        self._result_path = result_path
+        self._export_root = export_root
+        self.jobs = {}
+        self.cancel_requests = []
+
+    def list(self, **_filters):
+        return []
+
+    def submit(self, circuit_file: str, origin: JobOrigin, project_root: str) -> SimulationJob:
+        stale = SimulationJob(circuit_file=circuit_file, origin=origin, project_root=project_root)
+        fresh = SimulationJob(circuit_file=circuit_file, origin=origin, project_root=project_root)
+        stale.superseded_by = fresh.job_id
+        stale.mark_cancelled()
+        fresh.mark_running()
+        fresh.mark_completed(result_path=self._result_path, export_root=self._export_root)
+        self.jobs = {stale.job_id: stale, fresh.job_id: fresh}
+        return stale
+
+    async def await_completion_async(self, job_id: str) -> SimulationJob:
+        return self.jobs[job_id]
+
+    def request_cancel(self, job_id: str) -> bool:
+        self.cancel_requests.append(job_id)
+        return True
+
+
+def test_superseded_job_reports_the_superseding_run(tmp_path: Path):
+    (tmp_path / "amp.cir").write_text("* amp\n.end\n", encoding="utf-8")
+    time_axis = np.linspace(0.0, 1e-3, 50)
+    outcome = simulation_artifact_persistence.persist_bundle(
+        str(tmp_path),
+        SimulationResult(
+            executor="spice",
+            file_path="amp.cir",
+            analysis_type="tran",
+            success=True,
+            data=SimulationData(time=time_axis, signals={"V(out)": time_axis}),
+        ),
+        {},
+    )
+    export_root = Path(outcome.export_root)
+    result_path = simulation_artifact_exporter.result_json_path(export_root).relative_to(tmp_path).as_posix()
+    manager = _SupersedingJobManager(result_path, export_root.as_posix())
+    context = ToolContext(
+        project_root=str(tmp_path),
+        sim_job_manager=manager,
+        sim_result_repository=simulation_result_repository,
+    )
+
+    result = asyncio.run(RunSimulationTool().execute("call", {"file_path": "amp.cir"}, context))
+
+    stale, fresh = manager.jobs.values()
+    assert not result.is_error, result.content
+    assert result.details["job_id"] == fresh.job_id
+    assert result.details["superseded_job_ids"] == [stale.job_id]
+    assert result.details["result_path"] == result_path
+    assert f"job {stale.job_id} was superseded by newer submission {fresh.job_id}" in result.content
+    assert manager.cancel_requests == []
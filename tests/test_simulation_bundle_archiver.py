@@ -0,0 +1,182 @@
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+
+from domain.simulation.data import simulation_artifact_persistence as persistence_module
+from domain.simulation.data.result_column_store import (
+    CODEC_ZLIB,
+    is_archived_payload,
+    load_result_payload,
+    write_result_archive,
+)
+from domain.simulation.data.simulation_artifact_exporter import (
+    CATEGORY_OUTPUT_LOG,
+    CATEGORY_RAW_DATA,
+    simulation_artifact_exporter,
+)
+from domain.simulation.data.simulation_artifact_persistence import (
+    EXPORT_STATUS_ARCHIVED,
+    EXPORT_STATUS_READY,
+    ensure_bundle_categories,
+    simulation_artifact_persistence,
+)
+from domain.simulation.data.simulation_output_reader import simulation_output_reader
+from domain.simulation.models.simulation_result import SimulationData, SimulationResult
+from domain.simulation.service.simulation_bundle_archiver import (
+    ARCHIVE_STATUS_ARCHIVED,
+    ARCHIVE_STATUS_SKIPPED,
+    ARCHIVE_STATUS_WOULD_ARCHIVE,
+    format_archive_report,
+    main,
+    simulation_bundle_archiver,
+)
+from domain.simulation.service.simulation_result_repository import simulation_result_repository
+from shared.models.load_result import LoadErrorCode
+
+
+def _make_ac_result(points: int = 2000) -> SimulationResult:
+    frequency = np.logspace(0, 9, points)
+    response = 1.0 / (1.0 + 1j * frequency / 1e5)
+    return SimulationResult(
+        executor="spice",
+        file_path="amp.cir",
+        analysis_type="ac",
+        success=True,
+        data=SimulationData(
+            frequency=frequency,
+            signals={"V(out)": response, "I(R1)": np.abs(response) * 1e-3},
+            signal_types={"V(out)": "voltage", "I(R1)": "current"},
+        ),
+        raw_output="Circuit: amp\nWarning: gmin stepping\nSimulation finished\n",
+        timestamp="2026-01-06T00:10:00",
+        x_axis_kind="frequency",
+        x_axis_label="Frequency (Hz)",
+        analysis_command=".ac dec 200 1 1G",
+    )
+
+
+def _persist_old_bundle(project_root: Path, result: SimulationResult, age_days: float) -> Path:
+    outcome = simulation_artifact_persistence.persist_bundle(str(project_root), result, {})
+    result_path = simulation_artifact_exporter.result_json_path(outcome.export_root)
+    old = time.time() - age_days * 86400
+    os.utime(result_path, (old, old))
+    return outcome.export_root
+
+
+def _result_path(project_root: Path, export_root: Path) -> str:
+    return simulation_artifact_exporter.result_json_path(export_root).relative_to(project_root).as_posix()
+
+
+def test_archived_bundle_stays_transparently_readable(tmp_path: Path):
+    original = _make_ac_result()
+    old_root = _persist_old_bundle(tmp_path, original, age_days=90)
+    recent_root = _persist_old_bundle(tmp_path, _make_ac_result(points=10), age_days=1)
+    result_path = _result_path(tmp_path, old_root)
+    mtime = simulation_artifact_exporter.result_json_path(old_root).stat().st_mtime_ns
+
+    preview = simulation_bundle_archiver.archive_project(str(tmp_path), older_than_days=30, dry_run=True)
+    assert [entry.status for entry in preview.entries] == [ARCHIVE_STATUS_WOULD_ARCHIVE]
+    assert simulation_artifact_exporter.raw_data_paths(old_root).csv_path.exists()
+
+    report = simulation_bundle_archiver.archive_project(str(tmp_path), older_than_days=30)
+
+    assert [entry.status for entry in report.entries] == [ARCHIVE_STATUS_ARCHIVED]
+    assert report.bytes_before == preview.bytes_before
+    assert report.bytes_after == preview.bytes_after
+    assert report.bytes_reclaimed > report.bytes_before // 2
+    assert "回收" in format_archive_report(report)
+    assert simulation_artifact_exporter.result_json_path(old_root).stat().st_mtime_ns == mtime
+    assert not simulation_artifact_exporter.raw_data_paths(old_root).directory.exists()
+    assert simulation_artifact_exporter.raw_data_paths(recent_root).csv_path.exists()
+
+    manifest = json.loads(
+        simulation_artifact_exporter.export_manifest_path(old_root).read_text(encoding="utf-8")
+    )
+    status = manifest["data"]["category_status"]
+    assert status[CATEGORY_RAW_DATA] == status[CATEGORY_OUTPUT_LOG] == EXPORT_STATUS_ARCHIVED
+    assert not any(path.startswith("raw_data/") for path in manifest["data"]["exported_files"])
+
+    # 按路径加载、历史列表与输出日志读取与归档前一致
+    loaded = simulation_result_repository.load(str(tmp_path), result_path)
+    assert loaded.success, loaded.error_message
+    data = loaded.data.data
+    assert np.array_equal(data.frequency, original.data.frequency)
+    assert np.array_equal(data.signals["V(out)"], original.data.signals["V(out)"])
+    assert data.signals["I(R1)"].dtype == np.float64
+    assert np.array_equal(data.signals["I(R1)"], original.data.signals["I(R1)"])
+    assert loaded.data.raw_output == original.raw_output
+    assert result_path in {summary.result_path for summary in simulation_result_repository.list(str(tmp_path))}
+    log_lines = simulation_output_reader.get_output_log(result_path, str(tmp_path))
+    assert [line.content for line in log_lines][:2] == ["Circuit: amp", "Warning: gmin stepping"]
+    # 日志读取器按需从结果重新生成已归档的 output_log
+    assert simulation_artifact_exporter.output_log_paths(old_root).text_path.is_file()
+
+    # 读取工具请求被删除的类别时按需重新生成
+    assert ensure_bundle_categories(old_root, [CATEGORY_RAW_DATA], result=loaded.data) == {
+        CATEGORY_RAW_DATA: EXPORT_STATUS_READY
+    }
+    assert simulation_artifact_exporter.raw_data_paths(old_root).csv_path.exists()
+    assert persistence_module._export_key(old_root) not in persistence_module._ACTIVE_EXPORT_JOBS
+    assert simulation_artifact_persistence.read_category_status(old_root)[CATEGORY_OUTPUT_LOG] == (
+        EXPORT_STATUS_READY
+    )
+
+    # 再次归档时删除按需重新生成的类别并计入回收字节
+    regenerated_bytes = sum(
+        path.stat().st_size
+        for paths in (
+            simulation_artifact_exporter.raw_data_paths(old_root),
+            simulation_artifact_exporter.output_log_paths(old_root),
+        )
+        for path in paths.directory.rglob("*")
+        if path.is_file()
+    )
+    preview = simulation_bundle_archiver.archive_project(str(tmp_path), older_than_days=30, dry_run=True)
+    assert [entry.status for entry in preview.entries] == [ARCHIVE_STATUS_WOULD_ARCHIVE]
+    assert simulation_artifact_exporter.raw_data_paths(old_root).csv_path.exists()
+    again = simulation_bundle_archiver.archive_project(str(tmp_path), older_than_days=30)
+    (entry,) = again.entries
+    assert entry.status == ARCHIVE_STATUS_ARCHIVED
+    assert entry.bytes_reclaimed == regenerated_bytes > 0
+    assert not simulation_artifact_exporter.raw_data_paths(old_root).csv_path.exists()
+    assert simulation_artifact_persistence.read_category_status(old_root)[CATEGORY_RAW_DATA] == (
+        EXPORT_STATUS_ARCHIVED
+    )
+
+    once_more = simulation_bundle_archiver.archive_project(str(tmp_path), older_than_days=30)
+    assert [(entry.status, entry.reason) for entry in once_more.entries] == [(ARCHIVE_STATUS_SKIPPED, "已归档")]
+    assert main([str(tmp_path), "--older-than-days", "30", "--dry-run"]) == 0
+
+
+def test_float32_zlib_archive_keeps_axes_exact_and_reports_corruption(tmp_path: Path):
+    time_axis = np.cumsum(np.full(5000, 1e-9)) + np.linspace(0, 1e-12, 5000)
+    result = SimulationResult(
+        executor="spice",
+        file_path="tran.cir",
+        analysis_type="tran",
+        success=True,
+        data=SimulationData(time=time_axis, signals={"V(out)": np.sin(time_axis * 1e7)}),
+        raw_output=None,
+    )
+    result_file = tmp_path / "result.json"
+    archive_file = tmp_path / "result.columns"
+    stub_size, archive_size = write_result_archive(
+        result_file, archive_file, result.to_dict(), float32=True, codec=CODEC_ZLIB
+    )
+
+    stub = json.loads(result_file.read_text(encoding="utf-8"))
+    assert is_archived_payload(stub)
+    assert stub["archive"]["codec"] == CODEC_ZLIB and stub["archive"]["lossy"]
+    assert stub["raw_output"] is None
+    assert stub_size + archive_size < len(json.dumps(result.to_dict())) // 4
+
+    restored = SimulationResult.from_dict(load_result_payload(result_file))
+    assert np.array_equal(restored.data.time, time_axis)
+    assert np.allclose(restored.data.signals["V(out)"], result.data.signals["V(out)"], atol=1e-6)
+
+    archive_file.write_bytes(archive_file.read_bytes()[:-16])
+    loaded = simulation_result_repository.load(str(tmp_path), "result.json")
+    assert not loaded.success and loaded.error_code == LoadErrorCode.PARSE_ERROR
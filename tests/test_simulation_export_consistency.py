@@ -277,8 +277,10 @@ def test_artifact_exporter_outputs_common_payload_schema(sample_result: Simulati
     assert metrics_payload["data"]["columns"][0] == "display_name"
     assert analysis_payload["files"]["text"] == "analysis_info.txt"
     assert raw_data_payload["data"]["columns"][0] == "Time (s)"
-    assert len(raw_data_payload["data"]["rows"]) == 4
-    assert len(raw_data_payload["data"]["series"]) == 2
+    assert raw_data_payload["data"]["row_count"] == 4
+    assert raw_data_payload["data"]["storage"]["file"] == "raw_data.csv"
+    assert "rows" not in raw_data_payload["data"]
+    assert [series["column"] for series in raw_data_payload["data"]["series"]] == [1, 2]
     assert output_log_payload["files"]["text"] == "output_log.txt"
     assert len(output_log_payload["data"]["lines"]) == 3
     assert output_log_payload["summary"]["warning_count"] == 1
@@ -14,6 +14,7 @@ are hidden behind narrow interfaces we can substitute.
 from __future__ import annotations
 
 import asyncio
+import json
 import threading
 import time
 from pathlib import Path
@@ -41,7 +42,10 @@ from domain.simulation.models.simulation_result import (
     create_error_result,
     create_success_result,
 )
-from domain.services.simulation_job_manager import SimulationJobManager
+from domain.services.simulation_job_manager import (
+    SimulationJobManager,
+    SimulationQueueFullError,
+)
 from shared.event_types import (
     EVENT_SIM_COMPLETE,
     EVENT_SIM_ERROR,
@@ -191,6 +195,7 @@ class _FakePersistence:
         project_root: str,
         result: SimulationResult,
         metric_targets=None,
+        defer_derived_exports=False,
     ) -> BundlePersistenceResult:
         self.calls.append((project_root, result, dict(metric_targets or {})))
         if self._raise is not None:
@@ -234,6 +239,7 @@ def manager_factory(bus):
         executor: Optional[_FakeExecutor] = None,
         persistence: Optional[_FakePersistence] = None,
         max_workers: int = 2,
+        **retention: Any,
     ) -> SimulationJobManager:
         registry = _FakeRegistry(executor)
         mgr = SimulationJobManager(
@@ -241,6 +247,7 @@ def manager_factory(bus):
             artifact_persistence=persistence or _FakePersistence(),
             event_bus=bus,
             max_workers=max_workers,
+            **retention,
         )
         built.append(mgr)
         return mgr
@@ -785,6 +792,170 @@ def test_two_jobs_run_in_parallel(manager_factory):
     assert elapsed < 0.55, f"expected parallel execution, got {elapsed:.2f}s"
 
 
+# ---------------------------------------------------------------------------
+# Scheduling
+# ---------------------------------------------------------------------------
+
+
+def test_ui_job_overtakes_queued_agent_batch(manager_factory):
+    order: List[str] = []
+    persistence = _FakePersistence(
+        on_persist=lambda _root, result: order.append(Path(result.file_path).stem)
+    )
+    manager = manager_factory(
+        executor=_FakeExecutor(delay=0.1), persistence=persistence, max_workers=1
+    )
+    jobs = [
+        manager.submit(
+            circuit_file=f"{name}.fake",
+            origin=origin,
+            project_root="/tmp/project",
+        )
+        for name, origin in (
+            ("blocker", JobOrigin.AGENT_TOOL),
+            ("agent1", JobOrigin.AGENT_TOOL),
+            ("agent2", JobOrigin.AGENT_TOOL),
+            ("ui", JobOrigin.UI_EDITOR),
+        )
+    ]
+    for job in jobs:
+        manager.await_completion(job.job_id, timeout=5.0)
+
+    assert order == ["blocker", "ui", "agent1", "agent2"]
+    assert [j.queue_depth_at_submit for j in jobs] == [0, 0, 1, 2]
+    assert jobs[2].queue_wait_seconds >= jobs[3].queue_wait_seconds > 0.05
+
+
+def test_queued_submit_for_same_circuit_is_superseded(manager_factory, bus):
+    executor = _FakeExecutor(delay=0.2)
+    manager = manager_factory(executor=executor, max_workers=1)
+    running = manager.submit(
+        circuit_file="amp.fake", origin=JobOrigin.UI_EDITOR, project_root="/tmp/project"
+    )
+    assert executor.started_event.wait(timeout=2.0)
+    stale = manager.submit(
+        circuit_file="amp.fake", origin=JobOrigin.UI_EDITOR, project_root="/tmp/project"
+    )
+    fresh = manager.submit(
+        circuit_file="amp.fake", origin=JobOrigin.UI_EDITOR, project_root="/tmp/project"
+    )
+
+    assert stale.status is JobStatus.CANCELLED
+    assert stale.superseded_by == fresh.job_id
+    payload = next(
+        p for p in bus.events_of(EVENT_SIM_ERROR) if p["job_id"] == stale.job_id
+    )
+    assert payload["cancelled"] is True and payload["superseded_by"] == fresh.job_id
+
+    assert manager.await_completion(fresh.job_id, timeout=3.0).status is JobStatus.COMPLETED
+    assert manager.await_completion(running.job_id).status is JobStatus.COMPLETED
+    assert executor.execute_calls == 2
+
+
+def test_agent_queue_limit_applies_backpressure(manager_factory):
+    executor = _FakeExecutor(delay=0.2)
+    manager = manager_factory(
+        executor=executor, max_workers=1, queue_limits={JobOrigin.AGENT_TOOL: 1}
+    )
+    running = manager.submit(
+        circuit_file="a.fake", origin=JobOrigin.AGENT_TOOL, project_root="/tmp/project"
+    )
+    assert executor.started_event.wait(timeout=2.0)
+    queued = manager.submit(
+        circuit_file="b.fake", origin=JobOrigin.AGENT_TOOL, project_root="/tmp/project"
+    )
+    with pytest.raises(SimulationQueueFullError):
+        manager.submit(
+            circuit_file="c.fake", origin=JobOrigin.AGENT_TOOL, project_root="/tmp/project"
+        )
+    assert {j.job_id for j in manager.list()} == {running.job_id, queued.job_id}
+
+    manager.close()
+    assert manager.await_completion(queued.job_id, timeout=1.0).status is JobStatus.CANCELLED
+    with pytest.raises(RuntimeError):
+        manager.submit(
+            circuit_file="d.fake", origin=JobOrigin.UI_EDITOR, project_root="/tmp/project"
+        )
+    manager.await_completion(running.job_id, timeout=3.0)
+
+
+# ---------------------------------------------------------------------------
+# Retention
+# ---------------------------------------------------------------------------
+
+
+def test_terminal_jobs_are_compacted_evicted_and_spilled(manager_factory, tmp_path):
+    """Count-bounded LRU: terminal jobs drop their waiter primitives,
+    the oldest beyond ``max_retained_jobs`` leave memory, and ``query``
+    still resolves them from the project's on-disk job index."""
+    (tmp_path / "simulation_results").mkdir()
+    manager = manager_factory(executor=_FakeExecutor(), max_retained_jobs=2)
+    jobs = []
+    for circuit in ("a.fake", "b.fake", "c.fake", "d.fake"):
+        job = manager.submit(
+            circuit_file=circuit,
+            origin=JobOrigin.AGENT_TOOL,
+            project_root=str(tmp_path),
+        )
+        manager.await_completion(job.job_id, timeout=2.0)
+        jobs.append(job)
+
+    assert not manager._done_events and not manager._async_waiters and not manager._live
+    assert [j.job_id for j in manager.list()] == [jobs[2].job_id, jobs[3].job_id]
+    assert manager.list(circuit_file="a.fake") == []
+    index_lines = (tmp_path / "simulation_results" / "job_index.jsonl").read_text(
+        encoding="utf-8"
+    ).splitlines()
+    assert len(index_lines) == 2
+
+    restored = manager.query(jobs[0].job_id)
+    assert restored is not None and restored is not jobs[0]
+    assert restored == jobs[0]
+    with pytest.raises(AttributeError):
+        restored.status = JobStatus.PENDING
+    assert manager.await_completion(jobs[0].job_id) is restored
+
+    # Re-admission evicts the least recently used job; the restored one
+    # is not appended to the index a second time when it leaves again.
+    assert [j.job_id for j in manager.list()] == [jobs[0].job_id, jobs[3].job_id]
+    manager.query(jobs[1].job_id)
+    manager.query(jobs[2].job_id)
+    spilled_ids = [
+        json.loads(line)["job_id"]
+        for line in (tmp_path / "simulation_results" / "job_index.jsonl")
+        .read_text(encoding="utf-8")
+        .splitlines()
+    ]
+    assert sorted(spilled_ids) == sorted(j.job_id for j in jobs)
+
+
+def test_idle_terminal_jobs_expire_without_touching_missing_projects(
+    manager_factory, tmp_path
+):
+    manager = manager_factory(
+        executor=_FakeExecutor(delay=0.2), retention_seconds=0.05
+    )
+    done = manager.submit(
+        circuit_file="amp.fake",
+        origin=JobOrigin.UI_EDITOR,
+        project_root=str(tmp_path / "gone"),
+    )
+    manager.await_completion(done.job_id, timeout=2.0)
+    live = manager.submit(
+        circuit_file="amp.fake",
+        origin=JobOrigin.UI_EDITOR,
+        project_root=str(tmp_path / "gone"),
+    )
+    time.sleep(0.1)
+
+    # Live jobs never expire; the idle terminal one is gone for good
+    # because its project has no results directory to spill into.
+    assert manager.list(origin=JobOrigin.UI_EDITOR) == [live]
+    assert manager.query(done.job_id) is None
+    assert not (tmp_path / "gone").exists()
+    manager.await_completion(live.job_id, timeout=2.0)
+
+
 # ---------------------------------------------------------------------------
 # Step-5 round-trip: every emitted payload satisfies the authoritative schema
 # ---------------------------------------------------------------------------
@@ -0,0 +1,78 @@
+"""Tests for ``SimulationJobQueue`` — origin fair share, per-circuit
+coalescing and queue-depth limits. Pure data-structure tests; the
+manager-level behaviour lives in ``test_simulation_job_manager.py``."""
+
+from __future__ import annotations
+
+import pytest
+
+from domain.services.simulation_job_queue import (
+    QueuedJob,
+    SimulationJobQueue,
+    SimulationQueueFullError,
+)
+from domain.simulation.models.simulation_job import JobOrigin, SimulationJob
+
+
+def _entry(circuit: str, origin: JobOrigin, project_root: str = "/p") -> QueuedJob:
+    return QueuedJob(
+        job=SimulationJob(circuit_file=circuit, origin=origin, project_root=project_root)
+    )
+
+
+def test_fair_share_prefers_ui_without_starving_agents():
+    queue = SimulationJobQueue(queue_limits={})
+    for index in range(10):
+        queue.push(_entry(f"agent{index}.cir", JobOrigin.AGENT_TOOL))
+        queue.push(_entry(f"ui{index}.cir", JobOrigin.UI_EDITOR))
+
+    origins = [queue.pop().job.origin for _ in range(10)]
+
+    assert origins[0] is JobOrigin.UI_EDITOR
+    assert origins.count(JobOrigin.UI_EDITOR) == 8
+    assert origins.count(JobOrigin.AGENT_TOOL) == 2
+
+    # An origin that was idle re-enters at the current virtual time
+    # instead of cashing in the turns it did not use.
+    queue.drain()
+    for index in range(8):
+        queue.push(_entry(f"agent-late{index}.cir", JobOrigin.AGENT_TOOL))
+        queue.pop()
+    queue.push(_entry("agent-tail.cir", JobOrigin.AGENT_TOOL))
+    queue.push(_entry("ui-late.cir", JobOrigin.UI_EDITOR))
+    assert queue.pop().job.circuit_file == "ui-late.cir"
+    assert queue.pop().job.circuit_file == "agent-tail.cir"
+    assert queue.pop() is None
+
+
+def test_newer_submit_for_same_circuit_supersedes_queued_one():
+    queue = SimulationJobQueue()
+    first = _entry("amp.cir", JobOrigin.UI_EDITOR)
+    other_origin = _entry("amp.cir", JobOrigin.AGENT_TOOL)
+    assert queue.push(first) is None
+    assert queue.push(other_origin) is None
+
+    second = _entry("./amp.cir", JobOrigin.UI_EDITOR)
+    assert queue.push(second) is first
+    assert first.job.job_id not in queue and second.job.job_id in queue
+    assert len(queue) == 2
+
+    assert queue.remove(second.job.job_id) is second
+    assert queue.remove(second.job.job_id) is None
+    assert [e.job.job_id for e in queue.drain()] == [other_origin.job.job_id]
+
+
+def test_queue_depth_limit_applies_per_origin():
+    queue = SimulationJobQueue(queue_limits={JobOrigin.AGENT_TOOL: 2})
+    queue.push(_entry("a.cir", JobOrigin.AGENT_TOOL))
+    queue.push(_entry("b.cir", JobOrigin.AGENT_TOOL))
+
+    with pytest.raises(SimulationQueueFullError) as excinfo:
+        queue.push(_entry("c.cir", JobOrigin.AGENT_TOOL))
+    assert (excinfo.value.limit, excinfo.value.depth) == (2, 2)
+
+    # Replacing a queued job and other origins are not limited.
+    assert queue.push(_entry("a.cir", JobOrigin.AGENT_TOOL)) is not None
+    for index in range(5):
+        queue.push(_entry(f"ui{index}.cir", JobOrigin.UI_EDITOR))
+    assert queue.depth(JobOrigin.AGENT_TOOL) == 2 and queue.depth() == 7
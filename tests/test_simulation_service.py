@@ -123,6 +123,7 @@ class _FakePersistence:
         project_root: str,
         result: SimulationResult,
         metric_targets=None,
+        defer_derived_exports=False,
     ) -> BundlePersistenceResult:
         self.calls.append((project_root, result))
         if self._raise is not None:
@@ -0,0 +1,106 @@
+from domain.simulation.spice.parse_cache import SpiceParseCache
+from domain.simulation.spice.parser import SpiceParser
+from domain.simulation.spice.schematic_builder import SpiceSchematicBuilder
+
+
+_NETLIST = "\n".join([
+    "* rc ladder",
+    "V1 in 0 DC 5",
+    "R1 in mid 1k",
+    "C1 mid 0 10n",
+    ".include models.lib",
+    ".subckt stage a b",
+    "R2 a b 2k",
+    "Q1 a b 0 2N3904",
+    ".ends",
+    "X1 mid out stage",
+    "R3 out 0 bad value here",
+    ".tran 1u 1m",
+    ".end",
+    "",
+])
+
+
+def _full_parse(content: str, source_file: str):
+    return SpiceParser(SpiceParseCache(max_entries=0)).parse_content(content, source_file)
+
+
+def test_parse_cache_returns_shared_document_for_same_content():
+    parser = SpiceParser(SpiceParseCache())
+
+    first = parser.parse_content(_NETLIST, "ladder.cir")
+    second = SpiceParser(parser._parse_cache).parse_content(_NETLIST, "ladder.cir")
+
+    assert second is first
+    assert parser._parse_cache.hits == 1
+
+
+def test_single_value_edit_is_reparsed_incrementally():
+    cache = SpiceParseCache()
+    parser = SpiceParser(cache)
+    original = parser.parse_content(_NETLIST, "ladder.cir")
+
+    edited_text = _NETLIST.replace("R1 in mid 1k", "R1 in mid 4.7k")
+    edited = parser.parse_content(edited_text, "ladder.cir")
+
+    assert edited == _full_parse(edited_text, "ladder.cir")
+    # components before the edited line are reused as-is
+    assert edited.components[0] is original.components[0]
+    assert edited.components[1].editable_fields[0].raw_text == "4.7k"
+    assert edited.subcircuits[0].components[0].id != original.subcircuits[0].components[0].id
+
+
+def test_same_length_edit_keeps_following_components():
+    parser = SpiceParser(SpiceParseCache())
+    original = parser.parse_content(_NETLIST, "ladder.cir")
+
+    edited_text = _NETLIST.replace("C1 mid 0 10n", "C1 mid 0 22n")
+    edited = parser.parse_content(edited_text, "ladder.cir")
+
+    assert edited == _full_parse(edited_text, "ladder.cir")
+    assert edited.subcircuits[0].components[0] is original.subcircuits[0].components[0]
+
+
+def test_structural_edit_falls_back_to_full_parse():
+    parser = SpiceParser(SpiceParseCache())
+    parser.parse_content(_NETLIST, "ladder.cir")
+
+    edited_text = _NETLIST.replace("R1 in mid 1k", "* R1 in mid 1k")
+    edited = parser.parse_content(edited_text, "ladder.cir")
+
+    assert edited == _full_parse(edited_text, "ladder.cir")
+    assert [component.instance_name for component in edited.components] == ["V1", "C1", "X1", "R3"]
+
+
+def test_parse_cache_evicts_least_recently_used():
+    cache = SpiceParseCache(max_entries=2)
+    parser = SpiceParser(cache)
+    parser.parse_content("R1 a b 1k\n", "a.cir")
+    parser.parse_content("R1 a b 1k\n", "b.cir")
+    parser.parse_content("R1 a b 1k\n", "a.cir")
+    parser.parse_content("R1 a b 1k\n", "c.cir")
+
+    assert len(cache) == 2
+    assert cache.get("b.cir", "R1 a b 1k\n") is None
+    assert cache.get("a.cir", "R1 a b 1k\n") is not None
+
+
+def test_builder_reuses_payload_for_unchanged_components():
+    parser = SpiceParser(SpiceParseCache())
+    builder = SpiceSchematicBuilder()
+    document = parser.parse_content(_NETLIST, "ladder.cir")
+    first = builder.build_document(document, source_text=_NETLIST)
+
+    assert builder.build_document(document, source_text=_NETLIST) == first
+
+    edited_text = _NETLIST.replace("C1 mid 0 10n", "C1 mid 0 22n")
+    edited = parser.parse_content(edited_text, "ladder.cir")
+    second = builder.build_document(edited, source_text=edited_text)
+
+    assert second["revision"] != first["revision"]
+    assert second["components"][0] is first["components"][0]
+    assert second["components"][2]["display_value"] == "22n"
+    assert second == SpiceSchematicBuilder().build_document(
+        _full_parse(edited_text, "ladder.cir"),
+        source_text=edited_text,
+    )
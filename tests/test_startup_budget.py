@@ -0,0 +1,267 @@
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from application.startup_profile import (
+    StartupProfile,
+    format_importtime_report,
+    import_chain,
+    parse_importtime,
+)
+from application.startup_warmup import TASK_FAILED, TASK_OK, StartupWarmup
+from shared.event_types import EVENT_STATE_PROJECT_OPENED
+from shared.service_locator import ServiceLocator, ServiceNotFoundError
+from shared.service_names import SVC_FILE_SEARCH_SERVICE
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+class _RecordingEventBus:
+    def __init__(self):
+        self.handlers = {}
+
+    def subscribe(self, event_type, handler):
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def publish(self, event_type, data=None, source=None):
+        for handler in self.handlers.get(event_type, []):
+            handler({"type": event_type, "data": data or {}, "source": source})
+
+
+@pytest.fixture(autouse=True)
+def clear_services():
+    ServiceLocator.clear()
+    yield
+    ServiceLocator.clear()
+
+
+def test_lazy_factory_constructs_once_on_first_get() -> None:
+    calls = []
+
+    def factory():
+        calls.append(threading.current_thread().name)
+        time.sleep(0.05)
+        return object()
+
+    ServiceLocator.register_factory("lazy", factory)
+    assert ServiceLocator.has("lazy") and not ServiceLocator.is_constructed("lazy")
+    assert ServiceLocator.get_all_names() == ["lazy"] and ServiceLocator.get_service_count() == 1
+    assert calls == []
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(ServiceLocator.get_optional("lazy"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert ServiceLocator.is_constructed("lazy") and ServiceLocator.get("lazy") is results[0]
+    assert ServiceLocator.get_all_names() == ["lazy"]
+
+    # 工厂失败时异常上抛，工厂保留以便重试
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("not ready")
+        return "ready"
+
+    ServiceLocator.register_factory("flaky", flaky)
+    with pytest.raises(RuntimeError):
+        ServiceLocator.get("flaky")
+    assert ServiceLocator.get("flaky") == "ready"
+
+    ServiceLocator.register_factory("dropped", object)
+    ServiceLocator.unregister("dropped")
+    assert not ServiceLocator.has("dropped") and ServiceLocator.get_optional("dropped") is None
+    with pytest.raises(ServiceNotFoundError):
+        ServiceLocator.get("dropped")
+
+    # register() 覆盖尚未构造的工厂
+    ServiceLocator.register_factory("override", lambda: "factory")
+    ServiceLocator.register("override", "instance")
+    assert ServiceLocator.get("override") == "instance"
+
+
+def test_bootstrap_import_defers_heavy_libraries() -> None:
+    heavy = ["langgraph", "langchain_core", "chromadb", "tiktoken", "fitz", "matplotlib", "httpx", "numpy"]
+    script = (
+        "import sys\n"
+        "import application.bootstrap\n"
+        "from domain.rag import file_extractor\n"
+        f"print('LOADED=' + ','.join(m for m in {heavy!r} if m in sys.modules))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.splitlines()[-1] == "LOADED="
+
+    # 包级便捷导出仍然可用
+    import application
+    import domain.llm
+    from domain.llm import ContextManager
+    from domain.llm.context_manager import ContextManager as DirectContextManager
+
+    assert ContextManager is DirectContextManager
+    assert "ContextManager" in dir(domain.llm) and "GraphState" in dir(application)
+    with pytest.raises(AttributeError):
+        getattr(domain.llm, "NoSuchExport")
+
+
+def test_importtime_report_and_phase_marks() -> None:
+    text = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     pydantic_core",
+        "import time:      3000 |       3120 |   langchain_core",
+        "[INFO] unrelated log line",
+        "import time:       500 |       3620 | domain.llm.message_helpers",
+        "import time:        80 |         80 | domain.rag.file_extractor",
+    ])
+
+    entries = parse_importtime(text)
+
+    assert [entry.module for entry in entries] == [
+        "pydantic_core", "langchain_core", "domain.llm.message_helpers", "domain.rag.file_extractor",
+    ]
+    assert [entry.depth for entry in entries] == [2, 1, 0, 0]
+    assert [entry.module for entry in import_chain(entries, "pydantic_core")] == [
+        "pydantic_core", "langchain_core", "domain.llm.message_helpers",
+    ]
+    report = format_importtime_report(entries, top=2, watch=["langchain_core", "chromadb"])
+    assert "3.6ms  domain.llm.message_helpers" in report
+    assert "chromadb: 未导入" in report
+    assert "langchain_core: langchain_core(3ms) <- domain.llm.message_helpers(4ms)" in report
+
+    profile = StartupProfile(origin=time.perf_counter())
+    profile.mark("Phase 0")
+    worker = threading.Thread(target=profile.mark, args=("预热完成: imports",), name="startup-warmup_0")
+    worker.start()
+    worker.join()
+    profile.mark("Phase 1")
+    assert [mark.label for mark in profile.get_marks()] == ["Phase 0", "预热完成: imports", "Phase 1"]
+    assert profile.elapsed_ms("Phase 1") >= profile.elapsed_ms("Phase 0")
+    assert "[startup-warmup_0]" in profile.format_report()
+
+
+def test_warmup_builds_file_index_when_project_opens(tmp_path: Path) -> None:
+    (tmp_path / "amp.cir").write_text("* amp\n.end\n", encoding="utf-8")
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "opamp.lib").write_text("* lib\n", encoding="utf-8")
+
+    def create_file_search_service():
+        from infrastructure.file_intelligence.search.file_search_service import FileSearchService
+        return FileSearchService()
+
+    ServiceLocator.register_factory(SVC_FILE_SEARCH_SERVICE, create_file_search_service)
+    event_bus = _RecordingEventBus()
+    warmup = StartupWarmup(max_workers=2)
+    try:
+        warmup.subscribe_events(event_bus)
+        event_bus.publish(EVENT_STATE_PROJECT_OPENED, {"path": str(tmp_path)})
+        warmup.submit("broken", lambda: 1 / 0)
+        assert warmup.wait(timeout=30)
+
+        stats = warmup.get_stats()
+        assert stats["file_index"]["status"] == TASK_OK and stats["file_index"]["value"] == 2
+        assert stats["broken"]["status"] == TASK_FAILED
+        file_search_service = ServiceLocator.get(SVC_FILE_SEARCH_SERVICE)
+        assert file_search_service.get_index_stats()["is_built"]
+    finally:
+        warmup.shutdown()
+    assert warmup.submit("late", lambda: None) is None
+
+
+def test_file_index_builds_once_and_queues_changes_during_build(tmp_path: Path, monkeypatch) -> None:
+    from infrastructure.file_intelligence.search.file_search_service import FileNameIndex, FileSearchService
+    from shared.event_types import EVENT_FILE_CHANGED
+
+    (tmp_path / "amp.cir").write_text("* amp\n.end\n", encoding="utf-8")
+    started, release = threading.Event(), threading.Event()
+    builds = []
+    original_build = FileNameIndex.build
+
+    def slow_build(self, *args, **kwargs):
+        builds.append(args[0])
+        started.set()
+        assert release.wait(timeout=30)
+        return original_build(self, *args, **kwargs)
+
+    monkeypatch.setattr(FileNameIndex, "build", slow_build)
+    event_bus = _RecordingEventBus()
+    service = FileSearchService()
+    service._event_bus = event_bus
+
+    # 预热线程构建中：事件已订阅，变更排队而不阻塞发布方
+    warm = threading.Thread(target=service.build_index, args=(tmp_path,))
+    warm.start()
+    assert started.wait(timeout=30)
+    assert EVENT_FILE_CHANGED in event_bus.handlers
+    (tmp_path / "filter.cir").write_text("* filter\n.end\n", encoding="utf-8")
+    publisher = threading.Thread(
+        target=event_bus.publish,
+        args=(EVENT_FILE_CHANGED, {"path": str(tmp_path / "filter.cir"), "event_type": "created"}),
+    )
+    publisher.start()
+    publisher.join(timeout=5)
+    assert not publisher.is_alive()
+
+    # 主线程首次搜索等待进行中的构建，不重复遍历
+    searcher = threading.Thread(target=service._ensure_index)
+    searcher.start()
+    release.set()
+    warm.join(timeout=30)
+    searcher.join(timeout=30)
+
+    assert builds == [tmp_path]
+    assert set(service._file_index.get_all_files()) == {"amp.cir", "filter.cir"}
+
+
+def test_warmup_starts_python_worker_only_for_projects_with_simulation_scripts(tmp_path: Path) -> None:
+    from domain.simulation.executor.executor_registry import executor_registry
+    from domain.simulation.executor.python_executor import PythonExecutor
+    from domain.simulation.executor.python_worker_pool import PythonWorkerPool
+
+    plain = tmp_path / "plain"
+    (plain / ".venv").mkdir(parents=True)
+    (plain / "setup.py").write_text("print('not a simulation')\n", encoding="utf-8")
+    (plain / ".venv" / "sweep.py").write_text("def run_simulation(config):\n    return {}\n", encoding="utf-8")
+    scripted = tmp_path / "scripted"
+    (scripted / "scripts").mkdir(parents=True)
+    (scripted / "scripts" / "sweep.py").write_text(
+        "def run_simulation(config):\n    return {'success': True}\n",
+        encoding="utf-8",
+    )
+
+    pool = PythonWorkerPool(max_idle_workers=1)
+    executor = PythonExecutor(worker_pool=pool)
+    executor_registry.register(executor)
+    warmup = StartupWarmup(max_workers=1)
+    try:
+        warmup.warm_python_workers(plain)
+        assert warmup.wait(timeout=30)
+        assert warmup.get_stats()["python_workers"]["value"] == 0
+
+        warmup.warm_python_workers(scripted)
+        assert warmup.wait(timeout=30)
+        assert warmup.get_stats()["python_workers"]["value"] == 1
+        deadline = time.monotonic() + 30
+        while pool.get_stats()["idle_workers"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert pool.get_stats()["idle_workers"] == 1
+    finally:
+        warmup.shutdown()
+        executor_registry.unregister(executor.get_name())
+        pool.shutdown()
@@ -0,0 +1,115 @@
+import asyncio
+from typing import List, Tuple
+
+from domain.llm.agent.agent_loop import EVENT_STREAM_CHUNK, AgentLoop
+from domain.llm.agent.stream_coalescer import StreamChunkCoalescer
+from domain.llm.agent.tool_registry import ToolRegistry
+from domain.llm.agent.types import ToolContext
+from infrastructure.llm_adapters.base_client import StreamChunk
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_coalescer_merges_by_window_size_and_type():
+    emitted: List[Tuple[str, str]] = []
+    clock = _FakeClock()
+
+    async def emit(chunk_type: str, text: str) -> None:
+        emitted.append((chunk_type, text))
+
+    async def scenario() -> None:
+        coalescer = StreamChunkCoalescer(emit, interval=0.025, max_chars=8, clock=clock)
+        for piece in ["th", "in", "k"]:
+            await coalescer.push("reasoning", piece)
+        # 类型切换先发出旧类型
+        await coalescer.push("content", "ab")
+        clock.now = 0.03
+        await coalescer.push("content", "c")
+        await coalescer.push("content", "defghijk")
+        await coalescer.push("content", "z")
+        await coalescer.aclose()
+        coalescer.cancel()
+
+    asyncio.run(scenario())
+
+    assert emitted == [
+        ("reasoning", "think"),
+        ("content", "abc"),
+        ("content", "defghijk"),
+        ("content", "z"),
+    ]
+
+
+def test_coalescer_timer_flushes_idle_tail():
+    emitted: List[Tuple[str, str]] = []
+
+    async def emit(chunk_type: str, text: str) -> None:
+        emitted.append((chunk_type, text))
+
+    async def scenario() -> None:
+        coalescer = StreamChunkCoalescer(emit, interval=0.01)
+        await coalescer.push("content", "tail")
+        await asyncio.sleep(0.05)
+        assert emitted == [("content", "tail")]
+        await coalescer.aclose()
+
+    asyncio.run(scenario())
+    assert emitted == [("content", "tail")]
+
+
+class _FakeClient:
+    def __init__(self, chunks: List[StreamChunk]) -> None:
+        self._chunks = chunks
+
+    async def chat_stream(self, **kwargs):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def test_agent_loop_accumulates_full_text_with_fewer_events():
+    deltas = [StreamChunk(reasoning_content="r") for _ in range(300)]
+    deltas += [StreamChunk(content=f"{i},") for i in range(500)]
+    deltas.append(StreamChunk(finish_reason="stop"))
+    loop = AgentLoop(
+        client=_FakeClient(deltas),
+        registry=ToolRegistry(),
+        context=ToolContext(project_root="."),
+        model="fake",
+    )
+    events = []
+
+    result = asyncio.run(loop.run([], on_event=lambda t, d: events.append((t, d))))
+
+    chunks = [d for t, d in events if t == EVENT_STREAM_CHUNK]
+    assert result.content == "".join(f"{i}," for i in range(500))
+    assert result.reasoning_content == "r" * 300
+    assert "".join(d["text"] for d in chunks if d["chunk_type"] == "content") == result.content
+    assert len(chunks) < 20
+
+
+class _FailingClient(_FakeClient):
+    async def chat_stream(self, **kwargs):
+        for chunk in self._chunks:
+            yield chunk
+        raise RuntimeError("connection reset")
+
+
+def test_agent_loop_flushes_buffered_text_when_stream_fails():
+    loop = AgentLoop(
+        client=_FailingClient([StreamChunk(content="partial "), StreamChunk(content="answer")]),
+        registry=ToolRegistry(),
+        context=ToolContext(project_root="."),
+        model="fake",
+    )
+    events = []
+
+    asyncio.run(loop.run([], on_event=lambda t, d: events.append((t, d))))
+
+    chunks = [d for t, d in events if t == EVENT_STREAM_CHUNK]
+    assert "".join(d["text"] for d in chunks) == "partial answer"
@@ -0,0 +1,109 @@
+from pathlib import Path
+
+import pytest
+
+from domain.search.models.unified_search_result import SearchScope
+from domain.search.unified_search_service import UnifiedSearchService
+from infrastructure.file_intelligence.search.file_search_service import FileSearchService
+from shared.event_bus import EventBus
+from shared.event_types import EVENT_FILE_CHANGED
+from shared.service_locator import ServiceLocator
+from shared.service_names import SVC_EVENT_BUS, SVC_FILE_SEARCH_SERVICE
+
+
+class _CountingFileSearchService(FileSearchService):
+    def __init__(self):
+        super().__init__()
+        self.content_searches = 0
+
+    def search_by_content(self, *args, **kwargs):
+        self.content_searches += 1
+        return super().search_by_content(*args, **kwargs)
+
+
+@pytest.fixture
+def search_env(tmp_path):
+    (tmp_path / "amp.cir").write_text("R1 in out 10k\nC1 out 0 1n\n", encoding="utf-8")
+    (tmp_path / "filter.cir").write_text("R2 a b 1k\n", encoding="utf-8")
+    ServiceLocator.clear()
+    event_bus = EventBus()
+    file_search = _CountingFileSearchService()
+    ServiceLocator.register(SVC_EVENT_BUS, event_bus)
+    ServiceLocator.register(SVC_FILE_SEARCH_SERVICE, file_search)
+    file_search.build_index(tmp_path)
+    try:
+        yield tmp_path, event_bus, file_search, UnifiedSearchService()
+    finally:
+        ServiceLocator.clear()
+
+
+def _modify(event_bus, path: Path, text: str) -> None:
+    path.write_text(text, encoding="utf-8")
+    event_bus.publish(EVENT_FILE_CHANGED, {"path": str(path), "event_type": "modified"})
+
+
+def _files(result):
+    return {m.file_path for m in result.exact_matches}
+
+
+def test_repeated_query_is_served_from_cache(search_env):
+    _, _, file_search, service = search_env
+
+    first = service.search("r1 IN", scope=SearchScope.CODE)
+    second = service.search("R1 in", scope=SearchScope.CODE)
+
+    assert file_search.content_searches == 1
+    assert _files(second) == _files(first) == {"amp.cir"}
+    assert second.query == "R1 in"
+    cache = service.get_stats()["cache"]
+    assert (cache["hits"], cache["misses"], cache["entries"]) == (1, 1, 1)
+    assert cache["hit_rate"] == 0.5
+
+    # 选项不同 → 不同条目
+    service.search("r1 in", scope=SearchScope.CODE, file_types=[".txt"])
+    assert file_search.content_searches == 2
+
+
+def test_file_changes_invalidate_only_affected_entries(search_env):
+    root, event_bus, file_search, service = search_env
+    service.search("r1", scope=SearchScope.CODE)
+    service.search("r2", scope=SearchScope.CODE)
+    service.search("c9", scope=SearchScope.CODE)
+
+    # 修改结果中的文件：只失效 "r1"
+    _modify(event_bus, root / "amp.cir", "R1 in out 22k\n")
+    service.search("r2", scope=SearchScope.CODE)
+    service.search("c9", scope=SearchScope.CODE)
+    assert file_search.content_searches == 3
+    assert _files(service.search("r1", scope=SearchScope.CODE)) == {"amp.cir"}
+    assert file_search.content_searches == 4
+
+    # 修改后新命中 "c9" 的文件：失效 "c9" 与包含它的 "r2"，不影响 "r1"
+    _modify(event_bus, root / "filter.cir", "R2 a b 1k\nC9 b 0 1u\n")
+    assert _files(service.search("c9", scope=SearchScope.CODE)) == {"filter.cir"}
+    service.search("r1", scope=SearchScope.CODE)
+    assert file_search.content_searches == 5
+    assert service.get_stats()["cache"]["invalidated"] == 3
+
+    # 索引重建递增代数，旧条目全部不再命中
+    file_search.build_index(root)
+    service.search("r1", scope=SearchScope.CODE)
+    assert file_search.content_searches == 6
+
+
+def test_token_budget_uses_precise_counts_for_cjk_text():
+    from domain.llm.token_counter import count_tokens_many
+    from domain.search.models.unified_search_result import SemanticMatchResult, TokenBudgetConfig
+    from domain.search.token_budget_allocator import TokenBudgetAllocator
+
+    # 字符估算约 50 tokens/条，30 条远低于预算；精确计数则会超出
+    content = "运放输出级的静态电流由偏置网络决定。" * 11
+    results = [SemanticMatchResult(content=content, source=f"doc{index}.md", score=0.5) for index in range(30)]
+    config = TokenBudgetConfig()
+
+    allocated, tokens_used = TokenBudgetAllocator(config).allocate_semantic_results(results)
+
+    (precise,) = count_tokens_many([content])
+    assert tokens_used <= config.semantic_budget
+    assert len(allocated) == config.semantic_budget // precise < len(results)
+    assert tokens_used == sum(result.token_count for result in allocated) == precise * len(allocated)
@@ -0,0 +1,202 @@
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from domain.simulation.data.result_column_store import load_result_columns
+from domain.simulation.data.simulation_artifact_exporter import simulation_artifact_exporter
+from domain.simulation.data.simulation_artifact_persistence import simulation_artifact_persistence
+from domain.simulation.data.waveform_comparison import WaveformComparisonService
+from domain.simulation.models.simulation_result import SimulationData, SimulationResult
+from domain.simulation.service.simulation_bundle_archiver import simulation_bundle_archiver
+from presentation.panels.simulation.waveform_widget import WaveformWidget
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _tran_result(index: int, points: int) -> SimulationResult:
+    # 每次运行的时间轴长度与步长不同，末端略有差异（蒙特卡洛 / 自适应步长）
+    time_axis = np.linspace(0.0, 1e-3 * (1.0 + 0.01 * index), points)
+    gain = 1.0 + 0.05 * index
+    return SimulationResult(
+        executor="spice",
+        file_path="amp.cir",
+        analysis_type="tran",
+        success=True,
+        data=SimulationData(
+            time=time_axis,
+            signals={"V(out)": gain * np.sin(2 * np.pi * 5e3 * time_axis), "V(in)": np.sin(time_axis)},
+        ),
+        raw_output="x" * 1000,
+        timestamp=f"2026-01-0{index + 1}T00:00:00",
+    )
+
+
+def _bundle_id(project_root: Path, result: SimulationResult) -> str:
+    outcome = simulation_artifact_persistence.persist_bundle(str(project_root), result, {})
+    return Path(outcome.export_root).relative_to(project_root).as_posix()
+
+
+def test_compare_resamples_runs_onto_shared_grid(tmp_path: Path):
+    results = [_tran_result(index, 2000 + 100 * index) for index in range(5)]
+    bundle_ids = [_bundle_id(tmp_path, result) for result in results]
+    # 归档结果包只解压请求的列
+    simulation_bundle_archiver.archive_bundle(tmp_path / bundle_ids[3])
+    # 以 result.json 路径给出的 id 同样可用
+    bundle_ids[1] = simulation_artifact_exporter.result_json_path(
+        bundle_ids[1]
+    ).as_posix()
+    bundle_ids.append("simulation_results/missing/20260101_000000")
+
+    service = WaveformComparisonService()
+    comparisons = service.compare(str(tmp_path), bundle_ids, ["v(out)", "V(gone)"], reference=2)
+
+    assert set(comparisons) == {"v(out)"}
+    comparison = comparisons["v(out)"]
+    assert comparison.run_count == 5
+    assert list(comparison.skipped) == [bundle_ids[5]]
+    assert comparison.runs[3].signal_name == "V(out)"
+    assert comparison.x[0] == 0.0 and comparison.x[-1] == pytest.approx(1e-3)
+    assert len(comparison.x) == 2400
+
+    expected = np.stack([
+        np.interp(comparison.x, result.data.time, result.data.signals["V(out)"]) for result in results
+    ])
+    assert np.allclose(comparison.values, expected)
+    assert np.allclose(comparison.mean, expected.mean(axis=0))
+    assert np.allclose(comparison.upper, expected.max(axis=0))
+    assert not comparison.diff[comparison.reference_index].any()
+    statistics = comparison.run_statistics()
+    assert statistics[2].max_abs_diff == 0.0
+    assert statistics[4].max_abs_diff == pytest.approx(0.1, rel=1e-2)
+
+    overlay = comparison.overlay(2e-4, 4e-4, target_points=100)
+    assert overlay.run_y.shape[0] == 5 and 90 <= overlay.run_y.shape[1] <= 100
+    assert overlay.run_x.min() >= comparison.x[0] and overlay.run_x.max() <= 4e-4 + 1e-6
+    assert np.all(overlay.lower <= overlay.mean) and np.all(overlay.mean <= overlay.upper)
+    assert len(overlay.envelope_x) == len(overlay.lower) == overlay.run_y.shape[1] // 2
+    window = (comparison.x >= 2e-4) & (comparison.x <= 4e-4)
+    assert overlay.upper.max() == pytest.approx(comparison.upper[window].max())
+
+    # 同一组结果包再次比较命中缓存，其它信号只读取缺失的列
+    again = service.compare(str(tmp_path), bundle_ids, ["V(out)", "V(in)"])
+    assert set(again) == {"V(out)", "V(in)"}
+
+
+def test_compare_ac_signal_uses_log_grid_and_magnitude(tmp_path: Path):
+    bundle_ids = []
+    for index in range(3):
+        frequency = np.logspace(0, 6, 300 + index)
+        response = (1.0 + 0.1 * index) / (1.0 + 1j * frequency / 1e4)
+        result = SimulationResult(
+            executor="spice",
+            file_path="amp.cir",
+            analysis_type="ac",
+            success=True,
+            data=SimulationData(frequency=frequency, signals={"V(out)": response}),
+            x_axis_kind="frequency",
+            x_axis_scale="log",
+            timestamp=f"2026-02-0{index + 1}T00:00:00",
+        )
+        bundle_ids.append(_bundle_id(tmp_path, result))
+
+    comparison = WaveformComparisonService().compare(str(tmp_path), bundle_ids, ["V(out)"])["V(out)"]
+
+    assert comparison.log_x
+    assert comparison.runs[0].signal_name == "V(out)_mag"
+    assert np.allclose(np.diff(np.log10(comparison.x)), np.log10(comparison.x[1] / comparison.x[0]))
+    assert np.allclose(comparison.upper / comparison.lower, 1.2, rtol=1e-3)
+
+
+def test_load_result_columns_keeps_only_selected_signals(tmp_path: Path):
+    export_root = tmp_path / _bundle_id(tmp_path, _tran_result(0, 500))
+    result_path = simulation_artifact_exporter.result_json_path(export_root)
+
+    for _ in range(2):
+        payload = load_result_columns(result_path, lambda name: name == "V(in)")
+        assert list(payload["data"]["signals"]) == ["V(in)"]
+        assert payload["raw_output"] is None
+        restored = SimulationResult.from_dict(payload)
+        assert len(restored.data.time) == 500
+        simulation_bundle_archiver.archive_bundle(export_root)
+
+
+def test_waveform_widget_draws_comparison_with_fixed_item_count(qapp, tmp_path: Path):
+    bundle_ids = [_bundle_id(tmp_path, _tran_result(index, 3000)) for index in range(4)]
+    comparison = WaveformComparisonService().compare(str(tmp_path), bundle_ids, ["V(out)"])["V(out)"]
+    widget = WaveformWidget()
+
+    assert widget.load_comparison(comparison)
+    assert widget.get_displayed_signal_names() == []
+    runs_item = widget._comparison_items["runs"]
+    x_data, _ = runs_item.getData()
+    assert np.isnan(x_data).sum() == comparison.run_count - 1
+
+    assert widget.set_viewport({"x_min": 1e-4, "x_max": 2e-4, "left_y_min": -1.5, "left_y_max": 1.5})
+    x_data, _ = runs_item.getData()
+    finite = x_data[np.isfinite(x_data)]
+    assert finite.min() < 1e-4 + 1e-6 and finite.max() > 2e-4 - 1e-6 and finite.max() < 2.1e-4
+    snapshot = widget.get_web_snapshot(max_points=200)
+    assert snapshot["comparison"]["run_count"] == 4
+    assert snapshot["x_axis_label"] == comparison.x_label
+
+    # 回到单结果显示时退出比较模式
+    assert widget.load_waveform(_tran_result(0, 100), "V(out)")
+    assert widget.get_comparison() is None and widget._comparison_items == {}
+    assert widget.get_web_snapshot()["comparison"] is None
+
+
+def test_circuit_card_compare_action_renders_comparison_in_waveform_tab(qapp, tmp_path: Path):
+    from presentation.panels.simulation.simulation_tab import SimulationTab
+    from presentation.panels.simulation.simulation_web_bridge import SimulationWebBridge
+
+    for index in range(3):
+        _bundle_id(tmp_path, _tran_result(index, 1500))
+    tab = SimulationTab()
+    bridge = SimulationWebBridge()
+    try:
+        tab.bind_web_bridge(bridge)
+        tab._on_project_opened({"path": str(tmp_path)})
+        (card,) = tab._authoritative_frontend_state["circuit_selection_view"]["items"]
+        assert len(card["comparison_result_paths"]) == 3
+
+        bridge.compareResultsByPath(card["comparison_result_paths"])
+
+        # 比较在工作线程中进行，UI 线程只负责应用结果
+        widget = tab._backend_runtime.waveform_widget
+        assert widget.get_comparison() is None
+        deadline = time.monotonic() + 10
+        while widget.get_comparison() is None and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+        assert widget.get_comparison().run_count == 3
+        state = tab._authoritative_frontend_state
+        assert state["surface_tabs"]["active_tab"] == "waveform"
+        waveform_view = state["waveform_view"]
+        comparison = waveform_view["comparison"]
+        assert comparison["run_count"] == 3 and waveform_view["can_export"]
+        assert comparison["runs_x"].count(None) == 2
+        assert len(comparison["runs_x"]) == len(comparison["runs_y"])
+        assert "V(out)" in waveform_view["signal_names"]
+
+        exported = widget.export_bundle(str(tmp_path / "export" / "waveforms"))
+        csv_path = next(Path(path) for path in exported if path.endswith(".csv"))
+        header = next(line for line in csv_path.read_text(encoding="utf-8").splitlines() if line and not line.startswith("#"))
+        assert header.split(",")[1:5] == ["mean", "std", "lower", "upper"]
+        assert len(header.split(",")) == 5 + 3
+
+        # 选择信号即退出比较模式
+        assert widget.set_signal_visible("V(in)", True)
+        assert widget.get_comparison() is None
+        assert widget.get_displayed_signal_names() == ["V(in)"]
+    finally:
+        tab.close()
+        tab.deleteLater()
@@ -0,0 +1,191 @@
+import csv
+import math
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from domain.llm.agent.tools.simulation_series_stats import (
+    AnchorScale,
+    read_series_csv,
+    read_series_table,
+)
+from domain.simulation.data import waveform_measurements as wm
+from domain.simulation.measure import measure_cross_check
+from domain.simulation.measure.measure_cross_check import (
+    CROSS_CHECK_MATCH,
+    CROSS_CHECK_MISMATCH,
+    CROSS_CHECK_UNAVAILABLE,
+    CROSS_CHECK_UNSUPPORTED,
+    measure_cross_checker,
+)
+from domain.simulation.measure.measure_result import MeasureResult, MeasureStatus
+from domain.simulation.models.simulation_result import SimulationData
+
+
+def test_batched_kernels_match_per_signal_reference() -> None:
+    rng = np.random.default_rng(7)
+    x = np.sort(rng.uniform(0.0, 10.0, 400))
+    y = rng.normal(size=(3, 5, 400))
+    query = rng.uniform(-1.0, 11.0, 64)
+
+    expected = np.array([[np.interp(query, x, row) for row in group] for group in y])
+    np.testing.assert_array_equal(wm.interpolate_at(x, y, query), expected)
+    np.testing.assert_array_equal(wm.interpolate_at(x[::-1], y[..., ::-1], query), expected)
+    assert wm.interpolate_at(x, y, 4.2).shape == (3, 5)
+    np.testing.assert_array_equal(wm.interpolate_columns(x, list(y[0]), query), expected[0])
+
+    # 过零：跳过缺失值后与前一个有效采样比较，中间夹 0 不计
+    def reference_crossings(row):
+        last, count = None, 0
+        for value in row:
+            if not math.isfinite(value):
+                continue
+            if last is not None and last * value < 0:
+                count += 1
+            last = value
+        return count
+
+    sparse = np.where(rng.random(y.shape) < 0.2, np.nan, np.round(y))
+    assert wm.summarize_series(sparse).zero_crossings.tolist() == [
+        [reference_crossings(row) for row in group] for group in sparse
+    ]
+    summary = wm.summarize_series(sparse[..., :150]).merge(wm.summarize_series(sparse[..., 150:]))
+    whole = wm.summarize_series(sparse)
+    for field in ("samples", "minimum", "maximum", "initial", "final", "zero_crossings"):
+        np.testing.assert_array_equal(getattr(summary, field), getattr(whole, field))
+    np.testing.assert_allclose(summary.mean, whole.mean)
+
+
+def test_crossing_and_amplitude_measurements() -> None:
+    t = np.linspace(0.0, 10.0, 20001)
+    taus = np.array([[1.0], [0.5]])
+    step = 1.0 - np.exp(-t / taus)
+    t10 = wm.crossing_x(t, step, 0.1, edge=wm.EDGE_RISE)
+    t90 = wm.crossing_x(t, step, 0.9, edge=wm.EDGE_RISE, after_x=t10)
+    np.testing.assert_allclose(t90 - t10, np.log(9.0) * taus[:, 0], rtol=1e-5)
+    assert np.isnan(wm.crossing_x(t, 1.0 - step, 0.5, edge=wm.EDGE_RISE)).all()
+
+    period_t = np.linspace(0.0, 1e-2, 8000, endpoint=False)
+    tone = np.sin(2 * np.pi * 1e3 * period_t)
+    np.testing.assert_allclose(wm.crossing_x(period_t, tone, 0.0, occurrence=-1), 9.5e-3, rtol=1e-6)
+    np.testing.assert_allclose(wm.crossing_x(period_t, tone, 0.0, edge=wm.EDGE_FALL, occurrence=3), 2.5e-3, rtol=1e-6)
+
+    f = np.logspace(0, 7, 1401)
+    lowpass = 1.0 / (1.0 + 1j * f / 1e3)
+    np.testing.assert_allclose(wm.magnitude_db(lowpass[[0, -1]]), 20 * np.log10(np.abs(lowpass[[0, -1]])))
+    assert np.isfinite(wm.magnitude_db(np.zeros(3))).all()
+    assert wm.rms(tone, period_t) == pytest.approx(1 / np.sqrt(2), rel=1e-3)
+
+
+def test_series_csv_chunks_match_in_memory_table(tmp_path: Path) -> None:
+    rng = np.random.default_rng(3)
+    rows = 20000
+    x = np.logspace(-9, -3, rows)
+    columns = {
+        "V(out)": np.round(rng.normal(size=rows), 3),
+        "I(R1)": np.where(rng.random(rows) < 0.1, np.nan, rng.normal(size=rows)),
+    }
+    csv_path = tmp_path / "raw_data.csv"
+    with csv_path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write("# artifact_type: raw_data\n# circuit_file: amp.cir\n\n")
+        writer = csv.writer(handle)
+        writer.writerow(["time", *columns])
+        for index in range(rows):
+            cells = [repr(float(x[index]))] + [
+                "" if math.isnan(column[index]) else repr(float(column[index])) for column in columns.values()
+            ]
+            writer.writerow(cells[:2] if index == 9000 else cells)
+
+    table_columns = {name: column.copy() for name, column in columns.items()}
+    table_columns["I(R1)"][9000] = np.nan
+    for scale in (AnchorScale.LINEAR, AnchorScale.LOG):
+        from_csv = read_series_csv(csv_path, anchor_scale=scale)
+        from_table = read_series_table(
+            x_column_name="time",
+            signal_column_names=list(columns),
+            x_values=x,
+            signal_columns=table_columns,
+            anchor_scale=scale,
+        )
+        assert from_csv.header_entries == (("artifact_type", "raw_data"), ("circuit_file", "amp.cir"))
+        assert from_csv.total_rows == from_table.total_rows == rows
+        assert from_csv.anchors == from_table.anchors
+        assert from_csv.anchor_scale_effective == scale
+        for csv_stats, table_stats in zip(from_csv.stats, from_table.stats):
+            assert csv_stats.samples == table_stats.samples
+            assert csv_stats.zero_crossings == table_stats.zero_crossings
+            assert (csv_stats.min_value, csv_stats.max_value) == (table_stats.min_value, table_stats.max_value)
+            assert csv_stats.mean_value == pytest.approx(table_stats.mean_value, rel=1e-9)
+
+    out = from_table.stats[0]
+    assert out.zero_crossings == int(np.count_nonzero(columns["V(out)"][1:] * columns["V(out)"][:-1] < 0))
+    assert out.initial_value == columns["V(out)"][0] and out.final_value == columns["V(out)"][-1]
+
+
+def test_measure_cross_check_recomputes_supported_forms() -> None:
+    t = np.linspace(0.0, 1e-3, 10001)
+    vin = np.sin(2 * np.pi * 2e3 * t)
+    vout = 1.0 - np.exp(-t / 1e-4)
+    data = SimulationData(time=t, signals={"V(out)": vout, "V(in)": vin})
+
+    def measure(name, statement, value, status=MeasureStatus.OK):
+        return MeasureResult(name=name, value=value, status=status, statement=statement)
+
+    t10 = 1e-4 * np.log(1 / 0.9)
+    t90 = 1e-4 * np.log(10.0)
+    measurements = [
+        measure("vmax", ".measure tran vmax MAX v(out)", float(vout.max())),
+        measure("vpp_late", ".measure tran vpp_late PP V(out) FROM=0.5m TO=1m", float(vout[-1] - vout[5000])),
+        measure("v_at", ".measure tran v_at FIND V(out) AT=100u", 1.0 - np.exp(-1.0)),
+        measure("t_half", ".meas tran t_half WHEN v(out) = 0.5 RISE=1", 1e-4 * np.log(2.0)),
+        measure("t_rise", ".measure tran t_rise TRIG V(out) VAL=0.1 RISE=1 TARG V(out) VAL=0.9 RISE=1", t90 - t10),
+        measure("cross2", ".measure tran cross2 WHEN V(in)=0 CROSS=2", 1.0 / 2e3),
+        measure("in_rms", ".measure tran in_rms RMS V(in)", 1.0),
+        measure("diff", ".measure tran diff MAX V(out,in)", 1.0),
+        measure("ratio", ".measure tran ratio PARAM='vmax/2'", 0.5),
+        measure("failed", ".measure tran failed WHEN V(out)=0.5", None, MeasureStatus.FAILED),
+    ]
+
+    checks = {check.name: check for check in measure_cross_checker.check(data, measurements)}
+
+    for name in ("vmax", "vpp_late", "v_at", "t_half", "t_rise", "cross2"):
+        assert checks[name].status == CROSS_CHECK_MATCH, checks[name]
+    assert checks["in_rms"].status == CROSS_CHECK_MISMATCH
+    assert checks["in_rms"].recomputed == pytest.approx(1 / np.sqrt(2), rel=1e-3)
+    assert checks["diff"].recomputed == pytest.approx(float((vout - vin).max()))
+    assert checks["ratio"].status == CROSS_CHECK_UNSUPPORTED
+    assert checks["failed"].status == CROSS_CHECK_MISMATCH and checks["failed"].reported is None
+
+
+def test_measure_cross_check_reports_unexpected_errors_as_unavailable(monkeypatch) -> None:
+    t = np.linspace(0.0, 1e-3, 101)
+    data = SimulationData(time=t, signals={"V(out)": t})
+
+    def broken(*args, **kwargs):
+        raise IndexError("boom")
+
+    monkeypatch.setattr(measure_cross_check, "_statistic", broken)
+    measurement = MeasureResult(
+        name="vmax", value=1e-3, status=MeasureStatus.OK, statement=".measure tran vmax MAX V(out)"
+    )
+
+    (check,) = measure_cross_checker.check(data, [measurement])
+
+    assert check.status == CROSS_CHECK_UNAVAILABLE
+    assert check.reported == 1e-3 and "boom" in check.detail
+    assert wm.trapezoid(np.ones(11), np.linspace(0.0, 1.0, 11)) == pytest.approx(1.0)
+
+
+def test_measure_cross_check_imports_in_fresh_interpreter() -> None:
+    # 交叉校验 -> domain.simulation.data 包 -> 导出器 -> 交叉校验 不能成环
+    completed = subprocess.run(
+        [sys.executable, "-c", "import domain.simulation.measure.measure_cross_check"],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr